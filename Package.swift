@@ -14,9 +14,15 @@ let package = Package(
     targets: [
         .target(
             name: "ShaderGraphCoder"),
+        .executableTarget(
+            name: "ShaderGraphCoderBenchmark",
+            dependencies: ["ShaderGraphCoder"]),
         .testTarget(
             name: "ShaderGraphCoderTests",
             dependencies: ["ShaderGraphCoder"],
             resources: [.process("Resources/TestTexture.png")]),
+        .testTarget(
+            name: "ShaderGraphCoderOperationTests",
+            dependencies: ["ShaderGraphCoder"]),
     ]
 )
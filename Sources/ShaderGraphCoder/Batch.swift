@@ -0,0 +1,121 @@
+//
+//  Batch.swift
+//  ShaderGraphCoder
+//
+//  Creates many materials at once: identical graphs are found and exported
+//  in parallel, and only the RealityKit materials are created on the main actor.
+//
+
+import Foundation
+import RealityKit
+
+/// The outputs of one material. Graphs are not changed once built, so they can be read from any thread.
+struct SGGraphRoots: @unchecked Sendable {
+    let surface: SGToken?
+    let geometryModifier: SGToken?
+
+    /// A description of the graph that is equal for graphs that export the same USDA and textures,
+    /// even if they were built separately. Nil if the graph contains errors or textures without a cache key.
+    var key: String? {
+        var nodeIndexes: [SGNode: Int] = [:]
+        var key = ""
+        var isComparable = true
+        func reference(_ value: SGValue?) -> String {
+            guard let v = value else {
+                return "_"
+            }
+            switch v.source {
+            case .nodeOutput(let node, let outputName):
+                return "n\(nodeIndexes[node] ?? -1).\(outputName)"
+            case .constant(let c):
+                return constantKey(c)
+            case .parameter(name: let name, defaultValue: let c):
+                return "p\(name)=\(constantKey(c))"
+            case .error:
+                isComparable = false
+                return "error"
+            }
+        }
+        func constantKey(_ c: SGConstantValue) -> String {
+            if case .texture(let source) = c {
+                guard let k = source.cacheKey else {
+                    isComparable = false
+                    return "texture"
+                }
+                return "texture(\(k))"
+            }
+            return "\(c.dataType.usda) \(c.usda)"
+        }
+        forEachNodeInPostOrder(roots: [surface?.node, geometryModifier?.node].compactMap { $0 }) { node in
+            nodeIndexes[node] = nodeIndexes.count
+            key += "\(node.nodeType)(\(node.inputs.map { "\($0.name):\($0.dataType.usda)=\(reference($0.value))" }.joined(separator: ",")))\n"
+        }
+        key += "surface=\(reference(surface)) geometryModifier=\(reference(geometryModifier))"
+        return isComparable ? key : nil
+    }
+}
+
+/// Applies the transform to every value on the concurrent executor and returns the results in order.
+func concurrentMap<T: Sendable, R: Sendable>(_ values: [T], _ transform: @escaping @Sendable (T) -> R) async -> [R] {
+    await withTaskGroup(of: (Int, R).self) { group in
+        for (index, value) in values.enumerated() {
+            group.addTask {
+                (index, transform(value))
+            }
+        }
+        var results: [R?] = Array(repeating: nil, count: values.count)
+        for await (index, result) in group {
+            results[index] = result
+        }
+        return results.map { $0! }
+    }
+}
+
+#if os(visionOS)
+
+public extension ShaderGraphMaterial {
+    /// Creates a material for each graph, in order.
+    ///
+    /// Comparing graphs, estimating their cost and exporting their USDA runs in parallel off the main actor.
+    /// Graphs that would export the same USDA and textures share one material.
+    /// A graph that fails does not stop the others; its result holds the error `init(surface:)` would have thrown.
+    @MainActor
+    static func makeMaterials(_ graphs: [(surface: SGToken?, geometryModifier: SGToken?)], costBudget: SGMaterialCostBudget? = nil, textureCache: SGTextureCache = .shared) async -> [Result<ShaderGraphMaterial, Error>] {
+        let roots = graphs.map { SGGraphRoots(surface: $0.surface, geometryModifier: $0.geometryModifier) }
+        let keys = await concurrentMap(roots) { $0.key }
+        var distinctRoots: [SGGraphRoots] = []
+        var distinctIndexes: [Int] = []
+        var distinctIndexesByKey: [String: Int] = [:]
+        for (r, key) in zip(roots, keys) {
+            if let k = key, let index = distinctIndexesByKey[k] {
+                distinctIndexes.append(index)
+                continue
+            }
+            if let k = key {
+                distinctIndexesByKey[k] = distinctRoots.count
+            }
+            distinctIndexes.append(distinctRoots.count)
+            distinctRoots.append(r)
+        }
+        let prepared = await concurrentMap(distinctRoots) { r in
+            Result { try SGPreparedMaterial(surface: r.surface, geometryModifier: r.geometryModifier, costBudget: costBudget) }
+        }
+        var materials: [Result<ShaderGraphMaterial, Error>] = []
+        for p in prepared {
+            switch p {
+            case .success(let pm):
+                do {
+                    materials.append(.success(try await ShaderGraphMaterial(prepared: pm, textureCache: textureCache)))
+                }
+                catch {
+                    materials.append(.failure(error))
+                }
+            case .failure(let error):
+                materials.append(.failure(error))
+            }
+        }
+        return distinctIndexes.map { materials[$0] }
+    }
+}
+
+#endif
@@ -0,0 +1,148 @@
+//
+//  Cost.swift
+//  ShaderGraphCoder
+//
+//  Rough per-node costs generated from the node schemas (Costs.g.swift)
+//  and a material-level estimate to flag heavy graphs before they are exported.
+//
+
+import Foundation
+
+/// The estimated cost of evaluating one node.
+public struct SGNodeCost: Equatable {
+    /// Rough number of ALU operations, scaled by the number of output components.
+    public let aluWeight: Int
+    /// Number of texture fetches.
+    public let textureSamples: Int
+    public let isNoise: Bool
+    public let isBranch: Bool
+
+    /// How many ALU operations a texture fetch counts as in `cost`.
+    public static let textureSampleWeight = 16
+
+    public init(aluWeight: Int, textureSamples: Int = 0, isNoise: Bool = false, isBranch: Bool = false) {
+        self.aluWeight = aluWeight
+        self.textureSamples = textureSamples
+        self.isNoise = isNoise
+        self.isBranch = isBranch
+    }
+
+    /// The cost of a node type from the schemas. Unknown node types cost one ALU operation.
+    public init(nodeType: String) {
+        self = SGNodeCost.schemaCosts[nodeType] ?? SGNodeCost(aluWeight: 1)
+    }
+
+    public var cost: Int { aluWeight + textureSamples * SGNodeCost.textureSampleWeight }
+}
+
+public struct SGMaterialCost {
+    public var nodeCount: Int = 0
+    public var nodeCountsByType: [String: Int] = [:]
+    /// The number of nodes on the longest path from an output to a leaf.
+    public var criticalPathDepth: Int = 0
+    public var textureSamples: Int = 0
+    public var noiseNodes: Int = 0
+    public var branchNodes: Int = 0
+    /// The sum of the `SGNodeCost.cost` of every node.
+    public var totalCost: Int = 0
+
+    /// Returns a description of every limit of the budget this material exceeds.
+    public func violations(of budget: SGMaterialCostBudget) -> [String] {
+        var violations: [String] = []
+        if let m = budget.maxNodes, nodeCount > m {
+            violations.append("\(nodeCount) nodes (budget \(m))")
+        }
+        if let m = budget.maxCriticalPathDepth, criticalPathDepth > m {
+            violations.append("critical path depth \(criticalPathDepth) (budget \(m))")
+        }
+        if let m = budget.maxTextureSamples, textureSamples > m {
+            violations.append("\(textureSamples) texture samples (budget \(m))")
+        }
+        if let m = budget.maxNoiseNodes, noiseNodes > m {
+            violations.append("\(noiseNodes) noise nodes (budget \(m))")
+        }
+        if let m = budget.maxTotalCost, totalCost > m {
+            violations.append("estimated cost \(totalCost) (budget \(m))")
+        }
+        return violations
+    }
+}
+
+/// Limits for `SGMaterialCost`. A nil limit is not checked.
+public struct SGMaterialCostBudget: Sendable {
+    public var maxNodes: Int?
+    public var maxCriticalPathDepth: Int?
+    public var maxTextureSamples: Int?
+    public var maxNoiseNodes: Int?
+    public var maxTotalCost: Int?
+    public init(maxNodes: Int? = nil, maxCriticalPathDepth: Int? = nil, maxTextureSamples: Int? = nil, maxNoiseNodes: Int? = nil, maxTotalCost: Int? = nil) {
+        self.maxNodes = maxNodes
+        self.maxCriticalPathDepth = maxCriticalPathDepth
+        self.maxTextureSamples = maxTextureSamples
+        self.maxNoiseNodes = maxNoiseNodes
+        self.maxTotalCost = maxTotalCost
+    }
+}
+
+/// Thrown instead of exporting a material whose `SGMaterialCost` exceeds its budget.
+public struct SGCostBudgetError: Error {
+    public let violations: [String]
+}
+
+/// Estimates the cost of the nodes `getUSDA` would export for these outputs.
+/// The nodes of a subgraph count once for every instance.
+public func estimateCost(surface: SGToken?, geometryModifier: SGToken?) -> SGMaterialCost {
+    var subgraphCosts: [Int: SGMaterialCost] = [:]
+    return estimateCost(nodes: [surface?.node, geometryModifier?.node].compactMap { $0 }, subgraphCosts: &subgraphCosts)
+}
+
+private func estimateCost(nodes rootNodes: [SGNode], subgraphCosts: inout [Int: SGMaterialCost]) -> SGMaterialCost {
+    var cost = SGMaterialCost()
+    var depths: [SGNode: Int] = [:]
+    // Iterative post-order so that deep graphs do not overflow the stack
+    var stack: [(SGNode, Bool)] = rootNodes.map { ($0, false) }
+    while let (node, inputsVisited) = stack.popLast() {
+        if depths[node] != nil {
+            continue
+        }
+        let inputNodes = node.inputs.compactMap { $0.value?.node }
+        if !inputsVisited {
+            stack.append((node, true))
+            for inode in inputNodes where depths[inode] == nil {
+                stack.append((inode, false))
+            }
+            continue
+        }
+        let inputDepth = inputNodes.compactMap { depths[$0] }.max() ?? 0
+        if let s = node as? SGSubgraphNode {
+            let body: SGMaterialCost
+            if let c = subgraphCosts[s.definition.id] {
+                body = c
+            }
+            else {
+                body = estimateCost(nodes: [s.definition.output.node].compactMap { $0 }, subgraphCosts: &subgraphCosts)
+                subgraphCosts[s.definition.id] = body
+            }
+            depths[node] = inputDepth + body.criticalPathDepth
+            cost.criticalPathDepth = max(cost.criticalPathDepth, inputDepth + body.criticalPathDepth)
+            cost.nodeCount += body.nodeCount
+            cost.nodeCountsByType.merge(body.nodeCountsByType, uniquingKeysWith: +)
+            cost.textureSamples += body.textureSamples
+            cost.noiseNodes += body.noiseNodes
+            cost.branchNodes += body.branchNodes
+            cost.totalCost += body.totalCost
+            continue
+        }
+        let depth = 1 + inputDepth
+        depths[node] = depth
+        cost.criticalPathDepth = max(cost.criticalPathDepth, depth)
+        let nodeCost = SGNodeCost(nodeType: node.nodeType)
+        cost.nodeCount += 1
+        cost.nodeCountsByType[node.nodeType, default: 0] += 1
+        cost.textureSamples += nodeCost.textureSamples
+        cost.noiseNodes += nodeCost.isNoise ? 1 : 0
+        cost.branchNodes += nodeCost.isBranch ? 1 : 0
+        cost.totalCost += nodeCost.cost
+    }
+    return cost
+}
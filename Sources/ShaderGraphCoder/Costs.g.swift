@@ -0,0 +1,957 @@
+// Autogenerated by opgen.py
+import Foundation
+import simd
+
+extension SGNodeCost {
+    static let schemaCosts: [String: SGNodeCost] = [
+        "ND_RealityKitTexture2DGradient_color3": SGNodeCost(aluWeight: 3, textureSamples: 1),
+        "ND_RealityKitTexture2DGradient_color4": SGNodeCost(aluWeight: 4, textureSamples: 1),
+        "ND_RealityKitTexture2DGradient_vector4": SGNodeCost(aluWeight: 4, textureSamples: 1),
+        "ND_RealityKitTexture2DLOD_color3": SGNodeCost(aluWeight: 3, textureSamples: 1),
+        "ND_RealityKitTexture2DLOD_color4": SGNodeCost(aluWeight: 4, textureSamples: 1),
+        "ND_RealityKitTexture2DLOD_vector4": SGNodeCost(aluWeight: 4, textureSamples: 1),
+        "ND_RealityKitTexture2DPixelGradient_color3": SGNodeCost(aluWeight: 3, textureSamples: 1),
+        "ND_RealityKitTexture2DPixelGradient_color4": SGNodeCost(aluWeight: 4, textureSamples: 1),
+        "ND_RealityKitTexture2DPixelGradient_vector4": SGNodeCost(aluWeight: 4, textureSamples: 1),
+        "ND_RealityKitTexture2DPixelLOD_color3": SGNodeCost(aluWeight: 3, textureSamples: 1),
+        "ND_RealityKitTexture2DPixelLOD_color4": SGNodeCost(aluWeight: 4, textureSamples: 1),
+        "ND_RealityKitTexture2DPixelLOD_vector4": SGNodeCost(aluWeight: 4, textureSamples: 1),
+        "ND_RealityKitTexture2DPixel_color3": SGNodeCost(aluWeight: 3, textureSamples: 1),
+        "ND_RealityKitTexture2DPixel_color4": SGNodeCost(aluWeight: 4, textureSamples: 1),
+        "ND_RealityKitTexture2DPixel_vector4": SGNodeCost(aluWeight: 4, textureSamples: 1),
+        "ND_RealityKitTexture2D_color3": SGNodeCost(aluWeight: 3, textureSamples: 1),
+        "ND_RealityKitTexture2D_color4": SGNodeCost(aluWeight: 4, textureSamples: 1),
+        "ND_RealityKitTexture2D_vector4": SGNodeCost(aluWeight: 4, textureSamples: 1),
+        "ND_RealityKitTextureCubeGradient_color4": SGNodeCost(aluWeight: 4, textureSamples: 1),
+        "ND_RealityKitTextureCubeGradient_vector4": SGNodeCost(aluWeight: 4, textureSamples: 1),
+        "ND_RealityKitTextureCubeLOD_color4": SGNodeCost(aluWeight: 4, textureSamples: 1),
+        "ND_RealityKitTextureCubeLOD_vector4": SGNodeCost(aluWeight: 4, textureSamples: 1),
+        "ND_RealityKitTextureCube_color4": SGNodeCost(aluWeight: 4, textureSamples: 1),
+        "ND_RealityKitTextureCube_vector4": SGNodeCost(aluWeight: 4, textureSamples: 1),
+        "ND_RealityKitTextureRead_color4": SGNodeCost(aluWeight: 4, textureSamples: 1),
+        "ND_RealityKitTextureRead_vector4": SGNodeCost(aluWeight: 4, textureSamples: 1),
+        "ND_UsdPreviewSurface_surfaceshader": SGNodeCost(aluWeight: 1),
+        "ND_UsdPrimvarReader_boolean": SGNodeCost(aluWeight: 1),
+        "ND_UsdPrimvarReader_float": SGNodeCost(aluWeight: 1),
+        "ND_UsdPrimvarReader_integer": SGNodeCost(aluWeight: 1),
+        "ND_UsdPrimvarReader_string": SGNodeCost(aluWeight: 1),
+        "ND_UsdPrimvarReader_vector2": SGNodeCost(aluWeight: 2),
+        "ND_UsdPrimvarReader_vector3": SGNodeCost(aluWeight: 3),
+        "ND_UsdPrimvarReader_vector4": SGNodeCost(aluWeight: 4),
+        "ND_UsdTransform2d": SGNodeCost(aluWeight: 2),
+        "ND_UsdUVTexture": SGNodeCost(aluWeight: 11, textureSamples: 1),
+        "ND_absval_color3": SGNodeCost(aluWeight: 3),
+        "ND_absval_color4": SGNodeCost(aluWeight: 4),
+        "ND_absval_float": SGNodeCost(aluWeight: 1),
+        "ND_absval_half": SGNodeCost(aluWeight: 1),
+        "ND_absval_vector2": SGNodeCost(aluWeight: 2),
+        "ND_absval_vector3": SGNodeCost(aluWeight: 3),
+        "ND_absval_vector4": SGNodeCost(aluWeight: 4),
+        "ND_acos_float": SGNodeCost(aluWeight: 8),
+        "ND_acos_half": SGNodeCost(aluWeight: 8),
+        "ND_acos_half2": SGNodeCost(aluWeight: 16),
+        "ND_acos_half3": SGNodeCost(aluWeight: 24),
+        "ND_acos_half4": SGNodeCost(aluWeight: 32),
+        "ND_acos_vector2": SGNodeCost(aluWeight: 16),
+        "ND_acos_vector3": SGNodeCost(aluWeight: 24),
+        "ND_acos_vector4": SGNodeCost(aluWeight: 32),
+        "ND_add_color3": SGNodeCost(aluWeight: 3),
+        "ND_add_color3FA": SGNodeCost(aluWeight: 3),
+        "ND_add_color4": SGNodeCost(aluWeight: 4),
+        "ND_add_color4FA": SGNodeCost(aluWeight: 4),
+        "ND_add_displacementshader": SGNodeCost(aluWeight: 1),
+        "ND_add_float": SGNodeCost(aluWeight: 1),
+        "ND_add_half": SGNodeCost(aluWeight: 1),
+        "ND_add_matrix22": SGNodeCost(aluWeight: 4),
+        "ND_add_matrix22FA": SGNodeCost(aluWeight: 4),
+        "ND_add_matrix33": SGNodeCost(aluWeight: 9),
+        "ND_add_matrix33FA": SGNodeCost(aluWeight: 9),
+        "ND_add_matrix44": SGNodeCost(aluWeight: 16),
+        "ND_add_matrix44FA": SGNodeCost(aluWeight: 16),
+        "ND_add_surfaceshader": SGNodeCost(aluWeight: 1),
+        "ND_add_vector2": SGNodeCost(aluWeight: 2),
+        "ND_add_vector2FA": SGNodeCost(aluWeight: 2),
+        "ND_add_vector3": SGNodeCost(aluWeight: 3),
+        "ND_add_vector3FA": SGNodeCost(aluWeight: 3),
+        "ND_add_vector4": SGNodeCost(aluWeight: 4),
+        "ND_add_vector4FA": SGNodeCost(aluWeight: 4),
+        "ND_add_volumeshader": SGNodeCost(aluWeight: 1),
+        "ND_ambientocclusion_float": SGNodeCost(aluWeight: 32),
+        "ND_asin_float": SGNodeCost(aluWeight: 8),
+        "ND_asin_half": SGNodeCost(aluWeight: 8),
+        "ND_asin_half2": SGNodeCost(aluWeight: 16),
+        "ND_asin_half3": SGNodeCost(aluWeight: 24),
+        "ND_asin_half4": SGNodeCost(aluWeight: 32),
+        "ND_asin_vector2": SGNodeCost(aluWeight: 16),
+        "ND_asin_vector3": SGNodeCost(aluWeight: 24),
+        "ND_asin_vector4": SGNodeCost(aluWeight: 32),
+        "ND_atan2_float": SGNodeCost(aluWeight: 12),
+        "ND_atan2_half": SGNodeCost(aluWeight: 12),
+        "ND_atan2_half2": SGNodeCost(aluWeight: 24),
+        "ND_atan2_half3": SGNodeCost(aluWeight: 36),
+        "ND_atan2_half4": SGNodeCost(aluWeight: 48),
+        "ND_atan2_vector2": SGNodeCost(aluWeight: 24),
+        "ND_atan2_vector3": SGNodeCost(aluWeight: 36),
+        "ND_atan2_vector4": SGNodeCost(aluWeight: 48),
+        "ND_bitangent_vector3": SGNodeCost(aluWeight: 3),
+        "ND_blur_color3": SGNodeCost(aluWeight: 96),
+        "ND_blur_color4": SGNodeCost(aluWeight: 128),
+        "ND_blur_float": SGNodeCost(aluWeight: 32),
+        "ND_blur_half": SGNodeCost(aluWeight: 32),
+        "ND_blur_vector2": SGNodeCost(aluWeight: 64),
+        "ND_blur_vector3": SGNodeCost(aluWeight: 96),
+        "ND_blur_vector4": SGNodeCost(aluWeight: 128),
+        "ND_burn_color3": SGNodeCost(aluWeight: 12),
+        "ND_burn_color4": SGNodeCost(aluWeight: 16),
+        "ND_burn_float": SGNodeCost(aluWeight: 4),
+        "ND_burn_half": SGNodeCost(aluWeight: 4),
+        "ND_ceil_color3": SGNodeCost(aluWeight: 3),
+        "ND_ceil_color4": SGNodeCost(aluWeight: 4),
+        "ND_ceil_float": SGNodeCost(aluWeight: 1),
+        "ND_ceil_half": SGNodeCost(aluWeight: 1),
+        "ND_ceil_vector2": SGNodeCost(aluWeight: 2),
+        "ND_ceil_vector3": SGNodeCost(aluWeight: 3),
+        "ND_ceil_vector4": SGNodeCost(aluWeight: 4),
+        "ND_cellnoise2d_float": SGNodeCost(aluWeight: 12, isNoise: true),
+        "ND_cellnoise3d_float": SGNodeCost(aluWeight: 16, isNoise: true),
+        "ND_clamp_color3": SGNodeCost(aluWeight: 3),
+        "ND_clamp_color3FA": SGNodeCost(aluWeight: 3),
+        "ND_clamp_color4": SGNodeCost(aluWeight: 4),
+        "ND_clamp_color4FA": SGNodeCost(aluWeight: 4),
+        "ND_clamp_float": SGNodeCost(aluWeight: 1),
+        "ND_clamp_half": SGNodeCost(aluWeight: 1),
+        "ND_clamp_half2": SGNodeCost(aluWeight: 2),
+        "ND_clamp_half2FA": SGNodeCost(aluWeight: 2),
+        "ND_clamp_half3": SGNodeCost(aluWeight: 3),
+        "ND_clamp_half3FA": SGNodeCost(aluWeight: 3),
+        "ND_clamp_half4": SGNodeCost(aluWeight: 4),
+        "ND_clamp_half4FA": SGNodeCost(aluWeight: 4),
+        "ND_clamp_vector2": SGNodeCost(aluWeight: 2),
+        "ND_clamp_vector2FA": SGNodeCost(aluWeight: 2),
+        "ND_clamp_vector3": SGNodeCost(aluWeight: 3),
+        "ND_clamp_vector3FA": SGNodeCost(aluWeight: 3),
+        "ND_clamp_vector4": SGNodeCost(aluWeight: 4),
+        "ND_clamp_vector4FA": SGNodeCost(aluWeight: 4),
+        "ND_combine2_color4CF": SGNodeCost(aluWeight: 4),
+        "ND_combine2_integer2": SGNodeCost(aluWeight: 2),
+        "ND_combine2_vector2": SGNodeCost(aluWeight: 2),
+        "ND_combine2_vector4VF": SGNodeCost(aluWeight: 4),
+        "ND_combine2_vector4VV": SGNodeCost(aluWeight: 4),
+        "ND_combine3_color3": SGNodeCost(aluWeight: 3),
+        "ND_combine3_half3": SGNodeCost(aluWeight: 3),
+        "ND_combine3_integer3": SGNodeCost(aluWeight: 3),
+        "ND_combine3_vector3": SGNodeCost(aluWeight: 3),
+        "ND_combine4_color4": SGNodeCost(aluWeight: 4),
+        "ND_combine4_integer4": SGNodeCost(aluWeight: 4),
+        "ND_combine4_vector4": SGNodeCost(aluWeight: 4),
+        "ND_constant_boolean": SGNodeCost(aluWeight: 1),
+        "ND_constant_color3": SGNodeCost(aluWeight: 3),
+        "ND_constant_color4": SGNodeCost(aluWeight: 4),
+        "ND_constant_filename": SGNodeCost(aluWeight: 1),
+        "ND_constant_float": SGNodeCost(aluWeight: 1),
+        "ND_constant_half": SGNodeCost(aluWeight: 1),
+        "ND_constant_half2": SGNodeCost(aluWeight: 2),
+        "ND_constant_half3": SGNodeCost(aluWeight: 3),
+        "ND_constant_half4": SGNodeCost(aluWeight: 4),
+        "ND_constant_integer": SGNodeCost(aluWeight: 1),
+        "ND_constant_integer2": SGNodeCost(aluWeight: 2),
+        "ND_constant_integer3": SGNodeCost(aluWeight: 3),
+        "ND_constant_integer4": SGNodeCost(aluWeight: 4),
+        "ND_constant_matrix22": SGNodeCost(aluWeight: 4),
+        "ND_constant_matrix33": SGNodeCost(aluWeight: 9),
+        "ND_constant_matrix44": SGNodeCost(aluWeight: 16),
+        "ND_constant_string": SGNodeCost(aluWeight: 1),
+        "ND_constant_vector2": SGNodeCost(aluWeight: 2),
+        "ND_constant_vector3": SGNodeCost(aluWeight: 3),
+        "ND_constant_vector4": SGNodeCost(aluWeight: 4),
+        "ND_contrast_color3": SGNodeCost(aluWeight: 12),
+        "ND_contrast_color3FA": SGNodeCost(aluWeight: 12),
+        "ND_contrast_color4": SGNodeCost(aluWeight: 16),
+        "ND_contrast_color4FA": SGNodeCost(aluWeight: 16),
+        "ND_contrast_float": SGNodeCost(aluWeight: 4),
+        "ND_contrast_vector2": SGNodeCost(aluWeight: 8),
+        "ND_contrast_vector2FA": SGNodeCost(aluWeight: 8),
+        "ND_contrast_vector3": SGNodeCost(aluWeight: 12),
+        "ND_contrast_vector3FA": SGNodeCost(aluWeight: 12),
+        "ND_contrast_vector4": SGNodeCost(aluWeight: 16),
+        "ND_contrast_vector4FA": SGNodeCost(aluWeight: 16),
+        "ND_convert_boolean_float": SGNodeCost(aluWeight: 1),
+        "ND_convert_boolean_half": SGNodeCost(aluWeight: 1),
+        "ND_convert_color3_color4": SGNodeCost(aluWeight: 4),
+        "ND_convert_color3_vector3": SGNodeCost(aluWeight: 3),
+        "ND_convert_color4_color3": SGNodeCost(aluWeight: 3),
+        "ND_convert_color4_vector4": SGNodeCost(aluWeight: 4),
+        "ND_convert_float_color3": SGNodeCost(aluWeight: 3),
+        "ND_convert_float_color4": SGNodeCost(aluWeight: 4),
+        "ND_convert_float_half": SGNodeCost(aluWeight: 1),
+        "ND_convert_float_integer": SGNodeCost(aluWeight: 1),
+        "ND_convert_float_vector2": SGNodeCost(aluWeight: 2),
+        "ND_convert_float_vector3": SGNodeCost(aluWeight: 3),
+        "ND_convert_float_vector4": SGNodeCost(aluWeight: 4),
+        "ND_convert_half2_vector2": SGNodeCost(aluWeight: 2),
+        "ND_convert_half3_color3": SGNodeCost(aluWeight: 3),
+        "ND_convert_half3_vector3": SGNodeCost(aluWeight: 3),
+        "ND_convert_half4_vector4": SGNodeCost(aluWeight: 4),
+        "ND_convert_half_color3": SGNodeCost(aluWeight: 3),
+        "ND_convert_half_color4": SGNodeCost(aluWeight: 4),
+        "ND_convert_half_float": SGNodeCost(aluWeight: 1),
+        "ND_convert_half_integer": SGNodeCost(aluWeight: 1),
+        "ND_convert_half_vector2": SGNodeCost(aluWeight: 2),
+        "ND_convert_half_vector3": SGNodeCost(aluWeight: 3),
+        "ND_convert_half_vector4": SGNodeCost(aluWeight: 4),
+        "ND_convert_integer_float": SGNodeCost(aluWeight: 1),
+        "ND_convert_integer_half": SGNodeCost(aluWeight: 1),
+        "ND_convert_vector2_half2": SGNodeCost(aluWeight: 2),
+        "ND_convert_vector2_vector3": SGNodeCost(aluWeight: 3),
+        "ND_convert_vector3_color3": SGNodeCost(aluWeight: 3),
+        "ND_convert_vector3_half3": SGNodeCost(aluWeight: 3),
+        "ND_convert_vector3_vector2": SGNodeCost(aluWeight: 2),
+        "ND_convert_vector3_vector4": SGNodeCost(aluWeight: 4),
+        "ND_convert_vector4_color4": SGNodeCost(aluWeight: 4),
+        "ND_convert_vector4_half4": SGNodeCost(aluWeight: 4),
+        "ND_convert_vector4_vector3": SGNodeCost(aluWeight: 3),
+        "ND_cos_float": SGNodeCost(aluWeight: 6),
+        "ND_cos_half": SGNodeCost(aluWeight: 6),
+        "ND_cos_half2": SGNodeCost(aluWeight: 12),
+        "ND_cos_half3": SGNodeCost(aluWeight: 18),
+        "ND_cos_half4": SGNodeCost(aluWeight: 24),
+        "ND_cos_vector2": SGNodeCost(aluWeight: 12),
+        "ND_cos_vector3": SGNodeCost(aluWeight: 18),
+        "ND_cos_vector4": SGNodeCost(aluWeight: 24),
+        "ND_crossproduct_half3": SGNodeCost(aluWeight: 9),
+        "ND_crossproduct_vector3": SGNodeCost(aluWeight: 9),
+        "ND_curveadjust_color3": SGNodeCost(aluWeight: 48),
+        "ND_curveadjust_color4": SGNodeCost(aluWeight: 64),
+        "ND_curveadjust_float": SGNodeCost(aluWeight: 16),
+        "ND_curveadjust_vector2": SGNodeCost(aluWeight: 32),
+        "ND_curveadjust_vector3": SGNodeCost(aluWeight: 48),
+        "ND_curveadjust_vector4": SGNodeCost(aluWeight: 64),
+        "ND_curvelookup_color3": SGNodeCost(aluWeight: 48),
+        "ND_curvelookup_color4": SGNodeCost(aluWeight: 64),
+        "ND_curvelookup_float": SGNodeCost(aluWeight: 16),
+        "ND_curvelookup_vector2": SGNodeCost(aluWeight: 32),
+        "ND_curvelookup_vector3": SGNodeCost(aluWeight: 48),
+        "ND_curvelookup_vector4": SGNodeCost(aluWeight: 64),
+        "ND_determinant_matrix22": SGNodeCost(aluWeight: 8),
+        "ND_determinant_matrix33": SGNodeCost(aluWeight: 8),
+        "ND_determinant_matrix44": SGNodeCost(aluWeight: 8),
+        "ND_difference_color3": SGNodeCost(aluWeight: 3),
+        "ND_difference_color4": SGNodeCost(aluWeight: 4),
+        "ND_difference_float": SGNodeCost(aluWeight: 1),
+        "ND_difference_half": SGNodeCost(aluWeight: 1),
+        "ND_disjointover_color4": SGNodeCost(aluWeight: 4),
+        "ND_divide_color3": SGNodeCost(aluWeight: 12),
+        "ND_divide_color3FA": SGNodeCost(aluWeight: 12),
+        "ND_divide_color4": SGNodeCost(aluWeight: 16),
+        "ND_divide_color4FA": SGNodeCost(aluWeight: 16),
+        "ND_divide_float": SGNodeCost(aluWeight: 4),
+        "ND_divide_half": SGNodeCost(aluWeight: 4),
+        "ND_divide_matrix22": SGNodeCost(aluWeight: 16),
+        "ND_divide_matrix33": SGNodeCost(aluWeight: 36),
+        "ND_divide_matrix44": SGNodeCost(aluWeight: 64),
+        "ND_divide_vector2": SGNodeCost(aluWeight: 8),
+        "ND_divide_vector2FA": SGNodeCost(aluWeight: 8),
+        "ND_divide_vector3": SGNodeCost(aluWeight: 12),
+        "ND_divide_vector3FA": SGNodeCost(aluWeight: 12),
+        "ND_divide_vector4": SGNodeCost(aluWeight: 16),
+        "ND_divide_vector4FA": SGNodeCost(aluWeight: 16),
+        "ND_dodge_color3": SGNodeCost(aluWeight: 12),
+        "ND_dodge_color4": SGNodeCost(aluWeight: 16),
+        "ND_dodge_float": SGNodeCost(aluWeight: 4),
+        "ND_dodge_half": SGNodeCost(aluWeight: 4),
+        "ND_dot_boolean": SGNodeCost(aluWeight: 1),
+        "ND_dot_color3": SGNodeCost(aluWeight: 3),
+        "ND_dot_color4": SGNodeCost(aluWeight: 4),
+        "ND_dot_displacementshader": SGNodeCost(aluWeight: 1),
+        "ND_dot_filename": SGNodeCost(aluWeight: 1),
+        "ND_dot_float": SGNodeCost(aluWeight: 1),
+        "ND_dot_half": SGNodeCost(aluWeight: 1),
+        "ND_dot_integer": SGNodeCost(aluWeight: 1),
+        "ND_dot_lightshader": SGNodeCost(aluWeight: 1),
+        "ND_dot_matrix33": SGNodeCost(aluWeight: 9),
+        "ND_dot_matrix44": SGNodeCost(aluWeight: 16),
+        "ND_dot_string": SGNodeCost(aluWeight: 1),
+        "ND_dot_surfaceshader": SGNodeCost(aluWeight: 1),
+        "ND_dot_vector2": SGNodeCost(aluWeight: 2),
+        "ND_dot_vector3": SGNodeCost(aluWeight: 3),
+        "ND_dot_vector4": SGNodeCost(aluWeight: 4),
+        "ND_dot_volumeshader": SGNodeCost(aluWeight: 1),
+        "ND_dotproduct_half2": SGNodeCost(aluWeight: 1),
+        "ND_dotproduct_half3": SGNodeCost(aluWeight: 1),
+        "ND_dotproduct_half4": SGNodeCost(aluWeight: 1),
+        "ND_dotproduct_vector2": SGNodeCost(aluWeight: 1),
+        "ND_dotproduct_vector3": SGNodeCost(aluWeight: 1),
+        "ND_dotproduct_vector4": SGNodeCost(aluWeight: 1),
+        "ND_exp_float": SGNodeCost(aluWeight: 6),
+        "ND_exp_half": SGNodeCost(aluWeight: 6),
+        "ND_exp_half2": SGNodeCost(aluWeight: 12),
+        "ND_exp_half3": SGNodeCost(aluWeight: 18),
+        "ND_exp_half4": SGNodeCost(aluWeight: 24),
+        "ND_exp_vector2": SGNodeCost(aluWeight: 12),
+        "ND_exp_vector3": SGNodeCost(aluWeight: 18),
+        "ND_exp_vector4": SGNodeCost(aluWeight: 24),
+        "ND_extract_color3": SGNodeCost(aluWeight: 1),
+        "ND_extract_color4": SGNodeCost(aluWeight: 1),
+        "ND_extract_vector2": SGNodeCost(aluWeight: 1),
+        "ND_extract_vector3": SGNodeCost(aluWeight: 1),
+        "ND_extract_vector4": SGNodeCost(aluWeight: 1),
+        "ND_floor_color3": SGNodeCost(aluWeight: 3),
+        "ND_floor_color4": SGNodeCost(aluWeight: 4),
+        "ND_floor_float": SGNodeCost(aluWeight: 1),
+        "ND_floor_half": SGNodeCost(aluWeight: 1),
+        "ND_floor_vector2": SGNodeCost(aluWeight: 2),
+        "ND_floor_vector3": SGNodeCost(aluWeight: 3),
+        "ND_floor_vector4": SGNodeCost(aluWeight: 4),
+        "ND_fractal3d_color3": SGNodeCost(aluWeight: 384, isNoise: true),
+        "ND_fractal3d_color3FA": SGNodeCost(aluWeight: 384, isNoise: true),
+        "ND_fractal3d_color4": SGNodeCost(aluWeight: 512, isNoise: true),
+        "ND_fractal3d_color4FA": SGNodeCost(aluWeight: 512, isNoise: true),
+        "ND_fractal3d_float": SGNodeCost(aluWeight: 128, isNoise: true),
+        "ND_fractal3d_vector2": SGNodeCost(aluWeight: 256, isNoise: true),
+        "ND_fractal3d_vector2FA": SGNodeCost(aluWeight: 256, isNoise: true),
+        "ND_fractal3d_vector3": SGNodeCost(aluWeight: 384, isNoise: true),
+        "ND_fractal3d_vector3FA": SGNodeCost(aluWeight: 384, isNoise: true),
+        "ND_fractal3d_vector4": SGNodeCost(aluWeight: 512, isNoise: true),
+        "ND_fractal3d_vector4FA": SGNodeCost(aluWeight: 512, isNoise: true),
+        "ND_frame_float": SGNodeCost(aluWeight: 1),
+        "ND_geomcolor_color3": SGNodeCost(aluWeight: 3),
+        "ND_geomcolor_color4": SGNodeCost(aluWeight: 4),
+        "ND_geomcolor_float": SGNodeCost(aluWeight: 1),
+        "ND_geompropvalue_boolean": SGNodeCost(aluWeight: 1),
+        "ND_geompropvalue_color3": SGNodeCost(aluWeight: 3),
+        "ND_geompropvalue_color4": SGNodeCost(aluWeight: 4),
+        "ND_geompropvalue_float": SGNodeCost(aluWeight: 1),
+        "ND_geompropvalue_half": SGNodeCost(aluWeight: 1),
+        "ND_geompropvalue_integer": SGNodeCost(aluWeight: 1),
+        "ND_geompropvalue_string": SGNodeCost(aluWeight: 1),
+        "ND_geompropvalue_vector2": SGNodeCost(aluWeight: 2),
+        "ND_geompropvalue_vector3": SGNodeCost(aluWeight: 3),
+        "ND_geompropvalue_vector4": SGNodeCost(aluWeight: 4),
+        "ND_heighttonormal_vector3": SGNodeCost(aluWeight: 72),
+        "ND_hsvadjust_color3": SGNodeCost(aluWeight: 72),
+        "ND_hsvadjust_color4": SGNodeCost(aluWeight: 96),
+        "ND_hsvtorgb_color3": SGNodeCost(aluWeight: 36),
+        "ND_hsvtorgb_color4": SGNodeCost(aluWeight: 48),
+        "ND_ifequal_color3": SGNodeCost(aluWeight: 3, isBranch: true),
+        "ND_ifequal_color3B": SGNodeCost(aluWeight: 3, isBranch: true),
+        "ND_ifequal_color3I": SGNodeCost(aluWeight: 3, isBranch: true),
+        "ND_ifequal_color4": SGNodeCost(aluWeight: 4, isBranch: true),
+        "ND_ifequal_color4B": SGNodeCost(aluWeight: 4, isBranch: true),
+        "ND_ifequal_color4I": SGNodeCost(aluWeight: 4, isBranch: true),
+        "ND_ifequal_float": SGNodeCost(aluWeight: 1, isBranch: true),
+        "ND_ifequal_floatB": SGNodeCost(aluWeight: 1, isBranch: true),
+        "ND_ifequal_floatI": SGNodeCost(aluWeight: 1, isBranch: true),
+        "ND_ifequal_half": SGNodeCost(aluWeight: 1, isBranch: true),
+        "ND_ifequal_half2": SGNodeCost(aluWeight: 2, isBranch: true),
+        "ND_ifequal_half2B": SGNodeCost(aluWeight: 2, isBranch: true),
+        "ND_ifequal_half2I": SGNodeCost(aluWeight: 2, isBranch: true),
+        "ND_ifequal_half3": SGNodeCost(aluWeight: 3, isBranch: true),
+        "ND_ifequal_half3B": SGNodeCost(aluWeight: 3, isBranch: true),
+        "ND_ifequal_half3I": SGNodeCost(aluWeight: 3, isBranch: true),
+        "ND_ifequal_half4": SGNodeCost(aluWeight: 4, isBranch: true),
+        "ND_ifequal_half4B": SGNodeCost(aluWeight: 4, isBranch: true),
+        "ND_ifequal_half4I": SGNodeCost(aluWeight: 4, isBranch: true),
+        "ND_ifequal_halfB": SGNodeCost(aluWeight: 1, isBranch: true),
+        "ND_ifequal_halfI": SGNodeCost(aluWeight: 1, isBranch: true),
+        "ND_ifequal_vector2": SGNodeCost(aluWeight: 2, isBranch: true),
+        "ND_ifequal_vector2B": SGNodeCost(aluWeight: 2, isBranch: true),
+        "ND_ifequal_vector2I": SGNodeCost(aluWeight: 2, isBranch: true),
+        "ND_ifequal_vector3": SGNodeCost(aluWeight: 3, isBranch: true),
+        "ND_ifequal_vector3B": SGNodeCost(aluWeight: 3, isBranch: true),
+        "ND_ifequal_vector3I": SGNodeCost(aluWeight: 3, isBranch: true),
+        "ND_ifequal_vector4": SGNodeCost(aluWeight: 4, isBranch: true),
+        "ND_ifequal_vector4B": SGNodeCost(aluWeight: 4, isBranch: true),
+        "ND_ifequal_vector4I": SGNodeCost(aluWeight: 4, isBranch: true),
+        "ND_ifgreater_color3": SGNodeCost(aluWeight: 3, isBranch: true),
+        "ND_ifgreater_color3I": SGNodeCost(aluWeight: 3, isBranch: true),
+        "ND_ifgreater_color4": SGNodeCost(aluWeight: 4, isBranch: true),
+        "ND_ifgreater_color4I": SGNodeCost(aluWeight: 4, isBranch: true),
+        "ND_ifgreater_float": SGNodeCost(aluWeight: 1, isBranch: true),
+        "ND_ifgreater_floatI": SGNodeCost(aluWeight: 1, isBranch: true),
+        "ND_ifgreater_half": SGNodeCost(aluWeight: 1, isBranch: true),
+        "ND_ifgreater_half2": SGNodeCost(aluWeight: 2, isBranch: true),
+        "ND_ifgreater_half2I": SGNodeCost(aluWeight: 2, isBranch: true),
+        "ND_ifgreater_half3": SGNodeCost(aluWeight: 3, isBranch: true),
+        "ND_ifgreater_half3I": SGNodeCost(aluWeight: 3, isBranch: true),
+        "ND_ifgreater_half4": SGNodeCost(aluWeight: 4, isBranch: true),
+        "ND_ifgreater_half4I": SGNodeCost(aluWeight: 4, isBranch: true),
+        "ND_ifgreater_halfI": SGNodeCost(aluWeight: 1, isBranch: true),
+        "ND_ifgreater_vector2": SGNodeCost(aluWeight: 2, isBranch: true),
+        "ND_ifgreater_vector2I": SGNodeCost(aluWeight: 2, isBranch: true),
+        "ND_ifgreater_vector3": SGNodeCost(aluWeight: 3, isBranch: true),
+        "ND_ifgreater_vector3I": SGNodeCost(aluWeight: 3, isBranch: true),
+        "ND_ifgreater_vector4": SGNodeCost(aluWeight: 4, isBranch: true),
+        "ND_ifgreater_vector4I": SGNodeCost(aluWeight: 4, isBranch: true),
+        "ND_ifgreatereq_color3": SGNodeCost(aluWeight: 3, isBranch: true),
+        "ND_ifgreatereq_color3I": SGNodeCost(aluWeight: 3, isBranch: true),
+        "ND_ifgreatereq_color4": SGNodeCost(aluWeight: 4, isBranch: true),
+        "ND_ifgreatereq_color4I": SGNodeCost(aluWeight: 4, isBranch: true),
+        "ND_ifgreatereq_float": SGNodeCost(aluWeight: 1, isBranch: true),
+        "ND_ifgreatereq_floatI": SGNodeCost(aluWeight: 1, isBranch: true),
+        "ND_ifgreatereq_half": SGNodeCost(aluWeight: 1, isBranch: true),
+        "ND_ifgreatereq_half2": SGNodeCost(aluWeight: 2, isBranch: true),
+        "ND_ifgreatereq_half2I": SGNodeCost(aluWeight: 2, isBranch: true),
+        "ND_ifgreatereq_half3": SGNodeCost(aluWeight: 3, isBranch: true),
+        "ND_ifgreatereq_half3I": SGNodeCost(aluWeight: 3, isBranch: true),
+        "ND_ifgreatereq_half4": SGNodeCost(aluWeight: 4, isBranch: true),
+        "ND_ifgreatereq_half4I": SGNodeCost(aluWeight: 4, isBranch: true),
+        "ND_ifgreatereq_halfI": SGNodeCost(aluWeight: 1, isBranch: true),
+        "ND_ifgreatereq_vector2": SGNodeCost(aluWeight: 2, isBranch: true),
+        "ND_ifgreatereq_vector2I": SGNodeCost(aluWeight: 2, isBranch: true),
+        "ND_ifgreatereq_vector3": SGNodeCost(aluWeight: 3, isBranch: true),
+        "ND_ifgreatereq_vector3I": SGNodeCost(aluWeight: 3, isBranch: true),
+        "ND_ifgreatereq_vector4": SGNodeCost(aluWeight: 4, isBranch: true),
+        "ND_ifgreatereq_vector4I": SGNodeCost(aluWeight: 4, isBranch: true),
+        "ND_image_color3": SGNodeCost(aluWeight: 12, textureSamples: 1),
+        "ND_image_color4": SGNodeCost(aluWeight: 16, textureSamples: 1),
+        "ND_image_float": SGNodeCost(aluWeight: 4, textureSamples: 1),
+        "ND_image_half": SGNodeCost(aluWeight: 4, textureSamples: 1),
+        "ND_image_vector2": SGNodeCost(aluWeight: 8, textureSamples: 1),
+        "ND_image_vector3": SGNodeCost(aluWeight: 12, textureSamples: 1),
+        "ND_image_vector4": SGNodeCost(aluWeight: 16, textureSamples: 1),
+        "ND_in_color4": SGNodeCost(aluWeight: 4),
+        "ND_inside_color3": SGNodeCost(aluWeight: 3),
+        "ND_inside_color4": SGNodeCost(aluWeight: 4),
+        "ND_inside_float": SGNodeCost(aluWeight: 1),
+        "ND_inside_half": SGNodeCost(aluWeight: 1),
+        "ND_invertmatrix_matrix22": SGNodeCost(aluWeight: 128),
+        "ND_invertmatrix_matrix33": SGNodeCost(aluWeight: 288),
+        "ND_invertmatrix_matrix44": SGNodeCost(aluWeight: 512),
+        "ND_ln_float": SGNodeCost(aluWeight: 6),
+        "ND_ln_half": SGNodeCost(aluWeight: 6),
+        "ND_ln_half2": SGNodeCost(aluWeight: 12),
+        "ND_ln_half3": SGNodeCost(aluWeight: 18),
+        "ND_ln_half4": SGNodeCost(aluWeight: 24),
+        "ND_ln_vector2": SGNodeCost(aluWeight: 12),
+        "ND_ln_vector3": SGNodeCost(aluWeight: 18),
+        "ND_ln_vector4": SGNodeCost(aluWeight: 24),
+        "ND_luminance_color3": SGNodeCost(aluWeight: 9),
+        "ND_luminance_color4": SGNodeCost(aluWeight: 12),
+        "ND_magnitude_half2": SGNodeCost(aluWeight: 4),
+        "ND_magnitude_half3": SGNodeCost(aluWeight: 4),
+        "ND_magnitude_half4": SGNodeCost(aluWeight: 4),
+        "ND_magnitude_vector2": SGNodeCost(aluWeight: 4),
+        "ND_magnitude_vector3": SGNodeCost(aluWeight: 4),
+        "ND_magnitude_vector4": SGNodeCost(aluWeight: 4),
+        "ND_mask_color4": SGNodeCost(aluWeight: 4),
+        "ND_matte_color4": SGNodeCost(aluWeight: 4),
+        "ND_max_color3": SGNodeCost(aluWeight: 3),
+        "ND_max_color3FA": SGNodeCost(aluWeight: 3),
+        "ND_max_color4": SGNodeCost(aluWeight: 4),
+        "ND_max_color4FA": SGNodeCost(aluWeight: 4),
+        "ND_max_float": SGNodeCost(aluWeight: 1),
+        "ND_max_half": SGNodeCost(aluWeight: 1),
+        "ND_max_half2": SGNodeCost(aluWeight: 2),
+        "ND_max_half2FA": SGNodeCost(aluWeight: 2),
+        "ND_max_half3": SGNodeCost(aluWeight: 3),
+        "ND_max_half3FA": SGNodeCost(aluWeight: 3),
+        "ND_max_half4": SGNodeCost(aluWeight: 4),
+        "ND_max_half4FA": SGNodeCost(aluWeight: 4),
+        "ND_max_vector2": SGNodeCost(aluWeight: 2),
+        "ND_max_vector2FA": SGNodeCost(aluWeight: 2),
+        "ND_max_vector3": SGNodeCost(aluWeight: 3),
+        "ND_max_vector3FA": SGNodeCost(aluWeight: 3),
+        "ND_max_vector4": SGNodeCost(aluWeight: 4),
+        "ND_max_vector4FA": SGNodeCost(aluWeight: 4),
+        "ND_min_color3": SGNodeCost(aluWeight: 3),
+        "ND_min_color3FA": SGNodeCost(aluWeight: 3),
+        "ND_min_color4": SGNodeCost(aluWeight: 4),
+        "ND_min_color4FA": SGNodeCost(aluWeight: 4),
+        "ND_min_float": SGNodeCost(aluWeight: 1),
+        "ND_min_half": SGNodeCost(aluWeight: 1),
+        "ND_min_half2": SGNodeCost(aluWeight: 2),
+        "ND_min_half2FA": SGNodeCost(aluWeight: 2),
+        "ND_min_half3": SGNodeCost(aluWeight: 3),
+        "ND_min_half3FA": SGNodeCost(aluWeight: 3),
+        "ND_min_half4": SGNodeCost(aluWeight: 4),
+        "ND_min_half4FA": SGNodeCost(aluWeight: 4),
+        "ND_min_vector2": SGNodeCost(aluWeight: 2),
+        "ND_min_vector2FA": SGNodeCost(aluWeight: 2),
+        "ND_min_vector3": SGNodeCost(aluWeight: 3),
+        "ND_min_vector3FA": SGNodeCost(aluWeight: 3),
+        "ND_min_vector4": SGNodeCost(aluWeight: 4),
+        "ND_min_vector4FA": SGNodeCost(aluWeight: 4),
+        "ND_minus_color3": SGNodeCost(aluWeight: 3),
+        "ND_minus_color4": SGNodeCost(aluWeight: 4),
+        "ND_minus_float": SGNodeCost(aluWeight: 1),
+        "ND_minus_half": SGNodeCost(aluWeight: 1),
+        "ND_mix_color3": SGNodeCost(aluWeight: 9),
+        "ND_mix_color4": SGNodeCost(aluWeight: 12),
+        "ND_mix_displacementshader": SGNodeCost(aluWeight: 1),
+        "ND_mix_float": SGNodeCost(aluWeight: 3),
+        "ND_mix_half": SGNodeCost(aluWeight: 3),
+        "ND_mix_half2": SGNodeCost(aluWeight: 6),
+        "ND_mix_half3": SGNodeCost(aluWeight: 9),
+        "ND_mix_half4": SGNodeCost(aluWeight: 12),
+        "ND_mix_surfaceshader": SGNodeCost(aluWeight: 1),
+        "ND_mix_vector2": SGNodeCost(aluWeight: 6),
+        "ND_mix_vector3": SGNodeCost(aluWeight: 9),
+        "ND_mix_vector4": SGNodeCost(aluWeight: 12),
+        "ND_mix_volumeshader": SGNodeCost(aluWeight: 1),
+        "ND_modulo_color3": SGNodeCost(aluWeight: 12),
+        "ND_modulo_color3FA": SGNodeCost(aluWeight: 12),
+        "ND_modulo_color4": SGNodeCost(aluWeight: 16),
+        "ND_modulo_color4FA": SGNodeCost(aluWeight: 16),
+        "ND_modulo_float": SGNodeCost(aluWeight: 4),
+        "ND_modulo_half": SGNodeCost(aluWeight: 4),
+        "ND_modulo_vector2": SGNodeCost(aluWeight: 8),
+        "ND_modulo_vector2FA": SGNodeCost(aluWeight: 8),
+        "ND_modulo_vector3": SGNodeCost(aluWeight: 12),
+        "ND_modulo_vector3FA": SGNodeCost(aluWeight: 12),
+        "ND_modulo_vector4": SGNodeCost(aluWeight: 16),
+        "ND_modulo_vector4FA": SGNodeCost(aluWeight: 16),
+        "ND_multiply_color3": SGNodeCost(aluWeight: 3),
+        "ND_multiply_color3FA": SGNodeCost(aluWeight: 3),
+        "ND_multiply_color4": SGNodeCost(aluWeight: 4),
+        "ND_multiply_color4FA": SGNodeCost(aluWeight: 4),
+        "ND_multiply_displacementshaderF": SGNodeCost(aluWeight: 1),
+        "ND_multiply_displacementshaderV": SGNodeCost(aluWeight: 1),
+        "ND_multiply_float": SGNodeCost(aluWeight: 1),
+        "ND_multiply_half": SGNodeCost(aluWeight: 1),
+        "ND_multiply_matrix22": SGNodeCost(aluWeight: 4),
+        "ND_multiply_matrix33": SGNodeCost(aluWeight: 9),
+        "ND_multiply_matrix44": SGNodeCost(aluWeight: 16),
+        "ND_multiply_surfaceshaderC": SGNodeCost(aluWeight: 1),
+        "ND_multiply_surfaceshaderF": SGNodeCost(aluWeight: 1),
+        "ND_multiply_vector2": SGNodeCost(aluWeight: 2),
+        "ND_multiply_vector2FA": SGNodeCost(aluWeight: 2),
+        "ND_multiply_vector3": SGNodeCost(aluWeight: 3),
+        "ND_multiply_vector3FA": SGNodeCost(aluWeight: 3),
+        "ND_multiply_vector4": SGNodeCost(aluWeight: 4),
+        "ND_multiply_vector4FA": SGNodeCost(aluWeight: 4),
+        "ND_multiply_volumeshaderC": SGNodeCost(aluWeight: 1),
+        "ND_multiply_volumeshaderF": SGNodeCost(aluWeight: 1),
+        "ND_noise2d_color3": SGNodeCost(aluWeight: 72, isNoise: true),
+        "ND_noise2d_color3FA": SGNodeCost(aluWeight: 72, isNoise: true),
+        "ND_noise2d_color4": SGNodeCost(aluWeight: 96, isNoise: true),
+        "ND_noise2d_color4FA": SGNodeCost(aluWeight: 96, isNoise: true),
+        "ND_noise2d_float": SGNodeCost(aluWeight: 24, isNoise: true),
+        "ND_noise2d_vector2": SGNodeCost(aluWeight: 48, isNoise: true),
+        "ND_noise2d_vector2FA": SGNodeCost(aluWeight: 48, isNoise: true),
+        "ND_noise2d_vector3": SGNodeCost(aluWeight: 72, isNoise: true),
+        "ND_noise2d_vector3FA": SGNodeCost(aluWeight: 72, isNoise: true),
+        "ND_noise2d_vector4": SGNodeCost(aluWeight: 96, isNoise: true),
+        "ND_noise2d_vector4FA": SGNodeCost(aluWeight: 96, isNoise: true),
+        "ND_noise3d_color3": SGNodeCost(aluWeight: 96, isNoise: true),
+        "ND_noise3d_color3FA": SGNodeCost(aluWeight: 96, isNoise: true),
+        "ND_noise3d_color4": SGNodeCost(aluWeight: 128, isNoise: true),
+        "ND_noise3d_color4FA": SGNodeCost(aluWeight: 128, isNoise: true),
+        "ND_noise3d_float": SGNodeCost(aluWeight: 32, isNoise: true),
+        "ND_noise3d_vector2": SGNodeCost(aluWeight: 64, isNoise: true),
+        "ND_noise3d_vector2FA": SGNodeCost(aluWeight: 64, isNoise: true),
+        "ND_noise3d_vector3": SGNodeCost(aluWeight: 96, isNoise: true),
+        "ND_noise3d_vector3FA": SGNodeCost(aluWeight: 96, isNoise: true),
+        "ND_noise3d_vector4": SGNodeCost(aluWeight: 128, isNoise: true),
+        "ND_noise3d_vector4FA": SGNodeCost(aluWeight: 128, isNoise: true),
+        "ND_normal_map_decode": SGNodeCost(aluWeight: 3),
+        "ND_normal_vector3": SGNodeCost(aluWeight: 3),
+        "ND_normalize_half2": SGNodeCost(aluWeight: 12),
+        "ND_normalize_half3": SGNodeCost(aluWeight: 18),
+        "ND_normalize_half4": SGNodeCost(aluWeight: 24),
+        "ND_normalize_vector2": SGNodeCost(aluWeight: 12),
+        "ND_normalize_vector3": SGNodeCost(aluWeight: 18),
+        "ND_normalize_vector4": SGNodeCost(aluWeight: 24),
+        "ND_normalmap": SGNodeCost(aluWeight: 36),
+        "ND_normalmap_vector2": SGNodeCost(aluWeight: 36),
+        "ND_out_color4": SGNodeCost(aluWeight: 4),
+        "ND_outside_color3": SGNodeCost(aluWeight: 3),
+        "ND_outside_color4": SGNodeCost(aluWeight: 4),
+        "ND_outside_float": SGNodeCost(aluWeight: 1),
+        "ND_outside_half": SGNodeCost(aluWeight: 1),
+        "ND_over_color4": SGNodeCost(aluWeight: 4),
+        "ND_overlay_color3": SGNodeCost(aluWeight: 18),
+        "ND_overlay_color4": SGNodeCost(aluWeight: 24),
+        "ND_overlay_float": SGNodeCost(aluWeight: 6),
+        "ND_overlay_half": SGNodeCost(aluWeight: 6),
+        "ND_place2d_vector2": SGNodeCost(aluWeight: 24),
+        "ND_plus_color3": SGNodeCost(aluWeight: 3),
+        "ND_plus_color4": SGNodeCost(aluWeight: 4),
+        "ND_plus_float": SGNodeCost(aluWeight: 1),
+        "ND_plus_half": SGNodeCost(aluWeight: 1),
+        "ND_position_vector3": SGNodeCost(aluWeight: 3),
+        "ND_power_color3": SGNodeCost(aluWeight: 24),
+        "ND_power_color3FA": SGNodeCost(aluWeight: 24),
+        "ND_power_color4": SGNodeCost(aluWeight: 32),
+        "ND_power_color4FA": SGNodeCost(aluWeight: 32),
+        "ND_power_float": SGNodeCost(aluWeight: 8),
+        "ND_power_half": SGNodeCost(aluWeight: 8),
+        "ND_power_vector2": SGNodeCost(aluWeight: 16),
+        "ND_power_vector2FA": SGNodeCost(aluWeight: 16),
+        "ND_power_vector3": SGNodeCost(aluWeight: 24),
+        "ND_power_vector3FA": SGNodeCost(aluWeight: 24),
+        "ND_power_vector4": SGNodeCost(aluWeight: 32),
+        "ND_power_vector4FA": SGNodeCost(aluWeight: 32),
+        "ND_premult_color4": SGNodeCost(aluWeight: 4),
+        "ND_ramp4_color3": SGNodeCost(aluWeight: 3),
+        "ND_ramp4_color4": SGNodeCost(aluWeight: 4),
+        "ND_ramp4_float": SGNodeCost(aluWeight: 1),
+        "ND_ramp4_vector2": SGNodeCost(aluWeight: 2),
+        "ND_ramp4_vector3": SGNodeCost(aluWeight: 3),
+        "ND_ramp4_vector4": SGNodeCost(aluWeight: 4),
+        "ND_ramplr_color3": SGNodeCost(aluWeight: 3),
+        "ND_ramplr_color4": SGNodeCost(aluWeight: 4),
+        "ND_ramplr_float": SGNodeCost(aluWeight: 1),
+        "ND_ramplr_half": SGNodeCost(aluWeight: 1),
+        "ND_ramplr_half2": SGNodeCost(aluWeight: 2),
+        "ND_ramplr_half3": SGNodeCost(aluWeight: 3),
+        "ND_ramplr_half4": SGNodeCost(aluWeight: 4),
+        "ND_ramplr_vector2": SGNodeCost(aluWeight: 2),
+        "ND_ramplr_vector3": SGNodeCost(aluWeight: 3),
+        "ND_ramplr_vector4": SGNodeCost(aluWeight: 4),
+        "ND_ramptb_color3": SGNodeCost(aluWeight: 3),
+        "ND_ramptb_color4": SGNodeCost(aluWeight: 4),
+        "ND_ramptb_float": SGNodeCost(aluWeight: 1),
+        "ND_ramptb_half": SGNodeCost(aluWeight: 1),
+        "ND_ramptb_half2": SGNodeCost(aluWeight: 2),
+        "ND_ramptb_half3": SGNodeCost(aluWeight: 3),
+        "ND_ramptb_half4": SGNodeCost(aluWeight: 4),
+        "ND_ramptb_vector2": SGNodeCost(aluWeight: 2),
+        "ND_ramptb_vector3": SGNodeCost(aluWeight: 3),
+        "ND_ramptb_vector4": SGNodeCost(aluWeight: 4),
+        "ND_range_color3": SGNodeCost(aluWeight: 24),
+        "ND_range_color3FA": SGNodeCost(aluWeight: 24),
+        "ND_range_color4": SGNodeCost(aluWeight: 32),
+        "ND_range_color4FA": SGNodeCost(aluWeight: 32),
+        "ND_range_float": SGNodeCost(aluWeight: 8),
+        "ND_range_vector2": SGNodeCost(aluWeight: 16),
+        "ND_range_vector2FA": SGNodeCost(aluWeight: 16),
+        "ND_range_vector3": SGNodeCost(aluWeight: 24),
+        "ND_range_vector3FA": SGNodeCost(aluWeight: 24),
+        "ND_range_vector4": SGNodeCost(aluWeight: 32),
+        "ND_range_vector4FA": SGNodeCost(aluWeight: 32),
+        "ND_realitykit_cameraposition_vector3": SGNodeCost(aluWeight: 3),
+        "ND_realitykit_combine2_matrix22": SGNodeCost(aluWeight: 4),
+        "ND_realitykit_combine3_matrix33": SGNodeCost(aluWeight: 9),
+        "ND_realitykit_combine4_matrix44": SGNodeCost(aluWeight: 16),
+        "ND_realitykit_environment_radiance": SGNodeCost(aluWeight: 192),
+        "ND_realitykit_fractional_color3": SGNodeCost(aluWeight: 3),
+        "ND_realitykit_fractional_color4": SGNodeCost(aluWeight: 4),
+        "ND_realitykit_fractional_float": SGNodeCost(aluWeight: 1),
+        "ND_realitykit_fractional_vector2": SGNodeCost(aluWeight: 2),
+        "ND_realitykit_fractional_vector3": SGNodeCost(aluWeight: 3),
+        "ND_realitykit_fractional_vector4": SGNodeCost(aluWeight: 4),
+        "ND_realitykit_geometry_modifier_custom_attribute": SGNodeCost(aluWeight: 4),
+        "ND_realitykit_geometry_modifier_custom_attribute_half2_0": SGNodeCost(aluWeight: 2),
+        "ND_realitykit_geometry_modifier_custom_attribute_half2_1": SGNodeCost(aluWeight: 2),
+        "ND_realitykit_geometry_modifier_custom_attribute_half4_0": SGNodeCost(aluWeight: 4),
+        "ND_realitykit_geometry_modifier_custom_attribute_half4_1": SGNodeCost(aluWeight: 4),
+        "ND_realitykit_geometry_modifier_custom_attribute_half4_2": SGNodeCost(aluWeight: 4),
+        "ND_realitykit_geometry_modifier_custom_attribute_half4_3": SGNodeCost(aluWeight: 4),
+        "ND_realitykit_geometry_modifier_custom_parameter": SGNodeCost(aluWeight: 4),
+        "ND_realitykit_geometry_modifier_model_position_offset": SGNodeCost(aluWeight: 3),
+        "ND_realitykit_geometry_modifier_model_to_view": SGNodeCost(aluWeight: 16),
+        "ND_realitykit_geometry_modifier_model_to_world": SGNodeCost(aluWeight: 16),
+        "ND_realitykit_geometry_modifier_normal_to_world": SGNodeCost(aluWeight: 9),
+        "ND_realitykit_geometry_modifier_projection_to_view": SGNodeCost(aluWeight: 16),
+        "ND_realitykit_geometry_modifier_uv0_offset": SGNodeCost(aluWeight: 2),
+        "ND_realitykit_geometry_modifier_uv0_transform": SGNodeCost(aluWeight: 4),
+        "ND_realitykit_geometry_modifier_uv1_offset": SGNodeCost(aluWeight: 2),
+        "ND_realitykit_geometry_modifier_uv1_transform": SGNodeCost(aluWeight: 4),
+        "ND_realitykit_geometry_modifier_vertex_id": SGNodeCost(aluWeight: 1),
+        "ND_realitykit_geometry_modifier_view_to_projection": SGNodeCost(aluWeight: 16),
+        "ND_realitykit_geometry_modifier_world_to_model": SGNodeCost(aluWeight: 16),
+        "ND_realitykit_geometry_switch_cameraindex_color3": SGNodeCost(aluWeight: 3, isBranch: true),
+        "ND_realitykit_geometry_switch_cameraindex_color4": SGNodeCost(aluWeight: 4, isBranch: true),
+        "ND_realitykit_geometry_switch_cameraindex_float": SGNodeCost(aluWeight: 1, isBranch: true),
+        "ND_realitykit_geometry_switch_cameraindex_integer": SGNodeCost(aluWeight: 1, isBranch: true),
+        "ND_realitykit_geometry_switch_cameraindex_vector2": SGNodeCost(aluWeight: 2, isBranch: true),
+        "ND_realitykit_geometry_switch_cameraindex_vector3": SGNodeCost(aluWeight: 3, isBranch: true),
+        "ND_realitykit_geometry_switch_cameraindex_vector4": SGNodeCost(aluWeight: 4, isBranch: true),
+        "ND_realitykit_geometrymodifier_vertexshader": SGNodeCost(aluWeight: 1),
+        "ND_realitykit_logical_and": SGNodeCost(aluWeight: 1),
+        "ND_realitykit_logical_not": SGNodeCost(aluWeight: 1),
+        "ND_realitykit_logical_or": SGNodeCost(aluWeight: 1),
+        "ND_realitykit_logical_xor": SGNodeCost(aluWeight: 1),
+        "ND_realitykit_material_parameters_base_color_tint": SGNodeCost(aluWeight: 3),
+        "ND_realitykit_material_parameters_clearcoat_roughness_scale": SGNodeCost(aluWeight: 1),
+        "ND_realitykit_material_parameters_clearcoat_scale": SGNodeCost(aluWeight: 1),
+        "ND_realitykit_material_parameters_emissive_color": SGNodeCost(aluWeight: 3),
+        "ND_realitykit_material_parameters_metallic_scale": SGNodeCost(aluWeight: 1),
+        "ND_realitykit_material_parameters_opacity_scale": SGNodeCost(aluWeight: 1),
+        "ND_realitykit_material_parameters_opacity_threshold": SGNodeCost(aluWeight: 1),
+        "ND_realitykit_material_parameters_roughness_scale": SGNodeCost(aluWeight: 1),
+        "ND_realitykit_material_parameters_specular_scale": SGNodeCost(aluWeight: 1),
+        "ND_realitykit_occlusion_surfaceshader": SGNodeCost(aluWeight: 1),
+        "ND_realitykit_oneminus_color3": SGNodeCost(aluWeight: 3),
+        "ND_realitykit_oneminus_color4": SGNodeCost(aluWeight: 4),
+        "ND_realitykit_oneminus_float": SGNodeCost(aluWeight: 1),
+        "ND_realitykit_oneminus_vector2": SGNodeCost(aluWeight: 2),
+        "ND_realitykit_oneminus_vector3": SGNodeCost(aluWeight: 3),
+        "ND_realitykit_oneminus_vector4": SGNodeCost(aluWeight: 4),
+        "ND_realitykit_pbr_surfaceshader": SGNodeCost(aluWeight: 64),
+        "ND_realitykit_reflect_vector3": SGNodeCost(aluWeight: 12),
+        "ND_realitykit_refract_vector3": SGNodeCost(aluWeight: 24),
+        "ND_realitykit_shadowreceiver_surfaceshader": SGNodeCost(aluWeight: 1),
+        "ND_realitykit_step_color3": SGNodeCost(aluWeight: 3),
+        "ND_realitykit_step_color4": SGNodeCost(aluWeight: 4),
+        "ND_realitykit_step_float": SGNodeCost(aluWeight: 1),
+        "ND_realitykit_step_vector2": SGNodeCost(aluWeight: 2),
+        "ND_realitykit_step_vector3": SGNodeCost(aluWeight: 3),
+        "ND_realitykit_step_vector4": SGNodeCost(aluWeight: 4),
+        "ND_realitykit_surface_ambient_occlusion": SGNodeCost(aluWeight: 1),
+        "ND_realitykit_surface_base_color": SGNodeCost(aluWeight: 3),
+        "ND_realitykit_surface_clearcoat": SGNodeCost(aluWeight: 1),
+        "ND_realitykit_surface_clearcoat_roughness": SGNodeCost(aluWeight: 1),
+        "ND_realitykit_surface_custom_attribute": SGNodeCost(aluWeight: 4),
+        "ND_realitykit_surface_custom_attribute_half2_0": SGNodeCost(aluWeight: 2),
+        "ND_realitykit_surface_custom_attribute_half2_1": SGNodeCost(aluWeight: 2),
+        "ND_realitykit_surface_custom_attribute_half4_0": SGNodeCost(aluWeight: 4),
+        "ND_realitykit_surface_custom_attribute_half4_1": SGNodeCost(aluWeight: 4),
+        "ND_realitykit_surface_custom_attribute_half4_2": SGNodeCost(aluWeight: 4),
+        "ND_realitykit_surface_custom_attribute_half4_3": SGNodeCost(aluWeight: 4),
+        "ND_realitykit_surface_custom_parameter": SGNodeCost(aluWeight: 4),
+        "ND_realitykit_surface_emissive_color": SGNodeCost(aluWeight: 3),
+        "ND_realitykit_surface_metallic": SGNodeCost(aluWeight: 1),
+        "ND_realitykit_surface_model_to_view": SGNodeCost(aluWeight: 16),
+        "ND_realitykit_surface_model_to_world": SGNodeCost(aluWeight: 16),
+        "ND_realitykit_surface_opacity": SGNodeCost(aluWeight: 1),
+        "ND_realitykit_surface_projection_to_view": SGNodeCost(aluWeight: 16),
+        "ND_realitykit_surface_roughness": SGNodeCost(aluWeight: 1),
+        "ND_realitykit_surface_screen_position": SGNodeCost(aluWeight: 4),
+        "ND_realitykit_surface_specular": SGNodeCost(aluWeight: 1),
+        "ND_realitykit_surface_view_direction": SGNodeCost(aluWeight: 3),
+        "ND_realitykit_surface_view_to_projection": SGNodeCost(aluWeight: 16),
+        "ND_realitykit_surface_world_to_view": SGNodeCost(aluWeight: 16),
+        "ND_realitykit_unlit_surfaceshader": SGNodeCost(aluWeight: 8),
+        "ND_realitykit_viewdirection_vector3": SGNodeCost(aluWeight: 3),
+        "ND_remap_color3": SGNodeCost(aluWeight: 12),
+        "ND_remap_color3FA": SGNodeCost(aluWeight: 12),
+        "ND_remap_color4": SGNodeCost(aluWeight: 16),
+        "ND_remap_color4FA": SGNodeCost(aluWeight: 16),
+        "ND_remap_float": SGNodeCost(aluWeight: 4),
+        "ND_remap_half": SGNodeCost(aluWeight: 4),
+        "ND_remap_half2": SGNodeCost(aluWeight: 8),
+        "ND_remap_half2FA": SGNodeCost(aluWeight: 8),
+        "ND_remap_half3": SGNodeCost(aluWeight: 12),
+        "ND_remap_half3FA": SGNodeCost(aluWeight: 12),
+        "ND_remap_half4": SGNodeCost(aluWeight: 16),
+        "ND_remap_half4FA": SGNodeCost(aluWeight: 16),
+        "ND_remap_vector2": SGNodeCost(aluWeight: 8),
+        "ND_remap_vector2FA": SGNodeCost(aluWeight: 8),
+        "ND_remap_vector3": SGNodeCost(aluWeight: 12),
+        "ND_remap_vector3FA": SGNodeCost(aluWeight: 12),
+        "ND_remap_vector4": SGNodeCost(aluWeight: 16),
+        "ND_remap_vector4FA": SGNodeCost(aluWeight: 16),
+        "ND_rgbtohsv_color3": SGNodeCost(aluWeight: 36),
+        "ND_rgbtohsv_color4": SGNodeCost(aluWeight: 48),
+        "ND_rotate2d_vector2": SGNodeCost(aluWeight: 16),
+        "ND_rotate3d_vector3": SGNodeCost(aluWeight: 48),
+        "ND_round_color3": SGNodeCost(aluWeight: 3),
+        "ND_round_color4": SGNodeCost(aluWeight: 4),
+        "ND_round_float": SGNodeCost(aluWeight: 1),
+        "ND_round_half": SGNodeCost(aluWeight: 1),
+        "ND_round_vector2": SGNodeCost(aluWeight: 2),
+        "ND_round_vector3": SGNodeCost(aluWeight: 3),
+        "ND_round_vector4": SGNodeCost(aluWeight: 4),
+        "ND_safepower_color3": SGNodeCost(aluWeight: 30),
+        "ND_safepower_color3FA": SGNodeCost(aluWeight: 30),
+        "ND_safepower_color4": SGNodeCost(aluWeight: 40),
+        "ND_safepower_color4FA": SGNodeCost(aluWeight: 40),
+        "ND_safepower_float": SGNodeCost(aluWeight: 10),
+        "ND_safepower_half": SGNodeCost(aluWeight: 10),
+        "ND_safepower_vector2": SGNodeCost(aluWeight: 20),
+        "ND_safepower_vector2FA": SGNodeCost(aluWeight: 20),
+        "ND_safepower_vector3": SGNodeCost(aluWeight: 30),
+        "ND_safepower_vector3FA": SGNodeCost(aluWeight: 30),
+        "ND_safepower_vector4": SGNodeCost(aluWeight: 40),
+        "ND_safepower_vector4FA": SGNodeCost(aluWeight: 40),
+        "ND_saturate_color3": SGNodeCost(aluWeight: 3),
+        "ND_saturate_color4": SGNodeCost(aluWeight: 4),
+        "ND_screen_color3": SGNodeCost(aluWeight: 3),
+        "ND_screen_color4": SGNodeCost(aluWeight: 4),
+        "ND_screen_float": SGNodeCost(aluWeight: 1),
+        "ND_screen_half": SGNodeCost(aluWeight: 1),
+        "ND_separate2_integer2": SGNodeCost(aluWeight: 2),
+        "ND_separate2_vector2": SGNodeCost(aluWeight: 2),
+        "ND_separate3_color3": SGNodeCost(aluWeight: 3),
+        "ND_separate3_integer3": SGNodeCost(aluWeight: 3),
+        "ND_separate3_vector3": SGNodeCost(aluWeight: 3),
+        "ND_separate4_color4": SGNodeCost(aluWeight: 4),
+        "ND_separate4_integer4": SGNodeCost(aluWeight: 4),
+        "ND_separate4_vector4": SGNodeCost(aluWeight: 4),
+        "ND_sign_color3": SGNodeCost(aluWeight: 3),
+        "ND_sign_color4": SGNodeCost(aluWeight: 4),
+        "ND_sign_float": SGNodeCost(aluWeight: 1),
+        "ND_sign_half": SGNodeCost(aluWeight: 1),
+        "ND_sign_half2": SGNodeCost(aluWeight: 2),
+        "ND_sign_half3": SGNodeCost(aluWeight: 3),
+        "ND_sign_half4": SGNodeCost(aluWeight: 4),
+        "ND_sign_vector2": SGNodeCost(aluWeight: 2),
+        "ND_sign_vector3": SGNodeCost(aluWeight: 3),
+        "ND_sign_vector4": SGNodeCost(aluWeight: 4),
+        "ND_sin_float": SGNodeCost(aluWeight: 6),
+        "ND_sin_half": SGNodeCost(aluWeight: 6),
+        "ND_sin_half2": SGNodeCost(aluWeight: 12),
+        "ND_sin_half3": SGNodeCost(aluWeight: 18),
+        "ND_sin_half4": SGNodeCost(aluWeight: 24),
+        "ND_sin_vector2": SGNodeCost(aluWeight: 12),
+        "ND_sin_vector3": SGNodeCost(aluWeight: 18),
+        "ND_sin_vector4": SGNodeCost(aluWeight: 24),
+        "ND_smoothstep_color3": SGNodeCost(aluWeight: 18),
+        "ND_smoothstep_color3FA": SGNodeCost(aluWeight: 18),
+        "ND_smoothstep_color4": SGNodeCost(aluWeight: 24),
+        "ND_smoothstep_color4FA": SGNodeCost(aluWeight: 24),
+        "ND_smoothstep_float": SGNodeCost(aluWeight: 6),
+        "ND_smoothstep_half": SGNodeCost(aluWeight: 6),
+        "ND_smoothstep_half2": SGNodeCost(aluWeight: 12),
+        "ND_smoothstep_half2FA": SGNodeCost(aluWeight: 12),
+        "ND_smoothstep_half3": SGNodeCost(aluWeight: 18),
+        "ND_smoothstep_half3FA": SGNodeCost(aluWeight: 18),
+        "ND_smoothstep_half4": SGNodeCost(aluWeight: 24),
+        "ND_smoothstep_half4FA": SGNodeCost(aluWeight: 24),
+        "ND_smoothstep_vector2": SGNodeCost(aluWeight: 12),
+        "ND_smoothstep_vector2FA": SGNodeCost(aluWeight: 12),
+        "ND_smoothstep_vector3": SGNodeCost(aluWeight: 18),
+        "ND_smoothstep_vector3FA": SGNodeCost(aluWeight: 18),
+        "ND_smoothstep_vector4": SGNodeCost(aluWeight: 24),
+        "ND_smoothstep_vector4FA": SGNodeCost(aluWeight: 24),
+        "ND_splitlr_color3": SGNodeCost(aluWeight: 3),
+        "ND_splitlr_color4": SGNodeCost(aluWeight: 4),
+        "ND_splitlr_float": SGNodeCost(aluWeight: 1),
+        "ND_splitlr_half": SGNodeCost(aluWeight: 1),
+        "ND_splitlr_vector2": SGNodeCost(aluWeight: 2),
+        "ND_splitlr_vector3": SGNodeCost(aluWeight: 3),
+        "ND_splitlr_vector4": SGNodeCost(aluWeight: 4),
+        "ND_splittb_color3": SGNodeCost(aluWeight: 3),
+        "ND_splittb_color4": SGNodeCost(aluWeight: 4),
+        "ND_splittb_float": SGNodeCost(aluWeight: 1),
+        "ND_splittb_half": SGNodeCost(aluWeight: 1),
+        "ND_splittb_half2": SGNodeCost(aluWeight: 2),
+        "ND_splittb_half3": SGNodeCost(aluWeight: 3),
+        "ND_splittb_half4": SGNodeCost(aluWeight: 4),
+        "ND_splittb_vector2": SGNodeCost(aluWeight: 2),
+        "ND_splittb_vector3": SGNodeCost(aluWeight: 3),
+        "ND_splittb_vector4": SGNodeCost(aluWeight: 4),
+        "ND_sqrt_float": SGNodeCost(aluWeight: 4),
+        "ND_sqrt_half": SGNodeCost(aluWeight: 4),
+        "ND_sqrt_half2": SGNodeCost(aluWeight: 8),
+        "ND_sqrt_half3": SGNodeCost(aluWeight: 12),
+        "ND_sqrt_half4": SGNodeCost(aluWeight: 16),
+        "ND_sqrt_vector2": SGNodeCost(aluWeight: 8),
+        "ND_sqrt_vector3": SGNodeCost(aluWeight: 12),
+        "ND_sqrt_vector4": SGNodeCost(aluWeight: 16),
+        "ND_subtract_color3": SGNodeCost(aluWeight: 3),
+        "ND_subtract_color3FA": SGNodeCost(aluWeight: 3),
+        "ND_subtract_color4": SGNodeCost(aluWeight: 4),
+        "ND_subtract_color4FA": SGNodeCost(aluWeight: 4),
+        "ND_subtract_float": SGNodeCost(aluWeight: 1),
+        "ND_subtract_half": SGNodeCost(aluWeight: 1),
+        "ND_subtract_matrix22": SGNodeCost(aluWeight: 4),
+        "ND_subtract_matrix22FA": SGNodeCost(aluWeight: 4),
+        "ND_subtract_matrix33": SGNodeCost(aluWeight: 9),
+        "ND_subtract_matrix33FA": SGNodeCost(aluWeight: 9),
+        "ND_subtract_matrix44": SGNodeCost(aluWeight: 16),
+        "ND_subtract_matrix44FA": SGNodeCost(aluWeight: 16),
+        "ND_subtract_vector2": SGNodeCost(aluWeight: 2),
+        "ND_subtract_vector2FA": SGNodeCost(aluWeight: 2),
+        "ND_subtract_vector3": SGNodeCost(aluWeight: 3),
+        "ND_subtract_vector3FA": SGNodeCost(aluWeight: 3),
+        "ND_subtract_vector4": SGNodeCost(aluWeight: 4),
+        "ND_subtract_vector4FA": SGNodeCost(aluWeight: 4),
+        "ND_surfacematerial": SGNodeCost(aluWeight: 1),
+        "ND_switch_color3": SGNodeCost(aluWeight: 3, isBranch: true),
+        "ND_switch_color3I": SGNodeCost(aluWeight: 3, isBranch: true),
+        "ND_switch_color4": SGNodeCost(aluWeight: 4, isBranch: true),
+        "ND_switch_color4I": SGNodeCost(aluWeight: 4, isBranch: true),
+        "ND_switch_float": SGNodeCost(aluWeight: 1, isBranch: true),
+        "ND_switch_floatI": SGNodeCost(aluWeight: 1, isBranch: true),
+        "ND_switch_half": SGNodeCost(aluWeight: 1, isBranch: true),
+        "ND_switch_halfI": SGNodeCost(aluWeight: 1, isBranch: true),
+        "ND_switch_vector2": SGNodeCost(aluWeight: 2, isBranch: true),
+        "ND_switch_vector2I": SGNodeCost(aluWeight: 2, isBranch: true),
+        "ND_switch_vector3": SGNodeCost(aluWeight: 3, isBranch: true),
+        "ND_switch_vector3I": SGNodeCost(aluWeight: 3, isBranch: true),
+        "ND_switch_vector4": SGNodeCost(aluWeight: 4, isBranch: true),
+        "ND_switch_vector4I": SGNodeCost(aluWeight: 4, isBranch: true),
+        "ND_swizzle_color3_color3": SGNodeCost(aluWeight: 3),
+        "ND_swizzle_color3_color4": SGNodeCost(aluWeight: 4),
+        "ND_swizzle_color3_float": SGNodeCost(aluWeight: 1),
+        "ND_swizzle_color3_half": SGNodeCost(aluWeight: 1),
+        "ND_swizzle_color3_vector2": SGNodeCost(aluWeight: 2),
+        "ND_swizzle_color3_vector3": SGNodeCost(aluWeight: 3),
+        "ND_swizzle_color3_vector4": SGNodeCost(aluWeight: 4),
+        "ND_swizzle_color4_color3": SGNodeCost(aluWeight: 3),
+        "ND_swizzle_color4_color4": SGNodeCost(aluWeight: 4),
+        "ND_swizzle_color4_float": SGNodeCost(aluWeight: 1),
+        "ND_swizzle_color4_half": SGNodeCost(aluWeight: 1),
+        "ND_swizzle_color4_vector2": SGNodeCost(aluWeight: 2),
+        "ND_swizzle_color4_vector3": SGNodeCost(aluWeight: 3),
+        "ND_swizzle_color4_vector4": SGNodeCost(aluWeight: 4),
+        "ND_swizzle_float_color3": SGNodeCost(aluWeight: 3),
+        "ND_swizzle_float_color4": SGNodeCost(aluWeight: 4),
+        "ND_swizzle_float_vector2": SGNodeCost(aluWeight: 2),
+        "ND_swizzle_float_vector3": SGNodeCost(aluWeight: 3),
+        "ND_swizzle_float_vector4": SGNodeCost(aluWeight: 4),
+        "ND_swizzle_half_color3": SGNodeCost(aluWeight: 3),
+        "ND_swizzle_half_color4": SGNodeCost(aluWeight: 4),
+        "ND_swizzle_half_half2": SGNodeCost(aluWeight: 2),
+        "ND_swizzle_half_half3": SGNodeCost(aluWeight: 3),
+        "ND_swizzle_half_half4": SGNodeCost(aluWeight: 4),
+        "ND_swizzle_vector2_color3": SGNodeCost(aluWeight: 3),
+        "ND_swizzle_vector2_color4": SGNodeCost(aluWeight: 4),
+        "ND_swizzle_vector2_float": SGNodeCost(aluWeight: 1),
+        "ND_swizzle_vector2_half": SGNodeCost(aluWeight: 1),
+        "ND_swizzle_vector2_vector2": SGNodeCost(aluWeight: 2),
+        "ND_swizzle_vector2_vector3": SGNodeCost(aluWeight: 3),
+        "ND_swizzle_vector2_vector4": SGNodeCost(aluWeight: 4),
+        "ND_swizzle_vector3_color3": SGNodeCost(aluWeight: 3),
+        "ND_swizzle_vector3_color4": SGNodeCost(aluWeight: 4),
+        "ND_swizzle_vector3_float": SGNodeCost(aluWeight: 1),
+        "ND_swizzle_vector3_half": SGNodeCost(aluWeight: 1),
+        "ND_swizzle_vector3_vector2": SGNodeCost(aluWeight: 2),
+        "ND_swizzle_vector3_vector3": SGNodeCost(aluWeight: 3),
+        "ND_swizzle_vector3_vector4": SGNodeCost(aluWeight: 4),
+        "ND_swizzle_vector4_color3": SGNodeCost(aluWeight: 3),
+        "ND_swizzle_vector4_color4": SGNodeCost(aluWeight: 4),
+        "ND_swizzle_vector4_float": SGNodeCost(aluWeight: 1),
+        "ND_swizzle_vector4_half": SGNodeCost(aluWeight: 1),
+        "ND_swizzle_vector4_vector2": SGNodeCost(aluWeight: 2),
+        "ND_swizzle_vector4_vector3": SGNodeCost(aluWeight: 3),
+        "ND_swizzle_vector4_vector4": SGNodeCost(aluWeight: 4),
+        "ND_tan_float": SGNodeCost(aluWeight: 8),
+        "ND_tan_half": SGNodeCost(aluWeight: 8),
+        "ND_tan_half2": SGNodeCost(aluWeight: 16),
+        "ND_tan_half3": SGNodeCost(aluWeight: 24),
+        "ND_tan_half4": SGNodeCost(aluWeight: 32),
+        "ND_tan_vector2": SGNodeCost(aluWeight: 16),
+        "ND_tan_vector3": SGNodeCost(aluWeight: 24),
+        "ND_tan_vector4": SGNodeCost(aluWeight: 32),
+        "ND_tangent_vector3": SGNodeCost(aluWeight: 3),
+        "ND_texcoord_vector2": SGNodeCost(aluWeight: 2),
+        "ND_texcoord_vector3": SGNodeCost(aluWeight: 3),
+        "ND_tiledimage_color3": SGNodeCost(aluWeight: 24, textureSamples: 1),
+        "ND_tiledimage_color4": SGNodeCost(aluWeight: 32, textureSamples: 1),
+        "ND_tiledimage_float": SGNodeCost(aluWeight: 8, textureSamples: 1),
+        "ND_tiledimage_half": SGNodeCost(aluWeight: 8, textureSamples: 1),
+        "ND_tiledimage_vector2": SGNodeCost(aluWeight: 16, textureSamples: 1),
+        "ND_tiledimage_vector3": SGNodeCost(aluWeight: 24, textureSamples: 1),
+        "ND_tiledimage_vector4": SGNodeCost(aluWeight: 32, textureSamples: 1),
+        "ND_time_float": SGNodeCost(aluWeight: 1),
+        "ND_transformmatrix_vector2": SGNodeCost(aluWeight: 32),
+        "ND_transformmatrix_vector2M3": SGNodeCost(aluWeight: 32),
+        "ND_transformmatrix_vector3": SGNodeCost(aluWeight: 48),
+        "ND_transformmatrix_vector3M4": SGNodeCost(aluWeight: 48),
+        "ND_transformmatrix_vector4": SGNodeCost(aluWeight: 64),
+        "ND_transformnormal_vector3": SGNodeCost(aluWeight: 36),
+        "ND_transformpoint_vector3": SGNodeCost(aluWeight: 48),
+        "ND_transformvector_vector3": SGNodeCost(aluWeight: 36),
+        "ND_transpose_matrix22": SGNodeCost(aluWeight: 4),
+        "ND_transpose_matrix33": SGNodeCost(aluWeight: 9),
+        "ND_transpose_matrix44": SGNodeCost(aluWeight: 16),
+        "ND_triplanarprojection_color3": SGNodeCost(aluWeight: 48, textureSamples: 3),
+        "ND_triplanarprojection_color4": SGNodeCost(aluWeight: 64, textureSamples: 3),
+        "ND_triplanarprojection_float": SGNodeCost(aluWeight: 16, textureSamples: 3),
+        "ND_triplanarprojection_vector2": SGNodeCost(aluWeight: 32, textureSamples: 3),
+        "ND_triplanarprojection_vector3": SGNodeCost(aluWeight: 48, textureSamples: 3),
+        "ND_triplanarprojection_vector4": SGNodeCost(aluWeight: 64, textureSamples: 3),
+        "ND_unpremult_color4": SGNodeCost(aluWeight: 4),
+        "ND_updirection_vector3": SGNodeCost(aluWeight: 3),
+        "ND_volumematerial": SGNodeCost(aluWeight: 1),
+        "ND_worleynoise2d_float": SGNodeCost(aluWeight: 48, isNoise: true),
+        "ND_worleynoise2d_vector2": SGNodeCost(aluWeight: 96, isNoise: true),
+        "ND_worleynoise2d_vector3": SGNodeCost(aluWeight: 144, isNoise: true),
+        "ND_worleynoise3d_float": SGNodeCost(aluWeight: 96, isNoise: true),
+        "ND_worleynoise3d_vector2": SGNodeCost(aluWeight: 192, isNoise: true),
+        "ND_worleynoise3d_vector3": SGNodeCost(aluWeight: 288, isNoise: true),
+    ]
+}
@@ -14,32 +14,36 @@ import simd
 public class SGNode: Identifiable, Equatable, Hashable {
     private static var nextId: Int = 1
     public let id: Int
-    public let nodeType: String
+    /// The node type, interned in `SGNode.nodeTypes`.
+    let nodeTypeID: Int32
     public let inputs: [Input]
     public let outputs: [Output]
     
+    public var nodeType: String { SGNode.nodeTypes.name(nodeTypeID) }
     public var dataType: SGDataType { outputs[0].dataType }
     public var outputName: String { outputs[0].name }
     
     public struct Input {
-        public let name: String
+        /// The input name, interned in `SGNode.Input.names`.
+        let nameID: Int32
         public let dataType: SGDataType
         public let value: SGValue?
-        public init(name: String, dataType: SGDataType, connection: SGValue?) {
-            self.name = name
+        public var name: String { Input.names.name(nameID) }
+        init(nameID: Int32, dataType: SGDataType, connection: SGValue?) {
+            self.nameID = nameID
             self.dataType = dataType
             self.value = connection
         }
+        public init(name: String, dataType: SGDataType, connection: SGValue?) {
+            self.init(nameID: Input.names.id(name), dataType: dataType, connection: connection)
+        }
         public init(name: String, connection: SGValue) {
-            self.name = name
-            self.dataType = connection.dataType
-            self.value = connection
+            self.init(nameID: Input.names.id(name), dataType: connection.dataType, connection: connection)
         }
         public init(name: String, dataType: SGDataType) {
-            self.name = name
-            self.dataType = dataType
-            self.value = nil
+            self.init(nameID: Input.names.id(name), dataType: dataType, connection: nil)
         }
+        static let names = SGNameTable(schemaNames: schemaNames)
     }
     
     public struct Output {
@@ -55,12 +59,18 @@ public class SGNode: Identifiable, Equatable, Hashable {
         }
     }
     
-    public init(nodeType: String, inputs: [Input], outputs: [Output]) {
+    public convenience init(nodeType: String, inputs: [Input], outputs: [Output]) {
+        self.init(nodeTypeID: SGNode.nodeTypes.id(nodeType), inputs: inputs, outputs: outputs)
+    }
+    init(nodeTypeID: Int32, inputs: [Input], outputs: [Output]) {
         self.id = SGNode.nextId
         SGNode.nextId += 1
-        self.nodeType = nodeType
+        self.nodeTypeID = nodeTypeID
         self.inputs = inputs
         self.outputs = outputs
+#if SHADERGRAPHCODER_INSTRUMENTATION
+        SGInstrumentation.recordNodeAllocation(nodeType)
+#endif
     }
     public static func == (lhs: SGNode, rhs: SGNode) -> Bool {
         lhs.id == rhs.id
@@ -70,6 +80,13 @@ public class SGNode: Identifiable, Equatable, Hashable {
         hasher.combine(id)
     }
 
+    /// Returns a new node of the same type with different inputs.
+    func copy(inputs: [Input]) -> SGNode {
+        SGNode(nodeTypeID: nodeTypeID, inputs: inputs, outputs: outputs)
+    }
+
+    static let nodeTypes = SGNameTable(schemaNames: schemaNodeTypes)
+
     public func getOutputValue(name: String) -> SGValueSource { .nodeOutput(self, name) }
 
     public func findOutput(name: String) -> Output? {
@@ -169,6 +186,28 @@ public enum SGDataType: String {
         }
         return true
     }
+
+    /// The class of values of this data type.
+    var valueType: SGValue.Type {
+        switch self {
+        case .asset:
+            return SGTexture.self
+        case .bool, .float, .half, .int:
+            return SGScalar.self
+        case .color3f, .color4f:
+            return SGColor.self
+        case .matrix2d, .matrix3d, .matrix4d:
+            return SGMatrix.self
+        case .string:
+            return SGString.self
+        case .token:
+            return SGToken.self
+        case .vector2f, .vector3f, .vector4f, .vector2h, .vector3h, .vector4h, .vector2i, .vector3i, .vector4i:
+            return SGVector.self
+        case .error:
+            return SGValue.self
+        }
+    }
 }
 
 public enum SGTextureSource {
@@ -295,7 +334,7 @@ public enum ShaderGraphCoderError: Error {
     case graphContainsErrors(errors: [String])
 }
 
-func collectParameters(nodes rootNodes: [SGNode]) -> [(String, SGConstantValue)] {
+@_spi(Benchmarking) public func collectParameters(nodes rootNodes: [SGNode]) -> [(String, SGConstantValue)] {
     var nodesToWrite: [SGNode] = rootNodes
     var nodesWritten: Set<SGNode> = []
     var parameters: [String: SGConstantValue] = [:]
@@ -319,7 +358,7 @@ func collectParameters(nodes rootNodes: [SGNode]) -> [(String, SGConstantValue)]
     return parameters.map { ($0.key, $0.value) }
 }
 
-func collectErrors(values rootValues: [SGValue?]) -> [String] {
+@_spi(Benchmarking) public func collectErrors(values rootValues: [SGValue?]) -> [String] {
     var nodesToWrite: [SGNode] = []
     var nodesWritten: Set<SGNode> = []
     var errors: [String] = []
@@ -0,0 +1,140 @@
+// Autogenerated by opgen.py
+import Foundation
+import simd
+
+extension SGNode {
+    static let interfaceOnlyInputs: [String: Set<String>] = [
+        "ND_UsdPrimvarReader_boolean": ["varname"],
+        "ND_UsdPrimvarReader_float": ["varname"],
+        "ND_UsdPrimvarReader_integer": ["varname"],
+        "ND_UsdPrimvarReader_string": ["varname"],
+        "ND_UsdPrimvarReader_vector2": ["varname"],
+        "ND_UsdPrimvarReader_vector3": ["varname"],
+        "ND_UsdPrimvarReader_vector4": ["varname"],
+        "ND_UsdUVTexture": ["bias", "file", "scale", "wrapS", "wrapT"],
+        "ND_bitangent_vector3": ["space", "index"],
+        "ND_blur_color3": ["filtertype"],
+        "ND_blur_color4": ["filtertype"],
+        "ND_blur_float": ["filtertype"],
+        "ND_blur_half": ["filtertype"],
+        "ND_blur_vector2": ["filtertype"],
+        "ND_blur_vector3": ["filtertype"],
+        "ND_blur_vector4": ["filtertype"],
+        "ND_constant_filename": ["value"],
+        "ND_constant_string": ["value"],
+        "ND_dot_boolean": ["note"],
+        "ND_dot_color3": ["note"],
+        "ND_dot_color4": ["note"],
+        "ND_dot_displacementshader": ["note"],
+        "ND_dot_filename": ["note"],
+        "ND_dot_float": ["note"],
+        "ND_dot_half": ["note"],
+        "ND_dot_integer": ["note"],
+        "ND_dot_lightshader": ["note"],
+        "ND_dot_matrix33": ["note"],
+        "ND_dot_matrix44": ["note"],
+        "ND_dot_string": ["note"],
+        "ND_dot_surfaceshader": ["note"],
+        "ND_dot_vector2": ["note"],
+        "ND_dot_vector3": ["note"],
+        "ND_dot_vector4": ["note"],
+        "ND_dot_volumeshader": ["note"],
+        "ND_extract_color3": ["index"],
+        "ND_extract_color4": ["index"],
+        "ND_extract_vector2": ["index"],
+        "ND_extract_vector3": ["index"],
+        "ND_extract_vector4": ["index"],
+        "ND_geomcolor_color3": ["index"],
+        "ND_geomcolor_color4": ["index"],
+        "ND_geomcolor_float": ["index"],
+        "ND_geompropvalue_boolean": ["geomprop"],
+        "ND_geompropvalue_color3": ["geomprop"],
+        "ND_geompropvalue_color4": ["geomprop"],
+        "ND_geompropvalue_float": ["geomprop"],
+        "ND_geompropvalue_half": ["geomprop"],
+        "ND_geompropvalue_integer": ["geomprop", "default"],
+        "ND_geompropvalue_string": ["geomprop", "default"],
+        "ND_geompropvalue_vector2": ["geomprop"],
+        "ND_geompropvalue_vector3": ["geomprop"],
+        "ND_geompropvalue_vector4": ["geomprop"],
+        "ND_image_color3": ["file", "uaddressmode", "vaddressmode", "filtertype"],
+        "ND_image_color4": ["file", "uaddressmode", "vaddressmode", "filtertype"],
+        "ND_image_float": ["file", "uaddressmode", "vaddressmode", "filtertype"],
+        "ND_image_half": ["file", "uaddressmode", "vaddressmode", "filtertype"],
+        "ND_image_vector2": ["file", "uaddressmode", "vaddressmode", "filtertype"],
+        "ND_image_vector3": ["file", "uaddressmode", "vaddressmode", "filtertype"],
+        "ND_image_vector4": ["file", "uaddressmode", "vaddressmode", "filtertype"],
+        "ND_normal_vector3": ["space"],
+        "ND_normalmap": ["space"],
+        "ND_normalmap_vector2": ["space"],
+        "ND_position_vector3": ["space"],
+        "ND_realitykit_cameraposition_vector3": ["space"],
+        "ND_realitykit_pbr_surfaceshader": ["hasPremultipliedAlpha"],
+        "ND_realitykit_unlit_surfaceshader": ["applyPostProcessToneMap", "hasPremultipliedAlpha"],
+        "ND_realitykit_viewdirection_vector3": ["space"],
+        "ND_swizzle_color3_color3": ["channels"],
+        "ND_swizzle_color3_color4": ["channels"],
+        "ND_swizzle_color3_float": ["channels"],
+        "ND_swizzle_color3_half": ["channels"],
+        "ND_swizzle_color3_vector2": ["channels"],
+        "ND_swizzle_color3_vector3": ["channels"],
+        "ND_swizzle_color3_vector4": ["channels"],
+        "ND_swizzle_color4_color3": ["channels"],
+        "ND_swizzle_color4_color4": ["channels"],
+        "ND_swizzle_color4_float": ["channels"],
+        "ND_swizzle_color4_half": ["channels"],
+        "ND_swizzle_color4_vector2": ["channels"],
+        "ND_swizzle_color4_vector3": ["channels"],
+        "ND_swizzle_color4_vector4": ["channels"],
+        "ND_swizzle_float_color3": ["channels"],
+        "ND_swizzle_float_color4": ["channels"],
+        "ND_swizzle_float_vector2": ["channels"],
+        "ND_swizzle_float_vector3": ["channels"],
+        "ND_swizzle_float_vector4": ["channels"],
+        "ND_swizzle_half_color3": ["channels"],
+        "ND_swizzle_half_color4": ["channels"],
+        "ND_swizzle_half_half2": ["channels"],
+        "ND_swizzle_half_half3": ["channels"],
+        "ND_swizzle_half_half4": ["channels"],
+        "ND_swizzle_vector2_color3": ["channels"],
+        "ND_swizzle_vector2_color4": ["channels"],
+        "ND_swizzle_vector2_float": ["channels"],
+        "ND_swizzle_vector2_half": ["channels"],
+        "ND_swizzle_vector2_vector2": ["channels"],
+        "ND_swizzle_vector2_vector3": ["channels"],
+        "ND_swizzle_vector2_vector4": ["channels"],
+        "ND_swizzle_vector3_color3": ["channels"],
+        "ND_swizzle_vector3_color4": ["channels"],
+        "ND_swizzle_vector3_float": ["channels"],
+        "ND_swizzle_vector3_half": ["channels"],
+        "ND_swizzle_vector3_vector2": ["channels"],
+        "ND_swizzle_vector3_vector3": ["channels"],
+        "ND_swizzle_vector3_vector4": ["channels"],
+        "ND_swizzle_vector4_color3": ["channels"],
+        "ND_swizzle_vector4_color4": ["channels"],
+        "ND_swizzle_vector4_float": ["channels"],
+        "ND_swizzle_vector4_half": ["channels"],
+        "ND_swizzle_vector4_vector2": ["channels"],
+        "ND_swizzle_vector4_vector3": ["channels"],
+        "ND_swizzle_vector4_vector4": ["channels"],
+        "ND_tangent_vector3": ["space", "index"],
+        "ND_texcoord_vector2": ["index"],
+        "ND_texcoord_vector3": ["index"],
+        "ND_tiledimage_color3": ["file", "filtertype"],
+        "ND_tiledimage_color4": ["file", "filtertype"],
+        "ND_tiledimage_float": ["file", "filtertype"],
+        "ND_tiledimage_half": ["file", "filtertype"],
+        "ND_tiledimage_vector2": ["file", "filtertype"],
+        "ND_tiledimage_vector3": ["file", "filtertype"],
+        "ND_tiledimage_vector4": ["file", "filtertype"],
+        "ND_transformnormal_vector3": ["fromspace", "tospace"],
+        "ND_transformpoint_vector3": ["fromspace", "tospace"],
+        "ND_transformvector_vector3": ["fromspace", "tospace"],
+        "ND_triplanarprojection_color3": ["filex", "filey", "filez", "filtertype"],
+        "ND_triplanarprojection_color4": ["filex", "filey", "filez", "filtertype"],
+        "ND_triplanarprojection_float": ["filex", "filey", "filez", "filtertype"],
+        "ND_triplanarprojection_vector2": ["filex", "filey", "filez", "filtertype"],
+        "ND_triplanarprojection_vector3": ["filex", "filey", "filez", "filtertype"],
+        "ND_triplanarprojection_vector4": ["filex", "filey", "filez", "filtertype"],
+    ]
+}
@@ -0,0 +1,96 @@
+//
+//  Instrumentation.swift
+//  ShaderGraphCoder
+//
+//  Counters for finding out which operations a graph rebuild calls and how many nodes it allocates.
+//  Recording is only compiled when SHADERGRAPHCODER_INSTRUMENTATION is defined:
+//
+//  swift build -Xswiftc -DSHADERGRAPHCODER_INSTRUMENTATION
+//
+//  Node allocations are always recorded then. Calls, error paths and signposts
+//  of the generated operations and sources need them generated with `opgen.py --instrument`.
+//
+
+import Foundation
+#if SHADERGRAPHCODER_INSTRUMENTATION
+import os
+#endif
+
+public struct SGInstrumentationSnapshot {
+    /// Calls per operation or source name.
+    public let calls: [String: Int]
+    /// Allocated nodes per node type.
+    public let nodeAllocations: [String: Int]
+    /// Calls per operation or source name that returned an error value.
+    public let errors: [String: Int]
+
+    public var totalCalls: Int { calls.values.reduce(0, +) }
+    public var totalNodeAllocations: Int { nodeAllocations.values.reduce(0, +) }
+    public var totalErrors: Int { errors.values.reduce(0, +) }
+}
+
+public enum SGInstrumentation {
+    /// True if the library was built with SHADERGRAPHCODER_INSTRUMENTATION defined.
+    public static var isEnabled: Bool {
+#if SHADERGRAPHCODER_INSTRUMENTATION
+        return true
+#else
+        return false
+#endif
+    }
+
+    /// Returns the counters recorded since the start of the process or the last `reset()`.
+    /// The counters are empty if instrumentation is not compiled in.
+    public static func snapshot() -> SGInstrumentationSnapshot {
+#if SHADERGRAPHCODER_INSTRUMENTATION
+        lock.lock()
+        defer { lock.unlock() }
+        return SGInstrumentationSnapshot(calls: calls, nodeAllocations: nodeAllocations, errors: errors)
+#else
+        return SGInstrumentationSnapshot(calls: [:], nodeAllocations: [:], errors: [:])
+#endif
+    }
+
+    public static func reset() {
+#if SHADERGRAPHCODER_INSTRUMENTATION
+        lock.lock()
+        defer { lock.unlock() }
+        calls.removeAll()
+        nodeAllocations.removeAll()
+        errors.removeAll()
+#endif
+    }
+
+#if SHADERGRAPHCODER_INSTRUMENTATION
+    private static let lock = NSLock()
+    private static var calls: [String: Int] = [:]
+    private static var nodeAllocations: [String: Int] = [:]
+    private static var errors: [String: Int] = [:]
+    private static let log = OSLog(subsystem: "ShaderGraphCoder", category: .pointsOfInterest)
+
+    static func beginCall(_ name: String) -> OSSignpostID {
+        lock.lock()
+        calls[name, default: 0] += 1
+        lock.unlock()
+        let id = OSSignpostID(log: log)
+        os_signpost(.begin, log: log, name: "Operation", signpostID: id, "%{public}@", name)
+        return id
+    }
+
+    static func endCall(_ name: String, _ id: OSSignpostID) {
+        os_signpost(.end, log: log, name: "Operation", signpostID: id, "%{public}@", name)
+    }
+
+    static func recordNodeAllocation(_ nodeType: String) {
+        lock.lock()
+        nodeAllocations[nodeType, default: 0] += 1
+        lock.unlock()
+    }
+
+    static func recordError(_ name: String) {
+        lock.lock()
+        errors[name, default: 0] += 1
+        lock.unlock()
+    }
+#endif
+}
@@ -0,0 +1,1132 @@
+// Autogenerated by opgen.py
+import Foundation
+import simd
+
+extension SGNode {
+    static let schemaNodeTypes: [String] = [
+        "ND_InternalRealityKitTextureCubeAutomaticLOD_color4",
+        "ND_InternalRealityKitTextureCubeAutomaticLOD_vector4",
+        "ND_InternalRealityKitTextureCubeExplicitLOD_color4",
+        "ND_InternalRealityKitTextureCubeExplicitLOD_vector4",
+        "ND_InternalRealityKitTextureCubeGradient_color4",
+        "ND_InternalRealityKitTextureCubeGradient_vector4",
+        "ND_InternalRealityKitTextureRead_color4",
+        "ND_InternalRealityKitTextureRead_vector4",
+        "ND_InternalRealityKitTextureSampleAutomaticLOD_color4",
+        "ND_InternalRealityKitTextureSampleAutomaticLOD_vector4",
+        "ND_InternalRealityKitTextureSampleExplicitLOD_color4",
+        "ND_InternalRealityKitTextureSampleExplicitLOD_vector4",
+        "ND_InternalRealityKitTextureSampleGradient_color4",
+        "ND_InternalRealityKitTextureSampleGradient_vector4",
+        "ND_RealityKitTexture2DGradient_color3",
+        "ND_RealityKitTexture2DGradient_color4",
+        "ND_RealityKitTexture2DGradient_vector4",
+        "ND_RealityKitTexture2DLOD_color3",
+        "ND_RealityKitTexture2DLOD_color4",
+        "ND_RealityKitTexture2DLOD_vector4",
+        "ND_RealityKitTexture2DPixelGradient_color3",
+        "ND_RealityKitTexture2DPixelGradient_color4",
+        "ND_RealityKitTexture2DPixelGradient_vector4",
+        "ND_RealityKitTexture2DPixelLOD_color3",
+        "ND_RealityKitTexture2DPixelLOD_color4",
+        "ND_RealityKitTexture2DPixelLOD_vector4",
+        "ND_RealityKitTexture2DPixel_color3",
+        "ND_RealityKitTexture2DPixel_color4",
+        "ND_RealityKitTexture2DPixel_vector4",
+        "ND_RealityKitTexture2D_color3",
+        "ND_RealityKitTexture2D_color4",
+        "ND_RealityKitTexture2D_vector4",
+        "ND_RealityKitTextureCubeGradient_color4",
+        "ND_RealityKitTextureCubeGradient_vector4",
+        "ND_RealityKitTextureCubeLOD_color4",
+        "ND_RealityKitTextureCubeLOD_vector4",
+        "ND_RealityKitTextureCube_color4",
+        "ND_RealityKitTextureCube_vector4",
+        "ND_RealityKitTextureRead_color4",
+        "ND_RealityKitTextureRead_vector4",
+        "ND_UsdPreviewSurface_surfaceshader",
+        "ND_UsdPrimvarReader_boolean",
+        "ND_UsdPrimvarReader_float",
+        "ND_UsdPrimvarReader_integer",
+        "ND_UsdPrimvarReader_string",
+        "ND_UsdPrimvarReader_vector2",
+        "ND_UsdPrimvarReader_vector3",
+        "ND_UsdPrimvarReader_vector4",
+        "ND_UsdTransform2d",
+        "ND_UsdUVTexture",
+        "ND_absval_color3",
+        "ND_absval_color4",
+        "ND_absval_float",
+        "ND_absval_half",
+        "ND_absval_vector2",
+        "ND_absval_vector3",
+        "ND_absval_vector4",
+        "ND_acos_float",
+        "ND_acos_half",
+        "ND_acos_half2",
+        "ND_acos_half3",
+        "ND_acos_half4",
+        "ND_acos_vector2",
+        "ND_acos_vector3",
+        "ND_acos_vector4",
+        "ND_add_color3",
+        "ND_add_color3FA",
+        "ND_add_color4",
+        "ND_add_color4FA",
+        "ND_add_displacementshader",
+        "ND_add_float",
+        "ND_add_half",
+        "ND_add_matrix22",
+        "ND_add_matrix22FA",
+        "ND_add_matrix33",
+        "ND_add_matrix33FA",
+        "ND_add_matrix44",
+        "ND_add_matrix44FA",
+        "ND_add_surfaceshader",
+        "ND_add_vector2",
+        "ND_add_vector2FA",
+        "ND_add_vector3",
+        "ND_add_vector3FA",
+        "ND_add_vector4",
+        "ND_add_vector4FA",
+        "ND_add_volumeshader",
+        "ND_ambientocclusion_float",
+        "ND_arrayappend_color3_color3array",
+        "ND_arrayappend_color3array_color3array",
+        "ND_arrayappend_color4_color4array",
+        "ND_arrayappend_color4array_color4array",
+        "ND_arrayappend_float_floatarray",
+        "ND_arrayappend_floatarray_floatarray",
+        "ND_arrayappend_integer_integerarray",
+        "ND_arrayappend_integerarray_integerarray",
+        "ND_arrayappend_string_stringarray",
+        "ND_arrayappend_stringarray_stringarray",
+        "ND_arrayappend_vector2_vector2array",
+        "ND_arrayappend_vector2array_vector2array",
+        "ND_arrayappend_vector3_vector3array",
+        "ND_arrayappend_vector3array_vector3array",
+        "ND_arrayappend_vector4_vector4array",
+        "ND_arrayappend_vector4array_vector4array",
+        "ND_asin_float",
+        "ND_asin_half",
+        "ND_asin_half2",
+        "ND_asin_half3",
+        "ND_asin_half4",
+        "ND_asin_vector2",
+        "ND_asin_vector3",
+        "ND_asin_vector4",
+        "ND_atan2_float",
+        "ND_atan2_half",
+        "ND_atan2_half2",
+        "ND_atan2_half3",
+        "ND_atan2_half4",
+        "ND_atan2_vector2",
+        "ND_atan2_vector3",
+        "ND_atan2_vector4",
+        "ND_bitangent_vector3",
+        "ND_blur_color3",
+        "ND_blur_color4",
+        "ND_blur_float",
+        "ND_blur_half",
+        "ND_blur_vector2",
+        "ND_blur_vector3",
+        "ND_blur_vector4",
+        "ND_burn_color3",
+        "ND_burn_color4",
+        "ND_burn_float",
+        "ND_burn_half",
+        "ND_ceil_color3",
+        "ND_ceil_color4",
+        "ND_ceil_float",
+        "ND_ceil_half",
+        "ND_ceil_vector2",
+        "ND_ceil_vector3",
+        "ND_ceil_vector4",
+        "ND_cellnoise2d_float",
+        "ND_cellnoise3d_float",
+        "ND_clamp_color3",
+        "ND_clamp_color3FA",
+        "ND_clamp_color4",
+        "ND_clamp_color4FA",
+        "ND_clamp_float",
+        "ND_clamp_half",
+        "ND_clamp_half2",
+        "ND_clamp_half2FA",
+        "ND_clamp_half3",
+        "ND_clamp_half3FA",
+        "ND_clamp_half4",
+        "ND_clamp_half4FA",
+        "ND_clamp_vector2",
+        "ND_clamp_vector2FA",
+        "ND_clamp_vector3",
+        "ND_clamp_vector3FA",
+        "ND_clamp_vector4",
+        "ND_clamp_vector4FA",
+        "ND_combine2_color4CF",
+        "ND_combine2_integer2",
+        "ND_combine2_vector2",
+        "ND_combine2_vector4VF",
+        "ND_combine2_vector4VV",
+        "ND_combine3_color3",
+        "ND_combine3_half3",
+        "ND_combine3_integer3",
+        "ND_combine3_vector3",
+        "ND_combine4_color4",
+        "ND_combine4_integer4",
+        "ND_combine4_vector4",
+        "ND_constant_boolean",
+        "ND_constant_color3",
+        "ND_constant_color4",
+        "ND_constant_filename",
+        "ND_constant_float",
+        "ND_constant_half",
+        "ND_constant_half2",
+        "ND_constant_half3",
+        "ND_constant_half4",
+        "ND_constant_integer",
+        "ND_constant_integer2",
+        "ND_constant_integer3",
+        "ND_constant_integer4",
+        "ND_constant_matrix22",
+        "ND_constant_matrix33",
+        "ND_constant_matrix44",
+        "ND_constant_string",
+        "ND_constant_vector2",
+        "ND_constant_vector3",
+        "ND_constant_vector4",
+        "ND_contrast_color3",
+        "ND_contrast_color3FA",
+        "ND_contrast_color4",
+        "ND_contrast_color4FA",
+        "ND_contrast_float",
+        "ND_contrast_vector2",
+        "ND_contrast_vector2FA",
+        "ND_contrast_vector3",
+        "ND_contrast_vector3FA",
+        "ND_contrast_vector4",
+        "ND_contrast_vector4FA",
+        "ND_convert_boolean_float",
+        "ND_convert_boolean_half",
+        "ND_convert_color3_color4",
+        "ND_convert_color3_vector3",
+        "ND_convert_color4_color3",
+        "ND_convert_color4_vector4",
+        "ND_convert_float_color3",
+        "ND_convert_float_color4",
+        "ND_convert_float_half",
+        "ND_convert_float_integer",
+        "ND_convert_float_vector2",
+        "ND_convert_float_vector3",
+        "ND_convert_float_vector4",
+        "ND_convert_half2_vector2",
+        "ND_convert_half3_color3",
+        "ND_convert_half3_vector3",
+        "ND_convert_half4_vector4",
+        "ND_convert_half_color3",
+        "ND_convert_half_color4",
+        "ND_convert_half_float",
+        "ND_convert_half_integer",
+        "ND_convert_half_vector2",
+        "ND_convert_half_vector3",
+        "ND_convert_half_vector4",
+        "ND_convert_integer_float",
+        "ND_convert_integer_half",
+        "ND_convert_vector2_half2",
+        "ND_convert_vector2_vector3",
+        "ND_convert_vector3_color3",
+        "ND_convert_vector3_half3",
+        "ND_convert_vector3_vector2",
+        "ND_convert_vector3_vector4",
+        "ND_convert_vector4_color4",
+        "ND_convert_vector4_half4",
+        "ND_convert_vector4_vector3",
+        "ND_cos_float",
+        "ND_cos_half",
+        "ND_cos_half2",
+        "ND_cos_half3",
+        "ND_cos_half4",
+        "ND_cos_vector2",
+        "ND_cos_vector3",
+        "ND_cos_vector4",
+        "ND_crossproduct_half3",
+        "ND_crossproduct_vector3",
+        "ND_curveadjust_color3",
+        "ND_curveadjust_color4",
+        "ND_curveadjust_float",
+        "ND_curveadjust_vector2",
+        "ND_curveadjust_vector3",
+        "ND_curveadjust_vector4",
+        "ND_curvelookup_color3",
+        "ND_curvelookup_color4",
+        "ND_curvelookup_float",
+        "ND_curvelookup_vector2",
+        "ND_curvelookup_vector3",
+        "ND_curvelookup_vector4",
+        "ND_determinant_matrix22",
+        "ND_determinant_matrix33",
+        "ND_determinant_matrix44",
+        "ND_difference_color3",
+        "ND_difference_color4",
+        "ND_difference_float",
+        "ND_difference_half",
+        "ND_disjointover_color4",
+        "ND_divide_color3",
+        "ND_divide_color3FA",
+        "ND_divide_color4",
+        "ND_divide_color4FA",
+        "ND_divide_float",
+        "ND_divide_half",
+        "ND_divide_matrix22",
+        "ND_divide_matrix33",
+        "ND_divide_matrix44",
+        "ND_divide_vector2",
+        "ND_divide_vector2FA",
+        "ND_divide_vector3",
+        "ND_divide_vector3FA",
+        "ND_divide_vector4",
+        "ND_divide_vector4FA",
+        "ND_dodge_color3",
+        "ND_dodge_color4",
+        "ND_dodge_float",
+        "ND_dodge_half",
+        "ND_dot_boolean",
+        "ND_dot_color3",
+        "ND_dot_color4",
+        "ND_dot_displacementshader",
+        "ND_dot_filename",
+        "ND_dot_float",
+        "ND_dot_half",
+        "ND_dot_integer",
+        "ND_dot_lightshader",
+        "ND_dot_matrix33",
+        "ND_dot_matrix44",
+        "ND_dot_string",
+        "ND_dot_surfaceshader",
+        "ND_dot_vector2",
+        "ND_dot_vector3",
+        "ND_dot_vector4",
+        "ND_dot_volumeshader",
+        "ND_dotproduct_half2",
+        "ND_dotproduct_half3",
+        "ND_dotproduct_half4",
+        "ND_dotproduct_vector2",
+        "ND_dotproduct_vector3",
+        "ND_dotproduct_vector4",
+        "ND_exp_float",
+        "ND_exp_half",
+        "ND_exp_half2",
+        "ND_exp_half3",
+        "ND_exp_half4",
+        "ND_exp_vector2",
+        "ND_exp_vector3",
+        "ND_exp_vector4",
+        "ND_extract_color3",
+        "ND_extract_color4",
+        "ND_extract_vector2",
+        "ND_extract_vector3",
+        "ND_extract_vector4",
+        "ND_floor_color3",
+        "ND_floor_color4",
+        "ND_floor_float",
+        "ND_floor_half",
+        "ND_floor_vector2",
+        "ND_floor_vector3",
+        "ND_floor_vector4",
+        "ND_fractal3d_color3",
+        "ND_fractal3d_color3FA",
+        "ND_fractal3d_color4",
+        "ND_fractal3d_color4FA",
+        "ND_fractal3d_float",
+        "ND_fractal3d_vector2",
+        "ND_fractal3d_vector2FA",
+        "ND_fractal3d_vector3",
+        "ND_fractal3d_vector3FA",
+        "ND_fractal3d_vector4",
+        "ND_fractal3d_vector4FA",
+        "ND_frame_float",
+        "ND_geomcolor_color3",
+        "ND_geomcolor_color4",
+        "ND_geomcolor_float",
+        "ND_geompropvalue_boolean",
+        "ND_geompropvalue_color3",
+        "ND_geompropvalue_color4",
+        "ND_geompropvalue_float",
+        "ND_geompropvalue_half",
+        "ND_geompropvalue_integer",
+        "ND_geompropvalue_string",
+        "ND_geompropvalue_vector2",
+        "ND_geompropvalue_vector3",
+        "ND_geompropvalue_vector4",
+        "ND_heighttonormal_vector3",
+        "ND_hsvadjust_color3",
+        "ND_hsvadjust_color4",
+        "ND_hsvtorgb_color3",
+        "ND_hsvtorgb_color4",
+        "ND_ifequal_color3",
+        "ND_ifequal_color3B",
+        "ND_ifequal_color3I",
+        "ND_ifequal_color4",
+        "ND_ifequal_color4B",
+        "ND_ifequal_color4I",
+        "ND_ifequal_float",
+        "ND_ifequal_floatB",
+        "ND_ifequal_floatI",
+        "ND_ifequal_half",
+        "ND_ifequal_half2",
+        "ND_ifequal_half2B",
+        "ND_ifequal_half2I",
+        "ND_ifequal_half3",
+        "ND_ifequal_half3B",
+        "ND_ifequal_half3I",
+        "ND_ifequal_half4",
+        "ND_ifequal_half4B",
+        "ND_ifequal_half4I",
+        "ND_ifequal_halfB",
+        "ND_ifequal_halfI",
+        "ND_ifequal_vector2",
+        "ND_ifequal_vector2B",
+        "ND_ifequal_vector2I",
+        "ND_ifequal_vector3",
+        "ND_ifequal_vector3B",
+        "ND_ifequal_vector3I",
+        "ND_ifequal_vector4",
+        "ND_ifequal_vector4B",
+        "ND_ifequal_vector4I",
+        "ND_ifgreater_color3",
+        "ND_ifgreater_color3I",
+        "ND_ifgreater_color4",
+        "ND_ifgreater_color4I",
+        "ND_ifgreater_float",
+        "ND_ifgreater_floatI",
+        "ND_ifgreater_half",
+        "ND_ifgreater_half2",
+        "ND_ifgreater_half2I",
+        "ND_ifgreater_half3",
+        "ND_ifgreater_half3I",
+        "ND_ifgreater_half4",
+        "ND_ifgreater_half4I",
+        "ND_ifgreater_halfI",
+        "ND_ifgreater_vector2",
+        "ND_ifgreater_vector2I",
+        "ND_ifgreater_vector3",
+        "ND_ifgreater_vector3I",
+        "ND_ifgreater_vector4",
+        "ND_ifgreater_vector4I",
+        "ND_ifgreatereq_color3",
+        "ND_ifgreatereq_color3I",
+        "ND_ifgreatereq_color4",
+        "ND_ifgreatereq_color4I",
+        "ND_ifgreatereq_float",
+        "ND_ifgreatereq_floatI",
+        "ND_ifgreatereq_half",
+        "ND_ifgreatereq_half2",
+        "ND_ifgreatereq_half2I",
+        "ND_ifgreatereq_half3",
+        "ND_ifgreatereq_half3I",
+        "ND_ifgreatereq_half4",
+        "ND_ifgreatereq_half4I",
+        "ND_ifgreatereq_halfI",
+        "ND_ifgreatereq_vector2",
+        "ND_ifgreatereq_vector2I",
+        "ND_ifgreatereq_vector3",
+        "ND_ifgreatereq_vector3I",
+        "ND_ifgreatereq_vector4",
+        "ND_ifgreatereq_vector4I",
+        "ND_image_color3",
+        "ND_image_color4",
+        "ND_image_float",
+        "ND_image_half",
+        "ND_image_vector2",
+        "ND_image_vector3",
+        "ND_image_vector4",
+        "ND_in_color4",
+        "ND_inside_color3",
+        "ND_inside_color4",
+        "ND_inside_float",
+        "ND_inside_half",
+        "ND_invertmatrix_matrix22",
+        "ND_invertmatrix_matrix33",
+        "ND_invertmatrix_matrix44",
+        "ND_ln_float",
+        "ND_ln_half",
+        "ND_ln_half2",
+        "ND_ln_half3",
+        "ND_ln_half4",
+        "ND_ln_vector2",
+        "ND_ln_vector3",
+        "ND_ln_vector4",
+        "ND_luminance_color3",
+        "ND_luminance_color4",
+        "ND_magnitude_half2",
+        "ND_magnitude_half3",
+        "ND_magnitude_half4",
+        "ND_magnitude_vector2",
+        "ND_magnitude_vector3",
+        "ND_magnitude_vector4",
+        "ND_mask_color4",
+        "ND_matte_color4",
+        "ND_max_color3",
+        "ND_max_color3FA",
+        "ND_max_color4",
+        "ND_max_color4FA",
+        "ND_max_float",
+        "ND_max_half",
+        "ND_max_half2",
+        "ND_max_half2FA",
+        "ND_max_half3",
+        "ND_max_half3FA",
+        "ND_max_half4",
+        "ND_max_half4FA",
+        "ND_max_vector2",
+        "ND_max_vector2FA",
+        "ND_max_vector3",
+        "ND_max_vector3FA",
+        "ND_max_vector4",
+        "ND_max_vector4FA",
+        "ND_min_color3",
+        "ND_min_color3FA",
+        "ND_min_color4",
+        "ND_min_color4FA",
+        "ND_min_float",
+        "ND_min_half",
+        "ND_min_half2",
+        "ND_min_half2FA",
+        "ND_min_half3",
+        "ND_min_half3FA",
+        "ND_min_half4",
+        "ND_min_half4FA",
+        "ND_min_vector2",
+        "ND_min_vector2FA",
+        "ND_min_vector3",
+        "ND_min_vector3FA",
+        "ND_min_vector4",
+        "ND_min_vector4FA",
+        "ND_minus_color3",
+        "ND_minus_color4",
+        "ND_minus_float",
+        "ND_minus_half",
+        "ND_mix_color3",
+        "ND_mix_color4",
+        "ND_mix_displacementshader",
+        "ND_mix_float",
+        "ND_mix_half",
+        "ND_mix_half2",
+        "ND_mix_half3",
+        "ND_mix_half4",
+        "ND_mix_surfaceshader",
+        "ND_mix_vector2",
+        "ND_mix_vector3",
+        "ND_mix_vector4",
+        "ND_mix_volumeshader",
+        "ND_modulo_color3",
+        "ND_modulo_color3FA",
+        "ND_modulo_color4",
+        "ND_modulo_color4FA",
+        "ND_modulo_float",
+        "ND_modulo_half",
+        "ND_modulo_vector2",
+        "ND_modulo_vector2FA",
+        "ND_modulo_vector3",
+        "ND_modulo_vector3FA",
+        "ND_modulo_vector4",
+        "ND_modulo_vector4FA",
+        "ND_multiply_color3",
+        "ND_multiply_color3FA",
+        "ND_multiply_color4",
+        "ND_multiply_color4FA",
+        "ND_multiply_displacementshaderF",
+        "ND_multiply_displacementshaderV",
+        "ND_multiply_float",
+        "ND_multiply_half",
+        "ND_multiply_matrix22",
+        "ND_multiply_matrix33",
+        "ND_multiply_matrix44",
+        "ND_multiply_surfaceshaderC",
+        "ND_multiply_surfaceshaderF",
+        "ND_multiply_vector2",
+        "ND_multiply_vector2FA",
+        "ND_multiply_vector3",
+        "ND_multiply_vector3FA",
+        "ND_multiply_vector4",
+        "ND_multiply_vector4FA",
+        "ND_multiply_volumeshaderC",
+        "ND_multiply_volumeshaderF",
+        "ND_noise2d_color3",
+        "ND_noise2d_color3FA",
+        "ND_noise2d_color4",
+        "ND_noise2d_color4FA",
+        "ND_noise2d_float",
+        "ND_noise2d_vector2",
+        "ND_noise2d_vector2FA",
+        "ND_noise2d_vector3",
+        "ND_noise2d_vector3FA",
+        "ND_noise2d_vector4",
+        "ND_noise2d_vector4FA",
+        "ND_noise3d_color3",
+        "ND_noise3d_color3FA",
+        "ND_noise3d_color4",
+        "ND_noise3d_color4FA",
+        "ND_noise3d_float",
+        "ND_noise3d_vector2",
+        "ND_noise3d_vector2FA",
+        "ND_noise3d_vector3",
+        "ND_noise3d_vector3FA",
+        "ND_noise3d_vector4",
+        "ND_noise3d_vector4FA",
+        "ND_normal_map_decode",
+        "ND_normal_vector3",
+        "ND_normalize_half2",
+        "ND_normalize_half3",
+        "ND_normalize_half4",
+        "ND_normalize_vector2",
+        "ND_normalize_vector3",
+        "ND_normalize_vector4",
+        "ND_normalmap",
+        "ND_normalmap_vector2",
+        "ND_out_color4",
+        "ND_outside_color3",
+        "ND_outside_color4",
+        "ND_outside_float",
+        "ND_outside_half",
+        "ND_over_color4",
+        "ND_overlay_color3",
+        "ND_overlay_color4",
+        "ND_overlay_float",
+        "ND_overlay_half",
+        "ND_place2d_vector2",
+        "ND_plus_color3",
+        "ND_plus_color4",
+        "ND_plus_float",
+        "ND_plus_half",
+        "ND_position_vector3",
+        "ND_power_color3",
+        "ND_power_color3FA",
+        "ND_power_color4",
+        "ND_power_color4FA",
+        "ND_power_float",
+        "ND_power_half",
+        "ND_power_vector2",
+        "ND_power_vector2FA",
+        "ND_power_vector3",
+        "ND_power_vector3FA",
+        "ND_power_vector4",
+        "ND_power_vector4FA",
+        "ND_premult_color4",
+        "ND_ramp4_color3",
+        "ND_ramp4_color4",
+        "ND_ramp4_float",
+        "ND_ramp4_vector2",
+        "ND_ramp4_vector3",
+        "ND_ramp4_vector4",
+        "ND_ramplr_color3",
+        "ND_ramplr_color4",
+        "ND_ramplr_float",
+        "ND_ramplr_half",
+        "ND_ramplr_half2",
+        "ND_ramplr_half3",
+        "ND_ramplr_half4",
+        "ND_ramplr_vector2",
+        "ND_ramplr_vector3",
+        "ND_ramplr_vector4",
+        "ND_ramptb_color3",
+        "ND_ramptb_color4",
+        "ND_ramptb_float",
+        "ND_ramptb_half",
+        "ND_ramptb_half2",
+        "ND_ramptb_half3",
+        "ND_ramptb_half4",
+        "ND_ramptb_vector2",
+        "ND_ramptb_vector3",
+        "ND_ramptb_vector4",
+        "ND_range_color3",
+        "ND_range_color3FA",
+        "ND_range_color4",
+        "ND_range_color4FA",
+        "ND_range_float",
+        "ND_range_vector2",
+        "ND_range_vector2FA",
+        "ND_range_vector3",
+        "ND_range_vector3FA",
+        "ND_range_vector4",
+        "ND_range_vector4FA",
+        "ND_realitykit_cameraposition_vector3",
+        "ND_realitykit_combine2_matrix22",
+        "ND_realitykit_combine3_matrix33",
+        "ND_realitykit_combine4_matrix44",
+        "ND_realitykit_environment_radiance",
+        "ND_realitykit_fractional_color3",
+        "ND_realitykit_fractional_color4",
+        "ND_realitykit_fractional_float",
+        "ND_realitykit_fractional_vector2",
+        "ND_realitykit_fractional_vector3",
+        "ND_realitykit_fractional_vector4",
+        "ND_realitykit_geometry_modifier_custom_attribute",
+        "ND_realitykit_geometry_modifier_custom_attribute_half2_0",
+        "ND_realitykit_geometry_modifier_custom_attribute_half2_1",
+        "ND_realitykit_geometry_modifier_custom_attribute_half4_0",
+        "ND_realitykit_geometry_modifier_custom_attribute_half4_1",
+        "ND_realitykit_geometry_modifier_custom_attribute_half4_2",
+        "ND_realitykit_geometry_modifier_custom_attribute_half4_3",
+        "ND_realitykit_geometry_modifier_custom_parameter",
+        "ND_realitykit_geometry_modifier_model_position_offset",
+        "ND_realitykit_geometry_modifier_model_to_view",
+        "ND_realitykit_geometry_modifier_model_to_world",
+        "ND_realitykit_geometry_modifier_normal_to_world",
+        "ND_realitykit_geometry_modifier_projection_to_view",
+        "ND_realitykit_geometry_modifier_uv0_offset",
+        "ND_realitykit_geometry_modifier_uv0_transform",
+        "ND_realitykit_geometry_modifier_uv1_offset",
+        "ND_realitykit_geometry_modifier_uv1_transform",
+        "ND_realitykit_geometry_modifier_vertex_id",
+        "ND_realitykit_geometry_modifier_view_to_projection",
+        "ND_realitykit_geometry_modifier_world_to_model",
+        "ND_realitykit_geometry_switch_cameraindex_color3",
+        "ND_realitykit_geometry_switch_cameraindex_color4",
+        "ND_realitykit_geometry_switch_cameraindex_float",
+        "ND_realitykit_geometry_switch_cameraindex_integer",
+        "ND_realitykit_geometry_switch_cameraindex_vector2",
+        "ND_realitykit_geometry_switch_cameraindex_vector3",
+        "ND_realitykit_geometry_switch_cameraindex_vector4",
+        "ND_realitykit_geometrymodifier_vertexshader",
+        "ND_realitykit_logical_and",
+        "ND_realitykit_logical_not",
+        "ND_realitykit_logical_or",
+        "ND_realitykit_logical_xor",
+        "ND_realitykit_material_parameters_base_color_tint",
+        "ND_realitykit_material_parameters_clearcoat_roughness_scale",
+        "ND_realitykit_material_parameters_clearcoat_scale",
+        "ND_realitykit_material_parameters_emissive_color",
+        "ND_realitykit_material_parameters_metallic_scale",
+        "ND_realitykit_material_parameters_opacity_scale",
+        "ND_realitykit_material_parameters_opacity_threshold",
+        "ND_realitykit_material_parameters_roughness_scale",
+        "ND_realitykit_material_parameters_specular_scale",
+        "ND_realitykit_occlusion_surfaceshader",
+        "ND_realitykit_oneminus_color3",
+        "ND_realitykit_oneminus_color4",
+        "ND_realitykit_oneminus_float",
+        "ND_realitykit_oneminus_vector2",
+        "ND_realitykit_oneminus_vector3",
+        "ND_realitykit_oneminus_vector4",
+        "ND_realitykit_pbr_surfaceshader",
+        "ND_realitykit_reflect_vector3",
+        "ND_realitykit_refract_vector3",
+        "ND_realitykit_shadowreceiver_surfaceshader",
+        "ND_realitykit_step_color3",
+        "ND_realitykit_step_color4",
+        "ND_realitykit_step_float",
+        "ND_realitykit_step_vector2",
+        "ND_realitykit_step_vector3",
+        "ND_realitykit_step_vector4",
+        "ND_realitykit_surface_ambient_occlusion",
+        "ND_realitykit_surface_base_color",
+        "ND_realitykit_surface_clearcoat",
+        "ND_realitykit_surface_clearcoat_roughness",
+        "ND_realitykit_surface_custom_attribute",
+        "ND_realitykit_surface_custom_attribute_half2_0",
+        "ND_realitykit_surface_custom_attribute_half2_1",
+        "ND_realitykit_surface_custom_attribute_half4_0",
+        "ND_realitykit_surface_custom_attribute_half4_1",
+        "ND_realitykit_surface_custom_attribute_half4_2",
+        "ND_realitykit_surface_custom_attribute_half4_3",
+        "ND_realitykit_surface_custom_parameter",
+        "ND_realitykit_surface_emissive_color",
+        "ND_realitykit_surface_metallic",
+        "ND_realitykit_surface_model_to_view",
+        "ND_realitykit_surface_model_to_world",
+        "ND_realitykit_surface_opacity",
+        "ND_realitykit_surface_projection_to_view",
+        "ND_realitykit_surface_roughness",
+        "ND_realitykit_surface_screen_position",
+        "ND_realitykit_surface_specular",
+        "ND_realitykit_surface_view_direction",
+        "ND_realitykit_surface_view_to_projection",
+        "ND_realitykit_surface_world_to_view",
+        "ND_realitykit_unlit_surfaceshader",
+        "ND_realitykit_viewdirection_vector3",
+        "ND_remap_color3",
+        "ND_remap_color3FA",
+        "ND_remap_color4",
+        "ND_remap_color4FA",
+        "ND_remap_float",
+        "ND_remap_half",
+        "ND_remap_half2",
+        "ND_remap_half2FA",
+        "ND_remap_half3",
+        "ND_remap_half3FA",
+        "ND_remap_half4",
+        "ND_remap_half4FA",
+        "ND_remap_vector2",
+        "ND_remap_vector2FA",
+        "ND_remap_vector3",
+        "ND_remap_vector3FA",
+        "ND_remap_vector4",
+        "ND_remap_vector4FA",
+        "ND_rgbtohsv_color3",
+        "ND_rgbtohsv_color4",
+        "ND_rotate2d_vector2",
+        "ND_rotate3d_vector3",
+        "ND_round_color3",
+        "ND_round_color4",
+        "ND_round_float",
+        "ND_round_half",
+        "ND_round_vector2",
+        "ND_round_vector3",
+        "ND_round_vector4",
+        "ND_safepower_color3",
+        "ND_safepower_color3FA",
+        "ND_safepower_color4",
+        "ND_safepower_color4FA",
+        "ND_safepower_float",
+        "ND_safepower_half",
+        "ND_safepower_vector2",
+        "ND_safepower_vector2FA",
+        "ND_safepower_vector3",
+        "ND_safepower_vector3FA",
+        "ND_safepower_vector4",
+        "ND_safepower_vector4FA",
+        "ND_saturate_color3",
+        "ND_saturate_color4",
+        "ND_screen_color3",
+        "ND_screen_color4",
+        "ND_screen_float",
+        "ND_screen_half",
+        "ND_separate2_integer2",
+        "ND_separate2_vector2",
+        "ND_separate3_color3",
+        "ND_separate3_integer3",
+        "ND_separate3_vector3",
+        "ND_separate4_color4",
+        "ND_separate4_integer4",
+        "ND_separate4_vector4",
+        "ND_sign_color3",
+        "ND_sign_color4",
+        "ND_sign_float",
+        "ND_sign_half",
+        "ND_sign_half2",
+        "ND_sign_half3",
+        "ND_sign_half4",
+        "ND_sign_vector2",
+        "ND_sign_vector3",
+        "ND_sign_vector4",
+        "ND_sin_float",
+        "ND_sin_half",
+        "ND_sin_half2",
+        "ND_sin_half3",
+        "ND_sin_half4",
+        "ND_sin_vector2",
+        "ND_sin_vector3",
+        "ND_sin_vector4",
+        "ND_smoothstep_color3",
+        "ND_smoothstep_color3FA",
+        "ND_smoothstep_color4",
+        "ND_smoothstep_color4FA",
+        "ND_smoothstep_float",
+        "ND_smoothstep_half",
+        "ND_smoothstep_half2",
+        "ND_smoothstep_half2FA",
+        "ND_smoothstep_half3",
+        "ND_smoothstep_half3FA",
+        "ND_smoothstep_half4",
+        "ND_smoothstep_half4FA",
+        "ND_smoothstep_vector2",
+        "ND_smoothstep_vector2FA",
+        "ND_smoothstep_vector3",
+        "ND_smoothstep_vector3FA",
+        "ND_smoothstep_vector4",
+        "ND_smoothstep_vector4FA",
+        "ND_splitlr_color3",
+        "ND_splitlr_color4",
+        "ND_splitlr_float",
+        "ND_splitlr_half",
+        "ND_splitlr_vector2",
+        "ND_splitlr_vector3",
+        "ND_splitlr_vector4",
+        "ND_splittb_color3",
+        "ND_splittb_color4",
+        "ND_splittb_float",
+        "ND_splittb_half",
+        "ND_splittb_half2",
+        "ND_splittb_half3",
+        "ND_splittb_half4",
+        "ND_splittb_vector2",
+        "ND_splittb_vector3",
+        "ND_splittb_vector4",
+        "ND_sqrt_float",
+        "ND_sqrt_half",
+        "ND_sqrt_half2",
+        "ND_sqrt_half3",
+        "ND_sqrt_half4",
+        "ND_sqrt_vector2",
+        "ND_sqrt_vector3",
+        "ND_sqrt_vector4",
+        "ND_subtract_color3",
+        "ND_subtract_color3FA",
+        "ND_subtract_color4",
+        "ND_subtract_color4FA",
+        "ND_subtract_float",
+        "ND_subtract_half",
+        "ND_subtract_matrix22",
+        "ND_subtract_matrix22FA",
+        "ND_subtract_matrix33",
+        "ND_subtract_matrix33FA",
+        "ND_subtract_matrix44",
+        "ND_subtract_matrix44FA",
+        "ND_subtract_vector2",
+        "ND_subtract_vector2FA",
+        "ND_subtract_vector3",
+        "ND_subtract_vector3FA",
+        "ND_subtract_vector4",
+        "ND_subtract_vector4FA",
+        "ND_surfacematerial",
+        "ND_switch_color3",
+        "ND_switch_color3I",
+        "ND_switch_color4",
+        "ND_switch_color4I",
+        "ND_switch_float",
+        "ND_switch_floatI",
+        "ND_switch_half",
+        "ND_switch_halfI",
+        "ND_switch_vector2",
+        "ND_switch_vector2I",
+        "ND_switch_vector3",
+        "ND_switch_vector3I",
+        "ND_switch_vector4",
+        "ND_switch_vector4I",
+        "ND_swizzle_color3_color3",
+        "ND_swizzle_color3_color4",
+        "ND_swizzle_color3_float",
+        "ND_swizzle_color3_half",
+        "ND_swizzle_color3_vector2",
+        "ND_swizzle_color3_vector3",
+        "ND_swizzle_color3_vector4",
+        "ND_swizzle_color4_color3",
+        "ND_swizzle_color4_color4",
+        "ND_swizzle_color4_float",
+        "ND_swizzle_color4_half",
+        "ND_swizzle_color4_vector2",
+        "ND_swizzle_color4_vector3",
+        "ND_swizzle_color4_vector4",
+        "ND_swizzle_float_color3",
+        "ND_swizzle_float_color4",
+        "ND_swizzle_float_vector2",
+        "ND_swizzle_float_vector3",
+        "ND_swizzle_float_vector4",
+        "ND_swizzle_half_color3",
+        "ND_swizzle_half_color4",
+        "ND_swizzle_half_half2",
+        "ND_swizzle_half_half3",
+        "ND_swizzle_half_half4",
+        "ND_swizzle_vector2_color3",
+        "ND_swizzle_vector2_color4",
+        "ND_swizzle_vector2_float",
+        "ND_swizzle_vector2_half",
+        "ND_swizzle_vector2_vector2",
+        "ND_swizzle_vector2_vector3",
+        "ND_swizzle_vector2_vector4",
+        "ND_swizzle_vector3_color3",
+        "ND_swizzle_vector3_color4",
+        "ND_swizzle_vector3_float",
+        "ND_swizzle_vector3_half",
+        "ND_swizzle_vector3_vector2",
+        "ND_swizzle_vector3_vector3",
+        "ND_swizzle_vector3_vector4",
+        "ND_swizzle_vector4_color3",
+        "ND_swizzle_vector4_color4",
+        "ND_swizzle_vector4_float",
+        "ND_swizzle_vector4_half",
+        "ND_swizzle_vector4_vector2",
+        "ND_swizzle_vector4_vector3",
+        "ND_swizzle_vector4_vector4",
+        "ND_tan_float",
+        "ND_tan_half",
+        "ND_tan_half2",
+        "ND_tan_half3",
+        "ND_tan_half4",
+        "ND_tan_vector2",
+        "ND_tan_vector3",
+        "ND_tan_vector4",
+        "ND_tangent_vector3",
+        "ND_texcoord_vector2",
+        "ND_texcoord_vector3",
+        "ND_tiledimage_color3",
+        "ND_tiledimage_color4",
+        "ND_tiledimage_float",
+        "ND_tiledimage_half",
+        "ND_tiledimage_vector2",
+        "ND_tiledimage_vector3",
+        "ND_tiledimage_vector4",
+        "ND_time_float",
+        "ND_transformmatrix_vector2",
+        "ND_transformmatrix_vector2M3",
+        "ND_transformmatrix_vector3",
+        "ND_transformmatrix_vector3M4",
+        "ND_transformmatrix_vector4",
+        "ND_transformnormal_vector3",
+        "ND_transformpoint_vector3",
+        "ND_transformvector_vector3",
+        "ND_transpose_matrix22",
+        "ND_transpose_matrix33",
+        "ND_transpose_matrix44",
+        "ND_triplanarprojection_color3",
+        "ND_triplanarprojection_color4",
+        "ND_triplanarprojection_float",
+        "ND_triplanarprojection_vector2",
+        "ND_triplanarprojection_vector3",
+        "ND_triplanarprojection_vector4",
+        "ND_unpremult_color4",
+        "ND_updirection_vector3",
+        "ND_volumematerial",
+        "ND_worleynoise2d_float",
+        "ND_worleynoise2d_vector2",
+        "ND_worleynoise2d_vector3",
+        "ND_worleynoise3d_float",
+        "ND_worleynoise3d_vector2",
+        "ND_worleynoise3d_vector3",
+    ]
+}
+
+extension SGNode.Input {
+    static let schemaNames: [String] = [
+        "ambientOcclusion",
+        "amount",
+        "amplitude",
+        "applyPostProcessToneMap",
+        "axis",
+        "baseColor",
+        "bg",
+        "bias",
+        "bitangent",
+        "border_color",
+        "center",
+        "channels",
+        "clearcoat",
+        "clearcoatRoughness",
+        "color",
+        "coneangle",
+        "default",
+        "diffuseColor",
+        "diminish",
+        "displacementshader",
+        "doclamp",
+        "dynamic_min_lod_clamp",
+        "edge",
+        "emissiveColor",
+        "eta",
+        "fallback",
+        "fg",
+        "file",
+        "filex",
+        "filey",
+        "filez",
+        "filter",
+        "filtertype",
+        "fromspace",
+        "gamma",
+        "geomprop",
+        "gradient_dPdx",
+        "gradient_dPdy",
+        "gradientcube_dPdx",
+        "gradientcube_dPdy",
+        "hasPremultipliedAlpha",
+        "high",
+        "in",
+        "in1",
+        "in10",
+        "in2",
+        "in3",
+        "in4",
+        "in5",
+        "in6",
+        "in7",
+        "in8",
+        "in9",
+        "index",
+        "inhigh",
+        "inlow",
+        "inx",
+        "iny",
+        "ior",
+        "jitter",
+        "knots",
+        "knotvalues",
+        "lacunarity",
+        "left",
+        "lod",
+        "low",
+        "lumacoeffs",
+        "mag_filter",
+        "mask",
+        "mat",
+        "max_anisotropy",
+        "max_lod_clamp",
+        "maxdistance",
+        "metallic",
+        "min_filter",
+        "min_lod_clamp",
+        "mip_filter",
+        "mix",
+        "modelPositionOffset",
+        "mono",
+        "normal",
+        "note",
+        "occlusion",
+        "octaves",
+        "offset",
+        "opacity",
+        "opacityThreshold",
+        "outhigh",
+        "outlow",
+        "pivot",
+        "position",
+        "realworldimagesize",
+        "realworldtilesize",
+        "right",
+        "rotate",
+        "rotation",
+        "roughness",
+        "scale",
+        "size",
+        "space",
+        "specular",
+        "st",
+        "surfaceshader",
+        "tangent",
+        "texcoord",
+        "tospace",
+        "translation",
+        "u_wrap_mode",
+        "uaddressmode",
+        "userAttribute",
+        "userAttributeHalf2_0",
+        "userAttributeHalf2_1",
+        "userAttributeHalf4_0",
+        "userAttributeHalf4_1",
+        "userAttributeHalf4_2",
+        "userAttributeHalf4_3",
+        "uv0",
+        "uv1",
+        "uvoffset",
+        "uvtiling",
+        "v_wrap_mode",
+        "vaddressmode",
+        "value",
+        "value1",
+        "value2",
+        "valueb",
+        "valuebl",
+        "valuebr",
+        "valuel",
+        "valuer",
+        "valuet",
+        "valuetl",
+        "valuetr",
+        "varname",
+        "volumeshader",
+        "which",
+        "wrapS",
+        "wrapT",
+        "x",
+        "y",
+    ]
+}
@@ -0,0 +1,57 @@
+//
+//  Names.swift
+//  ShaderGraphCoder
+//
+//  Node types and input names are stored as small integer IDs
+//  and only turned back into strings when a graph is exported.
+//
+
+import Foundation
+
+/// Interns names as integer IDs. The names in the schemas have fixed IDs generated into Names.g.swift,
+/// other names get the next free ID the first time they are used.
+final class SGNameTable: @unchecked Sendable {
+    private let schemaNames: [String]
+    private let schemaIDs: [String: Int32]
+    private var otherNames: [String] = []
+    private var otherIDs: [String: Int32] = [:]
+    private let lock = NSLock()
+
+    init(schemaNames: [String]) {
+        self.schemaNames = schemaNames
+        var ids: [String: Int32] = [:]
+        for (i, name) in schemaNames.enumerated() {
+            ids[name] = Int32(i)
+        }
+        self.schemaIDs = ids
+    }
+
+    func id(_ name: String) -> Int32 {
+        if let id = schemaIDs[name] {
+            return id
+        }
+        lock.lock()
+        defer {
+            lock.unlock()
+        }
+        if let id = otherIDs[name] {
+            return id
+        }
+        let id = Int32(schemaNames.count + otherNames.count)
+        otherNames.append(name)
+        otherIDs[name] = id
+        return id
+    }
+
+    func name(_ id: Int32) -> String {
+        let index = Int(id)
+        if index < schemaNames.count {
+            return schemaNames[index]
+        }
+        lock.lock()
+        defer {
+            lock.unlock()
+        }
+        return otherNames[index - schemaNames.count]
+    }
+}
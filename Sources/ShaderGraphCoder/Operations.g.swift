@@ -74,57 +74,57 @@ public enum SGTransformSpace: String, CaseIterable {
 public func abs<T>(_ in1: T) -> T where T: SGNumeric {
     if SGDataType.color3f.matches(in1) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_absval_color3",
+            nodeTypeID: 50, // ND_absval_color3
             inputs: [
-                .init(name: "in", dataType: SGDataType.color3f, connection: in1),
+                .init(nameID: 42, dataType: SGDataType.color3f, connection: in1),
             ],
             outputs: [.init(dataType: SGDataType.color3f)])))
     }
     if SGDataType.color4f.matches(in1) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_absval_color4",
+            nodeTypeID: 51, // ND_absval_color4
             inputs: [
-                .init(name: "in", dataType: SGDataType.color4f, connection: in1),
+                .init(nameID: 42, dataType: SGDataType.color4f, connection: in1),
             ],
             outputs: [.init(dataType: SGDataType.color4f)])))
     }
     if SGDataType.float.matches(in1) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_absval_float",
+            nodeTypeID: 52, // ND_absval_float
             inputs: [
-                .init(name: "in", dataType: SGDataType.float, connection: in1),
+                .init(nameID: 42, dataType: SGDataType.float, connection: in1),
             ],
             outputs: [.init(dataType: SGDataType.float)])))
     }
     if SGDataType.half.matches(in1) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_absval_half",
+            nodeTypeID: 53, // ND_absval_half
             inputs: [
-                .init(name: "in", dataType: SGDataType.half, connection: in1),
+                .init(nameID: 42, dataType: SGDataType.half, connection: in1),
             ],
             outputs: [.init(dataType: SGDataType.half)])))
     }
     if SGDataType.vector2f.matches(in1) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_absval_vector2",
+            nodeTypeID: 54, // ND_absval_vector2
             inputs: [
-                .init(name: "in", dataType: SGDataType.vector2f, connection: in1),
+                .init(nameID: 42, dataType: SGDataType.vector2f, connection: in1),
             ],
             outputs: [.init(dataType: SGDataType.vector2f)])))
     }
     if SGDataType.vector3f.matches(in1) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_absval_vector3",
+            nodeTypeID: 55, // ND_absval_vector3
             inputs: [
-                .init(name: "in", dataType: SGDataType.vector3f, connection: in1),
+                .init(nameID: 42, dataType: SGDataType.vector3f, connection: in1),
             ],
             outputs: [.init(dataType: SGDataType.vector3f)])))
     }
     if SGDataType.vector4f.matches(in1) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_absval_vector4",
+            nodeTypeID: 56, // ND_absval_vector4
             inputs: [
-                .init(name: "in", dataType: SGDataType.vector4f, connection: in1),
+                .init(nameID: 42, dataType: SGDataType.vector4f, connection: in1),
             ],
             outputs: [.init(dataType: SGDataType.vector4f)])))
     }
@@ -134,65 +134,65 @@ public func abs<T>(_ in1: T) -> T where T: SGNumeric {
 public func acos<T>(_ in1: T) -> T where T: SGNumeric {
     if SGDataType.float.matches(in1) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_acos_float",
+            nodeTypeID: 57, // ND_acos_float
             inputs: [
-                .init(name: "in", dataType: SGDataType.float, connection: in1),
+                .init(nameID: 42, dataType: SGDataType.float, connection: in1),
             ],
             outputs: [.init(dataType: SGDataType.float)])))
     }
     if SGDataType.half.matches(in1) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_acos_half",
+            nodeTypeID: 58, // ND_acos_half
             inputs: [
-                .init(name: "in", dataType: SGDataType.half, connection: in1),
+                .init(nameID: 42, dataType: SGDataType.half, connection: in1),
             ],
             outputs: [.init(dataType: SGDataType.half)])))
     }
     if SGDataType.vector2h.matches(in1) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_acos_half2",
+            nodeTypeID: 59, // ND_acos_half2
             inputs: [
-                .init(name: "in", dataType: SGDataType.vector2h, connection: in1),
+                .init(nameID: 42, dataType: SGDataType.vector2h, connection: in1),
             ],
             outputs: [.init(dataType: SGDataType.vector2h)])))
     }
     if SGDataType.vector3h.matches(in1) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_acos_half3",
+            nodeTypeID: 60, // ND_acos_half3
             inputs: [
-                .init(name: "in", dataType: SGDataType.vector3h, connection: in1),
+                .init(nameID: 42, dataType: SGDataType.vector3h, connection: in1),
             ],
             outputs: [.init(dataType: SGDataType.vector3h)])))
     }
     if SGDataType.vector4h.matches(in1) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_acos_half4",
+            nodeTypeID: 61, // ND_acos_half4
             inputs: [
-                .init(name: "in", dataType: SGDataType.vector4h, connection: in1),
+                .init(nameID: 42, dataType: SGDataType.vector4h, connection: in1),
             ],
             outputs: [.init(dataType: SGDataType.vector4h)])))
     }
     if SGDataType.vector2f.matches(in1) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_acos_vector2",
+            nodeTypeID: 62, // ND_acos_vector2
             inputs: [
-                .init(name: "in", dataType: SGDataType.vector2f, connection: in1),
+                .init(nameID: 42, dataType: SGDataType.vector2f, connection: in1),
             ],
             outputs: [.init(dataType: SGDataType.vector2f)])))
     }
     if SGDataType.vector3f.matches(in1) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_acos_vector3",
+            nodeTypeID: 63, // ND_acos_vector3
             inputs: [
-                .init(name: "in", dataType: SGDataType.vector3f, connection: in1),
+                .init(nameID: 42, dataType: SGDataType.vector3f, connection: in1),
             ],
             outputs: [.init(dataType: SGDataType.vector3f)])))
     }
     if SGDataType.vector4f.matches(in1) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_acos_vector4",
+            nodeTypeID: 64, // ND_acos_vector4
             inputs: [
-                .init(name: "in", dataType: SGDataType.vector4f, connection: in1),
+                .init(nameID: 42, dataType: SGDataType.vector4f, connection: in1),
             ],
             outputs: [.init(dataType: SGDataType.vector4f)])))
     }
@@ -202,163 +202,163 @@ public func acos<T>(_ in1: T) -> T where T: SGNumeric {
 public func add<T>(_ in1: T, _ in2: SGNumeric) -> T where T: SGNumeric {
     if SGDataType.color3f.matches(in1) && SGDataType.color3f.matches(in2) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_add_color3",
+            nodeTypeID: 65, // ND_add_color3
             inputs: [
-                .init(name: "in1", dataType: SGDataType.color3f, connection: in1),
-                .init(name: "in2", dataType: SGDataType.color3f, connection: in2),
+                .init(nameID: 43, dataType: SGDataType.color3f, connection: in1),
+                .init(nameID: 45, dataType: SGDataType.color3f, connection: in2),
             ],
             outputs: [.init(dataType: SGDataType.color3f)])))
     }
     if SGDataType.color3f.matches(in1) && SGDataType.float.matches(in2) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_add_color3FA",
+            nodeTypeID: 66, // ND_add_color3FA
             inputs: [
-                .init(name: "in1", dataType: SGDataType.color3f, connection: in1),
-                .init(name: "in2", dataType: SGDataType.float, connection: in2),
+                .init(nameID: 43, dataType: SGDataType.color3f, connection: in1),
+                .init(nameID: 45, dataType: SGDataType.float, connection: in2),
             ],
             outputs: [.init(dataType: SGDataType.color3f)])))
     }
     if SGDataType.color4f.matches(in1) && SGDataType.color4f.matches(in2) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_add_color4",
+            nodeTypeID: 67, // ND_add_color4
             inputs: [
-                .init(name: "in1", dataType: SGDataType.color4f, connection: in1),
-                .init(name: "in2", dataType: SGDataType.color4f, connection: in2),
+                .init(nameID: 43, dataType: SGDataType.color4f, connection: in1),
+                .init(nameID: 45, dataType: SGDataType.color4f, connection: in2),
             ],
             outputs: [.init(dataType: SGDataType.color4f)])))
     }
     if SGDataType.color4f.matches(in1) && SGDataType.float.matches(in2) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_add_color4FA",
+            nodeTypeID: 68, // ND_add_color4FA
             inputs: [
-                .init(name: "in1", dataType: SGDataType.color4f, connection: in1),
-                .init(name: "in2", dataType: SGDataType.float, connection: in2),
+                .init(nameID: 43, dataType: SGDataType.color4f, connection: in1),
+                .init(nameID: 45, dataType: SGDataType.float, connection: in2),
             ],
             outputs: [.init(dataType: SGDataType.color4f)])))
     }
     if SGDataType.float.matches(in1) && SGDataType.float.matches(in2) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_add_float",
+            nodeTypeID: 70, // ND_add_float
             inputs: [
-                .init(name: "in1", dataType: SGDataType.float, connection: in1),
-                .init(name: "in2", dataType: SGDataType.float, connection: in2),
+                .init(nameID: 43, dataType: SGDataType.float, connection: in1),
+                .init(nameID: 45, dataType: SGDataType.float, connection: in2),
             ],
             outputs: [.init(dataType: SGDataType.float)])))
     }
     if SGDataType.half.matches(in1) && SGDataType.half.matches(in2) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_add_half",
+            nodeTypeID: 71, // ND_add_half
             inputs: [
-                .init(name: "in1", dataType: SGDataType.half, connection: in1),
-                .init(name: "in2", dataType: SGDataType.half, connection: in2),
+                .init(nameID: 43, dataType: SGDataType.half, connection: in1),
+                .init(nameID: 45, dataType: SGDataType.half, connection: in2),
             ],
             outputs: [.init(dataType: SGDataType.half)])))
     }
     if SGDataType.matrix2d.matches(in1) && SGDataType.matrix2d.matches(in2) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_add_matrix22",
+            nodeTypeID: 72, // ND_add_matrix22
             inputs: [
-                .init(name: "in1", dataType: SGDataType.matrix2d, connection: in1),
-                .init(name: "in2", dataType: SGDataType.matrix2d, connection: in2),
+                .init(nameID: 43, dataType: SGDataType.matrix2d, connection: in1),
+                .init(nameID: 45, dataType: SGDataType.matrix2d, connection: in2),
             ],
             outputs: [.init(dataType: SGDataType.matrix2d)])))
     }
     if SGDataType.matrix2d.matches(in1) && SGDataType.float.matches(in2) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_add_matrix22FA",
+            nodeTypeID: 73, // ND_add_matrix22FA
             inputs: [
-                .init(name: "in1", dataType: SGDataType.matrix2d, connection: in1),
-                .init(name: "in2", dataType: SGDataType.float, connection: in2),
+                .init(nameID: 43, dataType: SGDataType.matrix2d, connection: in1),
+                .init(nameID: 45, dataType: SGDataType.float, connection: in2),
             ],
             outputs: [.init(dataType: SGDataType.matrix2d)])))
     }
     if SGDataType.matrix3d.matches(in1) && SGDataType.matrix3d.matches(in2) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_add_matrix33",
+            nodeTypeID: 74, // ND_add_matrix33
             inputs: [
-                .init(name: "in1", dataType: SGDataType.matrix3d, connection: in1),
-                .init(name: "in2", dataType: SGDataType.matrix3d, connection: in2),
+                .init(nameID: 43, dataType: SGDataType.matrix3d, connection: in1),
+                .init(nameID: 45, dataType: SGDataType.matrix3d, connection: in2),
             ],
             outputs: [.init(dataType: SGDataType.matrix3d)])))
     }
     if SGDataType.matrix3d.matches(in1) && SGDataType.float.matches(in2) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_add_matrix33FA",
+            nodeTypeID: 75, // ND_add_matrix33FA
             inputs: [
-                .init(name: "in1", dataType: SGDataType.matrix3d, connection: in1),
-                .init(name: "in2", dataType: SGDataType.float, connection: in2),
+                .init(nameID: 43, dataType: SGDataType.matrix3d, connection: in1),
+                .init(nameID: 45, dataType: SGDataType.float, connection: in2),
             ],
             outputs: [.init(dataType: SGDataType.matrix3d)])))
     }
     if SGDataType.matrix4d.matches(in1) && SGDataType.matrix4d.matches(in2) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_add_matrix44",
+            nodeTypeID: 76, // ND_add_matrix44
             inputs: [
-                .init(name: "in1", dataType: SGDataType.matrix4d, connection: in1),
-                .init(name: "in2", dataType: SGDataType.matrix4d, connection: in2),
+                .init(nameID: 43, dataType: SGDataType.matrix4d, connection: in1),
+                .init(nameID: 45, dataType: SGDataType.matrix4d, connection: in2),
             ],
             outputs: [.init(dataType: SGDataType.matrix4d)])))
     }
     if SGDataType.matrix4d.matches(in1) && SGDataType.float.matches(in2) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_add_matrix44FA",
+            nodeTypeID: 77, // ND_add_matrix44FA
             inputs: [
-                .init(name: "in1", dataType: SGDataType.matrix4d, connection: in1),
-                .init(name: "in2", dataType: SGDataType.float, connection: in2),
+                .init(nameID: 43, dataType: SGDataType.matrix4d, connection: in1),
+                .init(nameID: 45, dataType: SGDataType.float, connection: in2),
             ],
             outputs: [.init(dataType: SGDataType.matrix4d)])))
     }
     if SGDataType.vector2f.matches(in1) && SGDataType.vector2f.matches(in2) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_add_vector2",
+            nodeTypeID: 79, // ND_add_vector2
             inputs: [
-                .init(name: "in1", dataType: SGDataType.vector2f, connection: in1),
-                .init(name: "in2", dataType: SGDataType.vector2f, connection: in2),
+                .init(nameID: 43, dataType: SGDataType.vector2f, connection: in1),
+                .init(nameID: 45, dataType: SGDataType.vector2f, connection: in2),
             ],
             outputs: [.init(dataType: SGDataType.vector2f)])))
     }
     if SGDataType.vector2f.matches(in1) && SGDataType.float.matches(in2) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_add_vector2FA",
+            nodeTypeID: 80, // ND_add_vector2FA
             inputs: [
-                .init(name: "in1", dataType: SGDataType.vector2f, connection: in1),
-                .init(name: "in2", dataType: SGDataType.float, connection: in2),
+                .init(nameID: 43, dataType: SGDataType.vector2f, connection: in1),
+                .init(nameID: 45, dataType: SGDataType.float, connection: in2),
             ],
             outputs: [.init(dataType: SGDataType.vector2f)])))
     }
     if SGDataType.vector3f.matches(in1) && SGDataType.vector3f.matches(in2) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_add_vector3",
+            nodeTypeID: 81, // ND_add_vector3
             inputs: [
-                .init(name: "in1", dataType: SGDataType.vector3f, connection: in1),
-                .init(name: "in2", dataType: SGDataType.vector3f, connection: in2),
+                .init(nameID: 43, dataType: SGDataType.vector3f, connection: in1),
+                .init(nameID: 45, dataType: SGDataType.vector3f, connection: in2),
             ],
             outputs: [.init(dataType: SGDataType.vector3f)])))
     }
     if SGDataType.vector3f.matches(in1) && SGDataType.float.matches(in2) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_add_vector3FA",
+            nodeTypeID: 82, // ND_add_vector3FA
             inputs: [
-                .init(name: "in1", dataType: SGDataType.vector3f, connection: in1),
-                .init(name: "in2", dataType: SGDataType.float, connection: in2),
+                .init(nameID: 43, dataType: SGDataType.vector3f, connection: in1),
+                .init(nameID: 45, dataType: SGDataType.float, connection: in2),
             ],
             outputs: [.init(dataType: SGDataType.vector3f)])))
     }
     if SGDataType.vector4f.matches(in1) && SGDataType.vector4f.matches(in2) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_add_vector4",
+            nodeTypeID: 83, // ND_add_vector4
             inputs: [
-                .init(name: "in1", dataType: SGDataType.vector4f, connection: in1),
-                .init(name: "in2", dataType: SGDataType.vector4f, connection: in2),
+                .init(nameID: 43, dataType: SGDataType.vector4f, connection: in1),
+                .init(nameID: 45, dataType: SGDataType.vector4f, connection: in2),
             ],
             outputs: [.init(dataType: SGDataType.vector4f)])))
     }
     if SGDataType.vector4f.matches(in1) && SGDataType.float.matches(in2) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_add_vector4FA",
+            nodeTypeID: 84, // ND_add_vector4FA
             inputs: [
-                .init(name: "in1", dataType: SGDataType.vector4f, connection: in1),
-                .init(name: "in2", dataType: SGDataType.float, connection: in2),
+                .init(nameID: 43, dataType: SGDataType.vector4f, connection: in1),
+                .init(nameID: 45, dataType: SGDataType.float, connection: in2),
             ],
             outputs: [.init(dataType: SGDataType.vector4f)])))
     }
@@ -373,10 +373,10 @@ public func ambientOcclusion(coneangle: SGScalar? = nil, maxdistance: SGScalar?
         return SGScalar(source: .error("Invalid ambientOcclusion input. Expected maxdistance data type to be SGDataType.float, but got \(maxdistance?.dataType.rawValue ?? "nil").", values: [maxdistance]))
     }
     return SGScalar(source: .nodeOutput(SGNode(
-        nodeType: "ND_ambientocclusion_float",
+        nodeTypeID: 86, // ND_ambientocclusion_float
         inputs: [
-            .init(name: "coneangle", dataType: SGDataType.float, connection: coneangle),
-            .init(name: "maxdistance", dataType: SGDataType.float, connection: maxdistance),
+            .init(nameID: 15, dataType: SGDataType.float, connection: coneangle),
+            .init(nameID: 72, dataType: SGDataType.float, connection: maxdistance),
         ],
         outputs: [.init(dataType: SGDataType.float)])))
 }
@@ -384,65 +384,65 @@ public func ambientOcclusion(coneangle: SGScalar? = nil, maxdistance: SGScalar?
 public func asin<T>(_ in1: T) -> T where T: SGNumeric {
     if SGDataType.float.matches(in1) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_asin_float",
+            nodeTypeID: 103, // ND_asin_float
             inputs: [
-                .init(name: "in", dataType: SGDataType.float, connection: in1),
+                .init(nameID: 42, dataType: SGDataType.float, connection: in1),
             ],
             outputs: [.init(dataType: SGDataType.float)])))
     }
     if SGDataType.half.matches(in1) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_asin_half",
+            nodeTypeID: 104, // ND_asin_half
             inputs: [
-                .init(name: "in", dataType: SGDataType.half, connection: in1),
+                .init(nameID: 42, dataType: SGDataType.half, connection: in1),
             ],
             outputs: [.init(dataType: SGDataType.half)])))
     }
     if SGDataType.vector2h.matches(in1) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_asin_half2",
+            nodeTypeID: 105, // ND_asin_half2
             inputs: [
-                .init(name: "in", dataType: SGDataType.vector2h, connection: in1),
+                .init(nameID: 42, dataType: SGDataType.vector2h, connection: in1),
             ],
             outputs: [.init(dataType: SGDataType.vector2h)])))
     }
     if SGDataType.vector3h.matches(in1) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_asin_half3",
+            nodeTypeID: 106, // ND_asin_half3
             inputs: [
-                .init(name: "in", dataType: SGDataType.vector3h, connection: in1),
+                .init(nameID: 42, dataType: SGDataType.vector3h, connection: in1),
             ],
             outputs: [.init(dataType: SGDataType.vector3h)])))
     }
     if SGDataType.vector4h.matches(in1) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_asin_half4",
+            nodeTypeID: 107, // ND_asin_half4
             inputs: [
-                .init(name: "in", dataType: SGDataType.vector4h, connection: in1),
+                .init(nameID: 42, dataType: SGDataType.vector4h, connection: in1),
             ],
             outputs: [.init(dataType: SGDataType.vector4h)])))
     }
     if SGDataType.vector2f.matches(in1) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_asin_vector2",
+            nodeTypeID: 108, // ND_asin_vector2
             inputs: [
-                .init(name: "in", dataType: SGDataType.vector2f, connection: in1),
+                .init(nameID: 42, dataType: SGDataType.vector2f, connection: in1),
             ],
             outputs: [.init(dataType: SGDataType.vector2f)])))
     }
     if SGDataType.vector3f.matches(in1) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_asin_vector3",
+            nodeTypeID: 109, // ND_asin_vector3
             inputs: [
-                .init(name: "in", dataType: SGDataType.vector3f, connection: in1),
+                .init(nameID: 42, dataType: SGDataType.vector3f, connection: in1),
             ],
             outputs: [.init(dataType: SGDataType.vector3f)])))
     }
     if SGDataType.vector4f.matches(in1) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_asin_vector4",
+            nodeTypeID: 110, // ND_asin_vector4
             inputs: [
-                .init(name: "in", dataType: SGDataType.vector4f, connection: in1),
+                .init(nameID: 42, dataType: SGDataType.vector4f, connection: in1),
             ],
             outputs: [.init(dataType: SGDataType.vector4f)])))
     }
@@ -452,73 +452,73 @@ public func asin<T>(_ in1: T) -> T where T: SGNumeric {
 public func atan2<T>(iny: T, inx: T) -> T where T: SGNumeric {
     if SGDataType.float.matches(iny) && SGDataType.float.matches(inx) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_atan2_float",
+            nodeTypeID: 111, // ND_atan2_float
             inputs: [
-                .init(name: "iny", dataType: SGDataType.float, connection: iny),
-                .init(name: "inx", dataType: SGDataType.float, connection: inx),
+                .init(nameID: 57, dataType: SGDataType.float, connection: iny),
+                .init(nameID: 56, dataType: SGDataType.float, connection: inx),
             ],
             outputs: [.init(dataType: SGDataType.float)])))
     }
     if SGDataType.half.matches(iny) && SGDataType.half.matches(inx) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_atan2_half",
+            nodeTypeID: 112, // ND_atan2_half
             inputs: [
-                .init(name: "iny", dataType: SGDataType.half, connection: iny),
-                .init(name: "inx", dataType: SGDataType.half, connection: inx),
+                .init(nameID: 57, dataType: SGDataType.half, connection: iny),
+                .init(nameID: 56, dataType: SGDataType.half, connection: inx),
             ],
             outputs: [.init(dataType: SGDataType.half)])))
     }
     if SGDataType.vector2h.matches(iny) && SGDataType.vector2h.matches(inx) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_atan2_half2",
+            nodeTypeID: 113, // ND_atan2_half2
             inputs: [
-                .init(name: "iny", dataType: SGDataType.vector2h, connection: iny),
-                .init(name: "inx", dataType: SGDataType.vector2h, connection: inx),
+                .init(nameID: 57, dataType: SGDataType.vector2h, connection: iny),
+                .init(nameID: 56, dataType: SGDataType.vector2h, connection: inx),
             ],
             outputs: [.init(dataType: SGDataType.vector2h)])))
     }
     if SGDataType.vector3h.matches(iny) && SGDataType.vector3h.matches(inx) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_atan2_half3",
+            nodeTypeID: 114, // ND_atan2_half3
             inputs: [
-                .init(name: "iny", dataType: SGDataType.vector3h, connection: iny),
-                .init(name: "inx", dataType: SGDataType.vector3h, connection: inx),
+                .init(nameID: 57, dataType: SGDataType.vector3h, connection: iny),
+                .init(nameID: 56, dataType: SGDataType.vector3h, connection: inx),
             ],
             outputs: [.init(dataType: SGDataType.vector3h)])))
     }
     if SGDataType.vector4h.matches(iny) && SGDataType.vector4h.matches(inx) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_atan2_half4",
+            nodeTypeID: 115, // ND_atan2_half4
             inputs: [
-                .init(name: "iny", dataType: SGDataType.vector4h, connection: iny),
-                .init(name: "inx", dataType: SGDataType.vector4h, connection: inx),
+                .init(nameID: 57, dataType: SGDataType.vector4h, connection: iny),
+                .init(nameID: 56, dataType: SGDataType.vector4h, connection: inx),
             ],
             outputs: [.init(dataType: SGDataType.vector4h)])))
     }
     if SGDataType.vector2f.matches(iny) && SGDataType.vector2f.matches(inx) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_atan2_vector2",
+            nodeTypeID: 116, // ND_atan2_vector2
             inputs: [
-                .init(name: "iny", dataType: SGDataType.vector2f, connection: iny),
-                .init(name: "inx", dataType: SGDataType.vector2f, connection: inx),
+                .init(nameID: 57, dataType: SGDataType.vector2f, connection: iny),
+                .init(nameID: 56, dataType: SGDataType.vector2f, connection: inx),
             ],
             outputs: [.init(dataType: SGDataType.vector2f)])))
     }
     if SGDataType.vector3f.matches(iny) && SGDataType.vector3f.matches(inx) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_atan2_vector3",
+            nodeTypeID: 117, // ND_atan2_vector3
             inputs: [
-                .init(name: "iny", dataType: SGDataType.vector3f, connection: iny),
-                .init(name: "inx", dataType: SGDataType.vector3f, connection: inx),
+                .init(nameID: 57, dataType: SGDataType.vector3f, connection: iny),
+                .init(nameID: 56, dataType: SGDataType.vector3f, connection: inx),
             ],
             outputs: [.init(dataType: SGDataType.vector3f)])))
     }
     if SGDataType.vector4f.matches(iny) && SGDataType.vector4f.matches(inx) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_atan2_vector4",
+            nodeTypeID: 118, // ND_atan2_vector4
             inputs: [
-                .init(name: "iny", dataType: SGDataType.vector4f, connection: iny),
-                .init(name: "inx", dataType: SGDataType.vector4f, connection: inx),
+                .init(nameID: 57, dataType: SGDataType.vector4f, connection: iny),
+                .init(nameID: 56, dataType: SGDataType.vector4f, connection: inx),
             ],
             outputs: [.init(dataType: SGDataType.vector4f)])))
     }
@@ -528,71 +528,71 @@ public func atan2<T>(iny: T, inx: T) -> T where T: SGNumeric {
 public func blur<T>(_ in1: T, size: SGScalar? = nil, filtertype: SGBlurFilterType = SGBlurFilterType.box) -> T where T: SGNumeric {
     if SGDataType.color3f.matches(in1) && SGDataType.float.matches(size) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_blur_color3",
+            nodeTypeID: 120, // ND_blur_color3
             inputs: [
-                .init(name: "in", dataType: SGDataType.color3f, connection: in1),
-                .init(name: "size", dataType: SGDataType.float, connection: size),
-                .init(name: "filtertype", dataType: SGDataType.string, connection: SGString(source: .constant(.string(filtertype.rawValue)))),
+                .init(nameID: 42, dataType: SGDataType.color3f, connection: in1),
+                .init(nameID: 98, dataType: SGDataType.float, connection: size),
+                .init(nameID: 32, dataType: SGDataType.string, connection: SGString(source: .constant(.string(filtertype.rawValue)))),
             ],
             outputs: [.init(dataType: SGDataType.color3f)])))
     }
     if SGDataType.color4f.matches(in1) && SGDataType.float.matches(size) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_blur_color4",
+            nodeTypeID: 121, // ND_blur_color4
             inputs: [
-                .init(name: "in", dataType: SGDataType.color4f, connection: in1),
-                .init(name: "size", dataType: SGDataType.float, connection: size),
-                .init(name: "filtertype", dataType: SGDataType.string, connection: SGString(source: .constant(.string(filtertype.rawValue)))),
+                .init(nameID: 42, dataType: SGDataType.color4f, connection: in1),
+                .init(nameID: 98, dataType: SGDataType.float, connection: size),
+                .init(nameID: 32, dataType: SGDataType.string, connection: SGString(source: .constant(.string(filtertype.rawValue)))),
             ],
             outputs: [.init(dataType: SGDataType.color4f)])))
     }
     if SGDataType.float.matches(in1) && SGDataType.float.matches(size) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_blur_float",
+            nodeTypeID: 122, // ND_blur_float
             inputs: [
-                .init(name: "in", dataType: SGDataType.float, connection: in1),
-                .init(name: "size", dataType: SGDataType.float, connection: size),
-                .init(name: "filtertype", dataType: SGDataType.string, connection: SGString(source: .constant(.string(filtertype.rawValue)))),
+                .init(nameID: 42, dataType: SGDataType.float, connection: in1),
+                .init(nameID: 98, dataType: SGDataType.float, connection: size),
+                .init(nameID: 32, dataType: SGDataType.string, connection: SGString(source: .constant(.string(filtertype.rawValue)))),
             ],
             outputs: [.init(dataType: SGDataType.float)])))
     }
     if SGDataType.half.matches(in1) && SGDataType.half.matches(size) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_blur_half",
+            nodeTypeID: 123, // ND_blur_half
             inputs: [
-                .init(name: "in", dataType: SGDataType.half, connection: in1),
-                .init(name: "size", dataType: SGDataType.half, connection: size),
-                .init(name: "filtertype", dataType: SGDataType.string, connection: SGString(source: .constant(.string(filtertype.rawValue)))),
+                .init(nameID: 42, dataType: SGDataType.half, connection: in1),
+                .init(nameID: 98, dataType: SGDataType.half, connection: size),
+                .init(nameID: 32, dataType: SGDataType.string, connection: SGString(source: .constant(.string(filtertype.rawValue)))),
             ],
             outputs: [.init(dataType: SGDataType.half)])))
     }
     if SGDataType.vector2f.matches(in1) && SGDataType.float.matches(size) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_blur_vector2",
+            nodeTypeID: 124, // ND_blur_vector2
             inputs: [
-                .init(name: "in", dataType: SGDataType.vector2f, connection: in1),
-                .init(name: "size", dataType: SGDataType.float, connection: size),
-                .init(name: "filtertype", dataType: SGDataType.string, connection: SGString(source: .constant(.string(filtertype.rawValue)))),
+                .init(nameID: 42, dataType: SGDataType.vector2f, connection: in1),
+                .init(nameID: 98, dataType: SGDataType.float, connection: size),
+                .init(nameID: 32, dataType: SGDataType.string, connection: SGString(source: .constant(.string(filtertype.rawValue)))),
             ],
             outputs: [.init(dataType: SGDataType.vector2f)])))
     }
     if SGDataType.vector3f.matches(in1) && SGDataType.float.matches(size) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_blur_vector3",
+            nodeTypeID: 125, // ND_blur_vector3
             inputs: [
-                .init(name: "in", dataType: SGDataType.vector3f, connection: in1),
-                .init(name: "size", dataType: SGDataType.float, connection: size),
-                .init(name: "filtertype", dataType: SGDataType.string, connection: SGString(source: .constant(.string(filtertype.rawValue)))),
+                .init(nameID: 42, dataType: SGDataType.vector3f, connection: in1),
+                .init(nameID: 98, dataType: SGDataType.float, connection: size),
+                .init(nameID: 32, dataType: SGDataType.string, connection: SGString(source: .constant(.string(filtertype.rawValue)))),
             ],
             outputs: [.init(dataType: SGDataType.vector3f)])))
     }
     if SGDataType.vector4f.matches(in1) && SGDataType.float.matches(size) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_blur_vector4",
+            nodeTypeID: 126, // ND_blur_vector4
             inputs: [
-                .init(name: "in", dataType: SGDataType.vector4f, connection: in1),
-                .init(name: "size", dataType: SGDataType.float, connection: size),
-                .init(name: "filtertype", dataType: SGDataType.string, connection: SGString(source: .constant(.string(filtertype.rawValue)))),
+                .init(nameID: 42, dataType: SGDataType.vector4f, connection: in1),
+                .init(nameID: 98, dataType: SGDataType.float, connection: size),
+                .init(nameID: 32, dataType: SGDataType.string, connection: SGString(source: .constant(.string(filtertype.rawValue)))),
             ],
             outputs: [.init(dataType: SGDataType.vector4f)])))
     }
@@ -602,41 +602,41 @@ public func blur<T>(_ in1: T, size: SGScalar? = nil, filtertype: SGBlurFilterTyp
 public func burn<T>(fg: T, bg: T, mix: SGScalar? = nil) -> T where T: SGNumeric {
     if SGDataType.color3f.matches(fg) && SGDataType.color3f.matches(bg) && SGDataType.float.matches(mix) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_burn_color3",
+            nodeTypeID: 127, // ND_burn_color3
             inputs: [
-                .init(name: "fg", dataType: SGDataType.color3f, connection: fg),
-                .init(name: "bg", dataType: SGDataType.color3f, connection: bg),
-                .init(name: "mix", dataType: SGDataType.float, connection: mix),
+                .init(nameID: 26, dataType: SGDataType.color3f, connection: fg),
+                .init(nameID: 6, dataType: SGDataType.color3f, connection: bg),
+                .init(nameID: 77, dataType: SGDataType.float, connection: mix),
             ],
             outputs: [.init(dataType: SGDataType.color3f)])))
     }
     if SGDataType.color4f.matches(fg) && SGDataType.color4f.matches(bg) && SGDataType.float.matches(mix) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_burn_color4",
+            nodeTypeID: 128, // ND_burn_color4
             inputs: [
-                .init(name: "fg", dataType: SGDataType.color4f, connection: fg),
-                .init(name: "bg", dataType: SGDataType.color4f, connection: bg),
-                .init(name: "mix", dataType: SGDataType.float, connection: mix),
+                .init(nameID: 26, dataType: SGDataType.color4f, connection: fg),
+                .init(nameID: 6, dataType: SGDataType.color4f, connection: bg),
+                .init(nameID: 77, dataType: SGDataType.float, connection: mix),
             ],
             outputs: [.init(dataType: SGDataType.color4f)])))
     }
     if SGDataType.float.matches(fg) && SGDataType.float.matches(bg) && SGDataType.float.matches(mix) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_burn_float",
+            nodeTypeID: 129, // ND_burn_float
             inputs: [
-                .init(name: "fg", dataType: SGDataType.float, connection: fg),
-                .init(name: "bg", dataType: SGDataType.float, connection: bg),
-                .init(name: "mix", dataType: SGDataType.float, connection: mix),
+                .init(nameID: 26, dataType: SGDataType.float, connection: fg),
+                .init(nameID: 6, dataType: SGDataType.float, connection: bg),
+                .init(nameID: 77, dataType: SGDataType.float, connection: mix),
             ],
             outputs: [.init(dataType: SGDataType.float)])))
     }
     if SGDataType.half.matches(fg) && SGDataType.half.matches(bg) && SGDataType.half.matches(mix) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_burn_half",
+            nodeTypeID: 130, // ND_burn_half
             inputs: [
-                .init(name: "fg", dataType: SGDataType.half, connection: fg),
-                .init(name: "bg", dataType: SGDataType.half, connection: bg),
-                .init(name: "mix", dataType: SGDataType.half, connection: mix),
+                .init(nameID: 26, dataType: SGDataType.half, connection: fg),
+                .init(nameID: 6, dataType: SGDataType.half, connection: bg),
+                .init(nameID: 77, dataType: SGDataType.half, connection: mix),
             ],
             outputs: [.init(dataType: SGDataType.half)])))
     }
@@ -646,57 +646,57 @@ public func burn<T>(fg: T, bg: T, mix: SGScalar? = nil) -> T where T: SGNumeric
 public func ceil<T>(_ in1: T) -> T where T: SGNumeric {
     if SGDataType.color3f.matches(in1) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_ceil_color3",
+            nodeTypeID: 131, // ND_ceil_color3
             inputs: [
-                .init(name: "in", dataType: SGDataType.color3f, connection: in1),
+                .init(nameID: 42, dataType: SGDataType.color3f, connection: in1),
             ],
             outputs: [.init(dataType: SGDataType.color3f)])))
     }
     if SGDataType.color4f.matches(in1) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_ceil_color4",
+            nodeTypeID: 132, // ND_ceil_color4
             inputs: [
-                .init(name: "in", dataType: SGDataType.color4f, connection: in1),
+                .init(nameID: 42, dataType: SGDataType.color4f, connection: in1),
             ],
             outputs: [.init(dataType: SGDataType.color4f)])))
     }
     if SGDataType.float.matches(in1) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_ceil_float",
+            nodeTypeID: 133, // ND_ceil_float
             inputs: [
-                .init(name: "in", dataType: SGDataType.float, connection: in1),
+                .init(nameID: 42, dataType: SGDataType.float, connection: in1),
             ],
             outputs: [.init(dataType: SGDataType.float)])))
     }
     if SGDataType.half.matches(in1) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_ceil_half",
+            nodeTypeID: 134, // ND_ceil_half
             inputs: [
-                .init(name: "in", dataType: SGDataType.half, connection: in1),
+                .init(nameID: 42, dataType: SGDataType.half, connection: in1),
             ],
             outputs: [.init(dataType: SGDataType.half)])))
     }
     if SGDataType.vector2f.matches(in1) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_ceil_vector2",
+            nodeTypeID: 135, // ND_ceil_vector2
             inputs: [
-                .init(name: "in", dataType: SGDataType.vector2f, connection: in1),
+                .init(nameID: 42, dataType: SGDataType.vector2f, connection: in1),
             ],
             outputs: [.init(dataType: SGDataType.vector2f)])))
     }
     if SGDataType.vector3f.matches(in1) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_ceil_vector3",
+            nodeTypeID: 136, // ND_ceil_vector3
             inputs: [
-                .init(name: "in", dataType: SGDataType.vector3f, connection: in1),
+                .init(nameID: 42, dataType: SGDataType.vector3f, connection: in1),
             ],
             outputs: [.init(dataType: SGDataType.vector3f)])))
     }
     if SGDataType.vector4f.matches(in1) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_ceil_vector4",
+            nodeTypeID: 137, // ND_ceil_vector4
             inputs: [
-                .init(name: "in", dataType: SGDataType.vector4f, connection: in1),
+                .init(nameID: 42, dataType: SGDataType.vector4f, connection: in1),
             ],
             outputs: [.init(dataType: SGDataType.vector4f)])))
     }
@@ -708,9 +708,9 @@ public func cellNoise2D(texcoord: SGVector? = nil) -> SGScalar {
         return SGScalar(source: .error("Invalid cellNoise2D input. Expected texcoord data type to be SGDataType.vector2f, but got \(texcoord?.dataType.rawValue ?? "nil").", values: [texcoord]))
     }
     return SGScalar(source: .nodeOutput(SGNode(
-        nodeType: "ND_cellnoise2d_float",
+        nodeTypeID: 138, // ND_cellnoise2d_float
         inputs: [
-            .init(name: "texcoord", dataType: SGDataType.vector2f, connection: texcoord),
+            .init(nameID: 104, dataType: SGDataType.vector2f, connection: texcoord),
         ],
         outputs: [.init(dataType: SGDataType.float)])))
 }
@@ -720,9 +720,9 @@ public func cellNoise3D(position: SGVector? = nil) -> SGScalar {
         return SGScalar(source: .error("Invalid cellNoise3D input. Expected position data type to be SGDataType.vector3f, but got \(position?.dataType.rawValue ?? "nil").", values: [position]))
     }
     return SGScalar(source: .nodeOutput(SGNode(
-        nodeType: "ND_cellnoise3d_float",
+        nodeTypeID: 139, // ND_cellnoise3d_float
         inputs: [
-            .init(name: "position", dataType: SGDataType.vector3f, connection: position),
+            .init(nameID: 90, dataType: SGDataType.vector3f, connection: position),
         ],
         outputs: [.init(dataType: SGDataType.float)])))
 }
@@ -730,181 +730,181 @@ public func cellNoise3D(position: SGVector? = nil) -> SGScalar {
 public func clamp<T>(_ in1: T, min: SGNumeric, max: SGNumeric) -> T where T: SGNumeric {
     if SGDataType.color3f.matches(in1) && SGDataType.color3f.matches(min) && SGDataType.color3f.matches(max) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_clamp_color3",
+            nodeTypeID: 140, // ND_clamp_color3
             inputs: [
-                .init(name: "in", dataType: SGDataType.color3f, connection: in1),
-                .init(name: "low", dataType: SGDataType.color3f, connection: min),
-                .init(name: "high", dataType: SGDataType.color3f, connection: max),
+                .init(nameID: 42, dataType: SGDataType.color3f, connection: in1),
+                .init(nameID: 65, dataType: SGDataType.color3f, connection: min),
+                .init(nameID: 41, dataType: SGDataType.color3f, connection: max),
             ],
             outputs: [.init(dataType: SGDataType.color3f)])))
     }
     if SGDataType.color3f.matches(in1) && SGDataType.float.matches(min) && SGDataType.float.matches(max) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_clamp_color3FA",
+            nodeTypeID: 141, // ND_clamp_color3FA
             inputs: [
-                .init(name: "in", dataType: SGDataType.color3f, connection: in1),
-                .init(name: "low", dataType: SGDataType.float, connection: min),
-                .init(name: "high", dataType: SGDataType.float, connection: max),
+                .init(nameID: 42, dataType: SGDataType.color3f, connection: in1),
+                .init(nameID: 65, dataType: SGDataType.float, connection: min),
+                .init(nameID: 41, dataType: SGDataType.float, connection: max),
             ],
             outputs: [.init(dataType: SGDataType.color3f)])))
     }
     if SGDataType.color4f.matches(in1) && SGDataType.color4f.matches(min) && SGDataType.color4f.matches(max) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_clamp_color4",
+            nodeTypeID: 142, // ND_clamp_color4
             inputs: [
-                .init(name: "in", dataType: SGDataType.color4f, connection: in1),
-                .init(name: "low", dataType: SGDataType.color4f, connection: min),
-                .init(name: "high", dataType: SGDataType.color4f, connection: max),
+                .init(nameID: 42, dataType: SGDataType.color4f, connection: in1),
+                .init(nameID: 65, dataType: SGDataType.color4f, connection: min),
+                .init(nameID: 41, dataType: SGDataType.color4f, connection: max),
             ],
             outputs: [.init(dataType: SGDataType.color4f)])))
     }
     if SGDataType.color4f.matches(in1) && SGDataType.float.matches(min) && SGDataType.float.matches(max) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_clamp_color4FA",
+            nodeTypeID: 143, // ND_clamp_color4FA
             inputs: [
-                .init(name: "in", dataType: SGDataType.color4f, connection: in1),
-                .init(name: "low", dataType: SGDataType.float, connection: min),
-                .init(name: "high", dataType: SGDataType.float, connection: max),
+                .init(nameID: 42, dataType: SGDataType.color4f, connection: in1),
+                .init(nameID: 65, dataType: SGDataType.float, connection: min),
+                .init(nameID: 41, dataType: SGDataType.float, connection: max),
             ],
             outputs: [.init(dataType: SGDataType.color4f)])))
     }
     if SGDataType.float.matches(in1) && SGDataType.float.matches(min) && SGDataType.float.matches(max) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_clamp_float",
+            nodeTypeID: 144, // ND_clamp_float
             inputs: [
-                .init(name: "in", dataType: SGDataType.float, connection: in1),
-                .init(name: "low", dataType: SGDataType.float, connection: min),
-                .init(name: "high", dataType: SGDataType.float, connection: max),
+                .init(nameID: 42, dataType: SGDataType.float, connection: in1),
+                .init(nameID: 65, dataType: SGDataType.float, connection: min),
+                .init(nameID: 41, dataType: SGDataType.float, connection: max),
             ],
             outputs: [.init(dataType: SGDataType.float)])))
     }
     if SGDataType.half.matches(in1) && SGDataType.half.matches(min) && SGDataType.half.matches(max) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_clamp_half",
+            nodeTypeID: 145, // ND_clamp_half
             inputs: [
-                .init(name: "in", dataType: SGDataType.half, connection: in1),
-                .init(name: "low", dataType: SGDataType.half, connection: min),
-                .init(name: "high", dataType: SGDataType.half, connection: max),
+                .init(nameID: 42, dataType: SGDataType.half, connection: in1),
+                .init(nameID: 65, dataType: SGDataType.half, connection: min),
+                .init(nameID: 41, dataType: SGDataType.half, connection: max),
             ],
             outputs: [.init(dataType: SGDataType.half)])))
     }
     if SGDataType.vector2h.matches(in1) && SGDataType.vector2h.matches(min) && SGDataType.vector2h.matches(max) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_clamp_half2",
+            nodeTypeID: 146, // ND_clamp_half2
             inputs: [
-                .init(name: "in", dataType: SGDataType.vector2h, connection: in1),
-                .init(name: "low", dataType: SGDataType.vector2h, connection: min),
-                .init(name: "high", dataType: SGDataType.vector2h, connection: max),
+                .init(nameID: 42, dataType: SGDataType.vector2h, connection: in1),
+                .init(nameID: 65, dataType: SGDataType.vector2h, connection: min),
+                .init(nameID: 41, dataType: SGDataType.vector2h, connection: max),
             ],
             outputs: [.init(dataType: SGDataType.vector2h)])))
     }
     if SGDataType.vector2h.matches(in1) && SGDataType.float.matches(min) && SGDataType.float.matches(max) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_clamp_half2FA",
+            nodeTypeID: 147, // ND_clamp_half2FA
             inputs: [
-                .init(name: "in", dataType: SGDataType.vector2h, connection: in1),
-                .init(name: "low", dataType: SGDataType.float, connection: min),
-                .init(name: "high", dataType: SGDataType.float, connection: max),
+                .init(nameID: 42, dataType: SGDataType.vector2h, connection: in1),
+                .init(nameID: 65, dataType: SGDataType.float, connection: min),
+                .init(nameID: 41, dataType: SGDataType.float, connection: max),
             ],
             outputs: [.init(dataType: SGDataType.vector2h)])))
     }
     if SGDataType.vector3h.matches(in1) && SGDataType.vector3h.matches(min) && SGDataType.vector3h.matches(max) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_clamp_half3",
+            nodeTypeID: 148, // ND_clamp_half3
             inputs: [
-                .init(name: "in", dataType: SGDataType.vector3h, connection: in1),
-                .init(name: "low", dataType: SGDataType.vector3h, connection: min),
-                .init(name: "high", dataType: SGDataType.vector3h, connection: max),
+                .init(nameID: 42, dataType: SGDataType.vector3h, connection: in1),
+                .init(nameID: 65, dataType: SGDataType.vector3h, connection: min),
+                .init(nameID: 41, dataType: SGDataType.vector3h, connection: max),
             ],
             outputs: [.init(dataType: SGDataType.vector3h)])))
     }
     if SGDataType.vector3h.matches(in1) && SGDataType.float.matches(min) && SGDataType.float.matches(max) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_clamp_half3FA",
+            nodeTypeID: 149, // ND_clamp_half3FA
             inputs: [
-                .init(name: "in", dataType: SGDataType.vector3h, connection: in1),
-                .init(name: "low", dataType: SGDataType.float, connection: min),
-                .init(name: "high", dataType: SGDataType.float, connection: max),
+                .init(nameID: 42, dataType: SGDataType.vector3h, connection: in1),
+                .init(nameID: 65, dataType: SGDataType.float, connection: min),
+                .init(nameID: 41, dataType: SGDataType.float, connection: max),
             ],
             outputs: [.init(dataType: SGDataType.vector3h)])))
     }
     if SGDataType.vector4h.matches(in1) && SGDataType.vector4h.matches(min) && SGDataType.vector4h.matches(max) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_clamp_half4",
+            nodeTypeID: 150, // ND_clamp_half4
             inputs: [
-                .init(name: "in", dataType: SGDataType.vector4h, connection: in1),
-                .init(name: "low", dataType: SGDataType.vector4h, connection: min),
-                .init(name: "high", dataType: SGDataType.vector4h, connection: max),
+                .init(nameID: 42, dataType: SGDataType.vector4h, connection: in1),
+                .init(nameID: 65, dataType: SGDataType.vector4h, connection: min),
+                .init(nameID: 41, dataType: SGDataType.vector4h, connection: max),
             ],
             outputs: [.init(dataType: SGDataType.vector4h)])))
     }
     if SGDataType.vector4h.matches(in1) && SGDataType.float.matches(min) && SGDataType.float.matches(max) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_clamp_half4FA",
+            nodeTypeID: 151, // ND_clamp_half4FA
             inputs: [
-                .init(name: "in", dataType: SGDataType.vector4h, connection: in1),
-                .init(name: "low", dataType: SGDataType.float, connection: min),
-                .init(name: "high", dataType: SGDataType.float, connection: max),
+                .init(nameID: 42, dataType: SGDataType.vector4h, connection: in1),
+                .init(nameID: 65, dataType: SGDataType.float, connection: min),
+                .init(nameID: 41, dataType: SGDataType.float, connection: max),
             ],
             outputs: [.init(dataType: SGDataType.vector4h)])))
     }
     if SGDataType.vector2f.matches(in1) && SGDataType.vector2f.matches(min) && SGDataType.vector2f.matches(max) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_clamp_vector2",
+            nodeTypeID: 152, // ND_clamp_vector2
             inputs: [
-                .init(name: "in", dataType: SGDataType.vector2f, connection: in1),
-                .init(name: "low", dataType: SGDataType.vector2f, connection: min),
-                .init(name: "high", dataType: SGDataType.vector2f, connection: max),
+                .init(nameID: 42, dataType: SGDataType.vector2f, connection: in1),
+                .init(nameID: 65, dataType: SGDataType.vector2f, connection: min),
+                .init(nameID: 41, dataType: SGDataType.vector2f, connection: max),
             ],
             outputs: [.init(dataType: SGDataType.vector2f)])))
     }
     if SGDataType.vector2f.matches(in1) && SGDataType.float.matches(min) && SGDataType.float.matches(max) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_clamp_vector2FA",
+            nodeTypeID: 153, // ND_clamp_vector2FA
             inputs: [
-                .init(name: "in", dataType: SGDataType.vector2f, connection: in1),
-                .init(name: "low", dataType: SGDataType.float, connection: min),
-                .init(name: "high", dataType: SGDataType.float, connection: max),
+                .init(nameID: 42, dataType: SGDataType.vector2f, connection: in1),
+                .init(nameID: 65, dataType: SGDataType.float, connection: min),
+                .init(nameID: 41, dataType: SGDataType.float, connection: max),
             ],
             outputs: [.init(dataType: SGDataType.vector2f)])))
     }
     if SGDataType.vector3f.matches(in1) && SGDataType.vector3f.matches(min) && SGDataType.vector3f.matches(max) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_clamp_vector3",
+            nodeTypeID: 154, // ND_clamp_vector3
             inputs: [
-                .init(name: "in", dataType: SGDataType.vector3f, connection: in1),
-                .init(name: "low", dataType: SGDataType.vector3f, connection: min),
-                .init(name: "high", dataType: SGDataType.vector3f, connection: max),
+                .init(nameID: 42, dataType: SGDataType.vector3f, connection: in1),
+                .init(nameID: 65, dataType: SGDataType.vector3f, connection: min),
+                .init(nameID: 41, dataType: SGDataType.vector3f, connection: max),
             ],
             outputs: [.init(dataType: SGDataType.vector3f)])))
     }
     if SGDataType.vector3f.matches(in1) && SGDataType.float.matches(min) && SGDataType.float.matches(max) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_clamp_vector3FA",
+            nodeTypeID: 155, // ND_clamp_vector3FA
             inputs: [
-                .init(name: "in", dataType: SGDataType.vector3f, connection: in1),
-                .init(name: "low", dataType: SGDataType.float, connection: min),
-                .init(name: "high", dataType: SGDataType.float, connection: max),
+                .init(nameID: 42, dataType: SGDataType.vector3f, connection: in1),
+                .init(nameID: 65, dataType: SGDataType.float, connection: min),
+                .init(nameID: 41, dataType: SGDataType.float, connection: max),
             ],
             outputs: [.init(dataType: SGDataType.vector3f)])))
     }
     if SGDataType.vector4f.matches(in1) && SGDataType.vector4f.matches(min) && SGDataType.vector4f.matches(max) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_clamp_vector4",
+            nodeTypeID: 156, // ND_clamp_vector4
             inputs: [
-                .init(name: "in", dataType: SGDataType.vector4f, connection: in1),
-                .init(name: "low", dataType: SGDataType.vector4f, connection: min),
-                .init(name: "high", dataType: SGDataType.vector4f, connection: max),
+                .init(nameID: 42, dataType: SGDataType.vector4f, connection: in1),
+                .init(nameID: 65, dataType: SGDataType.vector4f, connection: min),
+                .init(nameID: 41, dataType: SGDataType.vector4f, connection: max),
             ],
             outputs: [.init(dataType: SGDataType.vector4f)])))
     }
     if SGDataType.vector4f.matches(in1) && SGDataType.float.matches(min) && SGDataType.float.matches(max) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_clamp_vector4FA",
+            nodeTypeID: 157, // ND_clamp_vector4FA
             inputs: [
-                .init(name: "in", dataType: SGDataType.vector4f, connection: in1),
-                .init(name: "low", dataType: SGDataType.float, connection: min),
-                .init(name: "high", dataType: SGDataType.float, connection: max),
+                .init(nameID: 42, dataType: SGDataType.vector4f, connection: in1),
+                .init(nameID: 65, dataType: SGDataType.float, connection: min),
+                .init(nameID: 41, dataType: SGDataType.float, connection: max),
             ],
             outputs: [.init(dataType: SGDataType.vector4f)])))
     }
@@ -914,111 +914,111 @@ public func clamp<T>(_ in1: T, min: SGNumeric, max: SGNumeric) -> T where T: SGN
 public func contrast<T>(_ in1: T, amount: SGNumeric, pivot: SGNumeric) -> T where T: SGNumeric {
     if SGDataType.color3f.matches(in1) && SGDataType.color3f.matches(amount) && SGDataType.color3f.matches(pivot) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_contrast_color3",
+            nodeTypeID: 190, // ND_contrast_color3
             inputs: [
-                .init(name: "in", dataType: SGDataType.color3f, connection: in1),
-                .init(name: "amount", dataType: SGDataType.color3f, connection: amount),
-                .init(name: "pivot", dataType: SGDataType.color3f, connection: pivot),
+                .init(nameID: 42, dataType: SGDataType.color3f, connection: in1),
+                .init(nameID: 1, dataType: SGDataType.color3f, connection: amount),
+                .init(nameID: 89, dataType: SGDataType.color3f, connection: pivot),
             ],
             outputs: [.init(dataType: SGDataType.color3f)])))
     }
     if SGDataType.color3f.matches(in1) && SGDataType.float.matches(amount) && SGDataType.float.matches(pivot) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_contrast_color3FA",
+            nodeTypeID: 191, // ND_contrast_color3FA
             inputs: [
-                .init(name: "in", dataType: SGDataType.color3f, connection: in1),
-                .init(name: "amount", dataType: SGDataType.float, connection: amount),
-                .init(name: "pivot", dataType: SGDataType.float, connection: pivot),
+                .init(nameID: 42, dataType: SGDataType.color3f, connection: in1),
+                .init(nameID: 1, dataType: SGDataType.float, connection: amount),
+                .init(nameID: 89, dataType: SGDataType.float, connection: pivot),
             ],
             outputs: [.init(dataType: SGDataType.color3f)])))
     }
     if SGDataType.color4f.matches(in1) && SGDataType.color4f.matches(amount) && SGDataType.color4f.matches(pivot) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_contrast_color4",
+            nodeTypeID: 192, // ND_contrast_color4
             inputs: [
-                .init(name: "in", dataType: SGDataType.color4f, connection: in1),
-                .init(name: "amount", dataType: SGDataType.color4f, connection: amount),
-                .init(name: "pivot", dataType: SGDataType.color4f, connection: pivot),
+                .init(nameID: 42, dataType: SGDataType.color4f, connection: in1),
+                .init(nameID: 1, dataType: SGDataType.color4f, connection: amount),
+                .init(nameID: 89, dataType: SGDataType.color4f, connection: pivot),
             ],
             outputs: [.init(dataType: SGDataType.color4f)])))
     }
     if SGDataType.color4f.matches(in1) && SGDataType.float.matches(amount) && SGDataType.float.matches(pivot) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_contrast_color4FA",
+            nodeTypeID: 193, // ND_contrast_color4FA
             inputs: [
-                .init(name: "in", dataType: SGDataType.color4f, connection: in1),
-                .init(name: "amount", dataType: SGDataType.float, connection: amount),
-                .init(name: "pivot", dataType: SGDataType.float, connection: pivot),
+                .init(nameID: 42, dataType: SGDataType.color4f, connection: in1),
+                .init(nameID: 1, dataType: SGDataType.float, connection: amount),
+                .init(nameID: 89, dataType: SGDataType.float, connection: pivot),
             ],
             outputs: [.init(dataType: SGDataType.color4f)])))
     }
     if SGDataType.float.matches(in1) && SGDataType.float.matches(amount) && SGDataType.float.matches(pivot) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_contrast_float",
+            nodeTypeID: 194, // ND_contrast_float
             inputs: [
-                .init(name: "in", dataType: SGDataType.float, connection: in1),
-                .init(name: "amount", dataType: SGDataType.float, connection: amount),
-                .init(name: "pivot", dataType: SGDataType.float, connection: pivot),
+                .init(nameID: 42, dataType: SGDataType.float, connection: in1),
+                .init(nameID: 1, dataType: SGDataType.float, connection: amount),
+                .init(nameID: 89, dataType: SGDataType.float, connection: pivot),
             ],
             outputs: [.init(dataType: SGDataType.float)])))
     }
     if SGDataType.vector2f.matches(in1) && SGDataType.vector2f.matches(amount) && SGDataType.vector2f.matches(pivot) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_contrast_vector2",
+            nodeTypeID: 195, // ND_contrast_vector2
             inputs: [
-                .init(name: "in", dataType: SGDataType.vector2f, connection: in1),
-                .init(name: "amount", dataType: SGDataType.vector2f, connection: amount),
-                .init(name: "pivot", dataType: SGDataType.vector2f, connection: pivot),
+                .init(nameID: 42, dataType: SGDataType.vector2f, connection: in1),
+                .init(nameID: 1, dataType: SGDataType.vector2f, connection: amount),
+                .init(nameID: 89, dataType: SGDataType.vector2f, connection: pivot),
             ],
             outputs: [.init(dataType: SGDataType.vector2f)])))
     }
     if SGDataType.vector2f.matches(in1) && SGDataType.float.matches(amount) && SGDataType.float.matches(pivot) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_contrast_vector2FA",
+            nodeTypeID: 196, // ND_contrast_vector2FA
             inputs: [
-                .init(name: "in", dataType: SGDataType.vector2f, connection: in1),
-                .init(name: "amount", dataType: SGDataType.float, connection: amount),
-                .init(name: "pivot", dataType: SGDataType.float, connection: pivot),
+                .init(nameID: 42, dataType: SGDataType.vector2f, connection: in1),
+                .init(nameID: 1, dataType: SGDataType.float, connection: amount),
+                .init(nameID: 89, dataType: SGDataType.float, connection: pivot),
             ],
             outputs: [.init(dataType: SGDataType.vector2f)])))
     }
     if SGDataType.vector3f.matches(in1) && SGDataType.vector3f.matches(amount) && SGDataType.vector3f.matches(pivot) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_contrast_vector3",
+            nodeTypeID: 197, // ND_contrast_vector3
             inputs: [
-                .init(name: "in", dataType: SGDataType.vector3f, connection: in1),
-                .init(name: "amount", dataType: SGDataType.vector3f, connection: amount),
-                .init(name: "pivot", dataType: SGDataType.vector3f, connection: pivot),
+                .init(nameID: 42, dataType: SGDataType.vector3f, connection: in1),
+                .init(nameID: 1, dataType: SGDataType.vector3f, connection: amount),
+                .init(nameID: 89, dataType: SGDataType.vector3f, connection: pivot),
             ],
             outputs: [.init(dataType: SGDataType.vector3f)])))
     }
     if SGDataType.vector3f.matches(in1) && SGDataType.float.matches(amount) && SGDataType.float.matches(pivot) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_contrast_vector3FA",
+            nodeTypeID: 198, // ND_contrast_vector3FA
             inputs: [
-                .init(name: "in", dataType: SGDataType.vector3f, connection: in1),
-                .init(name: "amount", dataType: SGDataType.float, connection: amount),
-                .init(name: "pivot", dataType: SGDataType.float, connection: pivot),
+                .init(nameID: 42, dataType: SGDataType.vector3f, connection: in1),
+                .init(nameID: 1, dataType: SGDataType.float, connection: amount),
+                .init(nameID: 89, dataType: SGDataType.float, connection: pivot),
             ],
             outputs: [.init(dataType: SGDataType.vector3f)])))
     }
     if SGDataType.vector4f.matches(in1) && SGDataType.vector4f.matches(amount) && SGDataType.vector4f.matches(pivot) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_contrast_vector4",
+            nodeTypeID: 199, // ND_contrast_vector4
             inputs: [
-                .init(name: "in", dataType: SGDataType.vector4f, connection: in1),
-                .init(name: "amount", dataType: SGDataType.vector4f, connection: amount),
-                .init(name: "pivot", dataType: SGDataType.vector4f, connection: pivot),
+                .init(nameID: 42, dataType: SGDataType.vector4f, connection: in1),
+                .init(nameID: 1, dataType: SGDataType.vector4f, connection: amount),
+                .init(nameID: 89, dataType: SGDataType.vector4f, connection: pivot),
             ],
             outputs: [.init(dataType: SGDataType.vector4f)])))
     }
     if SGDataType.vector4f.matches(in1) && SGDataType.float.matches(amount) && SGDataType.float.matches(pivot) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_contrast_vector4FA",
+            nodeTypeID: 200, // ND_contrast_vector4FA
             inputs: [
-                .init(name: "in", dataType: SGDataType.vector4f, connection: in1),
-                .init(name: "amount", dataType: SGDataType.float, connection: amount),
-                .init(name: "pivot", dataType: SGDataType.float, connection: pivot),
+                .init(nameID: 42, dataType: SGDataType.vector4f, connection: in1),
+                .init(nameID: 1, dataType: SGDataType.float, connection: amount),
+                .init(nameID: 89, dataType: SGDataType.float, connection: pivot),
             ],
             outputs: [.init(dataType: SGDataType.vector4f)])))
     }
@@ -1028,65 +1028,65 @@ public func contrast<T>(_ in1: T, amount: SGNumeric, pivot: SGNumeric) -> T wher
 public func cos<T>(_ in1: T) -> T where T: SGNumeric {
     if SGDataType.float.matches(in1) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_cos_float",
+            nodeTypeID: 236, // ND_cos_float
             inputs: [
-                .init(name: "in", dataType: SGDataType.float, connection: in1),
+                .init(nameID: 42, dataType: SGDataType.float, connection: in1),
             ],
             outputs: [.init(dataType: SGDataType.float)])))
     }
     if SGDataType.half.matches(in1) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_cos_half",
+            nodeTypeID: 237, // ND_cos_half
             inputs: [
-                .init(name: "in", dataType: SGDataType.half, connection: in1),
+                .init(nameID: 42, dataType: SGDataType.half, connection: in1),
             ],
             outputs: [.init(dataType: SGDataType.half)])))
     }
     if SGDataType.vector2h.matches(in1) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_cos_half2",
+            nodeTypeID: 238, // ND_cos_half2
             inputs: [
-                .init(name: "in", dataType: SGDataType.vector2h, connection: in1),
+                .init(nameID: 42, dataType: SGDataType.vector2h, connection: in1),
             ],
             outputs: [.init(dataType: SGDataType.vector2h)])))
     }
     if SGDataType.vector3h.matches(in1) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_cos_half3",
+            nodeTypeID: 239, // ND_cos_half3
             inputs: [
-                .init(name: "in", dataType: SGDataType.vector3h, connection: in1),
+                .init(nameID: 42, dataType: SGDataType.vector3h, connection: in1),
             ],
             outputs: [.init(dataType: SGDataType.vector3h)])))
     }
     if SGDataType.vector4h.matches(in1) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_cos_half4",
+            nodeTypeID: 240, // ND_cos_half4
             inputs: [
-                .init(name: "in", dataType: SGDataType.vector4h, connection: in1),
+                .init(nameID: 42, dataType: SGDataType.vector4h, connection: in1),
             ],
             outputs: [.init(dataType: SGDataType.vector4h)])))
     }
     if SGDataType.vector2f.matches(in1) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_cos_vector2",
+            nodeTypeID: 241, // ND_cos_vector2
             inputs: [
-                .init(name: "in", dataType: SGDataType.vector2f, connection: in1),
+                .init(nameID: 42, dataType: SGDataType.vector2f, connection: in1),
             ],
             outputs: [.init(dataType: SGDataType.vector2f)])))
     }
     if SGDataType.vector3f.matches(in1) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_cos_vector3",
+            nodeTypeID: 242, // ND_cos_vector3
             inputs: [
-                .init(name: "in", dataType: SGDataType.vector3f, connection: in1),
+                .init(nameID: 42, dataType: SGDataType.vector3f, connection: in1),
             ],
             outputs: [.init(dataType: SGDataType.vector3f)])))
     }
     if SGDataType.vector4f.matches(in1) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_cos_vector4",
+            nodeTypeID: 243, // ND_cos_vector4
             inputs: [
-                .init(name: "in", dataType: SGDataType.vector4f, connection: in1),
+                .init(nameID: 42, dataType: SGDataType.vector4f, connection: in1),
             ],
             outputs: [.init(dataType: SGDataType.vector4f)])))
     }
@@ -1096,19 +1096,19 @@ public func cos<T>(_ in1: T) -> T where T: SGNumeric {
 public func cross(_ in1: SGVector, _ in2: SGVector) -> SGVector {
     if SGDataType.vector3h.matches(in1) && SGDataType.vector3h.matches(in2) {
         return SGVector(source: .nodeOutput(SGNode(
-            nodeType: "ND_crossproduct_half3",
+            nodeTypeID: 244, // ND_crossproduct_half3
             inputs: [
-                .init(name: "in1", dataType: SGDataType.vector3h, connection: in1),
-                .init(name: "in2", dataType: SGDataType.vector3h, connection: in2),
+                .init(nameID: 43, dataType: SGDataType.vector3h, connection: in1),
+                .init(nameID: 45, dataType: SGDataType.vector3h, connection: in2),
             ],
             outputs: [.init(dataType: SGDataType.vector3h)])))
     }
     if SGDataType.vector3f.matches(in1) && SGDataType.vector3f.matches(in2) {
         return SGVector(source: .nodeOutput(SGNode(
-            nodeType: "ND_crossproduct_vector3",
+            nodeTypeID: 245, // ND_crossproduct_vector3
             inputs: [
-                .init(name: "in1", dataType: SGDataType.vector3f, connection: in1),
-                .init(name: "in2", dataType: SGDataType.vector3f, connection: in2),
+                .init(nameID: 43, dataType: SGDataType.vector3f, connection: in1),
+                .init(nameID: 45, dataType: SGDataType.vector3f, connection: in2),
             ],
             outputs: [.init(dataType: SGDataType.vector3f)])))
     }
@@ -1118,25 +1118,25 @@ public func cross(_ in1: SGVector, _ in2: SGVector) -> SGVector {
 public func determinant(_ in1: SGMatrix) -> SGScalar {
     if SGDataType.matrix2d.matches(in1) {
         return SGScalar(source: .nodeOutput(SGNode(
-            nodeType: "ND_determinant_matrix22",
+            nodeTypeID: 258, // ND_determinant_matrix22
             inputs: [
-                .init(name: "in", dataType: SGDataType.matrix2d, connection: in1),
+                .init(nameID: 42, dataType: SGDataType.matrix2d, connection: in1),
             ],
             outputs: [.init(dataType: SGDataType.float)])))
     }
     if SGDataType.matrix3d.matches(in1) {
         return SGScalar(source: .nodeOutput(SGNode(
-            nodeType: "ND_determinant_matrix33",
+            nodeTypeID: 259, // ND_determinant_matrix33
             inputs: [
-                .init(name: "in", dataType: SGDataType.matrix3d, connection: in1),
+                .init(nameID: 42, dataType: SGDataType.matrix3d, connection: in1),
             ],
             outputs: [.init(dataType: SGDataType.float)])))
     }
     if SGDataType.matrix4d.matches(in1) {
         return SGScalar(source: .nodeOutput(SGNode(
-            nodeType: "ND_determinant_matrix44",
+            nodeTypeID: 260, // ND_determinant_matrix44
             inputs: [
-                .init(name: "in", dataType: SGDataType.matrix4d, connection: in1),
+                .init(nameID: 42, dataType: SGDataType.matrix4d, connection: in1),
             ],
             outputs: [.init(dataType: SGDataType.float)])))
     }
@@ -1146,41 +1146,41 @@ public func determinant(_ in1: SGMatrix) -> SGScalar {
 public func difference<T>(fg: T, bg: T, mix: SGScalar? = nil) -> T where T: SGNumeric {
     if SGDataType.color3f.matches(fg) && SGDataType.color3f.matches(bg) && SGDataType.float.matches(mix) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_difference_color3",
+            nodeTypeID: 261, // ND_difference_color3
             inputs: [
-                .init(name: "fg", dataType: SGDataType.color3f, connection: fg),
-                .init(name: "bg", dataType: SGDataType.color3f, connection: bg),
-                .init(name: "mix", dataType: SGDataType.float, connection: mix),
+                .init(nameID: 26, dataType: SGDataType.color3f, connection: fg),
+                .init(nameID: 6, dataType: SGDataType.color3f, connection: bg),
+                .init(nameID: 77, dataType: SGDataType.float, connection: mix),
             ],
             outputs: [.init(dataType: SGDataType.color3f)])))
     }
     if SGDataType.color4f.matches(fg) && SGDataType.color4f.matches(bg) && SGDataType.float.matches(mix) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_difference_color4",
+            nodeTypeID: 262, // ND_difference_color4
             inputs: [
-                .init(name: "fg", dataType: SGDataType.color4f, connection: fg),
-                .init(name: "bg", dataType: SGDataType.color4f, connection: bg),
-                .init(name: "mix", dataType: SGDataType.float, connection: mix),
+                .init(nameID: 26, dataType: SGDataType.color4f, connection: fg),
+                .init(nameID: 6, dataType: SGDataType.color4f, connection: bg),
+                .init(nameID: 77, dataType: SGDataType.float, connection: mix),
             ],
             outputs: [.init(dataType: SGDataType.color4f)])))
     }
     if SGDataType.float.matches(fg) && SGDataType.float.matches(bg) && SGDataType.float.matches(mix) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_difference_float",
+            nodeTypeID: 263, // ND_difference_float
             inputs: [
-                .init(name: "fg", dataType: SGDataType.float, connection: fg),
-                .init(name: "bg", dataType: SGDataType.float, connection: bg),
-                .init(name: "mix", dataType: SGDataType.float, connection: mix),
+                .init(nameID: 26, dataType: SGDataType.float, connection: fg),
+                .init(nameID: 6, dataType: SGDataType.float, connection: bg),
+                .init(nameID: 77, dataType: SGDataType.float, connection: mix),
             ],
             outputs: [.init(dataType: SGDataType.float)])))
     }
     if SGDataType.half.matches(fg) && SGDataType.half.matches(bg) && SGDataType.half.matches(mix) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_difference_half",
+            nodeTypeID: 264, // ND_difference_half
             inputs: [
-                .init(name: "fg", dataType: SGDataType.half, connection: fg),
-                .init(name: "bg", dataType: SGDataType.half, connection: bg),
-                .init(name: "mix", dataType: SGDataType.half, connection: mix),
+                .init(nameID: 26, dataType: SGDataType.half, connection: fg),
+                .init(nameID: 6, dataType: SGDataType.half, connection: bg),
+                .init(nameID: 77, dataType: SGDataType.half, connection: mix),
             ],
             outputs: [.init(dataType: SGDataType.half)])))
     }
@@ -1198,11 +1198,11 @@ public func disjointover(fg: SGColor? = nil, bg: SGColor? = nil, mix: SGScalar?
         return SGColor(source: .error("Invalid disjointover input. Expected mix data type to be SGDataType.float, but got \(mix?.dataType.rawValue ?? "nil").", values: [mix]))
     }
     return SGColor(source: .nodeOutput(SGNode(
-        nodeType: "ND_disjointover_color4",
+        nodeTypeID: 265, // ND_disjointover_color4
         inputs: [
-            .init(name: "fg", dataType: SGDataType.color4f, connection: fg),
-            .init(name: "bg", dataType: SGDataType.color4f, connection: bg),
-            .init(name: "mix", dataType: SGDataType.float, connection: mix),
+            .init(nameID: 26, dataType: SGDataType.color4f, connection: fg),
+            .init(nameID: 6, dataType: SGDataType.color4f, connection: bg),
+            .init(nameID: 77, dataType: SGDataType.float, connection: mix),
         ],
         outputs: [.init(dataType: SGDataType.color4f)])))
 }
@@ -1210,136 +1210,136 @@ public func disjointover(fg: SGColor? = nil, bg: SGColor? = nil, mix: SGScalar?
 public func divide<T>(_ in1: T, _ in2: SGNumeric) -> T where T: SGNumeric {
     if SGDataType.color3f.matches(in1) && SGDataType.color3f.matches(in2) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_divide_color3",
+            nodeTypeID: 266, // ND_divide_color3
             inputs: [
-                .init(name: "in1", dataType: SGDataType.color3f, connection: in1),
-                .init(name: "in2", dataType: SGDataType.color3f, connection: in2),
+                .init(nameID: 43, dataType: SGDataType.color3f, connection: in1),
+                .init(nameID: 45, dataType: SGDataType.color3f, connection: in2),
             ],
             outputs: [.init(dataType: SGDataType.color3f)])))
     }
     if SGDataType.color3f.matches(in1) && SGDataType.float.matches(in2) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_divide_color3FA",
+            nodeTypeID: 267, // ND_divide_color3FA
             inputs: [
-                .init(name: "in1", dataType: SGDataType.color3f, connection: in1),
-                .init(name: "in2", dataType: SGDataType.float, connection: in2),
+                .init(nameID: 43, dataType: SGDataType.color3f, connection: in1),
+                .init(nameID: 45, dataType: SGDataType.float, connection: in2),
             ],
             outputs: [.init(dataType: SGDataType.color3f)])))
     }
     if SGDataType.color4f.matches(in1) && SGDataType.color4f.matches(in2) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_divide_color4",
+            nodeTypeID: 268, // ND_divide_color4
             inputs: [
-                .init(name: "in1", dataType: SGDataType.color4f, connection: in1),
-                .init(name: "in2", dataType: SGDataType.color4f, connection: in2),
+                .init(nameID: 43, dataType: SGDataType.color4f, connection: in1),
+                .init(nameID: 45, dataType: SGDataType.color4f, connection: in2),
             ],
             outputs: [.init(dataType: SGDataType.color4f)])))
     }
     if SGDataType.color4f.matches(in1) && SGDataType.float.matches(in2) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_divide_color4FA",
+            nodeTypeID: 269, // ND_divide_color4FA
             inputs: [
-                .init(name: "in1", dataType: SGDataType.color4f, connection: in1),
-                .init(name: "in2", dataType: SGDataType.float, connection: in2),
+                .init(nameID: 43, dataType: SGDataType.color4f, connection: in1),
+                .init(nameID: 45, dataType: SGDataType.float, connection: in2),
             ],
             outputs: [.init(dataType: SGDataType.color4f)])))
     }
     if SGDataType.float.matches(in1) && SGDataType.float.matches(in2) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_divide_float",
+            nodeTypeID: 270, // ND_divide_float
             inputs: [
-                .init(name: "in1", dataType: SGDataType.float, connection: in1),
-                .init(name: "in2", dataType: SGDataType.float, connection: in2),
+                .init(nameID: 43, dataType: SGDataType.float, connection: in1),
+                .init(nameID: 45, dataType: SGDataType.float, connection: in2),
             ],
             outputs: [.init(dataType: SGDataType.float)])))
     }
     if SGDataType.half.matches(in1) && SGDataType.half.matches(in2) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_divide_half",
+            nodeTypeID: 271, // ND_divide_half
             inputs: [
-                .init(name: "in1", dataType: SGDataType.half, connection: in1),
-                .init(name: "in2", dataType: SGDataType.half, connection: in2),
+                .init(nameID: 43, dataType: SGDataType.half, connection: in1),
+                .init(nameID: 45, dataType: SGDataType.half, connection: in2),
             ],
             outputs: [.init(dataType: SGDataType.half)])))
     }
     if SGDataType.matrix2d.matches(in1) && SGDataType.matrix2d.matches(in2) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_divide_matrix22",
+            nodeTypeID: 272, // ND_divide_matrix22
             inputs: [
-                .init(name: "in1", dataType: SGDataType.matrix2d, connection: in1),
-                .init(name: "in2", dataType: SGDataType.matrix2d, connection: in2),
+                .init(nameID: 43, dataType: SGDataType.matrix2d, connection: in1),
+                .init(nameID: 45, dataType: SGDataType.matrix2d, connection: in2),
             ],
             outputs: [.init(dataType: SGDataType.matrix2d)])))
     }
     if SGDataType.matrix3d.matches(in1) && SGDataType.matrix3d.matches(in2) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_divide_matrix33",
+            nodeTypeID: 273, // ND_divide_matrix33
             inputs: [
-                .init(name: "in1", dataType: SGDataType.matrix3d, connection: in1),
-                .init(name: "in2", dataType: SGDataType.matrix3d, connection: in2),
+                .init(nameID: 43, dataType: SGDataType.matrix3d, connection: in1),
+                .init(nameID: 45, dataType: SGDataType.matrix3d, connection: in2),
             ],
             outputs: [.init(dataType: SGDataType.matrix3d)])))
     }
     if SGDataType.matrix4d.matches(in1) && SGDataType.matrix4d.matches(in2) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_divide_matrix44",
+            nodeTypeID: 274, // ND_divide_matrix44
             inputs: [
-                .init(name: "in1", dataType: SGDataType.matrix4d, connection: in1),
-                .init(name: "in2", dataType: SGDataType.matrix4d, connection: in2),
+                .init(nameID: 43, dataType: SGDataType.matrix4d, connection: in1),
+                .init(nameID: 45, dataType: SGDataType.matrix4d, connection: in2),
             ],
             outputs: [.init(dataType: SGDataType.matrix4d)])))
     }
     if SGDataType.vector2f.matches(in1) && SGDataType.vector2f.matches(in2) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_divide_vector2",
+            nodeTypeID: 275, // ND_divide_vector2
             inputs: [
-                .init(name: "in1", dataType: SGDataType.vector2f, connection: in1),
-                .init(name: "in2", dataType: SGDataType.vector2f, connection: in2),
+                .init(nameID: 43, dataType: SGDataType.vector2f, connection: in1),
+                .init(nameID: 45, dataType: SGDataType.vector2f, connection: in2),
             ],
             outputs: [.init(dataType: SGDataType.vector2f)])))
     }
     if SGDataType.vector2f.matches(in1) && SGDataType.float.matches(in2) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_divide_vector2FA",
+            nodeTypeID: 276, // ND_divide_vector2FA
             inputs: [
-                .init(name: "in1", dataType: SGDataType.vector2f, connection: in1),
-                .init(name: "in2", dataType: SGDataType.float, connection: in2),
+                .init(nameID: 43, dataType: SGDataType.vector2f, connection: in1),
+                .init(nameID: 45, dataType: SGDataType.float, connection: in2),
             ],
             outputs: [.init(dataType: SGDataType.vector2f)])))
     }
     if SGDataType.vector3f.matches(in1) && SGDataType.vector3f.matches(in2) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_divide_vector3",
+            nodeTypeID: 277, // ND_divide_vector3
             inputs: [
-                .init(name: "in1", dataType: SGDataType.vector3f, connection: in1),
-                .init(name: "in2", dataType: SGDataType.vector3f, connection: in2),
+                .init(nameID: 43, dataType: SGDataType.vector3f, connection: in1),
+                .init(nameID: 45, dataType: SGDataType.vector3f, connection: in2),
             ],
             outputs: [.init(dataType: SGDataType.vector3f)])))
     }
     if SGDataType.vector3f.matches(in1) && SGDataType.float.matches(in2) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_divide_vector3FA",
+            nodeTypeID: 278, // ND_divide_vector3FA
             inputs: [
-                .init(name: "in1", dataType: SGDataType.vector3f, connection: in1),
-                .init(name: "in2", dataType: SGDataType.float, connection: in2),
+                .init(nameID: 43, dataType: SGDataType.vector3f, connection: in1),
+                .init(nameID: 45, dataType: SGDataType.float, connection: in2),
             ],
             outputs: [.init(dataType: SGDataType.vector3f)])))
     }
     if SGDataType.vector4f.matches(in1) && SGDataType.vector4f.matches(in2) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_divide_vector4",
+            nodeTypeID: 279, // ND_divide_vector4
             inputs: [
-                .init(name: "in1", dataType: SGDataType.vector4f, connection: in1),
-                .init(name: "in2", dataType: SGDataType.vector4f, connection: in2),
+                .init(nameID: 43, dataType: SGDataType.vector4f, connection: in1),
+                .init(nameID: 45, dataType: SGDataType.vector4f, connection: in2),
             ],
             outputs: [.init(dataType: SGDataType.vector4f)])))
     }
     if SGDataType.vector4f.matches(in1) && SGDataType.float.matches(in2) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_divide_vector4FA",
+            nodeTypeID: 280, // ND_divide_vector4FA
             inputs: [
-                .init(name: "in1", dataType: SGDataType.vector4f, connection: in1),
-                .init(name: "in2", dataType: SGDataType.float, connection: in2),
+                .init(nameID: 43, dataType: SGDataType.vector4f, connection: in1),
+                .init(nameID: 45, dataType: SGDataType.float, connection: in2),
             ],
             outputs: [.init(dataType: SGDataType.vector4f)])))
     }
@@ -1349,41 +1349,41 @@ public func divide<T>(_ in1: T, _ in2: SGNumeric) -> T where T: SGNumeric {
 public func dodge<T>(fg: T, bg: T, mix: SGScalar? = nil) -> T where T: SGNumeric {
     if SGDataType.color3f.matches(fg) && SGDataType.color3f.matches(bg) && SGDataType.float.matches(mix) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_dodge_color3",
+            nodeTypeID: 281, // ND_dodge_color3
             inputs: [
-                .init(name: "fg", dataType: SGDataType.color3f, connection: fg),
-                .init(name: "bg", dataType: SGDataType.color3f, connection: bg),
-                .init(name: "mix", dataType: SGDataType.float, connection: mix),
+                .init(nameID: 26, dataType: SGDataType.color3f, connection: fg),
+                .init(nameID: 6, dataType: SGDataType.color3f, connection: bg),
+                .init(nameID: 77, dataType: SGDataType.float, connection: mix),
             ],
             outputs: [.init(dataType: SGDataType.color3f)])))
     }
     if SGDataType.color4f.matches(fg) && SGDataType.color4f.matches(bg) && SGDataType.float.matches(mix) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_dodge_color4",
+            nodeTypeID: 282, // ND_dodge_color4
             inputs: [
-                .init(name: "fg", dataType: SGDataType.color4f, connection: fg),
-                .init(name: "bg", dataType: SGDataType.color4f, connection: bg),
-                .init(name: "mix", dataType: SGDataType.float, connection: mix),
+                .init(nameID: 26, dataType: SGDataType.color4f, connection: fg),
+                .init(nameID: 6, dataType: SGDataType.color4f, connection: bg),
+                .init(nameID: 77, dataType: SGDataType.float, connection: mix),
             ],
             outputs: [.init(dataType: SGDataType.color4f)])))
     }
     if SGDataType.float.matches(fg) && SGDataType.float.matches(bg) && SGDataType.float.matches(mix) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_dodge_float",
+            nodeTypeID: 283, // ND_dodge_float
             inputs: [
-                .init(name: "fg", dataType: SGDataType.float, connection: fg),
-                .init(name: "bg", dataType: SGDataType.float, connection: bg),
-                .init(name: "mix", dataType: SGDataType.float, connection: mix),
+                .init(nameID: 26, dataType: SGDataType.float, connection: fg),
+                .init(nameID: 6, dataType: SGDataType.float, connection: bg),
+                .init(nameID: 77, dataType: SGDataType.float, connection: mix),
             ],
             outputs: [.init(dataType: SGDataType.float)])))
     }
     if SGDataType.half.matches(fg) && SGDataType.half.matches(bg) && SGDataType.half.matches(mix) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_dodge_half",
+            nodeTypeID: 284, // ND_dodge_half
             inputs: [
-                .init(name: "fg", dataType: SGDataType.half, connection: fg),
-                .init(name: "bg", dataType: SGDataType.half, connection: bg),
-                .init(name: "mix", dataType: SGDataType.half, connection: mix),
+                .init(nameID: 26, dataType: SGDataType.half, connection: fg),
+                .init(nameID: 6, dataType: SGDataType.half, connection: bg),
+                .init(nameID: 77, dataType: SGDataType.half, connection: mix),
             ],
             outputs: [.init(dataType: SGDataType.half)])))
     }
@@ -1393,55 +1393,55 @@ public func dodge<T>(fg: T, bg: T, mix: SGScalar? = nil) -> T where T: SGNumeric
 public func dot(_ in1: SGVector, _ in2: SGVector) -> SGScalar {
     if SGDataType.vector2h.matches(in1) && SGDataType.vector2h.matches(in2) {
         return SGScalar(source: .nodeOutput(SGNode(
-            nodeType: "ND_dotproduct_half2",
+            nodeTypeID: 302, // ND_dotproduct_half2
             inputs: [
-                .init(name: "in1", dataType: SGDataType.vector2h, connection: in1),
-                .init(name: "in2", dataType: SGDataType.vector2h, connection: in2),
+                .init(nameID: 43, dataType: SGDataType.vector2h, connection: in1),
+                .init(nameID: 45, dataType: SGDataType.vector2h, connection: in2),
             ],
             outputs: [.init(dataType: SGDataType.float)])))
     }
     if SGDataType.vector3h.matches(in1) && SGDataType.vector3h.matches(in2) {
         return SGScalar(source: .nodeOutput(SGNode(
-            nodeType: "ND_dotproduct_half3",
+            nodeTypeID: 303, // ND_dotproduct_half3
             inputs: [
-                .init(name: "in1", dataType: SGDataType.vector3h, connection: in1),
-                .init(name: "in2", dataType: SGDataType.vector3h, connection: in2),
+                .init(nameID: 43, dataType: SGDataType.vector3h, connection: in1),
+                .init(nameID: 45, dataType: SGDataType.vector3h, connection: in2),
             ],
             outputs: [.init(dataType: SGDataType.float)])))
     }
     if SGDataType.vector4h.matches(in1) && SGDataType.vector4h.matches(in2) {
         return SGScalar(source: .nodeOutput(SGNode(
-            nodeType: "ND_dotproduct_half4",
+            nodeTypeID: 304, // ND_dotproduct_half4
             inputs: [
-                .init(name: "in1", dataType: SGDataType.vector4h, connection: in1),
-                .init(name: "in2", dataType: SGDataType.vector4h, connection: in2),
+                .init(nameID: 43, dataType: SGDataType.vector4h, connection: in1),
+                .init(nameID: 45, dataType: SGDataType.vector4h, connection: in2),
             ],
             outputs: [.init(dataType: SGDataType.float)])))
     }
     if SGDataType.vector2f.matches(in1) && SGDataType.vector2f.matches(in2) {
         return SGScalar(source: .nodeOutput(SGNode(
-            nodeType: "ND_dotproduct_vector2",
+            nodeTypeID: 305, // ND_dotproduct_vector2
             inputs: [
-                .init(name: "in1", dataType: SGDataType.vector2f, connection: in1),
-                .init(name: "in2", dataType: SGDataType.vector2f, connection: in2),
+                .init(nameID: 43, dataType: SGDataType.vector2f, connection: in1),
+                .init(nameID: 45, dataType: SGDataType.vector2f, connection: in2),
             ],
             outputs: [.init(dataType: SGDataType.float)])))
     }
     if SGDataType.vector3f.matches(in1) && SGDataType.vector3f.matches(in2) {
         return SGScalar(source: .nodeOutput(SGNode(
-            nodeType: "ND_dotproduct_vector3",
+            nodeTypeID: 306, // ND_dotproduct_vector3
             inputs: [
-                .init(name: "in1", dataType: SGDataType.vector3f, connection: in1),
-                .init(name: "in2", dataType: SGDataType.vector3f, connection: in2),
+                .init(nameID: 43, dataType: SGDataType.vector3f, connection: in1),
+                .init(nameID: 45, dataType: SGDataType.vector3f, connection: in2),
             ],
             outputs: [.init(dataType: SGDataType.float)])))
     }
     if SGDataType.vector4f.matches(in1) && SGDataType.vector4f.matches(in2) {
         return SGScalar(source: .nodeOutput(SGNode(
-            nodeType: "ND_dotproduct_vector4",
+            nodeTypeID: 307, // ND_dotproduct_vector4
             inputs: [
-                .init(name: "in1", dataType: SGDataType.vector4f, connection: in1),
-                .init(name: "in2", dataType: SGDataType.vector4f, connection: in2),
+                .init(nameID: 43, dataType: SGDataType.vector4f, connection: in1),
+                .init(nameID: 45, dataType: SGDataType.vector4f, connection: in2),
             ],
             outputs: [.init(dataType: SGDataType.float)])))
     }
@@ -1451,65 +1451,65 @@ public func dot(_ in1: SGVector, _ in2: SGVector) -> SGScalar {
 public func exp<T>(_ in1: T) -> T where T: SGNumeric {
     if SGDataType.float.matches(in1) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_exp_float",
+            nodeTypeID: 308, // ND_exp_float
             inputs: [
-                .init(name: "in", dataType: SGDataType.float, connection: in1),
+                .init(nameID: 42, dataType: SGDataType.float, connection: in1),
             ],
             outputs: [.init(dataType: SGDataType.float)])))
     }
     if SGDataType.half.matches(in1) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_exp_half",
+            nodeTypeID: 309, // ND_exp_half
             inputs: [
-                .init(name: "in", dataType: SGDataType.half, connection: in1),
+                .init(nameID: 42, dataType: SGDataType.half, connection: in1),
             ],
             outputs: [.init(dataType: SGDataType.half)])))
     }
     if SGDataType.vector2h.matches(in1) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_exp_half2",
+            nodeTypeID: 310, // ND_exp_half2
             inputs: [
-                .init(name: "in", dataType: SGDataType.vector2h, connection: in1),
+                .init(nameID: 42, dataType: SGDataType.vector2h, connection: in1),
             ],
             outputs: [.init(dataType: SGDataType.vector2h)])))
     }
     if SGDataType.vector3h.matches(in1) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_exp_half3",
+            nodeTypeID: 311, // ND_exp_half3
             inputs: [
-                .init(name: "in", dataType: SGDataType.vector3h, connection: in1),
+                .init(nameID: 42, dataType: SGDataType.vector3h, connection: in1),
             ],
             outputs: [.init(dataType: SGDataType.vector3h)])))
     }
     if SGDataType.vector4h.matches(in1) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_exp_half4",
+            nodeTypeID: 312, // ND_exp_half4
             inputs: [
-                .init(name: "in", dataType: SGDataType.vector4h, connection: in1),
+                .init(nameID: 42, dataType: SGDataType.vector4h, connection: in1),
             ],
             outputs: [.init(dataType: SGDataType.vector4h)])))
     }
     if SGDataType.vector2f.matches(in1) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_exp_vector2",
+            nodeTypeID: 313, // ND_exp_vector2
             inputs: [
-                .init(name: "in", dataType: SGDataType.vector2f, connection: in1),
+                .init(nameID: 42, dataType: SGDataType.vector2f, connection: in1),
             ],
             outputs: [.init(dataType: SGDataType.vector2f)])))
     }
     if SGDataType.vector3f.matches(in1) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_exp_vector3",
+            nodeTypeID: 314, // ND_exp_vector3
             inputs: [
-                .init(name: "in", dataType: SGDataType.vector3f, connection: in1),
+                .init(nameID: 42, dataType: SGDataType.vector3f, connection: in1),
             ],
             outputs: [.init(dataType: SGDataType.vector3f)])))
     }
     if SGDataType.vector4f.matches(in1) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_exp_vector4",
+            nodeTypeID: 315, // ND_exp_vector4
             inputs: [
-                .init(name: "in", dataType: SGDataType.vector4f, connection: in1),
+                .init(nameID: 42, dataType: SGDataType.vector4f, connection: in1),
             ],
             outputs: [.init(dataType: SGDataType.vector4f)])))
     }
@@ -1519,46 +1519,46 @@ public func exp<T>(_ in1: T) -> T where T: SGNumeric {
 public func extract(_ in1: SGSIMD, index: Int = 0) -> SGScalar {
     if SGDataType.color3f.matches(in1) {
         return SGScalar(source: .nodeOutput(SGNode(
-            nodeType: "ND_extract_color3",
+            nodeTypeID: 316, // ND_extract_color3
             inputs: [
-                .init(name: "in", dataType: SGDataType.color3f, connection: in1),
-                .init(name: "index", dataType: SGDataType.int, connection: SGScalar(source: .constant(.int(index)))),
+                .init(nameID: 42, dataType: SGDataType.color3f, connection: in1),
+                .init(nameID: 53, dataType: SGDataType.int, connection: SGScalar(source: .constant(.int(index)))),
             ],
             outputs: [.init(dataType: SGDataType.float)])))
     }
     if SGDataType.color4f.matches(in1) {
         return SGScalar(source: .nodeOutput(SGNode(
-            nodeType: "ND_extract_color4",
+            nodeTypeID: 317, // ND_extract_color4
             inputs: [
-                .init(name: "in", dataType: SGDataType.color4f, connection: in1),
-                .init(name: "index", dataType: SGDataType.int, connection: SGScalar(source: .constant(.int(index)))),
+                .init(nameID: 42, dataType: SGDataType.color4f, connection: in1),
+                .init(nameID: 53, dataType: SGDataType.int, connection: SGScalar(source: .constant(.int(index)))),
             ],
             outputs: [.init(dataType: SGDataType.float)])))
     }
     if SGDataType.vector2f.matches(in1) {
         return SGScalar(source: .nodeOutput(SGNode(
-            nodeType: "ND_extract_vector2",
+            nodeTypeID: 318, // ND_extract_vector2
             inputs: [
-                .init(name: "in", dataType: SGDataType.vector2f, connection: in1),
-                .init(name: "index", dataType: SGDataType.int, connection: SGScalar(source: .constant(.int(index)))),
+                .init(nameID: 42, dataType: SGDataType.vector2f, connection: in1),
+                .init(nameID: 53, dataType: SGDataType.int, connection: SGScalar(source: .constant(.int(index)))),
             ],
             outputs: [.init(dataType: SGDataType.float)])))
     }
     if SGDataType.vector3f.matches(in1) {
         return SGScalar(source: .nodeOutput(SGNode(
-            nodeType: "ND_extract_vector3",
+            nodeTypeID: 319, // ND_extract_vector3
             inputs: [
-                .init(name: "in", dataType: SGDataType.vector3f, connection: in1),
-                .init(name: "index", dataType: SGDataType.int, connection: SGScalar(source: .constant(.int(index)))),
+                .init(nameID: 42, dataType: SGDataType.vector3f, connection: in1),
+                .init(nameID: 53, dataType: SGDataType.int, connection: SGScalar(source: .constant(.int(index)))),
             ],
             outputs: [.init(dataType: SGDataType.float)])))
     }
     if SGDataType.vector4f.matches(in1) {
         return SGScalar(source: .nodeOutput(SGNode(
-            nodeType: "ND_extract_vector4",
+            nodeTypeID: 320, // ND_extract_vector4
             inputs: [
-                .init(name: "in", dataType: SGDataType.vector4f, connection: in1),
-                .init(name: "index", dataType: SGDataType.int, connection: SGScalar(source: .constant(.int(index)))),
+                .init(nameID: 42, dataType: SGDataType.vector4f, connection: in1),
+                .init(nameID: 53, dataType: SGDataType.int, connection: SGScalar(source: .constant(.int(index)))),
             ],
             outputs: [.init(dataType: SGDataType.float)])))
     }
@@ -1568,57 +1568,57 @@ public func extract(_ in1: SGSIMD, index: Int = 0) -> SGScalar {
 public func floor<T>(_ in1: T) -> T where T: SGNumeric {
     if SGDataType.color3f.matches(in1) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_floor_color3",
+            nodeTypeID: 321, // ND_floor_color3
             inputs: [
-                .init(name: "in", dataType: SGDataType.color3f, connection: in1),
+                .init(nameID: 42, dataType: SGDataType.color3f, connection: in1),
             ],
             outputs: [.init(dataType: SGDataType.color3f)])))
     }
     if SGDataType.color4f.matches(in1) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_floor_color4",
+            nodeTypeID: 322, // ND_floor_color4
             inputs: [
-                .init(name: "in", dataType: SGDataType.color4f, connection: in1),
+                .init(nameID: 42, dataType: SGDataType.color4f, connection: in1),
             ],
             outputs: [.init(dataType: SGDataType.color4f)])))
     }
     if SGDataType.float.matches(in1) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_floor_float",
+            nodeTypeID: 323, // ND_floor_float
             inputs: [
-                .init(name: "in", dataType: SGDataType.float, connection: in1),
+                .init(nameID: 42, dataType: SGDataType.float, connection: in1),
             ],
             outputs: [.init(dataType: SGDataType.float)])))
     }
     if SGDataType.half.matches(in1) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_floor_half",
+            nodeTypeID: 324, // ND_floor_half
             inputs: [
-                .init(name: "in", dataType: SGDataType.half, connection: in1),
+                .init(nameID: 42, dataType: SGDataType.half, connection: in1),
             ],
             outputs: [.init(dataType: SGDataType.half)])))
     }
     if SGDataType.vector2f.matches(in1) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_floor_vector2",
+            nodeTypeID: 325, // ND_floor_vector2
             inputs: [
-                .init(name: "in", dataType: SGDataType.vector2f, connection: in1),
+                .init(nameID: 42, dataType: SGDataType.vector2f, connection: in1),
             ],
             outputs: [.init(dataType: SGDataType.vector2f)])))
     }
     if SGDataType.vector3f.matches(in1) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_floor_vector3",
+            nodeTypeID: 326, // ND_floor_vector3
             inputs: [
-                .init(name: "in", dataType: SGDataType.vector3f, connection: in1),
+                .init(nameID: 42, dataType: SGDataType.vector3f, connection: in1),
             ],
             outputs: [.init(dataType: SGDataType.vector3f)])))
     }
     if SGDataType.vector4f.matches(in1) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_floor_vector4",
+            nodeTypeID: 327, // ND_floor_vector4
             inputs: [
-                .init(name: "in", dataType: SGDataType.vector4f, connection: in1),
+                .init(nameID: 42, dataType: SGDataType.vector4f, connection: in1),
             ],
             outputs: [.init(dataType: SGDataType.vector4f)])))
     }
@@ -1628,49 +1628,49 @@ public func floor<T>(_ in1: T) -> T where T: SGNumeric {
 public func fract<T>(_ in1: T) -> T where T: SGNumeric {
     if SGDataType.color3f.matches(in1) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_realitykit_fractional_color3",
+            nodeTypeID: 650, // ND_realitykit_fractional_color3
             inputs: [
-                .init(name: "in", dataType: SGDataType.color3f, connection: in1),
+                .init(nameID: 42, dataType: SGDataType.color3f, connection: in1),
             ],
             outputs: [.init(dataType: SGDataType.color3f)])))
     }
     if SGDataType.color4f.matches(in1) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_realitykit_fractional_color4",
+            nodeTypeID: 651, // ND_realitykit_fractional_color4
             inputs: [
-                .init(name: "in", dataType: SGDataType.color4f, connection: in1),
+                .init(nameID: 42, dataType: SGDataType.color4f, connection: in1),
             ],
             outputs: [.init(dataType: SGDataType.color4f)])))
     }
     if SGDataType.float.matches(in1) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_realitykit_fractional_float",
+            nodeTypeID: 652, // ND_realitykit_fractional_float
             inputs: [
-                .init(name: "in", dataType: SGDataType.float, connection: in1),
+                .init(nameID: 42, dataType: SGDataType.float, connection: in1),
             ],
             outputs: [.init(dataType: SGDataType.float)])))
     }
     if SGDataType.vector2f.matches(in1) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_realitykit_fractional_vector2",
+            nodeTypeID: 653, // ND_realitykit_fractional_vector2
             inputs: [
-                .init(name: "in", dataType: SGDataType.vector2f, connection: in1),
+                .init(nameID: 42, dataType: SGDataType.vector2f, connection: in1),
             ],
             outputs: [.init(dataType: SGDataType.vector2f)])))
     }
     if SGDataType.vector3f.matches(in1) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_realitykit_fractional_vector3",
+            nodeTypeID: 654, // ND_realitykit_fractional_vector3
             inputs: [
-                .init(name: "in", dataType: SGDataType.vector3f, connection: in1),
+                .init(nameID: 42, dataType: SGDataType.vector3f, connection: in1),
             ],
             outputs: [.init(dataType: SGDataType.vector3f)])))
     }
     if SGDataType.vector4f.matches(in1) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_realitykit_fractional_vector4",
+            nodeTypeID: 655, // ND_realitykit_fractional_vector4
             inputs: [
-                .init(name: "in", dataType: SGDataType.vector4f, connection: in1),
+                .init(nameID: 42, dataType: SGDataType.vector4f, connection: in1),
             ],
             outputs: [.init(dataType: SGDataType.vector4f)])))
     }
@@ -1692,133 +1692,133 @@ public func fractal3D(amplitude: SGNumeric, octaves: SGScalar? = nil, lacunarity
     }
     if SGDataType.vector3f.matches(amplitude) {
         return SGColor(source: .nodeOutput(SGNode(
-            nodeType: "ND_fractal3d_color3",
+            nodeTypeID: 328, // ND_fractal3d_color3
             inputs: [
-                .init(name: "amplitude", dataType: SGDataType.vector3f, connection: amplitude),
-                .init(name: "octaves", dataType: SGDataType.int, connection: octaves),
-                .init(name: "lacunarity", dataType: SGDataType.float, connection: lacunarity),
-                .init(name: "diminish", dataType: SGDataType.float, connection: diminish),
-                .init(name: "position", dataType: SGDataType.vector3f, connection: position),
+                .init(nameID: 2, dataType: SGDataType.vector3f, connection: amplitude),
+                .init(nameID: 83, dataType: SGDataType.int, connection: octaves),
+                .init(nameID: 62, dataType: SGDataType.float, connection: lacunarity),
+                .init(nameID: 18, dataType: SGDataType.float, connection: diminish),
+                .init(nameID: 90, dataType: SGDataType.vector3f, connection: position),
             ],
             outputs: [.init(dataType: SGDataType.color3f)])))
     }
     if SGDataType.float.matches(amplitude) {
         return SGColor(source: .nodeOutput(SGNode(
-            nodeType: "ND_fractal3d_color3FA",
+            nodeTypeID: 329, // ND_fractal3d_color3FA
             inputs: [
-                .init(name: "amplitude", dataType: SGDataType.float, connection: amplitude),
-                .init(name: "octaves", dataType: SGDataType.int, connection: octaves),
-                .init(name: "lacunarity", dataType: SGDataType.float, connection: lacunarity),
-                .init(name: "diminish", dataType: SGDataType.float, connection: diminish),
-                .init(name: "position", dataType: SGDataType.vector3f, connection: position),
+                .init(nameID: 2, dataType: SGDataType.float, connection: amplitude),
+                .init(nameID: 83, dataType: SGDataType.int, connection: octaves),
+                .init(nameID: 62, dataType: SGDataType.float, connection: lacunarity),
+                .init(nameID: 18, dataType: SGDataType.float, connection: diminish),
+                .init(nameID: 90, dataType: SGDataType.vector3f, connection: position),
             ],
             outputs: [.init(dataType: SGDataType.color3f)])))
     }
     if SGDataType.vector4f.matches(amplitude) {
         return SGColor(source: .nodeOutput(SGNode(
-            nodeType: "ND_fractal3d_color4",
+            nodeTypeID: 330, // ND_fractal3d_color4
             inputs: [
-                .init(name: "amplitude", dataType: SGDataType.vector4f, connection: amplitude),
-                .init(name: "octaves", dataType: SGDataType.int, connection: octaves),
-                .init(name: "lacunarity", dataType: SGDataType.float, connection: lacunarity),
-                .init(name: "diminish", dataType: SGDataType.float, connection: diminish),
-                .init(name: "position", dataType: SGDataType.vector3f, connection: position),
+                .init(nameID: 2, dataType: SGDataType.vector4f, connection: amplitude),
+                .init(nameID: 83, dataType: SGDataType.int, connection: octaves),
+                .init(nameID: 62, dataType: SGDataType.float, connection: lacunarity),
+                .init(nameID: 18, dataType: SGDataType.float, connection: diminish),
+                .init(nameID: 90, dataType: SGDataType.vector3f, connection: position),
             ],
             outputs: [.init(dataType: SGDataType.color4f)])))
     }
     if SGDataType.float.matches(amplitude) {
         return SGColor(source: .nodeOutput(SGNode(
-            nodeType: "ND_fractal3d_color4FA",
+            nodeTypeID: 331, // ND_fractal3d_color4FA
             inputs: [
-                .init(name: "amplitude", dataType: SGDataType.float, connection: amplitude),
-                .init(name: "octaves", dataType: SGDataType.int, connection: octaves),
-                .init(name: "lacunarity", dataType: SGDataType.float, connection: lacunarity),
-                .init(name: "diminish", dataType: SGDataType.float, connection: diminish),
-                .init(name: "position", dataType: SGDataType.vector3f, connection: position),
+                .init(nameID: 2, dataType: SGDataType.float, connection: amplitude),
+                .init(nameID: 83, dataType: SGDataType.int, connection: octaves),
+                .init(nameID: 62, dataType: SGDataType.float, connection: lacunarity),
+                .init(nameID: 18, dataType: SGDataType.float, connection: diminish),
+                .init(nameID: 90, dataType: SGDataType.vector3f, connection: position),
             ],
             outputs: [.init(dataType: SGDataType.color4f)])))
     }
     if SGDataType.float.matches(amplitude) {
         return SGScalar(source: .nodeOutput(SGNode(
-            nodeType: "ND_fractal3d_float",
+            nodeTypeID: 332, // ND_fractal3d_float
             inputs: [
-                .init(name: "amplitude", dataType: SGDataType.float, connection: amplitude),
-                .init(name: "octaves", dataType: SGDataType.int, connection: octaves),
-                .init(name: "lacunarity", dataType: SGDataType.float, connection: lacunarity),
-                .init(name: "diminish", dataType: SGDataType.float, connection: diminish),
-                .init(name: "position", dataType: SGDataType.vector3f, connection: position),
+                .init(nameID: 2, dataType: SGDataType.float, connection: amplitude),
+                .init(nameID: 83, dataType: SGDataType.int, connection: octaves),
+                .init(nameID: 62, dataType: SGDataType.float, connection: lacunarity),
+                .init(nameID: 18, dataType: SGDataType.float, connection: diminish),
+                .init(nameID: 90, dataType: SGDataType.vector3f, connection: position),
             ],
             outputs: [.init(dataType: SGDataType.float)])))
     }
     if SGDataType.vector2f.matches(amplitude) {
         return SGVector(source: .nodeOutput(SGNode(
-            nodeType: "ND_fractal3d_vector2",
+            nodeTypeID: 333, // ND_fractal3d_vector2
             inputs: [
-                .init(name: "amplitude", dataType: SGDataType.vector2f, connection: amplitude),
-                .init(name: "octaves", dataType: SGDataType.int, connection: octaves),
-                .init(name: "lacunarity", dataType: SGDataType.float, connection: lacunarity),
-                .init(name: "diminish", dataType: SGDataType.float, connection: diminish),
-                .init(name: "position", dataType: SGDataType.vector3f, connection: position),
+                .init(nameID: 2, dataType: SGDataType.vector2f, connection: amplitude),
+                .init(nameID: 83, dataType: SGDataType.int, connection: octaves),
+                .init(nameID: 62, dataType: SGDataType.float, connection: lacunarity),
+                .init(nameID: 18, dataType: SGDataType.float, connection: diminish),
+                .init(nameID: 90, dataType: SGDataType.vector3f, connection: position),
             ],
             outputs: [.init(dataType: SGDataType.vector2f)])))
     }
     if SGDataType.float.matches(amplitude) {
         return SGVector(source: .nodeOutput(SGNode(
-            nodeType: "ND_fractal3d_vector2FA",
+            nodeTypeID: 334, // ND_fractal3d_vector2FA
             inputs: [
-                .init(name: "amplitude", dataType: SGDataType.float, connection: amplitude),
-                .init(name: "octaves", dataType: SGDataType.int, connection: octaves),
-                .init(name: "lacunarity", dataType: SGDataType.float, connection: lacunarity),
-                .init(name: "diminish", dataType: SGDataType.float, connection: diminish),
-                .init(name: "position", dataType: SGDataType.vector3f, connection: position),
+                .init(nameID: 2, dataType: SGDataType.float, connection: amplitude),
+                .init(nameID: 83, dataType: SGDataType.int, connection: octaves),
+                .init(nameID: 62, dataType: SGDataType.float, connection: lacunarity),
+                .init(nameID: 18, dataType: SGDataType.float, connection: diminish),
+                .init(nameID: 90, dataType: SGDataType.vector3f, connection: position),
             ],
             outputs: [.init(dataType: SGDataType.vector2f)])))
     }
     if SGDataType.vector3f.matches(amplitude) {
         return SGVector(source: .nodeOutput(SGNode(
-            nodeType: "ND_fractal3d_vector3",
+            nodeTypeID: 335, // ND_fractal3d_vector3
             inputs: [
-                .init(name: "amplitude", dataType: SGDataType.vector3f, connection: amplitude),
-                .init(name: "octaves", dataType: SGDataType.int, connection: octaves),
-                .init(name: "lacunarity", dataType: SGDataType.float, connection: lacunarity),
-                .init(name: "diminish", dataType: SGDataType.float, connection: diminish),
-                .init(name: "position", dataType: SGDataType.vector3f, connection: position),
+                .init(nameID: 2, dataType: SGDataType.vector3f, connection: amplitude),
+                .init(nameID: 83, dataType: SGDataType.int, connection: octaves),
+                .init(nameID: 62, dataType: SGDataType.float, connection: lacunarity),
+                .init(nameID: 18, dataType: SGDataType.float, connection: diminish),
+                .init(nameID: 90, dataType: SGDataType.vector3f, connection: position),
             ],
             outputs: [.init(dataType: SGDataType.vector3f)])))
     }
     if SGDataType.float.matches(amplitude) {
         return SGVector(source: .nodeOutput(SGNode(
-            nodeType: "ND_fractal3d_vector3FA",
+            nodeTypeID: 336, // ND_fractal3d_vector3FA
             inputs: [
-                .init(name: "amplitude", dataType: SGDataType.float, connection: amplitude),
-                .init(name: "octaves", dataType: SGDataType.int, connection: octaves),
-                .init(name: "lacunarity", dataType: SGDataType.float, connection: lacunarity),
-                .init(name: "diminish", dataType: SGDataType.float, connection: diminish),
-                .init(name: "position", dataType: SGDataType.vector3f, connection: position),
+                .init(nameID: 2, dataType: SGDataType.float, connection: amplitude),
+                .init(nameID: 83, dataType: SGDataType.int, connection: octaves),
+                .init(nameID: 62, dataType: SGDataType.float, connection: lacunarity),
+                .init(nameID: 18, dataType: SGDataType.float, connection: diminish),
+                .init(nameID: 90, dataType: SGDataType.vector3f, connection: position),
             ],
             outputs: [.init(dataType: SGDataType.vector3f)])))
     }
     if SGDataType.vector4f.matches(amplitude) {
         return SGVector(source: .nodeOutput(SGNode(
-            nodeType: "ND_fractal3d_vector4",
+            nodeTypeID: 337, // ND_fractal3d_vector4
             inputs: [
-                .init(name: "amplitude", dataType: SGDataType.vector4f, connection: amplitude),
-                .init(name: "octaves", dataType: SGDataType.int, connection: octaves),
-                .init(name: "lacunarity", dataType: SGDataType.float, connection: lacunarity),
-                .init(name: "diminish", dataType: SGDataType.float, connection: diminish),
-                .init(name: "position", dataType: SGDataType.vector3f, connection: position),
+                .init(nameID: 2, dataType: SGDataType.vector4f, connection: amplitude),
+                .init(nameID: 83, dataType: SGDataType.int, connection: octaves),
+                .init(nameID: 62, dataType: SGDataType.float, connection: lacunarity),
+                .init(nameID: 18, dataType: SGDataType.float, connection: diminish),
+                .init(nameID: 90, dataType: SGDataType.vector3f, connection: position),
             ],
             outputs: [.init(dataType: SGDataType.vector4f)])))
     }
     if SGDataType.float.matches(amplitude) {
         return SGVector(source: .nodeOutput(SGNode(
-            nodeType: "ND_fractal3d_vector4FA",
+            nodeTypeID: 338, // ND_fractal3d_vector4FA
             inputs: [
-                .init(name: "amplitude", dataType: SGDataType.float, connection: amplitude),
-                .init(name: "octaves", dataType: SGDataType.int, connection: octaves),
-                .init(name: "lacunarity", dataType: SGDataType.float, connection: lacunarity),
-                .init(name: "diminish", dataType: SGDataType.float, connection: diminish),
-                .init(name: "position", dataType: SGDataType.vector3f, connection: position),
+                .init(nameID: 2, dataType: SGDataType.float, connection: amplitude),
+                .init(nameID: 83, dataType: SGDataType.int, connection: octaves),
+                .init(nameID: 62, dataType: SGDataType.float, connection: lacunarity),
+                .init(nameID: 18, dataType: SGDataType.float, connection: diminish),
+                .init(nameID: 90, dataType: SGDataType.vector3f, connection: position),
             ],
             outputs: [.init(dataType: SGDataType.vector4f)])))
     }
@@ -1866,21 +1866,21 @@ public func geometryModifier(modelPositionOffset: SGVector? = nil, color: SGColo
         return SGToken(source: .error("Invalid geometryModifier input. Expected userAttributeHalf21 data type to be SGDataType.vector2h, but got \(userAttributeHalf21?.dataType.rawValue ?? "nil").", values: [userAttributeHalf21]))
     }
     return SGToken(source: .nodeOutput(SGNode(
-        nodeType: "ND_realitykit_geometrymodifier_vertexshader",
+        nodeTypeID: 683, // ND_realitykit_geometrymodifier_vertexshader
         inputs: [
-            .init(name: "modelPositionOffset", dataType: SGDataType.vector3f, connection: modelPositionOffset),
-            .init(name: "color", dataType: SGDataType.color4f, connection: color),
-            .init(name: "normal", dataType: SGDataType.vector3f, connection: normal),
-            .init(name: "bitangent", dataType: SGDataType.vector3f, connection: bitangent),
-            .init(name: "uv0", dataType: SGDataType.vector2f, connection: uv0),
-            .init(name: "uv1", dataType: SGDataType.vector2f, connection: uv1),
-            .init(name: "userAttribute", dataType: SGDataType.vector4f, connection: userAttribute),
-            .init(name: "userAttributeHalf4_0", dataType: SGDataType.vector4h, connection: userAttributeHalf40),
-            .init(name: "userAttributeHalf4_1", dataType: SGDataType.vector4h, connection: userAttributeHalf41),
-            .init(name: "userAttributeHalf4_2", dataType: SGDataType.vector4h, connection: userAttributeHalf42),
-            .init(name: "userAttributeHalf4_3", dataType: SGDataType.vector4h, connection: userAttributeHalf43),
-            .init(name: "userAttributeHalf2_0", dataType: SGDataType.vector2h, connection: userAttributeHalf20),
-            .init(name: "userAttributeHalf2_1", dataType: SGDataType.vector2h, connection: userAttributeHalf21),
+            .init(nameID: 78, dataType: SGDataType.vector3f, connection: modelPositionOffset),
+            .init(nameID: 14, dataType: SGDataType.color4f, connection: color),
+            .init(nameID: 80, dataType: SGDataType.vector3f, connection: normal),
+            .init(nameID: 8, dataType: SGDataType.vector3f, connection: bitangent),
+            .init(nameID: 116, dataType: SGDataType.vector2f, connection: uv0),
+            .init(nameID: 117, dataType: SGDataType.vector2f, connection: uv1),
+            .init(nameID: 109, dataType: SGDataType.vector4f, connection: userAttribute),
+            .init(nameID: 112, dataType: SGDataType.vector4h, connection: userAttributeHalf40),
+            .init(nameID: 113, dataType: SGDataType.vector4h, connection: userAttributeHalf41),
+            .init(nameID: 114, dataType: SGDataType.vector4h, connection: userAttributeHalf42),
+            .init(nameID: 115, dataType: SGDataType.vector4h, connection: userAttributeHalf43),
+            .init(nameID: 110, dataType: SGDataType.vector2h, connection: userAttributeHalf20),
+            .init(nameID: 111, dataType: SGDataType.vector2h, connection: userAttributeHalf21),
         ],
         outputs: [.init(dataType: SGDataType.token)])))
 }
@@ -1888,71 +1888,71 @@ public func geometryModifier(modelPositionOffset: SGVector? = nil, color: SGColo
 public func geometrySwitchCameraIndex<T>(mono: T, left: T, right: T) -> T where T: SGNumeric {
     if SGDataType.color3f.matches(mono) && SGDataType.color3f.matches(left) && SGDataType.color3f.matches(right) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_realitykit_geometry_switch_cameraindex_color3",
+            nodeTypeID: 676, // ND_realitykit_geometry_switch_cameraindex_color3
             inputs: [
-                .init(name: "mono", dataType: SGDataType.color3f, connection: mono),
-                .init(name: "left", dataType: SGDataType.color3f, connection: left),
-                .init(name: "right", dataType: SGDataType.color3f, connection: right),
+                .init(nameID: 79, dataType: SGDataType.color3f, connection: mono),
+                .init(nameID: 63, dataType: SGDataType.color3f, connection: left),
+                .init(nameID: 93, dataType: SGDataType.color3f, connection: right),
             ],
             outputs: [.init(dataType: SGDataType.color3f)])))
     }
     if SGDataType.color4f.matches(mono) && SGDataType.color4f.matches(left) && SGDataType.color4f.matches(right) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_realitykit_geometry_switch_cameraindex_color4",
+            nodeTypeID: 677, // ND_realitykit_geometry_switch_cameraindex_color4
             inputs: [
-                .init(name: "mono", dataType: SGDataType.color4f, connection: mono),
-                .init(name: "left", dataType: SGDataType.color4f, connection: left),
-                .init(name: "right", dataType: SGDataType.color4f, connection: right),
+                .init(nameID: 79, dataType: SGDataType.color4f, connection: mono),
+                .init(nameID: 63, dataType: SGDataType.color4f, connection: left),
+                .init(nameID: 93, dataType: SGDataType.color4f, connection: right),
             ],
             outputs: [.init(dataType: SGDataType.color4f)])))
     }
     if SGDataType.float.matches(mono) && SGDataType.float.matches(left) && SGDataType.float.matches(right) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_realitykit_geometry_switch_cameraindex_float",
+            nodeTypeID: 678, // ND_realitykit_geometry_switch_cameraindex_float
             inputs: [
-                .init(name: "mono", dataType: SGDataType.float, connection: mono),
-                .init(name: "left", dataType: SGDataType.float, connection: left),
-                .init(name: "right", dataType: SGDataType.float, connection: right),
+                .init(nameID: 79, dataType: SGDataType.float, connection: mono),
+                .init(nameID: 63, dataType: SGDataType.float, connection: left),
+                .init(nameID: 93, dataType: SGDataType.float, connection: right),
             ],
             outputs: [.init(dataType: SGDataType.float)])))
     }
     if SGDataType.int.matches(mono) && SGDataType.int.matches(left) && SGDataType.int.matches(right) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_realitykit_geometry_switch_cameraindex_integer",
+            nodeTypeID: 679, // ND_realitykit_geometry_switch_cameraindex_integer
             inputs: [
-                .init(name: "mono", dataType: SGDataType.int, connection: mono),
-                .init(name: "left", dataType: SGDataType.int, connection: left),
-                .init(name: "right", dataType: SGDataType.int, connection: right),
+                .init(nameID: 79, dataType: SGDataType.int, connection: mono),
+                .init(nameID: 63, dataType: SGDataType.int, connection: left),
+                .init(nameID: 93, dataType: SGDataType.int, connection: right),
             ],
             outputs: [.init(dataType: SGDataType.int)])))
     }
     if SGDataType.vector2f.matches(mono) && SGDataType.vector2f.matches(left) && SGDataType.vector2f.matches(right) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_realitykit_geometry_switch_cameraindex_vector2",
+            nodeTypeID: 680, // ND_realitykit_geometry_switch_cameraindex_vector2
             inputs: [
-                .init(name: "mono", dataType: SGDataType.vector2f, connection: mono),
-                .init(name: "left", dataType: SGDataType.vector2f, connection: left),
-                .init(name: "right", dataType: SGDataType.vector2f, connection: right),
+                .init(nameID: 79, dataType: SGDataType.vector2f, connection: mono),
+                .init(nameID: 63, dataType: SGDataType.vector2f, connection: left),
+                .init(nameID: 93, dataType: SGDataType.vector2f, connection: right),
             ],
             outputs: [.init(dataType: SGDataType.vector2f)])))
     }
     if SGDataType.vector3f.matches(mono) && SGDataType.vector3f.matches(left) && SGDataType.vector3f.matches(right) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_realitykit_geometry_switch_cameraindex_vector3",
+            nodeTypeID: 681, // ND_realitykit_geometry_switch_cameraindex_vector3
             inputs: [
-                .init(name: "mono", dataType: SGDataType.vector3f, connection: mono),
-                .init(name: "left", dataType: SGDataType.vector3f, connection: left),
-                .init(name: "right", dataType: SGDataType.vector3f, connection: right),
+                .init(nameID: 79, dataType: SGDataType.vector3f, connection: mono),
+                .init(nameID: 63, dataType: SGDataType.vector3f, connection: left),
+                .init(nameID: 93, dataType: SGDataType.vector3f, connection: right),
             ],
             outputs: [.init(dataType: SGDataType.vector3f)])))
     }
     if SGDataType.vector4f.matches(mono) && SGDataType.vector4f.matches(left) && SGDataType.vector4f.matches(right) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_realitykit_geometry_switch_cameraindex_vector4",
+            nodeTypeID: 682, // ND_realitykit_geometry_switch_cameraindex_vector4
             inputs: [
-                .init(name: "mono", dataType: SGDataType.vector4f, connection: mono),
-                .init(name: "left", dataType: SGDataType.vector4f, connection: left),
-                .init(name: "right", dataType: SGDataType.vector4f, connection: right),
+                .init(nameID: 79, dataType: SGDataType.vector4f, connection: mono),
+                .init(nameID: 63, dataType: SGDataType.vector4f, connection: left),
+                .init(nameID: 93, dataType: SGDataType.vector4f, connection: right),
             ],
             outputs: [.init(dataType: SGDataType.vector4f)])))
     }
@@ -1967,10 +1967,10 @@ public func heightToNormal(_ in1: SGScalar, scale: SGScalar? = nil) -> SGVector
         return SGVector(source: .error("Invalid heightToNormal input. Expected scale data type to be SGDataType.float, but got \(scale?.dataType.rawValue ?? "nil").", values: [scale]))
     }
     return SGVector(source: .nodeOutput(SGNode(
-        nodeType: "ND_heighttonormal_vector3",
+        nodeTypeID: 353, // ND_heighttonormal_vector3
         inputs: [
-            .init(name: "in", dataType: SGDataType.float, connection: in1),
-            .init(name: "scale", dataType: SGDataType.float, connection: scale),
+            .init(nameID: 42, dataType: SGDataType.float, connection: in1),
+            .init(nameID: 97, dataType: SGDataType.float, connection: scale),
         ],
         outputs: [.init(dataType: SGDataType.vector3f)])))
 }
@@ -1981,19 +1981,19 @@ public func hsvAdjust(_ in1: SGColor, amount: SGVector? = nil) -> SGColor {
     }
     if SGDataType.color3f.matches(in1) {
         return SGColor(source: .nodeOutput(SGNode(
-            nodeType: "ND_hsvadjust_color3",
+            nodeTypeID: 354, // ND_hsvadjust_color3
             inputs: [
-                .init(name: "in", dataType: SGDataType.color3f, connection: in1),
-                .init(name: "amount", dataType: SGDataType.vector3f, connection: amount),
+                .init(nameID: 42, dataType: SGDataType.color3f, connection: in1),
+                .init(nameID: 1, dataType: SGDataType.vector3f, connection: amount),
             ],
             outputs: [.init(dataType: SGDataType.color3f)])))
     }
     if SGDataType.color4f.matches(in1) {
         return SGColor(source: .nodeOutput(SGNode(
-            nodeType: "ND_hsvadjust_color4",
+            nodeTypeID: 355, // ND_hsvadjust_color4
             inputs: [
-                .init(name: "in", dataType: SGDataType.color4f, connection: in1),
-                .init(name: "amount", dataType: SGDataType.vector3f, connection: amount),
+                .init(nameID: 42, dataType: SGDataType.color4f, connection: in1),
+                .init(nameID: 1, dataType: SGDataType.vector3f, connection: amount),
             ],
             outputs: [.init(dataType: SGDataType.color4f)])))
     }
@@ -2003,17 +2003,17 @@ public func hsvAdjust(_ in1: SGColor, amount: SGVector? = nil) -> SGColor {
 public func hsvToRGB(_ in1: SGColor) -> SGColor {
     if SGDataType.color3f.matches(in1) {
         return SGColor(source: .nodeOutput(SGNode(
-            nodeType: "ND_hsvtorgb_color3",
+            nodeTypeID: 356, // ND_hsvtorgb_color3
             inputs: [
-                .init(name: "in", dataType: SGDataType.color3f, connection: in1),
+                .init(nameID: 42, dataType: SGDataType.color3f, connection: in1),
             ],
             outputs: [.init(dataType: SGDataType.color3f)])))
     }
     if SGDataType.color4f.matches(in1) {
         return SGColor(source: .nodeOutput(SGNode(
-            nodeType: "ND_hsvtorgb_color4",
+            nodeTypeID: 357, // ND_hsvtorgb_color4
             inputs: [
-                .init(name: "in", dataType: SGDataType.color4f, connection: in1),
+                .init(nameID: 42, dataType: SGDataType.color4f, connection: in1),
             ],
             outputs: [.init(dataType: SGDataType.color4f)])))
     }
@@ -2023,331 +2023,331 @@ public func hsvToRGB(_ in1: SGColor) -> SGColor {
 public func ifEqual<T>(_ value1: SGValue, _ value2: SGValue, trueResult: T, falseResult: T) -> T where T: SGNumeric {
     if SGDataType.float.matches(value1) && SGDataType.float.matches(value2) && SGDataType.color3f.matches(trueResult) && SGDataType.color3f.matches(falseResult) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_ifequal_color3",
+            nodeTypeID: 358, // ND_ifequal_color3
             inputs: [
-                .init(name: "value1", dataType: SGDataType.float, connection: value1),
-                .init(name: "value2", dataType: SGDataType.float, connection: value2),
-                .init(name: "in1", dataType: SGDataType.color3f, connection: trueResult),
-                .init(name: "in2", dataType: SGDataType.color3f, connection: falseResult),
+                .init(nameID: 123, dataType: SGDataType.float, connection: value1),
+                .init(nameID: 124, dataType: SGDataType.float, connection: value2),
+                .init(nameID: 43, dataType: SGDataType.color3f, connection: trueResult),
+                .init(nameID: 45, dataType: SGDataType.color3f, connection: falseResult),
             ],
             outputs: [.init(dataType: SGDataType.color3f)])))
     }
     if SGDataType.bool.matches(value1) && SGDataType.bool.matches(value2) && SGDataType.color3f.matches(trueResult) && SGDataType.color3f.matches(falseResult) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_ifequal_color3B",
+            nodeTypeID: 359, // ND_ifequal_color3B
             inputs: [
-                .init(name: "value1", dataType: SGDataType.bool, connection: value1),
-                .init(name: "value2", dataType: SGDataType.bool, connection: value2),
-                .init(name: "in1", dataType: SGDataType.color3f, connection: trueResult),
-                .init(name: "in2", dataType: SGDataType.color3f, connection: falseResult),
+                .init(nameID: 123, dataType: SGDataType.bool, connection: value1),
+                .init(nameID: 124, dataType: SGDataType.bool, connection: value2),
+                .init(nameID: 43, dataType: SGDataType.color3f, connection: trueResult),
+                .init(nameID: 45, dataType: SGDataType.color3f, connection: falseResult),
             ],
             outputs: [.init(dataType: SGDataType.color3f)])))
     }
     if SGDataType.int.matches(value1) && SGDataType.int.matches(value2) && SGDataType.color3f.matches(trueResult) && SGDataType.color3f.matches(falseResult) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_ifequal_color3I",
+            nodeTypeID: 360, // ND_ifequal_color3I
             inputs: [
-                .init(name: "value1", dataType: SGDataType.int, connection: value1),
-                .init(name: "value2", dataType: SGDataType.int, connection: value2),
-                .init(name: "in1", dataType: SGDataType.color3f, connection: trueResult),
-                .init(name: "in2", dataType: SGDataType.color3f, connection: falseResult),
+                .init(nameID: 123, dataType: SGDataType.int, connection: value1),
+                .init(nameID: 124, dataType: SGDataType.int, connection: value2),
+                .init(nameID: 43, dataType: SGDataType.color3f, connection: trueResult),
+                .init(nameID: 45, dataType: SGDataType.color3f, connection: falseResult),
             ],
             outputs: [.init(dataType: SGDataType.color3f)])))
     }
     if SGDataType.float.matches(value1) && SGDataType.float.matches(value2) && SGDataType.color4f.matches(trueResult) && SGDataType.color4f.matches(falseResult) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_ifequal_color4",
+            nodeTypeID: 361, // ND_ifequal_color4
             inputs: [
-                .init(name: "value1", dataType: SGDataType.float, connection: value1),
-                .init(name: "value2", dataType: SGDataType.float, connection: value2),
-                .init(name: "in1", dataType: SGDataType.color4f, connection: trueResult),
-                .init(name: "in2", dataType: SGDataType.color4f, connection: falseResult),
+                .init(nameID: 123, dataType: SGDataType.float, connection: value1),
+                .init(nameID: 124, dataType: SGDataType.float, connection: value2),
+                .init(nameID: 43, dataType: SGDataType.color4f, connection: trueResult),
+                .init(nameID: 45, dataType: SGDataType.color4f, connection: falseResult),
             ],
             outputs: [.init(dataType: SGDataType.color4f)])))
     }
     if SGDataType.bool.matches(value1) && SGDataType.bool.matches(value2) && SGDataType.color4f.matches(trueResult) && SGDataType.color4f.matches(falseResult) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_ifequal_color4B",
+            nodeTypeID: 362, // ND_ifequal_color4B
             inputs: [
-                .init(name: "value1", dataType: SGDataType.bool, connection: value1),
-                .init(name: "value2", dataType: SGDataType.bool, connection: value2),
-                .init(name: "in1", dataType: SGDataType.color4f, connection: trueResult),
-                .init(name: "in2", dataType: SGDataType.color4f, connection: falseResult),
+                .init(nameID: 123, dataType: SGDataType.bool, connection: value1),
+                .init(nameID: 124, dataType: SGDataType.bool, connection: value2),
+                .init(nameID: 43, dataType: SGDataType.color4f, connection: trueResult),
+                .init(nameID: 45, dataType: SGDataType.color4f, connection: falseResult),
             ],
             outputs: [.init(dataType: SGDataType.color4f)])))
     }
     if SGDataType.int.matches(value1) && SGDataType.int.matches(value2) && SGDataType.color4f.matches(trueResult) && SGDataType.color4f.matches(falseResult) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_ifequal_color4I",
+            nodeTypeID: 363, // ND_ifequal_color4I
             inputs: [
-                .init(name: "value1", dataType: SGDataType.int, connection: value1),
-                .init(name: "value2", dataType: SGDataType.int, connection: value2),
-                .init(name: "in1", dataType: SGDataType.color4f, connection: trueResult),
-                .init(name: "in2", dataType: SGDataType.color4f, connection: falseResult),
+                .init(nameID: 123, dataType: SGDataType.int, connection: value1),
+                .init(nameID: 124, dataType: SGDataType.int, connection: value2),
+                .init(nameID: 43, dataType: SGDataType.color4f, connection: trueResult),
+                .init(nameID: 45, dataType: SGDataType.color4f, connection: falseResult),
             ],
             outputs: [.init(dataType: SGDataType.color4f)])))
     }
     if SGDataType.float.matches(value1) && SGDataType.float.matches(value2) && SGDataType.float.matches(trueResult) && SGDataType.float.matches(falseResult) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_ifequal_float",
+            nodeTypeID: 364, // ND_ifequal_float
             inputs: [
-                .init(name: "value1", dataType: SGDataType.float, connection: value1),
-                .init(name: "value2", dataType: SGDataType.float, connection: value2),
-                .init(name: "in1", dataType: SGDataType.float, connection: trueResult),
-                .init(name: "in2", dataType: SGDataType.float, connection: falseResult),
+                .init(nameID: 123, dataType: SGDataType.float, connection: value1),
+                .init(nameID: 124, dataType: SGDataType.float, connection: value2),
+                .init(nameID: 43, dataType: SGDataType.float, connection: trueResult),
+                .init(nameID: 45, dataType: SGDataType.float, connection: falseResult),
             ],
             outputs: [.init(dataType: SGDataType.float)])))
     }
     if SGDataType.bool.matches(value1) && SGDataType.bool.matches(value2) && SGDataType.float.matches(trueResult) && SGDataType.float.matches(falseResult) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_ifequal_floatB",
+            nodeTypeID: 365, // ND_ifequal_floatB
             inputs: [
-                .init(name: "value1", dataType: SGDataType.bool, connection: value1),
-                .init(name: "value2", dataType: SGDataType.bool, connection: value2),
-                .init(name: "in1", dataType: SGDataType.float, connection: trueResult),
-                .init(name: "in2", dataType: SGDataType.float, connection: falseResult),
+                .init(nameID: 123, dataType: SGDataType.bool, connection: value1),
+                .init(nameID: 124, dataType: SGDataType.bool, connection: value2),
+                .init(nameID: 43, dataType: SGDataType.float, connection: trueResult),
+                .init(nameID: 45, dataType: SGDataType.float, connection: falseResult),
             ],
             outputs: [.init(dataType: SGDataType.float)])))
     }
     if SGDataType.int.matches(value1) && SGDataType.int.matches(value2) && SGDataType.float.matches(trueResult) && SGDataType.float.matches(falseResult) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_ifequal_floatI",
+            nodeTypeID: 366, // ND_ifequal_floatI
             inputs: [
-                .init(name: "value1", dataType: SGDataType.int, connection: value1),
-                .init(name: "value2", dataType: SGDataType.int, connection: value2),
-                .init(name: "in1", dataType: SGDataType.float, connection: trueResult),
-                .init(name: "in2", dataType: SGDataType.float, connection: falseResult),
+                .init(nameID: 123, dataType: SGDataType.int, connection: value1),
+                .init(nameID: 124, dataType: SGDataType.int, connection: value2),
+                .init(nameID: 43, dataType: SGDataType.float, connection: trueResult),
+                .init(nameID: 45, dataType: SGDataType.float, connection: falseResult),
             ],
             outputs: [.init(dataType: SGDataType.float)])))
     }
     if SGDataType.half.matches(value1) && SGDataType.half.matches(value2) && SGDataType.half.matches(trueResult) && SGDataType.half.matches(falseResult) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_ifequal_half",
+            nodeTypeID: 367, // ND_ifequal_half
             inputs: [
-                .init(name: "value1", dataType: SGDataType.half, connection: value1),
-                .init(name: "value2", dataType: SGDataType.half, connection: value2),
-                .init(name: "in1", dataType: SGDataType.half, connection: trueResult),
-                .init(name: "in2", dataType: SGDataType.half, connection: falseResult),
+                .init(nameID: 123, dataType: SGDataType.half, connection: value1),
+                .init(nameID: 124, dataType: SGDataType.half, connection: value2),
+                .init(nameID: 43, dataType: SGDataType.half, connection: trueResult),
+                .init(nameID: 45, dataType: SGDataType.half, connection: falseResult),
             ],
             outputs: [.init(dataType: SGDataType.half)])))
     }
     if SGDataType.float.matches(value1) && SGDataType.float.matches(value2) && SGDataType.vector2h.matches(trueResult) && SGDataType.vector2h.matches(falseResult) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_ifequal_half2",
+            nodeTypeID: 368, // ND_ifequal_half2
             inputs: [
-                .init(name: "value1", dataType: SGDataType.float, connection: value1),
-                .init(name: "value2", dataType: SGDataType.float, connection: value2),
-                .init(name: "in1", dataType: SGDataType.vector2h, connection: trueResult),
-                .init(name: "in2", dataType: SGDataType.vector2h, connection: falseResult),
+                .init(nameID: 123, dataType: SGDataType.float, connection: value1),
+                .init(nameID: 124, dataType: SGDataType.float, connection: value2),
+                .init(nameID: 43, dataType: SGDataType.vector2h, connection: trueResult),
+                .init(nameID: 45, dataType: SGDataType.vector2h, connection: falseResult),
             ],
             outputs: [.init(dataType: SGDataType.vector2h)])))
     }
     if SGDataType.bool.matches(value1) && SGDataType.bool.matches(value2) && SGDataType.vector2h.matches(trueResult) && SGDataType.vector2h.matches(falseResult) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_ifequal_half2B",
+            nodeTypeID: 369, // ND_ifequal_half2B
             inputs: [
-                .init(name: "value1", dataType: SGDataType.bool, connection: value1),
-                .init(name: "value2", dataType: SGDataType.bool, connection: value2),
-                .init(name: "in1", dataType: SGDataType.vector2h, connection: trueResult),
-                .init(name: "in2", dataType: SGDataType.vector2h, connection: falseResult),
+                .init(nameID: 123, dataType: SGDataType.bool, connection: value1),
+                .init(nameID: 124, dataType: SGDataType.bool, connection: value2),
+                .init(nameID: 43, dataType: SGDataType.vector2h, connection: trueResult),
+                .init(nameID: 45, dataType: SGDataType.vector2h, connection: falseResult),
             ],
             outputs: [.init(dataType: SGDataType.vector2h)])))
     }
     if SGDataType.int.matches(value1) && SGDataType.int.matches(value2) && SGDataType.vector2h.matches(trueResult) && SGDataType.vector2h.matches(falseResult) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_ifequal_half2I",
+            nodeTypeID: 370, // ND_ifequal_half2I
             inputs: [
-                .init(name: "value1", dataType: SGDataType.int, connection: value1),
-                .init(name: "value2", dataType: SGDataType.int, connection: value2),
-                .init(name: "in1", dataType: SGDataType.vector2h, connection: trueResult),
-                .init(name: "in2", dataType: SGDataType.vector2h, connection: falseResult),
+                .init(nameID: 123, dataType: SGDataType.int, connection: value1),
+                .init(nameID: 124, dataType: SGDataType.int, connection: value2),
+                .init(nameID: 43, dataType: SGDataType.vector2h, connection: trueResult),
+                .init(nameID: 45, dataType: SGDataType.vector2h, connection: falseResult),
             ],
             outputs: [.init(dataType: SGDataType.vector2h)])))
     }
     if SGDataType.float.matches(value1) && SGDataType.float.matches(value2) && SGDataType.vector3h.matches(trueResult) && SGDataType.vector3h.matches(falseResult) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_ifequal_half3",
+            nodeTypeID: 371, // ND_ifequal_half3
             inputs: [
-                .init(name: "value1", dataType: SGDataType.float, connection: value1),
-                .init(name: "value2", dataType: SGDataType.float, connection: value2),
-                .init(name: "in1", dataType: SGDataType.vector3h, connection: trueResult),
-                .init(name: "in2", dataType: SGDataType.vector3h, connection: falseResult),
+                .init(nameID: 123, dataType: SGDataType.float, connection: value1),
+                .init(nameID: 124, dataType: SGDataType.float, connection: value2),
+                .init(nameID: 43, dataType: SGDataType.vector3h, connection: trueResult),
+                .init(nameID: 45, dataType: SGDataType.vector3h, connection: falseResult),
             ],
             outputs: [.init(dataType: SGDataType.vector3h)])))
     }
     if SGDataType.bool.matches(value1) && SGDataType.bool.matches(value2) && SGDataType.vector3h.matches(trueResult) && SGDataType.vector3h.matches(falseResult) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_ifequal_half3B",
+            nodeTypeID: 372, // ND_ifequal_half3B
             inputs: [
-                .init(name: "value1", dataType: SGDataType.bool, connection: value1),
-                .init(name: "value2", dataType: SGDataType.bool, connection: value2),
-                .init(name: "in1", dataType: SGDataType.vector3h, connection: trueResult),
-                .init(name: "in2", dataType: SGDataType.vector3h, connection: falseResult),
+                .init(nameID: 123, dataType: SGDataType.bool, connection: value1),
+                .init(nameID: 124, dataType: SGDataType.bool, connection: value2),
+                .init(nameID: 43, dataType: SGDataType.vector3h, connection: trueResult),
+                .init(nameID: 45, dataType: SGDataType.vector3h, connection: falseResult),
             ],
             outputs: [.init(dataType: SGDataType.vector3h)])))
     }
     if SGDataType.int.matches(value1) && SGDataType.int.matches(value2) && SGDataType.vector3h.matches(trueResult) && SGDataType.vector3h.matches(falseResult) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_ifequal_half3I",
+            nodeTypeID: 373, // ND_ifequal_half3I
             inputs: [
-                .init(name: "value1", dataType: SGDataType.int, connection: value1),
-                .init(name: "value2", dataType: SGDataType.int, connection: value2),
-                .init(name: "in1", dataType: SGDataType.vector3h, connection: trueResult),
-                .init(name: "in2", dataType: SGDataType.vector3h, connection: falseResult),
+                .init(nameID: 123, dataType: SGDataType.int, connection: value1),
+                .init(nameID: 124, dataType: SGDataType.int, connection: value2),
+                .init(nameID: 43, dataType: SGDataType.vector3h, connection: trueResult),
+                .init(nameID: 45, dataType: SGDataType.vector3h, connection: falseResult),
             ],
             outputs: [.init(dataType: SGDataType.vector3h)])))
     }
     if SGDataType.float.matches(value1) && SGDataType.float.matches(value2) && SGDataType.vector4h.matches(trueResult) && SGDataType.vector4h.matches(falseResult) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_ifequal_half4",
+            nodeTypeID: 374, // ND_ifequal_half4
             inputs: [
-                .init(name: "value1", dataType: SGDataType.float, connection: value1),
-                .init(name: "value2", dataType: SGDataType.float, connection: value2),
-                .init(name: "in1", dataType: SGDataType.vector4h, connection: trueResult),
-                .init(name: "in2", dataType: SGDataType.vector4h, connection: falseResult),
+                .init(nameID: 123, dataType: SGDataType.float, connection: value1),
+                .init(nameID: 124, dataType: SGDataType.float, connection: value2),
+                .init(nameID: 43, dataType: SGDataType.vector4h, connection: trueResult),
+                .init(nameID: 45, dataType: SGDataType.vector4h, connection: falseResult),
             ],
             outputs: [.init(dataType: SGDataType.vector4h)])))
     }
     if SGDataType.bool.matches(value1) && SGDataType.bool.matches(value2) && SGDataType.vector4h.matches(trueResult) && SGDataType.vector4h.matches(falseResult) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_ifequal_half4B",
+            nodeTypeID: 375, // ND_ifequal_half4B
             inputs: [
-                .init(name: "value1", dataType: SGDataType.bool, connection: value1),
-                .init(name: "value2", dataType: SGDataType.bool, connection: value2),
-                .init(name: "in1", dataType: SGDataType.vector4h, connection: trueResult),
-                .init(name: "in2", dataType: SGDataType.vector4h, connection: falseResult),
+                .init(nameID: 123, dataType: SGDataType.bool, connection: value1),
+                .init(nameID: 124, dataType: SGDataType.bool, connection: value2),
+                .init(nameID: 43, dataType: SGDataType.vector4h, connection: trueResult),
+                .init(nameID: 45, dataType: SGDataType.vector4h, connection: falseResult),
             ],
             outputs: [.init(dataType: SGDataType.vector4h)])))
     }
     if SGDataType.int.matches(value1) && SGDataType.int.matches(value2) && SGDataType.vector4h.matches(trueResult) && SGDataType.vector4h.matches(falseResult) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_ifequal_half4I",
+            nodeTypeID: 376, // ND_ifequal_half4I
             inputs: [
-                .init(name: "value1", dataType: SGDataType.int, connection: value1),
-                .init(name: "value2", dataType: SGDataType.int, connection: value2),
-                .init(name: "in1", dataType: SGDataType.vector4h, connection: trueResult),
-                .init(name: "in2", dataType: SGDataType.vector4h, connection: falseResult),
+                .init(nameID: 123, dataType: SGDataType.int, connection: value1),
+                .init(nameID: 124, dataType: SGDataType.int, connection: value2),
+                .init(nameID: 43, dataType: SGDataType.vector4h, connection: trueResult),
+                .init(nameID: 45, dataType: SGDataType.vector4h, connection: falseResult),
             ],
             outputs: [.init(dataType: SGDataType.vector4h)])))
     }
     if SGDataType.bool.matches(value1) && SGDataType.bool.matches(value2) && SGDataType.half.matches(trueResult) && SGDataType.half.matches(falseResult) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_ifequal_halfB",
+            nodeTypeID: 377, // ND_ifequal_halfB
             inputs: [
-                .init(name: "value1", dataType: SGDataType.bool, connection: value1),
-                .init(name: "value2", dataType: SGDataType.bool, connection: value2),
-                .init(name: "in1", dataType: SGDataType.half, connection: trueResult),
-                .init(name: "in2", dataType: SGDataType.half, connection: falseResult),
+                .init(nameID: 123, dataType: SGDataType.bool, connection: value1),
+                .init(nameID: 124, dataType: SGDataType.bool, connection: value2),
+                .init(nameID: 43, dataType: SGDataType.half, connection: trueResult),
+                .init(nameID: 45, dataType: SGDataType.half, connection: falseResult),
             ],
             outputs: [.init(dataType: SGDataType.half)])))
     }
     if SGDataType.int.matches(value1) && SGDataType.int.matches(value2) && SGDataType.half.matches(trueResult) && SGDataType.half.matches(falseResult) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_ifequal_halfI",
+            nodeTypeID: 378, // ND_ifequal_halfI
             inputs: [
-                .init(name: "value1", dataType: SGDataType.int, connection: value1),
-                .init(name: "value2", dataType: SGDataType.int, connection: value2),
-                .init(name: "in1", dataType: SGDataType.half, connection: trueResult),
-                .init(name: "in2", dataType: SGDataType.half, connection: falseResult),
+                .init(nameID: 123, dataType: SGDataType.int, connection: value1),
+                .init(nameID: 124, dataType: SGDataType.int, connection: value2),
+                .init(nameID: 43, dataType: SGDataType.half, connection: trueResult),
+                .init(nameID: 45, dataType: SGDataType.half, connection: falseResult),
             ],
             outputs: [.init(dataType: SGDataType.half)])))
     }
     if SGDataType.float.matches(value1) && SGDataType.float.matches(value2) && SGDataType.vector2f.matches(trueResult) && SGDataType.vector2f.matches(falseResult) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_ifequal_vector2",
+            nodeTypeID: 379, // ND_ifequal_vector2
             inputs: [
-                .init(name: "value1", dataType: SGDataType.float, connection: value1),
-                .init(name: "value2", dataType: SGDataType.float, connection: value2),
-                .init(name: "in1", dataType: SGDataType.vector2f, connection: trueResult),
-                .init(name: "in2", dataType: SGDataType.vector2f, connection: falseResult),
+                .init(nameID: 123, dataType: SGDataType.float, connection: value1),
+                .init(nameID: 124, dataType: SGDataType.float, connection: value2),
+                .init(nameID: 43, dataType: SGDataType.vector2f, connection: trueResult),
+                .init(nameID: 45, dataType: SGDataType.vector2f, connection: falseResult),
             ],
             outputs: [.init(dataType: SGDataType.vector2f)])))
     }
     if SGDataType.bool.matches(value1) && SGDataType.bool.matches(value2) && SGDataType.vector2f.matches(trueResult) && SGDataType.vector2f.matches(falseResult) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_ifequal_vector2B",
+            nodeTypeID: 380, // ND_ifequal_vector2B
             inputs: [
-                .init(name: "value1", dataType: SGDataType.bool, connection: value1),
-                .init(name: "value2", dataType: SGDataType.bool, connection: value2),
-                .init(name: "in1", dataType: SGDataType.vector2f, connection: trueResult),
-                .init(name: "in2", dataType: SGDataType.vector2f, connection: falseResult),
+                .init(nameID: 123, dataType: SGDataType.bool, connection: value1),
+                .init(nameID: 124, dataType: SGDataType.bool, connection: value2),
+                .init(nameID: 43, dataType: SGDataType.vector2f, connection: trueResult),
+                .init(nameID: 45, dataType: SGDataType.vector2f, connection: falseResult),
             ],
             outputs: [.init(dataType: SGDataType.vector2f)])))
     }
     if SGDataType.int.matches(value1) && SGDataType.int.matches(value2) && SGDataType.vector2f.matches(trueResult) && SGDataType.vector2f.matches(falseResult) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_ifequal_vector2I",
+            nodeTypeID: 381, // ND_ifequal_vector2I
             inputs: [
-                .init(name: "value1", dataType: SGDataType.int, connection: value1),
-                .init(name: "value2", dataType: SGDataType.int, connection: value2),
-                .init(name: "in1", dataType: SGDataType.vector2f, connection: trueResult),
-                .init(name: "in2", dataType: SGDataType.vector2f, connection: falseResult),
+                .init(nameID: 123, dataType: SGDataType.int, connection: value1),
+                .init(nameID: 124, dataType: SGDataType.int, connection: value2),
+                .init(nameID: 43, dataType: SGDataType.vector2f, connection: trueResult),
+                .init(nameID: 45, dataType: SGDataType.vector2f, connection: falseResult),
             ],
             outputs: [.init(dataType: SGDataType.vector2f)])))
     }
     if SGDataType.float.matches(value1) && SGDataType.float.matches(value2) && SGDataType.vector3f.matches(trueResult) && SGDataType.vector3f.matches(falseResult) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_ifequal_vector3",
+            nodeTypeID: 382, // ND_ifequal_vector3
             inputs: [
-                .init(name: "value1", dataType: SGDataType.float, connection: value1),
-                .init(name: "value2", dataType: SGDataType.float, connection: value2),
-                .init(name: "in1", dataType: SGDataType.vector3f, connection: trueResult),
-                .init(name: "in2", dataType: SGDataType.vector3f, connection: falseResult),
+                .init(nameID: 123, dataType: SGDataType.float, connection: value1),
+                .init(nameID: 124, dataType: SGDataType.float, connection: value2),
+                .init(nameID: 43, dataType: SGDataType.vector3f, connection: trueResult),
+                .init(nameID: 45, dataType: SGDataType.vector3f, connection: falseResult),
             ],
             outputs: [.init(dataType: SGDataType.vector3f)])))
     }
     if SGDataType.bool.matches(value1) && SGDataType.bool.matches(value2) && SGDataType.vector3f.matches(trueResult) && SGDataType.vector3f.matches(falseResult) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_ifequal_vector3B",
+            nodeTypeID: 383, // ND_ifequal_vector3B
             inputs: [
-                .init(name: "value1", dataType: SGDataType.bool, connection: value1),
-                .init(name: "value2", dataType: SGDataType.bool, connection: value2),
-                .init(name: "in1", dataType: SGDataType.vector3f, connection: trueResult),
-                .init(name: "in2", dataType: SGDataType.vector3f, connection: falseResult),
+                .init(nameID: 123, dataType: SGDataType.bool, connection: value1),
+                .init(nameID: 124, dataType: SGDataType.bool, connection: value2),
+                .init(nameID: 43, dataType: SGDataType.vector3f, connection: trueResult),
+                .init(nameID: 45, dataType: SGDataType.vector3f, connection: falseResult),
             ],
             outputs: [.init(dataType: SGDataType.vector3f)])))
     }
     if SGDataType.int.matches(value1) && SGDataType.int.matches(value2) && SGDataType.vector3f.matches(trueResult) && SGDataType.vector3f.matches(falseResult) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_ifequal_vector3I",
+            nodeTypeID: 384, // ND_ifequal_vector3I
             inputs: [
-                .init(name: "value1", dataType: SGDataType.int, connection: value1),
-                .init(name: "value2", dataType: SGDataType.int, connection: value2),
-                .init(name: "in1", dataType: SGDataType.vector3f, connection: trueResult),
-                .init(name: "in2", dataType: SGDataType.vector3f, connection: falseResult),
+                .init(nameID: 123, dataType: SGDataType.int, connection: value1),
+                .init(nameID: 124, dataType: SGDataType.int, connection: value2),
+                .init(nameID: 43, dataType: SGDataType.vector3f, connection: trueResult),
+                .init(nameID: 45, dataType: SGDataType.vector3f, connection: falseResult),
             ],
             outputs: [.init(dataType: SGDataType.vector3f)])))
     }
     if SGDataType.float.matches(value1) && SGDataType.float.matches(value2) && SGDataType.vector4f.matches(trueResult) && SGDataType.vector4f.matches(falseResult) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_ifequal_vector4",
+            nodeTypeID: 385, // ND_ifequal_vector4
             inputs: [
-                .init(name: "value1", dataType: SGDataType.float, connection: value1),
-                .init(name: "value2", dataType: SGDataType.float, connection: value2),
-                .init(name: "in1", dataType: SGDataType.vector4f, connection: trueResult),
-                .init(name: "in2", dataType: SGDataType.vector4f, connection: falseResult),
+                .init(nameID: 123, dataType: SGDataType.float, connection: value1),
+                .init(nameID: 124, dataType: SGDataType.float, connection: value2),
+                .init(nameID: 43, dataType: SGDataType.vector4f, connection: trueResult),
+                .init(nameID: 45, dataType: SGDataType.vector4f, connection: falseResult),
             ],
             outputs: [.init(dataType: SGDataType.vector4f)])))
     }
     if SGDataType.bool.matches(value1) && SGDataType.bool.matches(value2) && SGDataType.vector4f.matches(trueResult) && SGDataType.vector4f.matches(falseResult) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_ifequal_vector4B",
+            nodeTypeID: 386, // ND_ifequal_vector4B
             inputs: [
-                .init(name: "value1", dataType: SGDataType.bool, connection: value1),
-                .init(name: "value2", dataType: SGDataType.bool, connection: value2),
-                .init(name: "in1", dataType: SGDataType.vector4f, connection: trueResult),
-                .init(name: "in2", dataType: SGDataType.vector4f, connection: falseResult),
+                .init(nameID: 123, dataType: SGDataType.bool, connection: value1),
+                .init(nameID: 124, dataType: SGDataType.bool, connection: value2),
+                .init(nameID: 43, dataType: SGDataType.vector4f, connection: trueResult),
+                .init(nameID: 45, dataType: SGDataType.vector4f, connection: falseResult),
             ],
             outputs: [.init(dataType: SGDataType.vector4f)])))
     }
     if SGDataType.int.matches(value1) && SGDataType.int.matches(value2) && SGDataType.vector4f.matches(trueResult) && SGDataType.vector4f.matches(falseResult) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_ifequal_vector4I",
+            nodeTypeID: 387, // ND_ifequal_vector4I
             inputs: [
-                .init(name: "value1", dataType: SGDataType.int, connection: value1),
-                .init(name: "value2", dataType: SGDataType.int, connection: value2),
-                .init(name: "in1", dataType: SGDataType.vector4f, connection: trueResult),
-                .init(name: "in2", dataType: SGDataType.vector4f, connection: falseResult),
+                .init(nameID: 123, dataType: SGDataType.int, connection: value1),
+                .init(nameID: 124, dataType: SGDataType.int, connection: value2),
+                .init(nameID: 43, dataType: SGDataType.vector4f, connection: trueResult),
+                .init(nameID: 45, dataType: SGDataType.vector4f, connection: falseResult),
             ],
             outputs: [.init(dataType: SGDataType.vector4f)])))
     }
@@ -2357,221 +2357,221 @@ public func ifEqual<T>(_ value1: SGValue, _ value2: SGValue, trueResult: T, fals
 public func ifGreater<T>(_ value1: SGScalar, _ value2: SGScalar, trueResult: T, falseResult: T) -> T where T: SGNumeric {
     if SGDataType.float.matches(value1) && SGDataType.float.matches(value2) && SGDataType.color3f.matches(trueResult) && SGDataType.color3f.matches(falseResult) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_ifgreater_color3",
+            nodeTypeID: 388, // ND_ifgreater_color3
             inputs: [
-                .init(name: "value1", dataType: SGDataType.float, connection: value1),
-                .init(name: "value2", dataType: SGDataType.float, connection: value2),
-                .init(name: "in1", dataType: SGDataType.color3f, connection: trueResult),
-                .init(name: "in2", dataType: SGDataType.color3f, connection: falseResult),
+                .init(nameID: 123, dataType: SGDataType.float, connection: value1),
+                .init(nameID: 124, dataType: SGDataType.float, connection: value2),
+                .init(nameID: 43, dataType: SGDataType.color3f, connection: trueResult),
+                .init(nameID: 45, dataType: SGDataType.color3f, connection: falseResult),
             ],
             outputs: [.init(dataType: SGDataType.color3f)])))
     }
     if SGDataType.int.matches(value1) && SGDataType.int.matches(value2) && SGDataType.color3f.matches(trueResult) && SGDataType.color3f.matches(falseResult) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_ifgreater_color3I",
+            nodeTypeID: 389, // ND_ifgreater_color3I
             inputs: [
-                .init(name: "value1", dataType: SGDataType.int, connection: value1),
-                .init(name: "value2", dataType: SGDataType.int, connection: value2),
-                .init(name: "in1", dataType: SGDataType.color3f, connection: trueResult),
-                .init(name: "in2", dataType: SGDataType.color3f, connection: falseResult),
+                .init(nameID: 123, dataType: SGDataType.int, connection: value1),
+                .init(nameID: 124, dataType: SGDataType.int, connection: value2),
+                .init(nameID: 43, dataType: SGDataType.color3f, connection: trueResult),
+                .init(nameID: 45, dataType: SGDataType.color3f, connection: falseResult),
             ],
             outputs: [.init(dataType: SGDataType.color3f)])))
     }
     if SGDataType.float.matches(value1) && SGDataType.float.matches(value2) && SGDataType.color4f.matches(trueResult) && SGDataType.color4f.matches(falseResult) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_ifgreater_color4",
+            nodeTypeID: 390, // ND_ifgreater_color4
             inputs: [
-                .init(name: "value1", dataType: SGDataType.float, connection: value1),
-                .init(name: "value2", dataType: SGDataType.float, connection: value2),
-                .init(name: "in1", dataType: SGDataType.color4f, connection: trueResult),
-                .init(name: "in2", dataType: SGDataType.color4f, connection: falseResult),
+                .init(nameID: 123, dataType: SGDataType.float, connection: value1),
+                .init(nameID: 124, dataType: SGDataType.float, connection: value2),
+                .init(nameID: 43, dataType: SGDataType.color4f, connection: trueResult),
+                .init(nameID: 45, dataType: SGDataType.color4f, connection: falseResult),
             ],
             outputs: [.init(dataType: SGDataType.color4f)])))
     }
     if SGDataType.int.matches(value1) && SGDataType.int.matches(value2) && SGDataType.color4f.matches(trueResult) && SGDataType.color4f.matches(falseResult) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_ifgreater_color4I",
+            nodeTypeID: 391, // ND_ifgreater_color4I
             inputs: [
-                .init(name: "value1", dataType: SGDataType.int, connection: value1),
-                .init(name: "value2", dataType: SGDataType.int, connection: value2),
-                .init(name: "in1", dataType: SGDataType.color4f, connection: trueResult),
-                .init(name: "in2", dataType: SGDataType.color4f, connection: falseResult),
+                .init(nameID: 123, dataType: SGDataType.int, connection: value1),
+                .init(nameID: 124, dataType: SGDataType.int, connection: value2),
+                .init(nameID: 43, dataType: SGDataType.color4f, connection: trueResult),
+                .init(nameID: 45, dataType: SGDataType.color4f, connection: falseResult),
             ],
             outputs: [.init(dataType: SGDataType.color4f)])))
     }
     if SGDataType.float.matches(value1) && SGDataType.float.matches(value2) && SGDataType.float.matches(trueResult) && SGDataType.float.matches(falseResult) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_ifgreater_float",
+            nodeTypeID: 392, // ND_ifgreater_float
             inputs: [
-                .init(name: "value1", dataType: SGDataType.float, connection: value1),
-                .init(name: "value2", dataType: SGDataType.float, connection: value2),
-                .init(name: "in1", dataType: SGDataType.float, connection: trueResult),
-                .init(name: "in2", dataType: SGDataType.float, connection: falseResult),
+                .init(nameID: 123, dataType: SGDataType.float, connection: value1),
+                .init(nameID: 124, dataType: SGDataType.float, connection: value2),
+                .init(nameID: 43, dataType: SGDataType.float, connection: trueResult),
+                .init(nameID: 45, dataType: SGDataType.float, connection: falseResult),
             ],
             outputs: [.init(dataType: SGDataType.float)])))
     }
     if SGDataType.int.matches(value1) && SGDataType.int.matches(value2) && SGDataType.float.matches(trueResult) && SGDataType.float.matches(falseResult) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_ifgreater_floatI",
+            nodeTypeID: 393, // ND_ifgreater_floatI
             inputs: [
-                .init(name: "value1", dataType: SGDataType.int, connection: value1),
-                .init(name: "value2", dataType: SGDataType.int, connection: value2),
-                .init(name: "in1", dataType: SGDataType.float, connection: trueResult),
-                .init(name: "in2", dataType: SGDataType.float, connection: falseResult),
+                .init(nameID: 123, dataType: SGDataType.int, connection: value1),
+                .init(nameID: 124, dataType: SGDataType.int, connection: value2),
+                .init(nameID: 43, dataType: SGDataType.float, connection: trueResult),
+                .init(nameID: 45, dataType: SGDataType.float, connection: falseResult),
             ],
             outputs: [.init(dataType: SGDataType.float)])))
     }
     if SGDataType.half.matches(value1) && SGDataType.half.matches(value2) && SGDataType.half.matches(trueResult) && SGDataType.half.matches(falseResult) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_ifgreater_half",
+            nodeTypeID: 394, // ND_ifgreater_half
             inputs: [
-                .init(name: "value1", dataType: SGDataType.half, connection: value1),
-                .init(name: "value2", dataType: SGDataType.half, connection: value2),
-                .init(name: "in1", dataType: SGDataType.half, connection: trueResult),
-                .init(name: "in2", dataType: SGDataType.half, connection: falseResult),
+                .init(nameID: 123, dataType: SGDataType.half, connection: value1),
+                .init(nameID: 124, dataType: SGDataType.half, connection: value2),
+                .init(nameID: 43, dataType: SGDataType.half, connection: trueResult),
+                .init(nameID: 45, dataType: SGDataType.half, connection: falseResult),
             ],
             outputs: [.init(dataType: SGDataType.half)])))
     }
     if SGDataType.float.matches(value1) && SGDataType.float.matches(value2) && SGDataType.vector2h.matches(trueResult) && SGDataType.vector2h.matches(falseResult) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_ifgreater_half2",
+            nodeTypeID: 395, // ND_ifgreater_half2
             inputs: [
-                .init(name: "value1", dataType: SGDataType.float, connection: value1),
-                .init(name: "value2", dataType: SGDataType.float, connection: value2),
-                .init(name: "in1", dataType: SGDataType.vector2h, connection: trueResult),
-                .init(name: "in2", dataType: SGDataType.vector2h, connection: falseResult),
+                .init(nameID: 123, dataType: SGDataType.float, connection: value1),
+                .init(nameID: 124, dataType: SGDataType.float, connection: value2),
+                .init(nameID: 43, dataType: SGDataType.vector2h, connection: trueResult),
+                .init(nameID: 45, dataType: SGDataType.vector2h, connection: falseResult),
             ],
             outputs: [.init(dataType: SGDataType.vector2h)])))
     }
     if SGDataType.int.matches(value1) && SGDataType.int.matches(value2) && SGDataType.vector2h.matches(trueResult) && SGDataType.vector2h.matches(falseResult) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_ifgreater_half2I",
+            nodeTypeID: 396, // ND_ifgreater_half2I
             inputs: [
-                .init(name: "value1", dataType: SGDataType.int, connection: value1),
-                .init(name: "value2", dataType: SGDataType.int, connection: value2),
-                .init(name: "in1", dataType: SGDataType.vector2h, connection: trueResult),
-                .init(name: "in2", dataType: SGDataType.vector2h, connection: falseResult),
+                .init(nameID: 123, dataType: SGDataType.int, connection: value1),
+                .init(nameID: 124, dataType: SGDataType.int, connection: value2),
+                .init(nameID: 43, dataType: SGDataType.vector2h, connection: trueResult),
+                .init(nameID: 45, dataType: SGDataType.vector2h, connection: falseResult),
             ],
             outputs: [.init(dataType: SGDataType.vector2h)])))
     }
     if SGDataType.float.matches(value1) && SGDataType.float.matches(value2) && SGDataType.vector3h.matches(trueResult) && SGDataType.vector3h.matches(falseResult) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_ifgreater_half3",
+            nodeTypeID: 397, // ND_ifgreater_half3
             inputs: [
-                .init(name: "value1", dataType: SGDataType.float, connection: value1),
-                .init(name: "value2", dataType: SGDataType.float, connection: value2),
-                .init(name: "in1", dataType: SGDataType.vector3h, connection: trueResult),
-                .init(name: "in2", dataType: SGDataType.vector3h, connection: falseResult),
+                .init(nameID: 123, dataType: SGDataType.float, connection: value1),
+                .init(nameID: 124, dataType: SGDataType.float, connection: value2),
+                .init(nameID: 43, dataType: SGDataType.vector3h, connection: trueResult),
+                .init(nameID: 45, dataType: SGDataType.vector3h, connection: falseResult),
             ],
             outputs: [.init(dataType: SGDataType.vector3h)])))
     }
     if SGDataType.int.matches(value1) && SGDataType.int.matches(value2) && SGDataType.vector3h.matches(trueResult) && SGDataType.vector3h.matches(falseResult) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_ifgreater_half3I",
+            nodeTypeID: 398, // ND_ifgreater_half3I
             inputs: [
-                .init(name: "value1", dataType: SGDataType.int, connection: value1),
-                .init(name: "value2", dataType: SGDataType.int, connection: value2),
-                .init(name: "in1", dataType: SGDataType.vector3h, connection: trueResult),
-                .init(name: "in2", dataType: SGDataType.vector3h, connection: falseResult),
+                .init(nameID: 123, dataType: SGDataType.int, connection: value1),
+                .init(nameID: 124, dataType: SGDataType.int, connection: value2),
+                .init(nameID: 43, dataType: SGDataType.vector3h, connection: trueResult),
+                .init(nameID: 45, dataType: SGDataType.vector3h, connection: falseResult),
             ],
             outputs: [.init(dataType: SGDataType.vector3h)])))
     }
     if SGDataType.float.matches(value1) && SGDataType.float.matches(value2) && SGDataType.vector4h.matches(trueResult) && SGDataType.vector4h.matches(falseResult) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_ifgreater_half4",
+            nodeTypeID: 399, // ND_ifgreater_half4
             inputs: [
-                .init(name: "value1", dataType: SGDataType.float, connection: value1),
-                .init(name: "value2", dataType: SGDataType.float, connection: value2),
-                .init(name: "in1", dataType: SGDataType.vector4h, connection: trueResult),
-                .init(name: "in2", dataType: SGDataType.vector4h, connection: falseResult),
+                .init(nameID: 123, dataType: SGDataType.float, connection: value1),
+                .init(nameID: 124, dataType: SGDataType.float, connection: value2),
+                .init(nameID: 43, dataType: SGDataType.vector4h, connection: trueResult),
+                .init(nameID: 45, dataType: SGDataType.vector4h, connection: falseResult),
             ],
             outputs: [.init(dataType: SGDataType.vector4h)])))
     }
     if SGDataType.int.matches(value1) && SGDataType.int.matches(value2) && SGDataType.vector4h.matches(trueResult) && SGDataType.vector4h.matches(falseResult) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_ifgreater_half4I",
+            nodeTypeID: 400, // ND_ifgreater_half4I
             inputs: [
-                .init(name: "value1", dataType: SGDataType.int, connection: value1),
-                .init(name: "value2", dataType: SGDataType.int, connection: value2),
-                .init(name: "in1", dataType: SGDataType.vector4h, connection: trueResult),
-                .init(name: "in2", dataType: SGDataType.vector4h, connection: falseResult),
+                .init(nameID: 123, dataType: SGDataType.int, connection: value1),
+                .init(nameID: 124, dataType: SGDataType.int, connection: value2),
+                .init(nameID: 43, dataType: SGDataType.vector4h, connection: trueResult),
+                .init(nameID: 45, dataType: SGDataType.vector4h, connection: falseResult),
             ],
             outputs: [.init(dataType: SGDataType.vector4h)])))
     }
     if SGDataType.int.matches(value1) && SGDataType.int.matches(value2) && SGDataType.half.matches(trueResult) && SGDataType.half.matches(falseResult) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_ifgreater_halfI",
+            nodeTypeID: 401, // ND_ifgreater_halfI
             inputs: [
-                .init(name: "value1", dataType: SGDataType.int, connection: value1),
-                .init(name: "value2", dataType: SGDataType.int, connection: value2),
-                .init(name: "in1", dataType: SGDataType.half, connection: trueResult),
-                .init(name: "in2", dataType: SGDataType.half, connection: falseResult),
+                .init(nameID: 123, dataType: SGDataType.int, connection: value1),
+                .init(nameID: 124, dataType: SGDataType.int, connection: value2),
+                .init(nameID: 43, dataType: SGDataType.half, connection: trueResult),
+                .init(nameID: 45, dataType: SGDataType.half, connection: falseResult),
             ],
             outputs: [.init(dataType: SGDataType.half)])))
     }
     if SGDataType.float.matches(value1) && SGDataType.float.matches(value2) && SGDataType.vector2f.matches(trueResult) && SGDataType.vector2f.matches(falseResult) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_ifgreater_vector2",
+            nodeTypeID: 402, // ND_ifgreater_vector2
             inputs: [
-                .init(name: "value1", dataType: SGDataType.float, connection: value1),
-                .init(name: "value2", dataType: SGDataType.float, connection: value2),
-                .init(name: "in1", dataType: SGDataType.vector2f, connection: trueResult),
-                .init(name: "in2", dataType: SGDataType.vector2f, connection: falseResult),
+                .init(nameID: 123, dataType: SGDataType.float, connection: value1),
+                .init(nameID: 124, dataType: SGDataType.float, connection: value2),
+                .init(nameID: 43, dataType: SGDataType.vector2f, connection: trueResult),
+                .init(nameID: 45, dataType: SGDataType.vector2f, connection: falseResult),
             ],
             outputs: [.init(dataType: SGDataType.vector2f)])))
     }
     if SGDataType.int.matches(value1) && SGDataType.int.matches(value2) && SGDataType.vector2f.matches(trueResult) && SGDataType.vector2f.matches(falseResult) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_ifgreater_vector2I",
+            nodeTypeID: 403, // ND_ifgreater_vector2I
             inputs: [
-                .init(name: "value1", dataType: SGDataType.int, connection: value1),
-                .init(name: "value2", dataType: SGDataType.int, connection: value2),
-                .init(name: "in1", dataType: SGDataType.vector2f, connection: trueResult),
-                .init(name: "in2", dataType: SGDataType.vector2f, connection: falseResult),
+                .init(nameID: 123, dataType: SGDataType.int, connection: value1),
+                .init(nameID: 124, dataType: SGDataType.int, connection: value2),
+                .init(nameID: 43, dataType: SGDataType.vector2f, connection: trueResult),
+                .init(nameID: 45, dataType: SGDataType.vector2f, connection: falseResult),
             ],
             outputs: [.init(dataType: SGDataType.vector2f)])))
     }
     if SGDataType.float.matches(value1) && SGDataType.float.matches(value2) && SGDataType.vector3f.matches(trueResult) && SGDataType.vector3f.matches(falseResult) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_ifgreater_vector3",
+            nodeTypeID: 404, // ND_ifgreater_vector3
             inputs: [
-                .init(name: "value1", dataType: SGDataType.float, connection: value1),
-                .init(name: "value2", dataType: SGDataType.float, connection: value2),
-                .init(name: "in1", dataType: SGDataType.vector3f, connection: trueResult),
-                .init(name: "in2", dataType: SGDataType.vector3f, connection: falseResult),
+                .init(nameID: 123, dataType: SGDataType.float, connection: value1),
+                .init(nameID: 124, dataType: SGDataType.float, connection: value2),
+                .init(nameID: 43, dataType: SGDataType.vector3f, connection: trueResult),
+                .init(nameID: 45, dataType: SGDataType.vector3f, connection: falseResult),
             ],
             outputs: [.init(dataType: SGDataType.vector3f)])))
     }
     if SGDataType.int.matches(value1) && SGDataType.int.matches(value2) && SGDataType.vector3f.matches(trueResult) && SGDataType.vector3f.matches(falseResult) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_ifgreater_vector3I",
+            nodeTypeID: 405, // ND_ifgreater_vector3I
             inputs: [
-                .init(name: "value1", dataType: SGDataType.int, connection: value1),
-                .init(name: "value2", dataType: SGDataType.int, connection: value2),
-                .init(name: "in1", dataType: SGDataType.vector3f, connection: trueResult),
-                .init(name: "in2", dataType: SGDataType.vector3f, connection: falseResult),
+                .init(nameID: 123, dataType: SGDataType.int, connection: value1),
+                .init(nameID: 124, dataType: SGDataType.int, connection: value2),
+                .init(nameID: 43, dataType: SGDataType.vector3f, connection: trueResult),
+                .init(nameID: 45, dataType: SGDataType.vector3f, connection: falseResult),
             ],
             outputs: [.init(dataType: SGDataType.vector3f)])))
     }
     if SGDataType.float.matches(value1) && SGDataType.float.matches(value2) && SGDataType.vector4f.matches(trueResult) && SGDataType.vector4f.matches(falseResult) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_ifgreater_vector4",
+            nodeTypeID: 406, // ND_ifgreater_vector4
             inputs: [
-                .init(name: "value1", dataType: SGDataType.float, connection: value1),
-                .init(name: "value2", dataType: SGDataType.float, connection: value2),
-                .init(name: "in1", dataType: SGDataType.vector4f, connection: trueResult),
-                .init(name: "in2", dataType: SGDataType.vector4f, connection: falseResult),
+                .init(nameID: 123, dataType: SGDataType.float, connection: value1),
+                .init(nameID: 124, dataType: SGDataType.float, connection: value2),
+                .init(nameID: 43, dataType: SGDataType.vector4f, connection: trueResult),
+                .init(nameID: 45, dataType: SGDataType.vector4f, connection: falseResult),
             ],
             outputs: [.init(dataType: SGDataType.vector4f)])))
     }
     if SGDataType.int.matches(value1) && SGDataType.int.matches(value2) && SGDataType.vector4f.matches(trueResult) && SGDataType.vector4f.matches(falseResult) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_ifgreater_vector4I",
+            nodeTypeID: 407, // ND_ifgreater_vector4I
             inputs: [
-                .init(name: "value1", dataType: SGDataType.int, connection: value1),
-                .init(name: "value2", dataType: SGDataType.int, connection: value2),
-                .init(name: "in1", dataType: SGDataType.vector4f, connection: trueResult),
-                .init(name: "in2", dataType: SGDataType.vector4f, connection: falseResult),
+                .init(nameID: 123, dataType: SGDataType.int, connection: value1),
+                .init(nameID: 124, dataType: SGDataType.int, connection: value2),
+                .init(nameID: 43, dataType: SGDataType.vector4f, connection: trueResult),
+                .init(nameID: 45, dataType: SGDataType.vector4f, connection: falseResult),
             ],
             outputs: [.init(dataType: SGDataType.vector4f)])))
     }
@@ -2581,221 +2581,221 @@ public func ifGreater<T>(_ value1: SGScalar, _ value2: SGScalar, trueResult: T,
 public func ifGreaterOrEqual<T>(_ value1: SGScalar, _ value2: SGScalar, trueResult: T, falseResult: T) -> T where T: SGNumeric {
     if SGDataType.float.matches(value1) && SGDataType.float.matches(value2) && SGDataType.color3f.matches(trueResult) && SGDataType.color3f.matches(falseResult) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_ifgreatereq_color3",
+            nodeTypeID: 408, // ND_ifgreatereq_color3
             inputs: [
-                .init(name: "value1", dataType: SGDataType.float, connection: value1),
-                .init(name: "value2", dataType: SGDataType.float, connection: value2),
-                .init(name: "in1", dataType: SGDataType.color3f, connection: trueResult),
-                .init(name: "in2", dataType: SGDataType.color3f, connection: falseResult),
+                .init(nameID: 123, dataType: SGDataType.float, connection: value1),
+                .init(nameID: 124, dataType: SGDataType.float, connection: value2),
+                .init(nameID: 43, dataType: SGDataType.color3f, connection: trueResult),
+                .init(nameID: 45, dataType: SGDataType.color3f, connection: falseResult),
             ],
             outputs: [.init(dataType: SGDataType.color3f)])))
     }
     if SGDataType.int.matches(value1) && SGDataType.int.matches(value2) && SGDataType.color3f.matches(trueResult) && SGDataType.color3f.matches(falseResult) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_ifgreatereq_color3I",
+            nodeTypeID: 409, // ND_ifgreatereq_color3I
             inputs: [
-                .init(name: "value1", dataType: SGDataType.int, connection: value1),
-                .init(name: "value2", dataType: SGDataType.int, connection: value2),
-                .init(name: "in1", dataType: SGDataType.color3f, connection: trueResult),
-                .init(name: "in2", dataType: SGDataType.color3f, connection: falseResult),
+                .init(nameID: 123, dataType: SGDataType.int, connection: value1),
+                .init(nameID: 124, dataType: SGDataType.int, connection: value2),
+                .init(nameID: 43, dataType: SGDataType.color3f, connection: trueResult),
+                .init(nameID: 45, dataType: SGDataType.color3f, connection: falseResult),
             ],
             outputs: [.init(dataType: SGDataType.color3f)])))
     }
     if SGDataType.float.matches(value1) && SGDataType.float.matches(value2) && SGDataType.color4f.matches(trueResult) && SGDataType.color4f.matches(falseResult) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_ifgreatereq_color4",
+            nodeTypeID: 410, // ND_ifgreatereq_color4
             inputs: [
-                .init(name: "value1", dataType: SGDataType.float, connection: value1),
-                .init(name: "value2", dataType: SGDataType.float, connection: value2),
-                .init(name: "in1", dataType: SGDataType.color4f, connection: trueResult),
-                .init(name: "in2", dataType: SGDataType.color4f, connection: falseResult),
+                .init(nameID: 123, dataType: SGDataType.float, connection: value1),
+                .init(nameID: 124, dataType: SGDataType.float, connection: value2),
+                .init(nameID: 43, dataType: SGDataType.color4f, connection: trueResult),
+                .init(nameID: 45, dataType: SGDataType.color4f, connection: falseResult),
             ],
             outputs: [.init(dataType: SGDataType.color4f)])))
     }
     if SGDataType.int.matches(value1) && SGDataType.int.matches(value2) && SGDataType.color4f.matches(trueResult) && SGDataType.color4f.matches(falseResult) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_ifgreatereq_color4I",
+            nodeTypeID: 411, // ND_ifgreatereq_color4I
             inputs: [
-                .init(name: "value1", dataType: SGDataType.int, connection: value1),
-                .init(name: "value2", dataType: SGDataType.int, connection: value2),
-                .init(name: "in1", dataType: SGDataType.color4f, connection: trueResult),
-                .init(name: "in2", dataType: SGDataType.color4f, connection: falseResult),
+                .init(nameID: 123, dataType: SGDataType.int, connection: value1),
+                .init(nameID: 124, dataType: SGDataType.int, connection: value2),
+                .init(nameID: 43, dataType: SGDataType.color4f, connection: trueResult),
+                .init(nameID: 45, dataType: SGDataType.color4f, connection: falseResult),
             ],
             outputs: [.init(dataType: SGDataType.color4f)])))
     }
     if SGDataType.float.matches(value1) && SGDataType.float.matches(value2) && SGDataType.float.matches(trueResult) && SGDataType.float.matches(falseResult) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_ifgreatereq_float",
+            nodeTypeID: 412, // ND_ifgreatereq_float
             inputs: [
-                .init(name: "value1", dataType: SGDataType.float, connection: value1),
-                .init(name: "value2", dataType: SGDataType.float, connection: value2),
-                .init(name: "in1", dataType: SGDataType.float, connection: trueResult),
-                .init(name: "in2", dataType: SGDataType.float, connection: falseResult),
+                .init(nameID: 123, dataType: SGDataType.float, connection: value1),
+                .init(nameID: 124, dataType: SGDataType.float, connection: value2),
+                .init(nameID: 43, dataType: SGDataType.float, connection: trueResult),
+                .init(nameID: 45, dataType: SGDataType.float, connection: falseResult),
             ],
             outputs: [.init(dataType: SGDataType.float)])))
     }
     if SGDataType.int.matches(value1) && SGDataType.int.matches(value2) && SGDataType.float.matches(trueResult) && SGDataType.float.matches(falseResult) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_ifgreatereq_floatI",
+            nodeTypeID: 413, // ND_ifgreatereq_floatI
             inputs: [
-                .init(name: "value1", dataType: SGDataType.int, connection: value1),
-                .init(name: "value2", dataType: SGDataType.int, connection: value2),
-                .init(name: "in1", dataType: SGDataType.float, connection: trueResult),
-                .init(name: "in2", dataType: SGDataType.float, connection: falseResult),
+                .init(nameID: 123, dataType: SGDataType.int, connection: value1),
+                .init(nameID: 124, dataType: SGDataType.int, connection: value2),
+                .init(nameID: 43, dataType: SGDataType.float, connection: trueResult),
+                .init(nameID: 45, dataType: SGDataType.float, connection: falseResult),
             ],
             outputs: [.init(dataType: SGDataType.float)])))
     }
     if SGDataType.half.matches(value1) && SGDataType.half.matches(value2) && SGDataType.half.matches(trueResult) && SGDataType.half.matches(falseResult) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_ifgreatereq_half",
+            nodeTypeID: 414, // ND_ifgreatereq_half
             inputs: [
-                .init(name: "value1", dataType: SGDataType.half, connection: value1),
-                .init(name: "value2", dataType: SGDataType.half, connection: value2),
-                .init(name: "in1", dataType: SGDataType.half, connection: trueResult),
-                .init(name: "in2", dataType: SGDataType.half, connection: falseResult),
+                .init(nameID: 123, dataType: SGDataType.half, connection: value1),
+                .init(nameID: 124, dataType: SGDataType.half, connection: value2),
+                .init(nameID: 43, dataType: SGDataType.half, connection: trueResult),
+                .init(nameID: 45, dataType: SGDataType.half, connection: falseResult),
             ],
             outputs: [.init(dataType: SGDataType.half)])))
     }
     if SGDataType.float.matches(value1) && SGDataType.float.matches(value2) && SGDataType.vector2h.matches(trueResult) && SGDataType.vector2h.matches(falseResult) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_ifgreatereq_half2",
+            nodeTypeID: 415, // ND_ifgreatereq_half2
             inputs: [
-                .init(name: "value1", dataType: SGDataType.float, connection: value1),
-                .init(name: "value2", dataType: SGDataType.float, connection: value2),
-                .init(name: "in1", dataType: SGDataType.vector2h, connection: trueResult),
-                .init(name: "in2", dataType: SGDataType.vector2h, connection: falseResult),
+                .init(nameID: 123, dataType: SGDataType.float, connection: value1),
+                .init(nameID: 124, dataType: SGDataType.float, connection: value2),
+                .init(nameID: 43, dataType: SGDataType.vector2h, connection: trueResult),
+                .init(nameID: 45, dataType: SGDataType.vector2h, connection: falseResult),
             ],
             outputs: [.init(dataType: SGDataType.vector2h)])))
     }
     if SGDataType.int.matches(value1) && SGDataType.int.matches(value2) && SGDataType.vector2h.matches(trueResult) && SGDataType.vector2h.matches(falseResult) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_ifgreatereq_half2I",
+            nodeTypeID: 416, // ND_ifgreatereq_half2I
             inputs: [
-                .init(name: "value1", dataType: SGDataType.int, connection: value1),
-                .init(name: "value2", dataType: SGDataType.int, connection: value2),
-                .init(name: "in1", dataType: SGDataType.vector2h, connection: trueResult),
-                .init(name: "in2", dataType: SGDataType.vector2h, connection: falseResult),
+                .init(nameID: 123, dataType: SGDataType.int, connection: value1),
+                .init(nameID: 124, dataType: SGDataType.int, connection: value2),
+                .init(nameID: 43, dataType: SGDataType.vector2h, connection: trueResult),
+                .init(nameID: 45, dataType: SGDataType.vector2h, connection: falseResult),
             ],
             outputs: [.init(dataType: SGDataType.vector2h)])))
     }
     if SGDataType.float.matches(value1) && SGDataType.float.matches(value2) && SGDataType.vector3h.matches(trueResult) && SGDataType.vector3h.matches(falseResult) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_ifgreatereq_half3",
+            nodeTypeID: 417, // ND_ifgreatereq_half3
             inputs: [
-                .init(name: "value1", dataType: SGDataType.float, connection: value1),
-                .init(name: "value2", dataType: SGDataType.float, connection: value2),
-                .init(name: "in1", dataType: SGDataType.vector3h, connection: trueResult),
-                .init(name: "in2", dataType: SGDataType.vector3h, connection: falseResult),
+                .init(nameID: 123, dataType: SGDataType.float, connection: value1),
+                .init(nameID: 124, dataType: SGDataType.float, connection: value2),
+                .init(nameID: 43, dataType: SGDataType.vector3h, connection: trueResult),
+                .init(nameID: 45, dataType: SGDataType.vector3h, connection: falseResult),
             ],
             outputs: [.init(dataType: SGDataType.vector3h)])))
     }
     if SGDataType.int.matches(value1) && SGDataType.int.matches(value2) && SGDataType.vector3h.matches(trueResult) && SGDataType.vector3h.matches(falseResult) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_ifgreatereq_half3I",
+            nodeTypeID: 418, // ND_ifgreatereq_half3I
             inputs: [
-                .init(name: "value1", dataType: SGDataType.int, connection: value1),
-                .init(name: "value2", dataType: SGDataType.int, connection: value2),
-                .init(name: "in1", dataType: SGDataType.vector3h, connection: trueResult),
-                .init(name: "in2", dataType: SGDataType.vector3h, connection: falseResult),
+                .init(nameID: 123, dataType: SGDataType.int, connection: value1),
+                .init(nameID: 124, dataType: SGDataType.int, connection: value2),
+                .init(nameID: 43, dataType: SGDataType.vector3h, connection: trueResult),
+                .init(nameID: 45, dataType: SGDataType.vector3h, connection: falseResult),
             ],
             outputs: [.init(dataType: SGDataType.vector3h)])))
     }
     if SGDataType.float.matches(value1) && SGDataType.float.matches(value2) && SGDataType.vector4h.matches(trueResult) && SGDataType.vector4h.matches(falseResult) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_ifgreatereq_half4",
+            nodeTypeID: 419, // ND_ifgreatereq_half4
             inputs: [
-                .init(name: "value1", dataType: SGDataType.float, connection: value1),
-                .init(name: "value2", dataType: SGDataType.float, connection: value2),
-                .init(name: "in1", dataType: SGDataType.vector4h, connection: trueResult),
-                .init(name: "in2", dataType: SGDataType.vector4h, connection: falseResult),
+                .init(nameID: 123, dataType: SGDataType.float, connection: value1),
+                .init(nameID: 124, dataType: SGDataType.float, connection: value2),
+                .init(nameID: 43, dataType: SGDataType.vector4h, connection: trueResult),
+                .init(nameID: 45, dataType: SGDataType.vector4h, connection: falseResult),
             ],
             outputs: [.init(dataType: SGDataType.vector4h)])))
     }
     if SGDataType.int.matches(value1) && SGDataType.int.matches(value2) && SGDataType.vector4h.matches(trueResult) && SGDataType.vector4h.matches(falseResult) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_ifgreatereq_half4I",
+            nodeTypeID: 420, // ND_ifgreatereq_half4I
             inputs: [
-                .init(name: "value1", dataType: SGDataType.int, connection: value1),
-                .init(name: "value2", dataType: SGDataType.int, connection: value2),
-                .init(name: "in1", dataType: SGDataType.vector4h, connection: trueResult),
-                .init(name: "in2", dataType: SGDataType.vector4h, connection: falseResult),
+                .init(nameID: 123, dataType: SGDataType.int, connection: value1),
+                .init(nameID: 124, dataType: SGDataType.int, connection: value2),
+                .init(nameID: 43, dataType: SGDataType.vector4h, connection: trueResult),
+                .init(nameID: 45, dataType: SGDataType.vector4h, connection: falseResult),
             ],
             outputs: [.init(dataType: SGDataType.vector4h)])))
     }
     if SGDataType.int.matches(value1) && SGDataType.int.matches(value2) && SGDataType.half.matches(trueResult) && SGDataType.half.matches(falseResult) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_ifgreatereq_halfI",
+            nodeTypeID: 421, // ND_ifgreatereq_halfI
             inputs: [
-                .init(name: "value1", dataType: SGDataType.int, connection: value1),
-                .init(name: "value2", dataType: SGDataType.int, connection: value2),
-                .init(name: "in1", dataType: SGDataType.half, connection: trueResult),
-                .init(name: "in2", dataType: SGDataType.half, connection: falseResult),
+                .init(nameID: 123, dataType: SGDataType.int, connection: value1),
+                .init(nameID: 124, dataType: SGDataType.int, connection: value2),
+                .init(nameID: 43, dataType: SGDataType.half, connection: trueResult),
+                .init(nameID: 45, dataType: SGDataType.half, connection: falseResult),
             ],
             outputs: [.init(dataType: SGDataType.half)])))
     }
     if SGDataType.float.matches(value1) && SGDataType.float.matches(value2) && SGDataType.vector2f.matches(trueResult) && SGDataType.vector2f.matches(falseResult) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_ifgreatereq_vector2",
+            nodeTypeID: 422, // ND_ifgreatereq_vector2
             inputs: [
-                .init(name: "value1", dataType: SGDataType.float, connection: value1),
-                .init(name: "value2", dataType: SGDataType.float, connection: value2),
-                .init(name: "in1", dataType: SGDataType.vector2f, connection: trueResult),
-                .init(name: "in2", dataType: SGDataType.vector2f, connection: falseResult),
+                .init(nameID: 123, dataType: SGDataType.float, connection: value1),
+                .init(nameID: 124, dataType: SGDataType.float, connection: value2),
+                .init(nameID: 43, dataType: SGDataType.vector2f, connection: trueResult),
+                .init(nameID: 45, dataType: SGDataType.vector2f, connection: falseResult),
             ],
             outputs: [.init(dataType: SGDataType.vector2f)])))
     }
     if SGDataType.int.matches(value1) && SGDataType.int.matches(value2) && SGDataType.vector2f.matches(trueResult) && SGDataType.vector2f.matches(falseResult) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_ifgreatereq_vector2I",
+            nodeTypeID: 423, // ND_ifgreatereq_vector2I
             inputs: [
-                .init(name: "value1", dataType: SGDataType.int, connection: value1),
-                .init(name: "value2", dataType: SGDataType.int, connection: value2),
-                .init(name: "in1", dataType: SGDataType.vector2f, connection: trueResult),
-                .init(name: "in2", dataType: SGDataType.vector2f, connection: falseResult),
+                .init(nameID: 123, dataType: SGDataType.int, connection: value1),
+                .init(nameID: 124, dataType: SGDataType.int, connection: value2),
+                .init(nameID: 43, dataType: SGDataType.vector2f, connection: trueResult),
+                .init(nameID: 45, dataType: SGDataType.vector2f, connection: falseResult),
             ],
             outputs: [.init(dataType: SGDataType.vector2f)])))
     }
     if SGDataType.float.matches(value1) && SGDataType.float.matches(value2) && SGDataType.vector3f.matches(trueResult) && SGDataType.vector3f.matches(falseResult) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_ifgreatereq_vector3",
+            nodeTypeID: 424, // ND_ifgreatereq_vector3
             inputs: [
-                .init(name: "value1", dataType: SGDataType.float, connection: value1),
-                .init(name: "value2", dataType: SGDataType.float, connection: value2),
-                .init(name: "in1", dataType: SGDataType.vector3f, connection: trueResult),
-                .init(name: "in2", dataType: SGDataType.vector3f, connection: falseResult),
+                .init(nameID: 123, dataType: SGDataType.float, connection: value1),
+                .init(nameID: 124, dataType: SGDataType.float, connection: value2),
+                .init(nameID: 43, dataType: SGDataType.vector3f, connection: trueResult),
+                .init(nameID: 45, dataType: SGDataType.vector3f, connection: falseResult),
             ],
             outputs: [.init(dataType: SGDataType.vector3f)])))
     }
     if SGDataType.int.matches(value1) && SGDataType.int.matches(value2) && SGDataType.vector3f.matches(trueResult) && SGDataType.vector3f.matches(falseResult) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_ifgreatereq_vector3I",
+            nodeTypeID: 425, // ND_ifgreatereq_vector3I
             inputs: [
-                .init(name: "value1", dataType: SGDataType.int, connection: value1),
-                .init(name: "value2", dataType: SGDataType.int, connection: value2),
-                .init(name: "in1", dataType: SGDataType.vector3f, connection: trueResult),
-                .init(name: "in2", dataType: SGDataType.vector3f, connection: falseResult),
+                .init(nameID: 123, dataType: SGDataType.int, connection: value1),
+                .init(nameID: 124, dataType: SGDataType.int, connection: value2),
+                .init(nameID: 43, dataType: SGDataType.vector3f, connection: trueResult),
+                .init(nameID: 45, dataType: SGDataType.vector3f, connection: falseResult),
             ],
             outputs: [.init(dataType: SGDataType.vector3f)])))
     }
     if SGDataType.float.matches(value1) && SGDataType.float.matches(value2) && SGDataType.vector4f.matches(trueResult) && SGDataType.vector4f.matches(falseResult) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_ifgreatereq_vector4",
+            nodeTypeID: 426, // ND_ifgreatereq_vector4
             inputs: [
-                .init(name: "value1", dataType: SGDataType.float, connection: value1),
-                .init(name: "value2", dataType: SGDataType.float, connection: value2),
-                .init(name: "in1", dataType: SGDataType.vector4f, connection: trueResult),
-                .init(name: "in2", dataType: SGDataType.vector4f, connection: falseResult),
+                .init(nameID: 123, dataType: SGDataType.float, connection: value1),
+                .init(nameID: 124, dataType: SGDataType.float, connection: value2),
+                .init(nameID: 43, dataType: SGDataType.vector4f, connection: trueResult),
+                .init(nameID: 45, dataType: SGDataType.vector4f, connection: falseResult),
             ],
             outputs: [.init(dataType: SGDataType.vector4f)])))
     }
     if SGDataType.int.matches(value1) && SGDataType.int.matches(value2) && SGDataType.vector4f.matches(trueResult) && SGDataType.vector4f.matches(falseResult) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_ifgreatereq_vector4I",
+            nodeTypeID: 427, // ND_ifgreatereq_vector4I
             inputs: [
-                .init(name: "value1", dataType: SGDataType.int, connection: value1),
-                .init(name: "value2", dataType: SGDataType.int, connection: value2),
-                .init(name: "in1", dataType: SGDataType.vector4f, connection: trueResult),
-                .init(name: "in2", dataType: SGDataType.vector4f, connection: falseResult),
+                .init(nameID: 123, dataType: SGDataType.int, connection: value1),
+                .init(nameID: 124, dataType: SGDataType.int, connection: value2),
+                .init(nameID: 43, dataType: SGDataType.vector4f, connection: trueResult),
+                .init(nameID: 45, dataType: SGDataType.vector4f, connection: falseResult),
             ],
             outputs: [.init(dataType: SGDataType.vector4f)])))
     }
@@ -2811,92 +2811,92 @@ public func image<T>(file: SGTexture, defaultValue: T, texcoord: SGVector? = nil
     }
     if SGDataType.color3f.matches(defaultValue) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_image_color3",
+            nodeTypeID: 428, // ND_image_color3
             inputs: [
-                .init(name: "file", dataType: SGDataType.asset, connection: file),
-                .init(name: "default", dataType: SGDataType.color3f, connection: defaultValue),
-                .init(name: "texcoord", dataType: SGDataType.vector2f, connection: texcoord),
-                .init(name: "uaddressmode", dataType: SGDataType.string, connection: SGString(source: .constant(.string(uaddressmode.rawValue)))),
-                .init(name: "vaddressmode", dataType: SGDataType.string, connection: SGString(source: .constant(.string(vaddressmode.rawValue)))),
-                .init(name: "filtertype", dataType: SGDataType.string, connection: SGString(source: .constant(.string(filtertype.rawValue)))),
+                .init(nameID: 27, dataType: SGDataType.asset, connection: file),
+                .init(nameID: 16, dataType: SGDataType.color3f, connection: defaultValue),
+                .init(nameID: 104, dataType: SGDataType.vector2f, connection: texcoord),
+                .init(nameID: 108, dataType: SGDataType.string, connection: SGString(source: .constant(.string(uaddressmode.rawValue)))),
+                .init(nameID: 121, dataType: SGDataType.string, connection: SGString(source: .constant(.string(vaddressmode.rawValue)))),
+                .init(nameID: 32, dataType: SGDataType.string, connection: SGString(source: .constant(.string(filtertype.rawValue)))),
             ],
             outputs: [.init(dataType: SGDataType.color3f)])))
     }
     if SGDataType.color4f.matches(defaultValue) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_image_color4",
+            nodeTypeID: 429, // ND_image_color4
             inputs: [
-                .init(name: "file", dataType: SGDataType.asset, connection: file),
-                .init(name: "default", dataType: SGDataType.color4f, connection: defaultValue),
-                .init(name: "texcoord", dataType: SGDataType.vector2f, connection: texcoord),
-                .init(name: "uaddressmode", dataType: SGDataType.string, connection: SGString(source: .constant(.string(uaddressmode.rawValue)))),
-                .init(name: "vaddressmode", dataType: SGDataType.string, connection: SGString(source: .constant(.string(vaddressmode.rawValue)))),
-                .init(name: "filtertype", dataType: SGDataType.string, connection: SGString(source: .constant(.string(filtertype.rawValue)))),
+                .init(nameID: 27, dataType: SGDataType.asset, connection: file),
+                .init(nameID: 16, dataType: SGDataType.color4f, connection: defaultValue),
+                .init(nameID: 104, dataType: SGDataType.vector2f, connection: texcoord),
+                .init(nameID: 108, dataType: SGDataType.string, connection: SGString(source: .constant(.string(uaddressmode.rawValue)))),
+                .init(nameID: 121, dataType: SGDataType.string, connection: SGString(source: .constant(.string(vaddressmode.rawValue)))),
+                .init(nameID: 32, dataType: SGDataType.string, connection: SGString(source: .constant(.string(filtertype.rawValue)))),
             ],
             outputs: [.init(dataType: SGDataType.color4f)])))
     }
     if SGDataType.float.matches(defaultValue) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_image_float",
+            nodeTypeID: 430, // ND_image_float
             inputs: [
-                .init(name: "file", dataType: SGDataType.asset, connection: file),
-                .init(name: "default", dataType: SGDataType.float, connection: defaultValue),
-                .init(name: "texcoord", dataType: SGDataType.vector2f, connection: texcoord),
-                .init(name: "uaddressmode", dataType: SGDataType.string, connection: SGString(source: .constant(.string(uaddressmode.rawValue)))),
-                .init(name: "vaddressmode", dataType: SGDataType.string, connection: SGString(source: .constant(.string(vaddressmode.rawValue)))),
-                .init(name: "filtertype", dataType: SGDataType.string, connection: SGString(source: .constant(.string(filtertype.rawValue)))),
+                .init(nameID: 27, dataType: SGDataType.asset, connection: file),
+                .init(nameID: 16, dataType: SGDataType.float, connection: defaultValue),
+                .init(nameID: 104, dataType: SGDataType.vector2f, connection: texcoord),
+                .init(nameID: 108, dataType: SGDataType.string, connection: SGString(source: .constant(.string(uaddressmode.rawValue)))),
+                .init(nameID: 121, dataType: SGDataType.string, connection: SGString(source: .constant(.string(vaddressmode.rawValue)))),
+                .init(nameID: 32, dataType: SGDataType.string, connection: SGString(source: .constant(.string(filtertype.rawValue)))),
             ],
             outputs: [.init(dataType: SGDataType.float)])))
     }
     if SGDataType.half.matches(defaultValue) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_image_half",
+            nodeTypeID: 431, // ND_image_half
             inputs: [
-                .init(name: "file", dataType: SGDataType.asset, connection: file),
-                .init(name: "default", dataType: SGDataType.half, connection: defaultValue),
-                .init(name: "texcoord", dataType: SGDataType.vector2f, connection: texcoord),
-                .init(name: "uaddressmode", dataType: SGDataType.string, connection: SGString(source: .constant(.string(uaddressmode.rawValue)))),
-                .init(name: "vaddressmode", dataType: SGDataType.string, connection: SGString(source: .constant(.string(vaddressmode.rawValue)))),
-                .init(name: "filtertype", dataType: SGDataType.string, connection: SGString(source: .constant(.string(filtertype.rawValue)))),
+                .init(nameID: 27, dataType: SGDataType.asset, connection: file),
+                .init(nameID: 16, dataType: SGDataType.half, connection: defaultValue),
+                .init(nameID: 104, dataType: SGDataType.vector2f, connection: texcoord),
+                .init(nameID: 108, dataType: SGDataType.string, connection: SGString(source: .constant(.string(uaddressmode.rawValue)))),
+                .init(nameID: 121, dataType: SGDataType.string, connection: SGString(source: .constant(.string(vaddressmode.rawValue)))),
+                .init(nameID: 32, dataType: SGDataType.string, connection: SGString(source: .constant(.string(filtertype.rawValue)))),
             ],
             outputs: [.init(dataType: SGDataType.half)])))
     }
     if SGDataType.vector2f.matches(defaultValue) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_image_vector2",
+            nodeTypeID: 432, // ND_image_vector2
             inputs: [
-                .init(name: "file", dataType: SGDataType.asset, connection: file),
-                .init(name: "default", dataType: SGDataType.vector2f, connection: defaultValue),
-                .init(name: "texcoord", dataType: SGDataType.vector2f, connection: texcoord),
-                .init(name: "uaddressmode", dataType: SGDataType.string, connection: SGString(source: .constant(.string(uaddressmode.rawValue)))),
-                .init(name: "vaddressmode", dataType: SGDataType.string, connection: SGString(source: .constant(.string(vaddressmode.rawValue)))),
-                .init(name: "filtertype", dataType: SGDataType.string, connection: SGString(source: .constant(.string(filtertype.rawValue)))),
+                .init(nameID: 27, dataType: SGDataType.asset, connection: file),
+                .init(nameID: 16, dataType: SGDataType.vector2f, connection: defaultValue),
+                .init(nameID: 104, dataType: SGDataType.vector2f, connection: texcoord),
+                .init(nameID: 108, dataType: SGDataType.string, connection: SGString(source: .constant(.string(uaddressmode.rawValue)))),
+                .init(nameID: 121, dataType: SGDataType.string, connection: SGString(source: .constant(.string(vaddressmode.rawValue)))),
+                .init(nameID: 32, dataType: SGDataType.string, connection: SGString(source: .constant(.string(filtertype.rawValue)))),
             ],
             outputs: [.init(dataType: SGDataType.vector2f)])))
     }
     if SGDataType.vector3f.matches(defaultValue) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_image_vector3",
+            nodeTypeID: 433, // ND_image_vector3
             inputs: [
-                .init(name: "file", dataType: SGDataType.asset, connection: file),
-                .init(name: "default", dataType: SGDataType.vector3f, connection: defaultValue),
-                .init(name: "texcoord", dataType: SGDataType.vector2f, connection: texcoord),
-                .init(name: "uaddressmode", dataType: SGDataType.string, connection: SGString(source: .constant(.string(uaddressmode.rawValue)))),
-                .init(name: "vaddressmode", dataType: SGDataType.string, connection: SGString(source: .constant(.string(vaddressmode.rawValue)))),
-                .init(name: "filtertype", dataType: SGDataType.string, connection: SGString(source: .constant(.string(filtertype.rawValue)))),
+                .init(nameID: 27, dataType: SGDataType.asset, connection: file),
+                .init(nameID: 16, dataType: SGDataType.vector3f, connection: defaultValue),
+                .init(nameID: 104, dataType: SGDataType.vector2f, connection: texcoord),
+                .init(nameID: 108, dataType: SGDataType.string, connection: SGString(source: .constant(.string(uaddressmode.rawValue)))),
+                .init(nameID: 121, dataType: SGDataType.string, connection: SGString(source: .constant(.string(vaddressmode.rawValue)))),
+                .init(nameID: 32, dataType: SGDataType.string, connection: SGString(source: .constant(.string(filtertype.rawValue)))),
             ],
             outputs: [.init(dataType: SGDataType.vector3f)])))
     }
     if SGDataType.vector4f.matches(defaultValue) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_image_vector4",
+            nodeTypeID: 434, // ND_image_vector4
             inputs: [
-                .init(name: "file", dataType: SGDataType.asset, connection: file),
-                .init(name: "default", dataType: SGDataType.vector4f, connection: defaultValue),
-                .init(name: "texcoord", dataType: SGDataType.vector2f, connection: texcoord),
-                .init(name: "uaddressmode", dataType: SGDataType.string, connection: SGString(source: .constant(.string(uaddressmode.rawValue)))),
-                .init(name: "vaddressmode", dataType: SGDataType.string, connection: SGString(source: .constant(.string(vaddressmode.rawValue)))),
-                .init(name: "filtertype", dataType: SGDataType.string, connection: SGString(source: .constant(.string(filtertype.rawValue)))),
+                .init(nameID: 27, dataType: SGDataType.asset, connection: file),
+                .init(nameID: 16, dataType: SGDataType.vector4f, connection: defaultValue),
+                .init(nameID: 104, dataType: SGDataType.vector2f, connection: texcoord),
+                .init(nameID: 108, dataType: SGDataType.string, connection: SGString(source: .constant(.string(uaddressmode.rawValue)))),
+                .init(nameID: 121, dataType: SGDataType.string, connection: SGString(source: .constant(.string(vaddressmode.rawValue)))),
+                .init(nameID: 32, dataType: SGDataType.string, connection: SGString(source: .constant(.string(filtertype.rawValue)))),
             ],
             outputs: [.init(dataType: SGDataType.vector4f)])))
     }
@@ -2906,37 +2906,37 @@ public func image<T>(file: SGTexture, defaultValue: T, texcoord: SGVector? = nil
 public func inside<T>(_ in1: T, mask: SGScalar? = nil) -> T where T: SGNumeric {
     if SGDataType.color3f.matches(in1) && SGDataType.float.matches(mask) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_inside_color3",
+            nodeTypeID: 436, // ND_inside_color3
             inputs: [
-                .init(name: "in", dataType: SGDataType.color3f, connection: in1),
-                .init(name: "mask", dataType: SGDataType.float, connection: mask),
+                .init(nameID: 42, dataType: SGDataType.color3f, connection: in1),
+                .init(nameID: 68, dataType: SGDataType.float, connection: mask),
             ],
             outputs: [.init(dataType: SGDataType.color3f)])))
     }
     if SGDataType.color4f.matches(in1) && SGDataType.float.matches(mask) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_inside_color4",
+            nodeTypeID: 437, // ND_inside_color4
             inputs: [
-                .init(name: "in", dataType: SGDataType.color4f, connection: in1),
-                .init(name: "mask", dataType: SGDataType.float, connection: mask),
+                .init(nameID: 42, dataType: SGDataType.color4f, connection: in1),
+                .init(nameID: 68, dataType: SGDataType.float, connection: mask),
             ],
             outputs: [.init(dataType: SGDataType.color4f)])))
     }
     if SGDataType.float.matches(in1) && SGDataType.float.matches(mask) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_inside_float",
+            nodeTypeID: 438, // ND_inside_float
             inputs: [
-                .init(name: "in", dataType: SGDataType.float, connection: in1),
-                .init(name: "mask", dataType: SGDataType.float, connection: mask),
+                .init(nameID: 42, dataType: SGDataType.float, connection: in1),
+                .init(nameID: 68, dataType: SGDataType.float, connection: mask),
             ],
             outputs: [.init(dataType: SGDataType.float)])))
     }
     if SGDataType.half.matches(in1) && SGDataType.half.matches(mask) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_inside_half",
+            nodeTypeID: 439, // ND_inside_half
             inputs: [
-                .init(name: "in", dataType: SGDataType.half, connection: in1),
-                .init(name: "mask", dataType: SGDataType.half, connection: mask),
+                .init(nameID: 42, dataType: SGDataType.half, connection: in1),
+                .init(nameID: 68, dataType: SGDataType.half, connection: mask),
             ],
             outputs: [.init(dataType: SGDataType.half)])))
     }
@@ -2946,25 +2946,25 @@ public func inside<T>(_ in1: T, mask: SGScalar? = nil) -> T where T: SGNumeric {
 public func invertMatrix(_ in1: SGMatrix) -> SGMatrix {
     if SGDataType.matrix2d.matches(in1) {
         return SGMatrix(source: .nodeOutput(SGNode(
-            nodeType: "ND_invertmatrix_matrix22",
+            nodeTypeID: 440, // ND_invertmatrix_matrix22
             inputs: [
-                .init(name: "in", dataType: SGDataType.matrix2d, connection: in1),
+                .init(nameID: 42, dataType: SGDataType.matrix2d, connection: in1),
             ],
             outputs: [.init(dataType: SGDataType.matrix2d)])))
     }
     if SGDataType.matrix3d.matches(in1) {
         return SGMatrix(source: .nodeOutput(SGNode(
-            nodeType: "ND_invertmatrix_matrix33",
+            nodeTypeID: 441, // ND_invertmatrix_matrix33
             inputs: [
-                .init(name: "in", dataType: SGDataType.matrix3d, connection: in1),
+                .init(nameID: 42, dataType: SGDataType.matrix3d, connection: in1),
             ],
             outputs: [.init(dataType: SGDataType.matrix3d)])))
     }
     if SGDataType.matrix4d.matches(in1) {
         return SGMatrix(source: .nodeOutput(SGNode(
-            nodeType: "ND_invertmatrix_matrix44",
+            nodeTypeID: 442, // ND_invertmatrix_matrix44
             inputs: [
-                .init(name: "in", dataType: SGDataType.matrix4d, connection: in1),
+                .init(nameID: 42, dataType: SGDataType.matrix4d, connection: in1),
             ],
             outputs: [.init(dataType: SGDataType.matrix4d)])))
     }
@@ -2974,49 +2974,49 @@ public func invertMatrix(_ in1: SGMatrix) -> SGMatrix {
 public func length(_ in1: SGVector) -> SGScalar {
     if SGDataType.vector2h.matches(in1) {
         return SGScalar(source: .nodeOutput(SGNode(
-            nodeType: "ND_magnitude_half2",
+            nodeTypeID: 453, // ND_magnitude_half2
             inputs: [
-                .init(name: "in", dataType: SGDataType.vector2h, connection: in1),
+                .init(nameID: 42, dataType: SGDataType.vector2h, connection: in1),
             ],
             outputs: [.init(dataType: SGDataType.float)])))
     }
     if SGDataType.vector3h.matches(in1) {
         return SGScalar(source: .nodeOutput(SGNode(
-            nodeType: "ND_magnitude_half3",
+            nodeTypeID: 454, // ND_magnitude_half3
             inputs: [
-                .init(name: "in", dataType: SGDataType.vector3h, connection: in1),
+                .init(nameID: 42, dataType: SGDataType.vector3h, connection: in1),
             ],
             outputs: [.init(dataType: SGDataType.float)])))
     }
     if SGDataType.vector4h.matches(in1) {
         return SGScalar(source: .nodeOutput(SGNode(
-            nodeType: "ND_magnitude_half4",
+            nodeTypeID: 455, // ND_magnitude_half4
             inputs: [
-                .init(name: "in", dataType: SGDataType.vector4h, connection: in1),
+                .init(nameID: 42, dataType: SGDataType.vector4h, connection: in1),
             ],
             outputs: [.init(dataType: SGDataType.float)])))
     }
     if SGDataType.vector2f.matches(in1) {
         return SGScalar(source: .nodeOutput(SGNode(
-            nodeType: "ND_magnitude_vector2",
+            nodeTypeID: 456, // ND_magnitude_vector2
             inputs: [
-                .init(name: "in", dataType: SGDataType.vector2f, connection: in1),
+                .init(nameID: 42, dataType: SGDataType.vector2f, connection: in1),
             ],
             outputs: [.init(dataType: SGDataType.float)])))
     }
     if SGDataType.vector3f.matches(in1) {
         return SGScalar(source: .nodeOutput(SGNode(
-            nodeType: "ND_magnitude_vector3",
+            nodeTypeID: 457, // ND_magnitude_vector3
             inputs: [
-                .init(name: "in", dataType: SGDataType.vector3f, connection: in1),
+                .init(nameID: 42, dataType: SGDataType.vector3f, connection: in1),
             ],
             outputs: [.init(dataType: SGDataType.float)])))
     }
     if SGDataType.vector4f.matches(in1) {
         return SGScalar(source: .nodeOutput(SGNode(
-            nodeType: "ND_magnitude_vector4",
+            nodeTypeID: 458, // ND_magnitude_vector4
             inputs: [
-                .init(name: "in", dataType: SGDataType.vector4f, connection: in1),
+                .init(nameID: 42, dataType: SGDataType.vector4f, connection: in1),
             ],
             outputs: [.init(dataType: SGDataType.float)])))
     }
@@ -3026,65 +3026,65 @@ public func length(_ in1: SGVector) -> SGScalar {
 public func log<T>(_ in1: T) -> T where T: SGNumeric {
     if SGDataType.float.matches(in1) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_ln_float",
+            nodeTypeID: 443, // ND_ln_float
             inputs: [
-                .init(name: "in", dataType: SGDataType.float, connection: in1),
+                .init(nameID: 42, dataType: SGDataType.float, connection: in1),
             ],
             outputs: [.init(dataType: SGDataType.float)])))
     }
     if SGDataType.half.matches(in1) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_ln_half",
+            nodeTypeID: 444, // ND_ln_half
             inputs: [
-                .init(name: "in", dataType: SGDataType.half, connection: in1),
+                .init(nameID: 42, dataType: SGDataType.half, connection: in1),
             ],
             outputs: [.init(dataType: SGDataType.half)])))
     }
     if SGDataType.vector2h.matches(in1) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_ln_half2",
+            nodeTypeID: 445, // ND_ln_half2
             inputs: [
-                .init(name: "in", dataType: SGDataType.vector2h, connection: in1),
+                .init(nameID: 42, dataType: SGDataType.vector2h, connection: in1),
             ],
             outputs: [.init(dataType: SGDataType.vector2h)])))
     }
     if SGDataType.vector3h.matches(in1) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_ln_half3",
+            nodeTypeID: 446, // ND_ln_half3
             inputs: [
-                .init(name: "in", dataType: SGDataType.vector3h, connection: in1),
+                .init(nameID: 42, dataType: SGDataType.vector3h, connection: in1),
             ],
             outputs: [.init(dataType: SGDataType.vector3h)])))
     }
     if SGDataType.vector4h.matches(in1) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_ln_half4",
+            nodeTypeID: 447, // ND_ln_half4
             inputs: [
-                .init(name: "in", dataType: SGDataType.vector4h, connection: in1),
+                .init(nameID: 42, dataType: SGDataType.vector4h, connection: in1),
             ],
             outputs: [.init(dataType: SGDataType.vector4h)])))
     }
     if SGDataType.vector2f.matches(in1) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_ln_vector2",
+            nodeTypeID: 448, // ND_ln_vector2
             inputs: [
-                .init(name: "in", dataType: SGDataType.vector2f, connection: in1),
+                .init(nameID: 42, dataType: SGDataType.vector2f, connection: in1),
             ],
             outputs: [.init(dataType: SGDataType.vector2f)])))
     }
     if SGDataType.vector3f.matches(in1) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_ln_vector3",
+            nodeTypeID: 449, // ND_ln_vector3
             inputs: [
-                .init(name: "in", dataType: SGDataType.vector3f, connection: in1),
+                .init(nameID: 42, dataType: SGDataType.vector3f, connection: in1),
             ],
             outputs: [.init(dataType: SGDataType.vector3f)])))
     }
     if SGDataType.vector4f.matches(in1) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_ln_vector4",
+            nodeTypeID: 450, // ND_ln_vector4
             inputs: [
-                .init(name: "in", dataType: SGDataType.vector4f, connection: in1),
+                .init(nameID: 42, dataType: SGDataType.vector4f, connection: in1),
             ],
             outputs: [.init(dataType: SGDataType.vector4f)])))
     }
@@ -3099,10 +3099,10 @@ public func logicalAnd(_ in1: SGValue, _ in2: SGValue) -> SGValue {
         return SGValue(source: .error("Invalid logicalAnd input. Expected in2 data type to be SGDataType.bool, but got \(in2.dataType).", values: [in2]))
     }
     return SGValue(source: .nodeOutput(SGNode(
-        nodeType: "ND_realitykit_logical_and",
+        nodeTypeID: 684, // ND_realitykit_logical_and
         inputs: [
-            .init(name: "in1", dataType: SGDataType.bool, connection: in1),
-            .init(name: "in2", dataType: SGDataType.bool, connection: in2),
+            .init(nameID: 43, dataType: SGDataType.bool, connection: in1),
+            .init(nameID: 45, dataType: SGDataType.bool, connection: in2),
         ],
         outputs: [.init(dataType: SGDataType.bool)])))
 }
@@ -3112,9 +3112,9 @@ public func logicalNot(_ in1: SGValue) -> SGValue {
         return SGValue(source: .error("Invalid logicalNot input. Expected in1 data type to be SGDataType.bool, but got \(in1.dataType).", values: [in1]))
     }
     return SGValue(source: .nodeOutput(SGNode(
-        nodeType: "ND_realitykit_logical_not",
+        nodeTypeID: 685, // ND_realitykit_logical_not
         inputs: [
-            .init(name: "in", dataType: SGDataType.bool, connection: in1),
+            .init(nameID: 42, dataType: SGDataType.bool, connection: in1),
         ],
         outputs: [.init(dataType: SGDataType.bool)])))
 }
@@ -3127,10 +3127,10 @@ public func logicalOr(_ in1: SGValue, _ in2: SGValue) -> SGValue {
         return SGValue(source: .error("Invalid logicalOr input. Expected in2 data type to be SGDataType.bool, but got \(in2.dataType).", values: [in2]))
     }
     return SGValue(source: .nodeOutput(SGNode(
-        nodeType: "ND_realitykit_logical_or",
+        nodeTypeID: 686, // ND_realitykit_logical_or
         inputs: [
-            .init(name: "in1", dataType: SGDataType.bool, connection: in1),
-            .init(name: "in2", dataType: SGDataType.bool, connection: in2),
+            .init(nameID: 43, dataType: SGDataType.bool, connection: in1),
+            .init(nameID: 45, dataType: SGDataType.bool, connection: in2),
         ],
         outputs: [.init(dataType: SGDataType.bool)])))
 }
@@ -3143,10 +3143,10 @@ public func logicalXor(_ in1: SGValue, _ in2: SGValue) -> SGValue {
         return SGValue(source: .error("Invalid logicalXor input. Expected in2 data type to be SGDataType.bool, but got \(in2.dataType).", values: [in2]))
     }
     return SGValue(source: .nodeOutput(SGNode(
-        nodeType: "ND_realitykit_logical_xor",
+        nodeTypeID: 687, // ND_realitykit_logical_xor
         inputs: [
-            .init(name: "in1", dataType: SGDataType.bool, connection: in1),
-            .init(name: "in2", dataType: SGDataType.bool, connection: in2),
+            .init(nameID: 43, dataType: SGDataType.bool, connection: in1),
+            .init(nameID: 45, dataType: SGDataType.bool, connection: in2),
         ],
         outputs: [.init(dataType: SGDataType.bool)])))
 }
@@ -3157,19 +3157,19 @@ public func luminance(_ in1: SGColor, lumacoeffs: SGColor? = nil) -> SGColor {
     }
     if SGDataType.color3f.matches(in1) {
         return SGColor(source: .nodeOutput(SGNode(
-            nodeType: "ND_luminance_color3",
+            nodeTypeID: 451, // ND_luminance_color3
             inputs: [
-                .init(name: "in", dataType: SGDataType.color3f, connection: in1),
-                .init(name: "lumacoeffs", dataType: SGDataType.color3f, connection: lumacoeffs),
+                .init(nameID: 42, dataType: SGDataType.color3f, connection: in1),
+                .init(nameID: 66, dataType: SGDataType.color3f, connection: lumacoeffs),
             ],
             outputs: [.init(dataType: SGDataType.color3f)])))
     }
     if SGDataType.color4f.matches(in1) {
         return SGColor(source: .nodeOutput(SGNode(
-            nodeType: "ND_luminance_color4",
+            nodeTypeID: 452, // ND_luminance_color4
             inputs: [
-                .init(name: "in", dataType: SGDataType.color4f, connection: in1),
-                .init(name: "lumacoeffs", dataType: SGDataType.color3f, connection: lumacoeffs),
+                .init(nameID: 42, dataType: SGDataType.color4f, connection: in1),
+                .init(nameID: 66, dataType: SGDataType.color3f, connection: lumacoeffs),
             ],
             outputs: [.init(dataType: SGDataType.color4f)])))
     }
@@ -3187,11 +3187,11 @@ public func mask(fg: SGColor? = nil, bg: SGColor? = nil, mix: SGScalar? = nil) -
         return SGColor(source: .error("Invalid mask input. Expected mix data type to be SGDataType.float, but got \(mix?.dataType.rawValue ?? "nil").", values: [mix]))
     }
     return SGColor(source: .nodeOutput(SGNode(
-        nodeType: "ND_mask_color4",
+        nodeTypeID: 459, // ND_mask_color4
         inputs: [
-            .init(name: "fg", dataType: SGDataType.color4f, connection: fg),
-            .init(name: "bg", dataType: SGDataType.color4f, connection: bg),
-            .init(name: "mix", dataType: SGDataType.float, connection: mix),
+            .init(nameID: 26, dataType: SGDataType.color4f, connection: fg),
+            .init(nameID: 6, dataType: SGDataType.color4f, connection: bg),
+            .init(nameID: 77, dataType: SGDataType.float, connection: mix),
         ],
         outputs: [.init(dataType: SGDataType.color4f)])))
 }
@@ -3207,11 +3207,11 @@ public func matte(fg: SGColor? = nil, bg: SGColor? = nil, mix: SGScalar? = nil)
         return SGColor(source: .error("Invalid matte input. Expected mix data type to be SGDataType.float, but got \(mix?.dataType.rawValue ?? "nil").", values: [mix]))
     }
     return SGColor(source: .nodeOutput(SGNode(
-        nodeType: "ND_matte_color4",
+        nodeTypeID: 460, // ND_matte_color4
         inputs: [
-            .init(name: "fg", dataType: SGDataType.color4f, connection: fg),
-            .init(name: "bg", dataType: SGDataType.color4f, connection: bg),
-            .init(name: "mix", dataType: SGDataType.float, connection: mix),
+            .init(nameID: 26, dataType: SGDataType.color4f, connection: fg),
+            .init(nameID: 6, dataType: SGDataType.color4f, connection: bg),
+            .init(nameID: 77, dataType: SGDataType.float, connection: mix),
         ],
         outputs: [.init(dataType: SGDataType.color4f)])))
 }
@@ -3219,163 +3219,163 @@ public func matte(fg: SGColor? = nil, bg: SGColor? = nil, mix: SGScalar? = nil)
 public func max<T>(_ in1: T, _ in2: SGNumeric) -> T where T: SGNumeric {
     if SGDataType.color3f.matches(in1) && SGDataType.color3f.matches(in2) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_max_color3",
+            nodeTypeID: 461, // ND_max_color3
             inputs: [
-                .init(name: "in1", dataType: SGDataType.color3f, connection: in1),
-                .init(name: "in2", dataType: SGDataType.color3f, connection: in2),
+                .init(nameID: 43, dataType: SGDataType.color3f, connection: in1),
+                .init(nameID: 45, dataType: SGDataType.color3f, connection: in2),
             ],
             outputs: [.init(dataType: SGDataType.color3f)])))
     }
     if SGDataType.color3f.matches(in1) && SGDataType.float.matches(in2) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_max_color3FA",
+            nodeTypeID: 462, // ND_max_color3FA
             inputs: [
-                .init(name: "in1", dataType: SGDataType.color3f, connection: in1),
-                .init(name: "in2", dataType: SGDataType.float, connection: in2),
+                .init(nameID: 43, dataType: SGDataType.color3f, connection: in1),
+                .init(nameID: 45, dataType: SGDataType.float, connection: in2),
             ],
             outputs: [.init(dataType: SGDataType.color3f)])))
     }
     if SGDataType.color4f.matches(in1) && SGDataType.color4f.matches(in2) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_max_color4",
+            nodeTypeID: 463, // ND_max_color4
             inputs: [
-                .init(name: "in1", dataType: SGDataType.color4f, connection: in1),
-                .init(name: "in2", dataType: SGDataType.color4f, connection: in2),
+                .init(nameID: 43, dataType: SGDataType.color4f, connection: in1),
+                .init(nameID: 45, dataType: SGDataType.color4f, connection: in2),
             ],
             outputs: [.init(dataType: SGDataType.color4f)])))
     }
     if SGDataType.color4f.matches(in1) && SGDataType.float.matches(in2) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_max_color4FA",
+            nodeTypeID: 464, // ND_max_color4FA
             inputs: [
-                .init(name: "in1", dataType: SGDataType.color4f, connection: in1),
-                .init(name: "in2", dataType: SGDataType.float, connection: in2),
+                .init(nameID: 43, dataType: SGDataType.color4f, connection: in1),
+                .init(nameID: 45, dataType: SGDataType.float, connection: in2),
             ],
             outputs: [.init(dataType: SGDataType.color4f)])))
     }
     if SGDataType.float.matches(in1) && SGDataType.float.matches(in2) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_max_float",
+            nodeTypeID: 465, // ND_max_float
             inputs: [
-                .init(name: "in1", dataType: SGDataType.float, connection: in1),
-                .init(name: "in2", dataType: SGDataType.float, connection: in2),
+                .init(nameID: 43, dataType: SGDataType.float, connection: in1),
+                .init(nameID: 45, dataType: SGDataType.float, connection: in2),
             ],
             outputs: [.init(dataType: SGDataType.float)])))
     }
     if SGDataType.half.matches(in1) && SGDataType.half.matches(in2) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_max_half",
+            nodeTypeID: 466, // ND_max_half
             inputs: [
-                .init(name: "in1", dataType: SGDataType.half, connection: in1),
-                .init(name: "in2", dataType: SGDataType.half, connection: in2),
+                .init(nameID: 43, dataType: SGDataType.half, connection: in1),
+                .init(nameID: 45, dataType: SGDataType.half, connection: in2),
             ],
             outputs: [.init(dataType: SGDataType.half)])))
     }
     if SGDataType.vector2h.matches(in1) && SGDataType.vector2h.matches(in2) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_max_half2",
+            nodeTypeID: 467, // ND_max_half2
             inputs: [
-                .init(name: "in1", dataType: SGDataType.vector2h, connection: in1),
-                .init(name: "in2", dataType: SGDataType.vector2h, connection: in2),
+                .init(nameID: 43, dataType: SGDataType.vector2h, connection: in1),
+                .init(nameID: 45, dataType: SGDataType.vector2h, connection: in2),
             ],
             outputs: [.init(dataType: SGDataType.vector2h)])))
     }
     if SGDataType.vector2h.matches(in1) && SGDataType.float.matches(in2) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_max_half2FA",
+            nodeTypeID: 468, // ND_max_half2FA
             inputs: [
-                .init(name: "in1", dataType: SGDataType.vector2h, connection: in1),
-                .init(name: "in2", dataType: SGDataType.float, connection: in2),
+                .init(nameID: 43, dataType: SGDataType.vector2h, connection: in1),
+                .init(nameID: 45, dataType: SGDataType.float, connection: in2),
             ],
             outputs: [.init(dataType: SGDataType.vector2h)])))
     }
     if SGDataType.vector3h.matches(in1) && SGDataType.vector3h.matches(in2) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_max_half3",
+            nodeTypeID: 469, // ND_max_half3
             inputs: [
-                .init(name: "in1", dataType: SGDataType.vector3h, connection: in1),
-                .init(name: "in2", dataType: SGDataType.vector3h, connection: in2),
+                .init(nameID: 43, dataType: SGDataType.vector3h, connection: in1),
+                .init(nameID: 45, dataType: SGDataType.vector3h, connection: in2),
             ],
             outputs: [.init(dataType: SGDataType.vector3h)])))
     }
     if SGDataType.vector3h.matches(in1) && SGDataType.float.matches(in2) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_max_half3FA",
+            nodeTypeID: 470, // ND_max_half3FA
             inputs: [
-                .init(name: "in1", dataType: SGDataType.vector3h, connection: in1),
-                .init(name: "in2", dataType: SGDataType.float, connection: in2),
+                .init(nameID: 43, dataType: SGDataType.vector3h, connection: in1),
+                .init(nameID: 45, dataType: SGDataType.float, connection: in2),
             ],
             outputs: [.init(dataType: SGDataType.vector3h)])))
     }
     if SGDataType.vector4h.matches(in1) && SGDataType.vector4h.matches(in2) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_max_half4",
+            nodeTypeID: 471, // ND_max_half4
             inputs: [
-                .init(name: "in1", dataType: SGDataType.vector4h, connection: in1),
-                .init(name: "in2", dataType: SGDataType.vector4h, connection: in2),
+                .init(nameID: 43, dataType: SGDataType.vector4h, connection: in1),
+                .init(nameID: 45, dataType: SGDataType.vector4h, connection: in2),
             ],
             outputs: [.init(dataType: SGDataType.vector4h)])))
     }
     if SGDataType.vector4h.matches(in1) && SGDataType.float.matches(in2) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_max_half4FA",
+            nodeTypeID: 472, // ND_max_half4FA
             inputs: [
-                .init(name: "in1", dataType: SGDataType.vector4h, connection: in1),
-                .init(name: "in2", dataType: SGDataType.float, connection: in2),
+                .init(nameID: 43, dataType: SGDataType.vector4h, connection: in1),
+                .init(nameID: 45, dataType: SGDataType.float, connection: in2),
             ],
             outputs: [.init(dataType: SGDataType.vector4h)])))
     }
     if SGDataType.vector2f.matches(in1) && SGDataType.vector2f.matches(in2) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_max_vector2",
+            nodeTypeID: 473, // ND_max_vector2
             inputs: [
-                .init(name: "in1", dataType: SGDataType.vector2f, connection: in1),
-                .init(name: "in2", dataType: SGDataType.vector2f, connection: in2),
+                .init(nameID: 43, dataType: SGDataType.vector2f, connection: in1),
+                .init(nameID: 45, dataType: SGDataType.vector2f, connection: in2),
             ],
             outputs: [.init(dataType: SGDataType.vector2f)])))
     }
     if SGDataType.vector2f.matches(in1) && SGDataType.float.matches(in2) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_max_vector2FA",
+            nodeTypeID: 474, // ND_max_vector2FA
             inputs: [
-                .init(name: "in1", dataType: SGDataType.vector2f, connection: in1),
-                .init(name: "in2", dataType: SGDataType.float, connection: in2),
+                .init(nameID: 43, dataType: SGDataType.vector2f, connection: in1),
+                .init(nameID: 45, dataType: SGDataType.float, connection: in2),
             ],
             outputs: [.init(dataType: SGDataType.vector2f)])))
     }
     if SGDataType.vector3f.matches(in1) && SGDataType.vector3f.matches(in2) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_max_vector3",
+            nodeTypeID: 475, // ND_max_vector3
             inputs: [
-                .init(name: "in1", dataType: SGDataType.vector3f, connection: in1),
-                .init(name: "in2", dataType: SGDataType.vector3f, connection: in2),
+                .init(nameID: 43, dataType: SGDataType.vector3f, connection: in1),
+                .init(nameID: 45, dataType: SGDataType.vector3f, connection: in2),
             ],
             outputs: [.init(dataType: SGDataType.vector3f)])))
     }
     if SGDataType.vector3f.matches(in1) && SGDataType.float.matches(in2) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_max_vector3FA",
+            nodeTypeID: 476, // ND_max_vector3FA
             inputs: [
-                .init(name: "in1", dataType: SGDataType.vector3f, connection: in1),
-                .init(name: "in2", dataType: SGDataType.float, connection: in2),
+                .init(nameID: 43, dataType: SGDataType.vector3f, connection: in1),
+                .init(nameID: 45, dataType: SGDataType.float, connection: in2),
             ],
             outputs: [.init(dataType: SGDataType.vector3f)])))
     }
     if SGDataType.vector4f.matches(in1) && SGDataType.vector4f.matches(in2) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_max_vector4",
+            nodeTypeID: 477, // ND_max_vector4
             inputs: [
-                .init(name: "in1", dataType: SGDataType.vector4f, connection: in1),
-                .init(name: "in2", dataType: SGDataType.vector4f, connection: in2),
+                .init(nameID: 43, dataType: SGDataType.vector4f, connection: in1),
+                .init(nameID: 45, dataType: SGDataType.vector4f, connection: in2),
             ],
             outputs: [.init(dataType: SGDataType.vector4f)])))
     }
     if SGDataType.vector4f.matches(in1) && SGDataType.float.matches(in2) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_max_vector4FA",
+            nodeTypeID: 478, // ND_max_vector4FA
             inputs: [
-                .init(name: "in1", dataType: SGDataType.vector4f, connection: in1),
-                .init(name: "in2", dataType: SGDataType.float, connection: in2),
+                .init(nameID: 43, dataType: SGDataType.vector4f, connection: in1),
+                .init(nameID: 45, dataType: SGDataType.float, connection: in2),
             ],
             outputs: [.init(dataType: SGDataType.vector4f)])))
     }
@@ -3385,163 +3385,163 @@ public func max<T>(_ in1: T, _ in2: SGNumeric) -> T where T: SGNumeric {
 public func min<T>(_ in1: T, _ in2: SGNumeric) -> T where T: SGNumeric {
     if SGDataType.color3f.matches(in1) && SGDataType.color3f.matches(in2) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_min_color3",
+            nodeTypeID: 479, // ND_min_color3
             inputs: [
-                .init(name: "in1", dataType: SGDataType.color3f, connection: in1),
-                .init(name: "in2", dataType: SGDataType.color3f, connection: in2),
+                .init(nameID: 43, dataType: SGDataType.color3f, connection: in1),
+                .init(nameID: 45, dataType: SGDataType.color3f, connection: in2),
             ],
             outputs: [.init(dataType: SGDataType.color3f)])))
     }
     if SGDataType.color3f.matches(in1) && SGDataType.float.matches(in2) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_min_color3FA",
+            nodeTypeID: 480, // ND_min_color3FA
             inputs: [
-                .init(name: "in1", dataType: SGDataType.color3f, connection: in1),
-                .init(name: "in2", dataType: SGDataType.float, connection: in2),
+                .init(nameID: 43, dataType: SGDataType.color3f, connection: in1),
+                .init(nameID: 45, dataType: SGDataType.float, connection: in2),
             ],
             outputs: [.init(dataType: SGDataType.color3f)])))
     }
     if SGDataType.color4f.matches(in1) && SGDataType.color4f.matches(in2) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_min_color4",
+            nodeTypeID: 481, // ND_min_color4
             inputs: [
-                .init(name: "in1", dataType: SGDataType.color4f, connection: in1),
-                .init(name: "in2", dataType: SGDataType.color4f, connection: in2),
+                .init(nameID: 43, dataType: SGDataType.color4f, connection: in1),
+                .init(nameID: 45, dataType: SGDataType.color4f, connection: in2),
             ],
             outputs: [.init(dataType: SGDataType.color4f)])))
     }
     if SGDataType.color4f.matches(in1) && SGDataType.float.matches(in2) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_min_color4FA",
+            nodeTypeID: 482, // ND_min_color4FA
             inputs: [
-                .init(name: "in1", dataType: SGDataType.color4f, connection: in1),
-                .init(name: "in2", dataType: SGDataType.float, connection: in2),
+                .init(nameID: 43, dataType: SGDataType.color4f, connection: in1),
+                .init(nameID: 45, dataType: SGDataType.float, connection: in2),
             ],
             outputs: [.init(dataType: SGDataType.color4f)])))
     }
     if SGDataType.float.matches(in1) && SGDataType.float.matches(in2) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_min_float",
+            nodeTypeID: 483, // ND_min_float
             inputs: [
-                .init(name: "in1", dataType: SGDataType.float, connection: in1),
-                .init(name: "in2", dataType: SGDataType.float, connection: in2),
+                .init(nameID: 43, dataType: SGDataType.float, connection: in1),
+                .init(nameID: 45, dataType: SGDataType.float, connection: in2),
             ],
             outputs: [.init(dataType: SGDataType.float)])))
     }
     if SGDataType.half.matches(in1) && SGDataType.half.matches(in2) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_min_half",
+            nodeTypeID: 484, // ND_min_half
             inputs: [
-                .init(name: "in1", dataType: SGDataType.half, connection: in1),
-                .init(name: "in2", dataType: SGDataType.half, connection: in2),
+                .init(nameID: 43, dataType: SGDataType.half, connection: in1),
+                .init(nameID: 45, dataType: SGDataType.half, connection: in2),
             ],
             outputs: [.init(dataType: SGDataType.half)])))
     }
     if SGDataType.vector2h.matches(in1) && SGDataType.vector2h.matches(in2) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_min_half2",
+            nodeTypeID: 485, // ND_min_half2
             inputs: [
-                .init(name: "in1", dataType: SGDataType.vector2h, connection: in1),
-                .init(name: "in2", dataType: SGDataType.vector2h, connection: in2),
+                .init(nameID: 43, dataType: SGDataType.vector2h, connection: in1),
+                .init(nameID: 45, dataType: SGDataType.vector2h, connection: in2),
             ],
             outputs: [.init(dataType: SGDataType.vector2h)])))
     }
     if SGDataType.vector2h.matches(in1) && SGDataType.float.matches(in2) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_min_half2FA",
+            nodeTypeID: 486, // ND_min_half2FA
             inputs: [
-                .init(name: "in1", dataType: SGDataType.vector2h, connection: in1),
-                .init(name: "in2", dataType: SGDataType.float, connection: in2),
+                .init(nameID: 43, dataType: SGDataType.vector2h, connection: in1),
+                .init(nameID: 45, dataType: SGDataType.float, connection: in2),
             ],
             outputs: [.init(dataType: SGDataType.vector2h)])))
     }
     if SGDataType.vector3h.matches(in1) && SGDataType.vector3h.matches(in2) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_min_half3",
+            nodeTypeID: 487, // ND_min_half3
             inputs: [
-                .init(name: "in1", dataType: SGDataType.vector3h, connection: in1),
-                .init(name: "in2", dataType: SGDataType.vector3h, connection: in2),
+                .init(nameID: 43, dataType: SGDataType.vector3h, connection: in1),
+                .init(nameID: 45, dataType: SGDataType.vector3h, connection: in2),
             ],
             outputs: [.init(dataType: SGDataType.vector3h)])))
     }
     if SGDataType.vector3h.matches(in1) && SGDataType.float.matches(in2) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_min_half3FA",
+            nodeTypeID: 488, // ND_min_half3FA
             inputs: [
-                .init(name: "in1", dataType: SGDataType.vector3h, connection: in1),
-                .init(name: "in2", dataType: SGDataType.float, connection: in2),
+                .init(nameID: 43, dataType: SGDataType.vector3h, connection: in1),
+                .init(nameID: 45, dataType: SGDataType.float, connection: in2),
             ],
             outputs: [.init(dataType: SGDataType.vector3h)])))
     }
     if SGDataType.vector4h.matches(in1) && SGDataType.vector4h.matches(in2) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_min_half4",
+            nodeTypeID: 489, // ND_min_half4
             inputs: [
-                .init(name: "in1", dataType: SGDataType.vector4h, connection: in1),
-                .init(name: "in2", dataType: SGDataType.vector4h, connection: in2),
+                .init(nameID: 43, dataType: SGDataType.vector4h, connection: in1),
+                .init(nameID: 45, dataType: SGDataType.vector4h, connection: in2),
             ],
             outputs: [.init(dataType: SGDataType.vector4h)])))
     }
     if SGDataType.vector4h.matches(in1) && SGDataType.float.matches(in2) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_min_half4FA",
+            nodeTypeID: 490, // ND_min_half4FA
             inputs: [
-                .init(name: "in1", dataType: SGDataType.vector4h, connection: in1),
-                .init(name: "in2", dataType: SGDataType.float, connection: in2),
+                .init(nameID: 43, dataType: SGDataType.vector4h, connection: in1),
+                .init(nameID: 45, dataType: SGDataType.float, connection: in2),
             ],
             outputs: [.init(dataType: SGDataType.vector4h)])))
     }
     if SGDataType.vector2f.matches(in1) && SGDataType.vector2f.matches(in2) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_min_vector2",
+            nodeTypeID: 491, // ND_min_vector2
             inputs: [
-                .init(name: "in1", dataType: SGDataType.vector2f, connection: in1),
-                .init(name: "in2", dataType: SGDataType.vector2f, connection: in2),
+                .init(nameID: 43, dataType: SGDataType.vector2f, connection: in1),
+                .init(nameID: 45, dataType: SGDataType.vector2f, connection: in2),
             ],
             outputs: [.init(dataType: SGDataType.vector2f)])))
     }
     if SGDataType.vector2f.matches(in1) && SGDataType.float.matches(in2) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_min_vector2FA",
+            nodeTypeID: 492, // ND_min_vector2FA
             inputs: [
-                .init(name: "in1", dataType: SGDataType.vector2f, connection: in1),
-                .init(name: "in2", dataType: SGDataType.float, connection: in2),
+                .init(nameID: 43, dataType: SGDataType.vector2f, connection: in1),
+                .init(nameID: 45, dataType: SGDataType.float, connection: in2),
             ],
             outputs: [.init(dataType: SGDataType.vector2f)])))
     }
     if SGDataType.vector3f.matches(in1) && SGDataType.vector3f.matches(in2) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_min_vector3",
+            nodeTypeID: 493, // ND_min_vector3
             inputs: [
-                .init(name: "in1", dataType: SGDataType.vector3f, connection: in1),
-                .init(name: "in2", dataType: SGDataType.vector3f, connection: in2),
+                .init(nameID: 43, dataType: SGDataType.vector3f, connection: in1),
+                .init(nameID: 45, dataType: SGDataType.vector3f, connection: in2),
             ],
             outputs: [.init(dataType: SGDataType.vector3f)])))
     }
     if SGDataType.vector3f.matches(in1) && SGDataType.float.matches(in2) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_min_vector3FA",
+            nodeTypeID: 494, // ND_min_vector3FA
             inputs: [
-                .init(name: "in1", dataType: SGDataType.vector3f, connection: in1),
-                .init(name: "in2", dataType: SGDataType.float, connection: in2),
+                .init(nameID: 43, dataType: SGDataType.vector3f, connection: in1),
+                .init(nameID: 45, dataType: SGDataType.float, connection: in2),
             ],
             outputs: [.init(dataType: SGDataType.vector3f)])))
     }
     if SGDataType.vector4f.matches(in1) && SGDataType.vector4f.matches(in2) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_min_vector4",
+            nodeTypeID: 495, // ND_min_vector4
             inputs: [
-                .init(name: "in1", dataType: SGDataType.vector4f, connection: in1),
-                .init(name: "in2", dataType: SGDataType.vector4f, connection: in2),
+                .init(nameID: 43, dataType: SGDataType.vector4f, connection: in1),
+                .init(nameID: 45, dataType: SGDataType.vector4f, connection: in2),
             ],
             outputs: [.init(dataType: SGDataType.vector4f)])))
     }
     if SGDataType.vector4f.matches(in1) && SGDataType.float.matches(in2) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_min_vector4FA",
+            nodeTypeID: 496, // ND_min_vector4FA
             inputs: [
-                .init(name: "in1", dataType: SGDataType.vector4f, connection: in1),
-                .init(name: "in2", dataType: SGDataType.float, connection: in2),
+                .init(nameID: 43, dataType: SGDataType.vector4f, connection: in1),
+                .init(nameID: 45, dataType: SGDataType.float, connection: in2),
             ],
             outputs: [.init(dataType: SGDataType.vector4f)])))
     }
@@ -3551,41 +3551,41 @@ public func min<T>(_ in1: T, _ in2: SGNumeric) -> T where T: SGNumeric {
 public func minus<T>(fg: T, bg: T, mix: SGScalar? = nil) -> T where T: SGNumeric {
     if SGDataType.color3f.matches(fg) && SGDataType.color3f.matches(bg) && SGDataType.float.matches(mix) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_minus_color3",
+            nodeTypeID: 497, // ND_minus_color3
             inputs: [
-                .init(name: "fg", dataType: SGDataType.color3f, connection: fg),
-                .init(name: "bg", dataType: SGDataType.color3f, connection: bg),
-                .init(name: "mix", dataType: SGDataType.float, connection: mix),
+                .init(nameID: 26, dataType: SGDataType.color3f, connection: fg),
+                .init(nameID: 6, dataType: SGDataType.color3f, connection: bg),
+                .init(nameID: 77, dataType: SGDataType.float, connection: mix),
             ],
             outputs: [.init(dataType: SGDataType.color3f)])))
     }
     if SGDataType.color4f.matches(fg) && SGDataType.color4f.matches(bg) && SGDataType.float.matches(mix) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_minus_color4",
+            nodeTypeID: 498, // ND_minus_color4
             inputs: [
-                .init(name: "fg", dataType: SGDataType.color4f, connection: fg),
-                .init(name: "bg", dataType: SGDataType.color4f, connection: bg),
-                .init(name: "mix", dataType: SGDataType.float, connection: mix),
+                .init(nameID: 26, dataType: SGDataType.color4f, connection: fg),
+                .init(nameID: 6, dataType: SGDataType.color4f, connection: bg),
+                .init(nameID: 77, dataType: SGDataType.float, connection: mix),
             ],
             outputs: [.init(dataType: SGDataType.color4f)])))
     }
     if SGDataType.float.matches(fg) && SGDataType.float.matches(bg) && SGDataType.float.matches(mix) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_minus_float",
+            nodeTypeID: 499, // ND_minus_float
             inputs: [
-                .init(name: "fg", dataType: SGDataType.float, connection: fg),
-                .init(name: "bg", dataType: SGDataType.float, connection: bg),
-                .init(name: "mix", dataType: SGDataType.float, connection: mix),
+                .init(nameID: 26, dataType: SGDataType.float, connection: fg),
+                .init(nameID: 6, dataType: SGDataType.float, connection: bg),
+                .init(nameID: 77, dataType: SGDataType.float, connection: mix),
             ],
             outputs: [.init(dataType: SGDataType.float)])))
     }
     if SGDataType.half.matches(fg) && SGDataType.half.matches(bg) && SGDataType.half.matches(mix) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_minus_half",
+            nodeTypeID: 500, // ND_minus_half
             inputs: [
-                .init(name: "fg", dataType: SGDataType.half, connection: fg),
-                .init(name: "bg", dataType: SGDataType.half, connection: bg),
-                .init(name: "mix", dataType: SGDataType.half, connection: mix),
+                .init(nameID: 26, dataType: SGDataType.half, connection: fg),
+                .init(nameID: 6, dataType: SGDataType.half, connection: bg),
+                .init(nameID: 77, dataType: SGDataType.half, connection: mix),
             ],
             outputs: [.init(dataType: SGDataType.half)])))
     }
@@ -3595,101 +3595,101 @@ public func minus<T>(fg: T, bg: T, mix: SGScalar? = nil) -> T where T: SGNumeric
 public func mix<T>(fg: T, bg: T, mix: SGScalar? = nil) -> T where T: SGNumeric {
     if SGDataType.color3f.matches(fg) && SGDataType.color3f.matches(bg) && SGDataType.float.matches(mix) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_mix_color3",
+            nodeTypeID: 501, // ND_mix_color3
             inputs: [
-                .init(name: "fg", dataType: SGDataType.color3f, connection: fg),
-                .init(name: "bg", dataType: SGDataType.color3f, connection: bg),
-                .init(name: "mix", dataType: SGDataType.float, connection: mix),
+                .init(nameID: 26, dataType: SGDataType.color3f, connection: fg),
+                .init(nameID: 6, dataType: SGDataType.color3f, connection: bg),
+                .init(nameID: 77, dataType: SGDataType.float, connection: mix),
             ],
             outputs: [.init(dataType: SGDataType.color3f)])))
     }
     if SGDataType.color4f.matches(fg) && SGDataType.color4f.matches(bg) && SGDataType.float.matches(mix) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_mix_color4",
+            nodeTypeID: 502, // ND_mix_color4
             inputs: [
-                .init(name: "fg", dataType: SGDataType.color4f, connection: fg),
-                .init(name: "bg", dataType: SGDataType.color4f, connection: bg),
-                .init(name: "mix", dataType: SGDataType.float, connection: mix),
+                .init(nameID: 26, dataType: SGDataType.color4f, connection: fg),
+                .init(nameID: 6, dataType: SGDataType.color4f, connection: bg),
+                .init(nameID: 77, dataType: SGDataType.float, connection: mix),
             ],
             outputs: [.init(dataType: SGDataType.color4f)])))
     }
     if SGDataType.float.matches(fg) && SGDataType.float.matches(bg) && SGDataType.float.matches(mix) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_mix_float",
+            nodeTypeID: 504, // ND_mix_float
             inputs: [
-                .init(name: "fg", dataType: SGDataType.float, connection: fg),
-                .init(name: "bg", dataType: SGDataType.float, connection: bg),
-                .init(name: "mix", dataType: SGDataType.float, connection: mix),
+                .init(nameID: 26, dataType: SGDataType.float, connection: fg),
+                .init(nameID: 6, dataType: SGDataType.float, connection: bg),
+                .init(nameID: 77, dataType: SGDataType.float, connection: mix),
             ],
             outputs: [.init(dataType: SGDataType.float)])))
     }
     if SGDataType.half.matches(fg) && SGDataType.half.matches(bg) && SGDataType.half.matches(mix) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_mix_half",
+            nodeTypeID: 505, // ND_mix_half
             inputs: [
-                .init(name: "fg", dataType: SGDataType.half, connection: fg),
-                .init(name: "bg", dataType: SGDataType.half, connection: bg),
-                .init(name: "mix", dataType: SGDataType.half, connection: mix),
+                .init(nameID: 26, dataType: SGDataType.half, connection: fg),
+                .init(nameID: 6, dataType: SGDataType.half, connection: bg),
+                .init(nameID: 77, dataType: SGDataType.half, connection: mix),
             ],
             outputs: [.init(dataType: SGDataType.half)])))
     }
     if SGDataType.vector2h.matches(fg) && SGDataType.vector2h.matches(bg) && SGDataType.float.matches(mix) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_mix_half2",
+            nodeTypeID: 506, // ND_mix_half2
             inputs: [
-                .init(name: "fg", dataType: SGDataType.vector2h, connection: fg),
-                .init(name: "bg", dataType: SGDataType.vector2h, connection: bg),
-                .init(name: "mix", dataType: SGDataType.float, connection: mix),
+                .init(nameID: 26, dataType: SGDataType.vector2h, connection: fg),
+                .init(nameID: 6, dataType: SGDataType.vector2h, connection: bg),
+                .init(nameID: 77, dataType: SGDataType.float, connection: mix),
             ],
             outputs: [.init(dataType: SGDataType.vector2h)])))
     }
     if SGDataType.vector3h.matches(fg) && SGDataType.vector3h.matches(bg) && SGDataType.float.matches(mix) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_mix_half3",
+            nodeTypeID: 507, // ND_mix_half3
             inputs: [
-                .init(name: "fg", dataType: SGDataType.vector3h, connection: fg),
-                .init(name: "bg", dataType: SGDataType.vector3h, connection: bg),
-                .init(name: "mix", dataType: SGDataType.float, connection: mix),
+                .init(nameID: 26, dataType: SGDataType.vector3h, connection: fg),
+                .init(nameID: 6, dataType: SGDataType.vector3h, connection: bg),
+                .init(nameID: 77, dataType: SGDataType.float, connection: mix),
             ],
             outputs: [.init(dataType: SGDataType.vector3h)])))
     }
     if SGDataType.vector4h.matches(fg) && SGDataType.vector4h.matches(bg) && SGDataType.float.matches(mix) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_mix_half4",
+            nodeTypeID: 508, // ND_mix_half4
             inputs: [
-                .init(name: "fg", dataType: SGDataType.vector4h, connection: fg),
-                .init(name: "bg", dataType: SGDataType.vector4h, connection: bg),
-                .init(name: "mix", dataType: SGDataType.float, connection: mix),
+                .init(nameID: 26, dataType: SGDataType.vector4h, connection: fg),
+                .init(nameID: 6, dataType: SGDataType.vector4h, connection: bg),
+                .init(nameID: 77, dataType: SGDataType.float, connection: mix),
             ],
             outputs: [.init(dataType: SGDataType.vector4h)])))
     }
     if SGDataType.vector2f.matches(fg) && SGDataType.vector2f.matches(bg) && SGDataType.float.matches(mix) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_mix_vector2",
+            nodeTypeID: 510, // ND_mix_vector2
             inputs: [
-                .init(name: "fg", dataType: SGDataType.vector2f, connection: fg),
-                .init(name: "bg", dataType: SGDataType.vector2f, connection: bg),
-                .init(name: "mix", dataType: SGDataType.float, connection: mix),
+                .init(nameID: 26, dataType: SGDataType.vector2f, connection: fg),
+                .init(nameID: 6, dataType: SGDataType.vector2f, connection: bg),
+                .init(nameID: 77, dataType: SGDataType.float, connection: mix),
             ],
             outputs: [.init(dataType: SGDataType.vector2f)])))
     }
     if SGDataType.vector3f.matches(fg) && SGDataType.vector3f.matches(bg) && SGDataType.float.matches(mix) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_mix_vector3",
+            nodeTypeID: 511, // ND_mix_vector3
             inputs: [
-                .init(name: "fg", dataType: SGDataType.vector3f, connection: fg),
-                .init(name: "bg", dataType: SGDataType.vector3f, connection: bg),
-                .init(name: "mix", dataType: SGDataType.float, connection: mix),
+                .init(nameID: 26, dataType: SGDataType.vector3f, connection: fg),
+                .init(nameID: 6, dataType: SGDataType.vector3f, connection: bg),
+                .init(nameID: 77, dataType: SGDataType.float, connection: mix),
             ],
             outputs: [.init(dataType: SGDataType.vector3f)])))
     }
     if SGDataType.vector4f.matches(fg) && SGDataType.vector4f.matches(bg) && SGDataType.float.matches(mix) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_mix_vector4",
+            nodeTypeID: 512, // ND_mix_vector4
             inputs: [
-                .init(name: "fg", dataType: SGDataType.vector4f, connection: fg),
-                .init(name: "bg", dataType: SGDataType.vector4f, connection: bg),
-                .init(name: "mix", dataType: SGDataType.float, connection: mix),
+                .init(nameID: 26, dataType: SGDataType.vector4f, connection: fg),
+                .init(nameID: 6, dataType: SGDataType.vector4f, connection: bg),
+                .init(nameID: 77, dataType: SGDataType.float, connection: mix),
             ],
             outputs: [.init(dataType: SGDataType.vector4f)])))
     }
@@ -3707,11 +3707,11 @@ public func mixColor(fg: SGColor? = nil, bg: SGColor? = nil, mix: SGScalar? = ni
         return SGColor(source: .error("Invalid mixColor input. Expected mix data type to be SGDataType.float, but got \(mix?.dataType.rawValue ?? "nil").", values: [mix]))
     }
     return SGColor(source: .nodeOutput(SGNode(
-        nodeType: "ND_in_color4",
+        nodeTypeID: 435, // ND_in_color4
         inputs: [
-            .init(name: "fg", dataType: SGDataType.color4f, connection: fg),
-            .init(name: "bg", dataType: SGDataType.color4f, connection: bg),
-            .init(name: "mix", dataType: SGDataType.float, connection: mix),
+            .init(nameID: 26, dataType: SGDataType.color4f, connection: fg),
+            .init(nameID: 6, dataType: SGDataType.color4f, connection: bg),
+            .init(nameID: 77, dataType: SGDataType.float, connection: mix),
         ],
         outputs: [.init(dataType: SGDataType.color4f)])))
 }
@@ -3719,109 +3719,109 @@ public func mixColor(fg: SGColor? = nil, bg: SGColor? = nil, mix: SGScalar? = ni
 public func modulo<T>(_ in1: T, _ in2: SGNumeric) -> T where T: SGNumeric {
     if SGDataType.color3f.matches(in1) && SGDataType.color3f.matches(in2) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_modulo_color3",
+            nodeTypeID: 514, // ND_modulo_color3
             inputs: [
-                .init(name: "in1", dataType: SGDataType.color3f, connection: in1),
-                .init(name: "in2", dataType: SGDataType.color3f, connection: in2),
+                .init(nameID: 43, dataType: SGDataType.color3f, connection: in1),
+                .init(nameID: 45, dataType: SGDataType.color3f, connection: in2),
             ],
             outputs: [.init(dataType: SGDataType.color3f)])))
     }
     if SGDataType.color3f.matches(in1) && SGDataType.float.matches(in2) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_modulo_color3FA",
+            nodeTypeID: 515, // ND_modulo_color3FA
             inputs: [
-                .init(name: "in1", dataType: SGDataType.color3f, connection: in1),
-                .init(name: "in2", dataType: SGDataType.float, connection: in2),
+                .init(nameID: 43, dataType: SGDataType.color3f, connection: in1),
+                .init(nameID: 45, dataType: SGDataType.float, connection: in2),
             ],
             outputs: [.init(dataType: SGDataType.color3f)])))
     }
     if SGDataType.color4f.matches(in1) && SGDataType.color4f.matches(in2) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_modulo_color4",
+            nodeTypeID: 516, // ND_modulo_color4
             inputs: [
-                .init(name: "in1", dataType: SGDataType.color4f, connection: in1),
-                .init(name: "in2", dataType: SGDataType.color4f, connection: in2),
+                .init(nameID: 43, dataType: SGDataType.color4f, connection: in1),
+                .init(nameID: 45, dataType: SGDataType.color4f, connection: in2),
             ],
             outputs: [.init(dataType: SGDataType.color4f)])))
     }
     if SGDataType.color4f.matches(in1) && SGDataType.float.matches(in2) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_modulo_color4FA",
+            nodeTypeID: 517, // ND_modulo_color4FA
             inputs: [
-                .init(name: "in1", dataType: SGDataType.color4f, connection: in1),
-                .init(name: "in2", dataType: SGDataType.float, connection: in2),
+                .init(nameID: 43, dataType: SGDataType.color4f, connection: in1),
+                .init(nameID: 45, dataType: SGDataType.float, connection: in2),
             ],
             outputs: [.init(dataType: SGDataType.color4f)])))
     }
     if SGDataType.float.matches(in1) && SGDataType.float.matches(in2) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_modulo_float",
+            nodeTypeID: 518, // ND_modulo_float
             inputs: [
-                .init(name: "in1", dataType: SGDataType.float, connection: in1),
-                .init(name: "in2", dataType: SGDataType.float, connection: in2),
+                .init(nameID: 43, dataType: SGDataType.float, connection: in1),
+                .init(nameID: 45, dataType: SGDataType.float, connection: in2),
             ],
             outputs: [.init(dataType: SGDataType.float)])))
     }
     if SGDataType.half.matches(in1) && SGDataType.half.matches(in2) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_modulo_half",
+            nodeTypeID: 519, // ND_modulo_half
             inputs: [
-                .init(name: "in1", dataType: SGDataType.half, connection: in1),
-                .init(name: "in2", dataType: SGDataType.half, connection: in2),
+                .init(nameID: 43, dataType: SGDataType.half, connection: in1),
+                .init(nameID: 45, dataType: SGDataType.half, connection: in2),
             ],
             outputs: [.init(dataType: SGDataType.half)])))
     }
     if SGDataType.vector2f.matches(in1) && SGDataType.vector2f.matches(in2) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_modulo_vector2",
+            nodeTypeID: 520, // ND_modulo_vector2
             inputs: [
-                .init(name: "in1", dataType: SGDataType.vector2f, connection: in1),
-                .init(name: "in2", dataType: SGDataType.vector2f, connection: in2),
+                .init(nameID: 43, dataType: SGDataType.vector2f, connection: in1),
+                .init(nameID: 45, dataType: SGDataType.vector2f, connection: in2),
             ],
             outputs: [.init(dataType: SGDataType.vector2f)])))
     }
     if SGDataType.vector2f.matches(in1) && SGDataType.float.matches(in2) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_modulo_vector2FA",
+            nodeTypeID: 521, // ND_modulo_vector2FA
             inputs: [
-                .init(name: "in1", dataType: SGDataType.vector2f, connection: in1),
-                .init(name: "in2", dataType: SGDataType.float, connection: in2),
+                .init(nameID: 43, dataType: SGDataType.vector2f, connection: in1),
+                .init(nameID: 45, dataType: SGDataType.float, connection: in2),
             ],
             outputs: [.init(dataType: SGDataType.vector2f)])))
     }
     if SGDataType.vector3f.matches(in1) && SGDataType.vector3f.matches(in2) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_modulo_vector3",
+            nodeTypeID: 522, // ND_modulo_vector3
             inputs: [
-                .init(name: "in1", dataType: SGDataType.vector3f, connection: in1),
-                .init(name: "in2", dataType: SGDataType.vector3f, connection: in2),
+                .init(nameID: 43, dataType: SGDataType.vector3f, connection: in1),
+                .init(nameID: 45, dataType: SGDataType.vector3f, connection: in2),
             ],
             outputs: [.init(dataType: SGDataType.vector3f)])))
     }
     if SGDataType.vector3f.matches(in1) && SGDataType.float.matches(in2) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_modulo_vector3FA",
+            nodeTypeID: 523, // ND_modulo_vector3FA
             inputs: [
-                .init(name: "in1", dataType: SGDataType.vector3f, connection: in1),
-                .init(name: "in2", dataType: SGDataType.float, connection: in2),
+                .init(nameID: 43, dataType: SGDataType.vector3f, connection: in1),
+                .init(nameID: 45, dataType: SGDataType.float, connection: in2),
             ],
             outputs: [.init(dataType: SGDataType.vector3f)])))
     }
     if SGDataType.vector4f.matches(in1) && SGDataType.vector4f.matches(in2) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_modulo_vector4",
+            nodeTypeID: 524, // ND_modulo_vector4
             inputs: [
-                .init(name: "in1", dataType: SGDataType.vector4f, connection: in1),
-                .init(name: "in2", dataType: SGDataType.vector4f, connection: in2),
+                .init(nameID: 43, dataType: SGDataType.vector4f, connection: in1),
+                .init(nameID: 45, dataType: SGDataType.vector4f, connection: in2),
             ],
             outputs: [.init(dataType: SGDataType.vector4f)])))
     }
     if SGDataType.vector4f.matches(in1) && SGDataType.float.matches(in2) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_modulo_vector4FA",
+            nodeTypeID: 525, // ND_modulo_vector4FA
             inputs: [
-                .init(name: "in1", dataType: SGDataType.vector4f, connection: in1),
-                .init(name: "in2", dataType: SGDataType.float, connection: in2),
+                .init(nameID: 43, dataType: SGDataType.vector4f, connection: in1),
+                .init(nameID: 45, dataType: SGDataType.float, connection: in2),
             ],
             outputs: [.init(dataType: SGDataType.vector4f)])))
     }
@@ -3831,136 +3831,136 @@ public func modulo<T>(_ in1: T, _ in2: SGNumeric) -> T where T: SGNumeric {
 public func multiply<T>(_ in1: T, _ in2: SGNumeric) -> T where T: SGNumeric {
     if SGDataType.color3f.matches(in1) && SGDataType.color3f.matches(in2) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_multiply_color3",
+            nodeTypeID: 526, // ND_multiply_color3
             inputs: [
-                .init(name: "in1", dataType: SGDataType.color3f, connection: in1),
-                .init(name: "in2", dataType: SGDataType.color3f, connection: in2),
+                .init(nameID: 43, dataType: SGDataType.color3f, connection: in1),
+                .init(nameID: 45, dataType: SGDataType.color3f, connection: in2),
             ],
             outputs: [.init(dataType: SGDataType.color3f)])))
     }
     if SGDataType.color3f.matches(in1) && SGDataType.float.matches(in2) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_multiply_color3FA",
+            nodeTypeID: 527, // ND_multiply_color3FA
             inputs: [
-                .init(name: "in1", dataType: SGDataType.color3f, connection: in1),
-                .init(name: "in2", dataType: SGDataType.float, connection: in2),
+                .init(nameID: 43, dataType: SGDataType.color3f, connection: in1),
+                .init(nameID: 45, dataType: SGDataType.float, connection: in2),
             ],
             outputs: [.init(dataType: SGDataType.color3f)])))
     }
     if SGDataType.color4f.matches(in1) && SGDataType.color4f.matches(in2) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_multiply_color4",
+            nodeTypeID: 528, // ND_multiply_color4
             inputs: [
-                .init(name: "in1", dataType: SGDataType.color4f, connection: in1),
-                .init(name: "in2", dataType: SGDataType.color4f, connection: in2),
+                .init(nameID: 43, dataType: SGDataType.color4f, connection: in1),
+                .init(nameID: 45, dataType: SGDataType.color4f, connection: in2),
             ],
             outputs: [.init(dataType: SGDataType.color4f)])))
     }
     if SGDataType.color4f.matches(in1) && SGDataType.float.matches(in2) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_multiply_color4FA",
+            nodeTypeID: 529, // ND_multiply_color4FA
             inputs: [
-                .init(name: "in1", dataType: SGDataType.color4f, connection: in1),
-                .init(name: "in2", dataType: SGDataType.float, connection: in2),
+                .init(nameID: 43, dataType: SGDataType.color4f, connection: in1),
+                .init(nameID: 45, dataType: SGDataType.float, connection: in2),
             ],
             outputs: [.init(dataType: SGDataType.color4f)])))
     }
     if SGDataType.float.matches(in1) && SGDataType.float.matches(in2) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_multiply_float",
+            nodeTypeID: 532, // ND_multiply_float
             inputs: [
-                .init(name: "in1", dataType: SGDataType.float, connection: in1),
-                .init(name: "in2", dataType: SGDataType.float, connection: in2),
+                .init(nameID: 43, dataType: SGDataType.float, connection: in1),
+                .init(nameID: 45, dataType: SGDataType.float, connection: in2),
             ],
             outputs: [.init(dataType: SGDataType.float)])))
     }
     if SGDataType.half.matches(in1) && SGDataType.half.matches(in2) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_multiply_half",
+            nodeTypeID: 533, // ND_multiply_half
             inputs: [
-                .init(name: "in1", dataType: SGDataType.half, connection: in1),
-                .init(name: "in2", dataType: SGDataType.half, connection: in2),
+                .init(nameID: 43, dataType: SGDataType.half, connection: in1),
+                .init(nameID: 45, dataType: SGDataType.half, connection: in2),
             ],
             outputs: [.init(dataType: SGDataType.half)])))
     }
     if SGDataType.matrix2d.matches(in1) && SGDataType.matrix2d.matches(in2) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_multiply_matrix22",
+            nodeTypeID: 534, // ND_multiply_matrix22
             inputs: [
-                .init(name: "in1", dataType: SGDataType.matrix2d, connection: in1),
-                .init(name: "in2", dataType: SGDataType.matrix2d, connection: in2),
+                .init(nameID: 43, dataType: SGDataType.matrix2d, connection: in1),
+                .init(nameID: 45, dataType: SGDataType.matrix2d, connection: in2),
             ],
             outputs: [.init(dataType: SGDataType.matrix2d)])))
     }
     if SGDataType.matrix3d.matches(in1) && SGDataType.matrix3d.matches(in2) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_multiply_matrix33",
+            nodeTypeID: 535, // ND_multiply_matrix33
             inputs: [
-                .init(name: "in1", dataType: SGDataType.matrix3d, connection: in1),
-                .init(name: "in2", dataType: SGDataType.matrix3d, connection: in2),
+                .init(nameID: 43, dataType: SGDataType.matrix3d, connection: in1),
+                .init(nameID: 45, dataType: SGDataType.matrix3d, connection: in2),
             ],
             outputs: [.init(dataType: SGDataType.matrix3d)])))
     }
     if SGDataType.matrix4d.matches(in1) && SGDataType.matrix4d.matches(in2) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_multiply_matrix44",
+            nodeTypeID: 536, // ND_multiply_matrix44
             inputs: [
-                .init(name: "in1", dataType: SGDataType.matrix4d, connection: in1),
-                .init(name: "in2", dataType: SGDataType.matrix4d, connection: in2),
+                .init(nameID: 43, dataType: SGDataType.matrix4d, connection: in1),
+                .init(nameID: 45, dataType: SGDataType.matrix4d, connection: in2),
             ],
             outputs: [.init(dataType: SGDataType.matrix4d)])))
     }
     if SGDataType.vector2f.matches(in1) && SGDataType.vector2f.matches(in2) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_multiply_vector2",
+            nodeTypeID: 539, // ND_multiply_vector2
             inputs: [
-                .init(name: "in1", dataType: SGDataType.vector2f, connection: in1),
-                .init(name: "in2", dataType: SGDataType.vector2f, connection: in2),
+                .init(nameID: 43, dataType: SGDataType.vector2f, connection: in1),
+                .init(nameID: 45, dataType: SGDataType.vector2f, connection: in2),
             ],
             outputs: [.init(dataType: SGDataType.vector2f)])))
     }
     if SGDataType.vector2f.matches(in1) && SGDataType.float.matches(in2) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_multiply_vector2FA",
+            nodeTypeID: 540, // ND_multiply_vector2FA
             inputs: [
-                .init(name: "in1", dataType: SGDataType.vector2f, connection: in1),
-                .init(name: "in2", dataType: SGDataType.float, connection: in2),
+                .init(nameID: 43, dataType: SGDataType.vector2f, connection: in1),
+                .init(nameID: 45, dataType: SGDataType.float, connection: in2),
             ],
             outputs: [.init(dataType: SGDataType.vector2f)])))
     }
     if SGDataType.vector3f.matches(in1) && SGDataType.vector3f.matches(in2) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_multiply_vector3",
+            nodeTypeID: 541, // ND_multiply_vector3
             inputs: [
-                .init(name: "in1", dataType: SGDataType.vector3f, connection: in1),
-                .init(name: "in2", dataType: SGDataType.vector3f, connection: in2),
+                .init(nameID: 43, dataType: SGDataType.vector3f, connection: in1),
+                .init(nameID: 45, dataType: SGDataType.vector3f, connection: in2),
             ],
             outputs: [.init(dataType: SGDataType.vector3f)])))
     }
     if SGDataType.vector3f.matches(in1) && SGDataType.float.matches(in2) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_multiply_vector3FA",
+            nodeTypeID: 542, // ND_multiply_vector3FA
             inputs: [
-                .init(name: "in1", dataType: SGDataType.vector3f, connection: in1),
-                .init(name: "in2", dataType: SGDataType.float, connection: in2),
+                .init(nameID: 43, dataType: SGDataType.vector3f, connection: in1),
+                .init(nameID: 45, dataType: SGDataType.float, connection: in2),
             ],
             outputs: [.init(dataType: SGDataType.vector3f)])))
     }
     if SGDataType.vector4f.matches(in1) && SGDataType.vector4f.matches(in2) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_multiply_vector4",
+            nodeTypeID: 543, // ND_multiply_vector4
             inputs: [
-                .init(name: "in1", dataType: SGDataType.vector4f, connection: in1),
-                .init(name: "in2", dataType: SGDataType.vector4f, connection: in2),
+                .init(nameID: 43, dataType: SGDataType.vector4f, connection: in1),
+                .init(nameID: 45, dataType: SGDataType.vector4f, connection: in2),
             ],
             outputs: [.init(dataType: SGDataType.vector4f)])))
     }
     if SGDataType.vector4f.matches(in1) && SGDataType.float.matches(in2) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_multiply_vector4FA",
+            nodeTypeID: 544, // ND_multiply_vector4FA
             inputs: [
-                .init(name: "in1", dataType: SGDataType.vector4f, connection: in1),
-                .init(name: "in2", dataType: SGDataType.float, connection: in2),
+                .init(nameID: 43, dataType: SGDataType.vector4f, connection: in1),
+                .init(nameID: 45, dataType: SGDataType.float, connection: in2),
             ],
             outputs: [.init(dataType: SGDataType.vector4f)])))
     }
@@ -3976,111 +3976,111 @@ public func noise2D(amplitude: SGNumeric, pivot: SGScalar? = nil, texcoord: SGVe
     }
     if SGDataType.vector3f.matches(amplitude) {
         return SGColor(source: .nodeOutput(SGNode(
-            nodeType: "ND_noise2d_color3",
+            nodeTypeID: 547, // ND_noise2d_color3
             inputs: [
-                .init(name: "amplitude", dataType: SGDataType.vector3f, connection: amplitude),
-                .init(name: "pivot", dataType: SGDataType.float, connection: pivot),
-                .init(name: "texcoord", dataType: SGDataType.vector2f, connection: texcoord),
+                .init(nameID: 2, dataType: SGDataType.vector3f, connection: amplitude),
+                .init(nameID: 89, dataType: SGDataType.float, connection: pivot),
+                .init(nameID: 104, dataType: SGDataType.vector2f, connection: texcoord),
             ],
             outputs: [.init(dataType: SGDataType.color3f)])))
     }
     if SGDataType.float.matches(amplitude) {
         return SGColor(source: .nodeOutput(SGNode(
-            nodeType: "ND_noise2d_color3FA",
+            nodeTypeID: 548, // ND_noise2d_color3FA
             inputs: [
-                .init(name: "amplitude", dataType: SGDataType.float, connection: amplitude),
-                .init(name: "pivot", dataType: SGDataType.float, connection: pivot),
-                .init(name: "texcoord", dataType: SGDataType.vector2f, connection: texcoord),
+                .init(nameID: 2, dataType: SGDataType.float, connection: amplitude),
+                .init(nameID: 89, dataType: SGDataType.float, connection: pivot),
+                .init(nameID: 104, dataType: SGDataType.vector2f, connection: texcoord),
             ],
             outputs: [.init(dataType: SGDataType.color3f)])))
     }
     if SGDataType.vector4f.matches(amplitude) {
         return SGColor(source: .nodeOutput(SGNode(
-            nodeType: "ND_noise2d_color4",
+            nodeTypeID: 549, // ND_noise2d_color4
             inputs: [
-                .init(name: "amplitude", dataType: SGDataType.vector4f, connection: amplitude),
-                .init(name: "pivot", dataType: SGDataType.float, connection: pivot),
-                .init(name: "texcoord", dataType: SGDataType.vector2f, connection: texcoord),
+                .init(nameID: 2, dataType: SGDataType.vector4f, connection: amplitude),
+                .init(nameID: 89, dataType: SGDataType.float, connection: pivot),
+                .init(nameID: 104, dataType: SGDataType.vector2f, connection: texcoord),
             ],
             outputs: [.init(dataType: SGDataType.color4f)])))
     }
     if SGDataType.float.matches(amplitude) {
         return SGColor(source: .nodeOutput(SGNode(
-            nodeType: "ND_noise2d_color4FA",
+            nodeTypeID: 550, // ND_noise2d_color4FA
             inputs: [
-                .init(name: "amplitude", dataType: SGDataType.float, connection: amplitude),
-                .init(name: "pivot", dataType: SGDataType.float, connection: pivot),
-                .init(name: "texcoord", dataType: SGDataType.vector2f, connection: texcoord),
+                .init(nameID: 2, dataType: SGDataType.float, connection: amplitude),
+                .init(nameID: 89, dataType: SGDataType.float, connection: pivot),
+                .init(nameID: 104, dataType: SGDataType.vector2f, connection: texcoord),
             ],
             outputs: [.init(dataType: SGDataType.color4f)])))
     }
     if SGDataType.float.matches(amplitude) {
         return SGScalar(source: .nodeOutput(SGNode(
-            nodeType: "ND_noise2d_float",
+            nodeTypeID: 551, // ND_noise2d_float
             inputs: [
-                .init(name: "amplitude", dataType: SGDataType.float, connection: amplitude),
-                .init(name: "pivot", dataType: SGDataType.float, connection: pivot),
-                .init(name: "texcoord", dataType: SGDataType.vector2f, connection: texcoord),
+                .init(nameID: 2, dataType: SGDataType.float, connection: amplitude),
+                .init(nameID: 89, dataType: SGDataType.float, connection: pivot),
+                .init(nameID: 104, dataType: SGDataType.vector2f, connection: texcoord),
             ],
             outputs: [.init(dataType: SGDataType.float)])))
     }
     if SGDataType.vector2f.matches(amplitude) {
         return SGVector(source: .nodeOutput(SGNode(
-            nodeType: "ND_noise2d_vector2",
+            nodeTypeID: 552, // ND_noise2d_vector2
             inputs: [
-                .init(name: "amplitude", dataType: SGDataType.vector2f, connection: amplitude),
-                .init(name: "pivot", dataType: SGDataType.float, connection: pivot),
-                .init(name: "texcoord", dataType: SGDataType.vector2f, connection: texcoord),
+                .init(nameID: 2, dataType: SGDataType.vector2f, connection: amplitude),
+                .init(nameID: 89, dataType: SGDataType.float, connection: pivot),
+                .init(nameID: 104, dataType: SGDataType.vector2f, connection: texcoord),
             ],
             outputs: [.init(dataType: SGDataType.vector2f)])))
     }
     if SGDataType.float.matches(amplitude) {
         return SGVector(source: .nodeOutput(SGNode(
-            nodeType: "ND_noise2d_vector2FA",
+            nodeTypeID: 553, // ND_noise2d_vector2FA
             inputs: [
-                .init(name: "amplitude", dataType: SGDataType.float, connection: amplitude),
-                .init(name: "pivot", dataType: SGDataType.float, connection: pivot),
-                .init(name: "texcoord", dataType: SGDataType.vector2f, connection: texcoord),
+                .init(nameID: 2, dataType: SGDataType.float, connection: amplitude),
+                .init(nameID: 89, dataType: SGDataType.float, connection: pivot),
+                .init(nameID: 104, dataType: SGDataType.vector2f, connection: texcoord),
             ],
             outputs: [.init(dataType: SGDataType.vector2f)])))
     }
     if SGDataType.vector3f.matches(amplitude) {
         return SGVector(source: .nodeOutput(SGNode(
-            nodeType: "ND_noise2d_vector3",
+            nodeTypeID: 554, // ND_noise2d_vector3
             inputs: [
-                .init(name: "amplitude", dataType: SGDataType.vector3f, connection: amplitude),
-                .init(name: "pivot", dataType: SGDataType.float, connection: pivot),
-                .init(name: "texcoord", dataType: SGDataType.vector2f, connection: texcoord),
+                .init(nameID: 2, dataType: SGDataType.vector3f, connection: amplitude),
+                .init(nameID: 89, dataType: SGDataType.float, connection: pivot),
+                .init(nameID: 104, dataType: SGDataType.vector2f, connection: texcoord),
             ],
             outputs: [.init(dataType: SGDataType.vector3f)])))
     }
     if SGDataType.float.matches(amplitude) {
         return SGVector(source: .nodeOutput(SGNode(
-            nodeType: "ND_noise2d_vector3FA",
+            nodeTypeID: 555, // ND_noise2d_vector3FA
             inputs: [
-                .init(name: "amplitude", dataType: SGDataType.float, connection: amplitude),
-                .init(name: "pivot", dataType: SGDataType.float, connection: pivot),
-                .init(name: "texcoord", dataType: SGDataType.vector2f, connection: texcoord),
+                .init(nameID: 2, dataType: SGDataType.float, connection: amplitude),
+                .init(nameID: 89, dataType: SGDataType.float, connection: pivot),
+                .init(nameID: 104, dataType: SGDataType.vector2f, connection: texcoord),
             ],
             outputs: [.init(dataType: SGDataType.vector3f)])))
     }
     if SGDataType.vector4f.matches(amplitude) {
         return SGVector(source: .nodeOutput(SGNode(
-            nodeType: "ND_noise2d_vector4",
+            nodeTypeID: 556, // ND_noise2d_vector4
             inputs: [
-                .init(name: "amplitude", dataType: SGDataType.vector4f, connection: amplitude),
-                .init(name: "pivot", dataType: SGDataType.float, connection: pivot),
-                .init(name: "texcoord", dataType: SGDataType.vector2f, connection: texcoord),
+                .init(nameID: 2, dataType: SGDataType.vector4f, connection: amplitude),
+                .init(nameID: 89, dataType: SGDataType.float, connection: pivot),
+                .init(nameID: 104, dataType: SGDataType.vector2f, connection: texcoord),
             ],
             outputs: [.init(dataType: SGDataType.vector4f)])))
     }
     if SGDataType.float.matches(amplitude) {
         return SGVector(source: .nodeOutput(SGNode(
-            nodeType: "ND_noise2d_vector4FA",
+            nodeTypeID: 557, // ND_noise2d_vector4FA
             inputs: [
-                .init(name: "amplitude", dataType: SGDataType.float, connection: amplitude),
-                .init(name: "pivot", dataType: SGDataType.float, connection: pivot),
-                .init(name: "texcoord", dataType: SGDataType.vector2f, connection: texcoord),
+                .init(nameID: 2, dataType: SGDataType.float, connection: amplitude),
+                .init(nameID: 89, dataType: SGDataType.float, connection: pivot),
+                .init(nameID: 104, dataType: SGDataType.vector2f, connection: texcoord),
             ],
             outputs: [.init(dataType: SGDataType.vector4f)])))
     }
@@ -4096,111 +4096,111 @@ public func noise3D(amplitude: SGNumeric, pivot: SGScalar? = nil, position: SGVe
     }
     if SGDataType.vector3f.matches(amplitude) {
         return SGColor(source: .nodeOutput(SGNode(
-            nodeType: "ND_noise3d_color3",
+            nodeTypeID: 558, // ND_noise3d_color3
             inputs: [
-                .init(name: "amplitude", dataType: SGDataType.vector3f, connection: amplitude),
-                .init(name: "pivot", dataType: SGDataType.float, connection: pivot),
-                .init(name: "position", dataType: SGDataType.vector3f, connection: position),
+                .init(nameID: 2, dataType: SGDataType.vector3f, connection: amplitude),
+                .init(nameID: 89, dataType: SGDataType.float, connection: pivot),
+                .init(nameID: 90, dataType: SGDataType.vector3f, connection: position),
             ],
             outputs: [.init(dataType: SGDataType.color3f)])))
     }
     if SGDataType.float.matches(amplitude) {
         return SGColor(source: .nodeOutput(SGNode(
-            nodeType: "ND_noise3d_color3FA",
+            nodeTypeID: 559, // ND_noise3d_color3FA
             inputs: [
-                .init(name: "amplitude", dataType: SGDataType.float, connection: amplitude),
-                .init(name: "pivot", dataType: SGDataType.float, connection: pivot),
-                .init(name: "position", dataType: SGDataType.vector3f, connection: position),
+                .init(nameID: 2, dataType: SGDataType.float, connection: amplitude),
+                .init(nameID: 89, dataType: SGDataType.float, connection: pivot),
+                .init(nameID: 90, dataType: SGDataType.vector3f, connection: position),
             ],
             outputs: [.init(dataType: SGDataType.color3f)])))
     }
     if SGDataType.vector4f.matches(amplitude) {
         return SGColor(source: .nodeOutput(SGNode(
-            nodeType: "ND_noise3d_color4",
+            nodeTypeID: 560, // ND_noise3d_color4
             inputs: [
-                .init(name: "amplitude", dataType: SGDataType.vector4f, connection: amplitude),
-                .init(name: "pivot", dataType: SGDataType.float, connection: pivot),
-                .init(name: "position", dataType: SGDataType.vector3f, connection: position),
+                .init(nameID: 2, dataType: SGDataType.vector4f, connection: amplitude),
+                .init(nameID: 89, dataType: SGDataType.float, connection: pivot),
+                .init(nameID: 90, dataType: SGDataType.vector3f, connection: position),
             ],
             outputs: [.init(dataType: SGDataType.color4f)])))
     }
     if SGDataType.float.matches(amplitude) {
         return SGColor(source: .nodeOutput(SGNode(
-            nodeType: "ND_noise3d_color4FA",
+            nodeTypeID: 561, // ND_noise3d_color4FA
             inputs: [
-                .init(name: "amplitude", dataType: SGDataType.float, connection: amplitude),
-                .init(name: "pivot", dataType: SGDataType.float, connection: pivot),
-                .init(name: "position", dataType: SGDataType.vector3f, connection: position),
+                .init(nameID: 2, dataType: SGDataType.float, connection: amplitude),
+                .init(nameID: 89, dataType: SGDataType.float, connection: pivot),
+                .init(nameID: 90, dataType: SGDataType.vector3f, connection: position),
             ],
             outputs: [.init(dataType: SGDataType.color4f)])))
     }
     if SGDataType.float.matches(amplitude) {
         return SGScalar(source: .nodeOutput(SGNode(
-            nodeType: "ND_noise3d_float",
+            nodeTypeID: 562, // ND_noise3d_float
             inputs: [
-                .init(name: "amplitude", dataType: SGDataType.float, connection: amplitude),
-                .init(name: "pivot", dataType: SGDataType.float, connection: pivot),
-                .init(name: "position", dataType: SGDataType.vector3f, connection: position),
+                .init(nameID: 2, dataType: SGDataType.float, connection: amplitude),
+                .init(nameID: 89, dataType: SGDataType.float, connection: pivot),
+                .init(nameID: 90, dataType: SGDataType.vector3f, connection: position),
             ],
             outputs: [.init(dataType: SGDataType.float)])))
     }
     if SGDataType.vector2f.matches(amplitude) {
         return SGVector(source: .nodeOutput(SGNode(
-            nodeType: "ND_noise3d_vector2",
+            nodeTypeID: 563, // ND_noise3d_vector2
             inputs: [
-                .init(name: "amplitude", dataType: SGDataType.vector2f, connection: amplitude),
-                .init(name: "pivot", dataType: SGDataType.float, connection: pivot),
-                .init(name: "position", dataType: SGDataType.vector3f, connection: position),
+                .init(nameID: 2, dataType: SGDataType.vector2f, connection: amplitude),
+                .init(nameID: 89, dataType: SGDataType.float, connection: pivot),
+                .init(nameID: 90, dataType: SGDataType.vector3f, connection: position),
             ],
             outputs: [.init(dataType: SGDataType.vector2f)])))
     }
     if SGDataType.float.matches(amplitude) {
         return SGVector(source: .nodeOutput(SGNode(
-            nodeType: "ND_noise3d_vector2FA",
+            nodeTypeID: 564, // ND_noise3d_vector2FA
             inputs: [
-                .init(name: "amplitude", dataType: SGDataType.float, connection: amplitude),
-                .init(name: "pivot", dataType: SGDataType.float, connection: pivot),
-                .init(name: "position", dataType: SGDataType.vector3f, connection: position),
+                .init(nameID: 2, dataType: SGDataType.float, connection: amplitude),
+                .init(nameID: 89, dataType: SGDataType.float, connection: pivot),
+                .init(nameID: 90, dataType: SGDataType.vector3f, connection: position),
             ],
             outputs: [.init(dataType: SGDataType.vector2f)])))
     }
     if SGDataType.vector3f.matches(amplitude) {
         return SGVector(source: .nodeOutput(SGNode(
-            nodeType: "ND_noise3d_vector3",
+            nodeTypeID: 565, // ND_noise3d_vector3
             inputs: [
-                .init(name: "amplitude", dataType: SGDataType.vector3f, connection: amplitude),
-                .init(name: "pivot", dataType: SGDataType.float, connection: pivot),
-                .init(name: "position", dataType: SGDataType.vector3f, connection: position),
+                .init(nameID: 2, dataType: SGDataType.vector3f, connection: amplitude),
+                .init(nameID: 89, dataType: SGDataType.float, connection: pivot),
+                .init(nameID: 90, dataType: SGDataType.vector3f, connection: position),
             ],
             outputs: [.init(dataType: SGDataType.vector3f)])))
     }
     if SGDataType.float.matches(amplitude) {
         return SGVector(source: .nodeOutput(SGNode(
-            nodeType: "ND_noise3d_vector3FA",
+            nodeTypeID: 566, // ND_noise3d_vector3FA
             inputs: [
-                .init(name: "amplitude", dataType: SGDataType.float, connection: amplitude),
-                .init(name: "pivot", dataType: SGDataType.float, connection: pivot),
-                .init(name: "position", dataType: SGDataType.vector3f, connection: position),
+                .init(nameID: 2, dataType: SGDataType.float, connection: amplitude),
+                .init(nameID: 89, dataType: SGDataType.float, connection: pivot),
+                .init(nameID: 90, dataType: SGDataType.vector3f, connection: position),
             ],
             outputs: [.init(dataType: SGDataType.vector3f)])))
     }
     if SGDataType.vector4f.matches(amplitude) {
         return SGVector(source: .nodeOutput(SGNode(
-            nodeType: "ND_noise3d_vector4",
+            nodeTypeID: 567, // ND_noise3d_vector4
             inputs: [
-                .init(name: "amplitude", dataType: SGDataType.vector4f, connection: amplitude),
-                .init(name: "pivot", dataType: SGDataType.float, connection: pivot),
-                .init(name: "position", dataType: SGDataType.vector3f, connection: position),
+                .init(nameID: 2, dataType: SGDataType.vector4f, connection: amplitude),
+                .init(nameID: 89, dataType: SGDataType.float, connection: pivot),
+                .init(nameID: 90, dataType: SGDataType.vector3f, connection: position),
             ],
             outputs: [.init(dataType: SGDataType.vector4f)])))
     }
     if SGDataType.float.matches(amplitude) {
         return SGVector(source: .nodeOutput(SGNode(
-            nodeType: "ND_noise3d_vector4FA",
+            nodeTypeID: 568, // ND_noise3d_vector4FA
             inputs: [
-                .init(name: "amplitude", dataType: SGDataType.float, connection: amplitude),
-                .init(name: "pivot", dataType: SGDataType.float, connection: pivot),
-                .init(name: "position", dataType: SGDataType.vector3f, connection: position),
+                .init(nameID: 2, dataType: SGDataType.float, connection: amplitude),
+                .init(nameID: 89, dataType: SGDataType.float, connection: pivot),
+                .init(nameID: 90, dataType: SGDataType.vector3f, connection: position),
             ],
             outputs: [.init(dataType: SGDataType.vector4f)])))
     }
@@ -4219,25 +4219,25 @@ public func normalMap(_ in1: SGVector, space: SGNormalSpace = SGNormalSpace.tang
     }
     if SGDataType.float.matches(scale) {
         return SGVector(source: .nodeOutput(SGNode(
-            nodeType: "ND_normalmap",
+            nodeTypeID: 577, // ND_normalmap
             inputs: [
-                .init(name: "in", dataType: SGDataType.vector3f, connection: in1),
-                .init(name: "space", dataType: SGDataType.string, connection: SGString(source: .constant(.string(space.rawValue)))),
-                .init(name: "scale", dataType: SGDataType.float, connection: scale),
-                .init(name: "normal", dataType: SGDataType.vector3f, connection: normal),
-                .init(name: "tangent", dataType: SGDataType.vector3f, connection: tangent),
+                .init(nameID: 42, dataType: SGDataType.vector3f, connection: in1),
+                .init(nameID: 99, dataType: SGDataType.string, connection: SGString(source: .constant(.string(space.rawValue)))),
+                .init(nameID: 97, dataType: SGDataType.float, connection: scale),
+                .init(nameID: 80, dataType: SGDataType.vector3f, connection: normal),
+                .init(nameID: 103, dataType: SGDataType.vector3f, connection: tangent),
             ],
             outputs: [.init(dataType: SGDataType.vector3f)])))
     }
     if SGDataType.vector2f.matches(scale) {
         return SGVector(source: .nodeOutput(SGNode(
-            nodeType: "ND_normalmap_vector2",
+            nodeTypeID: 578, // ND_normalmap_vector2
             inputs: [
-                .init(name: "in", dataType: SGDataType.vector3f, connection: in1),
-                .init(name: "space", dataType: SGDataType.string, connection: SGString(source: .constant(.string(space.rawValue)))),
-                .init(name: "scale", dataType: SGDataType.vector2f, connection: scale),
-                .init(name: "normal", dataType: SGDataType.vector3f, connection: normal),
-                .init(name: "tangent", dataType: SGDataType.vector3f, connection: tangent),
+                .init(nameID: 42, dataType: SGDataType.vector3f, connection: in1),
+                .init(nameID: 99, dataType: SGDataType.string, connection: SGString(source: .constant(.string(space.rawValue)))),
+                .init(nameID: 97, dataType: SGDataType.vector2f, connection: scale),
+                .init(nameID: 80, dataType: SGDataType.vector3f, connection: normal),
+                .init(nameID: 103, dataType: SGDataType.vector3f, connection: tangent),
             ],
             outputs: [.init(dataType: SGDataType.vector3f)])))
     }
@@ -4249,9 +4249,9 @@ public func normalMapDecode(_ in1: SGVector) -> SGVector {
         return SGVector(source: .error("Invalid normalMapDecode input. Expected in1 data type to be SGDataType.vector3f, but got \(in1.dataType).", values: [in1]))
     }
     return SGVector(source: .nodeOutput(SGNode(
-        nodeType: "ND_normal_map_decode",
+        nodeTypeID: 569, // ND_normal_map_decode
         inputs: [
-            .init(name: "in", dataType: SGDataType.vector3f, connection: in1),
+            .init(nameID: 42, dataType: SGDataType.vector3f, connection: in1),
         ],
         outputs: [.init(dataType: SGDataType.vector3f)])))
 }
@@ -4259,49 +4259,49 @@ public func normalMapDecode(_ in1: SGVector) -> SGVector {
 public func normalize(_ in1: SGVector) -> SGVector {
     if SGDataType.vector2h.matches(in1) {
         return SGVector(source: .nodeOutput(SGNode(
-            nodeType: "ND_normalize_half2",
+            nodeTypeID: 571, // ND_normalize_half2
             inputs: [
-                .init(name: "in", dataType: SGDataType.vector2h, connection: in1),
+                .init(nameID: 42, dataType: SGDataType.vector2h, connection: in1),
             ],
             outputs: [.init(dataType: SGDataType.vector2h)])))
     }
     if SGDataType.vector3h.matches(in1) {
         return SGVector(source: .nodeOutput(SGNode(
-            nodeType: "ND_normalize_half3",
+            nodeTypeID: 572, // ND_normalize_half3
             inputs: [
-                .init(name: "in", dataType: SGDataType.vector3h, connection: in1),
+                .init(nameID: 42, dataType: SGDataType.vector3h, connection: in1),
             ],
             outputs: [.init(dataType: SGDataType.vector3h)])))
     }
     if SGDataType.vector4h.matches(in1) {
         return SGVector(source: .nodeOutput(SGNode(
-            nodeType: "ND_normalize_half4",
+            nodeTypeID: 573, // ND_normalize_half4
             inputs: [
-                .init(name: "in", dataType: SGDataType.vector4h, connection: in1),
+                .init(nameID: 42, dataType: SGDataType.vector4h, connection: in1),
             ],
             outputs: [.init(dataType: SGDataType.vector4h)])))
     }
     if SGDataType.vector2f.matches(in1) {
         return SGVector(source: .nodeOutput(SGNode(
-            nodeType: "ND_normalize_vector2",
+            nodeTypeID: 574, // ND_normalize_vector2
             inputs: [
-                .init(name: "in", dataType: SGDataType.vector2f, connection: in1),
+                .init(nameID: 42, dataType: SGDataType.vector2f, connection: in1),
             ],
             outputs: [.init(dataType: SGDataType.vector2f)])))
     }
     if SGDataType.vector3f.matches(in1) {
         return SGVector(source: .nodeOutput(SGNode(
-            nodeType: "ND_normalize_vector3",
+            nodeTypeID: 575, // ND_normalize_vector3
             inputs: [
-                .init(name: "in", dataType: SGDataType.vector3f, connection: in1),
+                .init(nameID: 42, dataType: SGDataType.vector3f, connection: in1),
             ],
             outputs: [.init(dataType: SGDataType.vector3f)])))
     }
     if SGDataType.vector4f.matches(in1) {
         return SGVector(source: .nodeOutput(SGNode(
-            nodeType: "ND_normalize_vector4",
+            nodeTypeID: 576, // ND_normalize_vector4
             inputs: [
-                .init(name: "in", dataType: SGDataType.vector4f, connection: in1),
+                .init(nameID: 42, dataType: SGDataType.vector4f, connection: in1),
             ],
             outputs: [.init(dataType: SGDataType.vector4f)])))
     }
@@ -4311,49 +4311,49 @@ public func normalize(_ in1: SGVector) -> SGVector {
 public func oneMinus<T>(_ in1: T) -> T where T: SGNumeric {
     if SGDataType.color3f.matches(in1) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_realitykit_oneminus_color3",
+            nodeTypeID: 698, // ND_realitykit_oneminus_color3
             inputs: [
-                .init(name: "in", dataType: SGDataType.color3f, connection: in1),
+                .init(nameID: 42, dataType: SGDataType.color3f, connection: in1),
             ],
             outputs: [.init(dataType: SGDataType.color3f)])))
     }
     if SGDataType.color4f.matches(in1) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_realitykit_oneminus_color4",
+            nodeTypeID: 699, // ND_realitykit_oneminus_color4
             inputs: [
-                .init(name: "in", dataType: SGDataType.color4f, connection: in1),
+                .init(nameID: 42, dataType: SGDataType.color4f, connection: in1),
             ],
             outputs: [.init(dataType: SGDataType.color4f)])))
     }
     if SGDataType.float.matches(in1) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_realitykit_oneminus_float",
+            nodeTypeID: 700, // ND_realitykit_oneminus_float
             inputs: [
-                .init(name: "in", dataType: SGDataType.float, connection: in1),
+                .init(nameID: 42, dataType: SGDataType.float, connection: in1),
             ],
             outputs: [.init(dataType: SGDataType.float)])))
     }
     if SGDataType.vector2f.matches(in1) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_realitykit_oneminus_vector2",
+            nodeTypeID: 701, // ND_realitykit_oneminus_vector2
             inputs: [
-                .init(name: "in", dataType: SGDataType.vector2f, connection: in1),
+                .init(nameID: 42, dataType: SGDataType.vector2f, connection: in1),
             ],
             outputs: [.init(dataType: SGDataType.vector2f)])))
     }
     if SGDataType.vector3f.matches(in1) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_realitykit_oneminus_vector3",
+            nodeTypeID: 702, // ND_realitykit_oneminus_vector3
             inputs: [
-                .init(name: "in", dataType: SGDataType.vector3f, connection: in1),
+                .init(nameID: 42, dataType: SGDataType.vector3f, connection: in1),
             ],
             outputs: [.init(dataType: SGDataType.vector3f)])))
     }
     if SGDataType.vector4f.matches(in1) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_realitykit_oneminus_vector4",
+            nodeTypeID: 703, // ND_realitykit_oneminus_vector4
             inputs: [
-                .init(name: "in", dataType: SGDataType.vector4f, connection: in1),
+                .init(nameID: 42, dataType: SGDataType.vector4f, connection: in1),
             ],
             outputs: [.init(dataType: SGDataType.vector4f)])))
     }
@@ -4371,11 +4371,11 @@ public func out(fg: SGColor? = nil, bg: SGColor? = nil, mix: SGScalar? = nil) ->
         return SGColor(source: .error("Invalid out input. Expected mix data type to be SGDataType.float, but got \(mix?.dataType.rawValue ?? "nil").", values: [mix]))
     }
     return SGColor(source: .nodeOutput(SGNode(
-        nodeType: "ND_out_color4",
+        nodeTypeID: 579, // ND_out_color4
         inputs: [
-            .init(name: "fg", dataType: SGDataType.color4f, connection: fg),
-            .init(name: "bg", dataType: SGDataType.color4f, connection: bg),
-            .init(name: "mix", dataType: SGDataType.float, connection: mix),
+            .init(nameID: 26, dataType: SGDataType.color4f, connection: fg),
+            .init(nameID: 6, dataType: SGDataType.color4f, connection: bg),
+            .init(nameID: 77, dataType: SGDataType.float, connection: mix),
         ],
         outputs: [.init(dataType: SGDataType.color4f)])))
 }
@@ -4383,37 +4383,37 @@ public func out(fg: SGColor? = nil, bg: SGColor? = nil, mix: SGScalar? = nil) ->
 public func outside<T>(_ in1: T, mask: SGScalar? = nil) -> T where T: SGNumeric {
     if SGDataType.color3f.matches(in1) && SGDataType.float.matches(mask) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_outside_color3",
+            nodeTypeID: 580, // ND_outside_color3
             inputs: [
-                .init(name: "in", dataType: SGDataType.color3f, connection: in1),
-                .init(name: "mask", dataType: SGDataType.float, connection: mask),
+                .init(nameID: 42, dataType: SGDataType.color3f, connection: in1),
+                .init(nameID: 68, dataType: SGDataType.float, connection: mask),
             ],
             outputs: [.init(dataType: SGDataType.color3f)])))
     }
     if SGDataType.color4f.matches(in1) && SGDataType.float.matches(mask) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_outside_color4",
+            nodeTypeID: 581, // ND_outside_color4
             inputs: [
-                .init(name: "in", dataType: SGDataType.color4f, connection: in1),
-                .init(name: "mask", dataType: SGDataType.float, connection: mask),
+                .init(nameID: 42, dataType: SGDataType.color4f, connection: in1),
+                .init(nameID: 68, dataType: SGDataType.float, connection: mask),
             ],
             outputs: [.init(dataType: SGDataType.color4f)])))
     }
     if SGDataType.float.matches(in1) && SGDataType.float.matches(mask) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_outside_float",
+            nodeTypeID: 582, // ND_outside_float
             inputs: [
-                .init(name: "in", dataType: SGDataType.float, connection: in1),
-                .init(name: "mask", dataType: SGDataType.float, connection: mask),
+                .init(nameID: 42, dataType: SGDataType.float, connection: in1),
+                .init(nameID: 68, dataType: SGDataType.float, connection: mask),
             ],
             outputs: [.init(dataType: SGDataType.float)])))
     }
     if SGDataType.half.matches(in1) && SGDataType.half.matches(mask) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_outside_half",
+            nodeTypeID: 583, // ND_outside_half
             inputs: [
-                .init(name: "in", dataType: SGDataType.half, connection: in1),
-                .init(name: "mask", dataType: SGDataType.half, connection: mask),
+                .init(nameID: 42, dataType: SGDataType.half, connection: in1),
+                .init(nameID: 68, dataType: SGDataType.half, connection: mask),
             ],
             outputs: [.init(dataType: SGDataType.half)])))
     }
@@ -4431,11 +4431,11 @@ public func over(fg: SGColor? = nil, bg: SGColor? = nil, mix: SGScalar? = nil) -
         return SGColor(source: .error("Invalid over input. Expected mix data type to be SGDataType.float, but got \(mix?.dataType.rawValue ?? "nil").", values: [mix]))
     }
     return SGColor(source: .nodeOutput(SGNode(
-        nodeType: "ND_over_color4",
+        nodeTypeID: 584, // ND_over_color4
         inputs: [
-            .init(name: "fg", dataType: SGDataType.color4f, connection: fg),
-            .init(name: "bg", dataType: SGDataType.color4f, connection: bg),
-            .init(name: "mix", dataType: SGDataType.float, connection: mix),
+            .init(nameID: 26, dataType: SGDataType.color4f, connection: fg),
+            .init(nameID: 6, dataType: SGDataType.color4f, connection: bg),
+            .init(nameID: 77, dataType: SGDataType.float, connection: mix),
         ],
         outputs: [.init(dataType: SGDataType.color4f)])))
 }
@@ -4443,41 +4443,41 @@ public func over(fg: SGColor? = nil, bg: SGColor? = nil, mix: SGScalar? = nil) -
 public func overlay<T>(fg: T, bg: T, mix: SGScalar? = nil) -> T where T: SGNumeric {
     if SGDataType.color3f.matches(fg) && SGDataType.color3f.matches(bg) && SGDataType.float.matches(mix) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_overlay_color3",
+            nodeTypeID: 585, // ND_overlay_color3
             inputs: [
-                .init(name: "fg", dataType: SGDataType.color3f, connection: fg),
-                .init(name: "bg", dataType: SGDataType.color3f, connection: bg),
-                .init(name: "mix", dataType: SGDataType.float, connection: mix),
+                .init(nameID: 26, dataType: SGDataType.color3f, connection: fg),
+                .init(nameID: 6, dataType: SGDataType.color3f, connection: bg),
+                .init(nameID: 77, dataType: SGDataType.float, connection: mix),
             ],
             outputs: [.init(dataType: SGDataType.color3f)])))
     }
     if SGDataType.color4f.matches(fg) && SGDataType.color4f.matches(bg) && SGDataType.float.matches(mix) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_overlay_color4",
+            nodeTypeID: 586, // ND_overlay_color4
             inputs: [
-                .init(name: "fg", dataType: SGDataType.color4f, connection: fg),
-                .init(name: "bg", dataType: SGDataType.color4f, connection: bg),
-                .init(name: "mix", dataType: SGDataType.float, connection: mix),
+                .init(nameID: 26, dataType: SGDataType.color4f, connection: fg),
+                .init(nameID: 6, dataType: SGDataType.color4f, connection: bg),
+                .init(nameID: 77, dataType: SGDataType.float, connection: mix),
             ],
             outputs: [.init(dataType: SGDataType.color4f)])))
     }
     if SGDataType.float.matches(fg) && SGDataType.float.matches(bg) && SGDataType.float.matches(mix) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_overlay_float",
+            nodeTypeID: 587, // ND_overlay_float
             inputs: [
-                .init(name: "fg", dataType: SGDataType.float, connection: fg),
-                .init(name: "bg", dataType: SGDataType.float, connection: bg),
-                .init(name: "mix", dataType: SGDataType.float, connection: mix),
+                .init(nameID: 26, dataType: SGDataType.float, connection: fg),
+                .init(nameID: 6, dataType: SGDataType.float, connection: bg),
+                .init(nameID: 77, dataType: SGDataType.float, connection: mix),
             ],
             outputs: [.init(dataType: SGDataType.float)])))
     }
     if SGDataType.half.matches(fg) && SGDataType.half.matches(bg) && SGDataType.half.matches(mix) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_overlay_half",
+            nodeTypeID: 588, // ND_overlay_half
             inputs: [
-                .init(name: "fg", dataType: SGDataType.half, connection: fg),
-                .init(name: "bg", dataType: SGDataType.half, connection: bg),
-                .init(name: "mix", dataType: SGDataType.half, connection: mix),
+                .init(nameID: 26, dataType: SGDataType.half, connection: fg),
+                .init(nameID: 6, dataType: SGDataType.half, connection: bg),
+                .init(nameID: 77, dataType: SGDataType.half, connection: mix),
             ],
             outputs: [.init(dataType: SGDataType.half)])))
     }
@@ -4519,20 +4519,20 @@ public func pbrSurface(baseColor: SGColor? = nil, emissiveColor: SGColor? = nil,
         return SGToken(source: .error("Invalid pbrSurface input. Expected clearcoatRoughness data type to be SGDataType.float, but got \(clearcoatRoughness?.dataType.rawValue ?? "nil").", values: [clearcoatRoughness]))
     }
     return SGToken(source: .nodeOutput(SGNode(
-        nodeType: "ND_realitykit_pbr_surfaceshader",
+        nodeTypeID: 704, // ND_realitykit_pbr_surfaceshader
         inputs: [
-            .init(name: "baseColor", dataType: SGDataType.color3f, connection: baseColor),
-            .init(name: "emissiveColor", dataType: SGDataType.color3f, connection: emissiveColor),
-            .init(name: "normal", dataType: SGDataType.vector3f, connection: normal),
-            .init(name: "roughness", dataType: SGDataType.float, connection: roughness),
-            .init(name: "metallic", dataType: SGDataType.float, connection: metallic),
-            .init(name: "ambientOcclusion", dataType: SGDataType.float, connection: ambientOcclusion),
-            .init(name: "specular", dataType: SGDataType.float, connection: specular),
-            .init(name: "opacity", dataType: SGDataType.float, connection: opacity),
-            .init(name: "opacityThreshold", dataType: SGDataType.float, connection: opacityThreshold),
-            .init(name: "clearcoat", dataType: SGDataType.float, connection: clearcoat),
-            .init(name: "clearcoatRoughness", dataType: SGDataType.float, connection: clearcoatRoughness),
-            .init(name: "hasPremultipliedAlpha", dataType: SGDataType.bool, connection: SGValue(source: .constant(.bool(hasPremultipliedAlpha)))),
+            .init(nameID: 5, dataType: SGDataType.color3f, connection: baseColor),
+            .init(nameID: 23, dataType: SGDataType.color3f, connection: emissiveColor),
+            .init(nameID: 80, dataType: SGDataType.vector3f, connection: normal),
+            .init(nameID: 96, dataType: SGDataType.float, connection: roughness),
+            .init(nameID: 73, dataType: SGDataType.float, connection: metallic),
+            .init(nameID: 0, dataType: SGDataType.float, connection: ambientOcclusion),
+            .init(nameID: 100, dataType: SGDataType.float, connection: specular),
+            .init(nameID: 85, dataType: SGDataType.float, connection: opacity),
+            .init(nameID: 86, dataType: SGDataType.float, connection: opacityThreshold),
+            .init(nameID: 12, dataType: SGDataType.float, connection: clearcoat),
+            .init(nameID: 13, dataType: SGDataType.float, connection: clearcoatRoughness),
+            .init(nameID: 40, dataType: SGDataType.bool, connection: SGValue(source: .constant(.bool(hasPremultipliedAlpha)))),
         ],
         outputs: [.init(dataType: SGDataType.token)])))
 }
@@ -4564,61 +4564,61 @@ public func pixel<T>(file: SGTexture, uWrapMode: SGSamplerAddressModeWithoutRepe
     }
     if SGDataType.color3f.matches(defaultValue) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_RealityKitTexture2DPixel_color3",
-            inputs: [
-                .init(name: "file", dataType: SGDataType.asset, connection: file),
-                .init(name: "u_wrap_mode", dataType: SGDataType.string, connection: SGString(source: .constant(.string(uWrapMode.rawValue)))),
-                .init(name: "v_wrap_mode", dataType: SGDataType.string, connection: SGString(source: .constant(.string(vWrapMode.rawValue)))),
-                .init(name: "border_color", dataType: SGDataType.string, connection: SGString(source: .constant(.string(borderColor.rawValue)))),
-                .init(name: "filter", dataType: SGDataType.string, connection: SGString(source: .constant(.string(filter.rawValue)))),
-                .init(name: "max_anisotropy", dataType: SGDataType.int, connection: maxAnisotropy),
-                .init(name: "max_lod_clamp", dataType: SGDataType.float, connection: maxLodClamp),
-                .init(name: "min_lod_clamp", dataType: SGDataType.float, connection: minLodClamp),
-                .init(name: "default", dataType: SGDataType.color3f, connection: defaultValue),
-                .init(name: "texcoord", dataType: SGDataType.vector2f, connection: texcoord),
-                .init(name: "bias", dataType: SGDataType.float, connection: bias),
-                .init(name: "dynamic_min_lod_clamp", dataType: SGDataType.float, connection: dynamicMinLodClamp),
-                .init(name: "offset", dataType: SGDataType.vector2i, connection: offset),
+            nodeTypeID: 26, // ND_RealityKitTexture2DPixel_color3
+            inputs: [
+                .init(nameID: 27, dataType: SGDataType.asset, connection: file),
+                .init(nameID: 107, dataType: SGDataType.string, connection: SGString(source: .constant(.string(uWrapMode.rawValue)))),
+                .init(nameID: 120, dataType: SGDataType.string, connection: SGString(source: .constant(.string(vWrapMode.rawValue)))),
+                .init(nameID: 9, dataType: SGDataType.string, connection: SGString(source: .constant(.string(borderColor.rawValue)))),
+                .init(nameID: 31, dataType: SGDataType.string, connection: SGString(source: .constant(.string(filter.rawValue)))),
+                .init(nameID: 70, dataType: SGDataType.int, connection: maxAnisotropy),
+                .init(nameID: 71, dataType: SGDataType.float, connection: maxLodClamp),
+                .init(nameID: 75, dataType: SGDataType.float, connection: minLodClamp),
+                .init(nameID: 16, dataType: SGDataType.color3f, connection: defaultValue),
+                .init(nameID: 104, dataType: SGDataType.vector2f, connection: texcoord),
+                .init(nameID: 7, dataType: SGDataType.float, connection: bias),
+                .init(nameID: 21, dataType: SGDataType.float, connection: dynamicMinLodClamp),
+                .init(nameID: 84, dataType: SGDataType.vector2i, connection: offset),
             ],
             outputs: [.init(dataType: SGDataType.color3f)])))
     }
     if SGDataType.color4f.matches(defaultValue) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_RealityKitTexture2DPixel_color4",
-            inputs: [
-                .init(name: "file", dataType: SGDataType.asset, connection: file),
-                .init(name: "u_wrap_mode", dataType: SGDataType.string, connection: SGString(source: .constant(.string(uWrapMode.rawValue)))),
-                .init(name: "v_wrap_mode", dataType: SGDataType.string, connection: SGString(source: .constant(.string(vWrapMode.rawValue)))),
-                .init(name: "border_color", dataType: SGDataType.string, connection: SGString(source: .constant(.string(borderColor.rawValue)))),
-                .init(name: "filter", dataType: SGDataType.string, connection: SGString(source: .constant(.string(filter.rawValue)))),
-                .init(name: "max_anisotropy", dataType: SGDataType.int, connection: maxAnisotropy),
-                .init(name: "max_lod_clamp", dataType: SGDataType.float, connection: maxLodClamp),
-                .init(name: "min_lod_clamp", dataType: SGDataType.float, connection: minLodClamp),
-                .init(name: "default", dataType: SGDataType.color4f, connection: defaultValue),
-                .init(name: "texcoord", dataType: SGDataType.vector2f, connection: texcoord),
-                .init(name: "bias", dataType: SGDataType.float, connection: bias),
-                .init(name: "dynamic_min_lod_clamp", dataType: SGDataType.float, connection: dynamicMinLodClamp),
-                .init(name: "offset", dataType: SGDataType.vector2i, connection: offset),
+            nodeTypeID: 27, // ND_RealityKitTexture2DPixel_color4
+            inputs: [
+                .init(nameID: 27, dataType: SGDataType.asset, connection: file),
+                .init(nameID: 107, dataType: SGDataType.string, connection: SGString(source: .constant(.string(uWrapMode.rawValue)))),
+                .init(nameID: 120, dataType: SGDataType.string, connection: SGString(source: .constant(.string(vWrapMode.rawValue)))),
+                .init(nameID: 9, dataType: SGDataType.string, connection: SGString(source: .constant(.string(borderColor.rawValue)))),
+                .init(nameID: 31, dataType: SGDataType.string, connection: SGString(source: .constant(.string(filter.rawValue)))),
+                .init(nameID: 70, dataType: SGDataType.int, connection: maxAnisotropy),
+                .init(nameID: 71, dataType: SGDataType.float, connection: maxLodClamp),
+                .init(nameID: 75, dataType: SGDataType.float, connection: minLodClamp),
+                .init(nameID: 16, dataType: SGDataType.color4f, connection: defaultValue),
+                .init(nameID: 104, dataType: SGDataType.vector2f, connection: texcoord),
+                .init(nameID: 7, dataType: SGDataType.float, connection: bias),
+                .init(nameID: 21, dataType: SGDataType.float, connection: dynamicMinLodClamp),
+                .init(nameID: 84, dataType: SGDataType.vector2i, connection: offset),
             ],
             outputs: [.init(dataType: SGDataType.color4f)])))
     }
     if SGDataType.vector4f.matches(defaultValue) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_RealityKitTexture2DPixel_vector4",
-            inputs: [
-                .init(name: "file", dataType: SGDataType.asset, connection: file),
-                .init(name: "u_wrap_mode", dataType: SGDataType.string, connection: SGString(source: .constant(.string(uWrapMode.rawValue)))),
-                .init(name: "v_wrap_mode", dataType: SGDataType.string, connection: SGString(source: .constant(.string(vWrapMode.rawValue)))),
-                .init(name: "border_color", dataType: SGDataType.string, connection: SGString(source: .constant(.string(borderColor.rawValue)))),
-                .init(name: "filter", dataType: SGDataType.string, connection: SGString(source: .constant(.string(filter.rawValue)))),
-                .init(name: "max_anisotropy", dataType: SGDataType.int, connection: maxAnisotropy),
-                .init(name: "max_lod_clamp", dataType: SGDataType.float, connection: maxLodClamp),
-                .init(name: "min_lod_clamp", dataType: SGDataType.float, connection: minLodClamp),
-                .init(name: "default", dataType: SGDataType.vector4f, connection: defaultValue),
-                .init(name: "texcoord", dataType: SGDataType.vector2f, connection: texcoord),
-                .init(name: "bias", dataType: SGDataType.float, connection: bias),
-                .init(name: "dynamic_min_lod_clamp", dataType: SGDataType.float, connection: dynamicMinLodClamp),
-                .init(name: "offset", dataType: SGDataType.vector2i, connection: offset),
+            nodeTypeID: 28, // ND_RealityKitTexture2DPixel_vector4
+            inputs: [
+                .init(nameID: 27, dataType: SGDataType.asset, connection: file),
+                .init(nameID: 107, dataType: SGDataType.string, connection: SGString(source: .constant(.string(uWrapMode.rawValue)))),
+                .init(nameID: 120, dataType: SGDataType.string, connection: SGString(source: .constant(.string(vWrapMode.rawValue)))),
+                .init(nameID: 9, dataType: SGDataType.string, connection: SGString(source: .constant(.string(borderColor.rawValue)))),
+                .init(nameID: 31, dataType: SGDataType.string, connection: SGString(source: .constant(.string(filter.rawValue)))),
+                .init(nameID: 70, dataType: SGDataType.int, connection: maxAnisotropy),
+                .init(nameID: 71, dataType: SGDataType.float, connection: maxLodClamp),
+                .init(nameID: 75, dataType: SGDataType.float, connection: minLodClamp),
+                .init(nameID: 16, dataType: SGDataType.vector4f, connection: defaultValue),
+                .init(nameID: 104, dataType: SGDataType.vector2f, connection: texcoord),
+                .init(nameID: 7, dataType: SGDataType.float, connection: bias),
+                .init(nameID: 21, dataType: SGDataType.float, connection: dynamicMinLodClamp),
+                .init(nameID: 84, dataType: SGDataType.vector2i, connection: offset),
             ],
             outputs: [.init(dataType: SGDataType.vector4f)])))
     }
@@ -4655,64 +4655,64 @@ public func pixelGradient<T>(file: SGTexture, uWrapMode: SGSamplerAddressModeWit
     }
     if SGDataType.color3f.matches(defaultValue) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_RealityKitTexture2DPixelGradient_color3",
-            inputs: [
-                .init(name: "file", dataType: SGDataType.asset, connection: file),
-                .init(name: "u_wrap_mode", dataType: SGDataType.string, connection: SGString(source: .constant(.string(uWrapMode.rawValue)))),
-                .init(name: "v_wrap_mode", dataType: SGDataType.string, connection: SGString(source: .constant(.string(vWrapMode.rawValue)))),
-                .init(name: "border_color", dataType: SGDataType.string, connection: SGString(source: .constant(.string(borderColor.rawValue)))),
-                .init(name: "filter", dataType: SGDataType.string, connection: SGString(source: .constant(.string(filter.rawValue)))),
-                .init(name: "max_anisotropy", dataType: SGDataType.int, connection: maxAnisotropy),
-                .init(name: "max_lod_clamp", dataType: SGDataType.float, connection: maxLodClamp),
-                .init(name: "min_lod_clamp", dataType: SGDataType.float, connection: minLodClamp),
-                .init(name: "default", dataType: SGDataType.color3f, connection: defaultValue),
-                .init(name: "texcoord", dataType: SGDataType.vector2f, connection: texcoord),
-                .init(name: "dynamic_min_lod_clamp", dataType: SGDataType.float, connection: dynamicMinLodClamp),
-                .init(name: "gradient_dPdx", dataType: SGDataType.vector2f, connection: gradientDpdx),
-                .init(name: "gradient_dPdy", dataType: SGDataType.vector2f, connection: gradientDpdy),
-                .init(name: "offset", dataType: SGDataType.vector2i, connection: offset),
+            nodeTypeID: 20, // ND_RealityKitTexture2DPixelGradient_color3
+            inputs: [
+                .init(nameID: 27, dataType: SGDataType.asset, connection: file),
+                .init(nameID: 107, dataType: SGDataType.string, connection: SGString(source: .constant(.string(uWrapMode.rawValue)))),
+                .init(nameID: 120, dataType: SGDataType.string, connection: SGString(source: .constant(.string(vWrapMode.rawValue)))),
+                .init(nameID: 9, dataType: SGDataType.string, connection: SGString(source: .constant(.string(borderColor.rawValue)))),
+                .init(nameID: 31, dataType: SGDataType.string, connection: SGString(source: .constant(.string(filter.rawValue)))),
+                .init(nameID: 70, dataType: SGDataType.int, connection: maxAnisotropy),
+                .init(nameID: 71, dataType: SGDataType.float, connection: maxLodClamp),
+                .init(nameID: 75, dataType: SGDataType.float, connection: minLodClamp),
+                .init(nameID: 16, dataType: SGDataType.color3f, connection: defaultValue),
+                .init(nameID: 104, dataType: SGDataType.vector2f, connection: texcoord),
+                .init(nameID: 21, dataType: SGDataType.float, connection: dynamicMinLodClamp),
+                .init(nameID: 36, dataType: SGDataType.vector2f, connection: gradientDpdx),
+                .init(nameID: 37, dataType: SGDataType.vector2f, connection: gradientDpdy),
+                .init(nameID: 84, dataType: SGDataType.vector2i, connection: offset),
             ],
             outputs: [.init(dataType: SGDataType.color3f)])))
     }
     if SGDataType.color4f.matches(defaultValue) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_RealityKitTexture2DPixelGradient_color4",
-            inputs: [
-                .init(name: "file", dataType: SGDataType.asset, connection: file),
-                .init(name: "u_wrap_mode", dataType: SGDataType.string, connection: SGString(source: .constant(.string(uWrapMode.rawValue)))),
-                .init(name: "v_wrap_mode", dataType: SGDataType.string, connection: SGString(source: .constant(.string(vWrapMode.rawValue)))),
-                .init(name: "border_color", dataType: SGDataType.string, connection: SGString(source: .constant(.string(borderColor.rawValue)))),
-                .init(name: "filter", dataType: SGDataType.string, connection: SGString(source: .constant(.string(filter.rawValue)))),
-                .init(name: "max_anisotropy", dataType: SGDataType.int, connection: maxAnisotropy),
-                .init(name: "max_lod_clamp", dataType: SGDataType.float, connection: maxLodClamp),
-                .init(name: "min_lod_clamp", dataType: SGDataType.float, connection: minLodClamp),
-                .init(name: "default", dataType: SGDataType.color4f, connection: defaultValue),
-                .init(name: "texcoord", dataType: SGDataType.vector2f, connection: texcoord),
-                .init(name: "dynamic_min_lod_clamp", dataType: SGDataType.float, connection: dynamicMinLodClamp),
-                .init(name: "gradient_dPdx", dataType: SGDataType.vector2f, connection: gradientDpdx),
-                .init(name: "gradient_dPdy", dataType: SGDataType.vector2f, connection: gradientDpdy),
-                .init(name: "offset", dataType: SGDataType.vector2i, connection: offset),
+            nodeTypeID: 21, // ND_RealityKitTexture2DPixelGradient_color4
+            inputs: [
+                .init(nameID: 27, dataType: SGDataType.asset, connection: file),
+                .init(nameID: 107, dataType: SGDataType.string, connection: SGString(source: .constant(.string(uWrapMode.rawValue)))),
+                .init(nameID: 120, dataType: SGDataType.string, connection: SGString(source: .constant(.string(vWrapMode.rawValue)))),
+                .init(nameID: 9, dataType: SGDataType.string, connection: SGString(source: .constant(.string(borderColor.rawValue)))),
+                .init(nameID: 31, dataType: SGDataType.string, connection: SGString(source: .constant(.string(filter.rawValue)))),
+                .init(nameID: 70, dataType: SGDataType.int, connection: maxAnisotropy),
+                .init(nameID: 71, dataType: SGDataType.float, connection: maxLodClamp),
+                .init(nameID: 75, dataType: SGDataType.float, connection: minLodClamp),
+                .init(nameID: 16, dataType: SGDataType.color4f, connection: defaultValue),
+                .init(nameID: 104, dataType: SGDataType.vector2f, connection: texcoord),
+                .init(nameID: 21, dataType: SGDataType.float, connection: dynamicMinLodClamp),
+                .init(nameID: 36, dataType: SGDataType.vector2f, connection: gradientDpdx),
+                .init(nameID: 37, dataType: SGDataType.vector2f, connection: gradientDpdy),
+                .init(nameID: 84, dataType: SGDataType.vector2i, connection: offset),
             ],
             outputs: [.init(dataType: SGDataType.color4f)])))
     }
     if SGDataType.vector4f.matches(defaultValue) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_RealityKitTexture2DPixelGradient_vector4",
-            inputs: [
-                .init(name: "file", dataType: SGDataType.asset, connection: file),
-                .init(name: "u_wrap_mode", dataType: SGDataType.string, connection: SGString(source: .constant(.string(uWrapMode.rawValue)))),
-                .init(name: "v_wrap_mode", dataType: SGDataType.string, connection: SGString(source: .constant(.string(vWrapMode.rawValue)))),
-                .init(name: "border_color", dataType: SGDataType.string, connection: SGString(source: .constant(.string(borderColor.rawValue)))),
-                .init(name: "filter", dataType: SGDataType.string, connection: SGString(source: .constant(.string(filter.rawValue)))),
-                .init(name: "max_anisotropy", dataType: SGDataType.int, connection: maxAnisotropy),
-                .init(name: "max_lod_clamp", dataType: SGDataType.float, connection: maxLodClamp),
-                .init(name: "min_lod_clamp", dataType: SGDataType.float, connection: minLodClamp),
-                .init(name: "default", dataType: SGDataType.vector4f, connection: defaultValue),
-                .init(name: "texcoord", dataType: SGDataType.vector2f, connection: texcoord),
-                .init(name: "dynamic_min_lod_clamp", dataType: SGDataType.float, connection: dynamicMinLodClamp),
-                .init(name: "gradient_dPdx", dataType: SGDataType.vector2f, connection: gradientDpdx),
-                .init(name: "gradient_dPdy", dataType: SGDataType.vector2f, connection: gradientDpdy),
-                .init(name: "offset", dataType: SGDataType.vector2i, connection: offset),
+            nodeTypeID: 22, // ND_RealityKitTexture2DPixelGradient_vector4
+            inputs: [
+                .init(nameID: 27, dataType: SGDataType.asset, connection: file),
+                .init(nameID: 107, dataType: SGDataType.string, connection: SGString(source: .constant(.string(uWrapMode.rawValue)))),
+                .init(nameID: 120, dataType: SGDataType.string, connection: SGString(source: .constant(.string(vWrapMode.rawValue)))),
+                .init(nameID: 9, dataType: SGDataType.string, connection: SGString(source: .constant(.string(borderColor.rawValue)))),
+                .init(nameID: 31, dataType: SGDataType.string, connection: SGString(source: .constant(.string(filter.rawValue)))),
+                .init(nameID: 70, dataType: SGDataType.int, connection: maxAnisotropy),
+                .init(nameID: 71, dataType: SGDataType.float, connection: maxLodClamp),
+                .init(nameID: 75, dataType: SGDataType.float, connection: minLodClamp),
+                .init(nameID: 16, dataType: SGDataType.vector4f, connection: defaultValue),
+                .init(nameID: 104, dataType: SGDataType.vector2f, connection: texcoord),
+                .init(nameID: 21, dataType: SGDataType.float, connection: dynamicMinLodClamp),
+                .init(nameID: 36, dataType: SGDataType.vector2f, connection: gradientDpdx),
+                .init(nameID: 37, dataType: SGDataType.vector2f, connection: gradientDpdy),
+                .init(nameID: 84, dataType: SGDataType.vector2i, connection: offset),
             ],
             outputs: [.init(dataType: SGDataType.vector4f)])))
     }
@@ -4743,58 +4743,58 @@ public func pixelLOD<T>(file: SGTexture, uWrapMode: SGSamplerAddressModeWithoutR
     }
     if SGDataType.color3f.matches(defaultValue) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_RealityKitTexture2DPixelLOD_color3",
-            inputs: [
-                .init(name: "file", dataType: SGDataType.asset, connection: file),
-                .init(name: "u_wrap_mode", dataType: SGDataType.string, connection: SGString(source: .constant(.string(uWrapMode.rawValue)))),
-                .init(name: "v_wrap_mode", dataType: SGDataType.string, connection: SGString(source: .constant(.string(vWrapMode.rawValue)))),
-                .init(name: "border_color", dataType: SGDataType.string, connection: SGString(source: .constant(.string(borderColor.rawValue)))),
-                .init(name: "filter", dataType: SGDataType.string, connection: SGString(source: .constant(.string(filter.rawValue)))),
-                .init(name: "max_anisotropy", dataType: SGDataType.int, connection: maxAnisotropy),
-                .init(name: "max_lod_clamp", dataType: SGDataType.float, connection: maxLodClamp),
-                .init(name: "min_lod_clamp", dataType: SGDataType.float, connection: minLodClamp),
-                .init(name: "default", dataType: SGDataType.color3f, connection: defaultValue),
-                .init(name: "texcoord", dataType: SGDataType.vector2f, connection: texcoord),
-                .init(name: "lod", dataType: SGDataType.float, connection: lod),
-                .init(name: "offset", dataType: SGDataType.vector2i, connection: offset),
+            nodeTypeID: 23, // ND_RealityKitTexture2DPixelLOD_color3
+            inputs: [
+                .init(nameID: 27, dataType: SGDataType.asset, connection: file),
+                .init(nameID: 107, dataType: SGDataType.string, connection: SGString(source: .constant(.string(uWrapMode.rawValue)))),
+                .init(nameID: 120, dataType: SGDataType.string, connection: SGString(source: .constant(.string(vWrapMode.rawValue)))),
+                .init(nameID: 9, dataType: SGDataType.string, connection: SGString(source: .constant(.string(borderColor.rawValue)))),
+                .init(nameID: 31, dataType: SGDataType.string, connection: SGString(source: .constant(.string(filter.rawValue)))),
+                .init(nameID: 70, dataType: SGDataType.int, connection: maxAnisotropy),
+                .init(nameID: 71, dataType: SGDataType.float, connection: maxLodClamp),
+                .init(nameID: 75, dataType: SGDataType.float, connection: minLodClamp),
+                .init(nameID: 16, dataType: SGDataType.color3f, connection: defaultValue),
+                .init(nameID: 104, dataType: SGDataType.vector2f, connection: texcoord),
+                .init(nameID: 64, dataType: SGDataType.float, connection: lod),
+                .init(nameID: 84, dataType: SGDataType.vector2i, connection: offset),
             ],
             outputs: [.init(dataType: SGDataType.color3f)])))
     }
     if SGDataType.color4f.matches(defaultValue) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_RealityKitTexture2DPixelLOD_color4",
-            inputs: [
-                .init(name: "file", dataType: SGDataType.asset, connection: file),
-                .init(name: "u_wrap_mode", dataType: SGDataType.string, connection: SGString(source: .constant(.string(uWrapMode.rawValue)))),
-                .init(name: "v_wrap_mode", dataType: SGDataType.string, connection: SGString(source: .constant(.string(vWrapMode.rawValue)))),
-                .init(name: "border_color", dataType: SGDataType.string, connection: SGString(source: .constant(.string(borderColor.rawValue)))),
-                .init(name: "filter", dataType: SGDataType.string, connection: SGString(source: .constant(.string(filter.rawValue)))),
-                .init(name: "max_anisotropy", dataType: SGDataType.int, connection: maxAnisotropy),
-                .init(name: "max_lod_clamp", dataType: SGDataType.float, connection: maxLodClamp),
-                .init(name: "min_lod_clamp", dataType: SGDataType.float, connection: minLodClamp),
-                .init(name: "default", dataType: SGDataType.color4f, connection: defaultValue),
-                .init(name: "texcoord", dataType: SGDataType.vector2f, connection: texcoord),
-                .init(name: "lod", dataType: SGDataType.float, connection: lod),
-                .init(name: "offset", dataType: SGDataType.vector2i, connection: offset),
+            nodeTypeID: 24, // ND_RealityKitTexture2DPixelLOD_color4
+            inputs: [
+                .init(nameID: 27, dataType: SGDataType.asset, connection: file),
+                .init(nameID: 107, dataType: SGDataType.string, connection: SGString(source: .constant(.string(uWrapMode.rawValue)))),
+                .init(nameID: 120, dataType: SGDataType.string, connection: SGString(source: .constant(.string(vWrapMode.rawValue)))),
+                .init(nameID: 9, dataType: SGDataType.string, connection: SGString(source: .constant(.string(borderColor.rawValue)))),
+                .init(nameID: 31, dataType: SGDataType.string, connection: SGString(source: .constant(.string(filter.rawValue)))),
+                .init(nameID: 70, dataType: SGDataType.int, connection: maxAnisotropy),
+                .init(nameID: 71, dataType: SGDataType.float, connection: maxLodClamp),
+                .init(nameID: 75, dataType: SGDataType.float, connection: minLodClamp),
+                .init(nameID: 16, dataType: SGDataType.color4f, connection: defaultValue),
+                .init(nameID: 104, dataType: SGDataType.vector2f, connection: texcoord),
+                .init(nameID: 64, dataType: SGDataType.float, connection: lod),
+                .init(nameID: 84, dataType: SGDataType.vector2i, connection: offset),
             ],
             outputs: [.init(dataType: SGDataType.color4f)])))
     }
     if SGDataType.vector4f.matches(defaultValue) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_RealityKitTexture2DPixelLOD_vector4",
-            inputs: [
-                .init(name: "file", dataType: SGDataType.asset, connection: file),
-                .init(name: "u_wrap_mode", dataType: SGDataType.string, connection: SGString(source: .constant(.string(uWrapMode.rawValue)))),
-                .init(name: "v_wrap_mode", dataType: SGDataType.string, connection: SGString(source: .constant(.string(vWrapMode.rawValue)))),
-                .init(name: "border_color", dataType: SGDataType.string, connection: SGString(source: .constant(.string(borderColor.rawValue)))),
-                .init(name: "filter", dataType: SGDataType.string, connection: SGString(source: .constant(.string(filter.rawValue)))),
-                .init(name: "max_anisotropy", dataType: SGDataType.int, connection: maxAnisotropy),
-                .init(name: "max_lod_clamp", dataType: SGDataType.float, connection: maxLodClamp),
-                .init(name: "min_lod_clamp", dataType: SGDataType.float, connection: minLodClamp),
-                .init(name: "default", dataType: SGDataType.vector4f, connection: defaultValue),
-                .init(name: "texcoord", dataType: SGDataType.vector2f, connection: texcoord),
-                .init(name: "lod", dataType: SGDataType.float, connection: lod),
-                .init(name: "offset", dataType: SGDataType.vector2i, connection: offset),
+            nodeTypeID: 25, // ND_RealityKitTexture2DPixelLOD_vector4
+            inputs: [
+                .init(nameID: 27, dataType: SGDataType.asset, connection: file),
+                .init(nameID: 107, dataType: SGDataType.string, connection: SGString(source: .constant(.string(uWrapMode.rawValue)))),
+                .init(nameID: 120, dataType: SGDataType.string, connection: SGString(source: .constant(.string(vWrapMode.rawValue)))),
+                .init(nameID: 9, dataType: SGDataType.string, connection: SGString(source: .constant(.string(borderColor.rawValue)))),
+                .init(nameID: 31, dataType: SGDataType.string, connection: SGString(source: .constant(.string(filter.rawValue)))),
+                .init(nameID: 70, dataType: SGDataType.int, connection: maxAnisotropy),
+                .init(nameID: 71, dataType: SGDataType.float, connection: maxLodClamp),
+                .init(nameID: 75, dataType: SGDataType.float, connection: minLodClamp),
+                .init(nameID: 16, dataType: SGDataType.vector4f, connection: defaultValue),
+                .init(nameID: 104, dataType: SGDataType.vector2f, connection: texcoord),
+                .init(nameID: 64, dataType: SGDataType.float, connection: lod),
+                .init(nameID: 84, dataType: SGDataType.vector2i, connection: offset),
             ],
             outputs: [.init(dataType: SGDataType.vector4f)])))
     }
@@ -4818,13 +4818,13 @@ public func place2D(texcoord: SGVector? = nil, pivot: SGVector? = nil, scale: SG
         return SGVector(source: .error("Invalid place2D input. Expected offset data type to be SGDataType.vector2f, but got \(offset?.dataType.rawValue ?? "nil").", values: [offset]))
     }
     return SGVector(source: .nodeOutput(SGNode(
-        nodeType: "ND_place2d_vector2",
+        nodeTypeID: 589, // ND_place2d_vector2
         inputs: [
-            .init(name: "texcoord", dataType: SGDataType.vector2f, connection: texcoord),
-            .init(name: "pivot", dataType: SGDataType.vector2f, connection: pivot),
-            .init(name: "scale", dataType: SGDataType.vector2f, connection: scale),
-            .init(name: "rotate", dataType: SGDataType.float, connection: rotate),
-            .init(name: "offset", dataType: SGDataType.vector2f, connection: offset),
+            .init(nameID: 104, dataType: SGDataType.vector2f, connection: texcoord),
+            .init(nameID: 89, dataType: SGDataType.vector2f, connection: pivot),
+            .init(nameID: 97, dataType: SGDataType.vector2f, connection: scale),
+            .init(nameID: 94, dataType: SGDataType.float, connection: rotate),
+            .init(nameID: 84, dataType: SGDataType.vector2f, connection: offset),
         ],
         outputs: [.init(dataType: SGDataType.vector2f)])))
 }
@@ -4832,41 +4832,41 @@ public func place2D(texcoord: SGVector? = nil, pivot: SGVector? = nil, scale: SG
 public func plus<T>(fg: T, bg: T, mix: SGScalar? = nil) -> T where T: SGNumeric {
     if SGDataType.color3f.matches(fg) && SGDataType.color3f.matches(bg) && SGDataType.float.matches(mix) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_plus_color3",
+            nodeTypeID: 590, // ND_plus_color3
             inputs: [
-                .init(name: "fg", dataType: SGDataType.color3f, connection: fg),
-                .init(name: "bg", dataType: SGDataType.color3f, connection: bg),
-                .init(name: "mix", dataType: SGDataType.float, connection: mix),
+                .init(nameID: 26, dataType: SGDataType.color3f, connection: fg),
+                .init(nameID: 6, dataType: SGDataType.color3f, connection: bg),
+                .init(nameID: 77, dataType: SGDataType.float, connection: mix),
             ],
             outputs: [.init(dataType: SGDataType.color3f)])))
     }
     if SGDataType.color4f.matches(fg) && SGDataType.color4f.matches(bg) && SGDataType.float.matches(mix) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_plus_color4",
+            nodeTypeID: 591, // ND_plus_color4
             inputs: [
-                .init(name: "fg", dataType: SGDataType.color4f, connection: fg),
-                .init(name: "bg", dataType: SGDataType.color4f, connection: bg),
-                .init(name: "mix", dataType: SGDataType.float, connection: mix),
+                .init(nameID: 26, dataType: SGDataType.color4f, connection: fg),
+                .init(nameID: 6, dataType: SGDataType.color4f, connection: bg),
+                .init(nameID: 77, dataType: SGDataType.float, connection: mix),
             ],
             outputs: [.init(dataType: SGDataType.color4f)])))
     }
     if SGDataType.float.matches(fg) && SGDataType.float.matches(bg) && SGDataType.float.matches(mix) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_plus_float",
+            nodeTypeID: 592, // ND_plus_float
             inputs: [
-                .init(name: "fg", dataType: SGDataType.float, connection: fg),
-                .init(name: "bg", dataType: SGDataType.float, connection: bg),
-                .init(name: "mix", dataType: SGDataType.float, connection: mix),
+                .init(nameID: 26, dataType: SGDataType.float, connection: fg),
+                .init(nameID: 6, dataType: SGDataType.float, connection: bg),
+                .init(nameID: 77, dataType: SGDataType.float, connection: mix),
             ],
             outputs: [.init(dataType: SGDataType.float)])))
     }
     if SGDataType.half.matches(fg) && SGDataType.half.matches(bg) && SGDataType.half.matches(mix) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_plus_half",
+            nodeTypeID: 593, // ND_plus_half
             inputs: [
-                .init(name: "fg", dataType: SGDataType.half, connection: fg),
-                .init(name: "bg", dataType: SGDataType.half, connection: bg),
-                .init(name: "mix", dataType: SGDataType.half, connection: mix),
+                .init(nameID: 26, dataType: SGDataType.half, connection: fg),
+                .init(nameID: 6, dataType: SGDataType.half, connection: bg),
+                .init(nameID: 77, dataType: SGDataType.half, connection: mix),
             ],
             outputs: [.init(dataType: SGDataType.half)])))
     }
@@ -4876,109 +4876,109 @@ public func plus<T>(fg: T, bg: T, mix: SGScalar? = nil) -> T where T: SGNumeric
 public func pow<T>(_ in1: T, _ in2: SGNumeric) -> T where T: SGNumeric {
     if SGDataType.color3f.matches(in1) && SGDataType.color3f.matches(in2) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_power_color3",
+            nodeTypeID: 595, // ND_power_color3
             inputs: [
-                .init(name: "in1", dataType: SGDataType.color3f, connection: in1),
-                .init(name: "in2", dataType: SGDataType.color3f, connection: in2),
+                .init(nameID: 43, dataType: SGDataType.color3f, connection: in1),
+                .init(nameID: 45, dataType: SGDataType.color3f, connection: in2),
             ],
             outputs: [.init(dataType: SGDataType.color3f)])))
     }
     if SGDataType.color3f.matches(in1) && SGDataType.float.matches(in2) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_power_color3FA",
+            nodeTypeID: 596, // ND_power_color3FA
             inputs: [
-                .init(name: "in1", dataType: SGDataType.color3f, connection: in1),
-                .init(name: "in2", dataType: SGDataType.float, connection: in2),
+                .init(nameID: 43, dataType: SGDataType.color3f, connection: in1),
+                .init(nameID: 45, dataType: SGDataType.float, connection: in2),
             ],
             outputs: [.init(dataType: SGDataType.color3f)])))
     }
     if SGDataType.color4f.matches(in1) && SGDataType.color4f.matches(in2) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_power_color4",
+            nodeTypeID: 597, // ND_power_color4
             inputs: [
-                .init(name: "in1", dataType: SGDataType.color4f, connection: in1),
-                .init(name: "in2", dataType: SGDataType.color4f, connection: in2),
+                .init(nameID: 43, dataType: SGDataType.color4f, connection: in1),
+                .init(nameID: 45, dataType: SGDataType.color4f, connection: in2),
             ],
             outputs: [.init(dataType: SGDataType.color4f)])))
     }
     if SGDataType.color4f.matches(in1) && SGDataType.float.matches(in2) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_power_color4FA",
+            nodeTypeID: 598, // ND_power_color4FA
             inputs: [
-                .init(name: "in1", dataType: SGDataType.color4f, connection: in1),
-                .init(name: "in2", dataType: SGDataType.float, connection: in2),
+                .init(nameID: 43, dataType: SGDataType.color4f, connection: in1),
+                .init(nameID: 45, dataType: SGDataType.float, connection: in2),
             ],
             outputs: [.init(dataType: SGDataType.color4f)])))
     }
     if SGDataType.float.matches(in1) && SGDataType.float.matches(in2) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_power_float",
+            nodeTypeID: 599, // ND_power_float
             inputs: [
-                .init(name: "in1", dataType: SGDataType.float, connection: in1),
-                .init(name: "in2", dataType: SGDataType.float, connection: in2),
+                .init(nameID: 43, dataType: SGDataType.float, connection: in1),
+                .init(nameID: 45, dataType: SGDataType.float, connection: in2),
             ],
             outputs: [.init(dataType: SGDataType.float)])))
     }
     if SGDataType.half.matches(in1) && SGDataType.half.matches(in2) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_power_half",
+            nodeTypeID: 600, // ND_power_half
             inputs: [
-                .init(name: "in1", dataType: SGDataType.half, connection: in1),
-                .init(name: "in2", dataType: SGDataType.half, connection: in2),
+                .init(nameID: 43, dataType: SGDataType.half, connection: in1),
+                .init(nameID: 45, dataType: SGDataType.half, connection: in2),
             ],
             outputs: [.init(dataType: SGDataType.half)])))
     }
     if SGDataType.vector2f.matches(in1) && SGDataType.vector2f.matches(in2) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_power_vector2",
+            nodeTypeID: 601, // ND_power_vector2
             inputs: [
-                .init(name: "in1", dataType: SGDataType.vector2f, connection: in1),
-                .init(name: "in2", dataType: SGDataType.vector2f, connection: in2),
+                .init(nameID: 43, dataType: SGDataType.vector2f, connection: in1),
+                .init(nameID: 45, dataType: SGDataType.vector2f, connection: in2),
             ],
             outputs: [.init(dataType: SGDataType.vector2f)])))
     }
     if SGDataType.vector2f.matches(in1) && SGDataType.float.matches(in2) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_power_vector2FA",
+            nodeTypeID: 602, // ND_power_vector2FA
             inputs: [
-                .init(name: "in1", dataType: SGDataType.vector2f, connection: in1),
-                .init(name: "in2", dataType: SGDataType.float, connection: in2),
+                .init(nameID: 43, dataType: SGDataType.vector2f, connection: in1),
+                .init(nameID: 45, dataType: SGDataType.float, connection: in2),
             ],
             outputs: [.init(dataType: SGDataType.vector2f)])))
     }
     if SGDataType.vector3f.matches(in1) && SGDataType.vector3f.matches(in2) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_power_vector3",
+            nodeTypeID: 603, // ND_power_vector3
             inputs: [
-                .init(name: "in1", dataType: SGDataType.vector3f, connection: in1),
-                .init(name: "in2", dataType: SGDataType.vector3f, connection: in2),
+                .init(nameID: 43, dataType: SGDataType.vector3f, connection: in1),
+                .init(nameID: 45, dataType: SGDataType.vector3f, connection: in2),
             ],
             outputs: [.init(dataType: SGDataType.vector3f)])))
     }
     if SGDataType.vector3f.matches(in1) && SGDataType.float.matches(in2) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_power_vector3FA",
+            nodeTypeID: 604, // ND_power_vector3FA
             inputs: [
-                .init(name: "in1", dataType: SGDataType.vector3f, connection: in1),
-                .init(name: "in2", dataType: SGDataType.float, connection: in2),
+                .init(nameID: 43, dataType: SGDataType.vector3f, connection: in1),
+                .init(nameID: 45, dataType: SGDataType.float, connection: in2),
             ],
             outputs: [.init(dataType: SGDataType.vector3f)])))
     }
     if SGDataType.vector4f.matches(in1) && SGDataType.vector4f.matches(in2) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_power_vector4",
+            nodeTypeID: 605, // ND_power_vector4
             inputs: [
-                .init(name: "in1", dataType: SGDataType.vector4f, connection: in1),
-                .init(name: "in2", dataType: SGDataType.vector4f, connection: in2),
+                .init(nameID: 43, dataType: SGDataType.vector4f, connection: in1),
+                .init(nameID: 45, dataType: SGDataType.vector4f, connection: in2),
             ],
             outputs: [.init(dataType: SGDataType.vector4f)])))
     }
     if SGDataType.vector4f.matches(in1) && SGDataType.float.matches(in2) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_power_vector4FA",
+            nodeTypeID: 606, // ND_power_vector4FA
             inputs: [
-                .init(name: "in1", dataType: SGDataType.vector4f, connection: in1),
-                .init(name: "in2", dataType: SGDataType.float, connection: in2),
+                .init(nameID: 43, dataType: SGDataType.vector4f, connection: in1),
+                .init(nameID: 45, dataType: SGDataType.float, connection: in2),
             ],
             outputs: [.init(dataType: SGDataType.vector4f)])))
     }
@@ -4990,9 +4990,9 @@ public func premult(_ in1: SGColor) -> SGColor {
         return SGColor(source: .error("Invalid premult input. Expected in1 data type to be SGDataType.color4f, but got \(in1.dataType).", values: [in1]))
     }
     return SGColor(source: .nodeOutput(SGNode(
-        nodeType: "ND_premult_color4",
+        nodeTypeID: 607, // ND_premult_color4
         inputs: [
-            .init(name: "in", dataType: SGDataType.color4f, connection: in1),
+            .init(nameID: 42, dataType: SGDataType.color4f, connection: in1),
         ],
         outputs: [.init(dataType: SGDataType.color4f)])))
 }
@@ -5003,73 +5003,73 @@ public func ramp4<T>(valuetl: T, valuetr: T, valuebl: T, valuebr: T, texcoord: S
     }
     if SGDataType.color3f.matches(valuetl) && SGDataType.color3f.matches(valuetr) && SGDataType.color3f.matches(valuebl) && SGDataType.color3f.matches(valuebr) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_ramp4_color3",
+            nodeTypeID: 608, // ND_ramp4_color3
             inputs: [
-                .init(name: "valuetl", dataType: SGDataType.color3f, connection: valuetl),
-                .init(name: "valuetr", dataType: SGDataType.color3f, connection: valuetr),
-                .init(name: "valuebl", dataType: SGDataType.color3f, connection: valuebl),
-                .init(name: "valuebr", dataType: SGDataType.color3f, connection: valuebr),
-                .init(name: "texcoord", dataType: SGDataType.vector2f, connection: texcoord),
+                .init(nameID: 131, dataType: SGDataType.color3f, connection: valuetl),
+                .init(nameID: 132, dataType: SGDataType.color3f, connection: valuetr),
+                .init(nameID: 126, dataType: SGDataType.color3f, connection: valuebl),
+                .init(nameID: 127, dataType: SGDataType.color3f, connection: valuebr),
+                .init(nameID: 104, dataType: SGDataType.vector2f, connection: texcoord),
             ],
             outputs: [.init(dataType: SGDataType.color3f)])))
     }
     if SGDataType.color4f.matches(valuetl) && SGDataType.color4f.matches(valuetr) && SGDataType.color4f.matches(valuebl) && SGDataType.color4f.matches(valuebr) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_ramp4_color4",
+            nodeTypeID: 609, // ND_ramp4_color4
             inputs: [
-                .init(name: "valuetl", dataType: SGDataType.color4f, connection: valuetl),
-                .init(name: "valuetr", dataType: SGDataType.color4f, connection: valuetr),
-                .init(name: "valuebl", dataType: SGDataType.color4f, connection: valuebl),
-                .init(name: "valuebr", dataType: SGDataType.color4f, connection: valuebr),
-                .init(name: "texcoord", dataType: SGDataType.vector2f, connection: texcoord),
+                .init(nameID: 131, dataType: SGDataType.color4f, connection: valuetl),
+                .init(nameID: 132, dataType: SGDataType.color4f, connection: valuetr),
+                .init(nameID: 126, dataType: SGDataType.color4f, connection: valuebl),
+                .init(nameID: 127, dataType: SGDataType.color4f, connection: valuebr),
+                .init(nameID: 104, dataType: SGDataType.vector2f, connection: texcoord),
             ],
             outputs: [.init(dataType: SGDataType.color4f)])))
     }
     if SGDataType.float.matches(valuetl) && SGDataType.float.matches(valuetr) && SGDataType.float.matches(valuebl) && SGDataType.float.matches(valuebr) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_ramp4_float",
+            nodeTypeID: 610, // ND_ramp4_float
             inputs: [
-                .init(name: "valuetl", dataType: SGDataType.float, connection: valuetl),
-                .init(name: "valuetr", dataType: SGDataType.float, connection: valuetr),
-                .init(name: "valuebl", dataType: SGDataType.float, connection: valuebl),
-                .init(name: "valuebr", dataType: SGDataType.float, connection: valuebr),
-                .init(name: "texcoord", dataType: SGDataType.vector2f, connection: texcoord),
+                .init(nameID: 131, dataType: SGDataType.float, connection: valuetl),
+                .init(nameID: 132, dataType: SGDataType.float, connection: valuetr),
+                .init(nameID: 126, dataType: SGDataType.float, connection: valuebl),
+                .init(nameID: 127, dataType: SGDataType.float, connection: valuebr),
+                .init(nameID: 104, dataType: SGDataType.vector2f, connection: texcoord),
             ],
             outputs: [.init(dataType: SGDataType.float)])))
     }
     if SGDataType.vector2f.matches(valuetl) && SGDataType.vector2f.matches(valuetr) && SGDataType.vector2f.matches(valuebl) && SGDataType.vector2f.matches(valuebr) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_ramp4_vector2",
+            nodeTypeID: 611, // ND_ramp4_vector2
             inputs: [
-                .init(name: "valuetl", dataType: SGDataType.vector2f, connection: valuetl),
-                .init(name: "valuetr", dataType: SGDataType.vector2f, connection: valuetr),
-                .init(name: "valuebl", dataType: SGDataType.vector2f, connection: valuebl),
-                .init(name: "valuebr", dataType: SGDataType.vector2f, connection: valuebr),
-                .init(name: "texcoord", dataType: SGDataType.vector2f, connection: texcoord),
+                .init(nameID: 131, dataType: SGDataType.vector2f, connection: valuetl),
+                .init(nameID: 132, dataType: SGDataType.vector2f, connection: valuetr),
+                .init(nameID: 126, dataType: SGDataType.vector2f, connection: valuebl),
+                .init(nameID: 127, dataType: SGDataType.vector2f, connection: valuebr),
+                .init(nameID: 104, dataType: SGDataType.vector2f, connection: texcoord),
             ],
             outputs: [.init(dataType: SGDataType.vector2f)])))
     }
     if SGDataType.vector3f.matches(valuetl) && SGDataType.vector3f.matches(valuetr) && SGDataType.vector3f.matches(valuebl) && SGDataType.vector3f.matches(valuebr) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_ramp4_vector3",
+            nodeTypeID: 612, // ND_ramp4_vector3
             inputs: [
-                .init(name: "valuetl", dataType: SGDataType.vector3f, connection: valuetl),
-                .init(name: "valuetr", dataType: SGDataType.vector3f, connection: valuetr),
-                .init(name: "valuebl", dataType: SGDataType.vector3f, connection: valuebl),
-                .init(name: "valuebr", dataType: SGDataType.vector3f, connection: valuebr),
-                .init(name: "texcoord", dataType: SGDataType.vector2f, connection: texcoord),
+                .init(nameID: 131, dataType: SGDataType.vector3f, connection: valuetl),
+                .init(nameID: 132, dataType: SGDataType.vector3f, connection: valuetr),
+                .init(nameID: 126, dataType: SGDataType.vector3f, connection: valuebl),
+                .init(nameID: 127, dataType: SGDataType.vector3f, connection: valuebr),
+                .init(nameID: 104, dataType: SGDataType.vector2f, connection: texcoord),
             ],
             outputs: [.init(dataType: SGDataType.vector3f)])))
     }
     if SGDataType.vector4f.matches(valuetl) && SGDataType.vector4f.matches(valuetr) && SGDataType.vector4f.matches(valuebl) && SGDataType.vector4f.matches(valuebr) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_ramp4_vector4",
+            nodeTypeID: 613, // ND_ramp4_vector4
             inputs: [
-                .init(name: "valuetl", dataType: SGDataType.vector4f, connection: valuetl),
-                .init(name: "valuetr", dataType: SGDataType.vector4f, connection: valuetr),
-                .init(name: "valuebl", dataType: SGDataType.vector4f, connection: valuebl),
-                .init(name: "valuebr", dataType: SGDataType.vector4f, connection: valuebr),
-                .init(name: "texcoord", dataType: SGDataType.vector2f, connection: texcoord),
+                .init(nameID: 131, dataType: SGDataType.vector4f, connection: valuetl),
+                .init(nameID: 132, dataType: SGDataType.vector4f, connection: valuetr),
+                .init(nameID: 126, dataType: SGDataType.vector4f, connection: valuebl),
+                .init(nameID: 127, dataType: SGDataType.vector4f, connection: valuebr),
+                .init(nameID: 104, dataType: SGDataType.vector2f, connection: texcoord),
             ],
             outputs: [.init(dataType: SGDataType.vector4f)])))
     }
@@ -5082,101 +5082,101 @@ public func ramplr<T>(valuel: T, valuer: T, texcoord: SGVector? = nil) -> T wher
     }
     if SGDataType.color3f.matches(valuel) && SGDataType.color3f.matches(valuer) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_ramplr_color3",
+            nodeTypeID: 614, // ND_ramplr_color3
             inputs: [
-                .init(name: "valuel", dataType: SGDataType.color3f, connection: valuel),
-                .init(name: "valuer", dataType: SGDataType.color3f, connection: valuer),
-                .init(name: "texcoord", dataType: SGDataType.vector2f, connection: texcoord),
+                .init(nameID: 128, dataType: SGDataType.color3f, connection: valuel),
+                .init(nameID: 129, dataType: SGDataType.color3f, connection: valuer),
+                .init(nameID: 104, dataType: SGDataType.vector2f, connection: texcoord),
             ],
             outputs: [.init(dataType: SGDataType.color3f)])))
     }
     if SGDataType.color4f.matches(valuel) && SGDataType.color4f.matches(valuer) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_ramplr_color4",
+            nodeTypeID: 615, // ND_ramplr_color4
             inputs: [
-                .init(name: "valuel", dataType: SGDataType.color4f, connection: valuel),
-                .init(name: "valuer", dataType: SGDataType.color4f, connection: valuer),
-                .init(name: "texcoord", dataType: SGDataType.vector2f, connection: texcoord),
+                .init(nameID: 128, dataType: SGDataType.color4f, connection: valuel),
+                .init(nameID: 129, dataType: SGDataType.color4f, connection: valuer),
+                .init(nameID: 104, dataType: SGDataType.vector2f, connection: texcoord),
             ],
             outputs: [.init(dataType: SGDataType.color4f)])))
     }
     if SGDataType.float.matches(valuel) && SGDataType.float.matches(valuer) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_ramplr_float",
+            nodeTypeID: 616, // ND_ramplr_float
             inputs: [
-                .init(name: "valuel", dataType: SGDataType.float, connection: valuel),
-                .init(name: "valuer", dataType: SGDataType.float, connection: valuer),
-                .init(name: "texcoord", dataType: SGDataType.vector2f, connection: texcoord),
+                .init(nameID: 128, dataType: SGDataType.float, connection: valuel),
+                .init(nameID: 129, dataType: SGDataType.float, connection: valuer),
+                .init(nameID: 104, dataType: SGDataType.vector2f, connection: texcoord),
             ],
             outputs: [.init(dataType: SGDataType.float)])))
     }
     if SGDataType.half.matches(valuel) && SGDataType.half.matches(valuer) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_ramplr_half",
+            nodeTypeID: 617, // ND_ramplr_half
             inputs: [
-                .init(name: "valuel", dataType: SGDataType.half, connection: valuel),
-                .init(name: "valuer", dataType: SGDataType.half, connection: valuer),
-                .init(name: "texcoord", dataType: SGDataType.vector2f, connection: texcoord),
+                .init(nameID: 128, dataType: SGDataType.half, connection: valuel),
+                .init(nameID: 129, dataType: SGDataType.half, connection: valuer),
+                .init(nameID: 104, dataType: SGDataType.vector2f, connection: texcoord),
             ],
             outputs: [.init(dataType: SGDataType.half)])))
     }
     if SGDataType.vector2h.matches(valuel) && SGDataType.vector2h.matches(valuer) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_ramplr_half2",
+            nodeTypeID: 618, // ND_ramplr_half2
             inputs: [
-                .init(name: "valuel", dataType: SGDataType.vector2h, connection: valuel),
-                .init(name: "valuer", dataType: SGDataType.vector2h, connection: valuer),
-                .init(name: "texcoord", dataType: SGDataType.vector2f, connection: texcoord),
+                .init(nameID: 128, dataType: SGDataType.vector2h, connection: valuel),
+                .init(nameID: 129, dataType: SGDataType.vector2h, connection: valuer),
+                .init(nameID: 104, dataType: SGDataType.vector2f, connection: texcoord),
             ],
             outputs: [.init(dataType: SGDataType.vector2h)])))
     }
     if SGDataType.vector3h.matches(valuel) && SGDataType.vector3h.matches(valuer) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_ramplr_half3",
+            nodeTypeID: 619, // ND_ramplr_half3
             inputs: [
-                .init(name: "valuel", dataType: SGDataType.vector3h, connection: valuel),
-                .init(name: "valuer", dataType: SGDataType.vector3h, connection: valuer),
-                .init(name: "texcoord", dataType: SGDataType.vector2f, connection: texcoord),
+                .init(nameID: 128, dataType: SGDataType.vector3h, connection: valuel),
+                .init(nameID: 129, dataType: SGDataType.vector3h, connection: valuer),
+                .init(nameID: 104, dataType: SGDataType.vector2f, connection: texcoord),
             ],
             outputs: [.init(dataType: SGDataType.vector3h)])))
     }
     if SGDataType.vector4h.matches(valuel) && SGDataType.vector4h.matches(valuer) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_ramplr_half4",
+            nodeTypeID: 620, // ND_ramplr_half4
             inputs: [
-                .init(name: "valuel", dataType: SGDataType.vector4h, connection: valuel),
-                .init(name: "valuer", dataType: SGDataType.vector4h, connection: valuer),
-                .init(name: "texcoord", dataType: SGDataType.vector2f, connection: texcoord),
+                .init(nameID: 128, dataType: SGDataType.vector4h, connection: valuel),
+                .init(nameID: 129, dataType: SGDataType.vector4h, connection: valuer),
+                .init(nameID: 104, dataType: SGDataType.vector2f, connection: texcoord),
             ],
             outputs: [.init(dataType: SGDataType.vector4h)])))
     }
     if SGDataType.vector2f.matches(valuel) && SGDataType.vector2f.matches(valuer) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_ramplr_vector2",
+            nodeTypeID: 621, // ND_ramplr_vector2
             inputs: [
-                .init(name: "valuel", dataType: SGDataType.vector2f, connection: valuel),
-                .init(name: "valuer", dataType: SGDataType.vector2f, connection: valuer),
-                .init(name: "texcoord", dataType: SGDataType.vector2f, connection: texcoord),
+                .init(nameID: 128, dataType: SGDataType.vector2f, connection: valuel),
+                .init(nameID: 129, dataType: SGDataType.vector2f, connection: valuer),
+                .init(nameID: 104, dataType: SGDataType.vector2f, connection: texcoord),
             ],
             outputs: [.init(dataType: SGDataType.vector2f)])))
     }
     if SGDataType.vector3f.matches(valuel) && SGDataType.vector3f.matches(valuer) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_ramplr_vector3",
+            nodeTypeID: 622, // ND_ramplr_vector3
             inputs: [
-                .init(name: "valuel", dataType: SGDataType.vector3f, connection: valuel),
-                .init(name: "valuer", dataType: SGDataType.vector3f, connection: valuer),
-                .init(name: "texcoord", dataType: SGDataType.vector2f, connection: texcoord),
+                .init(nameID: 128, dataType: SGDataType.vector3f, connection: valuel),
+                .init(nameID: 129, dataType: SGDataType.vector3f, connection: valuer),
+                .init(nameID: 104, dataType: SGDataType.vector2f, connection: texcoord),
             ],
             outputs: [.init(dataType: SGDataType.vector3f)])))
     }
     if SGDataType.vector4f.matches(valuel) && SGDataType.vector4f.matches(valuer) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_ramplr_vector4",
+            nodeTypeID: 623, // ND_ramplr_vector4
             inputs: [
-                .init(name: "valuel", dataType: SGDataType.vector4f, connection: valuel),
-                .init(name: "valuer", dataType: SGDataType.vector4f, connection: valuer),
-                .init(name: "texcoord", dataType: SGDataType.vector2f, connection: texcoord),
+                .init(nameID: 128, dataType: SGDataType.vector4f, connection: valuel),
+                .init(nameID: 129, dataType: SGDataType.vector4f, connection: valuer),
+                .init(nameID: 104, dataType: SGDataType.vector2f, connection: texcoord),
             ],
             outputs: [.init(dataType: SGDataType.vector4f)])))
     }
@@ -5189,101 +5189,101 @@ public func ramptb<T>(valuet: T, valueb: T, texcoord: SGVector? = nil) -> T wher
     }
     if SGDataType.color3f.matches(valuet) && SGDataType.color3f.matches(valueb) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_ramptb_color3",
+            nodeTypeID: 624, // ND_ramptb_color3
             inputs: [
-                .init(name: "valuet", dataType: SGDataType.color3f, connection: valuet),
-                .init(name: "valueb", dataType: SGDataType.color3f, connection: valueb),
-                .init(name: "texcoord", dataType: SGDataType.vector2f, connection: texcoord),
+                .init(nameID: 130, dataType: SGDataType.color3f, connection: valuet),
+                .init(nameID: 125, dataType: SGDataType.color3f, connection: valueb),
+                .init(nameID: 104, dataType: SGDataType.vector2f, connection: texcoord),
             ],
             outputs: [.init(dataType: SGDataType.color3f)])))
     }
     if SGDataType.color4f.matches(valuet) && SGDataType.color4f.matches(valueb) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_ramptb_color4",
+            nodeTypeID: 625, // ND_ramptb_color4
             inputs: [
-                .init(name: "valuet", dataType: SGDataType.color4f, connection: valuet),
-                .init(name: "valueb", dataType: SGDataType.color4f, connection: valueb),
-                .init(name: "texcoord", dataType: SGDataType.vector2f, connection: texcoord),
+                .init(nameID: 130, dataType: SGDataType.color4f, connection: valuet),
+                .init(nameID: 125, dataType: SGDataType.color4f, connection: valueb),
+                .init(nameID: 104, dataType: SGDataType.vector2f, connection: texcoord),
             ],
             outputs: [.init(dataType: SGDataType.color4f)])))
     }
     if SGDataType.float.matches(valuet) && SGDataType.float.matches(valueb) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_ramptb_float",
+            nodeTypeID: 626, // ND_ramptb_float
             inputs: [
-                .init(name: "valuet", dataType: SGDataType.float, connection: valuet),
-                .init(name: "valueb", dataType: SGDataType.float, connection: valueb),
-                .init(name: "texcoord", dataType: SGDataType.vector2f, connection: texcoord),
+                .init(nameID: 130, dataType: SGDataType.float, connection: valuet),
+                .init(nameID: 125, dataType: SGDataType.float, connection: valueb),
+                .init(nameID: 104, dataType: SGDataType.vector2f, connection: texcoord),
             ],
             outputs: [.init(dataType: SGDataType.float)])))
     }
     if SGDataType.half.matches(valuet) && SGDataType.half.matches(valueb) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_ramptb_half",
+            nodeTypeID: 627, // ND_ramptb_half
             inputs: [
-                .init(name: "valuet", dataType: SGDataType.half, connection: valuet),
-                .init(name: "valueb", dataType: SGDataType.half, connection: valueb),
-                .init(name: "texcoord", dataType: SGDataType.vector2f, connection: texcoord),
+                .init(nameID: 130, dataType: SGDataType.half, connection: valuet),
+                .init(nameID: 125, dataType: SGDataType.half, connection: valueb),
+                .init(nameID: 104, dataType: SGDataType.vector2f, connection: texcoord),
             ],
             outputs: [.init(dataType: SGDataType.half)])))
     }
     if SGDataType.vector2h.matches(valuet) && SGDataType.vector2h.matches(valueb) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_ramptb_half2",
+            nodeTypeID: 628, // ND_ramptb_half2
             inputs: [
-                .init(name: "valuet", dataType: SGDataType.vector2h, connection: valuet),
-                .init(name: "valueb", dataType: SGDataType.vector2h, connection: valueb),
-                .init(name: "texcoord", dataType: SGDataType.vector2f, connection: texcoord),
+                .init(nameID: 130, dataType: SGDataType.vector2h, connection: valuet),
+                .init(nameID: 125, dataType: SGDataType.vector2h, connection: valueb),
+                .init(nameID: 104, dataType: SGDataType.vector2f, connection: texcoord),
             ],
             outputs: [.init(dataType: SGDataType.vector2h)])))
     }
     if SGDataType.vector3h.matches(valuet) && SGDataType.vector3h.matches(valueb) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_ramptb_half3",
+            nodeTypeID: 629, // ND_ramptb_half3
             inputs: [
-                .init(name: "valuet", dataType: SGDataType.vector3h, connection: valuet),
-                .init(name: "valueb", dataType: SGDataType.vector3h, connection: valueb),
-                .init(name: "texcoord", dataType: SGDataType.vector2f, connection: texcoord),
+                .init(nameID: 130, dataType: SGDataType.vector3h, connection: valuet),
+                .init(nameID: 125, dataType: SGDataType.vector3h, connection: valueb),
+                .init(nameID: 104, dataType: SGDataType.vector2f, connection: texcoord),
             ],
             outputs: [.init(dataType: SGDataType.vector3h)])))
     }
     if SGDataType.vector4h.matches(valuet) && SGDataType.vector4h.matches(valueb) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_ramptb_half4",
+            nodeTypeID: 630, // ND_ramptb_half4
             inputs: [
-                .init(name: "valuet", dataType: SGDataType.vector4h, connection: valuet),
-                .init(name: "valueb", dataType: SGDataType.vector4h, connection: valueb),
-                .init(name: "texcoord", dataType: SGDataType.vector2f, connection: texcoord),
+                .init(nameID: 130, dataType: SGDataType.vector4h, connection: valuet),
+                .init(nameID: 125, dataType: SGDataType.vector4h, connection: valueb),
+                .init(nameID: 104, dataType: SGDataType.vector2f, connection: texcoord),
             ],
             outputs: [.init(dataType: SGDataType.vector4h)])))
     }
     if SGDataType.vector2f.matches(valuet) && SGDataType.vector2f.matches(valueb) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_ramptb_vector2",
+            nodeTypeID: 631, // ND_ramptb_vector2
             inputs: [
-                .init(name: "valuet", dataType: SGDataType.vector2f, connection: valuet),
-                .init(name: "valueb", dataType: SGDataType.vector2f, connection: valueb),
-                .init(name: "texcoord", dataType: SGDataType.vector2f, connection: texcoord),
+                .init(nameID: 130, dataType: SGDataType.vector2f, connection: valuet),
+                .init(nameID: 125, dataType: SGDataType.vector2f, connection: valueb),
+                .init(nameID: 104, dataType: SGDataType.vector2f, connection: texcoord),
             ],
             outputs: [.init(dataType: SGDataType.vector2f)])))
     }
     if SGDataType.vector3f.matches(valuet) && SGDataType.vector3f.matches(valueb) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_ramptb_vector3",
+            nodeTypeID: 632, // ND_ramptb_vector3
             inputs: [
-                .init(name: "valuet", dataType: SGDataType.vector3f, connection: valuet),
-                .init(name: "valueb", dataType: SGDataType.vector3f, connection: valueb),
-                .init(name: "texcoord", dataType: SGDataType.vector2f, connection: texcoord),
+                .init(nameID: 130, dataType: SGDataType.vector3f, connection: valuet),
+                .init(nameID: 125, dataType: SGDataType.vector3f, connection: valueb),
+                .init(nameID: 104, dataType: SGDataType.vector2f, connection: texcoord),
             ],
             outputs: [.init(dataType: SGDataType.vector3f)])))
     }
     if SGDataType.vector4f.matches(valuet) && SGDataType.vector4f.matches(valueb) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_ramptb_vector4",
+            nodeTypeID: 633, // ND_ramptb_vector4
             inputs: [
-                .init(name: "valuet", dataType: SGDataType.vector4f, connection: valuet),
-                .init(name: "valueb", dataType: SGDataType.vector4f, connection: valueb),
-                .init(name: "texcoord", dataType: SGDataType.vector2f, connection: texcoord),
+                .init(nameID: 130, dataType: SGDataType.vector4f, connection: valuet),
+                .init(nameID: 125, dataType: SGDataType.vector4f, connection: valueb),
+                .init(nameID: 104, dataType: SGDataType.vector2f, connection: texcoord),
             ],
             outputs: [.init(dataType: SGDataType.vector4f)])))
     }
@@ -5296,155 +5296,155 @@ public func range<T>(_ in1: T, inlow: SGNumeric, inhigh: SGNumeric, gamma: SGNum
     }
     if SGDataType.color3f.matches(in1) && SGDataType.color3f.matches(inlow) && SGDataType.color3f.matches(inhigh) && SGDataType.color3f.matches(gamma) && SGDataType.color3f.matches(outlow) && SGDataType.color3f.matches(outhigh) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_range_color3",
+            nodeTypeID: 634, // ND_range_color3
             inputs: [
-                .init(name: "in", dataType: SGDataType.color3f, connection: in1),
-                .init(name: "inlow", dataType: SGDataType.color3f, connection: inlow),
-                .init(name: "inhigh", dataType: SGDataType.color3f, connection: inhigh),
-                .init(name: "gamma", dataType: SGDataType.color3f, connection: gamma),
-                .init(name: "outlow", dataType: SGDataType.color3f, connection: outlow),
-                .init(name: "outhigh", dataType: SGDataType.color3f, connection: outhigh),
-                .init(name: "doclamp", dataType: SGDataType.bool, connection: doclamp),
+                .init(nameID: 42, dataType: SGDataType.color3f, connection: in1),
+                .init(nameID: 55, dataType: SGDataType.color3f, connection: inlow),
+                .init(nameID: 54, dataType: SGDataType.color3f, connection: inhigh),
+                .init(nameID: 34, dataType: SGDataType.color3f, connection: gamma),
+                .init(nameID: 88, dataType: SGDataType.color3f, connection: outlow),
+                .init(nameID: 87, dataType: SGDataType.color3f, connection: outhigh),
+                .init(nameID: 20, dataType: SGDataType.bool, connection: doclamp),
             ],
             outputs: [.init(dataType: SGDataType.color3f)])))
     }
     if SGDataType.color3f.matches(in1) && SGDataType.float.matches(inlow) && SGDataType.float.matches(inhigh) && SGDataType.float.matches(gamma) && SGDataType.float.matches(outlow) && SGDataType.float.matches(outhigh) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_range_color3FA",
+            nodeTypeID: 635, // ND_range_color3FA
             inputs: [
-                .init(name: "in", dataType: SGDataType.color3f, connection: in1),
-                .init(name: "inlow", dataType: SGDataType.float, connection: inlow),
-                .init(name: "inhigh", dataType: SGDataType.float, connection: inhigh),
-                .init(name: "gamma", dataType: SGDataType.float, connection: gamma),
-                .init(name: "outlow", dataType: SGDataType.float, connection: outlow),
-                .init(name: "outhigh", dataType: SGDataType.float, connection: outhigh),
-                .init(name: "doclamp", dataType: SGDataType.bool, connection: doclamp),
+                .init(nameID: 42, dataType: SGDataType.color3f, connection: in1),
+                .init(nameID: 55, dataType: SGDataType.float, connection: inlow),
+                .init(nameID: 54, dataType: SGDataType.float, connection: inhigh),
+                .init(nameID: 34, dataType: SGDataType.float, connection: gamma),
+                .init(nameID: 88, dataType: SGDataType.float, connection: outlow),
+                .init(nameID: 87, dataType: SGDataType.float, connection: outhigh),
+                .init(nameID: 20, dataType: SGDataType.bool, connection: doclamp),
             ],
             outputs: [.init(dataType: SGDataType.color3f)])))
     }
     if SGDataType.color4f.matches(in1) && SGDataType.color4f.matches(inlow) && SGDataType.color4f.matches(inhigh) && SGDataType.color4f.matches(gamma) && SGDataType.color4f.matches(outlow) && SGDataType.color4f.matches(outhigh) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_range_color4",
+            nodeTypeID: 636, // ND_range_color4
             inputs: [
-                .init(name: "in", dataType: SGDataType.color4f, connection: in1),
-                .init(name: "inlow", dataType: SGDataType.color4f, connection: inlow),
-                .init(name: "inhigh", dataType: SGDataType.color4f, connection: inhigh),
-                .init(name: "gamma", dataType: SGDataType.color4f, connection: gamma),
-                .init(name: "outlow", dataType: SGDataType.color4f, connection: outlow),
-                .init(name: "outhigh", dataType: SGDataType.color4f, connection: outhigh),
-                .init(name: "doclamp", dataType: SGDataType.bool, connection: doclamp),
+                .init(nameID: 42, dataType: SGDataType.color4f, connection: in1),
+                .init(nameID: 55, dataType: SGDataType.color4f, connection: inlow),
+                .init(nameID: 54, dataType: SGDataType.color4f, connection: inhigh),
+                .init(nameID: 34, dataType: SGDataType.color4f, connection: gamma),
+                .init(nameID: 88, dataType: SGDataType.color4f, connection: outlow),
+                .init(nameID: 87, dataType: SGDataType.color4f, connection: outhigh),
+                .init(nameID: 20, dataType: SGDataType.bool, connection: doclamp),
             ],
             outputs: [.init(dataType: SGDataType.color4f)])))
     }
     if SGDataType.color4f.matches(in1) && SGDataType.float.matches(inlow) && SGDataType.float.matches(inhigh) && SGDataType.float.matches(gamma) && SGDataType.float.matches(outlow) && SGDataType.float.matches(outhigh) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_range_color4FA",
+            nodeTypeID: 637, // ND_range_color4FA
             inputs: [
-                .init(name: "in", dataType: SGDataType.color4f, connection: in1),
-                .init(name: "inlow", dataType: SGDataType.float, connection: inlow),
-                .init(name: "inhigh", dataType: SGDataType.float, connection: inhigh),
-                .init(name: "gamma", dataType: SGDataType.float, connection: gamma),
-                .init(name: "outlow", dataType: SGDataType.float, connection: outlow),
-                .init(name: "outhigh", dataType: SGDataType.float, connection: outhigh),
-                .init(name: "doclamp", dataType: SGDataType.bool, connection: doclamp),
+                .init(nameID: 42, dataType: SGDataType.color4f, connection: in1),
+                .init(nameID: 55, dataType: SGDataType.float, connection: inlow),
+                .init(nameID: 54, dataType: SGDataType.float, connection: inhigh),
+                .init(nameID: 34, dataType: SGDataType.float, connection: gamma),
+                .init(nameID: 88, dataType: SGDataType.float, connection: outlow),
+                .init(nameID: 87, dataType: SGDataType.float, connection: outhigh),
+                .init(nameID: 20, dataType: SGDataType.bool, connection: doclamp),
             ],
             outputs: [.init(dataType: SGDataType.color4f)])))
     }
     if SGDataType.float.matches(in1) && SGDataType.float.matches(inlow) && SGDataType.float.matches(inhigh) && SGDataType.float.matches(gamma) && SGDataType.float.matches(outlow) && SGDataType.float.matches(outhigh) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_range_float",
+            nodeTypeID: 638, // ND_range_float
             inputs: [
-                .init(name: "in", dataType: SGDataType.float, connection: in1),
-                .init(name: "inlow", dataType: SGDataType.float, connection: inlow),
-                .init(name: "inhigh", dataType: SGDataType.float, connection: inhigh),
-                .init(name: "gamma", dataType: SGDataType.float, connection: gamma),
-                .init(name: "outlow", dataType: SGDataType.float, connection: outlow),
-                .init(name: "outhigh", dataType: SGDataType.float, connection: outhigh),
-                .init(name: "doclamp", dataType: SGDataType.bool, connection: doclamp),
+                .init(nameID: 42, dataType: SGDataType.float, connection: in1),
+                .init(nameID: 55, dataType: SGDataType.float, connection: inlow),
+                .init(nameID: 54, dataType: SGDataType.float, connection: inhigh),
+                .init(nameID: 34, dataType: SGDataType.float, connection: gamma),
+                .init(nameID: 88, dataType: SGDataType.float, connection: outlow),
+                .init(nameID: 87, dataType: SGDataType.float, connection: outhigh),
+                .init(nameID: 20, dataType: SGDataType.bool, connection: doclamp),
             ],
             outputs: [.init(dataType: SGDataType.float)])))
     }
     if SGDataType.vector2f.matches(in1) && SGDataType.vector2f.matches(inlow) && SGDataType.vector2f.matches(inhigh) && SGDataType.vector2f.matches(gamma) && SGDataType.vector2f.matches(outlow) && SGDataType.vector2f.matches(outhigh) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_range_vector2",
+            nodeTypeID: 639, // ND_range_vector2
             inputs: [
-                .init(name: "in", dataType: SGDataType.vector2f, connection: in1),
-                .init(name: "inlow", dataType: SGDataType.vector2f, connection: inlow),
-                .init(name: "inhigh", dataType: SGDataType.vector2f, connection: inhigh),
-                .init(name: "gamma", dataType: SGDataType.vector2f, connection: gamma),
-                .init(name: "outlow", dataType: SGDataType.vector2f, connection: outlow),
-                .init(name: "outhigh", dataType: SGDataType.vector2f, connection: outhigh),
-                .init(name: "doclamp", dataType: SGDataType.bool, connection: doclamp),
+                .init(nameID: 42, dataType: SGDataType.vector2f, connection: in1),
+                .init(nameID: 55, dataType: SGDataType.vector2f, connection: inlow),
+                .init(nameID: 54, dataType: SGDataType.vector2f, connection: inhigh),
+                .init(nameID: 34, dataType: SGDataType.vector2f, connection: gamma),
+                .init(nameID: 88, dataType: SGDataType.vector2f, connection: outlow),
+                .init(nameID: 87, dataType: SGDataType.vector2f, connection: outhigh),
+                .init(nameID: 20, dataType: SGDataType.bool, connection: doclamp),
             ],
             outputs: [.init(dataType: SGDataType.vector2f)])))
     }
     if SGDataType.vector2f.matches(in1) && SGDataType.float.matches(inlow) && SGDataType.float.matches(inhigh) && SGDataType.float.matches(gamma) && SGDataType.float.matches(outlow) && SGDataType.float.matches(outhigh) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_range_vector2FA",
+            nodeTypeID: 640, // ND_range_vector2FA
             inputs: [
-                .init(name: "in", dataType: SGDataType.vector2f, connection: in1),
-                .init(name: "inlow", dataType: SGDataType.float, connection: inlow),
-                .init(name: "inhigh", dataType: SGDataType.float, connection: inhigh),
-                .init(name: "gamma", dataType: SGDataType.float, connection: gamma),
-                .init(name: "outlow", dataType: SGDataType.float, connection: outlow),
-                .init(name: "outhigh", dataType: SGDataType.float, connection: outhigh),
-                .init(name: "doclamp", dataType: SGDataType.bool, connection: doclamp),
+                .init(nameID: 42, dataType: SGDataType.vector2f, connection: in1),
+                .init(nameID: 55, dataType: SGDataType.float, connection: inlow),
+                .init(nameID: 54, dataType: SGDataType.float, connection: inhigh),
+                .init(nameID: 34, dataType: SGDataType.float, connection: gamma),
+                .init(nameID: 88, dataType: SGDataType.float, connection: outlow),
+                .init(nameID: 87, dataType: SGDataType.float, connection: outhigh),
+                .init(nameID: 20, dataType: SGDataType.bool, connection: doclamp),
             ],
             outputs: [.init(dataType: SGDataType.vector2f)])))
     }
     if SGDataType.vector3f.matches(in1) && SGDataType.vector3f.matches(inlow) && SGDataType.vector3f.matches(inhigh) && SGDataType.vector3f.matches(gamma) && SGDataType.vector3f.matches(outlow) && SGDataType.vector3f.matches(outhigh) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_range_vector3",
+            nodeTypeID: 641, // ND_range_vector3
             inputs: [
-                .init(name: "in", dataType: SGDataType.vector3f, connection: in1),
-                .init(name: "inlow", dataType: SGDataType.vector3f, connection: inlow),
-                .init(name: "inhigh", dataType: SGDataType.vector3f, connection: inhigh),
-                .init(name: "gamma", dataType: SGDataType.vector3f, connection: gamma),
-                .init(name: "outlow", dataType: SGDataType.vector3f, connection: outlow),
-                .init(name: "outhigh", dataType: SGDataType.vector3f, connection: outhigh),
-                .init(name: "doclamp", dataType: SGDataType.bool, connection: doclamp),
+                .init(nameID: 42, dataType: SGDataType.vector3f, connection: in1),
+                .init(nameID: 55, dataType: SGDataType.vector3f, connection: inlow),
+                .init(nameID: 54, dataType: SGDataType.vector3f, connection: inhigh),
+                .init(nameID: 34, dataType: SGDataType.vector3f, connection: gamma),
+                .init(nameID: 88, dataType: SGDataType.vector3f, connection: outlow),
+                .init(nameID: 87, dataType: SGDataType.vector3f, connection: outhigh),
+                .init(nameID: 20, dataType: SGDataType.bool, connection: doclamp),
             ],
             outputs: [.init(dataType: SGDataType.vector3f)])))
     }
     if SGDataType.vector3f.matches(in1) && SGDataType.float.matches(inlow) && SGDataType.float.matches(inhigh) && SGDataType.float.matches(gamma) && SGDataType.float.matches(outlow) && SGDataType.float.matches(outhigh) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_range_vector3FA",
+            nodeTypeID: 642, // ND_range_vector3FA
             inputs: [
-                .init(name: "in", dataType: SGDataType.vector3f, connection: in1),
-                .init(name: "inlow", dataType: SGDataType.float, connection: inlow),
-                .init(name: "inhigh", dataType: SGDataType.float, connection: inhigh),
-                .init(name: "gamma", dataType: SGDataType.float, connection: gamma),
-                .init(name: "outlow", dataType: SGDataType.float, connection: outlow),
-                .init(name: "outhigh", dataType: SGDataType.float, connection: outhigh),
-                .init(name: "doclamp", dataType: SGDataType.bool, connection: doclamp),
+                .init(nameID: 42, dataType: SGDataType.vector3f, connection: in1),
+                .init(nameID: 55, dataType: SGDataType.float, connection: inlow),
+                .init(nameID: 54, dataType: SGDataType.float, connection: inhigh),
+                .init(nameID: 34, dataType: SGDataType.float, connection: gamma),
+                .init(nameID: 88, dataType: SGDataType.float, connection: outlow),
+                .init(nameID: 87, dataType: SGDataType.float, connection: outhigh),
+                .init(nameID: 20, dataType: SGDataType.bool, connection: doclamp),
             ],
             outputs: [.init(dataType: SGDataType.vector3f)])))
     }
     if SGDataType.vector4f.matches(in1) && SGDataType.vector4f.matches(inlow) && SGDataType.vector4f.matches(inhigh) && SGDataType.vector4f.matches(gamma) && SGDataType.vector4f.matches(outlow) && SGDataType.vector4f.matches(outhigh) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_range_vector4",
+            nodeTypeID: 643, // ND_range_vector4
             inputs: [
-                .init(name: "in", dataType: SGDataType.vector4f, connection: in1),
-                .init(name: "inlow", dataType: SGDataType.vector4f, connection: inlow),
-                .init(name: "inhigh", dataType: SGDataType.vector4f, connection: inhigh),
-                .init(name: "gamma", dataType: SGDataType.vector4f, connection: gamma),
-                .init(name: "outlow", dataType: SGDataType.vector4f, connection: outlow),
-                .init(name: "outhigh", dataType: SGDataType.vector4f, connection: outhigh),
-                .init(name: "doclamp", dataType: SGDataType.bool, connection: doclamp),
+                .init(nameID: 42, dataType: SGDataType.vector4f, connection: in1),
+                .init(nameID: 55, dataType: SGDataType.vector4f, connection: inlow),
+                .init(nameID: 54, dataType: SGDataType.vector4f, connection: inhigh),
+                .init(nameID: 34, dataType: SGDataType.vector4f, connection: gamma),
+                .init(nameID: 88, dataType: SGDataType.vector4f, connection: outlow),
+                .init(nameID: 87, dataType: SGDataType.vector4f, connection: outhigh),
+                .init(nameID: 20, dataType: SGDataType.bool, connection: doclamp),
             ],
             outputs: [.init(dataType: SGDataType.vector4f)])))
     }
     if SGDataType.vector4f.matches(in1) && SGDataType.float.matches(inlow) && SGDataType.float.matches(inhigh) && SGDataType.float.matches(gamma) && SGDataType.float.matches(outlow) && SGDataType.float.matches(outhigh) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_range_vector4FA",
+            nodeTypeID: 644, // ND_range_vector4FA
             inputs: [
-                .init(name: "in", dataType: SGDataType.vector4f, connection: in1),
-                .init(name: "inlow", dataType: SGDataType.float, connection: inlow),
-                .init(name: "inhigh", dataType: SGDataType.float, connection: inhigh),
-                .init(name: "gamma", dataType: SGDataType.float, connection: gamma),
-                .init(name: "outlow", dataType: SGDataType.float, connection: outlow),
-                .init(name: "outhigh", dataType: SGDataType.float, connection: outhigh),
-                .init(name: "doclamp", dataType: SGDataType.bool, connection: doclamp),
+                .init(nameID: 42, dataType: SGDataType.vector4f, connection: in1),
+                .init(nameID: 55, dataType: SGDataType.float, connection: inlow),
+                .init(nameID: 54, dataType: SGDataType.float, connection: inhigh),
+                .init(nameID: 34, dataType: SGDataType.float, connection: gamma),
+                .init(nameID: 88, dataType: SGDataType.float, connection: outlow),
+                .init(nameID: 87, dataType: SGDataType.float, connection: outhigh),
+                .init(nameID: 20, dataType: SGDataType.bool, connection: doclamp),
             ],
             outputs: [.init(dataType: SGDataType.vector4f)])))
     }
@@ -5466,25 +5466,25 @@ public func read<T>(file: SGTexture, defaultValue: T, x: SGScalar? = nil, y: SGS
     }
     if SGDataType.color4f.matches(defaultValue) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_RealityKitTextureRead_color4",
+            nodeTypeID: 38, // ND_RealityKitTextureRead_color4
             inputs: [
-                .init(name: "file", dataType: SGDataType.asset, connection: file),
-                .init(name: "default", dataType: SGDataType.color4f, connection: defaultValue),
-                .init(name: "x", dataType: SGDataType.int, connection: x),
-                .init(name: "y", dataType: SGDataType.int, connection: y),
-                .init(name: "lod", dataType: SGDataType.int, connection: lod),
+                .init(nameID: 27, dataType: SGDataType.asset, connection: file),
+                .init(nameID: 16, dataType: SGDataType.color4f, connection: defaultValue),
+                .init(nameID: 138, dataType: SGDataType.int, connection: x),
+                .init(nameID: 139, dataType: SGDataType.int, connection: y),
+                .init(nameID: 64, dataType: SGDataType.int, connection: lod),
             ],
             outputs: [.init(dataType: SGDataType.color4f)])))
     }
     if SGDataType.vector4f.matches(defaultValue) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_RealityKitTextureRead_vector4",
+            nodeTypeID: 39, // ND_RealityKitTextureRead_vector4
             inputs: [
-                .init(name: "file", dataType: SGDataType.asset, connection: file),
-                .init(name: "default", dataType: SGDataType.vector4f, connection: defaultValue),
-                .init(name: "x", dataType: SGDataType.int, connection: x),
-                .init(name: "y", dataType: SGDataType.int, connection: y),
-                .init(name: "lod", dataType: SGDataType.int, connection: lod),
+                .init(nameID: 27, dataType: SGDataType.asset, connection: file),
+                .init(nameID: 16, dataType: SGDataType.vector4f, connection: defaultValue),
+                .init(nameID: 138, dataType: SGDataType.int, connection: x),
+                .init(nameID: 139, dataType: SGDataType.int, connection: y),
+                .init(nameID: 64, dataType: SGDataType.int, connection: lod),
             ],
             outputs: [.init(dataType: SGDataType.vector4f)])))
     }
@@ -5499,10 +5499,10 @@ public func reflect(_ in1: SGVector, normal: SGVector? = nil) -> SGVector {
         return SGVector(source: .error("Invalid reflect input. Expected normal data type to be SGDataType.vector3f, but got \(normal?.dataType.rawValue ?? "nil").", values: [normal]))
     }
     return SGVector(source: .nodeOutput(SGNode(
-        nodeType: "ND_realitykit_reflect_vector3",
+        nodeTypeID: 705, // ND_realitykit_reflect_vector3
         inputs: [
-            .init(name: "in", dataType: SGDataType.vector3f, connection: in1),
-            .init(name: "normal", dataType: SGDataType.vector3f, connection: normal),
+            .init(nameID: 42, dataType: SGDataType.vector3f, connection: in1),
+            .init(nameID: 80, dataType: SGDataType.vector3f, connection: normal),
         ],
         outputs: [.init(dataType: SGDataType.vector3f)])))
 }
@@ -5518,11 +5518,11 @@ public func refract(_ in1: SGVector, normal: SGVector? = nil, eta: SGScalar? = n
         return SGVector(source: .error("Invalid refract input. Expected eta data type to be SGDataType.float, but got \(eta?.dataType.rawValue ?? "nil").", values: [eta]))
     }
     return SGVector(source: .nodeOutput(SGNode(
-        nodeType: "ND_realitykit_refract_vector3",
+        nodeTypeID: 706, // ND_realitykit_refract_vector3
         inputs: [
-            .init(name: "in", dataType: SGDataType.vector3f, connection: in1),
-            .init(name: "normal", dataType: SGDataType.vector3f, connection: normal),
-            .init(name: "eta", dataType: SGDataType.float, connection: eta),
+            .init(nameID: 42, dataType: SGDataType.vector3f, connection: in1),
+            .init(nameID: 80, dataType: SGDataType.vector3f, connection: normal),
+            .init(nameID: 24, dataType: SGDataType.float, connection: eta),
         ],
         outputs: [.init(dataType: SGDataType.vector3f)])))
 }
@@ -5530,217 +5530,217 @@ public func refract(_ in1: SGVector, normal: SGVector? = nil, eta: SGScalar? = n
 public func remap<T>(_ in1: T, inlow: SGNumeric, inhigh: SGNumeric, outlow: SGNumeric, outhigh: SGNumeric) -> T where T: SGNumeric {
     if SGDataType.color3f.matches(in1) && SGDataType.color3f.matches(inlow) && SGDataType.color3f.matches(inhigh) && SGDataType.color3f.matches(outlow) && SGDataType.color3f.matches(outhigh) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_remap_color3",
+            nodeTypeID: 740, // ND_remap_color3
             inputs: [
-                .init(name: "in", dataType: SGDataType.color3f, connection: in1),
-                .init(name: "inlow", dataType: SGDataType.color3f, connection: inlow),
-                .init(name: "inhigh", dataType: SGDataType.color3f, connection: inhigh),
-                .init(name: "outlow", dataType: SGDataType.color3f, connection: outlow),
-                .init(name: "outhigh", dataType: SGDataType.color3f, connection: outhigh),
+                .init(nameID: 42, dataType: SGDataType.color3f, connection: in1),
+                .init(nameID: 55, dataType: SGDataType.color3f, connection: inlow),
+                .init(nameID: 54, dataType: SGDataType.color3f, connection: inhigh),
+                .init(nameID: 88, dataType: SGDataType.color3f, connection: outlow),
+                .init(nameID: 87, dataType: SGDataType.color3f, connection: outhigh),
             ],
             outputs: [.init(dataType: SGDataType.color3f)])))
     }
     if SGDataType.color3f.matches(in1) && SGDataType.float.matches(inlow) && SGDataType.float.matches(inhigh) && SGDataType.float.matches(outlow) && SGDataType.float.matches(outhigh) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_remap_color3FA",
+            nodeTypeID: 741, // ND_remap_color3FA
             inputs: [
-                .init(name: "in", dataType: SGDataType.color3f, connection: in1),
-                .init(name: "inlow", dataType: SGDataType.float, connection: inlow),
-                .init(name: "inhigh", dataType: SGDataType.float, connection: inhigh),
-                .init(name: "outlow", dataType: SGDataType.float, connection: outlow),
-                .init(name: "outhigh", dataType: SGDataType.float, connection: outhigh),
+                .init(nameID: 42, dataType: SGDataType.color3f, connection: in1),
+                .init(nameID: 55, dataType: SGDataType.float, connection: inlow),
+                .init(nameID: 54, dataType: SGDataType.float, connection: inhigh),
+                .init(nameID: 88, dataType: SGDataType.float, connection: outlow),
+                .init(nameID: 87, dataType: SGDataType.float, connection: outhigh),
             ],
             outputs: [.init(dataType: SGDataType.color3f)])))
     }
     if SGDataType.color4f.matches(in1) && SGDataType.color4f.matches(inlow) && SGDataType.color4f.matches(inhigh) && SGDataType.color4f.matches(outlow) && SGDataType.color4f.matches(outhigh) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_remap_color4",
+            nodeTypeID: 742, // ND_remap_color4
             inputs: [
-                .init(name: "in", dataType: SGDataType.color4f, connection: in1),
-                .init(name: "inlow", dataType: SGDataType.color4f, connection: inlow),
-                .init(name: "inhigh", dataType: SGDataType.color4f, connection: inhigh),
-                .init(name: "outlow", dataType: SGDataType.color4f, connection: outlow),
-                .init(name: "outhigh", dataType: SGDataType.color4f, connection: outhigh),
+                .init(nameID: 42, dataType: SGDataType.color4f, connection: in1),
+                .init(nameID: 55, dataType: SGDataType.color4f, connection: inlow),
+                .init(nameID: 54, dataType: SGDataType.color4f, connection: inhigh),
+                .init(nameID: 88, dataType: SGDataType.color4f, connection: outlow),
+                .init(nameID: 87, dataType: SGDataType.color4f, connection: outhigh),
             ],
             outputs: [.init(dataType: SGDataType.color4f)])))
     }
     if SGDataType.color4f.matches(in1) && SGDataType.float.matches(inlow) && SGDataType.float.matches(inhigh) && SGDataType.float.matches(outlow) && SGDataType.float.matches(outhigh) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_remap_color4FA",
+            nodeTypeID: 743, // ND_remap_color4FA
             inputs: [
-                .init(name: "in", dataType: SGDataType.color4f, connection: in1),
-                .init(name: "inlow", dataType: SGDataType.float, connection: inlow),
-                .init(name: "inhigh", dataType: SGDataType.float, connection: inhigh),
-                .init(name: "outlow", dataType: SGDataType.float, connection: outlow),
-                .init(name: "outhigh", dataType: SGDataType.float, connection: outhigh),
+                .init(nameID: 42, dataType: SGDataType.color4f, connection: in1),
+                .init(nameID: 55, dataType: SGDataType.float, connection: inlow),
+                .init(nameID: 54, dataType: SGDataType.float, connection: inhigh),
+                .init(nameID: 88, dataType: SGDataType.float, connection: outlow),
+                .init(nameID: 87, dataType: SGDataType.float, connection: outhigh),
             ],
             outputs: [.init(dataType: SGDataType.color4f)])))
     }
     if SGDataType.float.matches(in1) && SGDataType.float.matches(inlow) && SGDataType.float.matches(inhigh) && SGDataType.float.matches(outlow) && SGDataType.float.matches(outhigh) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_remap_float",
+            nodeTypeID: 744, // ND_remap_float
             inputs: [
-                .init(name: "in", dataType: SGDataType.float, connection: in1),
-                .init(name: "inlow", dataType: SGDataType.float, connection: inlow),
-                .init(name: "inhigh", dataType: SGDataType.float, connection: inhigh),
-                .init(name: "outlow", dataType: SGDataType.float, connection: outlow),
-                .init(name: "outhigh", dataType: SGDataType.float, connection: outhigh),
+                .init(nameID: 42, dataType: SGDataType.float, connection: in1),
+                .init(nameID: 55, dataType: SGDataType.float, connection: inlow),
+                .init(nameID: 54, dataType: SGDataType.float, connection: inhigh),
+                .init(nameID: 88, dataType: SGDataType.float, connection: outlow),
+                .init(nameID: 87, dataType: SGDataType.float, connection: outhigh),
             ],
             outputs: [.init(dataType: SGDataType.float)])))
     }
     if SGDataType.half.matches(in1) && SGDataType.half.matches(inlow) && SGDataType.half.matches(inhigh) && SGDataType.half.matches(outlow) && SGDataType.half.matches(outhigh) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_remap_half",
+            nodeTypeID: 745, // ND_remap_half
             inputs: [
-                .init(name: "in", dataType: SGDataType.half, connection: in1),
-                .init(name: "inlow", dataType: SGDataType.half, connection: inlow),
-                .init(name: "inhigh", dataType: SGDataType.half, connection: inhigh),
-                .init(name: "outlow", dataType: SGDataType.half, connection: outlow),
-                .init(name: "outhigh", dataType: SGDataType.half, connection: outhigh),
+                .init(nameID: 42, dataType: SGDataType.half, connection: in1),
+                .init(nameID: 55, dataType: SGDataType.half, connection: inlow),
+                .init(nameID: 54, dataType: SGDataType.half, connection: inhigh),
+                .init(nameID: 88, dataType: SGDataType.half, connection: outlow),
+                .init(nameID: 87, dataType: SGDataType.half, connection: outhigh),
             ],
             outputs: [.init(dataType: SGDataType.half)])))
     }
     if SGDataType.vector2h.matches(in1) && SGDataType.vector2h.matches(inlow) && SGDataType.vector2h.matches(inhigh) && SGDataType.vector2h.matches(outlow) && SGDataType.vector2h.matches(outhigh) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_remap_half2",
+            nodeTypeID: 746, // ND_remap_half2
             inputs: [
-                .init(name: "in", dataType: SGDataType.vector2h, connection: in1),
-                .init(name: "inlow", dataType: SGDataType.vector2h, connection: inlow),
-                .init(name: "inhigh", dataType: SGDataType.vector2h, connection: inhigh),
-                .init(name: "outlow", dataType: SGDataType.vector2h, connection: outlow),
-                .init(name: "outhigh", dataType: SGDataType.vector2h, connection: outhigh),
+                .init(nameID: 42, dataType: SGDataType.vector2h, connection: in1),
+                .init(nameID: 55, dataType: SGDataType.vector2h, connection: inlow),
+                .init(nameID: 54, dataType: SGDataType.vector2h, connection: inhigh),
+                .init(nameID: 88, dataType: SGDataType.vector2h, connection: outlow),
+                .init(nameID: 87, dataType: SGDataType.vector2h, connection: outhigh),
             ],
             outputs: [.init(dataType: SGDataType.vector2h)])))
     }
     if SGDataType.vector2h.matches(in1) && SGDataType.float.matches(inlow) && SGDataType.float.matches(inhigh) && SGDataType.float.matches(outlow) && SGDataType.float.matches(outhigh) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_remap_half2FA",
+            nodeTypeID: 747, // ND_remap_half2FA
             inputs: [
-                .init(name: "in", dataType: SGDataType.vector2h, connection: in1),
-                .init(name: "inlow", dataType: SGDataType.float, connection: inlow),
-                .init(name: "inhigh", dataType: SGDataType.float, connection: inhigh),
-                .init(name: "outlow", dataType: SGDataType.float, connection: outlow),
-                .init(name: "outhigh", dataType: SGDataType.float, connection: outhigh),
+                .init(nameID: 42, dataType: SGDataType.vector2h, connection: in1),
+                .init(nameID: 55, dataType: SGDataType.float, connection: inlow),
+                .init(nameID: 54, dataType: SGDataType.float, connection: inhigh),
+                .init(nameID: 88, dataType: SGDataType.float, connection: outlow),
+                .init(nameID: 87, dataType: SGDataType.float, connection: outhigh),
             ],
             outputs: [.init(dataType: SGDataType.vector2h)])))
     }
     if SGDataType.vector3h.matches(in1) && SGDataType.vector3h.matches(inlow) && SGDataType.vector3h.matches(inhigh) && SGDataType.vector3h.matches(outlow) && SGDataType.vector3h.matches(outhigh) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_remap_half3",
+            nodeTypeID: 748, // ND_remap_half3
             inputs: [
-                .init(name: "in", dataType: SGDataType.vector3h, connection: in1),
-                .init(name: "inlow", dataType: SGDataType.vector3h, connection: inlow),
-                .init(name: "inhigh", dataType: SGDataType.vector3h, connection: inhigh),
-                .init(name: "outlow", dataType: SGDataType.vector3h, connection: outlow),
-                .init(name: "outhigh", dataType: SGDataType.vector3h, connection: outhigh),
+                .init(nameID: 42, dataType: SGDataType.vector3h, connection: in1),
+                .init(nameID: 55, dataType: SGDataType.vector3h, connection: inlow),
+                .init(nameID: 54, dataType: SGDataType.vector3h, connection: inhigh),
+                .init(nameID: 88, dataType: SGDataType.vector3h, connection: outlow),
+                .init(nameID: 87, dataType: SGDataType.vector3h, connection: outhigh),
             ],
             outputs: [.init(dataType: SGDataType.vector3h)])))
     }
     if SGDataType.vector3h.matches(in1) && SGDataType.float.matches(inlow) && SGDataType.float.matches(inhigh) && SGDataType.float.matches(outlow) && SGDataType.float.matches(outhigh) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_remap_half3FA",
+            nodeTypeID: 749, // ND_remap_half3FA
             inputs: [
-                .init(name: "in", dataType: SGDataType.vector3h, connection: in1),
-                .init(name: "inlow", dataType: SGDataType.float, connection: inlow),
-                .init(name: "inhigh", dataType: SGDataType.float, connection: inhigh),
-                .init(name: "outlow", dataType: SGDataType.float, connection: outlow),
-                .init(name: "outhigh", dataType: SGDataType.float, connection: outhigh),
+                .init(nameID: 42, dataType: SGDataType.vector3h, connection: in1),
+                .init(nameID: 55, dataType: SGDataType.float, connection: inlow),
+                .init(nameID: 54, dataType: SGDataType.float, connection: inhigh),
+                .init(nameID: 88, dataType: SGDataType.float, connection: outlow),
+                .init(nameID: 87, dataType: SGDataType.float, connection: outhigh),
             ],
             outputs: [.init(dataType: SGDataType.vector3h)])))
     }
     if SGDataType.vector4h.matches(in1) && SGDataType.vector4h.matches(inlow) && SGDataType.vector4h.matches(inhigh) && SGDataType.vector4h.matches(outlow) && SGDataType.vector4h.matches(outhigh) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_remap_half4",
+            nodeTypeID: 750, // ND_remap_half4
             inputs: [
-                .init(name: "in", dataType: SGDataType.vector4h, connection: in1),
-                .init(name: "inlow", dataType: SGDataType.vector4h, connection: inlow),
-                .init(name: "inhigh", dataType: SGDataType.vector4h, connection: inhigh),
-                .init(name: "outlow", dataType: SGDataType.vector4h, connection: outlow),
-                .init(name: "outhigh", dataType: SGDataType.vector4h, connection: outhigh),
+                .init(nameID: 42, dataType: SGDataType.vector4h, connection: in1),
+                .init(nameID: 55, dataType: SGDataType.vector4h, connection: inlow),
+                .init(nameID: 54, dataType: SGDataType.vector4h, connection: inhigh),
+                .init(nameID: 88, dataType: SGDataType.vector4h, connection: outlow),
+                .init(nameID: 87, dataType: SGDataType.vector4h, connection: outhigh),
             ],
             outputs: [.init(dataType: SGDataType.vector4h)])))
     }
     if SGDataType.vector4h.matches(in1) && SGDataType.float.matches(inlow) && SGDataType.float.matches(inhigh) && SGDataType.float.matches(outlow) && SGDataType.float.matches(outhigh) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_remap_half4FA",
+            nodeTypeID: 751, // ND_remap_half4FA
             inputs: [
-                .init(name: "in", dataType: SGDataType.vector4h, connection: in1),
-                .init(name: "inlow", dataType: SGDataType.float, connection: inlow),
-                .init(name: "inhigh", dataType: SGDataType.float, connection: inhigh),
-                .init(name: "outlow", dataType: SGDataType.float, connection: outlow),
-                .init(name: "outhigh", dataType: SGDataType.float, connection: outhigh),
+                .init(nameID: 42, dataType: SGDataType.vector4h, connection: in1),
+                .init(nameID: 55, dataType: SGDataType.float, connection: inlow),
+                .init(nameID: 54, dataType: SGDataType.float, connection: inhigh),
+                .init(nameID: 88, dataType: SGDataType.float, connection: outlow),
+                .init(nameID: 87, dataType: SGDataType.float, connection: outhigh),
             ],
             outputs: [.init(dataType: SGDataType.vector4h)])))
     }
     if SGDataType.vector2f.matches(in1) && SGDataType.vector2f.matches(inlow) && SGDataType.vector2f.matches(inhigh) && SGDataType.vector2f.matches(outlow) && SGDataType.vector2f.matches(outhigh) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_remap_vector2",
+            nodeTypeID: 752, // ND_remap_vector2
             inputs: [
-                .init(name: "in", dataType: SGDataType.vector2f, connection: in1),
-                .init(name: "inlow", dataType: SGDataType.vector2f, connection: inlow),
-                .init(name: "inhigh", dataType: SGDataType.vector2f, connection: inhigh),
-                .init(name: "outlow", dataType: SGDataType.vector2f, connection: outlow),
-                .init(name: "outhigh", dataType: SGDataType.vector2f, connection: outhigh),
+                .init(nameID: 42, dataType: SGDataType.vector2f, connection: in1),
+                .init(nameID: 55, dataType: SGDataType.vector2f, connection: inlow),
+                .init(nameID: 54, dataType: SGDataType.vector2f, connection: inhigh),
+                .init(nameID: 88, dataType: SGDataType.vector2f, connection: outlow),
+                .init(nameID: 87, dataType: SGDataType.vector2f, connection: outhigh),
             ],
             outputs: [.init(dataType: SGDataType.vector2f)])))
     }
     if SGDataType.vector2f.matches(in1) && SGDataType.float.matches(inlow) && SGDataType.float.matches(inhigh) && SGDataType.float.matches(outlow) && SGDataType.float.matches(outhigh) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_remap_vector2FA",
+            nodeTypeID: 753, // ND_remap_vector2FA
             inputs: [
-                .init(name: "in", dataType: SGDataType.vector2f, connection: in1),
-                .init(name: "inlow", dataType: SGDataType.float, connection: inlow),
-                .init(name: "inhigh", dataType: SGDataType.float, connection: inhigh),
-                .init(name: "outlow", dataType: SGDataType.float, connection: outlow),
-                .init(name: "outhigh", dataType: SGDataType.float, connection: outhigh),
+                .init(nameID: 42, dataType: SGDataType.vector2f, connection: in1),
+                .init(nameID: 55, dataType: SGDataType.float, connection: inlow),
+                .init(nameID: 54, dataType: SGDataType.float, connection: inhigh),
+                .init(nameID: 88, dataType: SGDataType.float, connection: outlow),
+                .init(nameID: 87, dataType: SGDataType.float, connection: outhigh),
             ],
             outputs: [.init(dataType: SGDataType.vector2f)])))
     }
     if SGDataType.vector3f.matches(in1) && SGDataType.vector3f.matches(inlow) && SGDataType.vector3f.matches(inhigh) && SGDataType.vector3f.matches(outlow) && SGDataType.vector3f.matches(outhigh) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_remap_vector3",
+            nodeTypeID: 754, // ND_remap_vector3
             inputs: [
-                .init(name: "in", dataType: SGDataType.vector3f, connection: in1),
-                .init(name: "inlow", dataType: SGDataType.vector3f, connection: inlow),
-                .init(name: "inhigh", dataType: SGDataType.vector3f, connection: inhigh),
-                .init(name: "outlow", dataType: SGDataType.vector3f, connection: outlow),
-                .init(name: "outhigh", dataType: SGDataType.vector3f, connection: outhigh),
+                .init(nameID: 42, dataType: SGDataType.vector3f, connection: in1),
+                .init(nameID: 55, dataType: SGDataType.vector3f, connection: inlow),
+                .init(nameID: 54, dataType: SGDataType.vector3f, connection: inhigh),
+                .init(nameID: 88, dataType: SGDataType.vector3f, connection: outlow),
+                .init(nameID: 87, dataType: SGDataType.vector3f, connection: outhigh),
             ],
             outputs: [.init(dataType: SGDataType.vector3f)])))
     }
     if SGDataType.vector3f.matches(in1) && SGDataType.float.matches(inlow) && SGDataType.float.matches(inhigh) && SGDataType.float.matches(outlow) && SGDataType.float.matches(outhigh) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_remap_vector3FA",
+            nodeTypeID: 755, // ND_remap_vector3FA
             inputs: [
-                .init(name: "in", dataType: SGDataType.vector3f, connection: in1),
-                .init(name: "inlow", dataType: SGDataType.float, connection: inlow),
-                .init(name: "inhigh", dataType: SGDataType.float, connection: inhigh),
-                .init(name: "outlow", dataType: SGDataType.float, connection: outlow),
-                .init(name: "outhigh", dataType: SGDataType.float, connection: outhigh),
+                .init(nameID: 42, dataType: SGDataType.vector3f, connection: in1),
+                .init(nameID: 55, dataType: SGDataType.float, connection: inlow),
+                .init(nameID: 54, dataType: SGDataType.float, connection: inhigh),
+                .init(nameID: 88, dataType: SGDataType.float, connection: outlow),
+                .init(nameID: 87, dataType: SGDataType.float, connection: outhigh),
             ],
             outputs: [.init(dataType: SGDataType.vector3f)])))
     }
     if SGDataType.vector4f.matches(in1) && SGDataType.vector4f.matches(inlow) && SGDataType.vector4f.matches(inhigh) && SGDataType.vector4f.matches(outlow) && SGDataType.vector4f.matches(outhigh) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_remap_vector4",
+            nodeTypeID: 756, // ND_remap_vector4
             inputs: [
-                .init(name: "in", dataType: SGDataType.vector4f, connection: in1),
-                .init(name: "inlow", dataType: SGDataType.vector4f, connection: inlow),
-                .init(name: "inhigh", dataType: SGDataType.vector4f, connection: inhigh),
-                .init(name: "outlow", dataType: SGDataType.vector4f, connection: outlow),
-                .init(name: "outhigh", dataType: SGDataType.vector4f, connection: outhigh),
+                .init(nameID: 42, dataType: SGDataType.vector4f, connection: in1),
+                .init(nameID: 55, dataType: SGDataType.vector4f, connection: inlow),
+                .init(nameID: 54, dataType: SGDataType.vector4f, connection: inhigh),
+                .init(nameID: 88, dataType: SGDataType.vector4f, connection: outlow),
+                .init(nameID: 87, dataType: SGDataType.vector4f, connection: outhigh),
             ],
             outputs: [.init(dataType: SGDataType.vector4f)])))
     }
     if SGDataType.vector4f.matches(in1) && SGDataType.float.matches(inlow) && SGDataType.float.matches(inhigh) && SGDataType.float.matches(outlow) && SGDataType.float.matches(outhigh) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_remap_vector4FA",
+            nodeTypeID: 757, // ND_remap_vector4FA
             inputs: [
-                .init(name: "in", dataType: SGDataType.vector4f, connection: in1),
-                .init(name: "inlow", dataType: SGDataType.float, connection: inlow),
-                .init(name: "inhigh", dataType: SGDataType.float, connection: inhigh),
-                .init(name: "outlow", dataType: SGDataType.float, connection: outlow),
-                .init(name: "outhigh", dataType: SGDataType.float, connection: outhigh),
+                .init(nameID: 42, dataType: SGDataType.vector4f, connection: in1),
+                .init(nameID: 55, dataType: SGDataType.float, connection: inlow),
+                .init(nameID: 54, dataType: SGDataType.float, connection: inhigh),
+                .init(nameID: 88, dataType: SGDataType.float, connection: outlow),
+                .init(nameID: 87, dataType: SGDataType.float, connection: outhigh),
             ],
             outputs: [.init(dataType: SGDataType.vector4f)])))
     }
@@ -5750,17 +5750,17 @@ public func remap<T>(_ in1: T, inlow: SGNumeric, inhigh: SGNumeric, outlow: SGNu
 public func rgbToHSV(_ in1: SGColor) -> SGColor {
     if SGDataType.color3f.matches(in1) {
         return SGColor(source: .nodeOutput(SGNode(
-            nodeType: "ND_rgbtohsv_color3",
+            nodeTypeID: 758, // ND_rgbtohsv_color3
             inputs: [
-                .init(name: "in", dataType: SGDataType.color3f, connection: in1),
+                .init(nameID: 42, dataType: SGDataType.color3f, connection: in1),
             ],
             outputs: [.init(dataType: SGDataType.color3f)])))
     }
     if SGDataType.color4f.matches(in1) {
         return SGColor(source: .nodeOutput(SGNode(
-            nodeType: "ND_rgbtohsv_color4",
+            nodeTypeID: 759, // ND_rgbtohsv_color4
             inputs: [
-                .init(name: "in", dataType: SGDataType.color4f, connection: in1),
+                .init(nameID: 42, dataType: SGDataType.color4f, connection: in1),
             ],
             outputs: [.init(dataType: SGDataType.color4f)])))
     }
@@ -5775,10 +5775,10 @@ public func rotate2D(_ in1: SGVector, amount: SGScalar? = nil) -> SGVector {
         return SGVector(source: .error("Invalid rotate2D input. Expected amount data type to be SGDataType.float, but got \(amount?.dataType.rawValue ?? "nil").", values: [amount]))
     }
     return SGVector(source: .nodeOutput(SGNode(
-        nodeType: "ND_rotate2d_vector2",
+        nodeTypeID: 760, // ND_rotate2d_vector2
         inputs: [
-            .init(name: "in", dataType: SGDataType.vector2f, connection: in1),
-            .init(name: "amount", dataType: SGDataType.float, connection: amount),
+            .init(nameID: 42, dataType: SGDataType.vector2f, connection: in1),
+            .init(nameID: 1, dataType: SGDataType.float, connection: amount),
         ],
         outputs: [.init(dataType: SGDataType.vector2f)])))
 }
@@ -5794,11 +5794,11 @@ public func rotate3D(_ in1: SGVector, amount: SGScalar? = nil, axis: SGVector? =
         return SGVector(source: .error("Invalid rotate3D input. Expected axis data type to be SGDataType.vector3f, but got \(axis?.dataType.rawValue ?? "nil").", values: [axis]))
     }
     return SGVector(source: .nodeOutput(SGNode(
-        nodeType: "ND_rotate3d_vector3",
+        nodeTypeID: 761, // ND_rotate3d_vector3
         inputs: [
-            .init(name: "in", dataType: SGDataType.vector3f, connection: in1),
-            .init(name: "amount", dataType: SGDataType.float, connection: amount),
-            .init(name: "axis", dataType: SGDataType.vector3f, connection: axis),
+            .init(nameID: 42, dataType: SGDataType.vector3f, connection: in1),
+            .init(nameID: 1, dataType: SGDataType.float, connection: amount),
+            .init(nameID: 4, dataType: SGDataType.vector3f, connection: axis),
         ],
         outputs: [.init(dataType: SGDataType.vector3f)])))
 }
@@ -5806,57 +5806,57 @@ public func rotate3D(_ in1: SGVector, amount: SGScalar? = nil, axis: SGVector? =
 public func round<T>(_ in1: T) -> T where T: SGNumeric {
     if SGDataType.color3f.matches(in1) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_round_color3",
+            nodeTypeID: 762, // ND_round_color3
             inputs: [
-                .init(name: "in", dataType: SGDataType.color3f, connection: in1),
+                .init(nameID: 42, dataType: SGDataType.color3f, connection: in1),
             ],
             outputs: [.init(dataType: SGDataType.color3f)])))
     }
     if SGDataType.color4f.matches(in1) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_round_color4",
+            nodeTypeID: 763, // ND_round_color4
             inputs: [
-                .init(name: "in", dataType: SGDataType.color4f, connection: in1),
+                .init(nameID: 42, dataType: SGDataType.color4f, connection: in1),
             ],
             outputs: [.init(dataType: SGDataType.color4f)])))
     }
     if SGDataType.float.matches(in1) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_round_float",
+            nodeTypeID: 764, // ND_round_float
             inputs: [
-                .init(name: "in", dataType: SGDataType.float, connection: in1),
+                .init(nameID: 42, dataType: SGDataType.float, connection: in1),
             ],
             outputs: [.init(dataType: SGDataType.float)])))
     }
     if SGDataType.half.matches(in1) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_round_half",
+            nodeTypeID: 765, // ND_round_half
             inputs: [
-                .init(name: "in", dataType: SGDataType.half, connection: in1),
+                .init(nameID: 42, dataType: SGDataType.half, connection: in1),
             ],
             outputs: [.init(dataType: SGDataType.half)])))
     }
     if SGDataType.vector2f.matches(in1) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_round_vector2",
+            nodeTypeID: 766, // ND_round_vector2
             inputs: [
-                .init(name: "in", dataType: SGDataType.vector2f, connection: in1),
+                .init(nameID: 42, dataType: SGDataType.vector2f, connection: in1),
             ],
             outputs: [.init(dataType: SGDataType.vector2f)])))
     }
     if SGDataType.vector3f.matches(in1) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_round_vector3",
+            nodeTypeID: 767, // ND_round_vector3
             inputs: [
-                .init(name: "in", dataType: SGDataType.vector3f, connection: in1),
+                .init(nameID: 42, dataType: SGDataType.vector3f, connection: in1),
             ],
             outputs: [.init(dataType: SGDataType.vector3f)])))
     }
     if SGDataType.vector4f.matches(in1) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_round_vector4",
+            nodeTypeID: 768, // ND_round_vector4
             inputs: [
-                .init(name: "in", dataType: SGDataType.vector4f, connection: in1),
+                .init(nameID: 42, dataType: SGDataType.vector4f, connection: in1),
             ],
             outputs: [.init(dataType: SGDataType.vector4f)])))
     }
@@ -5866,109 +5866,109 @@ public func round<T>(_ in1: T) -> T where T: SGNumeric {
 public func safePow<T>(_ in1: T, _ in2: SGNumeric) -> T where T: SGNumeric {
     if SGDataType.color3f.matches(in1) && SGDataType.color3f.matches(in2) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_safepower_color3",
+            nodeTypeID: 769, // ND_safepower_color3
             inputs: [
-                .init(name: "in1", dataType: SGDataType.color3f, connection: in1),
-                .init(name: "in2", dataType: SGDataType.color3f, connection: in2),
+                .init(nameID: 43, dataType: SGDataType.color3f, connection: in1),
+                .init(nameID: 45, dataType: SGDataType.color3f, connection: in2),
             ],
             outputs: [.init(dataType: SGDataType.color3f)])))
     }
     if SGDataType.color3f.matches(in1) && SGDataType.float.matches(in2) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_safepower_color3FA",
+            nodeTypeID: 770, // ND_safepower_color3FA
             inputs: [
-                .init(name: "in1", dataType: SGDataType.color3f, connection: in1),
-                .init(name: "in2", dataType: SGDataType.float, connection: in2),
+                .init(nameID: 43, dataType: SGDataType.color3f, connection: in1),
+                .init(nameID: 45, dataType: SGDataType.float, connection: in2),
             ],
             outputs: [.init(dataType: SGDataType.color3f)])))
     }
     if SGDataType.color4f.matches(in1) && SGDataType.color4f.matches(in2) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_safepower_color4",
+            nodeTypeID: 771, // ND_safepower_color4
             inputs: [
-                .init(name: "in1", dataType: SGDataType.color4f, connection: in1),
-                .init(name: "in2", dataType: SGDataType.color4f, connection: in2),
+                .init(nameID: 43, dataType: SGDataType.color4f, connection: in1),
+                .init(nameID: 45, dataType: SGDataType.color4f, connection: in2),
             ],
             outputs: [.init(dataType: SGDataType.color4f)])))
     }
     if SGDataType.color4f.matches(in1) && SGDataType.float.matches(in2) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_safepower_color4FA",
+            nodeTypeID: 772, // ND_safepower_color4FA
             inputs: [
-                .init(name: "in1", dataType: SGDataType.color4f, connection: in1),
-                .init(name: "in2", dataType: SGDataType.float, connection: in2),
+                .init(nameID: 43, dataType: SGDataType.color4f, connection: in1),
+                .init(nameID: 45, dataType: SGDataType.float, connection: in2),
             ],
             outputs: [.init(dataType: SGDataType.color4f)])))
     }
     if SGDataType.float.matches(in1) && SGDataType.float.matches(in2) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_safepower_float",
+            nodeTypeID: 773, // ND_safepower_float
             inputs: [
-                .init(name: "in1", dataType: SGDataType.float, connection: in1),
-                .init(name: "in2", dataType: SGDataType.float, connection: in2),
+                .init(nameID: 43, dataType: SGDataType.float, connection: in1),
+                .init(nameID: 45, dataType: SGDataType.float, connection: in2),
             ],
             outputs: [.init(dataType: SGDataType.float)])))
     }
     if SGDataType.half.matches(in1) && SGDataType.half.matches(in2) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_safepower_half",
+            nodeTypeID: 774, // ND_safepower_half
             inputs: [
-                .init(name: "in1", dataType: SGDataType.half, connection: in1),
-                .init(name: "in2", dataType: SGDataType.half, connection: in2),
+                .init(nameID: 43, dataType: SGDataType.half, connection: in1),
+                .init(nameID: 45, dataType: SGDataType.half, connection: in2),
             ],
             outputs: [.init(dataType: SGDataType.half)])))
     }
     if SGDataType.vector2f.matches(in1) && SGDataType.vector2f.matches(in2) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_safepower_vector2",
+            nodeTypeID: 775, // ND_safepower_vector2
             inputs: [
-                .init(name: "in1", dataType: SGDataType.vector2f, connection: in1),
-                .init(name: "in2", dataType: SGDataType.vector2f, connection: in2),
+                .init(nameID: 43, dataType: SGDataType.vector2f, connection: in1),
+                .init(nameID: 45, dataType: SGDataType.vector2f, connection: in2),
             ],
             outputs: [.init(dataType: SGDataType.vector2f)])))
     }
     if SGDataType.vector2f.matches(in1) && SGDataType.float.matches(in2) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_safepower_vector2FA",
+            nodeTypeID: 776, // ND_safepower_vector2FA
             inputs: [
-                .init(name: "in1", dataType: SGDataType.vector2f, connection: in1),
-                .init(name: "in2", dataType: SGDataType.float, connection: in2),
+                .init(nameID: 43, dataType: SGDataType.vector2f, connection: in1),
+                .init(nameID: 45, dataType: SGDataType.float, connection: in2),
             ],
             outputs: [.init(dataType: SGDataType.vector2f)])))
     }
     if SGDataType.vector3f.matches(in1) && SGDataType.vector3f.matches(in2) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_safepower_vector3",
+            nodeTypeID: 777, // ND_safepower_vector3
             inputs: [
-                .init(name: "in1", dataType: SGDataType.vector3f, connection: in1),
-                .init(name: "in2", dataType: SGDataType.vector3f, connection: in2),
+                .init(nameID: 43, dataType: SGDataType.vector3f, connection: in1),
+                .init(nameID: 45, dataType: SGDataType.vector3f, connection: in2),
             ],
             outputs: [.init(dataType: SGDataType.vector3f)])))
     }
     if SGDataType.vector3f.matches(in1) && SGDataType.float.matches(in2) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_safepower_vector3FA",
+            nodeTypeID: 778, // ND_safepower_vector3FA
             inputs: [
-                .init(name: "in1", dataType: SGDataType.vector3f, connection: in1),
-                .init(name: "in2", dataType: SGDataType.float, connection: in2),
+                .init(nameID: 43, dataType: SGDataType.vector3f, connection: in1),
+                .init(nameID: 45, dataType: SGDataType.float, connection: in2),
             ],
             outputs: [.init(dataType: SGDataType.vector3f)])))
     }
     if SGDataType.vector4f.matches(in1) && SGDataType.vector4f.matches(in2) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_safepower_vector4",
+            nodeTypeID: 779, // ND_safepower_vector4
             inputs: [
-                .init(name: "in1", dataType: SGDataType.vector4f, connection: in1),
-                .init(name: "in2", dataType: SGDataType.vector4f, connection: in2),
+                .init(nameID: 43, dataType: SGDataType.vector4f, connection: in1),
+                .init(nameID: 45, dataType: SGDataType.vector4f, connection: in2),
             ],
             outputs: [.init(dataType: SGDataType.vector4f)])))
     }
     if SGDataType.vector4f.matches(in1) && SGDataType.float.matches(in2) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_safepower_vector4FA",
+            nodeTypeID: 780, // ND_safepower_vector4FA
             inputs: [
-                .init(name: "in1", dataType: SGDataType.vector4f, connection: in1),
-                .init(name: "in2", dataType: SGDataType.float, connection: in2),
+                .init(nameID: 43, dataType: SGDataType.vector4f, connection: in1),
+                .init(nameID: 45, dataType: SGDataType.float, connection: in2),
             ],
             outputs: [.init(dataType: SGDataType.vector4f)])))
     }
@@ -6002,67 +6002,67 @@ public func sample<T>(file: SGTexture, uWrapMode: SGSamplerAddressMode = SGSampl
     }
     if SGDataType.color3f.matches(defaultValue) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_RealityKitTexture2D_color3",
-            inputs: [
-                .init(name: "file", dataType: SGDataType.asset, connection: file),
-                .init(name: "u_wrap_mode", dataType: SGDataType.string, connection: SGString(source: .constant(.string(uWrapMode.rawValue)))),
-                .init(name: "v_wrap_mode", dataType: SGDataType.string, connection: SGString(source: .constant(.string(vWrapMode.rawValue)))),
-                .init(name: "border_color", dataType: SGDataType.string, connection: SGString(source: .constant(.string(borderColor.rawValue)))),
-                .init(name: "mag_filter", dataType: SGDataType.string, connection: SGString(source: .constant(.string(magFilter.rawValue)))),
-                .init(name: "min_filter", dataType: SGDataType.string, connection: SGString(source: .constant(.string(minFilter.rawValue)))),
-                .init(name: "mip_filter", dataType: SGDataType.string, connection: SGString(source: .constant(.string(mipFilter.rawValue)))),
-                .init(name: "max_anisotropy", dataType: SGDataType.int, connection: maxAnisotropy),
-                .init(name: "max_lod_clamp", dataType: SGDataType.float, connection: maxLodClamp),
-                .init(name: "min_lod_clamp", dataType: SGDataType.float, connection: minLodClamp),
-                .init(name: "default", dataType: SGDataType.color3f, connection: defaultValue),
-                .init(name: "texcoord", dataType: SGDataType.vector2f, connection: texcoord),
-                .init(name: "bias", dataType: SGDataType.float, connection: bias),
-                .init(name: "dynamic_min_lod_clamp", dataType: SGDataType.float, connection: dynamicMinLodClamp),
-                .init(name: "offset", dataType: SGDataType.vector2i, connection: offset),
+            nodeTypeID: 29, // ND_RealityKitTexture2D_color3
+            inputs: [
+                .init(nameID: 27, dataType: SGDataType.asset, connection: file),
+                .init(nameID: 107, dataType: SGDataType.string, connection: SGString(source: .constant(.string(uWrapMode.rawValue)))),
+                .init(nameID: 120, dataType: SGDataType.string, connection: SGString(source: .constant(.string(vWrapMode.rawValue)))),
+                .init(nameID: 9, dataType: SGDataType.string, connection: SGString(source: .constant(.string(borderColor.rawValue)))),
+                .init(nameID: 67, dataType: SGDataType.string, connection: SGString(source: .constant(.string(magFilter.rawValue)))),
+                .init(nameID: 74, dataType: SGDataType.string, connection: SGString(source: .constant(.string(minFilter.rawValue)))),
+                .init(nameID: 76, dataType: SGDataType.string, connection: SGString(source: .constant(.string(mipFilter.rawValue)))),
+                .init(nameID: 70, dataType: SGDataType.int, connection: maxAnisotropy),
+                .init(nameID: 71, dataType: SGDataType.float, connection: maxLodClamp),
+                .init(nameID: 75, dataType: SGDataType.float, connection: minLodClamp),
+                .init(nameID: 16, dataType: SGDataType.color3f, connection: defaultValue),
+                .init(nameID: 104, dataType: SGDataType.vector2f, connection: texcoord),
+                .init(nameID: 7, dataType: SGDataType.float, connection: bias),
+                .init(nameID: 21, dataType: SGDataType.float, connection: dynamicMinLodClamp),
+                .init(nameID: 84, dataType: SGDataType.vector2i, connection: offset),
             ],
             outputs: [.init(dataType: SGDataType.color3f)])))
     }
     if SGDataType.color4f.matches(defaultValue) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_RealityKitTexture2D_color4",
-            inputs: [
-                .init(name: "file", dataType: SGDataType.asset, connection: file),
-                .init(name: "u_wrap_mode", dataType: SGDataType.string, connection: SGString(source: .constant(.string(uWrapMode.rawValue)))),
-                .init(name: "v_wrap_mode", dataType: SGDataType.string, connection: SGString(source: .constant(.string(vWrapMode.rawValue)))),
-                .init(name: "border_color", dataType: SGDataType.string, connection: SGString(source: .constant(.string(borderColor.rawValue)))),
-                .init(name: "mag_filter", dataType: SGDataType.string, connection: SGString(source: .constant(.string(magFilter.rawValue)))),
-                .init(name: "min_filter", dataType: SGDataType.string, connection: SGString(source: .constant(.string(minFilter.rawValue)))),
-                .init(name: "mip_filter", dataType: SGDataType.string, connection: SGString(source: .constant(.string(mipFilter.rawValue)))),
-                .init(name: "max_anisotropy", dataType: SGDataType.int, connection: maxAnisotropy),
-                .init(name: "max_lod_clamp", dataType: SGDataType.float, connection: maxLodClamp),
-                .init(name: "min_lod_clamp", dataType: SGDataType.float, connection: minLodClamp),
-                .init(name: "default", dataType: SGDataType.color4f, connection: defaultValue),
-                .init(name: "texcoord", dataType: SGDataType.vector2f, connection: texcoord),
-                .init(name: "bias", dataType: SGDataType.float, connection: bias),
-                .init(name: "dynamic_min_lod_clamp", dataType: SGDataType.float, connection: dynamicMinLodClamp),
-                .init(name: "offset", dataType: SGDataType.vector2i, connection: offset),
+            nodeTypeID: 30, // ND_RealityKitTexture2D_color4
+            inputs: [
+                .init(nameID: 27, dataType: SGDataType.asset, connection: file),
+                .init(nameID: 107, dataType: SGDataType.string, connection: SGString(source: .constant(.string(uWrapMode.rawValue)))),
+                .init(nameID: 120, dataType: SGDataType.string, connection: SGString(source: .constant(.string(vWrapMode.rawValue)))),
+                .init(nameID: 9, dataType: SGDataType.string, connection: SGString(source: .constant(.string(borderColor.rawValue)))),
+                .init(nameID: 67, dataType: SGDataType.string, connection: SGString(source: .constant(.string(magFilter.rawValue)))),
+                .init(nameID: 74, dataType: SGDataType.string, connection: SGString(source: .constant(.string(minFilter.rawValue)))),
+                .init(nameID: 76, dataType: SGDataType.string, connection: SGString(source: .constant(.string(mipFilter.rawValue)))),
+                .init(nameID: 70, dataType: SGDataType.int, connection: maxAnisotropy),
+                .init(nameID: 71, dataType: SGDataType.float, connection: maxLodClamp),
+                .init(nameID: 75, dataType: SGDataType.float, connection: minLodClamp),
+                .init(nameID: 16, dataType: SGDataType.color4f, connection: defaultValue),
+                .init(nameID: 104, dataType: SGDataType.vector2f, connection: texcoord),
+                .init(nameID: 7, dataType: SGDataType.float, connection: bias),
+                .init(nameID: 21, dataType: SGDataType.float, connection: dynamicMinLodClamp),
+                .init(nameID: 84, dataType: SGDataType.vector2i, connection: offset),
             ],
             outputs: [.init(dataType: SGDataType.color4f)])))
     }
     if SGDataType.vector4f.matches(defaultValue) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_RealityKitTexture2D_vector4",
-            inputs: [
-                .init(name: "file", dataType: SGDataType.asset, connection: file),
-                .init(name: "u_wrap_mode", dataType: SGDataType.string, connection: SGString(source: .constant(.string(uWrapMode.rawValue)))),
-                .init(name: "v_wrap_mode", dataType: SGDataType.string, connection: SGString(source: .constant(.string(vWrapMode.rawValue)))),
-                .init(name: "border_color", dataType: SGDataType.string, connection: SGString(source: .constant(.string(borderColor.rawValue)))),
-                .init(name: "mag_filter", dataType: SGDataType.string, connection: SGString(source: .constant(.string(magFilter.rawValue)))),
-                .init(name: "min_filter", dataType: SGDataType.string, connection: SGString(source: .constant(.string(minFilter.rawValue)))),
-                .init(name: "mip_filter", dataType: SGDataType.string, connection: SGString(source: .constant(.string(mipFilter.rawValue)))),
-                .init(name: "max_anisotropy", dataType: SGDataType.int, connection: maxAnisotropy),
-                .init(name: "max_lod_clamp", dataType: SGDataType.float, connection: maxLodClamp),
-                .init(name: "min_lod_clamp", dataType: SGDataType.float, connection: minLodClamp),
-                .init(name: "default", dataType: SGDataType.vector4f, connection: defaultValue),
-                .init(name: "texcoord", dataType: SGDataType.vector2f, connection: texcoord),
-                .init(name: "bias", dataType: SGDataType.float, connection: bias),
-                .init(name: "dynamic_min_lod_clamp", dataType: SGDataType.float, connection: dynamicMinLodClamp),
-                .init(name: "offset", dataType: SGDataType.vector2i, connection: offset),
+            nodeTypeID: 31, // ND_RealityKitTexture2D_vector4
+            inputs: [
+                .init(nameID: 27, dataType: SGDataType.asset, connection: file),
+                .init(nameID: 107, dataType: SGDataType.string, connection: SGString(source: .constant(.string(uWrapMode.rawValue)))),
+                .init(nameID: 120, dataType: SGDataType.string, connection: SGString(source: .constant(.string(vWrapMode.rawValue)))),
+                .init(nameID: 9, dataType: SGDataType.string, connection: SGString(source: .constant(.string(borderColor.rawValue)))),
+                .init(nameID: 67, dataType: SGDataType.string, connection: SGString(source: .constant(.string(magFilter.rawValue)))),
+                .init(nameID: 74, dataType: SGDataType.string, connection: SGString(source: .constant(.string(minFilter.rawValue)))),
+                .init(nameID: 76, dataType: SGDataType.string, connection: SGString(source: .constant(.string(mipFilter.rawValue)))),
+                .init(nameID: 70, dataType: SGDataType.int, connection: maxAnisotropy),
+                .init(nameID: 71, dataType: SGDataType.float, connection: maxLodClamp),
+                .init(nameID: 75, dataType: SGDataType.float, connection: minLodClamp),
+                .init(nameID: 16, dataType: SGDataType.vector4f, connection: defaultValue),
+                .init(nameID: 104, dataType: SGDataType.vector2f, connection: texcoord),
+                .init(nameID: 7, dataType: SGDataType.float, connection: bias),
+                .init(nameID: 21, dataType: SGDataType.float, connection: dynamicMinLodClamp),
+                .init(nameID: 84, dataType: SGDataType.vector2i, connection: offset),
             ],
             outputs: [.init(dataType: SGDataType.vector4f)])))
     }
@@ -6093,43 +6093,43 @@ public func sampleCube<T>(file: SGTexture, uWrapMode: SGSamplerAddressMode = SGS
     }
     if SGDataType.color4f.matches(defaultValue) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_RealityKitTextureCube_color4",
-            inputs: [
-                .init(name: "file", dataType: SGDataType.asset, connection: file),
-                .init(name: "u_wrap_mode", dataType: SGDataType.string, connection: SGString(source: .constant(.string(uWrapMode.rawValue)))),
-                .init(name: "v_wrap_mode", dataType: SGDataType.string, connection: SGString(source: .constant(.string(vWrapMode.rawValue)))),
-                .init(name: "border_color", dataType: SGDataType.string, connection: SGString(source: .constant(.string(borderColor.rawValue)))),
-                .init(name: "mag_filter", dataType: SGDataType.string, connection: SGString(source: .constant(.string(magFilter.rawValue)))),
-                .init(name: "min_filter", dataType: SGDataType.string, connection: SGString(source: .constant(.string(minFilter.rawValue)))),
-                .init(name: "mip_filter", dataType: SGDataType.string, connection: SGString(source: .constant(.string(mipFilter.rawValue)))),
-                .init(name: "max_anisotropy", dataType: SGDataType.int, connection: maxAnisotropy),
-                .init(name: "max_lod_clamp", dataType: SGDataType.float, connection: maxLodClamp),
-                .init(name: "min_lod_clamp", dataType: SGDataType.float, connection: minLodClamp),
-                .init(name: "default", dataType: SGDataType.color4f, connection: defaultValue),
-                .init(name: "texcoord", dataType: SGDataType.vector3f, connection: texcoord),
-                .init(name: "bias", dataType: SGDataType.float, connection: bias),
-                .init(name: "dynamic_min_lod_clamp", dataType: SGDataType.float, connection: dynamicMinLodClamp),
+            nodeTypeID: 36, // ND_RealityKitTextureCube_color4
+            inputs: [
+                .init(nameID: 27, dataType: SGDataType.asset, connection: file),
+                .init(nameID: 107, dataType: SGDataType.string, connection: SGString(source: .constant(.string(uWrapMode.rawValue)))),
+                .init(nameID: 120, dataType: SGDataType.string, connection: SGString(source: .constant(.string(vWrapMode.rawValue)))),
+                .init(nameID: 9, dataType: SGDataType.string, connection: SGString(source: .constant(.string(borderColor.rawValue)))),
+                .init(nameID: 67, dataType: SGDataType.string, connection: SGString(source: .constant(.string(magFilter.rawValue)))),
+                .init(nameID: 74, dataType: SGDataType.string, connection: SGString(source: .constant(.string(minFilter.rawValue)))),
+                .init(nameID: 76, dataType: SGDataType.string, connection: SGString(source: .constant(.string(mipFilter.rawValue)))),
+                .init(nameID: 70, dataType: SGDataType.int, connection: maxAnisotropy),
+                .init(nameID: 71, dataType: SGDataType.float, connection: maxLodClamp),
+                .init(nameID: 75, dataType: SGDataType.float, connection: minLodClamp),
+                .init(nameID: 16, dataType: SGDataType.color4f, connection: defaultValue),
+                .init(nameID: 104, dataType: SGDataType.vector3f, connection: texcoord),
+                .init(nameID: 7, dataType: SGDataType.float, connection: bias),
+                .init(nameID: 21, dataType: SGDataType.float, connection: dynamicMinLodClamp),
             ],
             outputs: [.init(dataType: SGDataType.color4f)])))
     }
     if SGDataType.vector4f.matches(defaultValue) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_RealityKitTextureCube_vector4",
-            inputs: [
-                .init(name: "file", dataType: SGDataType.asset, connection: file),
-                .init(name: "u_wrap_mode", dataType: SGDataType.string, connection: SGString(source: .constant(.string(uWrapMode.rawValue)))),
-                .init(name: "v_wrap_mode", dataType: SGDataType.string, connection: SGString(source: .constant(.string(vWrapMode.rawValue)))),
-                .init(name: "border_color", dataType: SGDataType.string, connection: SGString(source: .constant(.string(borderColor.rawValue)))),
-                .init(name: "mag_filter", dataType: SGDataType.string, connection: SGString(source: .constant(.string(magFilter.rawValue)))),
-                .init(name: "min_filter", dataType: SGDataType.string, connection: SGString(source: .constant(.string(minFilter.rawValue)))),
-                .init(name: "mip_filter", dataType: SGDataType.string, connection: SGString(source: .constant(.string(mipFilter.rawValue)))),
-                .init(name: "max_anisotropy", dataType: SGDataType.int, connection: maxAnisotropy),
-                .init(name: "max_lod_clamp", dataType: SGDataType.float, connection: maxLodClamp),
-                .init(name: "min_lod_clamp", dataType: SGDataType.float, connection: minLodClamp),
-                .init(name: "default", dataType: SGDataType.vector4f, connection: defaultValue),
-                .init(name: "texcoord", dataType: SGDataType.vector3f, connection: texcoord),
-                .init(name: "bias", dataType: SGDataType.float, connection: bias),
-                .init(name: "dynamic_min_lod_clamp", dataType: SGDataType.float, connection: dynamicMinLodClamp),
+            nodeTypeID: 37, // ND_RealityKitTextureCube_vector4
+            inputs: [
+                .init(nameID: 27, dataType: SGDataType.asset, connection: file),
+                .init(nameID: 107, dataType: SGDataType.string, connection: SGString(source: .constant(.string(uWrapMode.rawValue)))),
+                .init(nameID: 120, dataType: SGDataType.string, connection: SGString(source: .constant(.string(vWrapMode.rawValue)))),
+                .init(nameID: 9, dataType: SGDataType.string, connection: SGString(source: .constant(.string(borderColor.rawValue)))),
+                .init(nameID: 67, dataType: SGDataType.string, connection: SGString(source: .constant(.string(magFilter.rawValue)))),
+                .init(nameID: 74, dataType: SGDataType.string, connection: SGString(source: .constant(.string(minFilter.rawValue)))),
+                .init(nameID: 76, dataType: SGDataType.string, connection: SGString(source: .constant(.string(mipFilter.rawValue)))),
+                .init(nameID: 70, dataType: SGDataType.int, connection: maxAnisotropy),
+                .init(nameID: 71, dataType: SGDataType.float, connection: maxLodClamp),
+                .init(nameID: 75, dataType: SGDataType.float, connection: minLodClamp),
+                .init(nameID: 16, dataType: SGDataType.vector4f, connection: defaultValue),
+                .init(nameID: 104, dataType: SGDataType.vector3f, connection: texcoord),
+                .init(nameID: 7, dataType: SGDataType.float, connection: bias),
+                .init(nameID: 21, dataType: SGDataType.float, connection: dynamicMinLodClamp),
             ],
             outputs: [.init(dataType: SGDataType.vector4f)])))
     }
@@ -6163,45 +6163,45 @@ public func sampleCubeGradient<T>(file: SGTexture, uWrapMode: SGSamplerAddressMo
     }
     if SGDataType.color4f.matches(defaultValue) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_RealityKitTextureCubeGradient_color4",
-            inputs: [
-                .init(name: "file", dataType: SGDataType.asset, connection: file),
-                .init(name: "u_wrap_mode", dataType: SGDataType.string, connection: SGString(source: .constant(.string(uWrapMode.rawValue)))),
-                .init(name: "v_wrap_mode", dataType: SGDataType.string, connection: SGString(source: .constant(.string(vWrapMode.rawValue)))),
-                .init(name: "border_color", dataType: SGDataType.string, connection: SGString(source: .constant(.string(borderColor.rawValue)))),
-                .init(name: "mag_filter", dataType: SGDataType.string, connection: SGString(source: .constant(.string(magFilter.rawValue)))),
-                .init(name: "min_filter", dataType: SGDataType.string, connection: SGString(source: .constant(.string(minFilter.rawValue)))),
-                .init(name: "mip_filter", dataType: SGDataType.string, connection: SGString(source: .constant(.string(mipFilter.rawValue)))),
-                .init(name: "max_anisotropy", dataType: SGDataType.int, connection: maxAnisotropy),
-                .init(name: "max_lod_clamp", dataType: SGDataType.float, connection: maxLodClamp),
-                .init(name: "min_lod_clamp", dataType: SGDataType.float, connection: minLodClamp),
-                .init(name: "default", dataType: SGDataType.color4f, connection: defaultValue),
-                .init(name: "texcoord", dataType: SGDataType.vector3f, connection: texcoord),
-                .init(name: "dynamic_min_lod_clamp", dataType: SGDataType.float, connection: dynamicMinLodClamp),
-                .init(name: "gradientcube_dPdx", dataType: SGDataType.vector3f, connection: gradientcubeDpdx),
-                .init(name: "gradientcube_dPdy", dataType: SGDataType.vector3f, connection: gradientcubeDpdy),
+            nodeTypeID: 32, // ND_RealityKitTextureCubeGradient_color4
+            inputs: [
+                .init(nameID: 27, dataType: SGDataType.asset, connection: file),
+                .init(nameID: 107, dataType: SGDataType.string, connection: SGString(source: .constant(.string(uWrapMode.rawValue)))),
+                .init(nameID: 120, dataType: SGDataType.string, connection: SGString(source: .constant(.string(vWrapMode.rawValue)))),
+                .init(nameID: 9, dataType: SGDataType.string, connection: SGString(source: .constant(.string(borderColor.rawValue)))),
+                .init(nameID: 67, dataType: SGDataType.string, connection: SGString(source: .constant(.string(magFilter.rawValue)))),
+                .init(nameID: 74, dataType: SGDataType.string, connection: SGString(source: .constant(.string(minFilter.rawValue)))),
+                .init(nameID: 76, dataType: SGDataType.string, connection: SGString(source: .constant(.string(mipFilter.rawValue)))),
+                .init(nameID: 70, dataType: SGDataType.int, connection: maxAnisotropy),
+                .init(nameID: 71, dataType: SGDataType.float, connection: maxLodClamp),
+                .init(nameID: 75, dataType: SGDataType.float, connection: minLodClamp),
+                .init(nameID: 16, dataType: SGDataType.color4f, connection: defaultValue),
+                .init(nameID: 104, dataType: SGDataType.vector3f, connection: texcoord),
+                .init(nameID: 21, dataType: SGDataType.float, connection: dynamicMinLodClamp),
+                .init(nameID: 38, dataType: SGDataType.vector3f, connection: gradientcubeDpdx),
+                .init(nameID: 39, dataType: SGDataType.vector3f, connection: gradientcubeDpdy),
             ],
             outputs: [.init(dataType: SGDataType.color4f)])))
     }
     if SGDataType.vector4f.matches(defaultValue) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_RealityKitTextureCubeGradient_vector4",
-            inputs: [
-                .init(name: "file", dataType: SGDataType.asset, connection: file),
-                .init(name: "u_wrap_mode", dataType: SGDataType.string, connection: SGString(source: .constant(.string(uWrapMode.rawValue)))),
-                .init(name: "v_wrap_mode", dataType: SGDataType.string, connection: SGString(source: .constant(.string(vWrapMode.rawValue)))),
-                .init(name: "border_color", dataType: SGDataType.string, connection: SGString(source: .constant(.string(borderColor.rawValue)))),
-                .init(name: "mag_filter", dataType: SGDataType.string, connection: SGString(source: .constant(.string(magFilter.rawValue)))),
-                .init(name: "min_filter", dataType: SGDataType.string, connection: SGString(source: .constant(.string(minFilter.rawValue)))),
-                .init(name: "mip_filter", dataType: SGDataType.string, connection: SGString(source: .constant(.string(mipFilter.rawValue)))),
-                .init(name: "max_anisotropy", dataType: SGDataType.int, connection: maxAnisotropy),
-                .init(name: "max_lod_clamp", dataType: SGDataType.float, connection: maxLodClamp),
-                .init(name: "min_lod_clamp", dataType: SGDataType.float, connection: minLodClamp),
-                .init(name: "default", dataType: SGDataType.vector4f, connection: defaultValue),
-                .init(name: "texcoord", dataType: SGDataType.vector3f, connection: texcoord),
-                .init(name: "dynamic_min_lod_clamp", dataType: SGDataType.float, connection: dynamicMinLodClamp),
-                .init(name: "gradientcube_dPdx", dataType: SGDataType.vector3f, connection: gradientcubeDpdx),
-                .init(name: "gradientcube_dPdy", dataType: SGDataType.vector3f, connection: gradientcubeDpdy),
+            nodeTypeID: 33, // ND_RealityKitTextureCubeGradient_vector4
+            inputs: [
+                .init(nameID: 27, dataType: SGDataType.asset, connection: file),
+                .init(nameID: 107, dataType: SGDataType.string, connection: SGString(source: .constant(.string(uWrapMode.rawValue)))),
+                .init(nameID: 120, dataType: SGDataType.string, connection: SGString(source: .constant(.string(vWrapMode.rawValue)))),
+                .init(nameID: 9, dataType: SGDataType.string, connection: SGString(source: .constant(.string(borderColor.rawValue)))),
+                .init(nameID: 67, dataType: SGDataType.string, connection: SGString(source: .constant(.string(magFilter.rawValue)))),
+                .init(nameID: 74, dataType: SGDataType.string, connection: SGString(source: .constant(.string(minFilter.rawValue)))),
+                .init(nameID: 76, dataType: SGDataType.string, connection: SGString(source: .constant(.string(mipFilter.rawValue)))),
+                .init(nameID: 70, dataType: SGDataType.int, connection: maxAnisotropy),
+                .init(nameID: 71, dataType: SGDataType.float, connection: maxLodClamp),
+                .init(nameID: 75, dataType: SGDataType.float, connection: minLodClamp),
+                .init(nameID: 16, dataType: SGDataType.vector4f, connection: defaultValue),
+                .init(nameID: 104, dataType: SGDataType.vector3f, connection: texcoord),
+                .init(nameID: 21, dataType: SGDataType.float, connection: dynamicMinLodClamp),
+                .init(nameID: 38, dataType: SGDataType.vector3f, connection: gradientcubeDpdx),
+                .init(nameID: 39, dataType: SGDataType.vector3f, connection: gradientcubeDpdy),
             ],
             outputs: [.init(dataType: SGDataType.vector4f)])))
     }
@@ -6229,41 +6229,41 @@ public func sampleCubeLOD<T>(file: SGTexture, uWrapMode: SGSamplerAddressMode =
     }
     if SGDataType.color4f.matches(defaultValue) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_RealityKitTextureCubeLOD_color4",
-            inputs: [
-                .init(name: "file", dataType: SGDataType.asset, connection: file),
-                .init(name: "u_wrap_mode", dataType: SGDataType.string, connection: SGString(source: .constant(.string(uWrapMode.rawValue)))),
-                .init(name: "v_wrap_mode", dataType: SGDataType.string, connection: SGString(source: .constant(.string(vWrapMode.rawValue)))),
-                .init(name: "border_color", dataType: SGDataType.string, connection: SGString(source: .constant(.string(borderColor.rawValue)))),
-                .init(name: "mag_filter", dataType: SGDataType.string, connection: SGString(source: .constant(.string(magFilter.rawValue)))),
-                .init(name: "min_filter", dataType: SGDataType.string, connection: SGString(source: .constant(.string(minFilter.rawValue)))),
-                .init(name: "mip_filter", dataType: SGDataType.string, connection: SGString(source: .constant(.string(mipFilter.rawValue)))),
-                .init(name: "max_anisotropy", dataType: SGDataType.int, connection: maxAnisotropy),
-                .init(name: "max_lod_clamp", dataType: SGDataType.float, connection: maxLodClamp),
-                .init(name: "min_lod_clamp", dataType: SGDataType.float, connection: minLodClamp),
-                .init(name: "default", dataType: SGDataType.color4f, connection: defaultValue),
-                .init(name: "texcoord", dataType: SGDataType.vector3f, connection: texcoord),
-                .init(name: "lod", dataType: SGDataType.float, connection: lod),
+            nodeTypeID: 34, // ND_RealityKitTextureCubeLOD_color4
+            inputs: [
+                .init(nameID: 27, dataType: SGDataType.asset, connection: file),
+                .init(nameID: 107, dataType: SGDataType.string, connection: SGString(source: .constant(.string(uWrapMode.rawValue)))),
+                .init(nameID: 120, dataType: SGDataType.string, connection: SGString(source: .constant(.string(vWrapMode.rawValue)))),
+                .init(nameID: 9, dataType: SGDataType.string, connection: SGString(source: .constant(.string(borderColor.rawValue)))),
+                .init(nameID: 67, dataType: SGDataType.string, connection: SGString(source: .constant(.string(magFilter.rawValue)))),
+                .init(nameID: 74, dataType: SGDataType.string, connection: SGString(source: .constant(.string(minFilter.rawValue)))),
+                .init(nameID: 76, dataType: SGDataType.string, connection: SGString(source: .constant(.string(mipFilter.rawValue)))),
+                .init(nameID: 70, dataType: SGDataType.int, connection: maxAnisotropy),
+                .init(nameID: 71, dataType: SGDataType.float, connection: maxLodClamp),
+                .init(nameID: 75, dataType: SGDataType.float, connection: minLodClamp),
+                .init(nameID: 16, dataType: SGDataType.color4f, connection: defaultValue),
+                .init(nameID: 104, dataType: SGDataType.vector3f, connection: texcoord),
+                .init(nameID: 64, dataType: SGDataType.float, connection: lod),
             ],
             outputs: [.init(dataType: SGDataType.color4f)])))
     }
     if SGDataType.vector4f.matches(defaultValue) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_RealityKitTextureCubeLOD_vector4",
-            inputs: [
-                .init(name: "file", dataType: SGDataType.asset, connection: file),
-                .init(name: "u_wrap_mode", dataType: SGDataType.string, connection: SGString(source: .constant(.string(uWrapMode.rawValue)))),
-                .init(name: "v_wrap_mode", dataType: SGDataType.string, connection: SGString(source: .constant(.string(vWrapMode.rawValue)))),
-                .init(name: "border_color", dataType: SGDataType.string, connection: SGString(source: .constant(.string(borderColor.rawValue)))),
-                .init(name: "mag_filter", dataType: SGDataType.string, connection: SGString(source: .constant(.string(magFilter.rawValue)))),
-                .init(name: "min_filter", dataType: SGDataType.string, connection: SGString(source: .constant(.string(minFilter.rawValue)))),
-                .init(name: "mip_filter", dataType: SGDataType.string, connection: SGString(source: .constant(.string(mipFilter.rawValue)))),
-                .init(name: "max_anisotropy", dataType: SGDataType.int, connection: maxAnisotropy),
-                .init(name: "max_lod_clamp", dataType: SGDataType.float, connection: maxLodClamp),
-                .init(name: "min_lod_clamp", dataType: SGDataType.float, connection: minLodClamp),
-                .init(name: "default", dataType: SGDataType.vector4f, connection: defaultValue),
-                .init(name: "texcoord", dataType: SGDataType.vector3f, connection: texcoord),
-                .init(name: "lod", dataType: SGDataType.float, connection: lod),
+            nodeTypeID: 35, // ND_RealityKitTextureCubeLOD_vector4
+            inputs: [
+                .init(nameID: 27, dataType: SGDataType.asset, connection: file),
+                .init(nameID: 107, dataType: SGDataType.string, connection: SGString(source: .constant(.string(uWrapMode.rawValue)))),
+                .init(nameID: 120, dataType: SGDataType.string, connection: SGString(source: .constant(.string(vWrapMode.rawValue)))),
+                .init(nameID: 9, dataType: SGDataType.string, connection: SGString(source: .constant(.string(borderColor.rawValue)))),
+                .init(nameID: 67, dataType: SGDataType.string, connection: SGString(source: .constant(.string(magFilter.rawValue)))),
+                .init(nameID: 74, dataType: SGDataType.string, connection: SGString(source: .constant(.string(minFilter.rawValue)))),
+                .init(nameID: 76, dataType: SGDataType.string, connection: SGString(source: .constant(.string(mipFilter.rawValue)))),
+                .init(nameID: 70, dataType: SGDataType.int, connection: maxAnisotropy),
+                .init(nameID: 71, dataType: SGDataType.float, connection: maxLodClamp),
+                .init(nameID: 75, dataType: SGDataType.float, connection: minLodClamp),
+                .init(nameID: 16, dataType: SGDataType.vector4f, connection: defaultValue),
+                .init(nameID: 104, dataType: SGDataType.vector3f, connection: texcoord),
+                .init(nameID: 64, dataType: SGDataType.float, connection: lod),
             ],
             outputs: [.init(dataType: SGDataType.vector4f)])))
     }
@@ -6300,70 +6300,70 @@ public func sampleGradient<T>(file: SGTexture, uWrapMode: SGSamplerAddressMode =
     }
     if SGDataType.color3f.matches(defaultValue) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_RealityKitTexture2DGradient_color3",
-            inputs: [
-                .init(name: "file", dataType: SGDataType.asset, connection: file),
-                .init(name: "u_wrap_mode", dataType: SGDataType.string, connection: SGString(source: .constant(.string(uWrapMode.rawValue)))),
-                .init(name: "v_wrap_mode", dataType: SGDataType.string, connection: SGString(source: .constant(.string(vWrapMode.rawValue)))),
-                .init(name: "border_color", dataType: SGDataType.string, connection: SGString(source: .constant(.string(borderColor.rawValue)))),
-                .init(name: "mag_filter", dataType: SGDataType.string, connection: SGString(source: .constant(.string(magFilter.rawValue)))),
-                .init(name: "min_filter", dataType: SGDataType.string, connection: SGString(source: .constant(.string(minFilter.rawValue)))),
-                .init(name: "mip_filter", dataType: SGDataType.string, connection: SGString(source: .constant(.string(mipFilter.rawValue)))),
-                .init(name: "max_anisotropy", dataType: SGDataType.int, connection: maxAnisotropy),
-                .init(name: "max_lod_clamp", dataType: SGDataType.float, connection: maxLodClamp),
-                .init(name: "min_lod_clamp", dataType: SGDataType.float, connection: minLodClamp),
-                .init(name: "default", dataType: SGDataType.color3f, connection: defaultValue),
-                .init(name: "texcoord", dataType: SGDataType.vector2f, connection: texcoord),
-                .init(name: "dynamic_min_lod_clamp", dataType: SGDataType.float, connection: dynamicMinLodClamp),
-                .init(name: "gradient_dPdx", dataType: SGDataType.vector2f, connection: gradientDpdx),
-                .init(name: "gradient_dPdy", dataType: SGDataType.vector2f, connection: gradientDpdy),
-                .init(name: "offset", dataType: SGDataType.vector2i, connection: offset),
+            nodeTypeID: 14, // ND_RealityKitTexture2DGradient_color3
+            inputs: [
+                .init(nameID: 27, dataType: SGDataType.asset, connection: file),
+                .init(nameID: 107, dataType: SGDataType.string, connection: SGString(source: .constant(.string(uWrapMode.rawValue)))),
+                .init(nameID: 120, dataType: SGDataType.string, connection: SGString(source: .constant(.string(vWrapMode.rawValue)))),
+                .init(nameID: 9, dataType: SGDataType.string, connection: SGString(source: .constant(.string(borderColor.rawValue)))),
+                .init(nameID: 67, dataType: SGDataType.string, connection: SGString(source: .constant(.string(magFilter.rawValue)))),
+                .init(nameID: 74, dataType: SGDataType.string, connection: SGString(source: .constant(.string(minFilter.rawValue)))),
+                .init(nameID: 76, dataType: SGDataType.string, connection: SGString(source: .constant(.string(mipFilter.rawValue)))),
+                .init(nameID: 70, dataType: SGDataType.int, connection: maxAnisotropy),
+                .init(nameID: 71, dataType: SGDataType.float, connection: maxLodClamp),
+                .init(nameID: 75, dataType: SGDataType.float, connection: minLodClamp),
+                .init(nameID: 16, dataType: SGDataType.color3f, connection: defaultValue),
+                .init(nameID: 104, dataType: SGDataType.vector2f, connection: texcoord),
+                .init(nameID: 21, dataType: SGDataType.float, connection: dynamicMinLodClamp),
+                .init(nameID: 36, dataType: SGDataType.vector2f, connection: gradientDpdx),
+                .init(nameID: 37, dataType: SGDataType.vector2f, connection: gradientDpdy),
+                .init(nameID: 84, dataType: SGDataType.vector2i, connection: offset),
             ],
             outputs: [.init(dataType: SGDataType.color3f)])))
     }
     if SGDataType.color4f.matches(defaultValue) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_RealityKitTexture2DGradient_color4",
-            inputs: [
-                .init(name: "file", dataType: SGDataType.asset, connection: file),
-                .init(name: "u_wrap_mode", dataType: SGDataType.string, connection: SGString(source: .constant(.string(uWrapMode.rawValue)))),
-                .init(name: "v_wrap_mode", dataType: SGDataType.string, connection: SGString(source: .constant(.string(vWrapMode.rawValue)))),
-                .init(name: "border_color", dataType: SGDataType.string, connection: SGString(source: .constant(.string(borderColor.rawValue)))),
-                .init(name: "mag_filter", dataType: SGDataType.string, connection: SGString(source: .constant(.string(magFilter.rawValue)))),
-                .init(name: "min_filter", dataType: SGDataType.string, connection: SGString(source: .constant(.string(minFilter.rawValue)))),
-                .init(name: "mip_filter", dataType: SGDataType.string, connection: SGString(source: .constant(.string(mipFilter.rawValue)))),
-                .init(name: "max_anisotropy", dataType: SGDataType.int, connection: maxAnisotropy),
-                .init(name: "max_lod_clamp", dataType: SGDataType.float, connection: maxLodClamp),
-                .init(name: "min_lod_clamp", dataType: SGDataType.float, connection: minLodClamp),
-                .init(name: "default", dataType: SGDataType.color4f, connection: defaultValue),
-                .init(name: "texcoord", dataType: SGDataType.vector2f, connection: texcoord),
-                .init(name: "dynamic_min_lod_clamp", dataType: SGDataType.float, connection: dynamicMinLodClamp),
-                .init(name: "gradient_dPdx", dataType: SGDataType.vector2f, connection: gradientDpdx),
-                .init(name: "gradient_dPdy", dataType: SGDataType.vector2f, connection: gradientDpdy),
-                .init(name: "offset", dataType: SGDataType.vector2i, connection: offset),
+            nodeTypeID: 15, // ND_RealityKitTexture2DGradient_color4
+            inputs: [
+                .init(nameID: 27, dataType: SGDataType.asset, connection: file),
+                .init(nameID: 107, dataType: SGDataType.string, connection: SGString(source: .constant(.string(uWrapMode.rawValue)))),
+                .init(nameID: 120, dataType: SGDataType.string, connection: SGString(source: .constant(.string(vWrapMode.rawValue)))),
+                .init(nameID: 9, dataType: SGDataType.string, connection: SGString(source: .constant(.string(borderColor.rawValue)))),
+                .init(nameID: 67, dataType: SGDataType.string, connection: SGString(source: .constant(.string(magFilter.rawValue)))),
+                .init(nameID: 74, dataType: SGDataType.string, connection: SGString(source: .constant(.string(minFilter.rawValue)))),
+                .init(nameID: 76, dataType: SGDataType.string, connection: SGString(source: .constant(.string(mipFilter.rawValue)))),
+                .init(nameID: 70, dataType: SGDataType.int, connection: maxAnisotropy),
+                .init(nameID: 71, dataType: SGDataType.float, connection: maxLodClamp),
+                .init(nameID: 75, dataType: SGDataType.float, connection: minLodClamp),
+                .init(nameID: 16, dataType: SGDataType.color4f, connection: defaultValue),
+                .init(nameID: 104, dataType: SGDataType.vector2f, connection: texcoord),
+                .init(nameID: 21, dataType: SGDataType.float, connection: dynamicMinLodClamp),
+                .init(nameID: 36, dataType: SGDataType.vector2f, connection: gradientDpdx),
+                .init(nameID: 37, dataType: SGDataType.vector2f, connection: gradientDpdy),
+                .init(nameID: 84, dataType: SGDataType.vector2i, connection: offset),
             ],
             outputs: [.init(dataType: SGDataType.color4f)])))
     }
     if SGDataType.vector4f.matches(defaultValue) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_RealityKitTexture2DGradient_vector4",
-            inputs: [
-                .init(name: "file", dataType: SGDataType.asset, connection: file),
-                .init(name: "u_wrap_mode", dataType: SGDataType.string, connection: SGString(source: .constant(.string(uWrapMode.rawValue)))),
-                .init(name: "v_wrap_mode", dataType: SGDataType.string, connection: SGString(source: .constant(.string(vWrapMode.rawValue)))),
-                .init(name: "border_color", dataType: SGDataType.string, connection: SGString(source: .constant(.string(borderColor.rawValue)))),
-                .init(name: "mag_filter", dataType: SGDataType.string, connection: SGString(source: .constant(.string(magFilter.rawValue)))),
-                .init(name: "min_filter", dataType: SGDataType.string, connection: SGString(source: .constant(.string(minFilter.rawValue)))),
-                .init(name: "mip_filter", dataType: SGDataType.string, connection: SGString(source: .constant(.string(mipFilter.rawValue)))),
-                .init(name: "max_anisotropy", dataType: SGDataType.int, connection: maxAnisotropy),
-                .init(name: "max_lod_clamp", dataType: SGDataType.float, connection: maxLodClamp),
-                .init(name: "min_lod_clamp", dataType: SGDataType.float, connection: minLodClamp),
-                .init(name: "default", dataType: SGDataType.vector4f, connection: defaultValue),
-                .init(name: "texcoord", dataType: SGDataType.vector2f, connection: texcoord),
-                .init(name: "dynamic_min_lod_clamp", dataType: SGDataType.float, connection: dynamicMinLodClamp),
-                .init(name: "gradient_dPdx", dataType: SGDataType.vector2f, connection: gradientDpdx),
-                .init(name: "gradient_dPdy", dataType: SGDataType.vector2f, connection: gradientDpdy),
-                .init(name: "offset", dataType: SGDataType.vector2i, connection: offset),
+            nodeTypeID: 16, // ND_RealityKitTexture2DGradient_vector4
+            inputs: [
+                .init(nameID: 27, dataType: SGDataType.asset, connection: file),
+                .init(nameID: 107, dataType: SGDataType.string, connection: SGString(source: .constant(.string(uWrapMode.rawValue)))),
+                .init(nameID: 120, dataType: SGDataType.string, connection: SGString(source: .constant(.string(vWrapMode.rawValue)))),
+                .init(nameID: 9, dataType: SGDataType.string, connection: SGString(source: .constant(.string(borderColor.rawValue)))),
+                .init(nameID: 67, dataType: SGDataType.string, connection: SGString(source: .constant(.string(magFilter.rawValue)))),
+                .init(nameID: 74, dataType: SGDataType.string, connection: SGString(source: .constant(.string(minFilter.rawValue)))),
+                .init(nameID: 76, dataType: SGDataType.string, connection: SGString(source: .constant(.string(mipFilter.rawValue)))),
+                .init(nameID: 70, dataType: SGDataType.int, connection: maxAnisotropy),
+                .init(nameID: 71, dataType: SGDataType.float, connection: maxLodClamp),
+                .init(nameID: 75, dataType: SGDataType.float, connection: minLodClamp),
+                .init(nameID: 16, dataType: SGDataType.vector4f, connection: defaultValue),
+                .init(nameID: 104, dataType: SGDataType.vector2f, connection: texcoord),
+                .init(nameID: 21, dataType: SGDataType.float, connection: dynamicMinLodClamp),
+                .init(nameID: 36, dataType: SGDataType.vector2f, connection: gradientDpdx),
+                .init(nameID: 37, dataType: SGDataType.vector2f, connection: gradientDpdy),
+                .init(nameID: 84, dataType: SGDataType.vector2i, connection: offset),
             ],
             outputs: [.init(dataType: SGDataType.vector4f)])))
     }
@@ -6394,64 +6394,64 @@ public func sampleLOD<T>(file: SGTexture, uWrapMode: SGSamplerAddressMode = SGSa
     }
     if SGDataType.color3f.matches(defaultValue) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_RealityKitTexture2DLOD_color3",
-            inputs: [
-                .init(name: "file", dataType: SGDataType.asset, connection: file),
-                .init(name: "u_wrap_mode", dataType: SGDataType.string, connection: SGString(source: .constant(.string(uWrapMode.rawValue)))),
-                .init(name: "v_wrap_mode", dataType: SGDataType.string, connection: SGString(source: .constant(.string(vWrapMode.rawValue)))),
-                .init(name: "border_color", dataType: SGDataType.string, connection: SGString(source: .constant(.string(borderColor.rawValue)))),
-                .init(name: "mag_filter", dataType: SGDataType.string, connection: SGString(source: .constant(.string(magFilter.rawValue)))),
-                .init(name: "min_filter", dataType: SGDataType.string, connection: SGString(source: .constant(.string(minFilter.rawValue)))),
-                .init(name: "mip_filter", dataType: SGDataType.string, connection: SGString(source: .constant(.string(mipFilter.rawValue)))),
-                .init(name: "max_anisotropy", dataType: SGDataType.int, connection: maxAnisotropy),
-                .init(name: "max_lod_clamp", dataType: SGDataType.float, connection: maxLodClamp),
-                .init(name: "min_lod_clamp", dataType: SGDataType.float, connection: minLodClamp),
-                .init(name: "default", dataType: SGDataType.color3f, connection: defaultValue),
-                .init(name: "texcoord", dataType: SGDataType.vector2f, connection: texcoord),
-                .init(name: "lod", dataType: SGDataType.float, connection: lod),
-                .init(name: "offset", dataType: SGDataType.vector2i, connection: offset),
+            nodeTypeID: 17, // ND_RealityKitTexture2DLOD_color3
+            inputs: [
+                .init(nameID: 27, dataType: SGDataType.asset, connection: file),
+                .init(nameID: 107, dataType: SGDataType.string, connection: SGString(source: .constant(.string(uWrapMode.rawValue)))),
+                .init(nameID: 120, dataType: SGDataType.string, connection: SGString(source: .constant(.string(vWrapMode.rawValue)))),
+                .init(nameID: 9, dataType: SGDataType.string, connection: SGString(source: .constant(.string(borderColor.rawValue)))),
+                .init(nameID: 67, dataType: SGDataType.string, connection: SGString(source: .constant(.string(magFilter.rawValue)))),
+                .init(nameID: 74, dataType: SGDataType.string, connection: SGString(source: .constant(.string(minFilter.rawValue)))),
+                .init(nameID: 76, dataType: SGDataType.string, connection: SGString(source: .constant(.string(mipFilter.rawValue)))),
+                .init(nameID: 70, dataType: SGDataType.int, connection: maxAnisotropy),
+                .init(nameID: 71, dataType: SGDataType.float, connection: maxLodClamp),
+                .init(nameID: 75, dataType: SGDataType.float, connection: minLodClamp),
+                .init(nameID: 16, dataType: SGDataType.color3f, connection: defaultValue),
+                .init(nameID: 104, dataType: SGDataType.vector2f, connection: texcoord),
+                .init(nameID: 64, dataType: SGDataType.float, connection: lod),
+                .init(nameID: 84, dataType: SGDataType.vector2i, connection: offset),
             ],
             outputs: [.init(dataType: SGDataType.color3f)])))
     }
     if SGDataType.color4f.matches(defaultValue) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_RealityKitTexture2DLOD_color4",
-            inputs: [
-                .init(name: "file", dataType: SGDataType.asset, connection: file),
-                .init(name: "u_wrap_mode", dataType: SGDataType.string, connection: SGString(source: .constant(.string(uWrapMode.rawValue)))),
-                .init(name: "v_wrap_mode", dataType: SGDataType.string, connection: SGString(source: .constant(.string(vWrapMode.rawValue)))),
-                .init(name: "border_color", dataType: SGDataType.string, connection: SGString(source: .constant(.string(borderColor.rawValue)))),
-                .init(name: "mag_filter", dataType: SGDataType.string, connection: SGString(source: .constant(.string(magFilter.rawValue)))),
-                .init(name: "min_filter", dataType: SGDataType.string, connection: SGString(source: .constant(.string(minFilter.rawValue)))),
-                .init(name: "mip_filter", dataType: SGDataType.string, connection: SGString(source: .constant(.string(mipFilter.rawValue)))),
-                .init(name: "max_anisotropy", dataType: SGDataType.int, connection: maxAnisotropy),
-                .init(name: "max_lod_clamp", dataType: SGDataType.float, connection: maxLodClamp),
-                .init(name: "min_lod_clamp", dataType: SGDataType.float, connection: minLodClamp),
-                .init(name: "default", dataType: SGDataType.color4f, connection: defaultValue),
-                .init(name: "texcoord", dataType: SGDataType.vector2f, connection: texcoord),
-                .init(name: "lod", dataType: SGDataType.float, connection: lod),
-                .init(name: "offset", dataType: SGDataType.vector2i, connection: offset),
+            nodeTypeID: 18, // ND_RealityKitTexture2DLOD_color4
+            inputs: [
+                .init(nameID: 27, dataType: SGDataType.asset, connection: file),
+                .init(nameID: 107, dataType: SGDataType.string, connection: SGString(source: .constant(.string(uWrapMode.rawValue)))),
+                .init(nameID: 120, dataType: SGDataType.string, connection: SGString(source: .constant(.string(vWrapMode.rawValue)))),
+                .init(nameID: 9, dataType: SGDataType.string, connection: SGString(source: .constant(.string(borderColor.rawValue)))),
+                .init(nameID: 67, dataType: SGDataType.string, connection: SGString(source: .constant(.string(magFilter.rawValue)))),
+                .init(nameID: 74, dataType: SGDataType.string, connection: SGString(source: .constant(.string(minFilter.rawValue)))),
+                .init(nameID: 76, dataType: SGDataType.string, connection: SGString(source: .constant(.string(mipFilter.rawValue)))),
+                .init(nameID: 70, dataType: SGDataType.int, connection: maxAnisotropy),
+                .init(nameID: 71, dataType: SGDataType.float, connection: maxLodClamp),
+                .init(nameID: 75, dataType: SGDataType.float, connection: minLodClamp),
+                .init(nameID: 16, dataType: SGDataType.color4f, connection: defaultValue),
+                .init(nameID: 104, dataType: SGDataType.vector2f, connection: texcoord),
+                .init(nameID: 64, dataType: SGDataType.float, connection: lod),
+                .init(nameID: 84, dataType: SGDataType.vector2i, connection: offset),
             ],
             outputs: [.init(dataType: SGDataType.color4f)])))
     }
     if SGDataType.vector4f.matches(defaultValue) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_RealityKitTexture2DLOD_vector4",
-            inputs: [
-                .init(name: "file", dataType: SGDataType.asset, connection: file),
-                .init(name: "u_wrap_mode", dataType: SGDataType.string, connection: SGString(source: .constant(.string(uWrapMode.rawValue)))),
-                .init(name: "v_wrap_mode", dataType: SGDataType.string, connection: SGString(source: .constant(.string(vWrapMode.rawValue)))),
-                .init(name: "border_color", dataType: SGDataType.string, connection: SGString(source: .constant(.string(borderColor.rawValue)))),
-                .init(name: "mag_filter", dataType: SGDataType.string, connection: SGString(source: .constant(.string(magFilter.rawValue)))),
-                .init(name: "min_filter", dataType: SGDataType.string, connection: SGString(source: .constant(.string(minFilter.rawValue)))),
-                .init(name: "mip_filter", dataType: SGDataType.string, connection: SGString(source: .constant(.string(mipFilter.rawValue)))),
-                .init(name: "max_anisotropy", dataType: SGDataType.int, connection: maxAnisotropy),
-                .init(name: "max_lod_clamp", dataType: SGDataType.float, connection: maxLodClamp),
-                .init(name: "min_lod_clamp", dataType: SGDataType.float, connection: minLodClamp),
-                .init(name: "default", dataType: SGDataType.vector4f, connection: defaultValue),
-                .init(name: "texcoord", dataType: SGDataType.vector2f, connection: texcoord),
-                .init(name: "lod", dataType: SGDataType.float, connection: lod),
-                .init(name: "offset", dataType: SGDataType.vector2i, connection: offset),
+            nodeTypeID: 19, // ND_RealityKitTexture2DLOD_vector4
+            inputs: [
+                .init(nameID: 27, dataType: SGDataType.asset, connection: file),
+                .init(nameID: 107, dataType: SGDataType.string, connection: SGString(source: .constant(.string(uWrapMode.rawValue)))),
+                .init(nameID: 120, dataType: SGDataType.string, connection: SGString(source: .constant(.string(vWrapMode.rawValue)))),
+                .init(nameID: 9, dataType: SGDataType.string, connection: SGString(source: .constant(.string(borderColor.rawValue)))),
+                .init(nameID: 67, dataType: SGDataType.string, connection: SGString(source: .constant(.string(magFilter.rawValue)))),
+                .init(nameID: 74, dataType: SGDataType.string, connection: SGString(source: .constant(.string(minFilter.rawValue)))),
+                .init(nameID: 76, dataType: SGDataType.string, connection: SGString(source: .constant(.string(mipFilter.rawValue)))),
+                .init(nameID: 70, dataType: SGDataType.int, connection: maxAnisotropy),
+                .init(nameID: 71, dataType: SGDataType.float, connection: maxLodClamp),
+                .init(nameID: 75, dataType: SGDataType.float, connection: minLodClamp),
+                .init(nameID: 16, dataType: SGDataType.vector4f, connection: defaultValue),
+                .init(nameID: 104, dataType: SGDataType.vector2f, connection: texcoord),
+                .init(nameID: 64, dataType: SGDataType.float, connection: lod),
+                .init(nameID: 84, dataType: SGDataType.vector2i, connection: offset),
             ],
             outputs: [.init(dataType: SGDataType.vector4f)])))
     }
@@ -6467,21 +6467,21 @@ public func saturate(_ in1: SGColor, amount: SGScalar? = nil, lumacoeffs: SGColo
     }
     if SGDataType.color3f.matches(in1) {
         return SGColor(source: .nodeOutput(SGNode(
-            nodeType: "ND_saturate_color3",
+            nodeTypeID: 781, // ND_saturate_color3
             inputs: [
-                .init(name: "in", dataType: SGDataType.color3f, connection: in1),
-                .init(name: "amount", dataType: SGDataType.float, connection: amount),
-                .init(name: "lumacoeffs", dataType: SGDataType.color3f, connection: lumacoeffs),
+                .init(nameID: 42, dataType: SGDataType.color3f, connection: in1),
+                .init(nameID: 1, dataType: SGDataType.float, connection: amount),
+                .init(nameID: 66, dataType: SGDataType.color3f, connection: lumacoeffs),
             ],
             outputs: [.init(dataType: SGDataType.color3f)])))
     }
     if SGDataType.color4f.matches(in1) {
         return SGColor(source: .nodeOutput(SGNode(
-            nodeType: "ND_saturate_color4",
+            nodeTypeID: 782, // ND_saturate_color4
             inputs: [
-                .init(name: "in", dataType: SGDataType.color4f, connection: in1),
-                .init(name: "amount", dataType: SGDataType.float, connection: amount),
-                .init(name: "lumacoeffs", dataType: SGDataType.color3f, connection: lumacoeffs),
+                .init(nameID: 42, dataType: SGDataType.color4f, connection: in1),
+                .init(nameID: 1, dataType: SGDataType.float, connection: amount),
+                .init(nameID: 66, dataType: SGDataType.color3f, connection: lumacoeffs),
             ],
             outputs: [.init(dataType: SGDataType.color4f)])))
     }
@@ -6491,41 +6491,41 @@ public func saturate(_ in1: SGColor, amount: SGScalar? = nil, lumacoeffs: SGColo
 public func screen<T>(fg: T, bg: T, mix: SGScalar? = nil) -> T where T: SGNumeric {
     if SGDataType.color3f.matches(fg) && SGDataType.color3f.matches(bg) && SGDataType.float.matches(mix) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_screen_color3",
+            nodeTypeID: 783, // ND_screen_color3
             inputs: [
-                .init(name: "fg", dataType: SGDataType.color3f, connection: fg),
-                .init(name: "bg", dataType: SGDataType.color3f, connection: bg),
-                .init(name: "mix", dataType: SGDataType.float, connection: mix),
+                .init(nameID: 26, dataType: SGDataType.color3f, connection: fg),
+                .init(nameID: 6, dataType: SGDataType.color3f, connection: bg),
+                .init(nameID: 77, dataType: SGDataType.float, connection: mix),
             ],
             outputs: [.init(dataType: SGDataType.color3f)])))
     }
     if SGDataType.color4f.matches(fg) && SGDataType.color4f.matches(bg) && SGDataType.float.matches(mix) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_screen_color4",
+            nodeTypeID: 784, // ND_screen_color4
             inputs: [
-                .init(name: "fg", dataType: SGDataType.color4f, connection: fg),
-                .init(name: "bg", dataType: SGDataType.color4f, connection: bg),
-                .init(name: "mix", dataType: SGDataType.float, connection: mix),
+                .init(nameID: 26, dataType: SGDataType.color4f, connection: fg),
+                .init(nameID: 6, dataType: SGDataType.color4f, connection: bg),
+                .init(nameID: 77, dataType: SGDataType.float, connection: mix),
             ],
             outputs: [.init(dataType: SGDataType.color4f)])))
     }
     if SGDataType.float.matches(fg) && SGDataType.float.matches(bg) && SGDataType.float.matches(mix) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_screen_float",
+            nodeTypeID: 785, // ND_screen_float
             inputs: [
-                .init(name: "fg", dataType: SGDataType.float, connection: fg),
-                .init(name: "bg", dataType: SGDataType.float, connection: bg),
-                .init(name: "mix", dataType: SGDataType.float, connection: mix),
+                .init(nameID: 26, dataType: SGDataType.float, connection: fg),
+                .init(nameID: 6, dataType: SGDataType.float, connection: bg),
+                .init(nameID: 77, dataType: SGDataType.float, connection: mix),
             ],
             outputs: [.init(dataType: SGDataType.float)])))
     }
     if SGDataType.half.matches(fg) && SGDataType.half.matches(bg) && SGDataType.half.matches(mix) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_screen_half",
+            nodeTypeID: 786, // ND_screen_half
             inputs: [
-                .init(name: "fg", dataType: SGDataType.half, connection: fg),
-                .init(name: "bg", dataType: SGDataType.half, connection: bg),
-                .init(name: "mix", dataType: SGDataType.half, connection: mix),
+                .init(nameID: 26, dataType: SGDataType.half, connection: fg),
+                .init(nameID: 6, dataType: SGDataType.half, connection: bg),
+                .init(nameID: 77, dataType: SGDataType.half, connection: mix),
             ],
             outputs: [.init(dataType: SGDataType.half)])))
     }
@@ -6535,81 +6535,81 @@ public func screen<T>(fg: T, bg: T, mix: SGScalar? = nil) -> T where T: SGNumeri
 public func sign<T>(_ in1: T) -> T where T: SGNumeric {
     if SGDataType.color3f.matches(in1) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_sign_color3",
+            nodeTypeID: 795, // ND_sign_color3
             inputs: [
-                .init(name: "in", dataType: SGDataType.color3f, connection: in1),
+                .init(nameID: 42, dataType: SGDataType.color3f, connection: in1),
             ],
             outputs: [.init(dataType: SGDataType.color3f)])))
     }
     if SGDataType.color4f.matches(in1) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_sign_color4",
+            nodeTypeID: 796, // ND_sign_color4
             inputs: [
-                .init(name: "in", dataType: SGDataType.color4f, connection: in1),
+                .init(nameID: 42, dataType: SGDataType.color4f, connection: in1),
             ],
             outputs: [.init(dataType: SGDataType.color4f)])))
     }
     if SGDataType.float.matches(in1) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_sign_float",
+            nodeTypeID: 797, // ND_sign_float
             inputs: [
-                .init(name: "in", dataType: SGDataType.float, connection: in1),
+                .init(nameID: 42, dataType: SGDataType.float, connection: in1),
             ],
             outputs: [.init(dataType: SGDataType.float)])))
     }
     if SGDataType.half.matches(in1) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_sign_half",
+            nodeTypeID: 798, // ND_sign_half
             inputs: [
-                .init(name: "in", dataType: SGDataType.half, connection: in1),
+                .init(nameID: 42, dataType: SGDataType.half, connection: in1),
             ],
             outputs: [.init(dataType: SGDataType.half)])))
     }
     if SGDataType.vector2h.matches(in1) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_sign_half2",
+            nodeTypeID: 799, // ND_sign_half2
             inputs: [
-                .init(name: "in", dataType: SGDataType.vector2h, connection: in1),
+                .init(nameID: 42, dataType: SGDataType.vector2h, connection: in1),
             ],
             outputs: [.init(dataType: SGDataType.vector2h)])))
     }
     if SGDataType.vector3h.matches(in1) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_sign_half3",
+            nodeTypeID: 800, // ND_sign_half3
             inputs: [
-                .init(name: "in", dataType: SGDataType.vector3h, connection: in1),
+                .init(nameID: 42, dataType: SGDataType.vector3h, connection: in1),
             ],
             outputs: [.init(dataType: SGDataType.vector3h)])))
     }
     if SGDataType.vector4h.matches(in1) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_sign_half4",
+            nodeTypeID: 801, // ND_sign_half4
             inputs: [
-                .init(name: "in", dataType: SGDataType.vector4h, connection: in1),
+                .init(nameID: 42, dataType: SGDataType.vector4h, connection: in1),
             ],
             outputs: [.init(dataType: SGDataType.vector4h)])))
     }
     if SGDataType.vector2f.matches(in1) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_sign_vector2",
+            nodeTypeID: 802, // ND_sign_vector2
             inputs: [
-                .init(name: "in", dataType: SGDataType.vector2f, connection: in1),
+                .init(nameID: 42, dataType: SGDataType.vector2f, connection: in1),
             ],
             outputs: [.init(dataType: SGDataType.vector2f)])))
     }
     if SGDataType.vector3f.matches(in1) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_sign_vector3",
+            nodeTypeID: 803, // ND_sign_vector3
             inputs: [
-                .init(name: "in", dataType: SGDataType.vector3f, connection: in1),
+                .init(nameID: 42, dataType: SGDataType.vector3f, connection: in1),
             ],
             outputs: [.init(dataType: SGDataType.vector3f)])))
     }
     if SGDataType.vector4f.matches(in1) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_sign_vector4",
+            nodeTypeID: 804, // ND_sign_vector4
             inputs: [
-                .init(name: "in", dataType: SGDataType.vector4f, connection: in1),
+                .init(nameID: 42, dataType: SGDataType.vector4f, connection: in1),
             ],
             outputs: [.init(dataType: SGDataType.vector4f)])))
     }
@@ -6619,65 +6619,65 @@ public func sign<T>(_ in1: T) -> T where T: SGNumeric {
 public func sin<T>(_ in1: T) -> T where T: SGNumeric {
     if SGDataType.float.matches(in1) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_sin_float",
+            nodeTypeID: 805, // ND_sin_float
             inputs: [
-                .init(name: "in", dataType: SGDataType.float, connection: in1),
+                .init(nameID: 42, dataType: SGDataType.float, connection: in1),
             ],
             outputs: [.init(dataType: SGDataType.float)])))
     }
     if SGDataType.half.matches(in1) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_sin_half",
+            nodeTypeID: 806, // ND_sin_half
             inputs: [
-                .init(name: "in", dataType: SGDataType.half, connection: in1),
+                .init(nameID: 42, dataType: SGDataType.half, connection: in1),
             ],
             outputs: [.init(dataType: SGDataType.half)])))
     }
     if SGDataType.vector2h.matches(in1) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_sin_half2",
+            nodeTypeID: 807, // ND_sin_half2
             inputs: [
-                .init(name: "in", dataType: SGDataType.vector2h, connection: in1),
+                .init(nameID: 42, dataType: SGDataType.vector2h, connection: in1),
             ],
             outputs: [.init(dataType: SGDataType.vector2h)])))
     }
     if SGDataType.vector3h.matches(in1) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_sin_half3",
+            nodeTypeID: 808, // ND_sin_half3
             inputs: [
-                .init(name: "in", dataType: SGDataType.vector3h, connection: in1),
+                .init(nameID: 42, dataType: SGDataType.vector3h, connection: in1),
             ],
             outputs: [.init(dataType: SGDataType.vector3h)])))
     }
     if SGDataType.vector4h.matches(in1) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_sin_half4",
+            nodeTypeID: 809, // ND_sin_half4
             inputs: [
-                .init(name: "in", dataType: SGDataType.vector4h, connection: in1),
+                .init(nameID: 42, dataType: SGDataType.vector4h, connection: in1),
             ],
             outputs: [.init(dataType: SGDataType.vector4h)])))
     }
     if SGDataType.vector2f.matches(in1) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_sin_vector2",
+            nodeTypeID: 810, // ND_sin_vector2
             inputs: [
-                .init(name: "in", dataType: SGDataType.vector2f, connection: in1),
+                .init(nameID: 42, dataType: SGDataType.vector2f, connection: in1),
             ],
             outputs: [.init(dataType: SGDataType.vector2f)])))
     }
     if SGDataType.vector3f.matches(in1) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_sin_vector3",
+            nodeTypeID: 811, // ND_sin_vector3
             inputs: [
-                .init(name: "in", dataType: SGDataType.vector3f, connection: in1),
+                .init(nameID: 42, dataType: SGDataType.vector3f, connection: in1),
             ],
             outputs: [.init(dataType: SGDataType.vector3f)])))
     }
     if SGDataType.vector4f.matches(in1) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_sin_vector4",
+            nodeTypeID: 812, // ND_sin_vector4
             inputs: [
-                .init(name: "in", dataType: SGDataType.vector4f, connection: in1),
+                .init(nameID: 42, dataType: SGDataType.vector4f, connection: in1),
             ],
             outputs: [.init(dataType: SGDataType.vector4f)])))
     }
@@ -6687,181 +6687,181 @@ public func sin<T>(_ in1: T) -> T where T: SGNumeric {
 public func smoothStep<T>(_ in1: T, low: SGNumeric, high: SGNumeric) -> T where T: SGNumeric {
     if SGDataType.color3f.matches(in1) && SGDataType.color3f.matches(low) && SGDataType.color3f.matches(high) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_smoothstep_color3",
+            nodeTypeID: 813, // ND_smoothstep_color3
             inputs: [
-                .init(name: "in", dataType: SGDataType.color3f, connection: in1),
-                .init(name: "low", dataType: SGDataType.color3f, connection: low),
-                .init(name: "high", dataType: SGDataType.color3f, connection: high),
+                .init(nameID: 42, dataType: SGDataType.color3f, connection: in1),
+                .init(nameID: 65, dataType: SGDataType.color3f, connection: low),
+                .init(nameID: 41, dataType: SGDataType.color3f, connection: high),
             ],
             outputs: [.init(dataType: SGDataType.color3f)])))
     }
     if SGDataType.color3f.matches(in1) && SGDataType.float.matches(low) && SGDataType.float.matches(high) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_smoothstep_color3FA",
+            nodeTypeID: 814, // ND_smoothstep_color3FA
             inputs: [
-                .init(name: "in", dataType: SGDataType.color3f, connection: in1),
-                .init(name: "low", dataType: SGDataType.float, connection: low),
-                .init(name: "high", dataType: SGDataType.float, connection: high),
+                .init(nameID: 42, dataType: SGDataType.color3f, connection: in1),
+                .init(nameID: 65, dataType: SGDataType.float, connection: low),
+                .init(nameID: 41, dataType: SGDataType.float, connection: high),
             ],
             outputs: [.init(dataType: SGDataType.color3f)])))
     }
     if SGDataType.color4f.matches(in1) && SGDataType.color4f.matches(low) && SGDataType.color4f.matches(high) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_smoothstep_color4",
+            nodeTypeID: 815, // ND_smoothstep_color4
             inputs: [
-                .init(name: "in", dataType: SGDataType.color4f, connection: in1),
-                .init(name: "low", dataType: SGDataType.color4f, connection: low),
-                .init(name: "high", dataType: SGDataType.color4f, connection: high),
+                .init(nameID: 42, dataType: SGDataType.color4f, connection: in1),
+                .init(nameID: 65, dataType: SGDataType.color4f, connection: low),
+                .init(nameID: 41, dataType: SGDataType.color4f, connection: high),
             ],
             outputs: [.init(dataType: SGDataType.color4f)])))
     }
     if SGDataType.color4f.matches(in1) && SGDataType.float.matches(low) && SGDataType.float.matches(high) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_smoothstep_color4FA",
+            nodeTypeID: 816, // ND_smoothstep_color4FA
             inputs: [
-                .init(name: "in", dataType: SGDataType.color4f, connection: in1),
-                .init(name: "low", dataType: SGDataType.float, connection: low),
-                .init(name: "high", dataType: SGDataType.float, connection: high),
+                .init(nameID: 42, dataType: SGDataType.color4f, connection: in1),
+                .init(nameID: 65, dataType: SGDataType.float, connection: low),
+                .init(nameID: 41, dataType: SGDataType.float, connection: high),
             ],
             outputs: [.init(dataType: SGDataType.color4f)])))
     }
     if SGDataType.float.matches(in1) && SGDataType.float.matches(low) && SGDataType.float.matches(high) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_smoothstep_float",
+            nodeTypeID: 817, // ND_smoothstep_float
             inputs: [
-                .init(name: "in", dataType: SGDataType.float, connection: in1),
-                .init(name: "low", dataType: SGDataType.float, connection: low),
-                .init(name: "high", dataType: SGDataType.float, connection: high),
+                .init(nameID: 42, dataType: SGDataType.float, connection: in1),
+                .init(nameID: 65, dataType: SGDataType.float, connection: low),
+                .init(nameID: 41, dataType: SGDataType.float, connection: high),
             ],
             outputs: [.init(dataType: SGDataType.float)])))
     }
     if SGDataType.half.matches(in1) && SGDataType.half.matches(low) && SGDataType.half.matches(high) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_smoothstep_half",
+            nodeTypeID: 818, // ND_smoothstep_half
             inputs: [
-                .init(name: "in", dataType: SGDataType.half, connection: in1),
-                .init(name: "low", dataType: SGDataType.half, connection: low),
-                .init(name: "high", dataType: SGDataType.half, connection: high),
+                .init(nameID: 42, dataType: SGDataType.half, connection: in1),
+                .init(nameID: 65, dataType: SGDataType.half, connection: low),
+                .init(nameID: 41, dataType: SGDataType.half, connection: high),
             ],
             outputs: [.init(dataType: SGDataType.half)])))
     }
     if SGDataType.vector2h.matches(in1) && SGDataType.vector2h.matches(low) && SGDataType.vector2h.matches(high) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_smoothstep_half2",
+            nodeTypeID: 819, // ND_smoothstep_half2
             inputs: [
-                .init(name: "in", dataType: SGDataType.vector2h, connection: in1),
-                .init(name: "low", dataType: SGDataType.vector2h, connection: low),
-                .init(name: "high", dataType: SGDataType.vector2h, connection: high),
+                .init(nameID: 42, dataType: SGDataType.vector2h, connection: in1),
+                .init(nameID: 65, dataType: SGDataType.vector2h, connection: low),
+                .init(nameID: 41, dataType: SGDataType.vector2h, connection: high),
             ],
             outputs: [.init(dataType: SGDataType.vector2h)])))
     }
     if SGDataType.vector2h.matches(in1) && SGDataType.float.matches(low) && SGDataType.float.matches(high) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_smoothstep_half2FA",
+            nodeTypeID: 820, // ND_smoothstep_half2FA
             inputs: [
-                .init(name: "in", dataType: SGDataType.vector2h, connection: in1),
-                .init(name: "low", dataType: SGDataType.float, connection: low),
-                .init(name: "high", dataType: SGDataType.float, connection: high),
+                .init(nameID: 42, dataType: SGDataType.vector2h, connection: in1),
+                .init(nameID: 65, dataType: SGDataType.float, connection: low),
+                .init(nameID: 41, dataType: SGDataType.float, connection: high),
             ],
             outputs: [.init(dataType: SGDataType.vector2h)])))
     }
     if SGDataType.vector3h.matches(in1) && SGDataType.vector3h.matches(low) && SGDataType.vector3h.matches(high) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_smoothstep_half3",
+            nodeTypeID: 821, // ND_smoothstep_half3
             inputs: [
-                .init(name: "in", dataType: SGDataType.vector3h, connection: in1),
-                .init(name: "low", dataType: SGDataType.vector3h, connection: low),
-                .init(name: "high", dataType: SGDataType.vector3h, connection: high),
+                .init(nameID: 42, dataType: SGDataType.vector3h, connection: in1),
+                .init(nameID: 65, dataType: SGDataType.vector3h, connection: low),
+                .init(nameID: 41, dataType: SGDataType.vector3h, connection: high),
             ],
             outputs: [.init(dataType: SGDataType.vector3h)])))
     }
     if SGDataType.vector3h.matches(in1) && SGDataType.float.matches(low) && SGDataType.float.matches(high) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_smoothstep_half3FA",
+            nodeTypeID: 822, // ND_smoothstep_half3FA
             inputs: [
-                .init(name: "in", dataType: SGDataType.vector3h, connection: in1),
-                .init(name: "low", dataType: SGDataType.float, connection: low),
-                .init(name: "high", dataType: SGDataType.float, connection: high),
+                .init(nameID: 42, dataType: SGDataType.vector3h, connection: in1),
+                .init(nameID: 65, dataType: SGDataType.float, connection: low),
+                .init(nameID: 41, dataType: SGDataType.float, connection: high),
             ],
             outputs: [.init(dataType: SGDataType.vector3h)])))
     }
     if SGDataType.vector4h.matches(in1) && SGDataType.vector4h.matches(low) && SGDataType.vector4h.matches(high) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_smoothstep_half4",
+            nodeTypeID: 823, // ND_smoothstep_half4
             inputs: [
-                .init(name: "in", dataType: SGDataType.vector4h, connection: in1),
-                .init(name: "low", dataType: SGDataType.vector4h, connection: low),
-                .init(name: "high", dataType: SGDataType.vector4h, connection: high),
+                .init(nameID: 42, dataType: SGDataType.vector4h, connection: in1),
+                .init(nameID: 65, dataType: SGDataType.vector4h, connection: low),
+                .init(nameID: 41, dataType: SGDataType.vector4h, connection: high),
             ],
             outputs: [.init(dataType: SGDataType.vector4h)])))
     }
     if SGDataType.vector4h.matches(in1) && SGDataType.float.matches(low) && SGDataType.float.matches(high) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_smoothstep_half4FA",
+            nodeTypeID: 824, // ND_smoothstep_half4FA
             inputs: [
-                .init(name: "in", dataType: SGDataType.vector4h, connection: in1),
-                .init(name: "low", dataType: SGDataType.float, connection: low),
-                .init(name: "high", dataType: SGDataType.float, connection: high),
+                .init(nameID: 42, dataType: SGDataType.vector4h, connection: in1),
+                .init(nameID: 65, dataType: SGDataType.float, connection: low),
+                .init(nameID: 41, dataType: SGDataType.float, connection: high),
             ],
             outputs: [.init(dataType: SGDataType.vector4h)])))
     }
     if SGDataType.vector2f.matches(in1) && SGDataType.vector2f.matches(low) && SGDataType.vector2f.matches(high) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_smoothstep_vector2",
+            nodeTypeID: 825, // ND_smoothstep_vector2
             inputs: [
-                .init(name: "in", dataType: SGDataType.vector2f, connection: in1),
-                .init(name: "low", dataType: SGDataType.vector2f, connection: low),
-                .init(name: "high", dataType: SGDataType.vector2f, connection: high),
+                .init(nameID: 42, dataType: SGDataType.vector2f, connection: in1),
+                .init(nameID: 65, dataType: SGDataType.vector2f, connection: low),
+                .init(nameID: 41, dataType: SGDataType.vector2f, connection: high),
             ],
             outputs: [.init(dataType: SGDataType.vector2f)])))
     }
     if SGDataType.vector2f.matches(in1) && SGDataType.float.matches(low) && SGDataType.float.matches(high) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_smoothstep_vector2FA",
+            nodeTypeID: 826, // ND_smoothstep_vector2FA
             inputs: [
-                .init(name: "in", dataType: SGDataType.vector2f, connection: in1),
-                .init(name: "low", dataType: SGDataType.float, connection: low),
-                .init(name: "high", dataType: SGDataType.float, connection: high),
+                .init(nameID: 42, dataType: SGDataType.vector2f, connection: in1),
+                .init(nameID: 65, dataType: SGDataType.float, connection: low),
+                .init(nameID: 41, dataType: SGDataType.float, connection: high),
             ],
             outputs: [.init(dataType: SGDataType.vector2f)])))
     }
     if SGDataType.vector3f.matches(in1) && SGDataType.vector3f.matches(low) && SGDataType.vector3f.matches(high) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_smoothstep_vector3",
+            nodeTypeID: 827, // ND_smoothstep_vector3
             inputs: [
-                .init(name: "in", dataType: SGDataType.vector3f, connection: in1),
-                .init(name: "low", dataType: SGDataType.vector3f, connection: low),
-                .init(name: "high", dataType: SGDataType.vector3f, connection: high),
+                .init(nameID: 42, dataType: SGDataType.vector3f, connection: in1),
+                .init(nameID: 65, dataType: SGDataType.vector3f, connection: low),
+                .init(nameID: 41, dataType: SGDataType.vector3f, connection: high),
             ],
             outputs: [.init(dataType: SGDataType.vector3f)])))
     }
     if SGDataType.vector3f.matches(in1) && SGDataType.float.matches(low) && SGDataType.float.matches(high) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_smoothstep_vector3FA",
+            nodeTypeID: 828, // ND_smoothstep_vector3FA
             inputs: [
-                .init(name: "in", dataType: SGDataType.vector3f, connection: in1),
-                .init(name: "low", dataType: SGDataType.float, connection: low),
-                .init(name: "high", dataType: SGDataType.float, connection: high),
+                .init(nameID: 42, dataType: SGDataType.vector3f, connection: in1),
+                .init(nameID: 65, dataType: SGDataType.float, connection: low),
+                .init(nameID: 41, dataType: SGDataType.float, connection: high),
             ],
             outputs: [.init(dataType: SGDataType.vector3f)])))
     }
     if SGDataType.vector4f.matches(in1) && SGDataType.vector4f.matches(low) && SGDataType.vector4f.matches(high) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_smoothstep_vector4",
+            nodeTypeID: 829, // ND_smoothstep_vector4
             inputs: [
-                .init(name: "in", dataType: SGDataType.vector4f, connection: in1),
-                .init(name: "low", dataType: SGDataType.vector4f, connection: low),
-                .init(name: "high", dataType: SGDataType.vector4f, connection: high),
+                .init(nameID: 42, dataType: SGDataType.vector4f, connection: in1),
+                .init(nameID: 65, dataType: SGDataType.vector4f, connection: low),
+                .init(nameID: 41, dataType: SGDataType.vector4f, connection: high),
             ],
             outputs: [.init(dataType: SGDataType.vector4f)])))
     }
     if SGDataType.vector4f.matches(in1) && SGDataType.float.matches(low) && SGDataType.float.matches(high) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_smoothstep_vector4FA",
+            nodeTypeID: 830, // ND_smoothstep_vector4FA
             inputs: [
-                .init(name: "in", dataType: SGDataType.vector4f, connection: in1),
-                .init(name: "low", dataType: SGDataType.float, connection: low),
-                .init(name: "high", dataType: SGDataType.float, connection: high),
+                .init(nameID: 42, dataType: SGDataType.vector4f, connection: in1),
+                .init(nameID: 65, dataType: SGDataType.float, connection: low),
+                .init(nameID: 41, dataType: SGDataType.float, connection: high),
             ],
             outputs: [.init(dataType: SGDataType.vector4f)])))
     }
@@ -6877,78 +6877,78 @@ public func splitlr<T>(valuel: T, valuer: T, center: SGScalar? = nil, texcoord:
     }
     if SGDataType.color3f.matches(valuel) && SGDataType.color3f.matches(valuer) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_splitlr_color3",
+            nodeTypeID: 831, // ND_splitlr_color3
             inputs: [
-                .init(name: "valuel", dataType: SGDataType.color3f, connection: valuel),
-                .init(name: "valuer", dataType: SGDataType.color3f, connection: valuer),
-                .init(name: "center", dataType: SGDataType.float, connection: center),
-                .init(name: "texcoord", dataType: SGDataType.vector2f, connection: texcoord),
+                .init(nameID: 128, dataType: SGDataType.color3f, connection: valuel),
+                .init(nameID: 129, dataType: SGDataType.color3f, connection: valuer),
+                .init(nameID: 10, dataType: SGDataType.float, connection: center),
+                .init(nameID: 104, dataType: SGDataType.vector2f, connection: texcoord),
             ],
             outputs: [.init(dataType: SGDataType.color3f)])))
     }
     if SGDataType.color4f.matches(valuel) && SGDataType.color4f.matches(valuer) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_splitlr_color4",
+            nodeTypeID: 832, // ND_splitlr_color4
             inputs: [
-                .init(name: "valuel", dataType: SGDataType.color4f, connection: valuel),
-                .init(name: "valuer", dataType: SGDataType.color4f, connection: valuer),
-                .init(name: "center", dataType: SGDataType.float, connection: center),
-                .init(name: "texcoord", dataType: SGDataType.vector2f, connection: texcoord),
+                .init(nameID: 128, dataType: SGDataType.color4f, connection: valuel),
+                .init(nameID: 129, dataType: SGDataType.color4f, connection: valuer),
+                .init(nameID: 10, dataType: SGDataType.float, connection: center),
+                .init(nameID: 104, dataType: SGDataType.vector2f, connection: texcoord),
             ],
             outputs: [.init(dataType: SGDataType.color4f)])))
     }
     if SGDataType.float.matches(valuel) && SGDataType.float.matches(valuer) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_splitlr_float",
+            nodeTypeID: 833, // ND_splitlr_float
             inputs: [
-                .init(name: "valuel", dataType: SGDataType.float, connection: valuel),
-                .init(name: "valuer", dataType: SGDataType.float, connection: valuer),
-                .init(name: "center", dataType: SGDataType.float, connection: center),
-                .init(name: "texcoord", dataType: SGDataType.vector2f, connection: texcoord),
+                .init(nameID: 128, dataType: SGDataType.float, connection: valuel),
+                .init(nameID: 129, dataType: SGDataType.float, connection: valuer),
+                .init(nameID: 10, dataType: SGDataType.float, connection: center),
+                .init(nameID: 104, dataType: SGDataType.vector2f, connection: texcoord),
             ],
             outputs: [.init(dataType: SGDataType.float)])))
     }
     if SGDataType.half.matches(valuel) && SGDataType.half.matches(valuer) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_splitlr_half",
+            nodeTypeID: 834, // ND_splitlr_half
             inputs: [
-                .init(name: "valuel", dataType: SGDataType.half, connection: valuel),
-                .init(name: "valuer", dataType: SGDataType.half, connection: valuer),
-                .init(name: "center", dataType: SGDataType.float, connection: center),
-                .init(name: "texcoord", dataType: SGDataType.vector2f, connection: texcoord),
+                .init(nameID: 128, dataType: SGDataType.half, connection: valuel),
+                .init(nameID: 129, dataType: SGDataType.half, connection: valuer),
+                .init(nameID: 10, dataType: SGDataType.float, connection: center),
+                .init(nameID: 104, dataType: SGDataType.vector2f, connection: texcoord),
             ],
             outputs: [.init(dataType: SGDataType.half)])))
     }
     if SGDataType.vector2f.matches(valuel) && SGDataType.vector2f.matches(valuer) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_splitlr_vector2",
+            nodeTypeID: 835, // ND_splitlr_vector2
             inputs: [
-                .init(name: "valuel", dataType: SGDataType.vector2f, connection: valuel),
-                .init(name: "valuer", dataType: SGDataType.vector2f, connection: valuer),
-                .init(name: "center", dataType: SGDataType.float, connection: center),
-                .init(name: "texcoord", dataType: SGDataType.vector2f, connection: texcoord),
+                .init(nameID: 128, dataType: SGDataType.vector2f, connection: valuel),
+                .init(nameID: 129, dataType: SGDataType.vector2f, connection: valuer),
+                .init(nameID: 10, dataType: SGDataType.float, connection: center),
+                .init(nameID: 104, dataType: SGDataType.vector2f, connection: texcoord),
             ],
             outputs: [.init(dataType: SGDataType.vector2f)])))
     }
     if SGDataType.vector3f.matches(valuel) && SGDataType.vector3f.matches(valuer) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_splitlr_vector3",
+            nodeTypeID: 836, // ND_splitlr_vector3
             inputs: [
-                .init(name: "valuel", dataType: SGDataType.vector3f, connection: valuel),
-                .init(name: "valuer", dataType: SGDataType.vector3f, connection: valuer),
-                .init(name: "center", dataType: SGDataType.float, connection: center),
-                .init(name: "texcoord", dataType: SGDataType.vector2f, connection: texcoord),
+                .init(nameID: 128, dataType: SGDataType.vector3f, connection: valuel),
+                .init(nameID: 129, dataType: SGDataType.vector3f, connection: valuer),
+                .init(nameID: 10, dataType: SGDataType.float, connection: center),
+                .init(nameID: 104, dataType: SGDataType.vector2f, connection: texcoord),
             ],
             outputs: [.init(dataType: SGDataType.vector3f)])))
     }
     if SGDataType.vector4f.matches(valuel) && SGDataType.vector4f.matches(valuer) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_splitlr_vector4",
+            nodeTypeID: 837, // ND_splitlr_vector4
             inputs: [
-                .init(name: "valuel", dataType: SGDataType.vector4f, connection: valuel),
-                .init(name: "valuer", dataType: SGDataType.vector4f, connection: valuer),
-                .init(name: "center", dataType: SGDataType.float, connection: center),
-                .init(name: "texcoord", dataType: SGDataType.vector2f, connection: texcoord),
+                .init(nameID: 128, dataType: SGDataType.vector4f, connection: valuel),
+                .init(nameID: 129, dataType: SGDataType.vector4f, connection: valuer),
+                .init(nameID: 10, dataType: SGDataType.float, connection: center),
+                .init(nameID: 104, dataType: SGDataType.vector2f, connection: texcoord),
             ],
             outputs: [.init(dataType: SGDataType.vector4f)])))
     }
@@ -6964,111 +6964,111 @@ public func splittb<T>(valuet: T, valueb: T, center: SGScalar? = nil, texcoord:
     }
     if SGDataType.color3f.matches(valuet) && SGDataType.color3f.matches(valueb) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_splittb_color3",
+            nodeTypeID: 838, // ND_splittb_color3
             inputs: [
-                .init(name: "valuet", dataType: SGDataType.color3f, connection: valuet),
-                .init(name: "valueb", dataType: SGDataType.color3f, connection: valueb),
-                .init(name: "center", dataType: SGDataType.float, connection: center),
-                .init(name: "texcoord", dataType: SGDataType.vector2f, connection: texcoord),
+                .init(nameID: 130, dataType: SGDataType.color3f, connection: valuet),
+                .init(nameID: 125, dataType: SGDataType.color3f, connection: valueb),
+                .init(nameID: 10, dataType: SGDataType.float, connection: center),
+                .init(nameID: 104, dataType: SGDataType.vector2f, connection: texcoord),
             ],
             outputs: [.init(dataType: SGDataType.color3f)])))
     }
     if SGDataType.color4f.matches(valuet) && SGDataType.color4f.matches(valueb) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_splittb_color4",
+            nodeTypeID: 839, // ND_splittb_color4
             inputs: [
-                .init(name: "valuet", dataType: SGDataType.color4f, connection: valuet),
-                .init(name: "valueb", dataType: SGDataType.color4f, connection: valueb),
-                .init(name: "center", dataType: SGDataType.float, connection: center),
-                .init(name: "texcoord", dataType: SGDataType.vector2f, connection: texcoord),
+                .init(nameID: 130, dataType: SGDataType.color4f, connection: valuet),
+                .init(nameID: 125, dataType: SGDataType.color4f, connection: valueb),
+                .init(nameID: 10, dataType: SGDataType.float, connection: center),
+                .init(nameID: 104, dataType: SGDataType.vector2f, connection: texcoord),
             ],
             outputs: [.init(dataType: SGDataType.color4f)])))
     }
     if SGDataType.float.matches(valuet) && SGDataType.float.matches(valueb) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_splittb_float",
+            nodeTypeID: 840, // ND_splittb_float
             inputs: [
-                .init(name: "valuet", dataType: SGDataType.float, connection: valuet),
-                .init(name: "valueb", dataType: SGDataType.float, connection: valueb),
-                .init(name: "center", dataType: SGDataType.float, connection: center),
-                .init(name: "texcoord", dataType: SGDataType.vector2f, connection: texcoord),
+                .init(nameID: 130, dataType: SGDataType.float, connection: valuet),
+                .init(nameID: 125, dataType: SGDataType.float, connection: valueb),
+                .init(nameID: 10, dataType: SGDataType.float, connection: center),
+                .init(nameID: 104, dataType: SGDataType.vector2f, connection: texcoord),
             ],
             outputs: [.init(dataType: SGDataType.float)])))
     }
     if SGDataType.half.matches(valuet) && SGDataType.half.matches(valueb) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_splittb_half",
+            nodeTypeID: 841, // ND_splittb_half
             inputs: [
-                .init(name: "valuet", dataType: SGDataType.half, connection: valuet),
-                .init(name: "valueb", dataType: SGDataType.half, connection: valueb),
-                .init(name: "center", dataType: SGDataType.float, connection: center),
-                .init(name: "texcoord", dataType: SGDataType.vector2f, connection: texcoord),
+                .init(nameID: 130, dataType: SGDataType.half, connection: valuet),
+                .init(nameID: 125, dataType: SGDataType.half, connection: valueb),
+                .init(nameID: 10, dataType: SGDataType.float, connection: center),
+                .init(nameID: 104, dataType: SGDataType.vector2f, connection: texcoord),
             ],
             outputs: [.init(dataType: SGDataType.half)])))
     }
     if SGDataType.vector2h.matches(valuet) && SGDataType.vector2h.matches(valueb) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_splittb_half2",
+            nodeTypeID: 842, // ND_splittb_half2
             inputs: [
-                .init(name: "valuet", dataType: SGDataType.vector2h, connection: valuet),
-                .init(name: "valueb", dataType: SGDataType.vector2h, connection: valueb),
-                .init(name: "center", dataType: SGDataType.float, connection: center),
-                .init(name: "texcoord", dataType: SGDataType.vector2f, connection: texcoord),
+                .init(nameID: 130, dataType: SGDataType.vector2h, connection: valuet),
+                .init(nameID: 125, dataType: SGDataType.vector2h, connection: valueb),
+                .init(nameID: 10, dataType: SGDataType.float, connection: center),
+                .init(nameID: 104, dataType: SGDataType.vector2f, connection: texcoord),
             ],
             outputs: [.init(dataType: SGDataType.vector2h)])))
     }
     if SGDataType.vector3h.matches(valuet) && SGDataType.vector3h.matches(valueb) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_splittb_half3",
+            nodeTypeID: 843, // ND_splittb_half3
             inputs: [
-                .init(name: "valuet", dataType: SGDataType.vector3h, connection: valuet),
-                .init(name: "valueb", dataType: SGDataType.vector3h, connection: valueb),
-                .init(name: "center", dataType: SGDataType.float, connection: center),
-                .init(name: "texcoord", dataType: SGDataType.vector2f, connection: texcoord),
+                .init(nameID: 130, dataType: SGDataType.vector3h, connection: valuet),
+                .init(nameID: 125, dataType: SGDataType.vector3h, connection: valueb),
+                .init(nameID: 10, dataType: SGDataType.float, connection: center),
+                .init(nameID: 104, dataType: SGDataType.vector2f, connection: texcoord),
             ],
             outputs: [.init(dataType: SGDataType.vector3h)])))
     }
     if SGDataType.vector4h.matches(valuet) && SGDataType.vector4h.matches(valueb) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_splittb_half4",
+            nodeTypeID: 844, // ND_splittb_half4
             inputs: [
-                .init(name: "valuet", dataType: SGDataType.vector4h, connection: valuet),
-                .init(name: "valueb", dataType: SGDataType.vector4h, connection: valueb),
-                .init(name: "center", dataType: SGDataType.float, connection: center),
-                .init(name: "texcoord", dataType: SGDataType.vector2f, connection: texcoord),
+                .init(nameID: 130, dataType: SGDataType.vector4h, connection: valuet),
+                .init(nameID: 125, dataType: SGDataType.vector4h, connection: valueb),
+                .init(nameID: 10, dataType: SGDataType.float, connection: center),
+                .init(nameID: 104, dataType: SGDataType.vector2f, connection: texcoord),
             ],
             outputs: [.init(dataType: SGDataType.vector4h)])))
     }
     if SGDataType.vector2f.matches(valuet) && SGDataType.vector2f.matches(valueb) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_splittb_vector2",
+            nodeTypeID: 845, // ND_splittb_vector2
             inputs: [
-                .init(name: "valuet", dataType: SGDataType.vector2f, connection: valuet),
-                .init(name: "valueb", dataType: SGDataType.vector2f, connection: valueb),
-                .init(name: "center", dataType: SGDataType.float, connection: center),
-                .init(name: "texcoord", dataType: SGDataType.vector2f, connection: texcoord),
+                .init(nameID: 130, dataType: SGDataType.vector2f, connection: valuet),
+                .init(nameID: 125, dataType: SGDataType.vector2f, connection: valueb),
+                .init(nameID: 10, dataType: SGDataType.float, connection: center),
+                .init(nameID: 104, dataType: SGDataType.vector2f, connection: texcoord),
             ],
             outputs: [.init(dataType: SGDataType.vector2f)])))
     }
     if SGDataType.vector3f.matches(valuet) && SGDataType.vector3f.matches(valueb) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_splittb_vector3",
+            nodeTypeID: 846, // ND_splittb_vector3
             inputs: [
-                .init(name: "valuet", dataType: SGDataType.vector3f, connection: valuet),
-                .init(name: "valueb", dataType: SGDataType.vector3f, connection: valueb),
-                .init(name: "center", dataType: SGDataType.float, connection: center),
-                .init(name: "texcoord", dataType: SGDataType.vector2f, connection: texcoord),
+                .init(nameID: 130, dataType: SGDataType.vector3f, connection: valuet),
+                .init(nameID: 125, dataType: SGDataType.vector3f, connection: valueb),
+                .init(nameID: 10, dataType: SGDataType.float, connection: center),
+                .init(nameID: 104, dataType: SGDataType.vector2f, connection: texcoord),
             ],
             outputs: [.init(dataType: SGDataType.vector3f)])))
     }
     if SGDataType.vector4f.matches(valuet) && SGDataType.vector4f.matches(valueb) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_splittb_vector4",
+            nodeTypeID: 847, // ND_splittb_vector4
             inputs: [
-                .init(name: "valuet", dataType: SGDataType.vector4f, connection: valuet),
-                .init(name: "valueb", dataType: SGDataType.vector4f, connection: valueb),
-                .init(name: "center", dataType: SGDataType.float, connection: center),
-                .init(name: "texcoord", dataType: SGDataType.vector2f, connection: texcoord),
+                .init(nameID: 130, dataType: SGDataType.vector4f, connection: valuet),
+                .init(nameID: 125, dataType: SGDataType.vector4f, connection: valueb),
+                .init(nameID: 10, dataType: SGDataType.float, connection: center),
+                .init(nameID: 104, dataType: SGDataType.vector2f, connection: texcoord),
             ],
             outputs: [.init(dataType: SGDataType.vector4f)])))
     }
@@ -7078,65 +7078,65 @@ public func splittb<T>(valuet: T, valueb: T, center: SGScalar? = nil, texcoord:
 public func sqrt<T>(_ in1: T) -> T where T: SGNumeric {
     if SGDataType.float.matches(in1) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_sqrt_float",
+            nodeTypeID: 848, // ND_sqrt_float
             inputs: [
-                .init(name: "in", dataType: SGDataType.float, connection: in1),
+                .init(nameID: 42, dataType: SGDataType.float, connection: in1),
             ],
             outputs: [.init(dataType: SGDataType.float)])))
     }
     if SGDataType.half.matches(in1) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_sqrt_half",
+            nodeTypeID: 849, // ND_sqrt_half
             inputs: [
-                .init(name: "in", dataType: SGDataType.half, connection: in1),
+                .init(nameID: 42, dataType: SGDataType.half, connection: in1),
             ],
             outputs: [.init(dataType: SGDataType.half)])))
     }
     if SGDataType.vector2h.matches(in1) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_sqrt_half2",
+            nodeTypeID: 850, // ND_sqrt_half2
             inputs: [
-                .init(name: "in", dataType: SGDataType.vector2h, connection: in1),
+                .init(nameID: 42, dataType: SGDataType.vector2h, connection: in1),
             ],
             outputs: [.init(dataType: SGDataType.vector2h)])))
     }
     if SGDataType.vector3h.matches(in1) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_sqrt_half3",
+            nodeTypeID: 851, // ND_sqrt_half3
             inputs: [
-                .init(name: "in", dataType: SGDataType.vector3h, connection: in1),
+                .init(nameID: 42, dataType: SGDataType.vector3h, connection: in1),
             ],
             outputs: [.init(dataType: SGDataType.vector3h)])))
     }
     if SGDataType.vector4h.matches(in1) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_sqrt_half4",
+            nodeTypeID: 852, // ND_sqrt_half4
             inputs: [
-                .init(name: "in", dataType: SGDataType.vector4h, connection: in1),
+                .init(nameID: 42, dataType: SGDataType.vector4h, connection: in1),
             ],
             outputs: [.init(dataType: SGDataType.vector4h)])))
     }
     if SGDataType.vector2f.matches(in1) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_sqrt_vector2",
+            nodeTypeID: 853, // ND_sqrt_vector2
             inputs: [
-                .init(name: "in", dataType: SGDataType.vector2f, connection: in1),
+                .init(nameID: 42, dataType: SGDataType.vector2f, connection: in1),
             ],
             outputs: [.init(dataType: SGDataType.vector2f)])))
     }
     if SGDataType.vector3f.matches(in1) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_sqrt_vector3",
+            nodeTypeID: 854, // ND_sqrt_vector3
             inputs: [
-                .init(name: "in", dataType: SGDataType.vector3f, connection: in1),
+                .init(nameID: 42, dataType: SGDataType.vector3f, connection: in1),
             ],
             outputs: [.init(dataType: SGDataType.vector3f)])))
     }
     if SGDataType.vector4f.matches(in1) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_sqrt_vector4",
+            nodeTypeID: 855, // ND_sqrt_vector4
             inputs: [
-                .init(name: "in", dataType: SGDataType.vector4f, connection: in1),
+                .init(nameID: 42, dataType: SGDataType.vector4f, connection: in1),
             ],
             outputs: [.init(dataType: SGDataType.vector4f)])))
     }
@@ -7146,55 +7146,55 @@ public func sqrt<T>(_ in1: T) -> T where T: SGNumeric {
 public func step<T>(_ in1: T, edge: T) -> T where T: SGNumeric {
     if SGDataType.color3f.matches(in1) && SGDataType.color3f.matches(edge) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_realitykit_step_color3",
+            nodeTypeID: 708, // ND_realitykit_step_color3
             inputs: [
-                .init(name: "in", dataType: SGDataType.color3f, connection: in1),
-                .init(name: "edge", dataType: SGDataType.color3f, connection: edge),
+                .init(nameID: 42, dataType: SGDataType.color3f, connection: in1),
+                .init(nameID: 22, dataType: SGDataType.color3f, connection: edge),
             ],
             outputs: [.init(dataType: SGDataType.color3f)])))
     }
     if SGDataType.color4f.matches(in1) && SGDataType.color4f.matches(edge) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_realitykit_step_color4",
+            nodeTypeID: 709, // ND_realitykit_step_color4
             inputs: [
-                .init(name: "in", dataType: SGDataType.color4f, connection: in1),
-                .init(name: "edge", dataType: SGDataType.color4f, connection: edge),
+                .init(nameID: 42, dataType: SGDataType.color4f, connection: in1),
+                .init(nameID: 22, dataType: SGDataType.color4f, connection: edge),
             ],
             outputs: [.init(dataType: SGDataType.color4f)])))
     }
     if SGDataType.float.matches(in1) && SGDataType.float.matches(edge) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_realitykit_step_float",
+            nodeTypeID: 710, // ND_realitykit_step_float
             inputs: [
-                .init(name: "in", dataType: SGDataType.float, connection: in1),
-                .init(name: "edge", dataType: SGDataType.float, connection: edge),
+                .init(nameID: 42, dataType: SGDataType.float, connection: in1),
+                .init(nameID: 22, dataType: SGDataType.float, connection: edge),
             ],
             outputs: [.init(dataType: SGDataType.float)])))
     }
     if SGDataType.vector2f.matches(in1) && SGDataType.vector2f.matches(edge) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_realitykit_step_vector2",
+            nodeTypeID: 711, // ND_realitykit_step_vector2
             inputs: [
-                .init(name: "in", dataType: SGDataType.vector2f, connection: in1),
-                .init(name: "edge", dataType: SGDataType.vector2f, connection: edge),
+                .init(nameID: 42, dataType: SGDataType.vector2f, connection: in1),
+                .init(nameID: 22, dataType: SGDataType.vector2f, connection: edge),
             ],
             outputs: [.init(dataType: SGDataType.vector2f)])))
     }
     if SGDataType.vector3f.matches(in1) && SGDataType.vector3f.matches(edge) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_realitykit_step_vector3",
+            nodeTypeID: 712, // ND_realitykit_step_vector3
             inputs: [
-                .init(name: "in", dataType: SGDataType.vector3f, connection: in1),
-                .init(name: "edge", dataType: SGDataType.vector3f, connection: edge),
+                .init(nameID: 42, dataType: SGDataType.vector3f, connection: in1),
+                .init(nameID: 22, dataType: SGDataType.vector3f, connection: edge),
             ],
             outputs: [.init(dataType: SGDataType.vector3f)])))
     }
     if SGDataType.vector4f.matches(in1) && SGDataType.vector4f.matches(edge) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_realitykit_step_vector4",
+            nodeTypeID: 713, // ND_realitykit_step_vector4
             inputs: [
-                .init(name: "in", dataType: SGDataType.vector4f, connection: in1),
-                .init(name: "edge", dataType: SGDataType.vector4f, connection: edge),
+                .init(nameID: 42, dataType: SGDataType.vector4f, connection: in1),
+                .init(nameID: 22, dataType: SGDataType.vector4f, connection: edge),
             ],
             outputs: [.init(dataType: SGDataType.vector4f)])))
     }
@@ -7204,163 +7204,163 @@ public func step<T>(_ in1: T, edge: T) -> T where T: SGNumeric {
 public func subtract<T>(_ in1: T, _ in2: SGNumeric) -> T where T: SGNumeric {
     if SGDataType.color3f.matches(in1) && SGDataType.color3f.matches(in2) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_subtract_color3",
+            nodeTypeID: 856, // ND_subtract_color3
             inputs: [
-                .init(name: "in1", dataType: SGDataType.color3f, connection: in1),
-                .init(name: "in2", dataType: SGDataType.color3f, connection: in2),
+                .init(nameID: 43, dataType: SGDataType.color3f, connection: in1),
+                .init(nameID: 45, dataType: SGDataType.color3f, connection: in2),
             ],
             outputs: [.init(dataType: SGDataType.color3f)])))
     }
     if SGDataType.color3f.matches(in1) && SGDataType.float.matches(in2) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_subtract_color3FA",
+            nodeTypeID: 857, // ND_subtract_color3FA
             inputs: [
-                .init(name: "in1", dataType: SGDataType.color3f, connection: in1),
-                .init(name: "in2", dataType: SGDataType.float, connection: in2),
+                .init(nameID: 43, dataType: SGDataType.color3f, connection: in1),
+                .init(nameID: 45, dataType: SGDataType.float, connection: in2),
             ],
             outputs: [.init(dataType: SGDataType.color3f)])))
     }
     if SGDataType.color4f.matches(in1) && SGDataType.color4f.matches(in2) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_subtract_color4",
+            nodeTypeID: 858, // ND_subtract_color4
             inputs: [
-                .init(name: "in1", dataType: SGDataType.color4f, connection: in1),
-                .init(name: "in2", dataType: SGDataType.color4f, connection: in2),
+                .init(nameID: 43, dataType: SGDataType.color4f, connection: in1),
+                .init(nameID: 45, dataType: SGDataType.color4f, connection: in2),
             ],
             outputs: [.init(dataType: SGDataType.color4f)])))
     }
     if SGDataType.color4f.matches(in1) && SGDataType.float.matches(in2) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_subtract_color4FA",
+            nodeTypeID: 859, // ND_subtract_color4FA
             inputs: [
-                .init(name: "in1", dataType: SGDataType.color4f, connection: in1),
-                .init(name: "in2", dataType: SGDataType.float, connection: in2),
+                .init(nameID: 43, dataType: SGDataType.color4f, connection: in1),
+                .init(nameID: 45, dataType: SGDataType.float, connection: in2),
             ],
             outputs: [.init(dataType: SGDataType.color4f)])))
     }
     if SGDataType.float.matches(in1) && SGDataType.float.matches(in2) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_subtract_float",
+            nodeTypeID: 860, // ND_subtract_float
             inputs: [
-                .init(name: "in1", dataType: SGDataType.float, connection: in1),
-                .init(name: "in2", dataType: SGDataType.float, connection: in2),
+                .init(nameID: 43, dataType: SGDataType.float, connection: in1),
+                .init(nameID: 45, dataType: SGDataType.float, connection: in2),
             ],
             outputs: [.init(dataType: SGDataType.float)])))
     }
     if SGDataType.half.matches(in1) && SGDataType.half.matches(in2) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_subtract_half",
+            nodeTypeID: 861, // ND_subtract_half
             inputs: [
-                .init(name: "in1", dataType: SGDataType.half, connection: in1),
-                .init(name: "in2", dataType: SGDataType.half, connection: in2),
+                .init(nameID: 43, dataType: SGDataType.half, connection: in1),
+                .init(nameID: 45, dataType: SGDataType.half, connection: in2),
             ],
             outputs: [.init(dataType: SGDataType.half)])))
     }
     if SGDataType.matrix2d.matches(in1) && SGDataType.matrix2d.matches(in2) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_subtract_matrix22",
+            nodeTypeID: 862, // ND_subtract_matrix22
             inputs: [
-                .init(name: "in1", dataType: SGDataType.matrix2d, connection: in1),
-                .init(name: "in2", dataType: SGDataType.matrix2d, connection: in2),
+                .init(nameID: 43, dataType: SGDataType.matrix2d, connection: in1),
+                .init(nameID: 45, dataType: SGDataType.matrix2d, connection: in2),
             ],
             outputs: [.init(dataType: SGDataType.matrix2d)])))
     }
     if SGDataType.matrix2d.matches(in1) && SGDataType.float.matches(in2) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_subtract_matrix22FA",
+            nodeTypeID: 863, // ND_subtract_matrix22FA
             inputs: [
-                .init(name: "in1", dataType: SGDataType.matrix2d, connection: in1),
-                .init(name: "in2", dataType: SGDataType.float, connection: in2),
+                .init(nameID: 43, dataType: SGDataType.matrix2d, connection: in1),
+                .init(nameID: 45, dataType: SGDataType.float, connection: in2),
             ],
             outputs: [.init(dataType: SGDataType.matrix2d)])))
     }
     if SGDataType.matrix3d.matches(in1) && SGDataType.matrix3d.matches(in2) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_subtract_matrix33",
+            nodeTypeID: 864, // ND_subtract_matrix33
             inputs: [
-                .init(name: "in1", dataType: SGDataType.matrix3d, connection: in1),
-                .init(name: "in2", dataType: SGDataType.matrix3d, connection: in2),
+                .init(nameID: 43, dataType: SGDataType.matrix3d, connection: in1),
+                .init(nameID: 45, dataType: SGDataType.matrix3d, connection: in2),
             ],
             outputs: [.init(dataType: SGDataType.matrix3d)])))
     }
     if SGDataType.matrix3d.matches(in1) && SGDataType.float.matches(in2) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_subtract_matrix33FA",
+            nodeTypeID: 865, // ND_subtract_matrix33FA
             inputs: [
-                .init(name: "in1", dataType: SGDataType.matrix3d, connection: in1),
-                .init(name: "in2", dataType: SGDataType.float, connection: in2),
+                .init(nameID: 43, dataType: SGDataType.matrix3d, connection: in1),
+                .init(nameID: 45, dataType: SGDataType.float, connection: in2),
             ],
             outputs: [.init(dataType: SGDataType.matrix3d)])))
     }
     if SGDataType.matrix4d.matches(in1) && SGDataType.matrix4d.matches(in2) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_subtract_matrix44",
+            nodeTypeID: 866, // ND_subtract_matrix44
             inputs: [
-                .init(name: "in1", dataType: SGDataType.matrix4d, connection: in1),
-                .init(name: "in2", dataType: SGDataType.matrix4d, connection: in2),
+                .init(nameID: 43, dataType: SGDataType.matrix4d, connection: in1),
+                .init(nameID: 45, dataType: SGDataType.matrix4d, connection: in2),
             ],
             outputs: [.init(dataType: SGDataType.matrix4d)])))
     }
     if SGDataType.matrix4d.matches(in1) && SGDataType.float.matches(in2) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_subtract_matrix44FA",
+            nodeTypeID: 867, // ND_subtract_matrix44FA
             inputs: [
-                .init(name: "in1", dataType: SGDataType.matrix4d, connection: in1),
-                .init(name: "in2", dataType: SGDataType.float, connection: in2),
+                .init(nameID: 43, dataType: SGDataType.matrix4d, connection: in1),
+                .init(nameID: 45, dataType: SGDataType.float, connection: in2),
             ],
             outputs: [.init(dataType: SGDataType.matrix4d)])))
     }
     if SGDataType.vector2f.matches(in1) && SGDataType.vector2f.matches(in2) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_subtract_vector2",
+            nodeTypeID: 868, // ND_subtract_vector2
             inputs: [
-                .init(name: "in1", dataType: SGDataType.vector2f, connection: in1),
-                .init(name: "in2", dataType: SGDataType.vector2f, connection: in2),
+                .init(nameID: 43, dataType: SGDataType.vector2f, connection: in1),
+                .init(nameID: 45, dataType: SGDataType.vector2f, connection: in2),
             ],
             outputs: [.init(dataType: SGDataType.vector2f)])))
     }
     if SGDataType.vector2f.matches(in1) && SGDataType.float.matches(in2) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_subtract_vector2FA",
+            nodeTypeID: 869, // ND_subtract_vector2FA
             inputs: [
-                .init(name: "in1", dataType: SGDataType.vector2f, connection: in1),
-                .init(name: "in2", dataType: SGDataType.float, connection: in2),
+                .init(nameID: 43, dataType: SGDataType.vector2f, connection: in1),
+                .init(nameID: 45, dataType: SGDataType.float, connection: in2),
             ],
             outputs: [.init(dataType: SGDataType.vector2f)])))
     }
     if SGDataType.vector3f.matches(in1) && SGDataType.vector3f.matches(in2) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_subtract_vector3",
+            nodeTypeID: 870, // ND_subtract_vector3
             inputs: [
-                .init(name: "in1", dataType: SGDataType.vector3f, connection: in1),
-                .init(name: "in2", dataType: SGDataType.vector3f, connection: in2),
+                .init(nameID: 43, dataType: SGDataType.vector3f, connection: in1),
+                .init(nameID: 45, dataType: SGDataType.vector3f, connection: in2),
             ],
             outputs: [.init(dataType: SGDataType.vector3f)])))
     }
     if SGDataType.vector3f.matches(in1) && SGDataType.float.matches(in2) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_subtract_vector3FA",
+            nodeTypeID: 871, // ND_subtract_vector3FA
             inputs: [
-                .init(name: "in1", dataType: SGDataType.vector3f, connection: in1),
-                .init(name: "in2", dataType: SGDataType.float, connection: in2),
+                .init(nameID: 43, dataType: SGDataType.vector3f, connection: in1),
+                .init(nameID: 45, dataType: SGDataType.float, connection: in2),
             ],
             outputs: [.init(dataType: SGDataType.vector3f)])))
     }
     if SGDataType.vector4f.matches(in1) && SGDataType.vector4f.matches(in2) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_subtract_vector4",
+            nodeTypeID: 872, // ND_subtract_vector4
             inputs: [
-                .init(name: "in1", dataType: SGDataType.vector4f, connection: in1),
-                .init(name: "in2", dataType: SGDataType.vector4f, connection: in2),
+                .init(nameID: 43, dataType: SGDataType.vector4f, connection: in1),
+                .init(nameID: 45, dataType: SGDataType.vector4f, connection: in2),
             ],
             outputs: [.init(dataType: SGDataType.vector4f)])))
     }
     if SGDataType.vector4f.matches(in1) && SGDataType.float.matches(in2) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_subtract_vector4FA",
+            nodeTypeID: 873, // ND_subtract_vector4FA
             inputs: [
-                .init(name: "in1", dataType: SGDataType.vector4f, connection: in1),
-                .init(name: "in2", dataType: SGDataType.float, connection: in2),
+                .init(nameID: 43, dataType: SGDataType.vector4f, connection: in1),
+                .init(nameID: 45, dataType: SGDataType.float, connection: in2),
             ],
             outputs: [.init(dataType: SGDataType.vector4f)])))
     }
@@ -7370,253 +7370,253 @@ public func subtract<T>(_ in1: T, _ in2: SGNumeric) -> T where T: SGNumeric {
 public func switchValue<T>(_ in1: T, _ in2: T, _ in3: T, _ in4: T, _ in5: T, _ in6: T, _ in7: T, _ in8: T, _ in9: T, _ in10: T, which: SGScalar? = nil) -> T where T: SGNumeric {
     if SGDataType.color3f.matches(in1) && SGDataType.color3f.matches(in2) && SGDataType.color3f.matches(in3) && SGDataType.color3f.matches(in4) && SGDataType.color3f.matches(in5) && SGDataType.color3f.matches(in6) && SGDataType.color3f.matches(in7) && SGDataType.color3f.matches(in8) && SGDataType.color3f.matches(in9) && SGDataType.color3f.matches(in10) && SGDataType.float.matches(which) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_switch_color3",
+            nodeTypeID: 875, // ND_switch_color3
             inputs: [
-                .init(name: "in1", dataType: SGDataType.color3f, connection: in1),
-                .init(name: "in2", dataType: SGDataType.color3f, connection: in2),
-                .init(name: "in3", dataType: SGDataType.color3f, connection: in3),
-                .init(name: "in4", dataType: SGDataType.color3f, connection: in4),
-                .init(name: "in5", dataType: SGDataType.color3f, connection: in5),
-                .init(name: "in6", dataType: SGDataType.color3f, connection: in6),
-                .init(name: "in7", dataType: SGDataType.color3f, connection: in7),
-                .init(name: "in8", dataType: SGDataType.color3f, connection: in8),
-                .init(name: "in9", dataType: SGDataType.color3f, connection: in9),
-                .init(name: "in10", dataType: SGDataType.color3f, connection: in10),
-                .init(name: "which", dataType: SGDataType.float, connection: which),
+                .init(nameID: 43, dataType: SGDataType.color3f, connection: in1),
+                .init(nameID: 45, dataType: SGDataType.color3f, connection: in2),
+                .init(nameID: 46, dataType: SGDataType.color3f, connection: in3),
+                .init(nameID: 47, dataType: SGDataType.color3f, connection: in4),
+                .init(nameID: 48, dataType: SGDataType.color3f, connection: in5),
+                .init(nameID: 49, dataType: SGDataType.color3f, connection: in6),
+                .init(nameID: 50, dataType: SGDataType.color3f, connection: in7),
+                .init(nameID: 51, dataType: SGDataType.color3f, connection: in8),
+                .init(nameID: 52, dataType: SGDataType.color3f, connection: in9),
+                .init(nameID: 44, dataType: SGDataType.color3f, connection: in10),
+                .init(nameID: 135, dataType: SGDataType.float, connection: which),
             ],
             outputs: [.init(dataType: SGDataType.color3f)])))
     }
     if SGDataType.color3f.matches(in1) && SGDataType.color3f.matches(in2) && SGDataType.color3f.matches(in3) && SGDataType.color3f.matches(in4) && SGDataType.color3f.matches(in5) && SGDataType.color3f.matches(in6) && SGDataType.color3f.matches(in7) && SGDataType.color3f.matches(in8) && SGDataType.color3f.matches(in9) && SGDataType.color3f.matches(in10) && SGDataType.int.matches(which) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_switch_color3I",
+            nodeTypeID: 876, // ND_switch_color3I
             inputs: [
-                .init(name: "in1", dataType: SGDataType.color3f, connection: in1),
-                .init(name: "in2", dataType: SGDataType.color3f, connection: in2),
-                .init(name: "in3", dataType: SGDataType.color3f, connection: in3),
-                .init(name: "in4", dataType: SGDataType.color3f, connection: in4),
-                .init(name: "in5", dataType: SGDataType.color3f, connection: in5),
-                .init(name: "in6", dataType: SGDataType.color3f, connection: in6),
-                .init(name: "in7", dataType: SGDataType.color3f, connection: in7),
-                .init(name: "in8", dataType: SGDataType.color3f, connection: in8),
-                .init(name: "in9", dataType: SGDataType.color3f, connection: in9),
-                .init(name: "in10", dataType: SGDataType.color3f, connection: in10),
-                .init(name: "which", dataType: SGDataType.int, connection: which),
+                .init(nameID: 43, dataType: SGDataType.color3f, connection: in1),
+                .init(nameID: 45, dataType: SGDataType.color3f, connection: in2),
+                .init(nameID: 46, dataType: SGDataType.color3f, connection: in3),
+                .init(nameID: 47, dataType: SGDataType.color3f, connection: in4),
+                .init(nameID: 48, dataType: SGDataType.color3f, connection: in5),
+                .init(nameID: 49, dataType: SGDataType.color3f, connection: in6),
+                .init(nameID: 50, dataType: SGDataType.color3f, connection: in7),
+                .init(nameID: 51, dataType: SGDataType.color3f, connection: in8),
+                .init(nameID: 52, dataType: SGDataType.color3f, connection: in9),
+                .init(nameID: 44, dataType: SGDataType.color3f, connection: in10),
+                .init(nameID: 135, dataType: SGDataType.int, connection: which),
             ],
             outputs: [.init(dataType: SGDataType.color3f)])))
     }
     if SGDataType.color4f.matches(in1) && SGDataType.color4f.matches(in2) && SGDataType.color4f.matches(in3) && SGDataType.color4f.matches(in4) && SGDataType.color4f.matches(in5) && SGDataType.color4f.matches(in6) && SGDataType.color4f.matches(in7) && SGDataType.color4f.matches(in8) && SGDataType.color4f.matches(in9) && SGDataType.color4f.matches(in10) && SGDataType.float.matches(which) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_switch_color4",
+            nodeTypeID: 877, // ND_switch_color4
             inputs: [
-                .init(name: "in1", dataType: SGDataType.color4f, connection: in1),
-                .init(name: "in2", dataType: SGDataType.color4f, connection: in2),
-                .init(name: "in3", dataType: SGDataType.color4f, connection: in3),
-                .init(name: "in4", dataType: SGDataType.color4f, connection: in4),
-                .init(name: "in5", dataType: SGDataType.color4f, connection: in5),
-                .init(name: "in6", dataType: SGDataType.color4f, connection: in6),
-                .init(name: "in7", dataType: SGDataType.color4f, connection: in7),
-                .init(name: "in8", dataType: SGDataType.color4f, connection: in8),
-                .init(name: "in9", dataType: SGDataType.color4f, connection: in9),
-                .init(name: "in10", dataType: SGDataType.color4f, connection: in10),
-                .init(name: "which", dataType: SGDataType.float, connection: which),
+                .init(nameID: 43, dataType: SGDataType.color4f, connection: in1),
+                .init(nameID: 45, dataType: SGDataType.color4f, connection: in2),
+                .init(nameID: 46, dataType: SGDataType.color4f, connection: in3),
+                .init(nameID: 47, dataType: SGDataType.color4f, connection: in4),
+                .init(nameID: 48, dataType: SGDataType.color4f, connection: in5),
+                .init(nameID: 49, dataType: SGDataType.color4f, connection: in6),
+                .init(nameID: 50, dataType: SGDataType.color4f, connection: in7),
+                .init(nameID: 51, dataType: SGDataType.color4f, connection: in8),
+                .init(nameID: 52, dataType: SGDataType.color4f, connection: in9),
+                .init(nameID: 44, dataType: SGDataType.color4f, connection: in10),
+                .init(nameID: 135, dataType: SGDataType.float, connection: which),
             ],
             outputs: [.init(dataType: SGDataType.color4f)])))
     }
     if SGDataType.color4f.matches(in1) && SGDataType.color4f.matches(in2) && SGDataType.color4f.matches(in3) && SGDataType.color4f.matches(in4) && SGDataType.color4f.matches(in5) && SGDataType.color4f.matches(in6) && SGDataType.color4f.matches(in7) && SGDataType.color4f.matches(in8) && SGDataType.color4f.matches(in9) && SGDataType.color4f.matches(in10) && SGDataType.int.matches(which) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_switch_color4I",
+            nodeTypeID: 878, // ND_switch_color4I
             inputs: [
-                .init(name: "in1", dataType: SGDataType.color4f, connection: in1),
-                .init(name: "in2", dataType: SGDataType.color4f, connection: in2),
-                .init(name: "in3", dataType: SGDataType.color4f, connection: in3),
-                .init(name: "in4", dataType: SGDataType.color4f, connection: in4),
-                .init(name: "in5", dataType: SGDataType.color4f, connection: in5),
-                .init(name: "in6", dataType: SGDataType.color4f, connection: in6),
-                .init(name: "in7", dataType: SGDataType.color4f, connection: in7),
-                .init(name: "in8", dataType: SGDataType.color4f, connection: in8),
-                .init(name: "in9", dataType: SGDataType.color4f, connection: in9),
-                .init(name: "in10", dataType: SGDataType.color4f, connection: in10),
-                .init(name: "which", dataType: SGDataType.int, connection: which),
+                .init(nameID: 43, dataType: SGDataType.color4f, connection: in1),
+                .init(nameID: 45, dataType: SGDataType.color4f, connection: in2),
+                .init(nameID: 46, dataType: SGDataType.color4f, connection: in3),
+                .init(nameID: 47, dataType: SGDataType.color4f, connection: in4),
+                .init(nameID: 48, dataType: SGDataType.color4f, connection: in5),
+                .init(nameID: 49, dataType: SGDataType.color4f, connection: in6),
+                .init(nameID: 50, dataType: SGDataType.color4f, connection: in7),
+                .init(nameID: 51, dataType: SGDataType.color4f, connection: in8),
+                .init(nameID: 52, dataType: SGDataType.color4f, connection: in9),
+                .init(nameID: 44, dataType: SGDataType.color4f, connection: in10),
+                .init(nameID: 135, dataType: SGDataType.int, connection: which),
             ],
             outputs: [.init(dataType: SGDataType.color4f)])))
     }
     if SGDataType.float.matches(in1) && SGDataType.float.matches(in2) && SGDataType.float.matches(in3) && SGDataType.float.matches(in4) && SGDataType.float.matches(in5) && SGDataType.float.matches(in6) && SGDataType.float.matches(in7) && SGDataType.float.matches(in8) && SGDataType.float.matches(in9) && SGDataType.float.matches(in10) && SGDataType.float.matches(which) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_switch_float",
+            nodeTypeID: 879, // ND_switch_float
             inputs: [
-                .init(name: "in1", dataType: SGDataType.float, connection: in1),
-                .init(name: "in2", dataType: SGDataType.float, connection: in2),
-                .init(name: "in3", dataType: SGDataType.float, connection: in3),
-                .init(name: "in4", dataType: SGDataType.float, connection: in4),
-                .init(name: "in5", dataType: SGDataType.float, connection: in5),
-                .init(name: "in6", dataType: SGDataType.float, connection: in6),
-                .init(name: "in7", dataType: SGDataType.float, connection: in7),
-                .init(name: "in8", dataType: SGDataType.float, connection: in8),
-                .init(name: "in9", dataType: SGDataType.float, connection: in9),
-                .init(name: "in10", dataType: SGDataType.float, connection: in10),
-                .init(name: "which", dataType: SGDataType.float, connection: which),
+                .init(nameID: 43, dataType: SGDataType.float, connection: in1),
+                .init(nameID: 45, dataType: SGDataType.float, connection: in2),
+                .init(nameID: 46, dataType: SGDataType.float, connection: in3),
+                .init(nameID: 47, dataType: SGDataType.float, connection: in4),
+                .init(nameID: 48, dataType: SGDataType.float, connection: in5),
+                .init(nameID: 49, dataType: SGDataType.float, connection: in6),
+                .init(nameID: 50, dataType: SGDataType.float, connection: in7),
+                .init(nameID: 51, dataType: SGDataType.float, connection: in8),
+                .init(nameID: 52, dataType: SGDataType.float, connection: in9),
+                .init(nameID: 44, dataType: SGDataType.float, connection: in10),
+                .init(nameID: 135, dataType: SGDataType.float, connection: which),
             ],
             outputs: [.init(dataType: SGDataType.float)])))
     }
     if SGDataType.float.matches(in1) && SGDataType.float.matches(in2) && SGDataType.float.matches(in3) && SGDataType.float.matches(in4) && SGDataType.float.matches(in5) && SGDataType.float.matches(in6) && SGDataType.float.matches(in7) && SGDataType.float.matches(in8) && SGDataType.float.matches(in9) && SGDataType.float.matches(in10) && SGDataType.int.matches(which) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_switch_floatI",
+            nodeTypeID: 880, // ND_switch_floatI
             inputs: [
-                .init(name: "in1", dataType: SGDataType.float, connection: in1),
-                .init(name: "in2", dataType: SGDataType.float, connection: in2),
-                .init(name: "in3", dataType: SGDataType.float, connection: in3),
-                .init(name: "in4", dataType: SGDataType.float, connection: in4),
-                .init(name: "in5", dataType: SGDataType.float, connection: in5),
-                .init(name: "in6", dataType: SGDataType.float, connection: in6),
-                .init(name: "in7", dataType: SGDataType.float, connection: in7),
-                .init(name: "in8", dataType: SGDataType.float, connection: in8),
-                .init(name: "in9", dataType: SGDataType.float, connection: in9),
-                .init(name: "in10", dataType: SGDataType.float, connection: in10),
-                .init(name: "which", dataType: SGDataType.int, connection: which),
+                .init(nameID: 43, dataType: SGDataType.float, connection: in1),
+                .init(nameID: 45, dataType: SGDataType.float, connection: in2),
+                .init(nameID: 46, dataType: SGDataType.float, connection: in3),
+                .init(nameID: 47, dataType: SGDataType.float, connection: in4),
+                .init(nameID: 48, dataType: SGDataType.float, connection: in5),
+                .init(nameID: 49, dataType: SGDataType.float, connection: in6),
+                .init(nameID: 50, dataType: SGDataType.float, connection: in7),
+                .init(nameID: 51, dataType: SGDataType.float, connection: in8),
+                .init(nameID: 52, dataType: SGDataType.float, connection: in9),
+                .init(nameID: 44, dataType: SGDataType.float, connection: in10),
+                .init(nameID: 135, dataType: SGDataType.int, connection: which),
             ],
             outputs: [.init(dataType: SGDataType.float)])))
     }
     if SGDataType.half.matches(in1) && SGDataType.half.matches(in2) && SGDataType.half.matches(in3) && SGDataType.half.matches(in4) && SGDataType.half.matches(in5) && SGDataType.half.matches(in6) && SGDataType.half.matches(in7) && SGDataType.half.matches(in8) && SGDataType.half.matches(in9) && SGDataType.half.matches(in10) && SGDataType.float.matches(which) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_switch_half",
+            nodeTypeID: 881, // ND_switch_half
             inputs: [
-                .init(name: "in1", dataType: SGDataType.half, connection: in1),
-                .init(name: "in2", dataType: SGDataType.half, connection: in2),
-                .init(name: "in3", dataType: SGDataType.half, connection: in3),
-                .init(name: "in4", dataType: SGDataType.half, connection: in4),
-                .init(name: "in5", dataType: SGDataType.half, connection: in5),
-                .init(name: "in6", dataType: SGDataType.half, connection: in6),
-                .init(name: "in7", dataType: SGDataType.half, connection: in7),
-                .init(name: "in8", dataType: SGDataType.half, connection: in8),
-                .init(name: "in9", dataType: SGDataType.half, connection: in9),
-                .init(name: "in10", dataType: SGDataType.half, connection: in10),
-                .init(name: "which", dataType: SGDataType.float, connection: which),
+                .init(nameID: 43, dataType: SGDataType.half, connection: in1),
+                .init(nameID: 45, dataType: SGDataType.half, connection: in2),
+                .init(nameID: 46, dataType: SGDataType.half, connection: in3),
+                .init(nameID: 47, dataType: SGDataType.half, connection: in4),
+                .init(nameID: 48, dataType: SGDataType.half, connection: in5),
+                .init(nameID: 49, dataType: SGDataType.half, connection: in6),
+                .init(nameID: 50, dataType: SGDataType.half, connection: in7),
+                .init(nameID: 51, dataType: SGDataType.half, connection: in8),
+                .init(nameID: 52, dataType: SGDataType.half, connection: in9),
+                .init(nameID: 44, dataType: SGDataType.half, connection: in10),
+                .init(nameID: 135, dataType: SGDataType.float, connection: which),
             ],
             outputs: [.init(dataType: SGDataType.half)])))
     }
     if SGDataType.half.matches(in1) && SGDataType.half.matches(in2) && SGDataType.half.matches(in3) && SGDataType.half.matches(in4) && SGDataType.half.matches(in5) && SGDataType.half.matches(in6) && SGDataType.half.matches(in7) && SGDataType.half.matches(in8) && SGDataType.half.matches(in9) && SGDataType.half.matches(in10) && SGDataType.int.matches(which) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_switch_halfI",
+            nodeTypeID: 882, // ND_switch_halfI
             inputs: [
-                .init(name: "in1", dataType: SGDataType.half, connection: in1),
-                .init(name: "in2", dataType: SGDataType.half, connection: in2),
-                .init(name: "in3", dataType: SGDataType.half, connection: in3),
-                .init(name: "in4", dataType: SGDataType.half, connection: in4),
-                .init(name: "in5", dataType: SGDataType.half, connection: in5),
-                .init(name: "in6", dataType: SGDataType.half, connection: in6),
-                .init(name: "in7", dataType: SGDataType.half, connection: in7),
-                .init(name: "in8", dataType: SGDataType.half, connection: in8),
-                .init(name: "in9", dataType: SGDataType.half, connection: in9),
-                .init(name: "in10", dataType: SGDataType.half, connection: in10),
-                .init(name: "which", dataType: SGDataType.int, connection: which),
+                .init(nameID: 43, dataType: SGDataType.half, connection: in1),
+                .init(nameID: 45, dataType: SGDataType.half, connection: in2),
+                .init(nameID: 46, dataType: SGDataType.half, connection: in3),
+                .init(nameID: 47, dataType: SGDataType.half, connection: in4),
+                .init(nameID: 48, dataType: SGDataType.half, connection: in5),
+                .init(nameID: 49, dataType: SGDataType.half, connection: in6),
+                .init(nameID: 50, dataType: SGDataType.half, connection: in7),
+                .init(nameID: 51, dataType: SGDataType.half, connection: in8),
+                .init(nameID: 52, dataType: SGDataType.half, connection: in9),
+                .init(nameID: 44, dataType: SGDataType.half, connection: in10),
+                .init(nameID: 135, dataType: SGDataType.int, connection: which),
             ],
             outputs: [.init(dataType: SGDataType.half)])))
     }
     if SGDataType.vector2f.matches(in1) && SGDataType.vector2f.matches(in2) && SGDataType.vector2f.matches(in3) && SGDataType.vector2f.matches(in4) && SGDataType.vector2f.matches(in5) && SGDataType.vector2f.matches(in6) && SGDataType.vector2f.matches(in7) && SGDataType.vector2f.matches(in8) && SGDataType.vector2f.matches(in9) && SGDataType.vector2f.matches(in10) && SGDataType.float.matches(which) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_switch_vector2",
+            nodeTypeID: 883, // ND_switch_vector2
             inputs: [
-                .init(name: "in1", dataType: SGDataType.vector2f, connection: in1),
-                .init(name: "in2", dataType: SGDataType.vector2f, connection: in2),
-                .init(name: "in3", dataType: SGDataType.vector2f, connection: in3),
-                .init(name: "in4", dataType: SGDataType.vector2f, connection: in4),
-                .init(name: "in5", dataType: SGDataType.vector2f, connection: in5),
-                .init(name: "in6", dataType: SGDataType.vector2f, connection: in6),
-                .init(name: "in7", dataType: SGDataType.vector2f, connection: in7),
-                .init(name: "in8", dataType: SGDataType.vector2f, connection: in8),
-                .init(name: "in9", dataType: SGDataType.vector2f, connection: in9),
-                .init(name: "in10", dataType: SGDataType.vector2f, connection: in10),
-                .init(name: "which", dataType: SGDataType.float, connection: which),
+                .init(nameID: 43, dataType: SGDataType.vector2f, connection: in1),
+                .init(nameID: 45, dataType: SGDataType.vector2f, connection: in2),
+                .init(nameID: 46, dataType: SGDataType.vector2f, connection: in3),
+                .init(nameID: 47, dataType: SGDataType.vector2f, connection: in4),
+                .init(nameID: 48, dataType: SGDataType.vector2f, connection: in5),
+                .init(nameID: 49, dataType: SGDataType.vector2f, connection: in6),
+                .init(nameID: 50, dataType: SGDataType.vector2f, connection: in7),
+                .init(nameID: 51, dataType: SGDataType.vector2f, connection: in8),
+                .init(nameID: 52, dataType: SGDataType.vector2f, connection: in9),
+                .init(nameID: 44, dataType: SGDataType.vector2f, connection: in10),
+                .init(nameID: 135, dataType: SGDataType.float, connection: which),
             ],
             outputs: [.init(dataType: SGDataType.vector2f)])))
     }
     if SGDataType.vector2f.matches(in1) && SGDataType.vector2f.matches(in2) && SGDataType.vector2f.matches(in3) && SGDataType.vector2f.matches(in4) && SGDataType.vector2f.matches(in5) && SGDataType.vector2f.matches(in6) && SGDataType.vector2f.matches(in7) && SGDataType.vector2f.matches(in8) && SGDataType.vector2f.matches(in9) && SGDataType.vector2f.matches(in10) && SGDataType.int.matches(which) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_switch_vector2I",
+            nodeTypeID: 884, // ND_switch_vector2I
             inputs: [
-                .init(name: "in1", dataType: SGDataType.vector2f, connection: in1),
-                .init(name: "in2", dataType: SGDataType.vector2f, connection: in2),
-                .init(name: "in3", dataType: SGDataType.vector2f, connection: in3),
-                .init(name: "in4", dataType: SGDataType.vector2f, connection: in4),
-                .init(name: "in5", dataType: SGDataType.vector2f, connection: in5),
-                .init(name: "in6", dataType: SGDataType.vector2f, connection: in6),
-                .init(name: "in7", dataType: SGDataType.vector2f, connection: in7),
-                .init(name: "in8", dataType: SGDataType.vector2f, connection: in8),
-                .init(name: "in9", dataType: SGDataType.vector2f, connection: in9),
-                .init(name: "in10", dataType: SGDataType.vector2f, connection: in10),
-                .init(name: "which", dataType: SGDataType.int, connection: which),
+                .init(nameID: 43, dataType: SGDataType.vector2f, connection: in1),
+                .init(nameID: 45, dataType: SGDataType.vector2f, connection: in2),
+                .init(nameID: 46, dataType: SGDataType.vector2f, connection: in3),
+                .init(nameID: 47, dataType: SGDataType.vector2f, connection: in4),
+                .init(nameID: 48, dataType: SGDataType.vector2f, connection: in5),
+                .init(nameID: 49, dataType: SGDataType.vector2f, connection: in6),
+                .init(nameID: 50, dataType: SGDataType.vector2f, connection: in7),
+                .init(nameID: 51, dataType: SGDataType.vector2f, connection: in8),
+                .init(nameID: 52, dataType: SGDataType.vector2f, connection: in9),
+                .init(nameID: 44, dataType: SGDataType.vector2f, connection: in10),
+                .init(nameID: 135, dataType: SGDataType.int, connection: which),
             ],
             outputs: [.init(dataType: SGDataType.vector2f)])))
     }
     if SGDataType.vector3f.matches(in1) && SGDataType.vector3f.matches(in2) && SGDataType.vector3f.matches(in3) && SGDataType.vector3f.matches(in4) && SGDataType.vector3f.matches(in5) && SGDataType.vector3f.matches(in6) && SGDataType.vector3f.matches(in7) && SGDataType.vector3f.matches(in8) && SGDataType.vector3f.matches(in9) && SGDataType.vector3f.matches(in10) && SGDataType.float.matches(which) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_switch_vector3",
+            nodeTypeID: 885, // ND_switch_vector3
             inputs: [
-                .init(name: "in1", dataType: SGDataType.vector3f, connection: in1),
-                .init(name: "in2", dataType: SGDataType.vector3f, connection: in2),
-                .init(name: "in3", dataType: SGDataType.vector3f, connection: in3),
-                .init(name: "in4", dataType: SGDataType.vector3f, connection: in4),
-                .init(name: "in5", dataType: SGDataType.vector3f, connection: in5),
-                .init(name: "in6", dataType: SGDataType.vector3f, connection: in6),
-                .init(name: "in7", dataType: SGDataType.vector3f, connection: in7),
-                .init(name: "in8", dataType: SGDataType.vector3f, connection: in8),
-                .init(name: "in9", dataType: SGDataType.vector3f, connection: in9),
-                .init(name: "in10", dataType: SGDataType.vector3f, connection: in10),
-                .init(name: "which", dataType: SGDataType.float, connection: which),
+                .init(nameID: 43, dataType: SGDataType.vector3f, connection: in1),
+                .init(nameID: 45, dataType: SGDataType.vector3f, connection: in2),
+                .init(nameID: 46, dataType: SGDataType.vector3f, connection: in3),
+                .init(nameID: 47, dataType: SGDataType.vector3f, connection: in4),
+                .init(nameID: 48, dataType: SGDataType.vector3f, connection: in5),
+                .init(nameID: 49, dataType: SGDataType.vector3f, connection: in6),
+                .init(nameID: 50, dataType: SGDataType.vector3f, connection: in7),
+                .init(nameID: 51, dataType: SGDataType.vector3f, connection: in8),
+                .init(nameID: 52, dataType: SGDataType.vector3f, connection: in9),
+                .init(nameID: 44, dataType: SGDataType.vector3f, connection: in10),
+                .init(nameID: 135, dataType: SGDataType.float, connection: which),
             ],
             outputs: [.init(dataType: SGDataType.vector3f)])))
     }
     if SGDataType.vector3f.matches(in1) && SGDataType.vector3f.matches(in2) && SGDataType.vector3f.matches(in3) && SGDataType.vector3f.matches(in4) && SGDataType.vector3f.matches(in5) && SGDataType.vector3f.matches(in6) && SGDataType.vector3f.matches(in7) && SGDataType.vector3f.matches(in8) && SGDataType.vector3f.matches(in9) && SGDataType.vector3f.matches(in10) && SGDataType.int.matches(which) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_switch_vector3I",
+            nodeTypeID: 886, // ND_switch_vector3I
             inputs: [
-                .init(name: "in1", dataType: SGDataType.vector3f, connection: in1),
-                .init(name: "in2", dataType: SGDataType.vector3f, connection: in2),
-                .init(name: "in3", dataType: SGDataType.vector3f, connection: in3),
-                .init(name: "in4", dataType: SGDataType.vector3f, connection: in4),
-                .init(name: "in5", dataType: SGDataType.vector3f, connection: in5),
-                .init(name: "in6", dataType: SGDataType.vector3f, connection: in6),
-                .init(name: "in7", dataType: SGDataType.vector3f, connection: in7),
-                .init(name: "in8", dataType: SGDataType.vector3f, connection: in8),
-                .init(name: "in9", dataType: SGDataType.vector3f, connection: in9),
-                .init(name: "in10", dataType: SGDataType.vector3f, connection: in10),
-                .init(name: "which", dataType: SGDataType.int, connection: which),
+                .init(nameID: 43, dataType: SGDataType.vector3f, connection: in1),
+                .init(nameID: 45, dataType: SGDataType.vector3f, connection: in2),
+                .init(nameID: 46, dataType: SGDataType.vector3f, connection: in3),
+                .init(nameID: 47, dataType: SGDataType.vector3f, connection: in4),
+                .init(nameID: 48, dataType: SGDataType.vector3f, connection: in5),
+                .init(nameID: 49, dataType: SGDataType.vector3f, connection: in6),
+                .init(nameID: 50, dataType: SGDataType.vector3f, connection: in7),
+                .init(nameID: 51, dataType: SGDataType.vector3f, connection: in8),
+                .init(nameID: 52, dataType: SGDataType.vector3f, connection: in9),
+                .init(nameID: 44, dataType: SGDataType.vector3f, connection: in10),
+                .init(nameID: 135, dataType: SGDataType.int, connection: which),
             ],
             outputs: [.init(dataType: SGDataType.vector3f)])))
     }
     if SGDataType.vector4f.matches(in1) && SGDataType.vector4f.matches(in2) && SGDataType.vector4f.matches(in3) && SGDataType.vector4f.matches(in4) && SGDataType.vector4f.matches(in5) && SGDataType.vector4f.matches(in6) && SGDataType.vector4f.matches(in7) && SGDataType.vector4f.matches(in8) && SGDataType.vector4f.matches(in9) && SGDataType.vector4f.matches(in10) && SGDataType.float.matches(which) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_switch_vector4",
+            nodeTypeID: 887, // ND_switch_vector4
             inputs: [
-                .init(name: "in1", dataType: SGDataType.vector4f, connection: in1),
-                .init(name: "in2", dataType: SGDataType.vector4f, connection: in2),
-                .init(name: "in3", dataType: SGDataType.vector4f, connection: in3),
-                .init(name: "in4", dataType: SGDataType.vector4f, connection: in4),
-                .init(name: "in5", dataType: SGDataType.vector4f, connection: in5),
-                .init(name: "in6", dataType: SGDataType.vector4f, connection: in6),
-                .init(name: "in7", dataType: SGDataType.vector4f, connection: in7),
-                .init(name: "in8", dataType: SGDataType.vector4f, connection: in8),
-                .init(name: "in9", dataType: SGDataType.vector4f, connection: in9),
-                .init(name: "in10", dataType: SGDataType.vector4f, connection: in10),
-                .init(name: "which", dataType: SGDataType.float, connection: which),
+                .init(nameID: 43, dataType: SGDataType.vector4f, connection: in1),
+                .init(nameID: 45, dataType: SGDataType.vector4f, connection: in2),
+                .init(nameID: 46, dataType: SGDataType.vector4f, connection: in3),
+                .init(nameID: 47, dataType: SGDataType.vector4f, connection: in4),
+                .init(nameID: 48, dataType: SGDataType.vector4f, connection: in5),
+                .init(nameID: 49, dataType: SGDataType.vector4f, connection: in6),
+                .init(nameID: 50, dataType: SGDataType.vector4f, connection: in7),
+                .init(nameID: 51, dataType: SGDataType.vector4f, connection: in8),
+                .init(nameID: 52, dataType: SGDataType.vector4f, connection: in9),
+                .init(nameID: 44, dataType: SGDataType.vector4f, connection: in10),
+                .init(nameID: 135, dataType: SGDataType.float, connection: which),
             ],
             outputs: [.init(dataType: SGDataType.vector4f)])))
     }
     if SGDataType.vector4f.matches(in1) && SGDataType.vector4f.matches(in2) && SGDataType.vector4f.matches(in3) && SGDataType.vector4f.matches(in4) && SGDataType.vector4f.matches(in5) && SGDataType.vector4f.matches(in6) && SGDataType.vector4f.matches(in7) && SGDataType.vector4f.matches(in8) && SGDataType.vector4f.matches(in9) && SGDataType.vector4f.matches(in10) && SGDataType.int.matches(which) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_switch_vector4I",
+            nodeTypeID: 888, // ND_switch_vector4I
             inputs: [
-                .init(name: "in1", dataType: SGDataType.vector4f, connection: in1),
-                .init(name: "in2", dataType: SGDataType.vector4f, connection: in2),
-                .init(name: "in3", dataType: SGDataType.vector4f, connection: in3),
-                .init(name: "in4", dataType: SGDataType.vector4f, connection: in4),
-                .init(name: "in5", dataType: SGDataType.vector4f, connection: in5),
-                .init(name: "in6", dataType: SGDataType.vector4f, connection: in6),
-                .init(name: "in7", dataType: SGDataType.vector4f, connection: in7),
-                .init(name: "in8", dataType: SGDataType.vector4f, connection: in8),
-                .init(name: "in9", dataType: SGDataType.vector4f, connection: in9),
-                .init(name: "in10", dataType: SGDataType.vector4f, connection: in10),
-                .init(name: "which", dataType: SGDataType.int, connection: which),
+                .init(nameID: 43, dataType: SGDataType.vector4f, connection: in1),
+                .init(nameID: 45, dataType: SGDataType.vector4f, connection: in2),
+                .init(nameID: 46, dataType: SGDataType.vector4f, connection: in3),
+                .init(nameID: 47, dataType: SGDataType.vector4f, connection: in4),
+                .init(nameID: 48, dataType: SGDataType.vector4f, connection: in5),
+                .init(nameID: 49, dataType: SGDataType.vector4f, connection: in6),
+                .init(nameID: 50, dataType: SGDataType.vector4f, connection: in7),
+                .init(nameID: 51, dataType: SGDataType.vector4f, connection: in8),
+                .init(nameID: 52, dataType: SGDataType.vector4f, connection: in9),
+                .init(nameID: 44, dataType: SGDataType.vector4f, connection: in10),
+                .init(nameID: 135, dataType: SGDataType.int, connection: which),
             ],
             outputs: [.init(dataType: SGDataType.vector4f)])))
     }
@@ -7626,65 +7626,65 @@ public func switchValue<T>(_ in1: T, _ in2: T, _ in3: T, _ in4: T, _ in5: T, _ i
 public func tan<T>(_ in1: T) -> T where T: SGNumeric {
     if SGDataType.float.matches(in1) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_tan_float",
+            nodeTypeID: 934, // ND_tan_float
             inputs: [
-                .init(name: "in", dataType: SGDataType.float, connection: in1),
+                .init(nameID: 42, dataType: SGDataType.float, connection: in1),
             ],
             outputs: [.init(dataType: SGDataType.float)])))
     }
     if SGDataType.half.matches(in1) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_tan_half",
+            nodeTypeID: 935, // ND_tan_half
             inputs: [
-                .init(name: "in", dataType: SGDataType.half, connection: in1),
+                .init(nameID: 42, dataType: SGDataType.half, connection: in1),
             ],
             outputs: [.init(dataType: SGDataType.half)])))
     }
     if SGDataType.vector2h.matches(in1) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_tan_half2",
+            nodeTypeID: 936, // ND_tan_half2
             inputs: [
-                .init(name: "in", dataType: SGDataType.vector2h, connection: in1),
+                .init(nameID: 42, dataType: SGDataType.vector2h, connection: in1),
             ],
             outputs: [.init(dataType: SGDataType.vector2h)])))
     }
     if SGDataType.vector3h.matches(in1) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_tan_half3",
+            nodeTypeID: 937, // ND_tan_half3
             inputs: [
-                .init(name: "in", dataType: SGDataType.vector3h, connection: in1),
+                .init(nameID: 42, dataType: SGDataType.vector3h, connection: in1),
             ],
             outputs: [.init(dataType: SGDataType.vector3h)])))
     }
     if SGDataType.vector4h.matches(in1) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_tan_half4",
+            nodeTypeID: 938, // ND_tan_half4
             inputs: [
-                .init(name: "in", dataType: SGDataType.vector4h, connection: in1),
+                .init(nameID: 42, dataType: SGDataType.vector4h, connection: in1),
             ],
             outputs: [.init(dataType: SGDataType.vector4h)])))
     }
     if SGDataType.vector2f.matches(in1) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_tan_vector2",
+            nodeTypeID: 939, // ND_tan_vector2
             inputs: [
-                .init(name: "in", dataType: SGDataType.vector2f, connection: in1),
+                .init(nameID: 42, dataType: SGDataType.vector2f, connection: in1),
             ],
             outputs: [.init(dataType: SGDataType.vector2f)])))
     }
     if SGDataType.vector3f.matches(in1) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_tan_vector3",
+            nodeTypeID: 940, // ND_tan_vector3
             inputs: [
-                .init(name: "in", dataType: SGDataType.vector3f, connection: in1),
+                .init(nameID: 42, dataType: SGDataType.vector3f, connection: in1),
             ],
             outputs: [.init(dataType: SGDataType.vector3f)])))
     }
     if SGDataType.vector4f.matches(in1) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_tan_vector4",
+            nodeTypeID: 941, // ND_tan_vector4
             inputs: [
-                .init(name: "in", dataType: SGDataType.vector4f, connection: in1),
+                .init(nameID: 42, dataType: SGDataType.vector4f, connection: in1),
             ],
             outputs: [.init(dataType: SGDataType.vector4f)])))
     }
@@ -7712,106 +7712,106 @@ public func tiledImage<T>(file: SGTexture, defaultValue: T, texcoord: SGVector?
     }
     if SGDataType.color3f.matches(defaultValue) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_tiledimage_color3",
+            nodeTypeID: 945, // ND_tiledimage_color3
             inputs: [
-                .init(name: "file", dataType: SGDataType.asset, connection: file),
-                .init(name: "default", dataType: SGDataType.color3f, connection: defaultValue),
-                .init(name: "texcoord", dataType: SGDataType.vector2f, connection: texcoord),
-                .init(name: "uvtiling", dataType: SGDataType.vector2f, connection: uvtiling),
-                .init(name: "uvoffset", dataType: SGDataType.vector2f, connection: uvoffset),
-                .init(name: "realworldimagesize", dataType: SGDataType.vector2f, connection: realworldimagesize),
-                .init(name: "realworldtilesize", dataType: SGDataType.vector2f, connection: realworldtilesize),
-                .init(name: "filtertype", dataType: SGDataType.string, connection: SGString(source: .constant(.string(filtertype.rawValue)))),
+                .init(nameID: 27, dataType: SGDataType.asset, connection: file),
+                .init(nameID: 16, dataType: SGDataType.color3f, connection: defaultValue),
+                .init(nameID: 104, dataType: SGDataType.vector2f, connection: texcoord),
+                .init(nameID: 119, dataType: SGDataType.vector2f, connection: uvtiling),
+                .init(nameID: 118, dataType: SGDataType.vector2f, connection: uvoffset),
+                .init(nameID: 91, dataType: SGDataType.vector2f, connection: realworldimagesize),
+                .init(nameID: 92, dataType: SGDataType.vector2f, connection: realworldtilesize),
+                .init(nameID: 32, dataType: SGDataType.string, connection: SGString(source: .constant(.string(filtertype.rawValue)))),
             ],
             outputs: [.init(dataType: SGDataType.color3f)])))
     }
     if SGDataType.color4f.matches(defaultValue) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_tiledimage_color4",
+            nodeTypeID: 946, // ND_tiledimage_color4
             inputs: [
-                .init(name: "file", dataType: SGDataType.asset, connection: file),
-                .init(name: "default", dataType: SGDataType.color4f, connection: defaultValue),
-                .init(name: "texcoord", dataType: SGDataType.vector2f, connection: texcoord),
-                .init(name: "uvtiling", dataType: SGDataType.vector2f, connection: uvtiling),
-                .init(name: "uvoffset", dataType: SGDataType.vector2f, connection: uvoffset),
-                .init(name: "realworldimagesize", dataType: SGDataType.vector2f, connection: realworldimagesize),
-                .init(name: "realworldtilesize", dataType: SGDataType.vector2f, connection: realworldtilesize),
-                .init(name: "filtertype", dataType: SGDataType.string, connection: SGString(source: .constant(.string(filtertype.rawValue)))),
+                .init(nameID: 27, dataType: SGDataType.asset, connection: file),
+                .init(nameID: 16, dataType: SGDataType.color4f, connection: defaultValue),
+                .init(nameID: 104, dataType: SGDataType.vector2f, connection: texcoord),
+                .init(nameID: 119, dataType: SGDataType.vector2f, connection: uvtiling),
+                .init(nameID: 118, dataType: SGDataType.vector2f, connection: uvoffset),
+                .init(nameID: 91, dataType: SGDataType.vector2f, connection: realworldimagesize),
+                .init(nameID: 92, dataType: SGDataType.vector2f, connection: realworldtilesize),
+                .init(nameID: 32, dataType: SGDataType.string, connection: SGString(source: .constant(.string(filtertype.rawValue)))),
             ],
             outputs: [.init(dataType: SGDataType.color4f)])))
     }
     if SGDataType.float.matches(defaultValue) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_tiledimage_float",
+            nodeTypeID: 947, // ND_tiledimage_float
             inputs: [
-                .init(name: "file", dataType: SGDataType.asset, connection: file),
-                .init(name: "default", dataType: SGDataType.float, connection: defaultValue),
-                .init(name: "texcoord", dataType: SGDataType.vector2f, connection: texcoord),
-                .init(name: "uvtiling", dataType: SGDataType.vector2f, connection: uvtiling),
-                .init(name: "uvoffset", dataType: SGDataType.vector2f, connection: uvoffset),
-                .init(name: "realworldimagesize", dataType: SGDataType.vector2f, connection: realworldimagesize),
-                .init(name: "realworldtilesize", dataType: SGDataType.vector2f, connection: realworldtilesize),
-                .init(name: "filtertype", dataType: SGDataType.string, connection: SGString(source: .constant(.string(filtertype.rawValue)))),
+                .init(nameID: 27, dataType: SGDataType.asset, connection: file),
+                .init(nameID: 16, dataType: SGDataType.float, connection: defaultValue),
+                .init(nameID: 104, dataType: SGDataType.vector2f, connection: texcoord),
+                .init(nameID: 119, dataType: SGDataType.vector2f, connection: uvtiling),
+                .init(nameID: 118, dataType: SGDataType.vector2f, connection: uvoffset),
+                .init(nameID: 91, dataType: SGDataType.vector2f, connection: realworldimagesize),
+                .init(nameID: 92, dataType: SGDataType.vector2f, connection: realworldtilesize),
+                .init(nameID: 32, dataType: SGDataType.string, connection: SGString(source: .constant(.string(filtertype.rawValue)))),
             ],
             outputs: [.init(dataType: SGDataType.float)])))
     }
     if SGDataType.half.matches(defaultValue) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_tiledimage_half",
+            nodeTypeID: 948, // ND_tiledimage_half
             inputs: [
-                .init(name: "file", dataType: SGDataType.asset, connection: file),
-                .init(name: "default", dataType: SGDataType.half, connection: defaultValue),
-                .init(name: "texcoord", dataType: SGDataType.vector2f, connection: texcoord),
-                .init(name: "uvtiling", dataType: SGDataType.vector2f, connection: uvtiling),
-                .init(name: "uvoffset", dataType: SGDataType.vector2f, connection: uvoffset),
-                .init(name: "realworldimagesize", dataType: SGDataType.vector2f, connection: realworldimagesize),
-                .init(name: "realworldtilesize", dataType: SGDataType.vector2f, connection: realworldtilesize),
-                .init(name: "filtertype", dataType: SGDataType.string, connection: SGString(source: .constant(.string(filtertype.rawValue)))),
+                .init(nameID: 27, dataType: SGDataType.asset, connection: file),
+                .init(nameID: 16, dataType: SGDataType.half, connection: defaultValue),
+                .init(nameID: 104, dataType: SGDataType.vector2f, connection: texcoord),
+                .init(nameID: 119, dataType: SGDataType.vector2f, connection: uvtiling),
+                .init(nameID: 118, dataType: SGDataType.vector2f, connection: uvoffset),
+                .init(nameID: 91, dataType: SGDataType.vector2f, connection: realworldimagesize),
+                .init(nameID: 92, dataType: SGDataType.vector2f, connection: realworldtilesize),
+                .init(nameID: 32, dataType: SGDataType.string, connection: SGString(source: .constant(.string(filtertype.rawValue)))),
             ],
             outputs: [.init(dataType: SGDataType.half)])))
     }
     if SGDataType.vector2f.matches(defaultValue) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_tiledimage_vector2",
+            nodeTypeID: 949, // ND_tiledimage_vector2
             inputs: [
-                .init(name: "file", dataType: SGDataType.asset, connection: file),
-                .init(name: "default", dataType: SGDataType.vector2f, connection: defaultValue),
-                .init(name: "texcoord", dataType: SGDataType.vector2f, connection: texcoord),
-                .init(name: "uvtiling", dataType: SGDataType.vector2f, connection: uvtiling),
-                .init(name: "uvoffset", dataType: SGDataType.vector2f, connection: uvoffset),
-                .init(name: "realworldimagesize", dataType: SGDataType.vector2f, connection: realworldimagesize),
-                .init(name: "realworldtilesize", dataType: SGDataType.vector2f, connection: realworldtilesize),
-                .init(name: "filtertype", dataType: SGDataType.string, connection: SGString(source: .constant(.string(filtertype.rawValue)))),
+                .init(nameID: 27, dataType: SGDataType.asset, connection: file),
+                .init(nameID: 16, dataType: SGDataType.vector2f, connection: defaultValue),
+                .init(nameID: 104, dataType: SGDataType.vector2f, connection: texcoord),
+                .init(nameID: 119, dataType: SGDataType.vector2f, connection: uvtiling),
+                .init(nameID: 118, dataType: SGDataType.vector2f, connection: uvoffset),
+                .init(nameID: 91, dataType: SGDataType.vector2f, connection: realworldimagesize),
+                .init(nameID: 92, dataType: SGDataType.vector2f, connection: realworldtilesize),
+                .init(nameID: 32, dataType: SGDataType.string, connection: SGString(source: .constant(.string(filtertype.rawValue)))),
             ],
             outputs: [.init(dataType: SGDataType.vector2f)])))
     }
     if SGDataType.vector3f.matches(defaultValue) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_tiledimage_vector3",
+            nodeTypeID: 950, // ND_tiledimage_vector3
             inputs: [
-                .init(name: "file", dataType: SGDataType.asset, connection: file),
-                .init(name: "default", dataType: SGDataType.vector3f, connection: defaultValue),
-                .init(name: "texcoord", dataType: SGDataType.vector2f, connection: texcoord),
-                .init(name: "uvtiling", dataType: SGDataType.vector2f, connection: uvtiling),
-                .init(name: "uvoffset", dataType: SGDataType.vector2f, connection: uvoffset),
-                .init(name: "realworldimagesize", dataType: SGDataType.vector2f, connection: realworldimagesize),
-                .init(name: "realworldtilesize", dataType: SGDataType.vector2f, connection: realworldtilesize),
-                .init(name: "filtertype", dataType: SGDataType.string, connection: SGString(source: .constant(.string(filtertype.rawValue)))),
+                .init(nameID: 27, dataType: SGDataType.asset, connection: file),
+                .init(nameID: 16, dataType: SGDataType.vector3f, connection: defaultValue),
+                .init(nameID: 104, dataType: SGDataType.vector2f, connection: texcoord),
+                .init(nameID: 119, dataType: SGDataType.vector2f, connection: uvtiling),
+                .init(nameID: 118, dataType: SGDataType.vector2f, connection: uvoffset),
+                .init(nameID: 91, dataType: SGDataType.vector2f, connection: realworldimagesize),
+                .init(nameID: 92, dataType: SGDataType.vector2f, connection: realworldtilesize),
+                .init(nameID: 32, dataType: SGDataType.string, connection: SGString(source: .constant(.string(filtertype.rawValue)))),
             ],
             outputs: [.init(dataType: SGDataType.vector3f)])))
     }
     if SGDataType.vector4f.matches(defaultValue) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_tiledimage_vector4",
+            nodeTypeID: 951, // ND_tiledimage_vector4
             inputs: [
-                .init(name: "file", dataType: SGDataType.asset, connection: file),
-                .init(name: "default", dataType: SGDataType.vector4f, connection: defaultValue),
-                .init(name: "texcoord", dataType: SGDataType.vector2f, connection: texcoord),
-                .init(name: "uvtiling", dataType: SGDataType.vector2f, connection: uvtiling),
-                .init(name: "uvoffset", dataType: SGDataType.vector2f, connection: uvoffset),
-                .init(name: "realworldimagesize", dataType: SGDataType.vector2f, connection: realworldimagesize),
-                .init(name: "realworldtilesize", dataType: SGDataType.vector2f, connection: realworldtilesize),
-                .init(name: "filtertype", dataType: SGDataType.string, connection: SGString(source: .constant(.string(filtertype.rawValue)))),
+                .init(nameID: 27, dataType: SGDataType.asset, connection: file),
+                .init(nameID: 16, dataType: SGDataType.vector4f, connection: defaultValue),
+                .init(nameID: 104, dataType: SGDataType.vector2f, connection: texcoord),
+                .init(nameID: 119, dataType: SGDataType.vector2f, connection: uvtiling),
+                .init(nameID: 118, dataType: SGDataType.vector2f, connection: uvoffset),
+                .init(nameID: 91, dataType: SGDataType.vector2f, connection: realworldimagesize),
+                .init(nameID: 92, dataType: SGDataType.vector2f, connection: realworldtilesize),
+                .init(nameID: 32, dataType: SGDataType.string, connection: SGString(source: .constant(.string(filtertype.rawValue)))),
             ],
             outputs: [.init(dataType: SGDataType.vector4f)])))
     }
@@ -7821,46 +7821,46 @@ public func tiledImage<T>(file: SGTexture, defaultValue: T, texcoord: SGVector?
 public func transformMatrix(_ in1: SGVector, mat: SGMatrix) -> SGVector {
     if SGDataType.vector2f.matches(in1) && SGDataType.matrix2d.matches(mat) {
         return SGVector(source: .nodeOutput(SGNode(
-            nodeType: "ND_transformmatrix_vector2",
+            nodeTypeID: 953, // ND_transformmatrix_vector2
             inputs: [
-                .init(name: "in", dataType: SGDataType.vector2f, connection: in1),
-                .init(name: "mat", dataType: SGDataType.matrix2d, connection: mat),
+                .init(nameID: 42, dataType: SGDataType.vector2f, connection: in1),
+                .init(nameID: 69, dataType: SGDataType.matrix2d, connection: mat),
             ],
             outputs: [.init(dataType: SGDataType.vector2f)])))
     }
     if SGDataType.vector2f.matches(in1) && SGDataType.matrix3d.matches(mat) {
         return SGVector(source: .nodeOutput(SGNode(
-            nodeType: "ND_transformmatrix_vector2M3",
+            nodeTypeID: 954, // ND_transformmatrix_vector2M3
             inputs: [
-                .init(name: "in", dataType: SGDataType.vector2f, connection: in1),
-                .init(name: "mat", dataType: SGDataType.matrix3d, connection: mat),
+                .init(nameID: 42, dataType: SGDataType.vector2f, connection: in1),
+                .init(nameID: 69, dataType: SGDataType.matrix3d, connection: mat),
             ],
             outputs: [.init(dataType: SGDataType.vector2f)])))
     }
     if SGDataType.vector3f.matches(in1) && SGDataType.matrix3d.matches(mat) {
         return SGVector(source: .nodeOutput(SGNode(
-            nodeType: "ND_transformmatrix_vector3",
+            nodeTypeID: 955, // ND_transformmatrix_vector3
             inputs: [
-                .init(name: "in", dataType: SGDataType.vector3f, connection: in1),
-                .init(name: "mat", dataType: SGDataType.matrix3d, connection: mat),
+                .init(nameID: 42, dataType: SGDataType.vector3f, connection: in1),
+                .init(nameID: 69, dataType: SGDataType.matrix3d, connection: mat),
             ],
             outputs: [.init(dataType: SGDataType.vector3f)])))
     }
     if SGDataType.vector3f.matches(in1) && SGDataType.matrix4d.matches(mat) {
         return SGVector(source: .nodeOutput(SGNode(
-            nodeType: "ND_transformmatrix_vector3M4",
+            nodeTypeID: 956, // ND_transformmatrix_vector3M4
             inputs: [
-                .init(name: "in", dataType: SGDataType.vector3f, connection: in1),
-                .init(name: "mat", dataType: SGDataType.matrix4d, connection: mat),
+                .init(nameID: 42, dataType: SGDataType.vector3f, connection: in1),
+                .init(nameID: 69, dataType: SGDataType.matrix4d, connection: mat),
             ],
             outputs: [.init(dataType: SGDataType.vector3f)])))
     }
     if SGDataType.vector4f.matches(in1) && SGDataType.matrix4d.matches(mat) {
         return SGVector(source: .nodeOutput(SGNode(
-            nodeType: "ND_transformmatrix_vector4",
+            nodeTypeID: 957, // ND_transformmatrix_vector4
             inputs: [
-                .init(name: "in", dataType: SGDataType.vector4f, connection: in1),
-                .init(name: "mat", dataType: SGDataType.matrix4d, connection: mat),
+                .init(nameID: 42, dataType: SGDataType.vector4f, connection: in1),
+                .init(nameID: 69, dataType: SGDataType.matrix4d, connection: mat),
             ],
             outputs: [.init(dataType: SGDataType.vector4f)])))
     }
@@ -7872,11 +7872,11 @@ public func transformNormal(_ in1: SGVector, fromspace: SGTransformSpace, tospac
         return SGVector(source: .error("Invalid transformNormal input. Expected in1 data type to be SGDataType.vector3f, but got \(in1.dataType).", values: [in1]))
     }
     return SGVector(source: .nodeOutput(SGNode(
-        nodeType: "ND_transformnormal_vector3",
+        nodeTypeID: 958, // ND_transformnormal_vector3
         inputs: [
-            .init(name: "in", dataType: SGDataType.vector3f, connection: in1),
-            .init(name: "fromspace", dataType: SGDataType.string, connection: SGString(source: .constant(.string(fromspace.rawValue)))),
-            .init(name: "tospace", dataType: SGDataType.string, connection: SGString(source: .constant(.string(tospace.rawValue)))),
+            .init(nameID: 42, dataType: SGDataType.vector3f, connection: in1),
+            .init(nameID: 33, dataType: SGDataType.string, connection: SGString(source: .constant(.string(fromspace.rawValue)))),
+            .init(nameID: 105, dataType: SGDataType.string, connection: SGString(source: .constant(.string(tospace.rawValue)))),
         ],
         outputs: [.init(dataType: SGDataType.vector3f)])))
 }
@@ -7886,11 +7886,11 @@ public func transformPoint(_ in1: SGVector, fromspace: SGTransformSpace, tospace
         return SGVector(source: .error("Invalid transformPoint input. Expected in1 data type to be SGDataType.vector3f, but got \(in1.dataType).", values: [in1]))
     }
     return SGVector(source: .nodeOutput(SGNode(
-        nodeType: "ND_transformpoint_vector3",
+        nodeTypeID: 959, // ND_transformpoint_vector3
         inputs: [
-            .init(name: "in", dataType: SGDataType.vector3f, connection: in1),
-            .init(name: "fromspace", dataType: SGDataType.string, connection: SGString(source: .constant(.string(fromspace.rawValue)))),
-            .init(name: "tospace", dataType: SGDataType.string, connection: SGString(source: .constant(.string(tospace.rawValue)))),
+            .init(nameID: 42, dataType: SGDataType.vector3f, connection: in1),
+            .init(nameID: 33, dataType: SGDataType.string, connection: SGString(source: .constant(.string(fromspace.rawValue)))),
+            .init(nameID: 105, dataType: SGDataType.string, connection: SGString(source: .constant(.string(tospace.rawValue)))),
         ],
         outputs: [.init(dataType: SGDataType.vector3f)])))
 }
@@ -7900,11 +7900,11 @@ public func transformVector(_ in1: SGVector, fromspace: SGTransformSpace, tospac
         return SGVector(source: .error("Invalid transformVector input. Expected in1 data type to be SGDataType.vector3f, but got \(in1.dataType).", values: [in1]))
     }
     return SGVector(source: .nodeOutput(SGNode(
-        nodeType: "ND_transformvector_vector3",
+        nodeTypeID: 960, // ND_transformvector_vector3
         inputs: [
-            .init(name: "in", dataType: SGDataType.vector3f, connection: in1),
-            .init(name: "fromspace", dataType: SGDataType.string, connection: SGString(source: .constant(.string(fromspace.rawValue)))),
-            .init(name: "tospace", dataType: SGDataType.string, connection: SGString(source: .constant(.string(tospace.rawValue)))),
+            .init(nameID: 42, dataType: SGDataType.vector3f, connection: in1),
+            .init(nameID: 33, dataType: SGDataType.string, connection: SGString(source: .constant(.string(fromspace.rawValue)))),
+            .init(nameID: 105, dataType: SGDataType.string, connection: SGString(source: .constant(.string(tospace.rawValue)))),
         ],
         outputs: [.init(dataType: SGDataType.vector3f)])))
 }
@@ -7912,25 +7912,25 @@ public func transformVector(_ in1: SGVector, fromspace: SGTransformSpace, tospac
 public func transpose(_ in1: SGMatrix) -> SGMatrix {
     if SGDataType.matrix2d.matches(in1) {
         return SGMatrix(source: .nodeOutput(SGNode(
-            nodeType: "ND_transpose_matrix22",
+            nodeTypeID: 961, // ND_transpose_matrix22
             inputs: [
-                .init(name: "in", dataType: SGDataType.matrix2d, connection: in1),
+                .init(nameID: 42, dataType: SGDataType.matrix2d, connection: in1),
             ],
             outputs: [.init(dataType: SGDataType.matrix2d)])))
     }
     if SGDataType.matrix3d.matches(in1) {
         return SGMatrix(source: .nodeOutput(SGNode(
-            nodeType: "ND_transpose_matrix33",
+            nodeTypeID: 962, // ND_transpose_matrix33
             inputs: [
-                .init(name: "in", dataType: SGDataType.matrix3d, connection: in1),
+                .init(nameID: 42, dataType: SGDataType.matrix3d, connection: in1),
             ],
             outputs: [.init(dataType: SGDataType.matrix3d)])))
     }
     if SGDataType.matrix4d.matches(in1) {
         return SGMatrix(source: .nodeOutput(SGNode(
-            nodeType: "ND_transpose_matrix44",
+            nodeTypeID: 963, // ND_transpose_matrix44
             inputs: [
-                .init(name: "in", dataType: SGDataType.matrix4d, connection: in1),
+                .init(nameID: 42, dataType: SGDataType.matrix4d, connection: in1),
             ],
             outputs: [.init(dataType: SGDataType.matrix4d)])))
     }
@@ -7955,85 +7955,85 @@ public func triplanarProjection<T>(filex: SGTexture, filey: SGTexture, filez: SG
     }
     if SGDataType.color3f.matches(defaultValue) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_triplanarprojection_color3",
+            nodeTypeID: 964, // ND_triplanarprojection_color3
             inputs: [
-                .init(name: "filex", dataType: SGDataType.asset, connection: filex),
-                .init(name: "filey", dataType: SGDataType.asset, connection: filey),
-                .init(name: "filez", dataType: SGDataType.asset, connection: filez),
-                .init(name: "default", dataType: SGDataType.color3f, connection: defaultValue),
-                .init(name: "position", dataType: SGDataType.vector3f, connection: position),
-                .init(name: "normal", dataType: SGDataType.vector3f, connection: normal),
-                .init(name: "filtertype", dataType: SGDataType.string, connection: SGString(source: .constant(.string(filtertype.rawValue)))),
+                .init(nameID: 28, dataType: SGDataType.asset, connection: filex),
+                .init(nameID: 29, dataType: SGDataType.asset, connection: filey),
+                .init(nameID: 30, dataType: SGDataType.asset, connection: filez),
+                .init(nameID: 16, dataType: SGDataType.color3f, connection: defaultValue),
+                .init(nameID: 90, dataType: SGDataType.vector3f, connection: position),
+                .init(nameID: 80, dataType: SGDataType.vector3f, connection: normal),
+                .init(nameID: 32, dataType: SGDataType.string, connection: SGString(source: .constant(.string(filtertype.rawValue)))),
             ],
             outputs: [.init(dataType: SGDataType.color3f)])))
     }
     if SGDataType.color4f.matches(defaultValue) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_triplanarprojection_color4",
+            nodeTypeID: 965, // ND_triplanarprojection_color4
             inputs: [
-                .init(name: "filex", dataType: SGDataType.asset, connection: filex),
-                .init(name: "filey", dataType: SGDataType.asset, connection: filey),
-                .init(name: "filez", dataType: SGDataType.asset, connection: filez),
-                .init(name: "default", dataType: SGDataType.color4f, connection: defaultValue),
-                .init(name: "position", dataType: SGDataType.vector3f, connection: position),
-                .init(name: "normal", dataType: SGDataType.vector3f, connection: normal),
-                .init(name: "filtertype", dataType: SGDataType.string, connection: SGString(source: .constant(.string(filtertype.rawValue)))),
+                .init(nameID: 28, dataType: SGDataType.asset, connection: filex),
+                .init(nameID: 29, dataType: SGDataType.asset, connection: filey),
+                .init(nameID: 30, dataType: SGDataType.asset, connection: filez),
+                .init(nameID: 16, dataType: SGDataType.color4f, connection: defaultValue),
+                .init(nameID: 90, dataType: SGDataType.vector3f, connection: position),
+                .init(nameID: 80, dataType: SGDataType.vector3f, connection: normal),
+                .init(nameID: 32, dataType: SGDataType.string, connection: SGString(source: .constant(.string(filtertype.rawValue)))),
             ],
             outputs: [.init(dataType: SGDataType.color4f)])))
     }
     if SGDataType.float.matches(defaultValue) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_triplanarprojection_float",
+            nodeTypeID: 966, // ND_triplanarprojection_float
             inputs: [
-                .init(name: "filex", dataType: SGDataType.asset, connection: filex),
-                .init(name: "filey", dataType: SGDataType.asset, connection: filey),
-                .init(name: "filez", dataType: SGDataType.asset, connection: filez),
-                .init(name: "default", dataType: SGDataType.float, connection: defaultValue),
-                .init(name: "position", dataType: SGDataType.vector3f, connection: position),
-                .init(name: "normal", dataType: SGDataType.vector3f, connection: normal),
-                .init(name: "filtertype", dataType: SGDataType.string, connection: SGString(source: .constant(.string(filtertype.rawValue)))),
+                .init(nameID: 28, dataType: SGDataType.asset, connection: filex),
+                .init(nameID: 29, dataType: SGDataType.asset, connection: filey),
+                .init(nameID: 30, dataType: SGDataType.asset, connection: filez),
+                .init(nameID: 16, dataType: SGDataType.float, connection: defaultValue),
+                .init(nameID: 90, dataType: SGDataType.vector3f, connection: position),
+                .init(nameID: 80, dataType: SGDataType.vector3f, connection: normal),
+                .init(nameID: 32, dataType: SGDataType.string, connection: SGString(source: .constant(.string(filtertype.rawValue)))),
             ],
             outputs: [.init(dataType: SGDataType.float)])))
     }
     if SGDataType.vector2f.matches(defaultValue) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_triplanarprojection_vector2",
+            nodeTypeID: 967, // ND_triplanarprojection_vector2
             inputs: [
-                .init(name: "filex", dataType: SGDataType.asset, connection: filex),
-                .init(name: "filey", dataType: SGDataType.asset, connection: filey),
-                .init(name: "filez", dataType: SGDataType.asset, connection: filez),
-                .init(name: "default", dataType: SGDataType.vector2f, connection: defaultValue),
-                .init(name: "position", dataType: SGDataType.vector3f, connection: position),
-                .init(name: "normal", dataType: SGDataType.vector3f, connection: normal),
-                .init(name: "filtertype", dataType: SGDataType.string, connection: SGString(source: .constant(.string(filtertype.rawValue)))),
+                .init(nameID: 28, dataType: SGDataType.asset, connection: filex),
+                .init(nameID: 29, dataType: SGDataType.asset, connection: filey),
+                .init(nameID: 30, dataType: SGDataType.asset, connection: filez),
+                .init(nameID: 16, dataType: SGDataType.vector2f, connection: defaultValue),
+                .init(nameID: 90, dataType: SGDataType.vector3f, connection: position),
+                .init(nameID: 80, dataType: SGDataType.vector3f, connection: normal),
+                .init(nameID: 32, dataType: SGDataType.string, connection: SGString(source: .constant(.string(filtertype.rawValue)))),
             ],
             outputs: [.init(dataType: SGDataType.vector2f)])))
     }
     if SGDataType.vector3f.matches(defaultValue) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_triplanarprojection_vector3",
+            nodeTypeID: 968, // ND_triplanarprojection_vector3
             inputs: [
-                .init(name: "filex", dataType: SGDataType.asset, connection: filex),
-                .init(name: "filey", dataType: SGDataType.asset, connection: filey),
-                .init(name: "filez", dataType: SGDataType.asset, connection: filez),
-                .init(name: "default", dataType: SGDataType.vector3f, connection: defaultValue),
-                .init(name: "position", dataType: SGDataType.vector3f, connection: position),
-                .init(name: "normal", dataType: SGDataType.vector3f, connection: normal),
-                .init(name: "filtertype", dataType: SGDataType.string, connection: SGString(source: .constant(.string(filtertype.rawValue)))),
+                .init(nameID: 28, dataType: SGDataType.asset, connection: filex),
+                .init(nameID: 29, dataType: SGDataType.asset, connection: filey),
+                .init(nameID: 30, dataType: SGDataType.asset, connection: filez),
+                .init(nameID: 16, dataType: SGDataType.vector3f, connection: defaultValue),
+                .init(nameID: 90, dataType: SGDataType.vector3f, connection: position),
+                .init(nameID: 80, dataType: SGDataType.vector3f, connection: normal),
+                .init(nameID: 32, dataType: SGDataType.string, connection: SGString(source: .constant(.string(filtertype.rawValue)))),
             ],
             outputs: [.init(dataType: SGDataType.vector3f)])))
     }
     if SGDataType.vector4f.matches(defaultValue) {
         return T(source: .nodeOutput(SGNode(
-            nodeType: "ND_triplanarprojection_vector4",
+            nodeTypeID: 969, // ND_triplanarprojection_vector4
             inputs: [
-                .init(name: "filex", dataType: SGDataType.asset, connection: filex),
-                .init(name: "filey", dataType: SGDataType.asset, connection: filey),
-                .init(name: "filez", dataType: SGDataType.asset, connection: filez),
-                .init(name: "default", dataType: SGDataType.vector4f, connection: defaultValue),
-                .init(name: "position", dataType: SGDataType.vector3f, connection: position),
-                .init(name: "normal", dataType: SGDataType.vector3f, connection: normal),
-                .init(name: "filtertype", dataType: SGDataType.string, connection: SGString(source: .constant(.string(filtertype.rawValue)))),
+                .init(nameID: 28, dataType: SGDataType.asset, connection: filex),
+                .init(nameID: 29, dataType: SGDataType.asset, connection: filey),
+                .init(nameID: 30, dataType: SGDataType.asset, connection: filez),
+                .init(nameID: 16, dataType: SGDataType.vector4f, connection: defaultValue),
+                .init(nameID: 90, dataType: SGDataType.vector3f, connection: position),
+                .init(nameID: 80, dataType: SGDataType.vector3f, connection: normal),
+                .init(nameID: 32, dataType: SGDataType.string, connection: SGString(source: .constant(.string(filtertype.rawValue)))),
             ],
             outputs: [.init(dataType: SGDataType.vector4f)])))
     }
@@ -8051,13 +8051,13 @@ public func unlitSurface(color: SGColor? = nil, opacity: SGScalar? = nil, opacit
         return SGToken(source: .error("Invalid unlitSurface input. Expected opacityThreshold data type to be SGDataType.float, but got \(opacityThreshold?.dataType.rawValue ?? "nil").", values: [opacityThreshold]))
     }
     return SGToken(source: .nodeOutput(SGNode(
-        nodeType: "ND_realitykit_unlit_surfaceshader",
+        nodeTypeID: 738, // ND_realitykit_unlit_surfaceshader
         inputs: [
-            .init(name: "color", dataType: SGDataType.color3f, connection: color),
-            .init(name: "opacity", dataType: SGDataType.float, connection: opacity),
-            .init(name: "opacityThreshold", dataType: SGDataType.float, connection: opacityThreshold),
-            .init(name: "applyPostProcessToneMap", dataType: SGDataType.bool, connection: SGValue(source: .constant(.bool(applyPostProcessToneMap)))),
-            .init(name: "hasPremultipliedAlpha", dataType: SGDataType.bool, connection: SGValue(source: .constant(.bool(hasPremultipliedAlpha)))),
+            .init(nameID: 14, dataType: SGDataType.color3f, connection: color),
+            .init(nameID: 85, dataType: SGDataType.float, connection: opacity),
+            .init(nameID: 86, dataType: SGDataType.float, connection: opacityThreshold),
+            .init(nameID: 3, dataType: SGDataType.bool, connection: SGValue(source: .constant(.bool(applyPostProcessToneMap)))),
+            .init(nameID: 40, dataType: SGDataType.bool, connection: SGValue(source: .constant(.bool(hasPremultipliedAlpha)))),
         ],
         outputs: [.init(dataType: SGDataType.token)])))
 }
@@ -8067,9 +8067,9 @@ public func unpremult(_ in1: SGColor) -> SGColor {
         return SGColor(source: .error("Invalid unpremult input. Expected in1 data type to be SGDataType.color4f, but got \(in1.dataType).", values: [in1]))
     }
     return SGColor(source: .nodeOutput(SGNode(
-        nodeType: "ND_unpremult_color4",
+        nodeTypeID: 970, // ND_unpremult_color4
         inputs: [
-            .init(name: "in", dataType: SGDataType.color4f, connection: in1),
+            .init(nameID: 42, dataType: SGDataType.color4f, connection: in1),
         ],
         outputs: [.init(dataType: SGDataType.color4f)])))
 }
@@ -8082,10 +8082,10 @@ public func worleyNoise2DFloat(texcoord: SGVector? = nil, jitter: SGScalar? = ni
         return SGScalar(source: .error("Invalid worleyNoise2DFloat input. Expected jitter data type to be SGDataType.float, but got \(jitter?.dataType.rawValue ?? "nil").", values: [jitter]))
     }
     return SGScalar(source: .nodeOutput(SGNode(
-        nodeType: "ND_worleynoise2d_float",
+        nodeTypeID: 973, // ND_worleynoise2d_float
         inputs: [
-            .init(name: "texcoord", dataType: SGDataType.vector2f, connection: texcoord),
-            .init(name: "jitter", dataType: SGDataType.float, connection: jitter),
+            .init(nameID: 104, dataType: SGDataType.vector2f, connection: texcoord),
+            .init(nameID: 59, dataType: SGDataType.float, connection: jitter),
         ],
         outputs: [.init(dataType: SGDataType.float)])))
 }
@@ -8098,10 +8098,10 @@ public func worleyNoise2DVector2(texcoord: SGVector? = nil, jitter: SGScalar? =
         return SGVector(source: .error("Invalid worleyNoise2DVector2 input. Expected jitter data type to be SGDataType.float, but got \(jitter?.dataType.rawValue ?? "nil").", values: [jitter]))
     }
     return SGVector(source: .nodeOutput(SGNode(
-        nodeType: "ND_worleynoise2d_vector2",
+        nodeTypeID: 974, // ND_worleynoise2d_vector2
         inputs: [
-            .init(name: "texcoord", dataType: SGDataType.vector2f, connection: texcoord),
-            .init(name: "jitter", dataType: SGDataType.float, connection: jitter),
+            .init(nameID: 104, dataType: SGDataType.vector2f, connection: texcoord),
+            .init(nameID: 59, dataType: SGDataType.float, connection: jitter),
         ],
         outputs: [.init(dataType: SGDataType.vector2f)])))
 }
@@ -8114,10 +8114,10 @@ public func worleyNoise2DVector3(texcoord: SGVector? = nil, jitter: SGScalar? =
         return SGVector(source: .error("Invalid worleyNoise2DVector3 input. Expected jitter data type to be SGDataType.float, but got \(jitter?.dataType.rawValue ?? "nil").", values: [jitter]))
     }
     return SGVector(source: .nodeOutput(SGNode(
-        nodeType: "ND_worleynoise2d_vector3",
+        nodeTypeID: 975, // ND_worleynoise2d_vector3
         inputs: [
-            .init(name: "texcoord", dataType: SGDataType.vector2f, connection: texcoord),
-            .init(name: "jitter", dataType: SGDataType.float, connection: jitter),
+            .init(nameID: 104, dataType: SGDataType.vector2f, connection: texcoord),
+            .init(nameID: 59, dataType: SGDataType.float, connection: jitter),
         ],
         outputs: [.init(dataType: SGDataType.vector3f)])))
 }
@@ -8130,10 +8130,10 @@ public func worleyNoise3DFloat(position: SGVector? = nil, jitter: SGScalar? = ni
         return SGScalar(source: .error("Invalid worleyNoise3DFloat input. Expected jitter data type to be SGDataType.float, but got \(jitter?.dataType.rawValue ?? "nil").", values: [jitter]))
     }
     return SGScalar(source: .nodeOutput(SGNode(
-        nodeType: "ND_worleynoise3d_float",
+        nodeTypeID: 976, // ND_worleynoise3d_float
         inputs: [
-            .init(name: "position", dataType: SGDataType.vector3f, connection: position),
-            .init(name: "jitter", dataType: SGDataType.float, connection: jitter),
+            .init(nameID: 90, dataType: SGDataType.vector3f, connection: position),
+            .init(nameID: 59, dataType: SGDataType.float, connection: jitter),
         ],
         outputs: [.init(dataType: SGDataType.float)])))
 }
@@ -8146,10 +8146,10 @@ public func worleyNoise3DVector2(position: SGVector? = nil, jitter: SGScalar? =
         return SGVector(source: .error("Invalid worleyNoise3DVector2 input. Expected jitter data type to be SGDataType.float, but got \(jitter?.dataType.rawValue ?? "nil").", values: [jitter]))
     }
     return SGVector(source: .nodeOutput(SGNode(
-        nodeType: "ND_worleynoise3d_vector2",
+        nodeTypeID: 977, // ND_worleynoise3d_vector2
         inputs: [
-            .init(name: "position", dataType: SGDataType.vector3f, connection: position),
-            .init(name: "jitter", dataType: SGDataType.float, connection: jitter),
+            .init(nameID: 90, dataType: SGDataType.vector3f, connection: position),
+            .init(nameID: 59, dataType: SGDataType.float, connection: jitter),
         ],
         outputs: [.init(dataType: SGDataType.vector2f)])))
 }
@@ -8162,10 +8162,10 @@ public func worleyNoise3DVector3(position: SGVector? = nil, jitter: SGScalar? =
         return SGVector(source: .error("Invalid worleyNoise3DVector3 input. Expected jitter data type to be SGDataType.float, but got \(jitter?.dataType.rawValue ?? "nil").", values: [jitter]))
     }
     return SGVector(source: .nodeOutput(SGNode(
-        nodeType: "ND_worleynoise3d_vector3",
+        nodeTypeID: 978, // ND_worleynoise3d_vector3
         inputs: [
-            .init(name: "position", dataType: SGDataType.vector3f, connection: position),
-            .init(name: "jitter", dataType: SGDataType.float, connection: jitter),
+            .init(nameID: 90, dataType: SGDataType.vector3f, connection: position),
+            .init(nameID: 59, dataType: SGDataType.float, connection: jitter),
         ],
         outputs: [.init(dataType: SGDataType.vector3f)])))
 }
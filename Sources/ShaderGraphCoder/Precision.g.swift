@@ -0,0 +1,198 @@
+// Autogenerated by opgen.py
+import Foundation
+import simd
+
+extension SGHalfPrecision {
+    static let schemaNodes: [String: SGHalfPrecision] = [
+        "ND_absval_color3": SGHalfPrecision(range: .preserving),
+        "ND_absval_color4": SGHalfPrecision(range: .preserving),
+        "ND_absval_float": SGHalfPrecision(range: .preserving, halfNodeType: "ND_absval_half", halfInputTypes: ["in": .half], halfOutputType: .half),
+        "ND_absval_vector2": SGHalfPrecision(range: .preserving),
+        "ND_absval_vector3": SGHalfPrecision(range: .preserving),
+        "ND_absval_vector4": SGHalfPrecision(range: .preserving),
+        "ND_ceil_color3": SGHalfPrecision(range: .preserving),
+        "ND_ceil_color4": SGHalfPrecision(range: .preserving),
+        "ND_ceil_float": SGHalfPrecision(range: .preserving, halfNodeType: "ND_ceil_half", halfInputTypes: ["in": .half], halfOutputType: .half),
+        "ND_ceil_vector2": SGHalfPrecision(range: .preserving),
+        "ND_ceil_vector3": SGHalfPrecision(range: .preserving),
+        "ND_ceil_vector4": SGHalfPrecision(range: .preserving),
+        "ND_clamp_color3": SGHalfPrecision(range: .preserving, halfNodeType: "ND_clamp_half3", halfInputTypes: ["in": .vector3h, "low": .vector3h, "high": .vector3h], halfOutputType: .vector3h),
+        "ND_clamp_color3FA": SGHalfPrecision(range: .preserving, halfNodeType: "ND_clamp_half3FA", halfInputTypes: ["in": .vector3h, "low": .float, "high": .float], halfOutputType: .vector3h),
+        "ND_clamp_color4": SGHalfPrecision(range: .preserving, halfNodeType: "ND_clamp_half4", halfInputTypes: ["in": .vector4h, "low": .vector4h, "high": .vector4h], halfOutputType: .vector4h),
+        "ND_clamp_color4FA": SGHalfPrecision(range: .preserving, halfNodeType: "ND_clamp_half4FA", halfInputTypes: ["in": .vector4h, "low": .float, "high": .float], halfOutputType: .vector4h),
+        "ND_clamp_float": SGHalfPrecision(range: .preserving, halfNodeType: "ND_clamp_half", halfInputTypes: ["in": .half, "low": .half, "high": .half], halfOutputType: .half),
+        "ND_clamp_vector2": SGHalfPrecision(range: .preserving, halfNodeType: "ND_clamp_half2", halfInputTypes: ["in": .vector2h, "low": .vector2h, "high": .vector2h], halfOutputType: .vector2h),
+        "ND_clamp_vector2FA": SGHalfPrecision(range: .preserving, halfNodeType: "ND_clamp_half2FA", halfInputTypes: ["in": .vector2h, "low": .float, "high": .float], halfOutputType: .vector2h),
+        "ND_clamp_vector3": SGHalfPrecision(range: .preserving, halfNodeType: "ND_clamp_half3", halfInputTypes: ["in": .vector3h, "low": .vector3h, "high": .vector3h], halfOutputType: .vector3h),
+        "ND_clamp_vector3FA": SGHalfPrecision(range: .preserving, halfNodeType: "ND_clamp_half3FA", halfInputTypes: ["in": .vector3h, "low": .float, "high": .float], halfOutputType: .vector3h),
+        "ND_clamp_vector4": SGHalfPrecision(range: .preserving, halfNodeType: "ND_clamp_half4", halfInputTypes: ["in": .vector4h, "low": .vector4h, "high": .vector4h], halfOutputType: .vector4h),
+        "ND_clamp_vector4FA": SGHalfPrecision(range: .preserving, halfNodeType: "ND_clamp_half4FA", halfInputTypes: ["in": .vector4h, "low": .float, "high": .float], halfOutputType: .vector4h),
+        "ND_cos_float": SGHalfPrecision(range: .bounded, halfNodeType: "ND_cos_half", halfInputTypes: ["in": .half], halfOutputType: .half),
+        "ND_cos_vector2": SGHalfPrecision(range: .bounded, halfNodeType: "ND_cos_half2", halfInputTypes: ["in": .vector2h], halfOutputType: .vector2h),
+        "ND_cos_vector3": SGHalfPrecision(range: .bounded, halfNodeType: "ND_cos_half3", halfInputTypes: ["in": .vector3h], halfOutputType: .vector3h),
+        "ND_cos_vector4": SGHalfPrecision(range: .bounded, halfNodeType: "ND_cos_half4", halfInputTypes: ["in": .vector4h], halfOutputType: .vector4h),
+        "ND_floor_color3": SGHalfPrecision(range: .preserving),
+        "ND_floor_color4": SGHalfPrecision(range: .preserving),
+        "ND_floor_float": SGHalfPrecision(range: .preserving, halfNodeType: "ND_floor_half", halfInputTypes: ["in": .half], halfOutputType: .half),
+        "ND_floor_vector2": SGHalfPrecision(range: .preserving),
+        "ND_floor_vector3": SGHalfPrecision(range: .preserving),
+        "ND_floor_vector4": SGHalfPrecision(range: .preserving),
+        "ND_ifequal_color3": SGHalfPrecision(range: .preserving, halfNodeType: "ND_ifequal_half3", halfInputTypes: ["value1": .float, "value2": .float, "in1": .vector3h, "in2": .vector3h], halfOutputType: .vector3h),
+        "ND_ifequal_color3B": SGHalfPrecision(range: .preserving, halfNodeType: "ND_ifequal_half3B", halfInputTypes: ["value1": .bool, "value2": .bool, "in1": .vector3h, "in2": .vector3h], halfOutputType: .vector3h),
+        "ND_ifequal_color3I": SGHalfPrecision(range: .preserving, halfNodeType: "ND_ifequal_half3I", halfInputTypes: ["value1": .int, "value2": .int, "in1": .vector3h, "in2": .vector3h], halfOutputType: .vector3h),
+        "ND_ifequal_color4": SGHalfPrecision(range: .preserving, halfNodeType: "ND_ifequal_half4", halfInputTypes: ["value1": .float, "value2": .float, "in1": .vector4h, "in2": .vector4h], halfOutputType: .vector4h),
+        "ND_ifequal_color4B": SGHalfPrecision(range: .preserving, halfNodeType: "ND_ifequal_half4B", halfInputTypes: ["value1": .bool, "value2": .bool, "in1": .vector4h, "in2": .vector4h], halfOutputType: .vector4h),
+        "ND_ifequal_color4I": SGHalfPrecision(range: .preserving, halfNodeType: "ND_ifequal_half4I", halfInputTypes: ["value1": .int, "value2": .int, "in1": .vector4h, "in2": .vector4h], halfOutputType: .vector4h),
+        "ND_ifequal_float": SGHalfPrecision(range: .preserving, halfNodeType: "ND_ifequal_half", halfInputTypes: ["value1": .half, "value2": .half, "in1": .half, "in2": .half], halfOutputType: .half),
+        "ND_ifequal_floatB": SGHalfPrecision(range: .preserving, halfNodeType: "ND_ifequal_halfB", halfInputTypes: ["value1": .bool, "value2": .bool, "in1": .half, "in2": .half], halfOutputType: .half),
+        "ND_ifequal_floatI": SGHalfPrecision(range: .preserving, halfNodeType: "ND_ifequal_halfI", halfInputTypes: ["value1": .int, "value2": .int, "in1": .half, "in2": .half], halfOutputType: .half),
+        "ND_ifequal_vector2": SGHalfPrecision(range: .preserving, halfNodeType: "ND_ifequal_half2", halfInputTypes: ["value1": .float, "value2": .float, "in1": .vector2h, "in2": .vector2h], halfOutputType: .vector2h),
+        "ND_ifequal_vector2B": SGHalfPrecision(range: .preserving, halfNodeType: "ND_ifequal_half2B", halfInputTypes: ["value1": .bool, "value2": .bool, "in1": .vector2h, "in2": .vector2h], halfOutputType: .vector2h),
+        "ND_ifequal_vector2I": SGHalfPrecision(range: .preserving, halfNodeType: "ND_ifequal_half2I", halfInputTypes: ["value1": .int, "value2": .int, "in1": .vector2h, "in2": .vector2h], halfOutputType: .vector2h),
+        "ND_ifequal_vector3": SGHalfPrecision(range: .preserving, halfNodeType: "ND_ifequal_half3", halfInputTypes: ["value1": .float, "value2": .float, "in1": .vector3h, "in2": .vector3h], halfOutputType: .vector3h),
+        "ND_ifequal_vector3B": SGHalfPrecision(range: .preserving, halfNodeType: "ND_ifequal_half3B", halfInputTypes: ["value1": .bool, "value2": .bool, "in1": .vector3h, "in2": .vector3h], halfOutputType: .vector3h),
+        "ND_ifequal_vector3I": SGHalfPrecision(range: .preserving, halfNodeType: "ND_ifequal_half3I", halfInputTypes: ["value1": .int, "value2": .int, "in1": .vector3h, "in2": .vector3h], halfOutputType: .vector3h),
+        "ND_ifequal_vector4": SGHalfPrecision(range: .preserving, halfNodeType: "ND_ifequal_half4", halfInputTypes: ["value1": .float, "value2": .float, "in1": .vector4h, "in2": .vector4h], halfOutputType: .vector4h),
+        "ND_ifequal_vector4B": SGHalfPrecision(range: .preserving, halfNodeType: "ND_ifequal_half4B", halfInputTypes: ["value1": .bool, "value2": .bool, "in1": .vector4h, "in2": .vector4h], halfOutputType: .vector4h),
+        "ND_ifequal_vector4I": SGHalfPrecision(range: .preserving, halfNodeType: "ND_ifequal_half4I", halfInputTypes: ["value1": .int, "value2": .int, "in1": .vector4h, "in2": .vector4h], halfOutputType: .vector4h),
+        "ND_ifgreater_color3": SGHalfPrecision(range: .preserving, halfNodeType: "ND_ifgreater_half3", halfInputTypes: ["value1": .float, "value2": .float, "in1": .vector3h, "in2": .vector3h], halfOutputType: .vector3h),
+        "ND_ifgreater_color3I": SGHalfPrecision(range: .preserving, halfNodeType: "ND_ifgreater_half3I", halfInputTypes: ["value1": .int, "value2": .int, "in1": .vector3h, "in2": .vector3h], halfOutputType: .vector3h),
+        "ND_ifgreater_color4": SGHalfPrecision(range: .preserving, halfNodeType: "ND_ifgreater_half4", halfInputTypes: ["value1": .float, "value2": .float, "in1": .vector4h, "in2": .vector4h], halfOutputType: .vector4h),
+        "ND_ifgreater_color4I": SGHalfPrecision(range: .preserving, halfNodeType: "ND_ifgreater_half4I", halfInputTypes: ["value1": .int, "value2": .int, "in1": .vector4h, "in2": .vector4h], halfOutputType: .vector4h),
+        "ND_ifgreater_float": SGHalfPrecision(range: .preserving, halfNodeType: "ND_ifgreater_half", halfInputTypes: ["value1": .half, "value2": .half, "in1": .half, "in2": .half], halfOutputType: .half),
+        "ND_ifgreater_floatI": SGHalfPrecision(range: .preserving, halfNodeType: "ND_ifgreater_halfI", halfInputTypes: ["value1": .int, "value2": .int, "in1": .half, "in2": .half], halfOutputType: .half),
+        "ND_ifgreater_vector2": SGHalfPrecision(range: .preserving, halfNodeType: "ND_ifgreater_half2", halfInputTypes: ["value1": .float, "value2": .float, "in1": .vector2h, "in2": .vector2h], halfOutputType: .vector2h),
+        "ND_ifgreater_vector2I": SGHalfPrecision(range: .preserving, halfNodeType: "ND_ifgreater_half2I", halfInputTypes: ["value1": .int, "value2": .int, "in1": .vector2h, "in2": .vector2h], halfOutputType: .vector2h),
+        "ND_ifgreater_vector3": SGHalfPrecision(range: .preserving, halfNodeType: "ND_ifgreater_half3", halfInputTypes: ["value1": .float, "value2": .float, "in1": .vector3h, "in2": .vector3h], halfOutputType: .vector3h),
+        "ND_ifgreater_vector3I": SGHalfPrecision(range: .preserving, halfNodeType: "ND_ifgreater_half3I", halfInputTypes: ["value1": .int, "value2": .int, "in1": .vector3h, "in2": .vector3h], halfOutputType: .vector3h),
+        "ND_ifgreater_vector4": SGHalfPrecision(range: .preserving, halfNodeType: "ND_ifgreater_half4", halfInputTypes: ["value1": .float, "value2": .float, "in1": .vector4h, "in2": .vector4h], halfOutputType: .vector4h),
+        "ND_ifgreater_vector4I": SGHalfPrecision(range: .preserving, halfNodeType: "ND_ifgreater_half4I", halfInputTypes: ["value1": .int, "value2": .int, "in1": .vector4h, "in2": .vector4h], halfOutputType: .vector4h),
+        "ND_ifgreatereq_color3": SGHalfPrecision(range: .preserving, halfNodeType: "ND_ifgreatereq_half3", halfInputTypes: ["value1": .float, "value2": .float, "in1": .vector3h, "in2": .vector3h], halfOutputType: .vector3h),
+        "ND_ifgreatereq_color3I": SGHalfPrecision(range: .preserving, halfNodeType: "ND_ifgreatereq_half3I", halfInputTypes: ["value1": .int, "value2": .int, "in1": .vector3h, "in2": .vector3h], halfOutputType: .vector3h),
+        "ND_ifgreatereq_color4": SGHalfPrecision(range: .preserving, halfNodeType: "ND_ifgreatereq_half4", halfInputTypes: ["value1": .float, "value2": .float, "in1": .vector4h, "in2": .vector4h], halfOutputType: .vector4h),
+        "ND_ifgreatereq_color4I": SGHalfPrecision(range: .preserving, halfNodeType: "ND_ifgreatereq_half4I", halfInputTypes: ["value1": .int, "value2": .int, "in1": .vector4h, "in2": .vector4h], halfOutputType: .vector4h),
+        "ND_ifgreatereq_float": SGHalfPrecision(range: .preserving, halfNodeType: "ND_ifgreatereq_half", halfInputTypes: ["value1": .half, "value2": .half, "in1": .half, "in2": .half], halfOutputType: .half),
+        "ND_ifgreatereq_floatI": SGHalfPrecision(range: .preserving, halfNodeType: "ND_ifgreatereq_halfI", halfInputTypes: ["value1": .int, "value2": .int, "in1": .half, "in2": .half], halfOutputType: .half),
+        "ND_ifgreatereq_vector2": SGHalfPrecision(range: .preserving, halfNodeType: "ND_ifgreatereq_half2", halfInputTypes: ["value1": .float, "value2": .float, "in1": .vector2h, "in2": .vector2h], halfOutputType: .vector2h),
+        "ND_ifgreatereq_vector2I": SGHalfPrecision(range: .preserving, halfNodeType: "ND_ifgreatereq_half2I", halfInputTypes: ["value1": .int, "value2": .int, "in1": .vector2h, "in2": .vector2h], halfOutputType: .vector2h),
+        "ND_ifgreatereq_vector3": SGHalfPrecision(range: .preserving, halfNodeType: "ND_ifgreatereq_half3", halfInputTypes: ["value1": .float, "value2": .float, "in1": .vector3h, "in2": .vector3h], halfOutputType: .vector3h),
+        "ND_ifgreatereq_vector3I": SGHalfPrecision(range: .preserving, halfNodeType: "ND_ifgreatereq_half3I", halfInputTypes: ["value1": .int, "value2": .int, "in1": .vector3h, "in2": .vector3h], halfOutputType: .vector3h),
+        "ND_ifgreatereq_vector4": SGHalfPrecision(range: .preserving, halfNodeType: "ND_ifgreatereq_half4", halfInputTypes: ["value1": .float, "value2": .float, "in1": .vector4h, "in2": .vector4h], halfOutputType: .vector4h),
+        "ND_ifgreatereq_vector4I": SGHalfPrecision(range: .preserving, halfNodeType: "ND_ifgreatereq_half4I", halfInputTypes: ["value1": .int, "value2": .int, "in1": .vector4h, "in2": .vector4h], halfOutputType: .vector4h),
+        "ND_max_color3": SGHalfPrecision(range: .preserving, halfNodeType: "ND_max_half3", halfInputTypes: ["in1": .vector3h, "in2": .vector3h], halfOutputType: .vector3h),
+        "ND_max_color3FA": SGHalfPrecision(range: .preserving, halfNodeType: "ND_max_half3FA", halfInputTypes: ["in1": .vector3h, "in2": .float], halfOutputType: .vector3h),
+        "ND_max_color4": SGHalfPrecision(range: .preserving, halfNodeType: "ND_max_half4", halfInputTypes: ["in1": .vector4h, "in2": .vector4h], halfOutputType: .vector4h),
+        "ND_max_color4FA": SGHalfPrecision(range: .preserving, halfNodeType: "ND_max_half4FA", halfInputTypes: ["in1": .vector4h, "in2": .float], halfOutputType: .vector4h),
+        "ND_max_float": SGHalfPrecision(range: .preserving, halfNodeType: "ND_max_half", halfInputTypes: ["in1": .half, "in2": .half], halfOutputType: .half),
+        "ND_max_vector2": SGHalfPrecision(range: .preserving, halfNodeType: "ND_max_half2", halfInputTypes: ["in1": .vector2h, "in2": .vector2h], halfOutputType: .vector2h),
+        "ND_max_vector2FA": SGHalfPrecision(range: .preserving, halfNodeType: "ND_max_half2FA", halfInputTypes: ["in1": .vector2h, "in2": .float], halfOutputType: .vector2h),
+        "ND_max_vector3": SGHalfPrecision(range: .preserving, halfNodeType: "ND_max_half3", halfInputTypes: ["in1": .vector3h, "in2": .vector3h], halfOutputType: .vector3h),
+        "ND_max_vector3FA": SGHalfPrecision(range: .preserving, halfNodeType: "ND_max_half3FA", halfInputTypes: ["in1": .vector3h, "in2": .float], halfOutputType: .vector3h),
+        "ND_max_vector4": SGHalfPrecision(range: .preserving, halfNodeType: "ND_max_half4", halfInputTypes: ["in1": .vector4h, "in2": .vector4h], halfOutputType: .vector4h),
+        "ND_max_vector4FA": SGHalfPrecision(range: .preserving, halfNodeType: "ND_max_half4FA", halfInputTypes: ["in1": .vector4h, "in2": .float], halfOutputType: .vector4h),
+        "ND_min_color3": SGHalfPrecision(range: .preserving, halfNodeType: "ND_min_half3", halfInputTypes: ["in1": .vector3h, "in2": .vector3h], halfOutputType: .vector3h),
+        "ND_min_color3FA": SGHalfPrecision(range: .preserving, halfNodeType: "ND_min_half3FA", halfInputTypes: ["in1": .vector3h, "in2": .float], halfOutputType: .vector3h),
+        "ND_min_color4": SGHalfPrecision(range: .preserving, halfNodeType: "ND_min_half4", halfInputTypes: ["in1": .vector4h, "in2": .vector4h], halfOutputType: .vector4h),
+        "ND_min_color4FA": SGHalfPrecision(range: .preserving, halfNodeType: "ND_min_half4FA", halfInputTypes: ["in1": .vector4h, "in2": .float], halfOutputType: .vector4h),
+        "ND_min_float": SGHalfPrecision(range: .preserving, halfNodeType: "ND_min_half", halfInputTypes: ["in1": .half, "in2": .half], halfOutputType: .half),
+        "ND_min_vector2": SGHalfPrecision(range: .preserving, halfNodeType: "ND_min_half2", halfInputTypes: ["in1": .vector2h, "in2": .vector2h], halfOutputType: .vector2h),
+        "ND_min_vector2FA": SGHalfPrecision(range: .preserving, halfNodeType: "ND_min_half2FA", halfInputTypes: ["in1": .vector2h, "in2": .float], halfOutputType: .vector2h),
+        "ND_min_vector3": SGHalfPrecision(range: .preserving, halfNodeType: "ND_min_half3", halfInputTypes: ["in1": .vector3h, "in2": .vector3h], halfOutputType: .vector3h),
+        "ND_min_vector3FA": SGHalfPrecision(range: .preserving, halfNodeType: "ND_min_half3FA", halfInputTypes: ["in1": .vector3h, "in2": .float], halfOutputType: .vector3h),
+        "ND_min_vector4": SGHalfPrecision(range: .preserving, halfNodeType: "ND_min_half4", halfInputTypes: ["in1": .vector4h, "in2": .vector4h], halfOutputType: .vector4h),
+        "ND_min_vector4FA": SGHalfPrecision(range: .preserving, halfNodeType: "ND_min_half4FA", halfInputTypes: ["in1": .vector4h, "in2": .float], halfOutputType: .vector4h),
+        "ND_multiply_color3": SGHalfPrecision(range: .preserving),
+        "ND_multiply_color3FA": SGHalfPrecision(range: .preserving),
+        "ND_multiply_color4": SGHalfPrecision(range: .preserving),
+        "ND_multiply_color4FA": SGHalfPrecision(range: .preserving),
+        "ND_multiply_float": SGHalfPrecision(range: .preserving, halfNodeType: "ND_multiply_half", halfInputTypes: ["in1": .half, "in2": .half], halfOutputType: .half),
+        "ND_multiply_vector2": SGHalfPrecision(range: .preserving),
+        "ND_multiply_vector2FA": SGHalfPrecision(range: .preserving),
+        "ND_multiply_vector3": SGHalfPrecision(range: .preserving),
+        "ND_multiply_vector3FA": SGHalfPrecision(range: .preserving),
+        "ND_multiply_vector4": SGHalfPrecision(range: .preserving),
+        "ND_multiply_vector4FA": SGHalfPrecision(range: .preserving),
+        "ND_normalize_vector2": SGHalfPrecision(range: .bounded, halfNodeType: "ND_normalize_half2", halfInputTypes: ["in": .vector2h], halfOutputType: .vector2h),
+        "ND_normalize_vector3": SGHalfPrecision(range: .bounded, halfNodeType: "ND_normalize_half3", halfInputTypes: ["in": .vector3h], halfOutputType: .vector3h),
+        "ND_normalize_vector4": SGHalfPrecision(range: .bounded, halfNodeType: "ND_normalize_half4", halfInputTypes: ["in": .vector4h], halfOutputType: .vector4h),
+        "ND_ramplr_color3": SGHalfPrecision(range: .preserving, halfNodeType: "ND_ramplr_half3", halfInputTypes: ["valuel": .vector3h, "valuer": .vector3h, "texcoord": .vector2f], halfOutputType: .vector3h),
+        "ND_ramplr_color4": SGHalfPrecision(range: .preserving, halfNodeType: "ND_ramplr_half4", halfInputTypes: ["valuel": .vector4h, "valuer": .vector4h, "texcoord": .vector2f], halfOutputType: .vector4h),
+        "ND_ramplr_float": SGHalfPrecision(range: .preserving, halfNodeType: "ND_ramplr_half", halfInputTypes: ["valuel": .half, "valuer": .half, "texcoord": .vector2f], halfOutputType: .half),
+        "ND_ramplr_vector2": SGHalfPrecision(range: .preserving, halfNodeType: "ND_ramplr_half2", halfInputTypes: ["valuel": .vector2h, "valuer": .vector2h, "texcoord": .vector2f], halfOutputType: .vector2h),
+        "ND_ramplr_vector3": SGHalfPrecision(range: .preserving, halfNodeType: "ND_ramplr_half3", halfInputTypes: ["valuel": .vector3h, "valuer": .vector3h, "texcoord": .vector2f], halfOutputType: .vector3h),
+        "ND_ramplr_vector4": SGHalfPrecision(range: .preserving, halfNodeType: "ND_ramplr_half4", halfInputTypes: ["valuel": .vector4h, "valuer": .vector4h, "texcoord": .vector2f], halfOutputType: .vector4h),
+        "ND_ramptb_color3": SGHalfPrecision(range: .preserving, halfNodeType: "ND_ramptb_half3", halfInputTypes: ["valuet": .vector3h, "valueb": .vector3h, "texcoord": .vector2f], halfOutputType: .vector3h),
+        "ND_ramptb_color4": SGHalfPrecision(range: .preserving, halfNodeType: "ND_ramptb_half4", halfInputTypes: ["valuet": .vector4h, "valueb": .vector4h, "texcoord": .vector2f], halfOutputType: .vector4h),
+        "ND_ramptb_float": SGHalfPrecision(range: .preserving, halfNodeType: "ND_ramptb_half", halfInputTypes: ["valuet": .half, "valueb": .half, "texcoord": .vector2f], halfOutputType: .half),
+        "ND_ramptb_vector2": SGHalfPrecision(range: .preserving, halfNodeType: "ND_ramptb_half2", halfInputTypes: ["valuet": .vector2h, "valueb": .vector2h, "texcoord": .vector2f], halfOutputType: .vector2h),
+        "ND_ramptb_vector3": SGHalfPrecision(range: .preserving, halfNodeType: "ND_ramptb_half3", halfInputTypes: ["valuet": .vector3h, "valueb": .vector3h, "texcoord": .vector2f], halfOutputType: .vector3h),
+        "ND_ramptb_vector4": SGHalfPrecision(range: .preserving, halfNodeType: "ND_ramptb_half4", halfInputTypes: ["valuet": .vector4h, "valueb": .vector4h, "texcoord": .vector2f], halfOutputType: .vector4h),
+        "ND_round_color3": SGHalfPrecision(range: .preserving),
+        "ND_round_color4": SGHalfPrecision(range: .preserving),
+        "ND_round_float": SGHalfPrecision(range: .preserving, halfNodeType: "ND_round_half", halfInputTypes: ["in": .half], halfOutputType: .half),
+        "ND_round_vector2": SGHalfPrecision(range: .preserving),
+        "ND_round_vector3": SGHalfPrecision(range: .preserving),
+        "ND_round_vector4": SGHalfPrecision(range: .preserving),
+        "ND_sign_color3": SGHalfPrecision(range: .bounded, halfNodeType: "ND_sign_half3", halfInputTypes: ["in": .vector3h], halfOutputType: .vector3h),
+        "ND_sign_color4": SGHalfPrecision(range: .bounded, halfNodeType: "ND_sign_half4", halfInputTypes: ["in": .vector4h], halfOutputType: .vector4h),
+        "ND_sign_float": SGHalfPrecision(range: .bounded, halfNodeType: "ND_sign_half", halfInputTypes: ["in": .half], halfOutputType: .half),
+        "ND_sign_vector2": SGHalfPrecision(range: .bounded, halfNodeType: "ND_sign_half2", halfInputTypes: ["in": .vector2h], halfOutputType: .vector2h),
+        "ND_sign_vector3": SGHalfPrecision(range: .bounded, halfNodeType: "ND_sign_half3", halfInputTypes: ["in": .vector3h], halfOutputType: .vector3h),
+        "ND_sign_vector4": SGHalfPrecision(range: .bounded, halfNodeType: "ND_sign_half4", halfInputTypes: ["in": .vector4h], halfOutputType: .vector4h),
+        "ND_sin_float": SGHalfPrecision(range: .bounded, halfNodeType: "ND_sin_half", halfInputTypes: ["in": .half], halfOutputType: .half),
+        "ND_sin_vector2": SGHalfPrecision(range: .bounded, halfNodeType: "ND_sin_half2", halfInputTypes: ["in": .vector2h], halfOutputType: .vector2h),
+        "ND_sin_vector3": SGHalfPrecision(range: .bounded, halfNodeType: "ND_sin_half3", halfInputTypes: ["in": .vector3h], halfOutputType: .vector3h),
+        "ND_sin_vector4": SGHalfPrecision(range: .bounded, halfNodeType: "ND_sin_half4", halfInputTypes: ["in": .vector4h], halfOutputType: .vector4h),
+        "ND_smoothstep_color3": SGHalfPrecision(range: .bounded, halfNodeType: "ND_smoothstep_half3", halfInputTypes: ["in": .vector3h, "low": .vector3h, "high": .vector3h], halfOutputType: .vector3h),
+        "ND_smoothstep_color3FA": SGHalfPrecision(range: .bounded, halfNodeType: "ND_smoothstep_half3FA", halfInputTypes: ["in": .vector3h, "low": .float, "high": .float], halfOutputType: .vector3h),
+        "ND_smoothstep_color4": SGHalfPrecision(range: .bounded, halfNodeType: "ND_smoothstep_half4", halfInputTypes: ["in": .vector4h, "low": .vector4h, "high": .vector4h], halfOutputType: .vector4h),
+        "ND_smoothstep_color4FA": SGHalfPrecision(range: .bounded, halfNodeType: "ND_smoothstep_half4FA", halfInputTypes: ["in": .vector4h, "low": .float, "high": .float], halfOutputType: .vector4h),
+        "ND_smoothstep_float": SGHalfPrecision(range: .bounded, halfNodeType: "ND_smoothstep_half", halfInputTypes: ["in": .half, "low": .half, "high": .half], halfOutputType: .half),
+        "ND_smoothstep_vector2": SGHalfPrecision(range: .bounded, halfNodeType: "ND_smoothstep_half2", halfInputTypes: ["in": .vector2h, "low": .vector2h, "high": .vector2h], halfOutputType: .vector2h),
+        "ND_smoothstep_vector2FA": SGHalfPrecision(range: .bounded, halfNodeType: "ND_smoothstep_half2FA", halfInputTypes: ["in": .vector2h, "low": .float, "high": .float], halfOutputType: .vector2h),
+        "ND_smoothstep_vector3": SGHalfPrecision(range: .bounded, halfNodeType: "ND_smoothstep_half3", halfInputTypes: ["in": .vector3h, "low": .vector3h, "high": .vector3h], halfOutputType: .vector3h),
+        "ND_smoothstep_vector3FA": SGHalfPrecision(range: .bounded, halfNodeType: "ND_smoothstep_half3FA", halfInputTypes: ["in": .vector3h, "low": .float, "high": .float], halfOutputType: .vector3h),
+        "ND_smoothstep_vector4": SGHalfPrecision(range: .bounded, halfNodeType: "ND_smoothstep_half4", halfInputTypes: ["in": .vector4h, "low": .vector4h, "high": .vector4h], halfOutputType: .vector4h),
+        "ND_smoothstep_vector4FA": SGHalfPrecision(range: .bounded, halfNodeType: "ND_smoothstep_half4FA", halfInputTypes: ["in": .vector4h, "low": .float, "high": .float], halfOutputType: .vector4h),
+        "ND_splitlr_color3": SGHalfPrecision(range: .preserving),
+        "ND_splitlr_color4": SGHalfPrecision(range: .preserving),
+        "ND_splitlr_float": SGHalfPrecision(range: .preserving, halfNodeType: "ND_splitlr_half", halfInputTypes: ["valuel": .half, "valuer": .half, "center": .float, "texcoord": .vector2f], halfOutputType: .half),
+        "ND_splitlr_vector2": SGHalfPrecision(range: .preserving),
+        "ND_splitlr_vector3": SGHalfPrecision(range: .preserving),
+        "ND_splitlr_vector4": SGHalfPrecision(range: .preserving),
+        "ND_splittb_color3": SGHalfPrecision(range: .preserving, halfNodeType: "ND_splittb_half3", halfInputTypes: ["valuet": .vector3h, "valueb": .vector3h, "center": .float, "texcoord": .vector2f], halfOutputType: .vector3h),
+        "ND_splittb_color4": SGHalfPrecision(range: .preserving, halfNodeType: "ND_splittb_half4", halfInputTypes: ["valuet": .vector4h, "valueb": .vector4h, "center": .float, "texcoord": .vector2f], halfOutputType: .vector4h),
+        "ND_splittb_float": SGHalfPrecision(range: .preserving, halfNodeType: "ND_splittb_half", halfInputTypes: ["valuet": .half, "valueb": .half, "center": .float, "texcoord": .vector2f], halfOutputType: .half),
+        "ND_splittb_vector2": SGHalfPrecision(range: .preserving, halfNodeType: "ND_splittb_half2", halfInputTypes: ["valuet": .vector2h, "valueb": .vector2h, "center": .float, "texcoord": .vector2f], halfOutputType: .vector2h),
+        "ND_splittb_vector3": SGHalfPrecision(range: .preserving, halfNodeType: "ND_splittb_half3", halfInputTypes: ["valuet": .vector3h, "valueb": .vector3h, "center": .float, "texcoord": .vector2f], halfOutputType: .vector3h),
+        "ND_splittb_vector4": SGHalfPrecision(range: .preserving, halfNodeType: "ND_splittb_half4", halfInputTypes: ["valuet": .vector4h, "valueb": .vector4h, "center": .float, "texcoord": .vector2f], halfOutputType: .vector4h),
+        "ND_switch_color3": SGHalfPrecision(range: .preserving),
+        "ND_switch_color3I": SGHalfPrecision(range: .preserving),
+        "ND_switch_color4": SGHalfPrecision(range: .preserving),
+        "ND_switch_color4I": SGHalfPrecision(range: .preserving),
+        "ND_switch_float": SGHalfPrecision(range: .preserving, halfNodeType: "ND_switch_half", halfInputTypes: ["in1": .half, "in2": .half, "in3": .half, "in4": .half, "in5": .half, "in6": .half, "in7": .half, "in8": .half, "in9": .half, "in10": .half, "which": .float], halfOutputType: .half),
+        "ND_switch_floatI": SGHalfPrecision(range: .preserving, halfNodeType: "ND_switch_halfI", halfInputTypes: ["in1": .half, "in2": .half, "in3": .half, "in4": .half, "in5": .half, "in6": .half, "in7": .half, "in8": .half, "in9": .half, "in10": .half, "which": .int], halfOutputType: .half),
+        "ND_switch_vector2": SGHalfPrecision(range: .preserving),
+        "ND_switch_vector2I": SGHalfPrecision(range: .preserving),
+        "ND_switch_vector3": SGHalfPrecision(range: .preserving),
+        "ND_switch_vector3I": SGHalfPrecision(range: .preserving),
+        "ND_switch_vector4": SGHalfPrecision(range: .preserving),
+        "ND_switch_vector4I": SGHalfPrecision(range: .preserving),
+    ]
+    static let toHalfConversions: [SGDataType: [(nodeType: String, dataType: SGDataType)]] = [
+        .color3f: [(nodeType: "ND_convert_color3_vector3", dataType: .vector3f), (nodeType: "ND_convert_vector3_half3", dataType: .vector3h)],
+        .color4f: [(nodeType: "ND_convert_color4_vector4", dataType: .vector4f), (nodeType: "ND_convert_vector4_half4", dataType: .vector4h)],
+        .float: [(nodeType: "ND_convert_float_half", dataType: .half)],
+        .vector2f: [(nodeType: "ND_convert_vector2_half2", dataType: .vector2h)],
+        .vector3f: [(nodeType: "ND_convert_vector3_half3", dataType: .vector3h)],
+        .vector4f: [(nodeType: "ND_convert_vector4_half4", dataType: .vector4h)],
+    ]
+    static let fromHalfConversions: [SGDataType: [(nodeType: String, dataType: SGDataType)]] = [
+        .color3f: [(nodeType: "ND_convert_half3_color3", dataType: .color3f)],
+        .color4f: [(nodeType: "ND_convert_half4_vector4", dataType: .vector4f), (nodeType: "ND_convert_vector4_color4", dataType: .color4f)],
+        .float: [(nodeType: "ND_convert_half_float", dataType: .float)],
+        .vector2f: [(nodeType: "ND_convert_half2_vector2", dataType: .vector2f)],
+        .vector3f: [(nodeType: "ND_convert_half3_vector3", dataType: .vector3f)],
+        .vector4f: [(nodeType: "ND_convert_half4_vector4", dataType: .vector4f)],
+    ]
+}
@@ -0,0 +1,184 @@
+//
+//  Precision.swift
+//  ShaderGraphCoder
+//
+//  Rewrites float nodes to their half-precision variants where the values stay within [-1, 1], using the precision-safety table generated from the schemas (Precision.g.swift).
+//
+
+import Foundation
+
+/// How the output range of a float node relates to its inputs, and its half-precision variant.
+public struct SGHalfPrecision {
+    public enum Range {
+        /// The output is within [-1, 1] whatever the inputs.
+        case bounded
+        /// The output is within [-1, 1] when all the inputs are.
+        case preserving
+    }
+
+    public let range: Range
+    /// The node type with the same inputs that computes in half precision, if the schemas have one.
+    public let halfNodeType: String?
+    /// The data types of the inputs of `halfNodeType`, by name.
+    public let halfInputTypes: [String: SGDataType]
+    public let halfOutputType: SGDataType?
+
+    public init(range: Range, halfNodeType: String? = nil, halfInputTypes: [String: SGDataType] = [:], halfOutputType: SGDataType? = nil) {
+        self.range = range
+        self.halfNodeType = halfNodeType
+        self.halfInputTypes = halfInputTypes
+        self.halfOutputType = halfOutputType
+    }
+}
+
+/// Replaces float nodes with their half-precision variants where that is safe, and converts values where
+/// demoted nodes meet float nodes.
+///
+/// A node is demoted when it has a half-precision variant and every input that changes type is a value within [-1, 1]:
+/// a constant in that range, or the output of a node the safety table says stays in it.
+/// Nodes that read parameters, positions or other values of unknown range stay in float, and so do those of colors.
+/// Color constants with a color space are converted by nodes so that the color space still applies.
+/// A node is only demoted when one of its inputs or consumers is demoted too, so a lone node is not surrounded by conversions.
+/// Subgraph bodies are left as they are.
+public func demotePrecision(surface: SGToken?, geometryModifier: SGToken?) -> (surface: SGToken?, geometryModifier: SGToken?, demotedNodes: Int) {
+    let roots = [surface?.node, geometryModifier?.node].compactMap { $0 }
+
+    // Decide on the float graph which outputs stay within [-1, 1] and which nodes can be demoted
+    var normalizedNodes: Set<SGNode> = []
+    var candidates: Set<SGNode> = []
+    var consumers: [SGNode: [SGNode]] = [:]
+    func isNormalized(_ value: SGValue?) -> Bool {
+        guard let v = value else {
+            return true
+        }
+        switch v.source {
+        case .constant(let c):
+            return c.isNormalized
+        case .nodeOutput(let node, _):
+            return normalizedNodes.contains(node)
+        default:
+            return false
+        }
+    }
+    forEachNodeInPostOrder(roots: roots) { node in
+        for i in node.inputs {
+            if let inode = i.value?.node {
+                consumers[inode, default: []].append(node)
+            }
+        }
+        guard let p = SGHalfPrecision.schemaNodes[node.nodeType] else {
+            return
+        }
+        if p.range == .bounded || node.inputs.allSatisfy({ SGHalfPrecision.toHalfConversions[$0.dataType] == nil || isNormalized($0.value) }) {
+            normalizedNodes.insert(node)
+        }
+        guard p.halfNodeType != nil, node.outputs.count == 1, SGHalfPrecision.fromHalfConversions[node.dataType] != nil else {
+            return
+        }
+        let inputsAreSafe = node.inputs.allSatisfy { i in
+            guard let t = p.halfInputTypes[i.name], t != i.dataType else {
+                return true
+            }
+            return SGHalfPrecision.toHalfConversions[i.dataType] != nil && isNormalized(i.value)
+        }
+        if inputsAreSafe {
+            candidates.insert(node)
+        }
+    }
+    // A lone candidate would need a conversion on each side for one node, so only clusters are demoted
+    let demotedNodes = candidates.filter { node in
+        let hasDemotedInput = node.inputs.contains { i in
+            i.value?.node.map { candidates.contains($0) } ?? false
+        }
+        return hasDemotedInput || (consumers[node] ?? []).contains { candidates.contains($0) }
+    }
+
+    // Rebuild the graph with the demoted nodes and conversions at their boundaries
+    var newNodes: [SGNode: SGNode] = [:]
+    var floatOutputs: [SGNode: SGValue] = [:]
+    func convert(_ value: SGValue, _ conversions: [(nodeType: String, dataType: SGDataType)]) -> SGValue {
+        conversions.reduce(value) { v, c in
+            c.dataType.valueType.init(source: .nodeOutput(SGNode(nodeType: c.nodeType, inputs: [.init(name: "in", connection: v)], outputs: [.init(dataType: c.dataType)])))
+        }
+    }
+    func rebuild(_ value: SGValue?) -> SGValue? {
+        guard let v = value, case .nodeOutput(let node, let outputName) = v.source, let newNode = newNodes[node] else {
+            return value
+        }
+        if !demotedNodes.contains(node) {
+            return type(of: v).init(source: .nodeOutput(newNode, outputName))
+        }
+        if let f = floatOutputs[node] {
+            return f
+        }
+        let f = convert(newNode.dataType.valueType.init(source: .nodeOutput(newNode, outputName)), SGHalfPrecision.fromHalfConversions[node.dataType] ?? [])
+        floatOutputs[node] = f
+        return f
+    }
+    func rebuildHalf(_ value: SGValue?, _ halfType: SGDataType) -> SGValue? {
+        guard let v = value else {
+            return nil
+        }
+        if case .constant(let c) = v.source, let h = c.halfPrecision {
+            return halfType.valueType.init(source: .constant(h))
+        }
+        if case .nodeOutput(let node, let outputName) = v.source, demotedNodes.contains(node), let newNode = newNodes[node] {
+            return halfType.valueType.init(source: .nodeOutput(newNode, outputName))
+        }
+        return convert(rebuild(v) ?? v, SGHalfPrecision.toHalfConversions[v.dataType] ?? [])
+    }
+    forEachNodeInPostOrder(roots: roots) { node in
+        guard demotedNodes.contains(node), let p = SGHalfPrecision.schemaNodes[node.nodeType], let halfNodeType = p.halfNodeType, let halfOutputType = p.halfOutputType else {
+            let inputs = node.inputs.map { i in
+                SGNode.Input(nameID: i.nameID, dataType: i.dataType, connection: rebuild(i.value))
+            }
+            newNodes[node] = node.copy(inputs: inputs)
+            return
+        }
+        let inputs: [SGNode.Input] = node.inputs.map { i in
+            guard let t = p.halfInputTypes[i.name], t != i.dataType else {
+                return SGNode.Input(nameID: i.nameID, dataType: i.dataType, connection: rebuild(i.value))
+            }
+            return SGNode.Input(nameID: i.nameID, dataType: t, connection: rebuildHalf(i.value, t))
+        }
+        newNodes[node] = SGNode(nodeType: halfNodeType, inputs: inputs, outputs: [.init(name: node.outputName, dataType: halfOutputType)])
+    }
+    return (rebuild(surface) as? SGToken, rebuild(geometryModifier) as? SGToken, demotedNodes.count)
+}
+
+extension SGConstantValue {
+    /// True if every component is within [-1, 1].
+    var isNormalized: Bool {
+        switch self {
+        case .float(let v):
+            return abs(v) <= 1
+        case .half(let v):
+            return abs(v) <= 1
+        case .color3f(let v, _), .vector3f(let v):
+            return v.min() >= -1 && v.max() <= 1
+        case .color4f(let v, _), .vector4f(let v):
+            return v.min() >= -1 && v.max() <= 1
+        case .vector2f(let v):
+            return v.min() >= -1 && v.max() <= 1
+        default:
+            return false
+        }
+    }
+
+    /// The constant converted to the half-precision type that replaces its type in a demoted node.
+    /// Nil for colors with a color space, which the half-precision vector types cannot carry.
+    var halfPrecision: SGConstantValue? {
+        switch self {
+        case .float(let v):
+            return .half(Float16(v))
+        case .color3f(let v, .none), .vector3f(let v):
+            return .vector3h(SIMD3<Float16>(v))
+        case .color4f(let v, .none), .vector4f(let v):
+            return .vector4h(SIMD4<Float16>(v))
+        case .vector2f(let v):
+            return .vector2h(SIMD2<Float16>(v))
+        default:
+            return nil
+        }
+    }
+}
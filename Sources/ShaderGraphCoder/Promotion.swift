@@ -0,0 +1,181 @@
+//
+//  Promotion.swift
+//  ShaderGraphCoder
+//
+//  Hoists constants into material parameters so that variants of a material
+//  that only differ in constants can share one compiled material.
+//
+
+import CoreGraphics
+import Foundation
+import RealityKit
+
+/// The constants `promoteConstants` turned into material parameters.
+public struct SGPromotedParameters {
+    /// The parameter names, in the order the constants were found, and the constants they replaced.
+    public let parameters: [(name: String, defaultValue: SGConstantValue)]
+    let namePrefix: String
+    let shouldPromote: ((SGNode, SGNode.Input) -> Bool)?
+
+    /// Returns the constants of a variant graph, built the same way as the promoted one, by parameter name.
+    /// Set them on a copy of the promoted material instead of compiling a new material for the variant.
+    public func values(surface: SGToken?, geometryModifier: SGToken?) -> [String: SGConstantValue] {
+        var values: [String: SGConstantValue] = [:]
+        var index = 0
+        forEachNodeInPostOrder(roots: [surface?.node, geometryModifier?.node].compactMap { $0 }) { node in
+            for i in node.inputs {
+                guard case .constant(let c) = i.value?.source, shouldPromoteConstant(node: node, input: i, shouldPromote: shouldPromote) else {
+                    continue
+                }
+                values[promotedParameterName(prefix: namePrefix, index: index, input: i)] = c
+                index += 1
+            }
+        }
+        return values
+    }
+}
+
+/// Thrown by `setParameters` for a value that material parameters cannot hold.
+public struct SGUnsupportedParameterValueError: Error {
+    public let name: String
+}
+
+/// Replaces constant inputs with material parameters, which `getUSDA` declares as inputs of the material.
+///
+/// Interface-only inputs and string, token, texture and integer constants are never promoted.
+/// Without `shouldPromote`, every float, half, color and float or half vector constant is promoted.
+/// Parameters are named `<namePrefix><index>_<input name>` in a fixed traversal order,
+/// so graphs built by the same code get the same names.
+public func promoteConstants(surface: SGToken?, geometryModifier: SGToken?, namePrefix: String = "promoted", where shouldPromote: ((SGNode, SGNode.Input) -> Bool)? = nil) -> (surface: SGToken?, geometryModifier: SGToken?, parameters: SGPromotedParameters) {
+    var newNodes: [SGNode: SGNode] = [:]
+    var parameters: [(name: String, defaultValue: SGConstantValue)] = []
+    func rebuild(_ value: SGValue?) -> SGValue? {
+        guard let v = value, case .nodeOutput(let node, let outputName) = v.source, let newNode = newNodes[node] else {
+            return value
+        }
+        return type(of: v).init(source: .nodeOutput(newNode, outputName))
+    }
+    forEachNodeInPostOrder(roots: [surface?.node, geometryModifier?.node].compactMap { $0 }) { node in
+        let inputs: [SGNode.Input] = node.inputs.map { i in
+            if let v = i.value, case .constant(let c) = v.source, shouldPromoteConstant(node: node, input: i, shouldPromote: shouldPromote) {
+                let name = promotedParameterName(prefix: namePrefix, index: parameters.count, input: i)
+                parameters.append((name: name, defaultValue: c))
+                return SGNode.Input(nameID: i.nameID, dataType: i.dataType, connection: type(of: v).init(source: .parameter(name: name, defaultValue: c)))
+            }
+            return SGNode.Input(nameID: i.nameID, dataType: i.dataType, connection: rebuild(i.value))
+        }
+        newNodes[node] = node.copy(inputs: inputs)
+    }
+    let promoted = SGPromotedParameters(parameters: parameters, namePrefix: namePrefix, shouldPromote: shouldPromote)
+    return (rebuild(surface) as? SGToken, rebuild(geometryModifier) as? SGToken, promoted)
+}
+
+private func shouldPromoteConstant(node: SGNode, input: SGNode.Input, shouldPromote: ((SGNode, SGNode.Input) -> Bool)?) -> Bool {
+    if let names = SGNode.interfaceOnlyInputs[node.nodeType], names.contains(input.name) {
+        return false
+    }
+    switch input.dataType {
+    case .asset, .error, .string, .token, .int, .vector2i, .vector3i, .vector4i:
+        // Material parameters cannot hold these types, so setParameters could not set them
+        return false
+    default:
+        break
+    }
+    if let f = shouldPromote {
+        return f(node, input)
+    }
+    switch input.dataType {
+    case .float, .half, .color3f, .color4f, .vector2f, .vector3f, .vector4f, .vector2h, .vector3h, .vector4h:
+        return true
+    default:
+        return false
+    }
+}
+
+private func promotedParameterName(prefix: String, index: Int, input: SGNode.Input) -> String {
+    "\(prefix)\(index)_\(input.name)"
+}
+
+/// Visits every node reachable from the roots once, inputs before the nodes that use them,
+/// in an order that only depends on the structure of the graph.
+func forEachNodeInPostOrder(roots: [SGNode], _ body: (SGNode) -> Void) {
+    var visited: Set<SGNode> = []
+    var stack: [(SGNode, Bool)] = roots.reversed().map { ($0, false) }
+    while let (node, inputsVisited) = stack.popLast() {
+        if visited.contains(node) {
+            continue
+        }
+        if inputsVisited {
+            visited.insert(node)
+            body(node)
+            continue
+        }
+        stack.append((node, true))
+        for i in node.inputs.reversed() {
+            if let inode = i.value?.node, !visited.contains(inode) {
+                stack.append((inode, false))
+            }
+        }
+    }
+}
+
+#if os(visionOS)
+
+public extension ShaderGraphMaterial {
+    /// Sets the values returned by `SGPromotedParameters.values(surface:geometryModifier:)`.
+    mutating func setParameters(_ values: [String: SGConstantValue]) throws {
+        for (name, value) in values.sorted(by: { $0.key < $1.key }) {
+            guard let v = value.materialParameterValue else {
+                throw SGUnsupportedParameterValueError(name: name)
+            }
+            try setParameter(name: name, value: v)
+        }
+    }
+}
+
+extension SGConstantValue {
+    var materialParameterValue: MaterialParameters.Value? {
+        switch self {
+        case .bool(let v):
+            return .bool(v)
+        case .color3f(let v, let colorSpace):
+            return SGConstantValue.cgColor(red: v.x, green: v.y, blue: v.z, alpha: 1, colorSpace: colorSpace).map { .color($0) }
+        case .color4f(let v, let colorSpace):
+            return SGConstantValue.cgColor(red: v.x, green: v.y, blue: v.z, alpha: v.w, colorSpace: colorSpace).map { .color($0) }
+        case .float(let v):
+            return .float(v)
+        case .half(let v):
+            return .float(Float(v))
+        case .matrix2d(let v):
+            return .float2x2(v)
+        case .matrix3d(let v):
+            return .float3x3(v)
+        case .matrix4d(let v):
+            return .float4x4(v)
+        case .vector2f(let v):
+            return .simd2Float(v)
+        case .vector3f(let v):
+            return .simd3Float(v)
+        case .vector4f(let v):
+            return .simd4Float(v)
+        case .vector2h(let v):
+            return .simd2Float(SIMD2<Float>(v))
+        case .vector3h(let v):
+            return .simd3Float(SIMD3<Float>(v))
+        case .vector4h(let v):
+            return .simd4Float(SIMD4<Float>(v))
+        default:
+            return nil
+        }
+    }
+
+    private static func cgColor(red: Float, green: Float, blue: Float, alpha: Float, colorSpace: SGColorSpace?) -> CGColor? {
+        let name = colorSpace == .textureSRGB ? CGColorSpace.sRGB : CGColorSpace.linearSRGB
+        guard let space = CGColorSpace(name: name) else {
+            return nil
+        }
+        return CGColor(colorSpace: space, components: [CGFloat(red), CGFloat(green), CGFloat(blue), CGFloat(alpha)])
+    }
+}
+
+#endif
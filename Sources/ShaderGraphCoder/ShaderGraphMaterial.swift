@@ -12,19 +12,55 @@ import RealityKit
 
 public extension ShaderGraphMaterial {
     @MainActor
-    init(surface: SGToken?, geometryModifier: SGToken? = nil) async throws {
-        let materialName = "ShaderGraphCoderMaterial"
-        let (usda, textures, errors) = getUSDA(materialName: materialName, surface: surface, geometryModifier: geometryModifier)
+    init(surface: SGToken?, geometryModifier: SGToken? = nil, costBudget: SGMaterialCostBudget? = nil, textureCache: SGTextureCache = .shared) async throws {
+        let prepared = try SGPreparedMaterial(surface: surface, geometryModifier: geometryModifier, costBudget: costBudget)
+        try await self.init(prepared: prepared, textureCache: textureCache)
+    }
+
+    @MainActor
+    internal init(prepared: SGPreparedMaterial, textureCache: SGTextureCache) async throws {
+        try await self.init(named: "/Root/\(SGPreparedMaterial.materialName)", from: prepared.usdaData)
+        let resources = try await withThrowingTaskGroup(of: (String, TextureResource).self) { group in
+            for t in prepared.textures {
+                group.addTask { @MainActor in
+                    (t.key, try await textureCache.texture(for: t.value))
+                }
+            }
+            var resources: [(String, TextureResource)] = []
+            for try await r in group {
+                resources.append(r)
+            }
+            return resources
+        }
+        for (name, resource) in resources {
+            try setParameter(name: name, value: .textureResource(resource))
+        }
+    }
+}
+
+/// The USDA of a material and the textures to set on it.
+/// Preparing it only reads the graph, so it does not need the main actor.
+struct SGPreparedMaterial: @unchecked Sendable {
+    static let materialName = "ShaderGraphCoderMaterial"
+    let usdaData: Data
+    let textures: [String: SGTextureSource]
+
+    init(surface: SGToken?, geometryModifier: SGToken?, costBudget: SGMaterialCostBudget?) throws {
+        if let budget = costBudget {
+            let violations = estimateCost(surface: surface, geometryModifier: geometryModifier).violations(of: budget)
+            if violations.count > 0 {
+                throw SGCostBudgetError(violations: violations)
+            }
+        }
+        let (usda, textures, errors) = getUSDA(materialName: SGPreparedMaterial.materialName, surface: surface, geometryModifier: geometryModifier)
         if errors.count > 0 {
             throw ShaderGraphCoderError.graphContainsErrors(errors: errors)
         }
         guard let usdaData = usda.data(using: .utf8) else {
             throw ShaderGraphCoderError.failedToEncodeUSDAsData
         }
-        try await self.init(named: "/Root/\(materialName)", from: usdaData)
-        for t in textures {
-            try setParameter(name: t.key, value: .textureResource(try t.value.loadTextureResource()))
-        }
+        self.usdaData = usdaData
+        self.textures = textures
     }
 }
 
@@ -6,26 +6,26 @@ public extension SGValue {
     /// Bitangent
     static func bitangent(space: SGSpace = SGSpace.object, index: Int = 0) -> SGVector {
         return SGVector(source: .nodeOutput(SGNode(
-            nodeType: "ND_bitangent_vector3",
+            nodeTypeID: 119, // ND_bitangent_vector3
             inputs: [
-                .init(name: "space", dataType: SGDataType.string, connection: SGString(source: .constant(.string(space.rawValue)))),
-                .init(name: "index", dataType: SGDataType.int, connection: SGScalar(source: .constant(.int(index)))),
+                .init(nameID: 99, dataType: SGDataType.string, connection: SGString(source: .constant(.string(space.rawValue)))),
+                .init(nameID: 53, dataType: SGDataType.int, connection: SGScalar(source: .constant(.int(index)))),
             ],
             outputs: [.init(dataType: SGDataType.vector3f)])))
     }
     /// Camera Position
     static func cameraPosition(space: SGSpace = SGSpace.world) -> SGVector {
         return SGVector(source: .nodeOutput(SGNode(
-            nodeType: "ND_realitykit_cameraposition_vector3",
+            nodeTypeID: 645, // ND_realitykit_cameraposition_vector3
             inputs: [
-                .init(name: "space", dataType: SGDataType.string, connection: SGString(source: .constant(.string(space.rawValue)))),
+                .init(nameID: 99, dataType: SGDataType.string, connection: SGString(source: .constant(.string(space.rawValue)))),
             ],
             outputs: [.init(dataType: SGDataType.vector3f)])))
     }
     /// Frame
     static var frame: SGScalar {
         return SGScalar(source: .nodeOutput(SGNode(
-            nodeType: "ND_frame_float",
+            nodeTypeID: 339, // ND_frame_float
             inputs: [
             ],
             outputs: [.init(dataType: SGDataType.float)])))
@@ -33,34 +33,34 @@ public extension SGValue {
     /// Geometry Color
     static func geomcolorColor3(index: Int = 0) -> SGColor {
         return SGColor(source: .nodeOutput(SGNode(
-            nodeType: "ND_geomcolor_color3",
+            nodeTypeID: 340, // ND_geomcolor_color3
             inputs: [
-                .init(name: "index", dataType: SGDataType.int, connection: SGScalar(source: .constant(.int(index)))),
+                .init(nameID: 53, dataType: SGDataType.int, connection: SGScalar(source: .constant(.int(index)))),
             ],
             outputs: [.init(dataType: SGDataType.color3f)])))
     }
     /// Geometry Color
     static func geomcolorColor4(index: Int = 0) -> SGColor {
         return SGColor(source: .nodeOutput(SGNode(
-            nodeType: "ND_geomcolor_color4",
+            nodeTypeID: 341, // ND_geomcolor_color4
             inputs: [
-                .init(name: "index", dataType: SGDataType.int, connection: SGScalar(source: .constant(.int(index)))),
+                .init(nameID: 53, dataType: SGDataType.int, connection: SGScalar(source: .constant(.int(index)))),
             ],
             outputs: [.init(dataType: SGDataType.color4f)])))
     }
     /// Geometry Color
     static func geomcolorFloat(index: Int = 0) -> SGScalar {
         return SGScalar(source: .nodeOutput(SGNode(
-            nodeType: "ND_geomcolor_float",
+            nodeTypeID: 342, // ND_geomcolor_float
             inputs: [
-                .init(name: "index", dataType: SGDataType.int, connection: SGScalar(source: .constant(.int(index)))),
+                .init(nameID: 53, dataType: SGDataType.int, connection: SGScalar(source: .constant(.int(index)))),
             ],
             outputs: [.init(dataType: SGDataType.float)])))
     }
     /// Geometry Modifier Custom Attribute
     static var geometryModifierCustomAttribute: SGVector {
         return SGVector(source: .nodeOutput(SGNode(
-            nodeType: "ND_realitykit_geometry_modifier_custom_attribute",
+            nodeTypeID: 656, // ND_realitykit_geometry_modifier_custom_attribute
             inputs: [
             ],
             outputs: [.init(dataType: SGDataType.vector4f)])))
@@ -68,7 +68,7 @@ public extension SGValue {
     /// Geometry Modifier Custom Attribute 0
     static var geometryModifierCustomAttributeHalf20: SGVector {
         return SGVector(source: .nodeOutput(SGNode(
-            nodeType: "ND_realitykit_geometry_modifier_custom_attribute_half2_0",
+            nodeTypeID: 657, // ND_realitykit_geometry_modifier_custom_attribute_half2_0
             inputs: [
             ],
             outputs: [.init(dataType: SGDataType.vector2h)])))
@@ -76,7 +76,7 @@ public extension SGValue {
     /// Geometry Modifier Custom Attribute 1
     static var geometryModifierCustomAttributeHalf21: SGVector {
         return SGVector(source: .nodeOutput(SGNode(
-            nodeType: "ND_realitykit_geometry_modifier_custom_attribute_half2_1",
+            nodeTypeID: 658, // ND_realitykit_geometry_modifier_custom_attribute_half2_1
             inputs: [
             ],
             outputs: [.init(dataType: SGDataType.vector2h)])))
@@ -84,7 +84,7 @@ public extension SGValue {
     /// Geometry Modifier Custom Attribute 0
     static var geometryModifierCustomAttributeHalf40: SGVector {
         return SGVector(source: .nodeOutput(SGNode(
-            nodeType: "ND_realitykit_geometry_modifier_custom_attribute_half4_0",
+            nodeTypeID: 659, // ND_realitykit_geometry_modifier_custom_attribute_half4_0
             inputs: [
             ],
             outputs: [.init(dataType: SGDataType.vector4h)])))
@@ -92,7 +92,7 @@ public extension SGValue {
     /// Geometry Modifier Custom Attribute 1
     static var geometryModifierCustomAttributeHalf41: SGVector {
         return SGVector(source: .nodeOutput(SGNode(
-            nodeType: "ND_realitykit_geometry_modifier_custom_attribute_half4_1",
+            nodeTypeID: 660, // ND_realitykit_geometry_modifier_custom_attribute_half4_1
             inputs: [
             ],
             outputs: [.init(dataType: SGDataType.vector4h)])))
@@ -100,7 +100,7 @@ public extension SGValue {
     /// Geometry Modifier Custom Attribute 2
     static var geometryModifierCustomAttributeHalf42: SGVector {
         return SGVector(source: .nodeOutput(SGNode(
-            nodeType: "ND_realitykit_geometry_modifier_custom_attribute_half4_2",
+            nodeTypeID: 661, // ND_realitykit_geometry_modifier_custom_attribute_half4_2
             inputs: [
             ],
             outputs: [.init(dataType: SGDataType.vector4h)])))
@@ -108,7 +108,7 @@ public extension SGValue {
     /// Geometry Modifier Custom Attribute 3
     static var geometryModifierCustomAttributeHalf43: SGVector {
         return SGVector(source: .nodeOutput(SGNode(
-            nodeType: "ND_realitykit_geometry_modifier_custom_attribute_half4_3",
+            nodeTypeID: 662, // ND_realitykit_geometry_modifier_custom_attribute_half4_3
             inputs: [
             ],
             outputs: [.init(dataType: SGDataType.vector4h)])))
@@ -116,7 +116,7 @@ public extension SGValue {
     /// Geometry Modifier Custom Parameter
     static var geometryModifierCustomParameter: SGVector {
         return SGVector(source: .nodeOutput(SGNode(
-            nodeType: "ND_realitykit_geometry_modifier_custom_parameter",
+            nodeTypeID: 663, // ND_realitykit_geometry_modifier_custom_parameter
             inputs: [
             ],
             outputs: [.init(dataType: SGDataType.vector4f)])))
@@ -124,7 +124,7 @@ public extension SGValue {
     /// Geometry Modifier Model Position Offset
     static var geometryModifierModelPositionOffset: SGVector {
         return SGVector(source: .nodeOutput(SGNode(
-            nodeType: "ND_realitykit_geometry_modifier_model_position_offset",
+            nodeTypeID: 664, // ND_realitykit_geometry_modifier_model_position_offset
             inputs: [
             ],
             outputs: [.init(dataType: SGDataType.vector3f)])))
@@ -132,7 +132,7 @@ public extension SGValue {
     /// Geometry Modifier Model To View
     static var geometryModifierModelToView: SGMatrix {
         return SGMatrix(source: .nodeOutput(SGNode(
-            nodeType: "ND_realitykit_geometry_modifier_model_to_view",
+            nodeTypeID: 665, // ND_realitykit_geometry_modifier_model_to_view
             inputs: [
             ],
             outputs: [.init(dataType: SGDataType.matrix4d)])))
@@ -140,7 +140,7 @@ public extension SGValue {
     /// Geometry Modifier Model To World
     static var geometryModifierModelToWorld: SGMatrix {
         return SGMatrix(source: .nodeOutput(SGNode(
-            nodeType: "ND_realitykit_geometry_modifier_model_to_world",
+            nodeTypeID: 666, // ND_realitykit_geometry_modifier_model_to_world
             inputs: [
             ],
             outputs: [.init(dataType: SGDataType.matrix4d)])))
@@ -148,7 +148,7 @@ public extension SGValue {
     /// Geometry Modifier Normal To World
     static var geometryModifierNormalToWorld: SGMatrix {
         return SGMatrix(source: .nodeOutput(SGNode(
-            nodeType: "ND_realitykit_geometry_modifier_normal_to_world",
+            nodeTypeID: 667, // ND_realitykit_geometry_modifier_normal_to_world
             inputs: [
             ],
             outputs: [.init(dataType: SGDataType.matrix3d)])))
@@ -156,7 +156,7 @@ public extension SGValue {
     /// Geometry Modifier Projection To View
     static var geometryModifierProjectionToView: SGMatrix {
         return SGMatrix(source: .nodeOutput(SGNode(
-            nodeType: "ND_realitykit_geometry_modifier_projection_to_view",
+            nodeTypeID: 668, // ND_realitykit_geometry_modifier_projection_to_view
             inputs: [
             ],
             outputs: [.init(dataType: SGDataType.matrix4d)])))
@@ -164,7 +164,7 @@ public extension SGValue {
     /// Geometry Modifier uv0 Offset
     static var geometryModifierUV0Offset: SGVector {
         return SGVector(source: .nodeOutput(SGNode(
-            nodeType: "ND_realitykit_geometry_modifier_uv0_offset",
+            nodeTypeID: 669, // ND_realitykit_geometry_modifier_uv0_offset
             inputs: [
             ],
             outputs: [.init(dataType: SGDataType.vector2f)])))
@@ -172,7 +172,7 @@ public extension SGValue {
     /// Geometry Modifier uv0 Transform
     static var geometryModifierUV0Transform: SGMatrix {
         return SGMatrix(source: .nodeOutput(SGNode(
-            nodeType: "ND_realitykit_geometry_modifier_uv0_transform",
+            nodeTypeID: 670, // ND_realitykit_geometry_modifier_uv0_transform
             inputs: [
             ],
             outputs: [.init(dataType: SGDataType.matrix2d)])))
@@ -180,7 +180,7 @@ public extension SGValue {
     /// Geometry Modifier uv1 Offset
     static var geometryModifierUV1Offset: SGVector {
         return SGVector(source: .nodeOutput(SGNode(
-            nodeType: "ND_realitykit_geometry_modifier_uv1_offset",
+            nodeTypeID: 671, // ND_realitykit_geometry_modifier_uv1_offset
             inputs: [
             ],
             outputs: [.init(dataType: SGDataType.vector2f)])))
@@ -188,7 +188,7 @@ public extension SGValue {
     /// Geometry Modifier uv1 Transform
     static var geometryModifierUV1Transform: SGMatrix {
         return SGMatrix(source: .nodeOutput(SGNode(
-            nodeType: "ND_realitykit_geometry_modifier_uv1_transform",
+            nodeTypeID: 672, // ND_realitykit_geometry_modifier_uv1_transform
             inputs: [
             ],
             outputs: [.init(dataType: SGDataType.matrix2d)])))
@@ -196,7 +196,7 @@ public extension SGValue {
     /// Geometry Modifier Vertex ID
     static var geometryModifierVertexId: SGScalar {
         return SGScalar(source: .nodeOutput(SGNode(
-            nodeType: "ND_realitykit_geometry_modifier_vertex_id",
+            nodeTypeID: 673, // ND_realitykit_geometry_modifier_vertex_id
             inputs: [
             ],
             outputs: [.init(dataType: SGDataType.int)])))
@@ -204,7 +204,7 @@ public extension SGValue {
     /// Geometry Modifier View To Projection
     static var geometryModifierViewToProjection: SGMatrix {
         return SGMatrix(source: .nodeOutput(SGNode(
-            nodeType: "ND_realitykit_geometry_modifier_view_to_projection",
+            nodeTypeID: 674, // ND_realitykit_geometry_modifier_view_to_projection
             inputs: [
             ],
             outputs: [.init(dataType: SGDataType.matrix4d)])))
@@ -212,7 +212,7 @@ public extension SGValue {
     /// Geometry Modifier World To Model
     static var geometryModifierWorldToModel: SGMatrix {
         return SGMatrix(source: .nodeOutput(SGNode(
-            nodeType: "ND_realitykit_geometry_modifier_world_to_model",
+            nodeTypeID: 675, // ND_realitykit_geometry_modifier_world_to_model
             inputs: [
             ],
             outputs: [.init(dataType: SGDataType.matrix4d)])))
@@ -220,7 +220,7 @@ public extension SGValue {
     /// Material Parameter Base Color Tint
     static var materialParametersBaseColorTint: SGColor {
         return SGColor(source: .nodeOutput(SGNode(
-            nodeType: "ND_realitykit_material_parameters_base_color_tint",
+            nodeTypeID: 688, // ND_realitykit_material_parameters_base_color_tint
             inputs: [
             ],
             outputs: [.init(dataType: SGDataType.color3f)])))
@@ -228,7 +228,7 @@ public extension SGValue {
     /// Material Parameter Roughness Scale
     static var materialParametersClearcoatRoughnessScale: SGScalar {
         return SGScalar(source: .nodeOutput(SGNode(
-            nodeType: "ND_realitykit_material_parameters_clearcoat_roughness_scale",
+            nodeTypeID: 689, // ND_realitykit_material_parameters_clearcoat_roughness_scale
             inputs: [
             ],
             outputs: [.init(dataType: SGDataType.float)])))
@@ -236,7 +236,7 @@ public extension SGValue {
     /// Material Parameter Clearcoat Scale
     static var materialParametersClearcoatScale: SGScalar {
         return SGScalar(source: .nodeOutput(SGNode(
-            nodeType: "ND_realitykit_material_parameters_clearcoat_scale",
+            nodeTypeID: 690, // ND_realitykit_material_parameters_clearcoat_scale
             inputs: [
             ],
             outputs: [.init(dataType: SGDataType.float)])))
@@ -244,7 +244,7 @@ public extension SGValue {
     /// Material Parameter Emissive Color
     static var materialParametersEmissiveColor: SGColor {
         return SGColor(source: .nodeOutput(SGNode(
-            nodeType: "ND_realitykit_material_parameters_emissive_color",
+            nodeTypeID: 691, // ND_realitykit_material_parameters_emissive_color
             inputs: [
             ],
             outputs: [.init(dataType: SGDataType.color3f)])))
@@ -252,7 +252,7 @@ public extension SGValue {
     /// Material Parameter Metallic Scale
     static var materialParametersMetallicScale: SGScalar {
         return SGScalar(source: .nodeOutput(SGNode(
-            nodeType: "ND_realitykit_material_parameters_metallic_scale",
+            nodeTypeID: 692, // ND_realitykit_material_parameters_metallic_scale
             inputs: [
             ],
             outputs: [.init(dataType: SGDataType.float)])))
@@ -260,7 +260,7 @@ public extension SGValue {
     /// Material Parameter Opacity Scale
     static var materialParametersOpacityScale: SGScalar {
         return SGScalar(source: .nodeOutput(SGNode(
-            nodeType: "ND_realitykit_material_parameters_opacity_scale",
+            nodeTypeID: 693, // ND_realitykit_material_parameters_opacity_scale
             inputs: [
             ],
             outputs: [.init(dataType: SGDataType.float)])))
@@ -268,7 +268,7 @@ public extension SGValue {
     /// Material Parameter Opacity Threshold
     static var materialParametersOpacityThreshold: SGScalar {
         return SGScalar(source: .nodeOutput(SGNode(
-            nodeType: "ND_realitykit_material_parameters_opacity_threshold",
+            nodeTypeID: 694, // ND_realitykit_material_parameters_opacity_threshold
             inputs: [
             ],
             outputs: [.init(dataType: SGDataType.float)])))
@@ -276,7 +276,7 @@ public extension SGValue {
     /// Material Parameter Roughness Scale
     static var materialParametersRoughnessScale: SGScalar {
         return SGScalar(source: .nodeOutput(SGNode(
-            nodeType: "ND_realitykit_material_parameters_roughness_scale",
+            nodeTypeID: 695, // ND_realitykit_material_parameters_roughness_scale
             inputs: [
             ],
             outputs: [.init(dataType: SGDataType.float)])))
@@ -284,7 +284,7 @@ public extension SGValue {
     /// Material Parameter Specular Scale
     static var materialParametersSpecularScale: SGScalar {
         return SGScalar(source: .nodeOutput(SGNode(
-            nodeType: "ND_realitykit_material_parameters_specular_scale",
+            nodeTypeID: 696, // ND_realitykit_material_parameters_specular_scale
             inputs: [
             ],
             outputs: [.init(dataType: SGDataType.float)])))
@@ -292,25 +292,25 @@ public extension SGValue {
     /// Normal
     static func normal(space: SGSpace = SGSpace.object) -> SGVector {
         return SGVector(source: .nodeOutput(SGNode(
-            nodeType: "ND_normal_vector3",
+            nodeTypeID: 570, // ND_normal_vector3
             inputs: [
-                .init(name: "space", dataType: SGDataType.string, connection: SGString(source: .constant(.string(space.rawValue)))),
+                .init(nameID: 99, dataType: SGDataType.string, connection: SGString(source: .constant(.string(space.rawValue)))),
             ],
             outputs: [.init(dataType: SGDataType.vector3f)])))
     }
     /// Position
     static func position(space: SGSpace = SGSpace.object) -> SGVector {
         return SGVector(source: .nodeOutput(SGNode(
-            nodeType: "ND_position_vector3",
+            nodeTypeID: 594, // ND_position_vector3
             inputs: [
-                .init(name: "space", dataType: SGDataType.string, connection: SGString(source: .constant(.string(space.rawValue)))),
+                .init(nameID: 99, dataType: SGDataType.string, connection: SGString(source: .constant(.string(space.rawValue)))),
             ],
             outputs: [.init(dataType: SGDataType.vector3f)])))
     }
     /// Surface Base Color
     static var surfaceBaseColor: SGColor {
         return SGColor(source: .nodeOutput(SGNode(
-            nodeType: "ND_realitykit_surface_base_color",
+            nodeTypeID: 715, // ND_realitykit_surface_base_color
             inputs: [
             ],
             outputs: [.init(dataType: SGDataType.color3f)])))
@@ -318,7 +318,7 @@ public extension SGValue {
     /// Surface Clearcoat
     static var surfaceClearcoat: SGScalar {
         return SGScalar(source: .nodeOutput(SGNode(
-            nodeType: "ND_realitykit_surface_clearcoat",
+            nodeTypeID: 716, // ND_realitykit_surface_clearcoat
             inputs: [
             ],
             outputs: [.init(dataType: SGDataType.float)])))
@@ -326,7 +326,7 @@ public extension SGValue {
     /// Surface Clearcoat Roughness
     static var surfaceClearcoatRoughness: SGScalar {
         return SGScalar(source: .nodeOutput(SGNode(
-            nodeType: "ND_realitykit_surface_clearcoat_roughness",
+            nodeTypeID: 717, // ND_realitykit_surface_clearcoat_roughness
             inputs: [
             ],
             outputs: [.init(dataType: SGDataType.float)])))
@@ -334,7 +334,7 @@ public extension SGValue {
     /// Surface Custom Attribute
     static var surfaceCustomAttribute: SGVector {
         return SGVector(source: .nodeOutput(SGNode(
-            nodeType: "ND_realitykit_surface_custom_attribute",
+            nodeTypeID: 718, // ND_realitykit_surface_custom_attribute
             inputs: [
             ],
             outputs: [.init(dataType: SGDataType.vector4f)])))
@@ -342,7 +342,7 @@ public extension SGValue {
     /// Surface Custom Attribute 0
     static var surfaceCustomAttributeHalf20: SGVector {
         return SGVector(source: .nodeOutput(SGNode(
-            nodeType: "ND_realitykit_surface_custom_attribute_half2_0",
+            nodeTypeID: 719, // ND_realitykit_surface_custom_attribute_half2_0
             inputs: [
             ],
             outputs: [.init(dataType: SGDataType.vector2h)])))
@@ -350,7 +350,7 @@ public extension SGValue {
     /// Surface Custom Attribute 1
     static var surfaceCustomAttributeHalf21: SGVector {
         return SGVector(source: .nodeOutput(SGNode(
-            nodeType: "ND_realitykit_surface_custom_attribute_half2_1",
+            nodeTypeID: 720, // ND_realitykit_surface_custom_attribute_half2_1
             inputs: [
             ],
             outputs: [.init(dataType: SGDataType.vector2h)])))
@@ -358,7 +358,7 @@ public extension SGValue {
     /// Surface Custom Attribute 0
     static var surfaceCustomAttributeHalf40: SGVector {
         return SGVector(source: .nodeOutput(SGNode(
-            nodeType: "ND_realitykit_surface_custom_attribute_half4_0",
+            nodeTypeID: 721, // ND_realitykit_surface_custom_attribute_half4_0
             inputs: [
             ],
             outputs: [.init(dataType: SGDataType.vector4h)])))
@@ -366,7 +366,7 @@ public extension SGValue {
     /// Surface Custom Attribute 1
     static var surfaceCustomAttributeHalf41: SGVector {
         return SGVector(source: .nodeOutput(SGNode(
-            nodeType: "ND_realitykit_surface_custom_attribute_half4_1",
+            nodeTypeID: 722, // ND_realitykit_surface_custom_attribute_half4_1
             inputs: [
             ],
             outputs: [.init(dataType: SGDataType.vector4h)])))
@@ -374,7 +374,7 @@ public extension SGValue {
     /// Surface Custom Attribute 2
     static var surfaceCustomAttributeHalf42: SGVector {
         return SGVector(source: .nodeOutput(SGNode(
-            nodeType: "ND_realitykit_surface_custom_attribute_half4_2",
+            nodeTypeID: 723, // ND_realitykit_surface_custom_attribute_half4_2
             inputs: [
             ],
             outputs: [.init(dataType: SGDataType.vector4h)])))
@@ -382,7 +382,7 @@ public extension SGValue {
     /// Surface Custom Attribute 3
     static var surfaceCustomAttributeHalf43: SGVector {
         return SGVector(source: .nodeOutput(SGNode(
-            nodeType: "ND_realitykit_surface_custom_attribute_half4_3",
+            nodeTypeID: 724, // ND_realitykit_surface_custom_attribute_half4_3
             inputs: [
             ],
             outputs: [.init(dataType: SGDataType.vector4h)])))
@@ -390,7 +390,7 @@ public extension SGValue {
     /// Surface Custom Parameter
     static var surfaceCustomParameter: SGVector {
         return SGVector(source: .nodeOutput(SGNode(
-            nodeType: "ND_realitykit_surface_custom_parameter",
+            nodeTypeID: 725, // ND_realitykit_surface_custom_parameter
             inputs: [
             ],
             outputs: [.init(dataType: SGDataType.vector4f)])))
@@ -398,7 +398,7 @@ public extension SGValue {
     /// Surface Emissive Color
     static var surfaceEmissiveColor: SGColor {
         return SGColor(source: .nodeOutput(SGNode(
-            nodeType: "ND_realitykit_surface_emissive_color",
+            nodeTypeID: 726, // ND_realitykit_surface_emissive_color
             inputs: [
             ],
             outputs: [.init(dataType: SGDataType.color3f)])))
@@ -406,7 +406,7 @@ public extension SGValue {
     /// Surface Metallic
     static var surfaceMetallic: SGScalar {
         return SGScalar(source: .nodeOutput(SGNode(
-            nodeType: "ND_realitykit_surface_metallic",
+            nodeTypeID: 727, // ND_realitykit_surface_metallic
             inputs: [
             ],
             outputs: [.init(dataType: SGDataType.float)])))
@@ -414,7 +414,7 @@ public extension SGValue {
     /// Surface Model To View
     static var surfaceModelToView: SGMatrix {
         return SGMatrix(source: .nodeOutput(SGNode(
-            nodeType: "ND_realitykit_surface_model_to_view",
+            nodeTypeID: 728, // ND_realitykit_surface_model_to_view
             inputs: [
             ],
             outputs: [.init(dataType: SGDataType.matrix4d)])))
@@ -422,7 +422,7 @@ public extension SGValue {
     /// Surface Model To World
     static var surfaceModelToWorld: SGMatrix {
         return SGMatrix(source: .nodeOutput(SGNode(
-            nodeType: "ND_realitykit_surface_model_to_world",
+            nodeTypeID: 729, // ND_realitykit_surface_model_to_world
             inputs: [
             ],
             outputs: [.init(dataType: SGDataType.matrix4d)])))
@@ -430,7 +430,7 @@ public extension SGValue {
     /// Surface Opacity
     static var surfaceOpacity: SGScalar {
         return SGScalar(source: .nodeOutput(SGNode(
-            nodeType: "ND_realitykit_surface_opacity",
+            nodeTypeID: 730, // ND_realitykit_surface_opacity
             inputs: [
             ],
             outputs: [.init(dataType: SGDataType.float)])))
@@ -438,7 +438,7 @@ public extension SGValue {
     /// Surface Projection To View
     static var surfaceProjectionToView: SGMatrix {
         return SGMatrix(source: .nodeOutput(SGNode(
-            nodeType: "ND_realitykit_surface_projection_to_view",
+            nodeTypeID: 731, // ND_realitykit_surface_projection_to_view
             inputs: [
             ],
             outputs: [.init(dataType: SGDataType.matrix4d)])))
@@ -446,7 +446,7 @@ public extension SGValue {
     /// Surface Roughness
     static var surfaceRoughness: SGScalar {
         return SGScalar(source: .nodeOutput(SGNode(
-            nodeType: "ND_realitykit_surface_roughness",
+            nodeTypeID: 732, // ND_realitykit_surface_roughness
             inputs: [
             ],
             outputs: [.init(dataType: SGDataType.float)])))
@@ -454,7 +454,7 @@ public extension SGValue {
     /// Surface Screen Position
     static var surfaceScreenPosition: SGVector {
         return SGVector(source: .nodeOutput(SGNode(
-            nodeType: "ND_realitykit_surface_screen_position",
+            nodeTypeID: 733, // ND_realitykit_surface_screen_position
             inputs: [
             ],
             outputs: [.init(dataType: SGDataType.vector4f)])))
@@ -462,7 +462,7 @@ public extension SGValue {
     /// Surface Specular
     static var surfaceSpecular: SGScalar {
         return SGScalar(source: .nodeOutput(SGNode(
-            nodeType: "ND_realitykit_surface_specular",
+            nodeTypeID: 734, // ND_realitykit_surface_specular
             inputs: [
             ],
             outputs: [.init(dataType: SGDataType.float)])))
@@ -470,7 +470,7 @@ public extension SGValue {
     /// Surface View Direction
     static var surfaceViewDirection: SGVector {
         return SGVector(source: .nodeOutput(SGNode(
-            nodeType: "ND_realitykit_surface_view_direction",
+            nodeTypeID: 735, // ND_realitykit_surface_view_direction
             inputs: [
             ],
             outputs: [.init(dataType: SGDataType.vector3f)])))
@@ -478,7 +478,7 @@ public extension SGValue {
     /// Surface View To Projection
     static var surfaceViewToProjection: SGMatrix {
         return SGMatrix(source: .nodeOutput(SGNode(
-            nodeType: "ND_realitykit_surface_view_to_projection",
+            nodeTypeID: 736, // ND_realitykit_surface_view_to_projection
             inputs: [
             ],
             outputs: [.init(dataType: SGDataType.matrix4d)])))
@@ -486,7 +486,7 @@ public extension SGValue {
     /// Surface World To View
     static var surfaceWorldToView: SGMatrix {
         return SGMatrix(source: .nodeOutput(SGNode(
-            nodeType: "ND_realitykit_surface_world_to_view",
+            nodeTypeID: 737, // ND_realitykit_surface_world_to_view
             inputs: [
             ],
             outputs: [.init(dataType: SGDataType.matrix4d)])))
@@ -494,35 +494,35 @@ public extension SGValue {
     /// Tangent
     static func tangent(space: SGSpace = SGSpace.object, index: Int = 0) -> SGVector {
         return SGVector(source: .nodeOutput(SGNode(
-            nodeType: "ND_tangent_vector3",
+            nodeTypeID: 942, // ND_tangent_vector3
             inputs: [
-                .init(name: "space", dataType: SGDataType.string, connection: SGString(source: .constant(.string(space.rawValue)))),
-                .init(name: "index", dataType: SGDataType.int, connection: SGScalar(source: .constant(.int(index)))),
+                .init(nameID: 99, dataType: SGDataType.string, connection: SGString(source: .constant(.string(space.rawValue)))),
+                .init(nameID: 53, dataType: SGDataType.int, connection: SGScalar(source: .constant(.int(index)))),
             ],
             outputs: [.init(dataType: SGDataType.vector3f)])))
     }
     /// Texture Coordinates
     static func texcoordVector2(index: Int = 0) -> SGVector {
         return SGVector(source: .nodeOutput(SGNode(
-            nodeType: "ND_texcoord_vector2",
+            nodeTypeID: 943, // ND_texcoord_vector2
             inputs: [
-                .init(name: "index", dataType: SGDataType.int, connection: SGScalar(source: .constant(.int(index)))),
+                .init(nameID: 53, dataType: SGDataType.int, connection: SGScalar(source: .constant(.int(index)))),
             ],
             outputs: [.init(dataType: SGDataType.vector2f)])))
     }
     /// Texture Coordinates
     static func texcoordVector3(index: Int = 0) -> SGVector {
         return SGVector(source: .nodeOutput(SGNode(
-            nodeType: "ND_texcoord_vector3",
+            nodeTypeID: 944, // ND_texcoord_vector3
             inputs: [
-                .init(name: "index", dataType: SGDataType.int, connection: SGScalar(source: .constant(.int(index)))),
+                .init(nameID: 53, dataType: SGDataType.int, connection: SGScalar(source: .constant(.int(index)))),
             ],
             outputs: [.init(dataType: SGDataType.vector3f)])))
     }
     /// Time
     static var time: SGScalar {
         return SGScalar(source: .nodeOutput(SGNode(
-            nodeType: "ND_time_float",
+            nodeTypeID: 952, // ND_time_float
             inputs: [
             ],
             outputs: [.init(dataType: SGDataType.float)])))
@@ -530,18 +530,18 @@ public extension SGValue {
     /// Up Direction
     static func upDirection(space: SGSpace = SGSpace.world) -> SGVector {
         return SGVector(source: .nodeOutput(SGNode(
-            nodeType: "ND_updirection_vector3",
+            nodeTypeID: 971, // ND_updirection_vector3
             inputs: [
-                .init(name: "space", dataType: SGDataType.string, connection: SGString(source: .constant(.string(space.rawValue)))),
+                .init(nameID: 99, dataType: SGDataType.string, connection: SGString(source: .constant(.string(space.rawValue)))),
             ],
             outputs: [.init(dataType: SGDataType.vector3f)])))
     }
     /// View Direction
     static func viewDirection(space: SGSpace = SGSpace.world) -> SGVector {
         return SGVector(source: .nodeOutput(SGNode(
-            nodeType: "ND_realitykit_viewdirection_vector3",
+            nodeTypeID: 739, // ND_realitykit_viewdirection_vector3
             inputs: [
-                .init(name: "space", dataType: SGDataType.string, connection: SGString(source: .constant(.string(space.rawValue)))),
+                .init(nameID: 99, dataType: SGDataType.string, connection: SGString(source: .constant(.string(space.rawValue)))),
             ],
             outputs: [.init(dataType: SGDataType.vector3f)])))
     }
@@ -0,0 +1,149 @@
+//
+//  Subgraph.swift
+//  ShaderGraphCoder
+//
+//  Reusable subgraphs that are exported once as a USD NodeGraph
+//  and instanced by reference wherever they are applied.
+//
+
+import Foundation
+
+/// An input of a subgraph. Its data type is the data type of the default value.
+public struct SGSubgraphInput {
+    public let name: String
+    public let defaultValue: SGConstantValue
+    public init(name: String, defaultValue: SGConstantValue) {
+        self.name = name
+        self.defaultValue = defaultValue
+    }
+    public var dataType: SGDataType { defaultValue.dataType }
+}
+
+/// A graph that is built once and exported as a NodeGraph, so applying it many times does not repeat its nodes.
+///
+/// The body receives one value per input. Material parameters and textures used in the body are declared
+/// on the material that applies it and connected to every instance.
+///
+/// ```swift
+/// let warp = SGSubgraph(name: "Warp", inputs: [.init(name: "position", defaultValue: .vector3f(.zero))]) { inputs in
+///     let p = inputs[0] as! SGVector
+///     return p + sin(p * 3) * 0.1
+/// }
+/// let a = warp(SGValue.position())
+/// ```
+public final class SGSubgraph<Output: SGValue> {
+    let definition: SGSubgraphDefinition
+
+    public var name: String { definition.name }
+    public var inputs: [SGSubgraphInput] { definition.inputs }
+
+    public init(name: String, inputs: [SGSubgraphInput], _ body: ([SGValue]) -> Output) {
+        let inputValues = inputs.map { i in
+            i.dataType.valueType.init(source: .parameter(name: i.name, defaultValue: i.defaultValue))
+        }
+        definition = SGSubgraphDefinition(name: name, inputs: inputs, output: body(inputValues))
+    }
+
+    /// Instances the subgraph. A nil argument leaves that input at its default value.
+    public func callAsFunction(_ arguments: SGValue?...) -> Output {
+        guard arguments.count == definition.inputs.count else {
+            return Output(source: .error("Subgraph \(definition.name) expects \(definition.inputs.count) inputs, but got \(arguments.count).", values: arguments))
+        }
+        for (i, a) in zip(definition.inputs, arguments) {
+            guard i.dataType.matches(a) else {
+                return Output(source: .error("Invalid \(definition.name) input. Expected \(i.name) data type to be \(i.dataType), but got \(a?.dataType.rawValue ?? "nil").", values: [a]))
+            }
+        }
+        let node = SGSubgraphNode(definition: definition, inputs: zip(definition.inputs, arguments).map { i, a in
+            SGNode.Input(name: i.name, dataType: i.dataType, connection: a)
+        })
+        return Output(source: .nodeOutput(node))
+    }
+}
+
+final class SGSubgraphDefinition {
+    private static var nextId: Int = 1
+    let id: Int
+    let name: String
+    let inputs: [SGSubgraphInput]
+    let output: SGValue
+    /// The parameters the body uses that are not inputs, including those of the subgraphs it instances, sorted by name.
+    let parameters: [(name: String, defaultValue: SGConstantValue)]
+
+    init(name: String, inputs: [SGSubgraphInput], output: SGValue) {
+        self.id = SGSubgraphDefinition.nextId
+        SGSubgraphDefinition.nextId += 1
+        self.name = name
+        self.inputs = inputs
+        self.output = output
+        var parameters: [String: SGConstantValue] = [:]
+        if case .parameter(name: let name, defaultValue: let dv) = output.source {
+            parameters[name] = dv
+        }
+        forEachNodeInPostOrder(roots: [output.node].compactMap { $0 }) { node in
+            for i in node.inputs {
+                if case .parameter(name: let name, defaultValue: let dv) = i.value?.source {
+                    parameters[name] = dv
+                }
+            }
+            if let s = node as? SGSubgraphNode {
+                for p in s.definition.parameters {
+                    parameters[p.name] = p.defaultValue
+                }
+            }
+        }
+        for i in inputs {
+            parameters[i.name] = nil
+        }
+        self.parameters = parameters.map { (name: $0.key, defaultValue: $0.value) }.sorted { $0.name < $1.name }
+    }
+
+    var usdaName: String {
+        let safeName = String(name.map { $0.isLetter || $0.isNumber || $0 == "_" ? $0 : "_" })
+        return "Subgraph\(id)_\(safeName)"
+    }
+}
+
+/// A node that instances a subgraph. It is exported as a NodeGraph that references the subgraph's definition.
+final class SGSubgraphNode: SGNode {
+    let definition: SGSubgraphDefinition
+
+    init(definition: SGSubgraphDefinition, inputs: [Input]) {
+        self.definition = definition
+        // Every definition has its own node type, so it is not interned in SGNode.nodeTypes, which never shrinks
+        super.init(nodeTypeID: -1, inputs: inputs, outputs: [.init(dataType: definition.output.dataType)])
+    }
+
+    override var nodeType: String { definition.usdaName }
+
+    override func copy(inputs: [Input]) -> SGNode {
+        SGSubgraphNode(definition: definition, inputs: inputs)
+    }
+}
+
+/// Returns the definitions of the subgraphs the nodes instance, including subgraphs instanced by those, each once.
+func collectSubgraphs(nodes rootNodes: [SGNode]) -> [SGSubgraphDefinition] {
+    var definitions: [SGSubgraphDefinition] = []
+    var definitionIds: Set<Int> = []
+    var nodesToVisit: [SGNode] = rootNodes
+    var nodesVisited: Set<SGNode> = []
+    while let node = nodesToVisit.popLast() {
+        if nodesVisited.contains(node) {
+            continue
+        }
+        nodesVisited.insert(node)
+        if let s = node as? SGSubgraphNode, !definitionIds.contains(s.definition.id) {
+            definitionIds.insert(s.definition.id)
+            definitions.append(s.definition)
+            if let bodyNode = s.definition.output.node {
+                nodesToVisit.append(bodyNode)
+            }
+        }
+        for i in node.inputs {
+            if let inode = i.value?.node {
+                nodesToVisit.append(inode)
+            }
+        }
+    }
+    return definitions.sorted { $0.id < $1.id }
+}
@@ -0,0 +1,155 @@
+//
+//  TextureCache.swift
+//  ShaderGraphCoder
+//
+//  Shares loaded textures between materials and loads the textures of one material concurrently.
+//
+
+import Combine
+import Foundation
+import RealityKit
+
+/// A size-bounded cache of loaded textures, keyed by where they were loaded from.
+/// Concurrent requests for the same texture share one load.
+@MainActor
+public final class SGTextureCache {
+    public static let shared = SGTextureCache()
+
+    /// The estimated size the cached textures may use. The least recently used textures are evicted first.
+    public var maxBytes: Int {
+        didSet {
+            evict()
+        }
+    }
+    /// The estimated size of the cached textures.
+    public private(set) var bytes: Int = 0
+    public var count: Int { entries.count }
+
+    private struct Entry {
+        let source: SGTextureSource
+        let resource: TextureResource
+        let bytes: Int
+        var lastUse: Int
+    }
+    private var entries: [String: Entry] = [:]
+    private var loads: [String: Task<TextureResource, Error>] = [:]
+    private var useCounter: Int = 0
+
+    public init(maxBytes: Int = 256 * 1024 * 1024) {
+        self.maxBytes = maxBytes
+    }
+
+    /// Returns the cached texture for the source, or loads it.
+    /// Sources without a stable identity (resources, buffers and data) are loaded without caching.
+    public func texture(for source: SGTextureSource) async throws -> TextureResource {
+        guard let key = source.cacheKey else {
+            return try await source.loadTextureResourceAsync()
+        }
+        useCounter += 1
+        if entries[key] != nil {
+            entries[key]!.lastUse = useCounter
+            return entries[key]!.resource
+        }
+        if let load = loads[key] {
+            return try await load.value
+        }
+        let load = Task { try await source.loadTextureResourceAsync() }
+        loads[key] = load
+        defer {
+            if loads[key] == load {
+                loads[key] = nil
+            }
+        }
+        let resource = try await load.value
+        guard loads[key] == load else {
+            // removeAll() was called during the load
+            return resource
+        }
+        let resourceBytes = resource.width * resource.height * 4
+        if resourceBytes <= maxBytes {
+            entries[key] = Entry(source: source, resource: resource, bytes: resourceBytes, lastUse: useCounter)
+            bytes += resourceBytes
+            evict()
+        }
+        return resource
+    }
+
+    /// Removes the cached textures and cancels the loads in progress.
+    /// Textures that finish loading afterwards are returned to their callers but not cached.
+    public func removeAll() {
+        entries.removeAll()
+        bytes = 0
+        for load in loads.values {
+            load.cancel()
+        }
+        loads.removeAll()
+    }
+
+    private func evict() {
+        while bytes > maxBytes, let oldest = entries.min(by: { $0.value.lastUse < $1.value.lastUse }) {
+            entries[oldest.key] = nil
+            bytes -= oldest.value.bytes
+        }
+    }
+}
+
+extension SGTextureSource {
+    var cacheKey: String? {
+        switch self {
+        case .cgImage(let image, let options):
+            // Entries keep their source, so the identity of a cached image is not reused
+            return "cgImage:\(ObjectIdentifier(image)):\(String(describing: options))"
+        case .loadNamed(let named, let bundle, let options):
+            return "named:\(bundle?.bundleURL.path ?? Bundle.main.bundleURL.path):\(named):\(String(describing: options))"
+        case .loadContentsOf(let url, let options):
+            return "url:\(url.absoluteString):\(String(describing: options))"
+        default:
+            return nil
+        }
+    }
+
+    @MainActor
+    func loadTextureResourceAsync() async throws -> TextureResource {
+        switch self {
+        case .cgImage(let from, let options):
+            return try await TextureResource.generateAsync(from: from, options: options).firstValue()
+        case .loadNamed(let named, let bundle, .some(let options)):
+            return try await TextureResource.loadAsync(named: named, in: bundle, options: options).firstValue()
+        case .loadNamed(let named, let bundle, .none):
+            return try await TextureResource.loadAsync(named: named, in: bundle).firstValue()
+        case .loadContentsOf(let url, .some(let options)):
+            return try await TextureResource.loadAsync(contentsOf: url, options: options).firstValue()
+        case .loadContentsOf(let url, .none):
+            return try await TextureResource.loadAsync(contentsOf: url).firstValue()
+        default:
+            return try loadTextureResource()
+        }
+    }
+}
+
+extension LoadRequest {
+    func firstValue() async throws -> Output {
+        try await withCheckedThrowingContinuation { continuation in
+            var cancellable: AnyCancellable?
+            var resumed = false
+            cancellable = sink(receiveCompletion: { completion in
+                if !resumed {
+                    resumed = true
+                    switch completion {
+                    case .failure(let error):
+                        continuation.resume(throwing: error)
+                    case .finished:
+                        // The request finished without loading anything
+                        continuation.resume(throwing: CancellationError())
+                    }
+                }
+                cancellable = nil
+            }, receiveValue: { value in
+                if !resumed {
+                    resumed = true
+                    continuation.resume(returning: value)
+                }
+            })
+        }
+    }
+}
@@ -92,13 +92,18 @@ public extension SGConstantValue {
 
 public extension SGValueSource {
     func getUSDAReference(materialName: String) -> String {
+        getUSDAReference(scopePath: "/Root/\(materialName)")
+    }
+
+    /// References nodes and parameters of the Material or NodeGraph at `scopePath`.
+    internal func getUSDAReference(scopePath: String) -> String {
         switch self {
         case .constant(let ivalue):
             return ivalue.usda
         case .nodeOutput(let inode, let inodeOut):
-            return "</Root/\(materialName)/\(inode.usdaName).outputs:\(inodeOut)>"
+            return "<\(scopePath)/\(inode.usdaName).outputs:\(inodeOut)>"
         case .parameter(name: let name, defaultValue: _):
-            return "</Root/\(materialName).inputs:\(name)>"
+            return "<\(scopePath).inputs:\(name)>"
         case .error(let error, _):
             return "\"\(error)\""
         }
@@ -125,8 +130,19 @@ public func getUSDA(materialName: String, surface: SGToken?, geometryModifier: S
     
     let outputValues = [surface, geometryModifier]
     let outputNodes = [surface?.node, geometryModifier?.node].compactMap { $0 }
-    let parameters = collectParameters(nodes: outputNodes)
-    let errors = collectErrors(values: outputValues)
+    var parameters = collectParameters(nodes: outputNodes)
+    // Parameters used inside subgraph bodies are declared on the material and connected to the instances
+    var parameterNames = Set(parameters.map { $0.0 })
+    forEachNodeInPostOrder(roots: outputNodes) { node in
+        guard let s = node as? SGSubgraphNode else {
+            return
+        }
+        for p in s.definition.parameters where !parameterNames.contains(p.name) {
+            parameterNames.insert(p.name)
+            parameters.append((p.name, p.defaultValue))
+        }
+    }
+    var errors = collectErrors(values: outputValues)
     var textureSources: [String: SGTextureSource] = [:]
     for p in parameters {
         let (name, defaultValue) = p
@@ -151,6 +167,36 @@ public func getUSDA(materialName: String, surface: SGToken?, geometryModifier: S
         line("        token outputs:realitykit:vertex")
     }
     
+    writeUSDANodes(outputNodes, scopePath: "/Root/\(materialName)", indent: "        ", line: line)
+    line("    }")
+    
+    // Subgraphs are abstract prims next to the material that their instances reference
+    for subgraph in collectSubgraphs(nodes: outputNodes) {
+        let scopePath = "/Root/\(subgraph.usdaName)"
+        errors.append(contentsOf: collectErrors(values: [subgraph.output]).map { "\(subgraph.name): \($0)" })
+        line("")
+        line("    class NodeGraph \"\(subgraph.usdaName)\"")
+        line("    {")
+        for (name, defaultValue) in subgraph.inputs.map({ ($0.name, $0.defaultValue) }) + subgraph.parameters {
+            line("        \(defaultValue.dataType.usda) inputs:\(name) = \(defaultValue.usda)")
+        }
+        var decl = "\(subgraph.output.dataType.usda) outputs:out"
+        switch subgraph.output.source {
+        case .nodeOutput, .parameter:
+            decl += ".connect"
+        default:
+            break
+        }
+        line("        \(decl) = \(subgraph.output.source.getUSDAReference(scopePath: scopePath))")
+        writeUSDANodes([subgraph.output.node].compactMap { $0 }, scopePath: scopePath, indent: "        ", line: line)
+        line("    }")
+    }
+    line("}")
+    
+    return (lines.joined(separator: "\n"), textureSources, errors)
+}
+
+private func writeUSDANodes(_ outputNodes: [SGNode], scopePath: String, indent: String, line: (String) -> Void) {
     var nodesToWrite: [SGNode] = outputNodes
     var nodesWritten: Set<SGNode> = []
     while nodesToWrite.count > 0 {
@@ -158,9 +204,17 @@ public func getUSDA(materialName: String, surface: SGToken?, geometryModifier: S
         nodesToWrite.remove(at: 0)
         nodesWritten.insert(node)
         line("")
-        line("        def Shader \"\(node.usdaName)\"")
-        line("        {")
-        line("            uniform token info:id = \"\(node.nodeType)\"")
+        if let subgraphNode = node as? SGSubgraphNode {
+            line("\(indent)def NodeGraph \"\(node.usdaName)\" (")
+            line("\(indent)    prepend references = </Root/\(subgraphNode.definition.usdaName)>")
+            line("\(indent))")
+            line("\(indent){")
+        }
+        else {
+            line("\(indent)def Shader \"\(node.usdaName)\"")
+            line("\(indent){")
+            line("\(indent)    uniform token info:id = \"\(node.nodeType)\"")
+        }
         for i in node.inputs {
             var decl = "\(i.dataType.usda) inputs:\(i.name)"
             if let c = i.value?.source {
@@ -171,18 +225,26 @@ public func getUSDA(materialName: String, surface: SGToken?, geometryModifier: S
                     decl += ".connect"
                 }
             }
-            if let value = i.value?.source.getUSDAReference(materialName: materialName) {
-                line("            \(decl) = \(value)")
+            if let value = i.value?.source.getUSDAReference(scopePath: scopePath) {
+                line("\(indent)    \(decl) = \(value)")
             }
             else {
-                line("            \(decl)")
+                line("\(indent)    \(decl)")
             }
         }
-        for o in node.outputs {
-            let decl = "\(o.dataType.usda) outputs:\(o.name)"
-            line("            \(decl)")
+        if let subgraphNode = node as? SGSubgraphNode {
+            for p in subgraphNode.definition.parameters {
+                line("\(indent)    \(p.defaultValue.dataType.usda) inputs:\(p.name).connect = <\(scopePath).inputs:\(p.name)>")
+            }
         }
-        line("        }")
+        // Subgraph instances get their outputs from the definition they reference
+        if !(node is SGSubgraphNode) {
+            for o in node.outputs {
+                let decl = "\(o.dataType.usda) outputs:\(o.name)"
+                line("\(indent)    \(decl)")
+            }
+        }
+        line("\(indent)}")
         for i in node.inputs {
             if case .nodeOutput(let inode, _) = i.value?.source {
                 if !(nodesWritten.contains(inode) || nodesToWrite.contains(inode)) {
@@ -191,9 +253,4 @@ public func getUSDA(materialName: String, surface: SGToken?, geometryModifier: S
             }
         }
     }
-    
-    line("    }")
-    line("}")
-    
-    return (lines.joined(separator: "\n"), textureSources, errors)
 }
@@ -0,0 +1,700 @@
+// Autogenerated by opgen.py
+import Foundation
+import simd
+
+import ShaderGraphCoder
+
+func makeBenchmarkOperations() -> [BenchmarkOperation] {
+    var ops: [BenchmarkOperation] = []
+    ops.append(BenchmarkOperation(nodeType: "ND_absval_color3", inputs: [.color3f], output: .color3f) { ShaderGraphCoder.abs($0[0] as! SGColor) })
+    ops.append(BenchmarkOperation(nodeType: "ND_absval_color4", inputs: [.color4f], output: .color4f) { ShaderGraphCoder.abs($0[0] as! SGColor) })
+    ops.append(BenchmarkOperation(nodeType: "ND_absval_float", inputs: [.float], output: .float) { ShaderGraphCoder.abs($0[0] as! SGScalar) })
+    ops.append(BenchmarkOperation(nodeType: "ND_absval_half", inputs: [.half], output: .half) { ShaderGraphCoder.abs($0[0] as! SGScalar) })
+    ops.append(BenchmarkOperation(nodeType: "ND_absval_vector2", inputs: [.vector2f], output: .vector2f) { ShaderGraphCoder.abs($0[0] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_absval_vector3", inputs: [.vector3f], output: .vector3f) { ShaderGraphCoder.abs($0[0] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_absval_vector4", inputs: [.vector4f], output: .vector4f) { ShaderGraphCoder.abs($0[0] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_acos_float", inputs: [.float], output: .float) { ShaderGraphCoder.acos($0[0] as! SGScalar) })
+    ops.append(BenchmarkOperation(nodeType: "ND_acos_half", inputs: [.half], output: .half) { ShaderGraphCoder.acos($0[0] as! SGScalar) })
+    ops.append(BenchmarkOperation(nodeType: "ND_acos_half2", inputs: [.vector2h], output: .vector2h) { ShaderGraphCoder.acos($0[0] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_acos_half3", inputs: [.vector3h], output: .vector3h) { ShaderGraphCoder.acos($0[0] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_acos_half4", inputs: [.vector4h], output: .vector4h) { ShaderGraphCoder.acos($0[0] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_acos_vector2", inputs: [.vector2f], output: .vector2f) { ShaderGraphCoder.acos($0[0] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_acos_vector3", inputs: [.vector3f], output: .vector3f) { ShaderGraphCoder.acos($0[0] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_acos_vector4", inputs: [.vector4f], output: .vector4f) { ShaderGraphCoder.acos($0[0] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_add_color3", inputs: [.color3f, .color3f], output: .color3f) { ShaderGraphCoder.add($0[0] as! SGColor, $0[1] as! SGNumeric) })
+    ops.append(BenchmarkOperation(nodeType: "ND_add_color3FA", inputs: [.color3f, .float], output: .color3f) { ShaderGraphCoder.add($0[0] as! SGColor, $0[1] as! SGNumeric) })
+    ops.append(BenchmarkOperation(nodeType: "ND_add_color4", inputs: [.color4f, .color4f], output: .color4f) { ShaderGraphCoder.add($0[0] as! SGColor, $0[1] as! SGNumeric) })
+    ops.append(BenchmarkOperation(nodeType: "ND_add_color4FA", inputs: [.color4f, .float], output: .color4f) { ShaderGraphCoder.add($0[0] as! SGColor, $0[1] as! SGNumeric) })
+    ops.append(BenchmarkOperation(nodeType: "ND_add_float", inputs: [.float, .float], output: .float) { ShaderGraphCoder.add($0[0] as! SGScalar, $0[1] as! SGNumeric) })
+    ops.append(BenchmarkOperation(nodeType: "ND_add_half", inputs: [.half, .half], output: .half) { ShaderGraphCoder.add($0[0] as! SGScalar, $0[1] as! SGNumeric) })
+    ops.append(BenchmarkOperation(nodeType: "ND_add_matrix22", inputs: [.matrix2d, .matrix2d], output: .matrix2d) { ShaderGraphCoder.add($0[0] as! SGMatrix, $0[1] as! SGNumeric) })
+    ops.append(BenchmarkOperation(nodeType: "ND_add_matrix22FA", inputs: [.matrix2d, .float], output: .matrix2d) { ShaderGraphCoder.add($0[0] as! SGMatrix, $0[1] as! SGNumeric) })
+    ops.append(BenchmarkOperation(nodeType: "ND_add_matrix33", inputs: [.matrix3d, .matrix3d], output: .matrix3d) { ShaderGraphCoder.add($0[0] as! SGMatrix, $0[1] as! SGNumeric) })
+    ops.append(BenchmarkOperation(nodeType: "ND_add_matrix33FA", inputs: [.matrix3d, .float], output: .matrix3d) { ShaderGraphCoder.add($0[0] as! SGMatrix, $0[1] as! SGNumeric) })
+    ops.append(BenchmarkOperation(nodeType: "ND_add_matrix44", inputs: [.matrix4d, .matrix4d], output: .matrix4d) { ShaderGraphCoder.add($0[0] as! SGMatrix, $0[1] as! SGNumeric) })
+    ops.append(BenchmarkOperation(nodeType: "ND_add_matrix44FA", inputs: [.matrix4d, .float], output: .matrix4d) { ShaderGraphCoder.add($0[0] as! SGMatrix, $0[1] as! SGNumeric) })
+    ops.append(BenchmarkOperation(nodeType: "ND_add_vector2", inputs: [.vector2f, .vector2f], output: .vector2f) { ShaderGraphCoder.add($0[0] as! SGVector, $0[1] as! SGNumeric) })
+    ops.append(BenchmarkOperation(nodeType: "ND_add_vector2FA", inputs: [.vector2f, .float], output: .vector2f) { ShaderGraphCoder.add($0[0] as! SGVector, $0[1] as! SGNumeric) })
+    ops.append(BenchmarkOperation(nodeType: "ND_add_vector3", inputs: [.vector3f, .vector3f], output: .vector3f) { ShaderGraphCoder.add($0[0] as! SGVector, $0[1] as! SGNumeric) })
+    ops.append(BenchmarkOperation(nodeType: "ND_add_vector3FA", inputs: [.vector3f, .float], output: .vector3f) { ShaderGraphCoder.add($0[0] as! SGVector, $0[1] as! SGNumeric) })
+    ops.append(BenchmarkOperation(nodeType: "ND_add_vector4", inputs: [.vector4f, .vector4f], output: .vector4f) { ShaderGraphCoder.add($0[0] as! SGVector, $0[1] as! SGNumeric) })
+    ops.append(BenchmarkOperation(nodeType: "ND_add_vector4FA", inputs: [.vector4f, .float], output: .vector4f) { ShaderGraphCoder.add($0[0] as! SGVector, $0[1] as! SGNumeric) })
+    ops.append(BenchmarkOperation(nodeType: "ND_ambientocclusion_float", inputs: [.float, .float], output: .float) { ShaderGraphCoder.ambientOcclusion(coneangle: $0[0] as! SGScalar, maxdistance: $0[1] as! SGScalar) })
+    ops.append(BenchmarkOperation(nodeType: "ND_asin_float", inputs: [.float], output: .float) { ShaderGraphCoder.asin($0[0] as! SGScalar) })
+    ops.append(BenchmarkOperation(nodeType: "ND_asin_half", inputs: [.half], output: .half) { ShaderGraphCoder.asin($0[0] as! SGScalar) })
+    ops.append(BenchmarkOperation(nodeType: "ND_asin_half2", inputs: [.vector2h], output: .vector2h) { ShaderGraphCoder.asin($0[0] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_asin_half3", inputs: [.vector3h], output: .vector3h) { ShaderGraphCoder.asin($0[0] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_asin_half4", inputs: [.vector4h], output: .vector4h) { ShaderGraphCoder.asin($0[0] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_asin_vector2", inputs: [.vector2f], output: .vector2f) { ShaderGraphCoder.asin($0[0] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_asin_vector3", inputs: [.vector3f], output: .vector3f) { ShaderGraphCoder.asin($0[0] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_asin_vector4", inputs: [.vector4f], output: .vector4f) { ShaderGraphCoder.asin($0[0] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_atan2_float", inputs: [.float, .float], output: .float) { ShaderGraphCoder.atan2(iny: $0[0] as! SGScalar, inx: $0[1] as! SGScalar) })
+    ops.append(BenchmarkOperation(nodeType: "ND_atan2_half", inputs: [.half, .half], output: .half) { ShaderGraphCoder.atan2(iny: $0[0] as! SGScalar, inx: $0[1] as! SGScalar) })
+    ops.append(BenchmarkOperation(nodeType: "ND_atan2_half2", inputs: [.vector2h, .vector2h], output: .vector2h) { ShaderGraphCoder.atan2(iny: $0[0] as! SGVector, inx: $0[1] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_atan2_half3", inputs: [.vector3h, .vector3h], output: .vector3h) { ShaderGraphCoder.atan2(iny: $0[0] as! SGVector, inx: $0[1] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_atan2_half4", inputs: [.vector4h, .vector4h], output: .vector4h) { ShaderGraphCoder.atan2(iny: $0[0] as! SGVector, inx: $0[1] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_atan2_vector2", inputs: [.vector2f, .vector2f], output: .vector2f) { ShaderGraphCoder.atan2(iny: $0[0] as! SGVector, inx: $0[1] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_atan2_vector3", inputs: [.vector3f, .vector3f], output: .vector3f) { ShaderGraphCoder.atan2(iny: $0[0] as! SGVector, inx: $0[1] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_atan2_vector4", inputs: [.vector4f, .vector4f], output: .vector4f) { ShaderGraphCoder.atan2(iny: $0[0] as! SGVector, inx: $0[1] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_blur_color3", inputs: [.color3f, .float], output: .color3f) { ShaderGraphCoder.blur($0[0] as! SGColor, size: $0[1] as! SGScalar) })
+    ops.append(BenchmarkOperation(nodeType: "ND_blur_color4", inputs: [.color4f, .float], output: .color4f) { ShaderGraphCoder.blur($0[0] as! SGColor, size: $0[1] as! SGScalar) })
+    ops.append(BenchmarkOperation(nodeType: "ND_blur_float", inputs: [.float, .float], output: .float) { ShaderGraphCoder.blur($0[0] as! SGScalar, size: $0[1] as! SGScalar) })
+    ops.append(BenchmarkOperation(nodeType: "ND_blur_half", inputs: [.half, .half], output: .half) { ShaderGraphCoder.blur($0[0] as! SGScalar, size: $0[1] as! SGScalar) })
+    ops.append(BenchmarkOperation(nodeType: "ND_blur_vector2", inputs: [.vector2f, .float], output: .vector2f) { ShaderGraphCoder.blur($0[0] as! SGVector, size: $0[1] as! SGScalar) })
+    ops.append(BenchmarkOperation(nodeType: "ND_blur_vector3", inputs: [.vector3f, .float], output: .vector3f) { ShaderGraphCoder.blur($0[0] as! SGVector, size: $0[1] as! SGScalar) })
+    ops.append(BenchmarkOperation(nodeType: "ND_blur_vector4", inputs: [.vector4f, .float], output: .vector4f) { ShaderGraphCoder.blur($0[0] as! SGVector, size: $0[1] as! SGScalar) })
+    ops.append(BenchmarkOperation(nodeType: "ND_burn_color3", inputs: [.color3f, .color3f, .float], output: .color3f) { ShaderGraphCoder.burn(fg: $0[0] as! SGColor, bg: $0[1] as! SGColor, mix: $0[2] as! SGScalar) })
+    ops.append(BenchmarkOperation(nodeType: "ND_burn_color4", inputs: [.color4f, .color4f, .float], output: .color4f) { ShaderGraphCoder.burn(fg: $0[0] as! SGColor, bg: $0[1] as! SGColor, mix: $0[2] as! SGScalar) })
+    ops.append(BenchmarkOperation(nodeType: "ND_burn_float", inputs: [.float, .float, .float], output: .float) { ShaderGraphCoder.burn(fg: $0[0] as! SGScalar, bg: $0[1] as! SGScalar, mix: $0[2] as! SGScalar) })
+    ops.append(BenchmarkOperation(nodeType: "ND_burn_half", inputs: [.half, .half, .half], output: .half) { ShaderGraphCoder.burn(fg: $0[0] as! SGScalar, bg: $0[1] as! SGScalar, mix: $0[2] as! SGScalar) })
+    ops.append(BenchmarkOperation(nodeType: "ND_ceil_color3", inputs: [.color3f], output: .color3f) { ShaderGraphCoder.ceil($0[0] as! SGColor) })
+    ops.append(BenchmarkOperation(nodeType: "ND_ceil_color4", inputs: [.color4f], output: .color4f) { ShaderGraphCoder.ceil($0[0] as! SGColor) })
+    ops.append(BenchmarkOperation(nodeType: "ND_ceil_float", inputs: [.float], output: .float) { ShaderGraphCoder.ceil($0[0] as! SGScalar) })
+    ops.append(BenchmarkOperation(nodeType: "ND_ceil_half", inputs: [.half], output: .half) { ShaderGraphCoder.ceil($0[0] as! SGScalar) })
+    ops.append(BenchmarkOperation(nodeType: "ND_ceil_vector2", inputs: [.vector2f], output: .vector2f) { ShaderGraphCoder.ceil($0[0] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_ceil_vector3", inputs: [.vector3f], output: .vector3f) { ShaderGraphCoder.ceil($0[0] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_ceil_vector4", inputs: [.vector4f], output: .vector4f) { ShaderGraphCoder.ceil($0[0] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_cellnoise2d_float", inputs: [.vector2f], output: .float) { ShaderGraphCoder.cellNoise2D(texcoord: $0[0] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_cellnoise3d_float", inputs: [.vector3f], output: .float) { ShaderGraphCoder.cellNoise3D(position: $0[0] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_clamp_color3", inputs: [.color3f, .color3f, .color3f], output: .color3f) { ShaderGraphCoder.clamp($0[0] as! SGColor, min: $0[1] as! SGNumeric, max: $0[2] as! SGNumeric) })
+    ops.append(BenchmarkOperation(nodeType: "ND_clamp_color3FA", inputs: [.color3f, .float, .float], output: .color3f) { ShaderGraphCoder.clamp($0[0] as! SGColor, min: $0[1] as! SGNumeric, max: $0[2] as! SGNumeric) })
+    ops.append(BenchmarkOperation(nodeType: "ND_clamp_color4", inputs: [.color4f, .color4f, .color4f], output: .color4f) { ShaderGraphCoder.clamp($0[0] as! SGColor, min: $0[1] as! SGNumeric, max: $0[2] as! SGNumeric) })
+    ops.append(BenchmarkOperation(nodeType: "ND_clamp_color4FA", inputs: [.color4f, .float, .float], output: .color4f) { ShaderGraphCoder.clamp($0[0] as! SGColor, min: $0[1] as! SGNumeric, max: $0[2] as! SGNumeric) })
+    ops.append(BenchmarkOperation(nodeType: "ND_clamp_float", inputs: [.float, .float, .float], output: .float) { ShaderGraphCoder.clamp($0[0] as! SGScalar, min: $0[1] as! SGNumeric, max: $0[2] as! SGNumeric) })
+    ops.append(BenchmarkOperation(nodeType: "ND_clamp_half", inputs: [.half, .half, .half], output: .half) { ShaderGraphCoder.clamp($0[0] as! SGScalar, min: $0[1] as! SGNumeric, max: $0[2] as! SGNumeric) })
+    ops.append(BenchmarkOperation(nodeType: "ND_clamp_half2", inputs: [.vector2h, .vector2h, .vector2h], output: .vector2h) { ShaderGraphCoder.clamp($0[0] as! SGVector, min: $0[1] as! SGNumeric, max: $0[2] as! SGNumeric) })
+    ops.append(BenchmarkOperation(nodeType: "ND_clamp_half2FA", inputs: [.vector2h, .float, .float], output: .vector2h) { ShaderGraphCoder.clamp($0[0] as! SGVector, min: $0[1] as! SGNumeric, max: $0[2] as! SGNumeric) })
+    ops.append(BenchmarkOperation(nodeType: "ND_clamp_half3", inputs: [.vector3h, .vector3h, .vector3h], output: .vector3h) { ShaderGraphCoder.clamp($0[0] as! SGVector, min: $0[1] as! SGNumeric, max: $0[2] as! SGNumeric) })
+    ops.append(BenchmarkOperation(nodeType: "ND_clamp_half3FA", inputs: [.vector3h, .float, .float], output: .vector3h) { ShaderGraphCoder.clamp($0[0] as! SGVector, min: $0[1] as! SGNumeric, max: $0[2] as! SGNumeric) })
+    ops.append(BenchmarkOperation(nodeType: "ND_clamp_half4", inputs: [.vector4h, .vector4h, .vector4h], output: .vector4h) { ShaderGraphCoder.clamp($0[0] as! SGVector, min: $0[1] as! SGNumeric, max: $0[2] as! SGNumeric) })
+    ops.append(BenchmarkOperation(nodeType: "ND_clamp_half4FA", inputs: [.vector4h, .float, .float], output: .vector4h) { ShaderGraphCoder.clamp($0[0] as! SGVector, min: $0[1] as! SGNumeric, max: $0[2] as! SGNumeric) })
+    ops.append(BenchmarkOperation(nodeType: "ND_clamp_vector2", inputs: [.vector2f, .vector2f, .vector2f], output: .vector2f) { ShaderGraphCoder.clamp($0[0] as! SGVector, min: $0[1] as! SGNumeric, max: $0[2] as! SGNumeric) })
+    ops.append(BenchmarkOperation(nodeType: "ND_clamp_vector2FA", inputs: [.vector2f, .float, .float], output: .vector2f) { ShaderGraphCoder.clamp($0[0] as! SGVector, min: $0[1] as! SGNumeric, max: $0[2] as! SGNumeric) })
+    ops.append(BenchmarkOperation(nodeType: "ND_clamp_vector3", inputs: [.vector3f, .vector3f, .vector3f], output: .vector3f) { ShaderGraphCoder.clamp($0[0] as! SGVector, min: $0[1] as! SGNumeric, max: $0[2] as! SGNumeric) })
+    ops.append(BenchmarkOperation(nodeType: "ND_clamp_vector3FA", inputs: [.vector3f, .float, .float], output: .vector3f) { ShaderGraphCoder.clamp($0[0] as! SGVector, min: $0[1] as! SGNumeric, max: $0[2] as! SGNumeric) })
+    ops.append(BenchmarkOperation(nodeType: "ND_clamp_vector4", inputs: [.vector4f, .vector4f, .vector4f], output: .vector4f) { ShaderGraphCoder.clamp($0[0] as! SGVector, min: $0[1] as! SGNumeric, max: $0[2] as! SGNumeric) })
+    ops.append(BenchmarkOperation(nodeType: "ND_clamp_vector4FA", inputs: [.vector4f, .float, .float], output: .vector4f) { ShaderGraphCoder.clamp($0[0] as! SGVector, min: $0[1] as! SGNumeric, max: $0[2] as! SGNumeric) })
+    ops.append(BenchmarkOperation(nodeType: "ND_contrast_color3", inputs: [.color3f, .color3f, .color3f], output: .color3f) { ShaderGraphCoder.contrast($0[0] as! SGColor, amount: $0[1] as! SGNumeric, pivot: $0[2] as! SGNumeric) })
+    ops.append(BenchmarkOperation(nodeType: "ND_contrast_color3FA", inputs: [.color3f, .float, .float], output: .color3f) { ShaderGraphCoder.contrast($0[0] as! SGColor, amount: $0[1] as! SGNumeric, pivot: $0[2] as! SGNumeric) })
+    ops.append(BenchmarkOperation(nodeType: "ND_contrast_color4", inputs: [.color4f, .color4f, .color4f], output: .color4f) { ShaderGraphCoder.contrast($0[0] as! SGColor, amount: $0[1] as! SGNumeric, pivot: $0[2] as! SGNumeric) })
+    ops.append(BenchmarkOperation(nodeType: "ND_contrast_color4FA", inputs: [.color4f, .float, .float], output: .color4f) { ShaderGraphCoder.contrast($0[0] as! SGColor, amount: $0[1] as! SGNumeric, pivot: $0[2] as! SGNumeric) })
+    ops.append(BenchmarkOperation(nodeType: "ND_contrast_float", inputs: [.float, .float, .float], output: .float) { ShaderGraphCoder.contrast($0[0] as! SGScalar, amount: $0[1] as! SGNumeric, pivot: $0[2] as! SGNumeric) })
+    ops.append(BenchmarkOperation(nodeType: "ND_contrast_vector2", inputs: [.vector2f, .vector2f, .vector2f], output: .vector2f) { ShaderGraphCoder.contrast($0[0] as! SGVector, amount: $0[1] as! SGNumeric, pivot: $0[2] as! SGNumeric) })
+    ops.append(BenchmarkOperation(nodeType: "ND_contrast_vector2FA", inputs: [.vector2f, .float, .float], output: .vector2f) { ShaderGraphCoder.contrast($0[0] as! SGVector, amount: $0[1] as! SGNumeric, pivot: $0[2] as! SGNumeric) })
+    ops.append(BenchmarkOperation(nodeType: "ND_contrast_vector3", inputs: [.vector3f, .vector3f, .vector3f], output: .vector3f) { ShaderGraphCoder.contrast($0[0] as! SGVector, amount: $0[1] as! SGNumeric, pivot: $0[2] as! SGNumeric) })
+    ops.append(BenchmarkOperation(nodeType: "ND_contrast_vector3FA", inputs: [.vector3f, .float, .float], output: .vector3f) { ShaderGraphCoder.contrast($0[0] as! SGVector, amount: $0[1] as! SGNumeric, pivot: $0[2] as! SGNumeric) })
+    ops.append(BenchmarkOperation(nodeType: "ND_contrast_vector4", inputs: [.vector4f, .vector4f, .vector4f], output: .vector4f) { ShaderGraphCoder.contrast($0[0] as! SGVector, amount: $0[1] as! SGNumeric, pivot: $0[2] as! SGNumeric) })
+    ops.append(BenchmarkOperation(nodeType: "ND_contrast_vector4FA", inputs: [.vector4f, .float, .float], output: .vector4f) { ShaderGraphCoder.contrast($0[0] as! SGVector, amount: $0[1] as! SGNumeric, pivot: $0[2] as! SGNumeric) })
+    ops.append(BenchmarkOperation(nodeType: "ND_cos_float", inputs: [.float], output: .float) { ShaderGraphCoder.cos($0[0] as! SGScalar) })
+    ops.append(BenchmarkOperation(nodeType: "ND_cos_half", inputs: [.half], output: .half) { ShaderGraphCoder.cos($0[0] as! SGScalar) })
+    ops.append(BenchmarkOperation(nodeType: "ND_cos_half2", inputs: [.vector2h], output: .vector2h) { ShaderGraphCoder.cos($0[0] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_cos_half3", inputs: [.vector3h], output: .vector3h) { ShaderGraphCoder.cos($0[0] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_cos_half4", inputs: [.vector4h], output: .vector4h) { ShaderGraphCoder.cos($0[0] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_cos_vector2", inputs: [.vector2f], output: .vector2f) { ShaderGraphCoder.cos($0[0] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_cos_vector3", inputs: [.vector3f], output: .vector3f) { ShaderGraphCoder.cos($0[0] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_cos_vector4", inputs: [.vector4f], output: .vector4f) { ShaderGraphCoder.cos($0[0] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_crossproduct_half3", inputs: [.vector3h, .vector3h], output: .vector3h) { ShaderGraphCoder.cross($0[0] as! SGVector, $0[1] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_crossproduct_vector3", inputs: [.vector3f, .vector3f], output: .vector3f) { ShaderGraphCoder.cross($0[0] as! SGVector, $0[1] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_determinant_matrix22", inputs: [.matrix2d], output: .float) { ShaderGraphCoder.determinant($0[0] as! SGMatrix) })
+    ops.append(BenchmarkOperation(nodeType: "ND_determinant_matrix33", inputs: [.matrix3d], output: .float) { ShaderGraphCoder.determinant($0[0] as! SGMatrix) })
+    ops.append(BenchmarkOperation(nodeType: "ND_determinant_matrix44", inputs: [.matrix4d], output: .float) { ShaderGraphCoder.determinant($0[0] as! SGMatrix) })
+    ops.append(BenchmarkOperation(nodeType: "ND_difference_color3", inputs: [.color3f, .color3f, .float], output: .color3f) { ShaderGraphCoder.difference(fg: $0[0] as! SGColor, bg: $0[1] as! SGColor, mix: $0[2] as! SGScalar) })
+    ops.append(BenchmarkOperation(nodeType: "ND_difference_color4", inputs: [.color4f, .color4f, .float], output: .color4f) { ShaderGraphCoder.difference(fg: $0[0] as! SGColor, bg: $0[1] as! SGColor, mix: $0[2] as! SGScalar) })
+    ops.append(BenchmarkOperation(nodeType: "ND_difference_float", inputs: [.float, .float, .float], output: .float) { ShaderGraphCoder.difference(fg: $0[0] as! SGScalar, bg: $0[1] as! SGScalar, mix: $0[2] as! SGScalar) })
+    ops.append(BenchmarkOperation(nodeType: "ND_difference_half", inputs: [.half, .half, .half], output: .half) { ShaderGraphCoder.difference(fg: $0[0] as! SGScalar, bg: $0[1] as! SGScalar, mix: $0[2] as! SGScalar) })
+    ops.append(BenchmarkOperation(nodeType: "ND_disjointover_color4", inputs: [.color4f, .color4f, .float], output: .color4f) { ShaderGraphCoder.disjointover(fg: $0[0] as! SGColor, bg: $0[1] as! SGColor, mix: $0[2] as! SGScalar) })
+    ops.append(BenchmarkOperation(nodeType: "ND_divide_color3", inputs: [.color3f, .color3f], output: .color3f) { ShaderGraphCoder.divide($0[0] as! SGColor, $0[1] as! SGNumeric) })
+    ops.append(BenchmarkOperation(nodeType: "ND_divide_color3FA", inputs: [.color3f, .float], output: .color3f) { ShaderGraphCoder.divide($0[0] as! SGColor, $0[1] as! SGNumeric) })
+    ops.append(BenchmarkOperation(nodeType: "ND_divide_color4", inputs: [.color4f, .color4f], output: .color4f) { ShaderGraphCoder.divide($0[0] as! SGColor, $0[1] as! SGNumeric) })
+    ops.append(BenchmarkOperation(nodeType: "ND_divide_color4FA", inputs: [.color4f, .float], output: .color4f) { ShaderGraphCoder.divide($0[0] as! SGColor, $0[1] as! SGNumeric) })
+    ops.append(BenchmarkOperation(nodeType: "ND_divide_float", inputs: [.float, .float], output: .float) { ShaderGraphCoder.divide($0[0] as! SGScalar, $0[1] as! SGNumeric) })
+    ops.append(BenchmarkOperation(nodeType: "ND_divide_half", inputs: [.half, .half], output: .half) { ShaderGraphCoder.divide($0[0] as! SGScalar, $0[1] as! SGNumeric) })
+    ops.append(BenchmarkOperation(nodeType: "ND_divide_matrix22", inputs: [.matrix2d, .matrix2d], output: .matrix2d) { ShaderGraphCoder.divide($0[0] as! SGMatrix, $0[1] as! SGNumeric) })
+    ops.append(BenchmarkOperation(nodeType: "ND_divide_matrix33", inputs: [.matrix3d, .matrix3d], output: .matrix3d) { ShaderGraphCoder.divide($0[0] as! SGMatrix, $0[1] as! SGNumeric) })
+    ops.append(BenchmarkOperation(nodeType: "ND_divide_matrix44", inputs: [.matrix4d, .matrix4d], output: .matrix4d) { ShaderGraphCoder.divide($0[0] as! SGMatrix, $0[1] as! SGNumeric) })
+    ops.append(BenchmarkOperation(nodeType: "ND_divide_vector2", inputs: [.vector2f, .vector2f], output: .vector2f) { ShaderGraphCoder.divide($0[0] as! SGVector, $0[1] as! SGNumeric) })
+    ops.append(BenchmarkOperation(nodeType: "ND_divide_vector2FA", inputs: [.vector2f, .float], output: .vector2f) { ShaderGraphCoder.divide($0[0] as! SGVector, $0[1] as! SGNumeric) })
+    ops.append(BenchmarkOperation(nodeType: "ND_divide_vector3", inputs: [.vector3f, .vector3f], output: .vector3f) { ShaderGraphCoder.divide($0[0] as! SGVector, $0[1] as! SGNumeric) })
+    ops.append(BenchmarkOperation(nodeType: "ND_divide_vector3FA", inputs: [.vector3f, .float], output: .vector3f) { ShaderGraphCoder.divide($0[0] as! SGVector, $0[1] as! SGNumeric) })
+    ops.append(BenchmarkOperation(nodeType: "ND_divide_vector4", inputs: [.vector4f, .vector4f], output: .vector4f) { ShaderGraphCoder.divide($0[0] as! SGVector, $0[1] as! SGNumeric) })
+    ops.append(BenchmarkOperation(nodeType: "ND_divide_vector4FA", inputs: [.vector4f, .float], output: .vector4f) { ShaderGraphCoder.divide($0[0] as! SGVector, $0[1] as! SGNumeric) })
+    ops.append(BenchmarkOperation(nodeType: "ND_dodge_color3", inputs: [.color3f, .color3f, .float], output: .color3f) { ShaderGraphCoder.dodge(fg: $0[0] as! SGColor, bg: $0[1] as! SGColor, mix: $0[2] as! SGScalar) })
+    ops.append(BenchmarkOperation(nodeType: "ND_dodge_color4", inputs: [.color4f, .color4f, .float], output: .color4f) { ShaderGraphCoder.dodge(fg: $0[0] as! SGColor, bg: $0[1] as! SGColor, mix: $0[2] as! SGScalar) })
+    ops.append(BenchmarkOperation(nodeType: "ND_dodge_float", inputs: [.float, .float, .float], output: .float) { ShaderGraphCoder.dodge(fg: $0[0] as! SGScalar, bg: $0[1] as! SGScalar, mix: $0[2] as! SGScalar) })
+    ops.append(BenchmarkOperation(nodeType: "ND_dodge_half", inputs: [.half, .half, .half], output: .half) { ShaderGraphCoder.dodge(fg: $0[0] as! SGScalar, bg: $0[1] as! SGScalar, mix: $0[2] as! SGScalar) })
+    ops.append(BenchmarkOperation(nodeType: "ND_dotproduct_half2", inputs: [.vector2h, .vector2h], output: .float) { ShaderGraphCoder.dot($0[0] as! SGVector, $0[1] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_dotproduct_half3", inputs: [.vector3h, .vector3h], output: .float) { ShaderGraphCoder.dot($0[0] as! SGVector, $0[1] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_dotproduct_half4", inputs: [.vector4h, .vector4h], output: .float) { ShaderGraphCoder.dot($0[0] as! SGVector, $0[1] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_dotproduct_vector2", inputs: [.vector2f, .vector2f], output: .float) { ShaderGraphCoder.dot($0[0] as! SGVector, $0[1] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_dotproduct_vector3", inputs: [.vector3f, .vector3f], output: .float) { ShaderGraphCoder.dot($0[0] as! SGVector, $0[1] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_dotproduct_vector4", inputs: [.vector4f, .vector4f], output: .float) { ShaderGraphCoder.dot($0[0] as! SGVector, $0[1] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_exp_float", inputs: [.float], output: .float) { ShaderGraphCoder.exp($0[0] as! SGScalar) })
+    ops.append(BenchmarkOperation(nodeType: "ND_exp_half", inputs: [.half], output: .half) { ShaderGraphCoder.exp($0[0] as! SGScalar) })
+    ops.append(BenchmarkOperation(nodeType: "ND_exp_half2", inputs: [.vector2h], output: .vector2h) { ShaderGraphCoder.exp($0[0] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_exp_half3", inputs: [.vector3h], output: .vector3h) { ShaderGraphCoder.exp($0[0] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_exp_half4", inputs: [.vector4h], output: .vector4h) { ShaderGraphCoder.exp($0[0] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_exp_vector2", inputs: [.vector2f], output: .vector2f) { ShaderGraphCoder.exp($0[0] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_exp_vector3", inputs: [.vector3f], output: .vector3f) { ShaderGraphCoder.exp($0[0] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_exp_vector4", inputs: [.vector4f], output: .vector4f) { ShaderGraphCoder.exp($0[0] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_extract_color3", inputs: [.color3f], output: .float) { ShaderGraphCoder.extract($0[0] as! SGSIMD) })
+    ops.append(BenchmarkOperation(nodeType: "ND_extract_color4", inputs: [.color4f], output: .float) { ShaderGraphCoder.extract($0[0] as! SGSIMD) })
+    ops.append(BenchmarkOperation(nodeType: "ND_extract_vector2", inputs: [.vector2f], output: .float) { ShaderGraphCoder.extract($0[0] as! SGSIMD) })
+    ops.append(BenchmarkOperation(nodeType: "ND_extract_vector3", inputs: [.vector3f], output: .float) { ShaderGraphCoder.extract($0[0] as! SGSIMD) })
+    ops.append(BenchmarkOperation(nodeType: "ND_extract_vector4", inputs: [.vector4f], output: .float) { ShaderGraphCoder.extract($0[0] as! SGSIMD) })
+    ops.append(BenchmarkOperation(nodeType: "ND_floor_color3", inputs: [.color3f], output: .color3f) { ShaderGraphCoder.floor($0[0] as! SGColor) })
+    ops.append(BenchmarkOperation(nodeType: "ND_floor_color4", inputs: [.color4f], output: .color4f) { ShaderGraphCoder.floor($0[0] as! SGColor) })
+    ops.append(BenchmarkOperation(nodeType: "ND_floor_float", inputs: [.float], output: .float) { ShaderGraphCoder.floor($0[0] as! SGScalar) })
+    ops.append(BenchmarkOperation(nodeType: "ND_floor_half", inputs: [.half], output: .half) { ShaderGraphCoder.floor($0[0] as! SGScalar) })
+    ops.append(BenchmarkOperation(nodeType: "ND_floor_vector2", inputs: [.vector2f], output: .vector2f) { ShaderGraphCoder.floor($0[0] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_floor_vector3", inputs: [.vector3f], output: .vector3f) { ShaderGraphCoder.floor($0[0] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_floor_vector4", inputs: [.vector4f], output: .vector4f) { ShaderGraphCoder.floor($0[0] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_realitykit_fractional_color3", inputs: [.color3f], output: .color3f) { ShaderGraphCoder.fract($0[0] as! SGColor) })
+    ops.append(BenchmarkOperation(nodeType: "ND_realitykit_fractional_color4", inputs: [.color4f], output: .color4f) { ShaderGraphCoder.fract($0[0] as! SGColor) })
+    ops.append(BenchmarkOperation(nodeType: "ND_realitykit_fractional_float", inputs: [.float], output: .float) { ShaderGraphCoder.fract($0[0] as! SGScalar) })
+    ops.append(BenchmarkOperation(nodeType: "ND_realitykit_fractional_vector2", inputs: [.vector2f], output: .vector2f) { ShaderGraphCoder.fract($0[0] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_realitykit_fractional_vector3", inputs: [.vector3f], output: .vector3f) { ShaderGraphCoder.fract($0[0] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_realitykit_fractional_vector4", inputs: [.vector4f], output: .vector4f) { ShaderGraphCoder.fract($0[0] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_fractal3d_color3", inputs: [.vector3f, .int, .float, .float, .vector3f], output: .color3f) { ShaderGraphCoder.fractal3D(amplitude: $0[0] as! SGNumeric, octaves: $0[1] as! SGScalar, lacunarity: $0[2] as! SGScalar, diminish: $0[3] as! SGScalar, position: $0[4] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_fractal3d_color3FA", inputs: [.float, .int, .float, .float, .vector3f], output: .color3f) { ShaderGraphCoder.fractal3D(amplitude: $0[0] as! SGNumeric, octaves: $0[1] as! SGScalar, lacunarity: $0[2] as! SGScalar, diminish: $0[3] as! SGScalar, position: $0[4] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_fractal3d_color4", inputs: [.vector4f, .int, .float, .float, .vector3f], output: .color4f) { ShaderGraphCoder.fractal3D(amplitude: $0[0] as! SGNumeric, octaves: $0[1] as! SGScalar, lacunarity: $0[2] as! SGScalar, diminish: $0[3] as! SGScalar, position: $0[4] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_fractal3d_color4FA", inputs: [.float, .int, .float, .float, .vector3f], output: .color4f) { ShaderGraphCoder.fractal3D(amplitude: $0[0] as! SGNumeric, octaves: $0[1] as! SGScalar, lacunarity: $0[2] as! SGScalar, diminish: $0[3] as! SGScalar, position: $0[4] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_fractal3d_float", inputs: [.float, .int, .float, .float, .vector3f], output: .float) { ShaderGraphCoder.fractal3D(amplitude: $0[0] as! SGNumeric, octaves: $0[1] as! SGScalar, lacunarity: $0[2] as! SGScalar, diminish: $0[3] as! SGScalar, position: $0[4] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_fractal3d_vector2", inputs: [.vector2f, .int, .float, .float, .vector3f], output: .vector2f) { ShaderGraphCoder.fractal3D(amplitude: $0[0] as! SGNumeric, octaves: $0[1] as! SGScalar, lacunarity: $0[2] as! SGScalar, diminish: $0[3] as! SGScalar, position: $0[4] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_fractal3d_vector2FA", inputs: [.float, .int, .float, .float, .vector3f], output: .vector2f) { ShaderGraphCoder.fractal3D(amplitude: $0[0] as! SGNumeric, octaves: $0[1] as! SGScalar, lacunarity: $0[2] as! SGScalar, diminish: $0[3] as! SGScalar, position: $0[4] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_fractal3d_vector3", inputs: [.vector3f, .int, .float, .float, .vector3f], output: .vector3f) { ShaderGraphCoder.fractal3D(amplitude: $0[0] as! SGNumeric, octaves: $0[1] as! SGScalar, lacunarity: $0[2] as! SGScalar, diminish: $0[3] as! SGScalar, position: $0[4] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_fractal3d_vector3FA", inputs: [.float, .int, .float, .float, .vector3f], output: .vector3f) { ShaderGraphCoder.fractal3D(amplitude: $0[0] as! SGNumeric, octaves: $0[1] as! SGScalar, lacunarity: $0[2] as! SGScalar, diminish: $0[3] as! SGScalar, position: $0[4] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_fractal3d_vector4", inputs: [.vector4f, .int, .float, .float, .vector3f], output: .vector4f) { ShaderGraphCoder.fractal3D(amplitude: $0[0] as! SGNumeric, octaves: $0[1] as! SGScalar, lacunarity: $0[2] as! SGScalar, diminish: $0[3] as! SGScalar, position: $0[4] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_fractal3d_vector4FA", inputs: [.float, .int, .float, .float, .vector3f], output: .vector4f) { ShaderGraphCoder.fractal3D(amplitude: $0[0] as! SGNumeric, octaves: $0[1] as! SGScalar, lacunarity: $0[2] as! SGScalar, diminish: $0[3] as! SGScalar, position: $0[4] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_realitykit_geometry_switch_cameraindex_color3", inputs: [.color3f, .color3f, .color3f], output: .color3f) { ShaderGraphCoder.geometrySwitchCameraIndex(mono: $0[0] as! SGColor, left: $0[1] as! SGColor, right: $0[2] as! SGColor) })
+    ops.append(BenchmarkOperation(nodeType: "ND_realitykit_geometry_switch_cameraindex_color4", inputs: [.color4f, .color4f, .color4f], output: .color4f) { ShaderGraphCoder.geometrySwitchCameraIndex(mono: $0[0] as! SGColor, left: $0[1] as! SGColor, right: $0[2] as! SGColor) })
+    ops.append(BenchmarkOperation(nodeType: "ND_realitykit_geometry_switch_cameraindex_float", inputs: [.float, .float, .float], output: .float) { ShaderGraphCoder.geometrySwitchCameraIndex(mono: $0[0] as! SGScalar, left: $0[1] as! SGScalar, right: $0[2] as! SGScalar) })
+    ops.append(BenchmarkOperation(nodeType: "ND_realitykit_geometry_switch_cameraindex_integer", inputs: [.int, .int, .int], output: .int) { ShaderGraphCoder.geometrySwitchCameraIndex(mono: $0[0] as! SGScalar, left: $0[1] as! SGScalar, right: $0[2] as! SGScalar) })
+    ops.append(BenchmarkOperation(nodeType: "ND_realitykit_geometry_switch_cameraindex_vector2", inputs: [.vector2f, .vector2f, .vector2f], output: .vector2f) { ShaderGraphCoder.geometrySwitchCameraIndex(mono: $0[0] as! SGVector, left: $0[1] as! SGVector, right: $0[2] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_realitykit_geometry_switch_cameraindex_vector3", inputs: [.vector3f, .vector3f, .vector3f], output: .vector3f) { ShaderGraphCoder.geometrySwitchCameraIndex(mono: $0[0] as! SGVector, left: $0[1] as! SGVector, right: $0[2] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_realitykit_geometry_switch_cameraindex_vector4", inputs: [.vector4f, .vector4f, .vector4f], output: .vector4f) { ShaderGraphCoder.geometrySwitchCameraIndex(mono: $0[0] as! SGVector, left: $0[1] as! SGVector, right: $0[2] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_heighttonormal_vector3", inputs: [.float, .float], output: .vector3f) { ShaderGraphCoder.heightToNormal($0[0] as! SGScalar, scale: $0[1] as! SGScalar) })
+    ops.append(BenchmarkOperation(nodeType: "ND_hsvadjust_color3", inputs: [.color3f, .vector3f], output: .color3f) { ShaderGraphCoder.hsvAdjust($0[0] as! SGColor, amount: $0[1] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_hsvadjust_color4", inputs: [.color4f, .vector3f], output: .color4f) { ShaderGraphCoder.hsvAdjust($0[0] as! SGColor, amount: $0[1] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_hsvtorgb_color3", inputs: [.color3f], output: .color3f) { ShaderGraphCoder.hsvToRGB($0[0] as! SGColor) })
+    ops.append(BenchmarkOperation(nodeType: "ND_hsvtorgb_color4", inputs: [.color4f], output: .color4f) { ShaderGraphCoder.hsvToRGB($0[0] as! SGColor) })
+    ops.append(BenchmarkOperation(nodeType: "ND_ifequal_color3", inputs: [.float, .float, .color3f, .color3f], output: .color3f) { ShaderGraphCoder.ifEqual($0[0] as! SGValue, $0[1] as! SGValue, trueResult: $0[2] as! SGColor, falseResult: $0[3] as! SGColor) })
+    ops.append(BenchmarkOperation(nodeType: "ND_ifequal_color3B", inputs: [.bool, .bool, .color3f, .color3f], output: .color3f) { ShaderGraphCoder.ifEqual($0[0] as! SGValue, $0[1] as! SGValue, trueResult: $0[2] as! SGColor, falseResult: $0[3] as! SGColor) })
+    ops.append(BenchmarkOperation(nodeType: "ND_ifequal_color3I", inputs: [.int, .int, .color3f, .color3f], output: .color3f) { ShaderGraphCoder.ifEqual($0[0] as! SGValue, $0[1] as! SGValue, trueResult: $0[2] as! SGColor, falseResult: $0[3] as! SGColor) })
+    ops.append(BenchmarkOperation(nodeType: "ND_ifequal_color4", inputs: [.float, .float, .color4f, .color4f], output: .color4f) { ShaderGraphCoder.ifEqual($0[0] as! SGValue, $0[1] as! SGValue, trueResult: $0[2] as! SGColor, falseResult: $0[3] as! SGColor) })
+    ops.append(BenchmarkOperation(nodeType: "ND_ifequal_color4B", inputs: [.bool, .bool, .color4f, .color4f], output: .color4f) { ShaderGraphCoder.ifEqual($0[0] as! SGValue, $0[1] as! SGValue, trueResult: $0[2] as! SGColor, falseResult: $0[3] as! SGColor) })
+    ops.append(BenchmarkOperation(nodeType: "ND_ifequal_color4I", inputs: [.int, .int, .color4f, .color4f], output: .color4f) { ShaderGraphCoder.ifEqual($0[0] as! SGValue, $0[1] as! SGValue, trueResult: $0[2] as! SGColor, falseResult: $0[3] as! SGColor) })
+    ops.append(BenchmarkOperation(nodeType: "ND_ifequal_float", inputs: [.float, .float, .float, .float], output: .float) { ShaderGraphCoder.ifEqual($0[0] as! SGValue, $0[1] as! SGValue, trueResult: $0[2] as! SGScalar, falseResult: $0[3] as! SGScalar) })
+    ops.append(BenchmarkOperation(nodeType: "ND_ifequal_floatB", inputs: [.bool, .bool, .float, .float], output: .float) { ShaderGraphCoder.ifEqual($0[0] as! SGValue, $0[1] as! SGValue, trueResult: $0[2] as! SGScalar, falseResult: $0[3] as! SGScalar) })
+    ops.append(BenchmarkOperation(nodeType: "ND_ifequal_floatI", inputs: [.int, .int, .float, .float], output: .float) { ShaderGraphCoder.ifEqual($0[0] as! SGValue, $0[1] as! SGValue, trueResult: $0[2] as! SGScalar, falseResult: $0[3] as! SGScalar) })
+    ops.append(BenchmarkOperation(nodeType: "ND_ifequal_half", inputs: [.half, .half, .half, .half], output: .half) { ShaderGraphCoder.ifEqual($0[0] as! SGValue, $0[1] as! SGValue, trueResult: $0[2] as! SGScalar, falseResult: $0[3] as! SGScalar) })
+    ops.append(BenchmarkOperation(nodeType: "ND_ifequal_half2", inputs: [.float, .float, .vector2h, .vector2h], output: .vector2h) { ShaderGraphCoder.ifEqual($0[0] as! SGValue, $0[1] as! SGValue, trueResult: $0[2] as! SGVector, falseResult: $0[3] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_ifequal_half2B", inputs: [.bool, .bool, .vector2h, .vector2h], output: .vector2h) { ShaderGraphCoder.ifEqual($0[0] as! SGValue, $0[1] as! SGValue, trueResult: $0[2] as! SGVector, falseResult: $0[3] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_ifequal_half2I", inputs: [.int, .int, .vector2h, .vector2h], output: .vector2h) { ShaderGraphCoder.ifEqual($0[0] as! SGValue, $0[1] as! SGValue, trueResult: $0[2] as! SGVector, falseResult: $0[3] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_ifequal_half3", inputs: [.float, .float, .vector3h, .vector3h], output: .vector3h) { ShaderGraphCoder.ifEqual($0[0] as! SGValue, $0[1] as! SGValue, trueResult: $0[2] as! SGVector, falseResult: $0[3] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_ifequal_half3B", inputs: [.bool, .bool, .vector3h, .vector3h], output: .vector3h) { ShaderGraphCoder.ifEqual($0[0] as! SGValue, $0[1] as! SGValue, trueResult: $0[2] as! SGVector, falseResult: $0[3] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_ifequal_half3I", inputs: [.int, .int, .vector3h, .vector3h], output: .vector3h) { ShaderGraphCoder.ifEqual($0[0] as! SGValue, $0[1] as! SGValue, trueResult: $0[2] as! SGVector, falseResult: $0[3] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_ifequal_half4", inputs: [.float, .float, .vector4h, .vector4h], output: .vector4h) { ShaderGraphCoder.ifEqual($0[0] as! SGValue, $0[1] as! SGValue, trueResult: $0[2] as! SGVector, falseResult: $0[3] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_ifequal_half4B", inputs: [.bool, .bool, .vector4h, .vector4h], output: .vector4h) { ShaderGraphCoder.ifEqual($0[0] as! SGValue, $0[1] as! SGValue, trueResult: $0[2] as! SGVector, falseResult: $0[3] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_ifequal_half4I", inputs: [.int, .int, .vector4h, .vector4h], output: .vector4h) { ShaderGraphCoder.ifEqual($0[0] as! SGValue, $0[1] as! SGValue, trueResult: $0[2] as! SGVector, falseResult: $0[3] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_ifequal_halfB", inputs: [.bool, .bool, .half, .half], output: .half) { ShaderGraphCoder.ifEqual($0[0] as! SGValue, $0[1] as! SGValue, trueResult: $0[2] as! SGScalar, falseResult: $0[3] as! SGScalar) })
+    ops.append(BenchmarkOperation(nodeType: "ND_ifequal_halfI", inputs: [.int, .int, .half, .half], output: .half) { ShaderGraphCoder.ifEqual($0[0] as! SGValue, $0[1] as! SGValue, trueResult: $0[2] as! SGScalar, falseResult: $0[3] as! SGScalar) })
+    ops.append(BenchmarkOperation(nodeType: "ND_ifequal_vector2", inputs: [.float, .float, .vector2f, .vector2f], output: .vector2f) { ShaderGraphCoder.ifEqual($0[0] as! SGValue, $0[1] as! SGValue, trueResult: $0[2] as! SGVector, falseResult: $0[3] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_ifequal_vector2B", inputs: [.bool, .bool, .vector2f, .vector2f], output: .vector2f) { ShaderGraphCoder.ifEqual($0[0] as! SGValue, $0[1] as! SGValue, trueResult: $0[2] as! SGVector, falseResult: $0[3] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_ifequal_vector2I", inputs: [.int, .int, .vector2f, .vector2f], output: .vector2f) { ShaderGraphCoder.ifEqual($0[0] as! SGValue, $0[1] as! SGValue, trueResult: $0[2] as! SGVector, falseResult: $0[3] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_ifequal_vector3", inputs: [.float, .float, .vector3f, .vector3f], output: .vector3f) { ShaderGraphCoder.ifEqual($0[0] as! SGValue, $0[1] as! SGValue, trueResult: $0[2] as! SGVector, falseResult: $0[3] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_ifequal_vector3B", inputs: [.bool, .bool, .vector3f, .vector3f], output: .vector3f) { ShaderGraphCoder.ifEqual($0[0] as! SGValue, $0[1] as! SGValue, trueResult: $0[2] as! SGVector, falseResult: $0[3] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_ifequal_vector3I", inputs: [.int, .int, .vector3f, .vector3f], output: .vector3f) { ShaderGraphCoder.ifEqual($0[0] as! SGValue, $0[1] as! SGValue, trueResult: $0[2] as! SGVector, falseResult: $0[3] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_ifequal_vector4", inputs: [.float, .float, .vector4f, .vector4f], output: .vector4f) { ShaderGraphCoder.ifEqual($0[0] as! SGValue, $0[1] as! SGValue, trueResult: $0[2] as! SGVector, falseResult: $0[3] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_ifequal_vector4B", inputs: [.bool, .bool, .vector4f, .vector4f], output: .vector4f) { ShaderGraphCoder.ifEqual($0[0] as! SGValue, $0[1] as! SGValue, trueResult: $0[2] as! SGVector, falseResult: $0[3] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_ifequal_vector4I", inputs: [.int, .int, .vector4f, .vector4f], output: .vector4f) { ShaderGraphCoder.ifEqual($0[0] as! SGValue, $0[1] as! SGValue, trueResult: $0[2] as! SGVector, falseResult: $0[3] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_ifgreater_color3", inputs: [.float, .float, .color3f, .color3f], output: .color3f) { ShaderGraphCoder.ifGreater($0[0] as! SGScalar, $0[1] as! SGScalar, trueResult: $0[2] as! SGColor, falseResult: $0[3] as! SGColor) })
+    ops.append(BenchmarkOperation(nodeType: "ND_ifgreater_color3I", inputs: [.int, .int, .color3f, .color3f], output: .color3f) { ShaderGraphCoder.ifGreater($0[0] as! SGScalar, $0[1] as! SGScalar, trueResult: $0[2] as! SGColor, falseResult: $0[3] as! SGColor) })
+    ops.append(BenchmarkOperation(nodeType: "ND_ifgreater_color4", inputs: [.float, .float, .color4f, .color4f], output: .color4f) { ShaderGraphCoder.ifGreater($0[0] as! SGScalar, $0[1] as! SGScalar, trueResult: $0[2] as! SGColor, falseResult: $0[3] as! SGColor) })
+    ops.append(BenchmarkOperation(nodeType: "ND_ifgreater_color4I", inputs: [.int, .int, .color4f, .color4f], output: .color4f) { ShaderGraphCoder.ifGreater($0[0] as! SGScalar, $0[1] as! SGScalar, trueResult: $0[2] as! SGColor, falseResult: $0[3] as! SGColor) })
+    ops.append(BenchmarkOperation(nodeType: "ND_ifgreater_float", inputs: [.float, .float, .float, .float], output: .float) { ShaderGraphCoder.ifGreater($0[0] as! SGScalar, $0[1] as! SGScalar, trueResult: $0[2] as! SGScalar, falseResult: $0[3] as! SGScalar) })
+    ops.append(BenchmarkOperation(nodeType: "ND_ifgreater_floatI", inputs: [.int, .int, .float, .float], output: .float) { ShaderGraphCoder.ifGreater($0[0] as! SGScalar, $0[1] as! SGScalar, trueResult: $0[2] as! SGScalar, falseResult: $0[3] as! SGScalar) })
+    ops.append(BenchmarkOperation(nodeType: "ND_ifgreater_half", inputs: [.half, .half, .half, .half], output: .half) { ShaderGraphCoder.ifGreater($0[0] as! SGScalar, $0[1] as! SGScalar, trueResult: $0[2] as! SGScalar, falseResult: $0[3] as! SGScalar) })
+    ops.append(BenchmarkOperation(nodeType: "ND_ifgreater_half2", inputs: [.float, .float, .vector2h, .vector2h], output: .vector2h) { ShaderGraphCoder.ifGreater($0[0] as! SGScalar, $0[1] as! SGScalar, trueResult: $0[2] as! SGVector, falseResult: $0[3] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_ifgreater_half2I", inputs: [.int, .int, .vector2h, .vector2h], output: .vector2h) { ShaderGraphCoder.ifGreater($0[0] as! SGScalar, $0[1] as! SGScalar, trueResult: $0[2] as! SGVector, falseResult: $0[3] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_ifgreater_half3", inputs: [.float, .float, .vector3h, .vector3h], output: .vector3h) { ShaderGraphCoder.ifGreater($0[0] as! SGScalar, $0[1] as! SGScalar, trueResult: $0[2] as! SGVector, falseResult: $0[3] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_ifgreater_half3I", inputs: [.int, .int, .vector3h, .vector3h], output: .vector3h) { ShaderGraphCoder.ifGreater($0[0] as! SGScalar, $0[1] as! SGScalar, trueResult: $0[2] as! SGVector, falseResult: $0[3] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_ifgreater_half4", inputs: [.float, .float, .vector4h, .vector4h], output: .vector4h) { ShaderGraphCoder.ifGreater($0[0] as! SGScalar, $0[1] as! SGScalar, trueResult: $0[2] as! SGVector, falseResult: $0[3] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_ifgreater_half4I", inputs: [.int, .int, .vector4h, .vector4h], output: .vector4h) { ShaderGraphCoder.ifGreater($0[0] as! SGScalar, $0[1] as! SGScalar, trueResult: $0[2] as! SGVector, falseResult: $0[3] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_ifgreater_halfI", inputs: [.int, .int, .half, .half], output: .half) { ShaderGraphCoder.ifGreater($0[0] as! SGScalar, $0[1] as! SGScalar, trueResult: $0[2] as! SGScalar, falseResult: $0[3] as! SGScalar) })
+    ops.append(BenchmarkOperation(nodeType: "ND_ifgreater_vector2", inputs: [.float, .float, .vector2f, .vector2f], output: .vector2f) { ShaderGraphCoder.ifGreater($0[0] as! SGScalar, $0[1] as! SGScalar, trueResult: $0[2] as! SGVector, falseResult: $0[3] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_ifgreater_vector2I", inputs: [.int, .int, .vector2f, .vector2f], output: .vector2f) { ShaderGraphCoder.ifGreater($0[0] as! SGScalar, $0[1] as! SGScalar, trueResult: $0[2] as! SGVector, falseResult: $0[3] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_ifgreater_vector3", inputs: [.float, .float, .vector3f, .vector3f], output: .vector3f) { ShaderGraphCoder.ifGreater($0[0] as! SGScalar, $0[1] as! SGScalar, trueResult: $0[2] as! SGVector, falseResult: $0[3] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_ifgreater_vector3I", inputs: [.int, .int, .vector3f, .vector3f], output: .vector3f) { ShaderGraphCoder.ifGreater($0[0] as! SGScalar, $0[1] as! SGScalar, trueResult: $0[2] as! SGVector, falseResult: $0[3] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_ifgreater_vector4", inputs: [.float, .float, .vector4f, .vector4f], output: .vector4f) { ShaderGraphCoder.ifGreater($0[0] as! SGScalar, $0[1] as! SGScalar, trueResult: $0[2] as! SGVector, falseResult: $0[3] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_ifgreater_vector4I", inputs: [.int, .int, .vector4f, .vector4f], output: .vector4f) { ShaderGraphCoder.ifGreater($0[0] as! SGScalar, $0[1] as! SGScalar, trueResult: $0[2] as! SGVector, falseResult: $0[3] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_ifgreatereq_color3", inputs: [.float, .float, .color3f, .color3f], output: .color3f) { ShaderGraphCoder.ifGreaterOrEqual($0[0] as! SGScalar, $0[1] as! SGScalar, trueResult: $0[2] as! SGColor, falseResult: $0[3] as! SGColor) })
+    ops.append(BenchmarkOperation(nodeType: "ND_ifgreatereq_color3I", inputs: [.int, .int, .color3f, .color3f], output: .color3f) { ShaderGraphCoder.ifGreaterOrEqual($0[0] as! SGScalar, $0[1] as! SGScalar, trueResult: $0[2] as! SGColor, falseResult: $0[3] as! SGColor) })
+    ops.append(BenchmarkOperation(nodeType: "ND_ifgreatereq_color4", inputs: [.float, .float, .color4f, .color4f], output: .color4f) { ShaderGraphCoder.ifGreaterOrEqual($0[0] as! SGScalar, $0[1] as! SGScalar, trueResult: $0[2] as! SGColor, falseResult: $0[3] as! SGColor) })
+    ops.append(BenchmarkOperation(nodeType: "ND_ifgreatereq_color4I", inputs: [.int, .int, .color4f, .color4f], output: .color4f) { ShaderGraphCoder.ifGreaterOrEqual($0[0] as! SGScalar, $0[1] as! SGScalar, trueResult: $0[2] as! SGColor, falseResult: $0[3] as! SGColor) })
+    ops.append(BenchmarkOperation(nodeType: "ND_ifgreatereq_float", inputs: [.float, .float, .float, .float], output: .float) { ShaderGraphCoder.ifGreaterOrEqual($0[0] as! SGScalar, $0[1] as! SGScalar, trueResult: $0[2] as! SGScalar, falseResult: $0[3] as! SGScalar) })
+    ops.append(BenchmarkOperation(nodeType: "ND_ifgreatereq_floatI", inputs: [.int, .int, .float, .float], output: .float) { ShaderGraphCoder.ifGreaterOrEqual($0[0] as! SGScalar, $0[1] as! SGScalar, trueResult: $0[2] as! SGScalar, falseResult: $0[3] as! SGScalar) })
+    ops.append(BenchmarkOperation(nodeType: "ND_ifgreatereq_half", inputs: [.half, .half, .half, .half], output: .half) { ShaderGraphCoder.ifGreaterOrEqual($0[0] as! SGScalar, $0[1] as! SGScalar, trueResult: $0[2] as! SGScalar, falseResult: $0[3] as! SGScalar) })
+    ops.append(BenchmarkOperation(nodeType: "ND_ifgreatereq_half2", inputs: [.float, .float, .vector2h, .vector2h], output: .vector2h) { ShaderGraphCoder.ifGreaterOrEqual($0[0] as! SGScalar, $0[1] as! SGScalar, trueResult: $0[2] as! SGVector, falseResult: $0[3] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_ifgreatereq_half2I", inputs: [.int, .int, .vector2h, .vector2h], output: .vector2h) { ShaderGraphCoder.ifGreaterOrEqual($0[0] as! SGScalar, $0[1] as! SGScalar, trueResult: $0[2] as! SGVector, falseResult: $0[3] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_ifgreatereq_half3", inputs: [.float, .float, .vector3h, .vector3h], output: .vector3h) { ShaderGraphCoder.ifGreaterOrEqual($0[0] as! SGScalar, $0[1] as! SGScalar, trueResult: $0[2] as! SGVector, falseResult: $0[3] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_ifgreatereq_half3I", inputs: [.int, .int, .vector3h, .vector3h], output: .vector3h) { ShaderGraphCoder.ifGreaterOrEqual($0[0] as! SGScalar, $0[1] as! SGScalar, trueResult: $0[2] as! SGVector, falseResult: $0[3] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_ifgreatereq_half4", inputs: [.float, .float, .vector4h, .vector4h], output: .vector4h) { ShaderGraphCoder.ifGreaterOrEqual($0[0] as! SGScalar, $0[1] as! SGScalar, trueResult: $0[2] as! SGVector, falseResult: $0[3] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_ifgreatereq_half4I", inputs: [.int, .int, .vector4h, .vector4h], output: .vector4h) { ShaderGraphCoder.ifGreaterOrEqual($0[0] as! SGScalar, $0[1] as! SGScalar, trueResult: $0[2] as! SGVector, falseResult: $0[3] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_ifgreatereq_halfI", inputs: [.int, .int, .half, .half], output: .half) { ShaderGraphCoder.ifGreaterOrEqual($0[0] as! SGScalar, $0[1] as! SGScalar, trueResult: $0[2] as! SGScalar, falseResult: $0[3] as! SGScalar) })
+    ops.append(BenchmarkOperation(nodeType: "ND_ifgreatereq_vector2", inputs: [.float, .float, .vector2f, .vector2f], output: .vector2f) { ShaderGraphCoder.ifGreaterOrEqual($0[0] as! SGScalar, $0[1] as! SGScalar, trueResult: $0[2] as! SGVector, falseResult: $0[3] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_ifgreatereq_vector2I", inputs: [.int, .int, .vector2f, .vector2f], output: .vector2f) { ShaderGraphCoder.ifGreaterOrEqual($0[0] as! SGScalar, $0[1] as! SGScalar, trueResult: $0[2] as! SGVector, falseResult: $0[3] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_ifgreatereq_vector3", inputs: [.float, .float, .vector3f, .vector3f], output: .vector3f) { ShaderGraphCoder.ifGreaterOrEqual($0[0] as! SGScalar, $0[1] as! SGScalar, trueResult: $0[2] as! SGVector, falseResult: $0[3] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_ifgreatereq_vector3I", inputs: [.int, .int, .vector3f, .vector3f], output: .vector3f) { ShaderGraphCoder.ifGreaterOrEqual($0[0] as! SGScalar, $0[1] as! SGScalar, trueResult: $0[2] as! SGVector, falseResult: $0[3] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_ifgreatereq_vector4", inputs: [.float, .float, .vector4f, .vector4f], output: .vector4f) { ShaderGraphCoder.ifGreaterOrEqual($0[0] as! SGScalar, $0[1] as! SGScalar, trueResult: $0[2] as! SGVector, falseResult: $0[3] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_ifgreatereq_vector4I", inputs: [.int, .int, .vector4f, .vector4f], output: .vector4f) { ShaderGraphCoder.ifGreaterOrEqual($0[0] as! SGScalar, $0[1] as! SGScalar, trueResult: $0[2] as! SGVector, falseResult: $0[3] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_image_color3", inputs: [.asset, .color3f, .vector2f], output: .color3f) { ShaderGraphCoder.image(file: $0[0] as! SGTexture, defaultValue: $0[1] as! SGColor, texcoord: $0[2] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_image_color4", inputs: [.asset, .color4f, .vector2f], output: .color4f) { ShaderGraphCoder.image(file: $0[0] as! SGTexture, defaultValue: $0[1] as! SGColor, texcoord: $0[2] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_image_float", inputs: [.asset, .float, .vector2f], output: .float) { ShaderGraphCoder.image(file: $0[0] as! SGTexture, defaultValue: $0[1] as! SGScalar, texcoord: $0[2] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_image_half", inputs: [.asset, .half, .vector2f], output: .half) { ShaderGraphCoder.image(file: $0[0] as! SGTexture, defaultValue: $0[1] as! SGScalar, texcoord: $0[2] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_image_vector2", inputs: [.asset, .vector2f, .vector2f], output: .vector2f) { ShaderGraphCoder.image(file: $0[0] as! SGTexture, defaultValue: $0[1] as! SGVector, texcoord: $0[2] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_image_vector3", inputs: [.asset, .vector3f, .vector2f], output: .vector3f) { ShaderGraphCoder.image(file: $0[0] as! SGTexture, defaultValue: $0[1] as! SGVector, texcoord: $0[2] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_image_vector4", inputs: [.asset, .vector4f, .vector2f], output: .vector4f) { ShaderGraphCoder.image(file: $0[0] as! SGTexture, defaultValue: $0[1] as! SGVector, texcoord: $0[2] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_inside_color3", inputs: [.color3f, .float], output: .color3f) { ShaderGraphCoder.inside($0[0] as! SGColor, mask: $0[1] as! SGScalar) })
+    ops.append(BenchmarkOperation(nodeType: "ND_inside_color4", inputs: [.color4f, .float], output: .color4f) { ShaderGraphCoder.inside($0[0] as! SGColor, mask: $0[1] as! SGScalar) })
+    ops.append(BenchmarkOperation(nodeType: "ND_inside_float", inputs: [.float, .float], output: .float) { ShaderGraphCoder.inside($0[0] as! SGScalar, mask: $0[1] as! SGScalar) })
+    ops.append(BenchmarkOperation(nodeType: "ND_inside_half", inputs: [.half, .half], output: .half) { ShaderGraphCoder.inside($0[0] as! SGScalar, mask: $0[1] as! SGScalar) })
+    ops.append(BenchmarkOperation(nodeType: "ND_invertmatrix_matrix22", inputs: [.matrix2d], output: .matrix2d) { ShaderGraphCoder.invertMatrix($0[0] as! SGMatrix) })
+    ops.append(BenchmarkOperation(nodeType: "ND_invertmatrix_matrix33", inputs: [.matrix3d], output: .matrix3d) { ShaderGraphCoder.invertMatrix($0[0] as! SGMatrix) })
+    ops.append(BenchmarkOperation(nodeType: "ND_invertmatrix_matrix44", inputs: [.matrix4d], output: .matrix4d) { ShaderGraphCoder.invertMatrix($0[0] as! SGMatrix) })
+    ops.append(BenchmarkOperation(nodeType: "ND_magnitude_half2", inputs: [.vector2h], output: .float) { ShaderGraphCoder.length($0[0] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_magnitude_half3", inputs: [.vector3h], output: .float) { ShaderGraphCoder.length($0[0] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_magnitude_half4", inputs: [.vector4h], output: .float) { ShaderGraphCoder.length($0[0] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_magnitude_vector2", inputs: [.vector2f], output: .float) { ShaderGraphCoder.length($0[0] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_magnitude_vector3", inputs: [.vector3f], output: .float) { ShaderGraphCoder.length($0[0] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_magnitude_vector4", inputs: [.vector4f], output: .float) { ShaderGraphCoder.length($0[0] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_ln_float", inputs: [.float], output: .float) { ShaderGraphCoder.log($0[0] as! SGScalar) })
+    ops.append(BenchmarkOperation(nodeType: "ND_ln_half", inputs: [.half], output: .half) { ShaderGraphCoder.log($0[0] as! SGScalar) })
+    ops.append(BenchmarkOperation(nodeType: "ND_ln_half2", inputs: [.vector2h], output: .vector2h) { ShaderGraphCoder.log($0[0] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_ln_half3", inputs: [.vector3h], output: .vector3h) { ShaderGraphCoder.log($0[0] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_ln_half4", inputs: [.vector4h], output: .vector4h) { ShaderGraphCoder.log($0[0] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_ln_vector2", inputs: [.vector2f], output: .vector2f) { ShaderGraphCoder.log($0[0] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_ln_vector3", inputs: [.vector3f], output: .vector3f) { ShaderGraphCoder.log($0[0] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_ln_vector4", inputs: [.vector4f], output: .vector4f) { ShaderGraphCoder.log($0[0] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_realitykit_logical_and", inputs: [.bool, .bool], output: .bool) { ShaderGraphCoder.logicalAnd($0[0] as! SGValue, $0[1] as! SGValue) })
+    ops.append(BenchmarkOperation(nodeType: "ND_realitykit_logical_not", inputs: [.bool], output: .bool) { ShaderGraphCoder.logicalNot($0[0] as! SGValue) })
+    ops.append(BenchmarkOperation(nodeType: "ND_realitykit_logical_or", inputs: [.bool, .bool], output: .bool) { ShaderGraphCoder.logicalOr($0[0] as! SGValue, $0[1] as! SGValue) })
+    ops.append(BenchmarkOperation(nodeType: "ND_realitykit_logical_xor", inputs: [.bool, .bool], output: .bool) { ShaderGraphCoder.logicalXor($0[0] as! SGValue, $0[1] as! SGValue) })
+    ops.append(BenchmarkOperation(nodeType: "ND_luminance_color3", inputs: [.color3f, .color3f], output: .color3f) { ShaderGraphCoder.luminance($0[0] as! SGColor, lumacoeffs: $0[1] as! SGColor) })
+    ops.append(BenchmarkOperation(nodeType: "ND_luminance_color4", inputs: [.color4f, .color3f], output: .color4f) { ShaderGraphCoder.luminance($0[0] as! SGColor, lumacoeffs: $0[1] as! SGColor) })
+    ops.append(BenchmarkOperation(nodeType: "ND_mask_color4", inputs: [.color4f, .color4f, .float], output: .color4f) { ShaderGraphCoder.mask(fg: $0[0] as! SGColor, bg: $0[1] as! SGColor, mix: $0[2] as! SGScalar) })
+    ops.append(BenchmarkOperation(nodeType: "ND_matte_color4", inputs: [.color4f, .color4f, .float], output: .color4f) { ShaderGraphCoder.matte(fg: $0[0] as! SGColor, bg: $0[1] as! SGColor, mix: $0[2] as! SGScalar) })
+    ops.append(BenchmarkOperation(nodeType: "ND_max_color3", inputs: [.color3f, .color3f], output: .color3f) { ShaderGraphCoder.max($0[0] as! SGColor, $0[1] as! SGNumeric) })
+    ops.append(BenchmarkOperation(nodeType: "ND_max_color3FA", inputs: [.color3f, .float], output: .color3f) { ShaderGraphCoder.max($0[0] as! SGColor, $0[1] as! SGNumeric) })
+    ops.append(BenchmarkOperation(nodeType: "ND_max_color4", inputs: [.color4f, .color4f], output: .color4f) { ShaderGraphCoder.max($0[0] as! SGColor, $0[1] as! SGNumeric) })
+    ops.append(BenchmarkOperation(nodeType: "ND_max_color4FA", inputs: [.color4f, .float], output: .color4f) { ShaderGraphCoder.max($0[0] as! SGColor, $0[1] as! SGNumeric) })
+    ops.append(BenchmarkOperation(nodeType: "ND_max_float", inputs: [.float, .float], output: .float) { ShaderGraphCoder.max($0[0] as! SGScalar, $0[1] as! SGNumeric) })
+    ops.append(BenchmarkOperation(nodeType: "ND_max_half", inputs: [.half, .half], output: .half) { ShaderGraphCoder.max($0[0] as! SGScalar, $0[1] as! SGNumeric) })
+    ops.append(BenchmarkOperation(nodeType: "ND_max_half2", inputs: [.vector2h, .vector2h], output: .vector2h) { ShaderGraphCoder.max($0[0] as! SGVector, $0[1] as! SGNumeric) })
+    ops.append(BenchmarkOperation(nodeType: "ND_max_half2FA", inputs: [.vector2h, .float], output: .vector2h) { ShaderGraphCoder.max($0[0] as! SGVector, $0[1] as! SGNumeric) })
+    ops.append(BenchmarkOperation(nodeType: "ND_max_half3", inputs: [.vector3h, .vector3h], output: .vector3h) { ShaderGraphCoder.max($0[0] as! SGVector, $0[1] as! SGNumeric) })
+    ops.append(BenchmarkOperation(nodeType: "ND_max_half3FA", inputs: [.vector3h, .float], output: .vector3h) { ShaderGraphCoder.max($0[0] as! SGVector, $0[1] as! SGNumeric) })
+    ops.append(BenchmarkOperation(nodeType: "ND_max_half4", inputs: [.vector4h, .vector4h], output: .vector4h) { ShaderGraphCoder.max($0[0] as! SGVector, $0[1] as! SGNumeric) })
+    ops.append(BenchmarkOperation(nodeType: "ND_max_half4FA", inputs: [.vector4h, .float], output: .vector4h) { ShaderGraphCoder.max($0[0] as! SGVector, $0[1] as! SGNumeric) })
+    ops.append(BenchmarkOperation(nodeType: "ND_max_vector2", inputs: [.vector2f, .vector2f], output: .vector2f) { ShaderGraphCoder.max($0[0] as! SGVector, $0[1] as! SGNumeric) })
+    ops.append(BenchmarkOperation(nodeType: "ND_max_vector2FA", inputs: [.vector2f, .float], output: .vector2f) { ShaderGraphCoder.max($0[0] as! SGVector, $0[1] as! SGNumeric) })
+    ops.append(BenchmarkOperation(nodeType: "ND_max_vector3", inputs: [.vector3f, .vector3f], output: .vector3f) { ShaderGraphCoder.max($0[0] as! SGVector, $0[1] as! SGNumeric) })
+    ops.append(BenchmarkOperation(nodeType: "ND_max_vector3FA", inputs: [.vector3f, .float], output: .vector3f) { ShaderGraphCoder.max($0[0] as! SGVector, $0[1] as! SGNumeric) })
+    ops.append(BenchmarkOperation(nodeType: "ND_max_vector4", inputs: [.vector4f, .vector4f], output: .vector4f) { ShaderGraphCoder.max($0[0] as! SGVector, $0[1] as! SGNumeric) })
+    ops.append(BenchmarkOperation(nodeType: "ND_max_vector4FA", inputs: [.vector4f, .float], output: .vector4f) { ShaderGraphCoder.max($0[0] as! SGVector, $0[1] as! SGNumeric) })
+    ops.append(BenchmarkOperation(nodeType: "ND_min_color3", inputs: [.color3f, .color3f], output: .color3f) { ShaderGraphCoder.min($0[0] as! SGColor, $0[1] as! SGNumeric) })
+    ops.append(BenchmarkOperation(nodeType: "ND_min_color3FA", inputs: [.color3f, .float], output: .color3f) { ShaderGraphCoder.min($0[0] as! SGColor, $0[1] as! SGNumeric) })
+    ops.append(BenchmarkOperation(nodeType: "ND_min_color4", inputs: [.color4f, .color4f], output: .color4f) { ShaderGraphCoder.min($0[0] as! SGColor, $0[1] as! SGNumeric) })
+    ops.append(BenchmarkOperation(nodeType: "ND_min_color4FA", inputs: [.color4f, .float], output: .color4f) { ShaderGraphCoder.min($0[0] as! SGColor, $0[1] as! SGNumeric) })
+    ops.append(BenchmarkOperation(nodeType: "ND_min_float", inputs: [.float, .float], output: .float) { ShaderGraphCoder.min($0[0] as! SGScalar, $0[1] as! SGNumeric) })
+    ops.append(BenchmarkOperation(nodeType: "ND_min_half", inputs: [.half, .half], output: .half) { ShaderGraphCoder.min($0[0] as! SGScalar, $0[1] as! SGNumeric) })
+    ops.append(BenchmarkOperation(nodeType: "ND_min_half2", inputs: [.vector2h, .vector2h], output: .vector2h) { ShaderGraphCoder.min($0[0] as! SGVector, $0[1] as! SGNumeric) })
+    ops.append(BenchmarkOperation(nodeType: "ND_min_half2FA", inputs: [.vector2h, .float], output: .vector2h) { ShaderGraphCoder.min($0[0] as! SGVector, $0[1] as! SGNumeric) })
+    ops.append(BenchmarkOperation(nodeType: "ND_min_half3", inputs: [.vector3h, .vector3h], output: .vector3h) { ShaderGraphCoder.min($0[0] as! SGVector, $0[1] as! SGNumeric) })
+    ops.append(BenchmarkOperation(nodeType: "ND_min_half3FA", inputs: [.vector3h, .float], output: .vector3h) { ShaderGraphCoder.min($0[0] as! SGVector, $0[1] as! SGNumeric) })
+    ops.append(BenchmarkOperation(nodeType: "ND_min_half4", inputs: [.vector4h, .vector4h], output: .vector4h) { ShaderGraphCoder.min($0[0] as! SGVector, $0[1] as! SGNumeric) })
+    ops.append(BenchmarkOperation(nodeType: "ND_min_half4FA", inputs: [.vector4h, .float], output: .vector4h) { ShaderGraphCoder.min($0[0] as! SGVector, $0[1] as! SGNumeric) })
+    ops.append(BenchmarkOperation(nodeType: "ND_min_vector2", inputs: [.vector2f, .vector2f], output: .vector2f) { ShaderGraphCoder.min($0[0] as! SGVector, $0[1] as! SGNumeric) })
+    ops.append(BenchmarkOperation(nodeType: "ND_min_vector2FA", inputs: [.vector2f, .float], output: .vector2f) { ShaderGraphCoder.min($0[0] as! SGVector, $0[1] as! SGNumeric) })
+    ops.append(BenchmarkOperation(nodeType: "ND_min_vector3", inputs: [.vector3f, .vector3f], output: .vector3f) { ShaderGraphCoder.min($0[0] as! SGVector, $0[1] as! SGNumeric) })
+    ops.append(BenchmarkOperation(nodeType: "ND_min_vector3FA", inputs: [.vector3f, .float], output: .vector3f) { ShaderGraphCoder.min($0[0] as! SGVector, $0[1] as! SGNumeric) })
+    ops.append(BenchmarkOperation(nodeType: "ND_min_vector4", inputs: [.vector4f, .vector4f], output: .vector4f) { ShaderGraphCoder.min($0[0] as! SGVector, $0[1] as! SGNumeric) })
+    ops.append(BenchmarkOperation(nodeType: "ND_min_vector4FA", inputs: [.vector4f, .float], output: .vector4f) { ShaderGraphCoder.min($0[0] as! SGVector, $0[1] as! SGNumeric) })
+    ops.append(BenchmarkOperation(nodeType: "ND_minus_color3", inputs: [.color3f, .color3f, .float], output: .color3f) { ShaderGraphCoder.minus(fg: $0[0] as! SGColor, bg: $0[1] as! SGColor, mix: $0[2] as! SGScalar) })
+    ops.append(BenchmarkOperation(nodeType: "ND_minus_color4", inputs: [.color4f, .color4f, .float], output: .color4f) { ShaderGraphCoder.minus(fg: $0[0] as! SGColor, bg: $0[1] as! SGColor, mix: $0[2] as! SGScalar) })
+    ops.append(BenchmarkOperation(nodeType: "ND_minus_float", inputs: [.float, .float, .float], output: .float) { ShaderGraphCoder.minus(fg: $0[0] as! SGScalar, bg: $0[1] as! SGScalar, mix: $0[2] as! SGScalar) })
+    ops.append(BenchmarkOperation(nodeType: "ND_minus_half", inputs: [.half, .half, .half], output: .half) { ShaderGraphCoder.minus(fg: $0[0] as! SGScalar, bg: $0[1] as! SGScalar, mix: $0[2] as! SGScalar) })
+    ops.append(BenchmarkOperation(nodeType: "ND_mix_color3", inputs: [.color3f, .color3f, .float], output: .color3f) { ShaderGraphCoder.mix(fg: $0[0] as! SGColor, bg: $0[1] as! SGColor, mix: $0[2] as! SGScalar) })
+    ops.append(BenchmarkOperation(nodeType: "ND_mix_color4", inputs: [.color4f, .color4f, .float], output: .color4f) { ShaderGraphCoder.mix(fg: $0[0] as! SGColor, bg: $0[1] as! SGColor, mix: $0[2] as! SGScalar) })
+    ops.append(BenchmarkOperation(nodeType: "ND_mix_float", inputs: [.float, .float, .float], output: .float) { ShaderGraphCoder.mix(fg: $0[0] as! SGScalar, bg: $0[1] as! SGScalar, mix: $0[2] as! SGScalar) })
+    ops.append(BenchmarkOperation(nodeType: "ND_mix_half", inputs: [.half, .half, .half], output: .half) { ShaderGraphCoder.mix(fg: $0[0] as! SGScalar, bg: $0[1] as! SGScalar, mix: $0[2] as! SGScalar) })
+    ops.append(BenchmarkOperation(nodeType: "ND_mix_half2", inputs: [.vector2h, .vector2h, .float], output: .vector2h) { ShaderGraphCoder.mix(fg: $0[0] as! SGVector, bg: $0[1] as! SGVector, mix: $0[2] as! SGScalar) })
+    ops.append(BenchmarkOperation(nodeType: "ND_mix_half3", inputs: [.vector3h, .vector3h, .float], output: .vector3h) { ShaderGraphCoder.mix(fg: $0[0] as! SGVector, bg: $0[1] as! SGVector, mix: $0[2] as! SGScalar) })
+    ops.append(BenchmarkOperation(nodeType: "ND_mix_half4", inputs: [.vector4h, .vector4h, .float], output: .vector4h) { ShaderGraphCoder.mix(fg: $0[0] as! SGVector, bg: $0[1] as! SGVector, mix: $0[2] as! SGScalar) })
+    ops.append(BenchmarkOperation(nodeType: "ND_mix_vector2", inputs: [.vector2f, .vector2f, .float], output: .vector2f) { ShaderGraphCoder.mix(fg: $0[0] as! SGVector, bg: $0[1] as! SGVector, mix: $0[2] as! SGScalar) })
+    ops.append(BenchmarkOperation(nodeType: "ND_mix_vector3", inputs: [.vector3f, .vector3f, .float], output: .vector3f) { ShaderGraphCoder.mix(fg: $0[0] as! SGVector, bg: $0[1] as! SGVector, mix: $0[2] as! SGScalar) })
+    ops.append(BenchmarkOperation(nodeType: "ND_mix_vector4", inputs: [.vector4f, .vector4f, .float], output: .vector4f) { ShaderGraphCoder.mix(fg: $0[0] as! SGVector, bg: $0[1] as! SGVector, mix: $0[2] as! SGScalar) })
+    ops.append(BenchmarkOperation(nodeType: "ND_in_color4", inputs: [.color4f, .color4f, .float], output: .color4f) { ShaderGraphCoder.mixColor(fg: $0[0] as! SGColor, bg: $0[1] as! SGColor, mix: $0[2] as! SGScalar) })
+    ops.append(BenchmarkOperation(nodeType: "ND_modulo_color3", inputs: [.color3f, .color3f], output: .color3f) { ShaderGraphCoder.modulo($0[0] as! SGColor, $0[1] as! SGNumeric) })
+    ops.append(BenchmarkOperation(nodeType: "ND_modulo_color3FA", inputs: [.color3f, .float], output: .color3f) { ShaderGraphCoder.modulo($0[0] as! SGColor, $0[1] as! SGNumeric) })
+    ops.append(BenchmarkOperation(nodeType: "ND_modulo_color4", inputs: [.color4f, .color4f], output: .color4f) { ShaderGraphCoder.modulo($0[0] as! SGColor, $0[1] as! SGNumeric) })
+    ops.append(BenchmarkOperation(nodeType: "ND_modulo_color4FA", inputs: [.color4f, .float], output: .color4f) { ShaderGraphCoder.modulo($0[0] as! SGColor, $0[1] as! SGNumeric) })
+    ops.append(BenchmarkOperation(nodeType: "ND_modulo_float", inputs: [.float, .float], output: .float) { ShaderGraphCoder.modulo($0[0] as! SGScalar, $0[1] as! SGNumeric) })
+    ops.append(BenchmarkOperation(nodeType: "ND_modulo_half", inputs: [.half, .half], output: .half) { ShaderGraphCoder.modulo($0[0] as! SGScalar, $0[1] as! SGNumeric) })
+    ops.append(BenchmarkOperation(nodeType: "ND_modulo_vector2", inputs: [.vector2f, .vector2f], output: .vector2f) { ShaderGraphCoder.modulo($0[0] as! SGVector, $0[1] as! SGNumeric) })
+    ops.append(BenchmarkOperation(nodeType: "ND_modulo_vector2FA", inputs: [.vector2f, .float], output: .vector2f) { ShaderGraphCoder.modulo($0[0] as! SGVector, $0[1] as! SGNumeric) })
+    ops.append(BenchmarkOperation(nodeType: "ND_modulo_vector3", inputs: [.vector3f, .vector3f], output: .vector3f) { ShaderGraphCoder.modulo($0[0] as! SGVector, $0[1] as! SGNumeric) })
+    ops.append(BenchmarkOperation(nodeType: "ND_modulo_vector3FA", inputs: [.vector3f, .float], output: .vector3f) { ShaderGraphCoder.modulo($0[0] as! SGVector, $0[1] as! SGNumeric) })
+    ops.append(BenchmarkOperation(nodeType: "ND_modulo_vector4", inputs: [.vector4f, .vector4f], output: .vector4f) { ShaderGraphCoder.modulo($0[0] as! SGVector, $0[1] as! SGNumeric) })
+    ops.append(BenchmarkOperation(nodeType: "ND_modulo_vector4FA", inputs: [.vector4f, .float], output: .vector4f) { ShaderGraphCoder.modulo($0[0] as! SGVector, $0[1] as! SGNumeric) })
+    ops.append(BenchmarkOperation(nodeType: "ND_multiply_color3", inputs: [.color3f, .color3f], output: .color3f) { ShaderGraphCoder.multiply($0[0] as! SGColor, $0[1] as! SGNumeric) })
+    ops.append(BenchmarkOperation(nodeType: "ND_multiply_color3FA", inputs: [.color3f, .float], output: .color3f) { ShaderGraphCoder.multiply($0[0] as! SGColor, $0[1] as! SGNumeric) })
+    ops.append(BenchmarkOperation(nodeType: "ND_multiply_color4", inputs: [.color4f, .color4f], output: .color4f) { ShaderGraphCoder.multiply($0[0] as! SGColor, $0[1] as! SGNumeric) })
+    ops.append(BenchmarkOperation(nodeType: "ND_multiply_color4FA", inputs: [.color4f, .float], output: .color4f) { ShaderGraphCoder.multiply($0[0] as! SGColor, $0[1] as! SGNumeric) })
+    ops.append(BenchmarkOperation(nodeType: "ND_multiply_float", inputs: [.float, .float], output: .float) { ShaderGraphCoder.multiply($0[0] as! SGScalar, $0[1] as! SGNumeric) })
+    ops.append(BenchmarkOperation(nodeType: "ND_multiply_half", inputs: [.half, .half], output: .half) { ShaderGraphCoder.multiply($0[0] as! SGScalar, $0[1] as! SGNumeric) })
+    ops.append(BenchmarkOperation(nodeType: "ND_multiply_matrix22", inputs: [.matrix2d, .matrix2d], output: .matrix2d) { ShaderGraphCoder.multiply($0[0] as! SGMatrix, $0[1] as! SGNumeric) })
+    ops.append(BenchmarkOperation(nodeType: "ND_multiply_matrix33", inputs: [.matrix3d, .matrix3d], output: .matrix3d) { ShaderGraphCoder.multiply($0[0] as! SGMatrix, $0[1] as! SGNumeric) })
+    ops.append(BenchmarkOperation(nodeType: "ND_multiply_matrix44", inputs: [.matrix4d, .matrix4d], output: .matrix4d) { ShaderGraphCoder.multiply($0[0] as! SGMatrix, $0[1] as! SGNumeric) })
+    ops.append(BenchmarkOperation(nodeType: "ND_multiply_vector2", inputs: [.vector2f, .vector2f], output: .vector2f) { ShaderGraphCoder.multiply($0[0] as! SGVector, $0[1] as! SGNumeric) })
+    ops.append(BenchmarkOperation(nodeType: "ND_multiply_vector2FA", inputs: [.vector2f, .float], output: .vector2f) { ShaderGraphCoder.multiply($0[0] as! SGVector, $0[1] as! SGNumeric) })
+    ops.append(BenchmarkOperation(nodeType: "ND_multiply_vector3", inputs: [.vector3f, .vector3f], output: .vector3f) { ShaderGraphCoder.multiply($0[0] as! SGVector, $0[1] as! SGNumeric) })
+    ops.append(BenchmarkOperation(nodeType: "ND_multiply_vector3FA", inputs: [.vector3f, .float], output: .vector3f) { ShaderGraphCoder.multiply($0[0] as! SGVector, $0[1] as! SGNumeric) })
+    ops.append(BenchmarkOperation(nodeType: "ND_multiply_vector4", inputs: [.vector4f, .vector4f], output: .vector4f) { ShaderGraphCoder.multiply($0[0] as! SGVector, $0[1] as! SGNumeric) })
+    ops.append(BenchmarkOperation(nodeType: "ND_multiply_vector4FA", inputs: [.vector4f, .float], output: .vector4f) { ShaderGraphCoder.multiply($0[0] as! SGVector, $0[1] as! SGNumeric) })
+    ops.append(BenchmarkOperation(nodeType: "ND_noise2d_color3", inputs: [.vector3f, .float, .vector2f], output: .color3f) { ShaderGraphCoder.noise2D(amplitude: $0[0] as! SGNumeric, pivot: $0[1] as! SGScalar, texcoord: $0[2] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_noise2d_color3FA", inputs: [.float, .float, .vector2f], output: .color3f) { ShaderGraphCoder.noise2D(amplitude: $0[0] as! SGNumeric, pivot: $0[1] as! SGScalar, texcoord: $0[2] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_noise2d_color4", inputs: [.vector4f, .float, .vector2f], output: .color4f) { ShaderGraphCoder.noise2D(amplitude: $0[0] as! SGNumeric, pivot: $0[1] as! SGScalar, texcoord: $0[2] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_noise2d_color4FA", inputs: [.float, .float, .vector2f], output: .color4f) { ShaderGraphCoder.noise2D(amplitude: $0[0] as! SGNumeric, pivot: $0[1] as! SGScalar, texcoord: $0[2] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_noise2d_float", inputs: [.float, .float, .vector2f], output: .float) { ShaderGraphCoder.noise2D(amplitude: $0[0] as! SGNumeric, pivot: $0[1] as! SGScalar, texcoord: $0[2] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_noise2d_vector2", inputs: [.vector2f, .float, .vector2f], output: .vector2f) { ShaderGraphCoder.noise2D(amplitude: $0[0] as! SGNumeric, pivot: $0[1] as! SGScalar, texcoord: $0[2] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_noise2d_vector2FA", inputs: [.float, .float, .vector2f], output: .vector2f) { ShaderGraphCoder.noise2D(amplitude: $0[0] as! SGNumeric, pivot: $0[1] as! SGScalar, texcoord: $0[2] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_noise2d_vector3", inputs: [.vector3f, .float, .vector2f], output: .vector3f) { ShaderGraphCoder.noise2D(amplitude: $0[0] as! SGNumeric, pivot: $0[1] as! SGScalar, texcoord: $0[2] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_noise2d_vector3FA", inputs: [.float, .float, .vector2f], output: .vector3f) { ShaderGraphCoder.noise2D(amplitude: $0[0] as! SGNumeric, pivot: $0[1] as! SGScalar, texcoord: $0[2] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_noise2d_vector4", inputs: [.vector4f, .float, .vector2f], output: .vector4f) { ShaderGraphCoder.noise2D(amplitude: $0[0] as! SGNumeric, pivot: $0[1] as! SGScalar, texcoord: $0[2] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_noise2d_vector4FA", inputs: [.float, .float, .vector2f], output: .vector4f) { ShaderGraphCoder.noise2D(amplitude: $0[0] as! SGNumeric, pivot: $0[1] as! SGScalar, texcoord: $0[2] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_noise3d_color3", inputs: [.vector3f, .float, .vector3f], output: .color3f) { ShaderGraphCoder.noise3D(amplitude: $0[0] as! SGNumeric, pivot: $0[1] as! SGScalar, position: $0[2] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_noise3d_color3FA", inputs: [.float, .float, .vector3f], output: .color3f) { ShaderGraphCoder.noise3D(amplitude: $0[0] as! SGNumeric, pivot: $0[1] as! SGScalar, position: $0[2] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_noise3d_color4", inputs: [.vector4f, .float, .vector3f], output: .color4f) { ShaderGraphCoder.noise3D(amplitude: $0[0] as! SGNumeric, pivot: $0[1] as! SGScalar, position: $0[2] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_noise3d_color4FA", inputs: [.float, .float, .vector3f], output: .color4f) { ShaderGraphCoder.noise3D(amplitude: $0[0] as! SGNumeric, pivot: $0[1] as! SGScalar, position: $0[2] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_noise3d_float", inputs: [.float, .float, .vector3f], output: .float) { ShaderGraphCoder.noise3D(amplitude: $0[0] as! SGNumeric, pivot: $0[1] as! SGScalar, position: $0[2] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_noise3d_vector2", inputs: [.vector2f, .float, .vector3f], output: .vector2f) { ShaderGraphCoder.noise3D(amplitude: $0[0] as! SGNumeric, pivot: $0[1] as! SGScalar, position: $0[2] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_noise3d_vector2FA", inputs: [.float, .float, .vector3f], output: .vector2f) { ShaderGraphCoder.noise3D(amplitude: $0[0] as! SGNumeric, pivot: $0[1] as! SGScalar, position: $0[2] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_noise3d_vector3", inputs: [.vector3f, .float, .vector3f], output: .vector3f) { ShaderGraphCoder.noise3D(amplitude: $0[0] as! SGNumeric, pivot: $0[1] as! SGScalar, position: $0[2] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_noise3d_vector3FA", inputs: [.float, .float, .vector3f], output: .vector3f) { ShaderGraphCoder.noise3D(amplitude: $0[0] as! SGNumeric, pivot: $0[1] as! SGScalar, position: $0[2] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_noise3d_vector4", inputs: [.vector4f, .float, .vector3f], output: .vector4f) { ShaderGraphCoder.noise3D(amplitude: $0[0] as! SGNumeric, pivot: $0[1] as! SGScalar, position: $0[2] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_noise3d_vector4FA", inputs: [.float, .float, .vector3f], output: .vector4f) { ShaderGraphCoder.noise3D(amplitude: $0[0] as! SGNumeric, pivot: $0[1] as! SGScalar, position: $0[2] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_normalmap", inputs: [.vector3f, .float, .vector3f, .vector3f], output: .vector3f) { ShaderGraphCoder.normalMap($0[0] as! SGVector, scale: $0[1] as! SGNumeric, normal: $0[2] as! SGVector, tangent: $0[3] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_normalmap_vector2", inputs: [.vector3f, .vector2f, .vector3f, .vector3f], output: .vector3f) { ShaderGraphCoder.normalMap($0[0] as! SGVector, scale: $0[1] as! SGNumeric, normal: $0[2] as! SGVector, tangent: $0[3] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_normal_map_decode", inputs: [.vector3f], output: .vector3f) { ShaderGraphCoder.normalMapDecode($0[0] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_normalize_half2", inputs: [.vector2h], output: .vector2h) { ShaderGraphCoder.normalize($0[0] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_normalize_half3", inputs: [.vector3h], output: .vector3h) { ShaderGraphCoder.normalize($0[0] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_normalize_half4", inputs: [.vector4h], output: .vector4h) { ShaderGraphCoder.normalize($0[0] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_normalize_vector2", inputs: [.vector2f], output: .vector2f) { ShaderGraphCoder.normalize($0[0] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_normalize_vector3", inputs: [.vector3f], output: .vector3f) { ShaderGraphCoder.normalize($0[0] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_normalize_vector4", inputs: [.vector4f], output: .vector4f) { ShaderGraphCoder.normalize($0[0] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_realitykit_oneminus_color3", inputs: [.color3f], output: .color3f) { ShaderGraphCoder.oneMinus($0[0] as! SGColor) })
+    ops.append(BenchmarkOperation(nodeType: "ND_realitykit_oneminus_color4", inputs: [.color4f], output: .color4f) { ShaderGraphCoder.oneMinus($0[0] as! SGColor) })
+    ops.append(BenchmarkOperation(nodeType: "ND_realitykit_oneminus_float", inputs: [.float], output: .float) { ShaderGraphCoder.oneMinus($0[0] as! SGScalar) })
+    ops.append(BenchmarkOperation(nodeType: "ND_realitykit_oneminus_vector2", inputs: [.vector2f], output: .vector2f) { ShaderGraphCoder.oneMinus($0[0] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_realitykit_oneminus_vector3", inputs: [.vector3f], output: .vector3f) { ShaderGraphCoder.oneMinus($0[0] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_realitykit_oneminus_vector4", inputs: [.vector4f], output: .vector4f) { ShaderGraphCoder.oneMinus($0[0] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_out_color4", inputs: [.color4f, .color4f, .float], output: .color4f) { ShaderGraphCoder.out(fg: $0[0] as! SGColor, bg: $0[1] as! SGColor, mix: $0[2] as! SGScalar) })
+    ops.append(BenchmarkOperation(nodeType: "ND_outside_color3", inputs: [.color3f, .float], output: .color3f) { ShaderGraphCoder.outside($0[0] as! SGColor, mask: $0[1] as! SGScalar) })
+    ops.append(BenchmarkOperation(nodeType: "ND_outside_color4", inputs: [.color4f, .float], output: .color4f) { ShaderGraphCoder.outside($0[0] as! SGColor, mask: $0[1] as! SGScalar) })
+    ops.append(BenchmarkOperation(nodeType: "ND_outside_float", inputs: [.float, .float], output: .float) { ShaderGraphCoder.outside($0[0] as! SGScalar, mask: $0[1] as! SGScalar) })
+    ops.append(BenchmarkOperation(nodeType: "ND_outside_half", inputs: [.half, .half], output: .half) { ShaderGraphCoder.outside($0[0] as! SGScalar, mask: $0[1] as! SGScalar) })
+    ops.append(BenchmarkOperation(nodeType: "ND_over_color4", inputs: [.color4f, .color4f, .float], output: .color4f) { ShaderGraphCoder.over(fg: $0[0] as! SGColor, bg: $0[1] as! SGColor, mix: $0[2] as! SGScalar) })
+    ops.append(BenchmarkOperation(nodeType: "ND_overlay_color3", inputs: [.color3f, .color3f, .float], output: .color3f) { ShaderGraphCoder.overlay(fg: $0[0] as! SGColor, bg: $0[1] as! SGColor, mix: $0[2] as! SGScalar) })
+    ops.append(BenchmarkOperation(nodeType: "ND_overlay_color4", inputs: [.color4f, .color4f, .float], output: .color4f) { ShaderGraphCoder.overlay(fg: $0[0] as! SGColor, bg: $0[1] as! SGColor, mix: $0[2] as! SGScalar) })
+    ops.append(BenchmarkOperation(nodeType: "ND_overlay_float", inputs: [.float, .float, .float], output: .float) { ShaderGraphCoder.overlay(fg: $0[0] as! SGScalar, bg: $0[1] as! SGScalar, mix: $0[2] as! SGScalar) })
+    ops.append(BenchmarkOperation(nodeType: "ND_overlay_half", inputs: [.half, .half, .half], output: .half) { ShaderGraphCoder.overlay(fg: $0[0] as! SGScalar, bg: $0[1] as! SGScalar, mix: $0[2] as! SGScalar) })
+    ops.append(BenchmarkOperation(nodeType: "ND_RealityKitTexture2DPixel_color3", inputs: [.asset, .int, .float, .float, .color3f, .vector2f, .float, .float, .vector2i], output: .color3f) { ShaderGraphCoder.pixel(file: $0[0] as! SGTexture, maxAnisotropy: $0[1] as! SGScalar, maxLodClamp: $0[2] as! SGScalar, minLodClamp: $0[3] as! SGScalar, defaultValue: $0[4] as! SGColor, texcoord: $0[5] as! SGVector, bias: $0[6] as! SGScalar, dynamicMinLodClamp: $0[7] as! SGScalar, offset: $0[8] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_RealityKitTexture2DPixel_color4", inputs: [.asset, .int, .float, .float, .color4f, .vector2f, .float, .float, .vector2i], output: .color4f) { ShaderGraphCoder.pixel(file: $0[0] as! SGTexture, maxAnisotropy: $0[1] as! SGScalar, maxLodClamp: $0[2] as! SGScalar, minLodClamp: $0[3] as! SGScalar, defaultValue: $0[4] as! SGColor, texcoord: $0[5] as! SGVector, bias: $0[6] as! SGScalar, dynamicMinLodClamp: $0[7] as! SGScalar, offset: $0[8] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_RealityKitTexture2DPixel_vector4", inputs: [.asset, .int, .float, .float, .vector4f, .vector2f, .float, .float, .vector2i], output: .vector4f) { ShaderGraphCoder.pixel(file: $0[0] as! SGTexture, maxAnisotropy: $0[1] as! SGScalar, maxLodClamp: $0[2] as! SGScalar, minLodClamp: $0[3] as! SGScalar, defaultValue: $0[4] as! SGVector, texcoord: $0[5] as! SGVector, bias: $0[6] as! SGScalar, dynamicMinLodClamp: $0[7] as! SGScalar, offset: $0[8] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_RealityKitTexture2DPixelGradient_color3", inputs: [.asset, .int, .float, .float, .color3f, .vector2f, .float, .vector2f, .vector2f, .vector2i], output: .color3f) { ShaderGraphCoder.pixelGradient(file: $0[0] as! SGTexture, maxAnisotropy: $0[1] as! SGScalar, maxLodClamp: $0[2] as! SGScalar, minLodClamp: $0[3] as! SGScalar, defaultValue: $0[4] as! SGColor, texcoord: $0[5] as! SGVector, dynamicMinLodClamp: $0[6] as! SGScalar, gradientDpdx: $0[7] as! SGVector, gradientDpdy: $0[8] as! SGVector, offset: $0[9] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_RealityKitTexture2DPixelGradient_color4", inputs: [.asset, .int, .float, .float, .color4f, .vector2f, .float, .vector2f, .vector2f, .vector2i], output: .color4f) { ShaderGraphCoder.pixelGradient(file: $0[0] as! SGTexture, maxAnisotropy: $0[1] as! SGScalar, maxLodClamp: $0[2] as! SGScalar, minLodClamp: $0[3] as! SGScalar, defaultValue: $0[4] as! SGColor, texcoord: $0[5] as! SGVector, dynamicMinLodClamp: $0[6] as! SGScalar, gradientDpdx: $0[7] as! SGVector, gradientDpdy: $0[8] as! SGVector, offset: $0[9] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_RealityKitTexture2DPixelGradient_vector4", inputs: [.asset, .int, .float, .float, .vector4f, .vector2f, .float, .vector2f, .vector2f, .vector2i], output: .vector4f) { ShaderGraphCoder.pixelGradient(file: $0[0] as! SGTexture, maxAnisotropy: $0[1] as! SGScalar, maxLodClamp: $0[2] as! SGScalar, minLodClamp: $0[3] as! SGScalar, defaultValue: $0[4] as! SGVector, texcoord: $0[5] as! SGVector, dynamicMinLodClamp: $0[6] as! SGScalar, gradientDpdx: $0[7] as! SGVector, gradientDpdy: $0[8] as! SGVector, offset: $0[9] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_RealityKitTexture2DPixelLOD_color3", inputs: [.asset, .int, .float, .float, .color3f, .vector2f, .float, .vector2i], output: .color3f) { ShaderGraphCoder.pixelLOD(file: $0[0] as! SGTexture, maxAnisotropy: $0[1] as! SGScalar, maxLodClamp: $0[2] as! SGScalar, minLodClamp: $0[3] as! SGScalar, defaultValue: $0[4] as! SGColor, texcoord: $0[5] as! SGVector, lod: $0[6] as! SGScalar, offset: $0[7] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_RealityKitTexture2DPixelLOD_color4", inputs: [.asset, .int, .float, .float, .color4f, .vector2f, .float, .vector2i], output: .color4f) { ShaderGraphCoder.pixelLOD(file: $0[0] as! SGTexture, maxAnisotropy: $0[1] as! SGScalar, maxLodClamp: $0[2] as! SGScalar, minLodClamp: $0[3] as! SGScalar, defaultValue: $0[4] as! SGColor, texcoord: $0[5] as! SGVector, lod: $0[6] as! SGScalar, offset: $0[7] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_RealityKitTexture2DPixelLOD_vector4", inputs: [.asset, .int, .float, .float, .vector4f, .vector2f, .float, .vector2i], output: .vector4f) { ShaderGraphCoder.pixelLOD(file: $0[0] as! SGTexture, maxAnisotropy: $0[1] as! SGScalar, maxLodClamp: $0[2] as! SGScalar, minLodClamp: $0[3] as! SGScalar, defaultValue: $0[4] as! SGVector, texcoord: $0[5] as! SGVector, lod: $0[6] as! SGScalar, offset: $0[7] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_place2d_vector2", inputs: [.vector2f, .vector2f, .vector2f, .float, .vector2f], output: .vector2f) { ShaderGraphCoder.place2D(texcoord: $0[0] as! SGVector, pivot: $0[1] as! SGVector, scale: $0[2] as! SGVector, rotate: $0[3] as! SGScalar, offset: $0[4] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_plus_color3", inputs: [.color3f, .color3f, .float], output: .color3f) { ShaderGraphCoder.plus(fg: $0[0] as! SGColor, bg: $0[1] as! SGColor, mix: $0[2] as! SGScalar) })
+    ops.append(BenchmarkOperation(nodeType: "ND_plus_color4", inputs: [.color4f, .color4f, .float], output: .color4f) { ShaderGraphCoder.plus(fg: $0[0] as! SGColor, bg: $0[1] as! SGColor, mix: $0[2] as! SGScalar) })
+    ops.append(BenchmarkOperation(nodeType: "ND_plus_float", inputs: [.float, .float, .float], output: .float) { ShaderGraphCoder.plus(fg: $0[0] as! SGScalar, bg: $0[1] as! SGScalar, mix: $0[2] as! SGScalar) })
+    ops.append(BenchmarkOperation(nodeType: "ND_plus_half", inputs: [.half, .half, .half], output: .half) { ShaderGraphCoder.plus(fg: $0[0] as! SGScalar, bg: $0[1] as! SGScalar, mix: $0[2] as! SGScalar) })
+    ops.append(BenchmarkOperation(nodeType: "ND_power_color3", inputs: [.color3f, .color3f], output: .color3f) { ShaderGraphCoder.pow($0[0] as! SGColor, $0[1] as! SGNumeric) })
+    ops.append(BenchmarkOperation(nodeType: "ND_power_color3FA", inputs: [.color3f, .float], output: .color3f) { ShaderGraphCoder.pow($0[0] as! SGColor, $0[1] as! SGNumeric) })
+    ops.append(BenchmarkOperation(nodeType: "ND_power_color4", inputs: [.color4f, .color4f], output: .color4f) { ShaderGraphCoder.pow($0[0] as! SGColor, $0[1] as! SGNumeric) })
+    ops.append(BenchmarkOperation(nodeType: "ND_power_color4FA", inputs: [.color4f, .float], output: .color4f) { ShaderGraphCoder.pow($0[0] as! SGColor, $0[1] as! SGNumeric) })
+    ops.append(BenchmarkOperation(nodeType: "ND_power_float", inputs: [.float, .float], output: .float) { ShaderGraphCoder.pow($0[0] as! SGScalar, $0[1] as! SGNumeric) })
+    ops.append(BenchmarkOperation(nodeType: "ND_power_half", inputs: [.half, .half], output: .half) { ShaderGraphCoder.pow($0[0] as! SGScalar, $0[1] as! SGNumeric) })
+    ops.append(BenchmarkOperation(nodeType: "ND_power_vector2", inputs: [.vector2f, .vector2f], output: .vector2f) { ShaderGraphCoder.pow($0[0] as! SGVector, $0[1] as! SGNumeric) })
+    ops.append(BenchmarkOperation(nodeType: "ND_power_vector2FA", inputs: [.vector2f, .float], output: .vector2f) { ShaderGraphCoder.pow($0[0] as! SGVector, $0[1] as! SGNumeric) })
+    ops.append(BenchmarkOperation(nodeType: "ND_power_vector3", inputs: [.vector3f, .vector3f], output: .vector3f) { ShaderGraphCoder.pow($0[0] as! SGVector, $0[1] as! SGNumeric) })
+    ops.append(BenchmarkOperation(nodeType: "ND_power_vector3FA", inputs: [.vector3f, .float], output: .vector3f) { ShaderGraphCoder.pow($0[0] as! SGVector, $0[1] as! SGNumeric) })
+    ops.append(BenchmarkOperation(nodeType: "ND_power_vector4", inputs: [.vector4f, .vector4f], output: .vector4f) { ShaderGraphCoder.pow($0[0] as! SGVector, $0[1] as! SGNumeric) })
+    ops.append(BenchmarkOperation(nodeType: "ND_power_vector4FA", inputs: [.vector4f, .float], output: .vector4f) { ShaderGraphCoder.pow($0[0] as! SGVector, $0[1] as! SGNumeric) })
+    ops.append(BenchmarkOperation(nodeType: "ND_premult_color4", inputs: [.color4f], output: .color4f) { ShaderGraphCoder.premult($0[0] as! SGColor) })
+    ops.append(BenchmarkOperation(nodeType: "ND_ramp4_color3", inputs: [.color3f, .color3f, .color3f, .color3f, .vector2f], output: .color3f) { ShaderGraphCoder.ramp4(valuetl: $0[0] as! SGColor, valuetr: $0[1] as! SGColor, valuebl: $0[2] as! SGColor, valuebr: $0[3] as! SGColor, texcoord: $0[4] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_ramp4_color4", inputs: [.color4f, .color4f, .color4f, .color4f, .vector2f], output: .color4f) { ShaderGraphCoder.ramp4(valuetl: $0[0] as! SGColor, valuetr: $0[1] as! SGColor, valuebl: $0[2] as! SGColor, valuebr: $0[3] as! SGColor, texcoord: $0[4] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_ramp4_float", inputs: [.float, .float, .float, .float, .vector2f], output: .float) { ShaderGraphCoder.ramp4(valuetl: $0[0] as! SGScalar, valuetr: $0[1] as! SGScalar, valuebl: $0[2] as! SGScalar, valuebr: $0[3] as! SGScalar, texcoord: $0[4] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_ramp4_vector2", inputs: [.vector2f, .vector2f, .vector2f, .vector2f, .vector2f], output: .vector2f) { ShaderGraphCoder.ramp4(valuetl: $0[0] as! SGVector, valuetr: $0[1] as! SGVector, valuebl: $0[2] as! SGVector, valuebr: $0[3] as! SGVector, texcoord: $0[4] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_ramp4_vector3", inputs: [.vector3f, .vector3f, .vector3f, .vector3f, .vector2f], output: .vector3f) { ShaderGraphCoder.ramp4(valuetl: $0[0] as! SGVector, valuetr: $0[1] as! SGVector, valuebl: $0[2] as! SGVector, valuebr: $0[3] as! SGVector, texcoord: $0[4] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_ramp4_vector4", inputs: [.vector4f, .vector4f, .vector4f, .vector4f, .vector2f], output: .vector4f) { ShaderGraphCoder.ramp4(valuetl: $0[0] as! SGVector, valuetr: $0[1] as! SGVector, valuebl: $0[2] as! SGVector, valuebr: $0[3] as! SGVector, texcoord: $0[4] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_ramplr_color3", inputs: [.color3f, .color3f, .vector2f], output: .color3f) { ShaderGraphCoder.ramplr(valuel: $0[0] as! SGColor, valuer: $0[1] as! SGColor, texcoord: $0[2] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_ramplr_color4", inputs: [.color4f, .color4f, .vector2f], output: .color4f) { ShaderGraphCoder.ramplr(valuel: $0[0] as! SGColor, valuer: $0[1] as! SGColor, texcoord: $0[2] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_ramplr_float", inputs: [.float, .float, .vector2f], output: .float) { ShaderGraphCoder.ramplr(valuel: $0[0] as! SGScalar, valuer: $0[1] as! SGScalar, texcoord: $0[2] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_ramplr_half", inputs: [.half, .half, .vector2f], output: .half) { ShaderGraphCoder.ramplr(valuel: $0[0] as! SGScalar, valuer: $0[1] as! SGScalar, texcoord: $0[2] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_ramplr_half2", inputs: [.vector2h, .vector2h, .vector2f], output: .vector2h) { ShaderGraphCoder.ramplr(valuel: $0[0] as! SGVector, valuer: $0[1] as! SGVector, texcoord: $0[2] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_ramplr_half3", inputs: [.vector3h, .vector3h, .vector2f], output: .vector3h) { ShaderGraphCoder.ramplr(valuel: $0[0] as! SGVector, valuer: $0[1] as! SGVector, texcoord: $0[2] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_ramplr_half4", inputs: [.vector4h, .vector4h, .vector2f], output: .vector4h) { ShaderGraphCoder.ramplr(valuel: $0[0] as! SGVector, valuer: $0[1] as! SGVector, texcoord: $0[2] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_ramplr_vector2", inputs: [.vector2f, .vector2f, .vector2f], output: .vector2f) { ShaderGraphCoder.ramplr(valuel: $0[0] as! SGVector, valuer: $0[1] as! SGVector, texcoord: $0[2] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_ramplr_vector3", inputs: [.vector3f, .vector3f, .vector2f], output: .vector3f) { ShaderGraphCoder.ramplr(valuel: $0[0] as! SGVector, valuer: $0[1] as! SGVector, texcoord: $0[2] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_ramplr_vector4", inputs: [.vector4f, .vector4f, .vector2f], output: .vector4f) { ShaderGraphCoder.ramplr(valuel: $0[0] as! SGVector, valuer: $0[1] as! SGVector, texcoord: $0[2] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_ramptb_color3", inputs: [.color3f, .color3f, .vector2f], output: .color3f) { ShaderGraphCoder.ramptb(valuet: $0[0] as! SGColor, valueb: $0[1] as! SGColor, texcoord: $0[2] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_ramptb_color4", inputs: [.color4f, .color4f, .vector2f], output: .color4f) { ShaderGraphCoder.ramptb(valuet: $0[0] as! SGColor, valueb: $0[1] as! SGColor, texcoord: $0[2] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_ramptb_float", inputs: [.float, .float, .vector2f], output: .float) { ShaderGraphCoder.ramptb(valuet: $0[0] as! SGScalar, valueb: $0[1] as! SGScalar, texcoord: $0[2] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_ramptb_half", inputs: [.half, .half, .vector2f], output: .half) { ShaderGraphCoder.ramptb(valuet: $0[0] as! SGScalar, valueb: $0[1] as! SGScalar, texcoord: $0[2] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_ramptb_half2", inputs: [.vector2h, .vector2h, .vector2f], output: .vector2h) { ShaderGraphCoder.ramptb(valuet: $0[0] as! SGVector, valueb: $0[1] as! SGVector, texcoord: $0[2] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_ramptb_half3", inputs: [.vector3h, .vector3h, .vector2f], output: .vector3h) { ShaderGraphCoder.ramptb(valuet: $0[0] as! SGVector, valueb: $0[1] as! SGVector, texcoord: $0[2] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_ramptb_half4", inputs: [.vector4h, .vector4h, .vector2f], output: .vector4h) { ShaderGraphCoder.ramptb(valuet: $0[0] as! SGVector, valueb: $0[1] as! SGVector, texcoord: $0[2] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_ramptb_vector2", inputs: [.vector2f, .vector2f, .vector2f], output: .vector2f) { ShaderGraphCoder.ramptb(valuet: $0[0] as! SGVector, valueb: $0[1] as! SGVector, texcoord: $0[2] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_ramptb_vector3", inputs: [.vector3f, .vector3f, .vector2f], output: .vector3f) { ShaderGraphCoder.ramptb(valuet: $0[0] as! SGVector, valueb: $0[1] as! SGVector, texcoord: $0[2] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_ramptb_vector4", inputs: [.vector4f, .vector4f, .vector2f], output: .vector4f) { ShaderGraphCoder.ramptb(valuet: $0[0] as! SGVector, valueb: $0[1] as! SGVector, texcoord: $0[2] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_range_color3", inputs: [.color3f, .color3f, .color3f, .color3f, .color3f, .color3f, .bool], output: .color3f) { ShaderGraphCoder.range($0[0] as! SGColor, inlow: $0[1] as! SGNumeric, inhigh: $0[2] as! SGNumeric, gamma: $0[3] as! SGNumeric, outlow: $0[4] as! SGNumeric, outhigh: $0[5] as! SGNumeric, doclamp: $0[6] as! SGValue) })
+    ops.append(BenchmarkOperation(nodeType: "ND_range_color3FA", inputs: [.color3f, .float, .float, .float, .float, .float, .bool], output: .color3f) { ShaderGraphCoder.range($0[0] as! SGColor, inlow: $0[1] as! SGNumeric, inhigh: $0[2] as! SGNumeric, gamma: $0[3] as! SGNumeric, outlow: $0[4] as! SGNumeric, outhigh: $0[5] as! SGNumeric, doclamp: $0[6] as! SGValue) })
+    ops.append(BenchmarkOperation(nodeType: "ND_range_color4", inputs: [.color4f, .color4f, .color4f, .color4f, .color4f, .color4f, .bool], output: .color4f) { ShaderGraphCoder.range($0[0] as! SGColor, inlow: $0[1] as! SGNumeric, inhigh: $0[2] as! SGNumeric, gamma: $0[3] as! SGNumeric, outlow: $0[4] as! SGNumeric, outhigh: $0[5] as! SGNumeric, doclamp: $0[6] as! SGValue) })
+    ops.append(BenchmarkOperation(nodeType: "ND_range_color4FA", inputs: [.color4f, .float, .float, .float, .float, .float, .bool], output: .color4f) { ShaderGraphCoder.range($0[0] as! SGColor, inlow: $0[1] as! SGNumeric, inhigh: $0[2] as! SGNumeric, gamma: $0[3] as! SGNumeric, outlow: $0[4] as! SGNumeric, outhigh: $0[5] as! SGNumeric, doclamp: $0[6] as! SGValue) })
+    ops.append(BenchmarkOperation(nodeType: "ND_range_float", inputs: [.float, .float, .float, .float, .float, .float, .bool], output: .float) { ShaderGraphCoder.range($0[0] as! SGScalar, inlow: $0[1] as! SGNumeric, inhigh: $0[2] as! SGNumeric, gamma: $0[3] as! SGNumeric, outlow: $0[4] as! SGNumeric, outhigh: $0[5] as! SGNumeric, doclamp: $0[6] as! SGValue) })
+    ops.append(BenchmarkOperation(nodeType: "ND_range_vector2", inputs: [.vector2f, .vector2f, .vector2f, .vector2f, .vector2f, .vector2f, .bool], output: .vector2f) { ShaderGraphCoder.range($0[0] as! SGVector, inlow: $0[1] as! SGNumeric, inhigh: $0[2] as! SGNumeric, gamma: $0[3] as! SGNumeric, outlow: $0[4] as! SGNumeric, outhigh: $0[5] as! SGNumeric, doclamp: $0[6] as! SGValue) })
+    ops.append(BenchmarkOperation(nodeType: "ND_range_vector2FA", inputs: [.vector2f, .float, .float, .float, .float, .float, .bool], output: .vector2f) { ShaderGraphCoder.range($0[0] as! SGVector, inlow: $0[1] as! SGNumeric, inhigh: $0[2] as! SGNumeric, gamma: $0[3] as! SGNumeric, outlow: $0[4] as! SGNumeric, outhigh: $0[5] as! SGNumeric, doclamp: $0[6] as! SGValue) })
+    ops.append(BenchmarkOperation(nodeType: "ND_range_vector3", inputs: [.vector3f, .vector3f, .vector3f, .vector3f, .vector3f, .vector3f, .bool], output: .vector3f) { ShaderGraphCoder.range($0[0] as! SGVector, inlow: $0[1] as! SGNumeric, inhigh: $0[2] as! SGNumeric, gamma: $0[3] as! SGNumeric, outlow: $0[4] as! SGNumeric, outhigh: $0[5] as! SGNumeric, doclamp: $0[6] as! SGValue) })
+    ops.append(BenchmarkOperation(nodeType: "ND_range_vector3FA", inputs: [.vector3f, .float, .float, .float, .float, .float, .bool], output: .vector3f) { ShaderGraphCoder.range($0[0] as! SGVector, inlow: $0[1] as! SGNumeric, inhigh: $0[2] as! SGNumeric, gamma: $0[3] as! SGNumeric, outlow: $0[4] as! SGNumeric, outhigh: $0[5] as! SGNumeric, doclamp: $0[6] as! SGValue) })
+    ops.append(BenchmarkOperation(nodeType: "ND_range_vector4", inputs: [.vector4f, .vector4f, .vector4f, .vector4f, .vector4f, .vector4f, .bool], output: .vector4f) { ShaderGraphCoder.range($0[0] as! SGVector, inlow: $0[1] as! SGNumeric, inhigh: $0[2] as! SGNumeric, gamma: $0[3] as! SGNumeric, outlow: $0[4] as! SGNumeric, outhigh: $0[5] as! SGNumeric, doclamp: $0[6] as! SGValue) })
+    ops.append(BenchmarkOperation(nodeType: "ND_range_vector4FA", inputs: [.vector4f, .float, .float, .float, .float, .float, .bool], output: .vector4f) { ShaderGraphCoder.range($0[0] as! SGVector, inlow: $0[1] as! SGNumeric, inhigh: $0[2] as! SGNumeric, gamma: $0[3] as! SGNumeric, outlow: $0[4] as! SGNumeric, outhigh: $0[5] as! SGNumeric, doclamp: $0[6] as! SGValue) })
+    ops.append(BenchmarkOperation(nodeType: "ND_RealityKitTextureRead_color4", inputs: [.asset, .color4f, .int, .int, .int], output: .color4f) { ShaderGraphCoder.read(file: $0[0] as! SGTexture, defaultValue: $0[1] as! SGColor, x: $0[2] as! SGScalar, y: $0[3] as! SGScalar, lod: $0[4] as! SGScalar) })
+    ops.append(BenchmarkOperation(nodeType: "ND_RealityKitTextureRead_vector4", inputs: [.asset, .vector4f, .int, .int, .int], output: .vector4f) { ShaderGraphCoder.read(file: $0[0] as! SGTexture, defaultValue: $0[1] as! SGVector, x: $0[2] as! SGScalar, y: $0[3] as! SGScalar, lod: $0[4] as! SGScalar) })
+    ops.append(BenchmarkOperation(nodeType: "ND_realitykit_reflect_vector3", inputs: [.vector3f, .vector3f], output: .vector3f) { ShaderGraphCoder.reflect($0[0] as! SGVector, normal: $0[1] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_realitykit_refract_vector3", inputs: [.vector3f, .vector3f, .float], output: .vector3f) { ShaderGraphCoder.refract($0[0] as! SGVector, normal: $0[1] as! SGVector, eta: $0[2] as! SGScalar) })
+    ops.append(BenchmarkOperation(nodeType: "ND_remap_color3", inputs: [.color3f, .color3f, .color3f, .color3f, .color3f], output: .color3f) { ShaderGraphCoder.remap($0[0] as! SGColor, inlow: $0[1] as! SGNumeric, inhigh: $0[2] as! SGNumeric, outlow: $0[3] as! SGNumeric, outhigh: $0[4] as! SGNumeric) })
+    ops.append(BenchmarkOperation(nodeType: "ND_remap_color3FA", inputs: [.color3f, .float, .float, .float, .float], output: .color3f) { ShaderGraphCoder.remap($0[0] as! SGColor, inlow: $0[1] as! SGNumeric, inhigh: $0[2] as! SGNumeric, outlow: $0[3] as! SGNumeric, outhigh: $0[4] as! SGNumeric) })
+    ops.append(BenchmarkOperation(nodeType: "ND_remap_color4", inputs: [.color4f, .color4f, .color4f, .color4f, .color4f], output: .color4f) { ShaderGraphCoder.remap($0[0] as! SGColor, inlow: $0[1] as! SGNumeric, inhigh: $0[2] as! SGNumeric, outlow: $0[3] as! SGNumeric, outhigh: $0[4] as! SGNumeric) })
+    ops.append(BenchmarkOperation(nodeType: "ND_remap_color4FA", inputs: [.color4f, .float, .float, .float, .float], output: .color4f) { ShaderGraphCoder.remap($0[0] as! SGColor, inlow: $0[1] as! SGNumeric, inhigh: $0[2] as! SGNumeric, outlow: $0[3] as! SGNumeric, outhigh: $0[4] as! SGNumeric) })
+    ops.append(BenchmarkOperation(nodeType: "ND_remap_float", inputs: [.float, .float, .float, .float, .float], output: .float) { ShaderGraphCoder.remap($0[0] as! SGScalar, inlow: $0[1] as! SGNumeric, inhigh: $0[2] as! SGNumeric, outlow: $0[3] as! SGNumeric, outhigh: $0[4] as! SGNumeric) })
+    ops.append(BenchmarkOperation(nodeType: "ND_remap_half", inputs: [.half, .half, .half, .half, .half], output: .half) { ShaderGraphCoder.remap($0[0] as! SGScalar, inlow: $0[1] as! SGNumeric, inhigh: $0[2] as! SGNumeric, outlow: $0[3] as! SGNumeric, outhigh: $0[4] as! SGNumeric) })
+    ops.append(BenchmarkOperation(nodeType: "ND_remap_half2", inputs: [.vector2h, .vector2h, .vector2h, .vector2h, .vector2h], output: .vector2h) { ShaderGraphCoder.remap($0[0] as! SGVector, inlow: $0[1] as! SGNumeric, inhigh: $0[2] as! SGNumeric, outlow: $0[3] as! SGNumeric, outhigh: $0[4] as! SGNumeric) })
+    ops.append(BenchmarkOperation(nodeType: "ND_remap_half2FA", inputs: [.vector2h, .float, .float, .float, .float], output: .vector2h) { ShaderGraphCoder.remap($0[0] as! SGVector, inlow: $0[1] as! SGNumeric, inhigh: $0[2] as! SGNumeric, outlow: $0[3] as! SGNumeric, outhigh: $0[4] as! SGNumeric) })
+    ops.append(BenchmarkOperation(nodeType: "ND_remap_half3", inputs: [.vector3h, .vector3h, .vector3h, .vector3h, .vector3h], output: .vector3h) { ShaderGraphCoder.remap($0[0] as! SGVector, inlow: $0[1] as! SGNumeric, inhigh: $0[2] as! SGNumeric, outlow: $0[3] as! SGNumeric, outhigh: $0[4] as! SGNumeric) })
+    ops.append(BenchmarkOperation(nodeType: "ND_remap_half3FA", inputs: [.vector3h, .float, .float, .float, .float], output: .vector3h) { ShaderGraphCoder.remap($0[0] as! SGVector, inlow: $0[1] as! SGNumeric, inhigh: $0[2] as! SGNumeric, outlow: $0[3] as! SGNumeric, outhigh: $0[4] as! SGNumeric) })
+    ops.append(BenchmarkOperation(nodeType: "ND_remap_half4", inputs: [.vector4h, .vector4h, .vector4h, .vector4h, .vector4h], output: .vector4h) { ShaderGraphCoder.remap($0[0] as! SGVector, inlow: $0[1] as! SGNumeric, inhigh: $0[2] as! SGNumeric, outlow: $0[3] as! SGNumeric, outhigh: $0[4] as! SGNumeric) })
+    ops.append(BenchmarkOperation(nodeType: "ND_remap_half4FA", inputs: [.vector4h, .float, .float, .float, .float], output: .vector4h) { ShaderGraphCoder.remap($0[0] as! SGVector, inlow: $0[1] as! SGNumeric, inhigh: $0[2] as! SGNumeric, outlow: $0[3] as! SGNumeric, outhigh: $0[4] as! SGNumeric) })
+    ops.append(BenchmarkOperation(nodeType: "ND_remap_vector2", inputs: [.vector2f, .vector2f, .vector2f, .vector2f, .vector2f], output: .vector2f) { ShaderGraphCoder.remap($0[0] as! SGVector, inlow: $0[1] as! SGNumeric, inhigh: $0[2] as! SGNumeric, outlow: $0[3] as! SGNumeric, outhigh: $0[4] as! SGNumeric) })
+    ops.append(BenchmarkOperation(nodeType: "ND_remap_vector2FA", inputs: [.vector2f, .float, .float, .float, .float], output: .vector2f) { ShaderGraphCoder.remap($0[0] as! SGVector, inlow: $0[1] as! SGNumeric, inhigh: $0[2] as! SGNumeric, outlow: $0[3] as! SGNumeric, outhigh: $0[4] as! SGNumeric) })
+    ops.append(BenchmarkOperation(nodeType: "ND_remap_vector3", inputs: [.vector3f, .vector3f, .vector3f, .vector3f, .vector3f], output: .vector3f) { ShaderGraphCoder.remap($0[0] as! SGVector, inlow: $0[1] as! SGNumeric, inhigh: $0[2] as! SGNumeric, outlow: $0[3] as! SGNumeric, outhigh: $0[4] as! SGNumeric) })
+    ops.append(BenchmarkOperation(nodeType: "ND_remap_vector3FA", inputs: [.vector3f, .float, .float, .float, .float], output: .vector3f) { ShaderGraphCoder.remap($0[0] as! SGVector, inlow: $0[1] as! SGNumeric, inhigh: $0[2] as! SGNumeric, outlow: $0[3] as! SGNumeric, outhigh: $0[4] as! SGNumeric) })
+    ops.append(BenchmarkOperation(nodeType: "ND_remap_vector4", inputs: [.vector4f, .vector4f, .vector4f, .vector4f, .vector4f], output: .vector4f) { ShaderGraphCoder.remap($0[0] as! SGVector, inlow: $0[1] as! SGNumeric, inhigh: $0[2] as! SGNumeric, outlow: $0[3] as! SGNumeric, outhigh: $0[4] as! SGNumeric) })
+    ops.append(BenchmarkOperation(nodeType: "ND_remap_vector4FA", inputs: [.vector4f, .float, .float, .float, .float], output: .vector4f) { ShaderGraphCoder.remap($0[0] as! SGVector, inlow: $0[1] as! SGNumeric, inhigh: $0[2] as! SGNumeric, outlow: $0[3] as! SGNumeric, outhigh: $0[4] as! SGNumeric) })
+    ops.append(BenchmarkOperation(nodeType: "ND_rgbtohsv_color3", inputs: [.color3f], output: .color3f) { ShaderGraphCoder.rgbToHSV($0[0] as! SGColor) })
+    ops.append(BenchmarkOperation(nodeType: "ND_rgbtohsv_color4", inputs: [.color4f], output: .color4f) { ShaderGraphCoder.rgbToHSV($0[0] as! SGColor) })
+    ops.append(BenchmarkOperation(nodeType: "ND_rotate2d_vector2", inputs: [.vector2f, .float], output: .vector2f) { ShaderGraphCoder.rotate2D($0[0] as! SGVector, amount: $0[1] as! SGScalar) })
+    ops.append(BenchmarkOperation(nodeType: "ND_rotate3d_vector3", inputs: [.vector3f, .float, .vector3f], output: .vector3f) { ShaderGraphCoder.rotate3D($0[0] as! SGVector, amount: $0[1] as! SGScalar, axis: $0[2] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_round_color3", inputs: [.color3f], output: .color3f) { ShaderGraphCoder.round($0[0] as! SGColor) })
+    ops.append(BenchmarkOperation(nodeType: "ND_round_color4", inputs: [.color4f], output: .color4f) { ShaderGraphCoder.round($0[0] as! SGColor) })
+    ops.append(BenchmarkOperation(nodeType: "ND_round_float", inputs: [.float], output: .float) { ShaderGraphCoder.round($0[0] as! SGScalar) })
+    ops.append(BenchmarkOperation(nodeType: "ND_round_half", inputs: [.half], output: .half) { ShaderGraphCoder.round($0[0] as! SGScalar) })
+    ops.append(BenchmarkOperation(nodeType: "ND_round_vector2", inputs: [.vector2f], output: .vector2f) { ShaderGraphCoder.round($0[0] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_round_vector3", inputs: [.vector3f], output: .vector3f) { ShaderGraphCoder.round($0[0] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_round_vector4", inputs: [.vector4f], output: .vector4f) { ShaderGraphCoder.round($0[0] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_safepower_color3", inputs: [.color3f, .color3f], output: .color3f) { ShaderGraphCoder.safePow($0[0] as! SGColor, $0[1] as! SGNumeric) })
+    ops.append(BenchmarkOperation(nodeType: "ND_safepower_color3FA", inputs: [.color3f, .float], output: .color3f) { ShaderGraphCoder.safePow($0[0] as! SGColor, $0[1] as! SGNumeric) })
+    ops.append(BenchmarkOperation(nodeType: "ND_safepower_color4", inputs: [.color4f, .color4f], output: .color4f) { ShaderGraphCoder.safePow($0[0] as! SGColor, $0[1] as! SGNumeric) })
+    ops.append(BenchmarkOperation(nodeType: "ND_safepower_color4FA", inputs: [.color4f, .float], output: .color4f) { ShaderGraphCoder.safePow($0[0] as! SGColor, $0[1] as! SGNumeric) })
+    ops.append(BenchmarkOperation(nodeType: "ND_safepower_float", inputs: [.float, .float], output: .float) { ShaderGraphCoder.safePow($0[0] as! SGScalar, $0[1] as! SGNumeric) })
+    ops.append(BenchmarkOperation(nodeType: "ND_safepower_half", inputs: [.half, .half], output: .half) { ShaderGraphCoder.safePow($0[0] as! SGScalar, $0[1] as! SGNumeric) })
+    ops.append(BenchmarkOperation(nodeType: "ND_safepower_vector2", inputs: [.vector2f, .vector2f], output: .vector2f) { ShaderGraphCoder.safePow($0[0] as! SGVector, $0[1] as! SGNumeric) })
+    ops.append(BenchmarkOperation(nodeType: "ND_safepower_vector2FA", inputs: [.vector2f, .float], output: .vector2f) { ShaderGraphCoder.safePow($0[0] as! SGVector, $0[1] as! SGNumeric) })
+    ops.append(BenchmarkOperation(nodeType: "ND_safepower_vector3", inputs: [.vector3f, .vector3f], output: .vector3f) { ShaderGraphCoder.safePow($0[0] as! SGVector, $0[1] as! SGNumeric) })
+    ops.append(BenchmarkOperation(nodeType: "ND_safepower_vector3FA", inputs: [.vector3f, .float], output: .vector3f) { ShaderGraphCoder.safePow($0[0] as! SGVector, $0[1] as! SGNumeric) })
+    ops.append(BenchmarkOperation(nodeType: "ND_safepower_vector4", inputs: [.vector4f, .vector4f], output: .vector4f) { ShaderGraphCoder.safePow($0[0] as! SGVector, $0[1] as! SGNumeric) })
+    ops.append(BenchmarkOperation(nodeType: "ND_safepower_vector4FA", inputs: [.vector4f, .float], output: .vector4f) { ShaderGraphCoder.safePow($0[0] as! SGVector, $0[1] as! SGNumeric) })
+    ops.append(BenchmarkOperation(nodeType: "ND_RealityKitTexture2D_color3", inputs: [.asset, .int, .float, .float, .color3f, .vector2f, .float, .float, .vector2i], output: .color3f) { ShaderGraphCoder.sample(file: $0[0] as! SGTexture, maxAnisotropy: $0[1] as! SGScalar, maxLodClamp: $0[2] as! SGScalar, minLodClamp: $0[3] as! SGScalar, defaultValue: $0[4] as! SGColor, texcoord: $0[5] as! SGVector, bias: $0[6] as! SGScalar, dynamicMinLodClamp: $0[7] as! SGScalar, offset: $0[8] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_RealityKitTexture2D_color4", inputs: [.asset, .int, .float, .float, .color4f, .vector2f, .float, .float, .vector2i], output: .color4f) { ShaderGraphCoder.sample(file: $0[0] as! SGTexture, maxAnisotropy: $0[1] as! SGScalar, maxLodClamp: $0[2] as! SGScalar, minLodClamp: $0[3] as! SGScalar, defaultValue: $0[4] as! SGColor, texcoord: $0[5] as! SGVector, bias: $0[6] as! SGScalar, dynamicMinLodClamp: $0[7] as! SGScalar, offset: $0[8] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_RealityKitTexture2D_vector4", inputs: [.asset, .int, .float, .float, .vector4f, .vector2f, .float, .float, .vector2i], output: .vector4f) { ShaderGraphCoder.sample(file: $0[0] as! SGTexture, maxAnisotropy: $0[1] as! SGScalar, maxLodClamp: $0[2] as! SGScalar, minLodClamp: $0[3] as! SGScalar, defaultValue: $0[4] as! SGVector, texcoord: $0[5] as! SGVector, bias: $0[6] as! SGScalar, dynamicMinLodClamp: $0[7] as! SGScalar, offset: $0[8] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_RealityKitTextureCube_color4", inputs: [.asset, .int, .float, .float, .color4f, .vector3f, .float, .float], output: .color4f) { ShaderGraphCoder.sampleCube(file: $0[0] as! SGTexture, maxAnisotropy: $0[1] as! SGScalar, maxLodClamp: $0[2] as! SGScalar, minLodClamp: $0[3] as! SGScalar, defaultValue: $0[4] as! SGColor, texcoord: $0[5] as! SGVector, bias: $0[6] as! SGScalar, dynamicMinLodClamp: $0[7] as! SGScalar) })
+    ops.append(BenchmarkOperation(nodeType: "ND_RealityKitTextureCube_vector4", inputs: [.asset, .int, .float, .float, .vector4f, .vector3f, .float, .float], output: .vector4f) { ShaderGraphCoder.sampleCube(file: $0[0] as! SGTexture, maxAnisotropy: $0[1] as! SGScalar, maxLodClamp: $0[2] as! SGScalar, minLodClamp: $0[3] as! SGScalar, defaultValue: $0[4] as! SGVector, texcoord: $0[5] as! SGVector, bias: $0[6] as! SGScalar, dynamicMinLodClamp: $0[7] as! SGScalar) })
+    ops.append(BenchmarkOperation(nodeType: "ND_RealityKitTextureCubeGradient_color4", inputs: [.asset, .int, .float, .float, .color4f, .vector3f, .float, .vector3f, .vector3f], output: .color4f) { ShaderGraphCoder.sampleCubeGradient(file: $0[0] as! SGTexture, maxAnisotropy: $0[1] as! SGScalar, maxLodClamp: $0[2] as! SGScalar, minLodClamp: $0[3] as! SGScalar, defaultValue: $0[4] as! SGColor, texcoord: $0[5] as! SGVector, dynamicMinLodClamp: $0[6] as! SGScalar, gradientcubeDpdx: $0[7] as! SGVector, gradientcubeDpdy: $0[8] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_RealityKitTextureCubeGradient_vector4", inputs: [.asset, .int, .float, .float, .vector4f, .vector3f, .float, .vector3f, .vector3f], output: .vector4f) { ShaderGraphCoder.sampleCubeGradient(file: $0[0] as! SGTexture, maxAnisotropy: $0[1] as! SGScalar, maxLodClamp: $0[2] as! SGScalar, minLodClamp: $0[3] as! SGScalar, defaultValue: $0[4] as! SGVector, texcoord: $0[5] as! SGVector, dynamicMinLodClamp: $0[6] as! SGScalar, gradientcubeDpdx: $0[7] as! SGVector, gradientcubeDpdy: $0[8] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_RealityKitTextureCubeLOD_color4", inputs: [.asset, .int, .float, .float, .color4f, .vector3f, .float], output: .color4f) { ShaderGraphCoder.sampleCubeLOD(file: $0[0] as! SGTexture, maxAnisotropy: $0[1] as! SGScalar, maxLodClamp: $0[2] as! SGScalar, minLodClamp: $0[3] as! SGScalar, defaultValue: $0[4] as! SGColor, texcoord: $0[5] as! SGVector, lod: $0[6] as! SGScalar) })
+    ops.append(BenchmarkOperation(nodeType: "ND_RealityKitTextureCubeLOD_vector4", inputs: [.asset, .int, .float, .float, .vector4f, .vector3f, .float], output: .vector4f) { ShaderGraphCoder.sampleCubeLOD(file: $0[0] as! SGTexture, maxAnisotropy: $0[1] as! SGScalar, maxLodClamp: $0[2] as! SGScalar, minLodClamp: $0[3] as! SGScalar, defaultValue: $0[4] as! SGVector, texcoord: $0[5] as! SGVector, lod: $0[6] as! SGScalar) })
+    ops.append(BenchmarkOperation(nodeType: "ND_RealityKitTexture2DGradient_color3", inputs: [.asset, .int, .float, .float, .color3f, .vector2f, .float, .vector2f, .vector2f, .vector2i], output: .color3f) { ShaderGraphCoder.sampleGradient(file: $0[0] as! SGTexture, maxAnisotropy: $0[1] as! SGScalar, maxLodClamp: $0[2] as! SGScalar, minLodClamp: $0[3] as! SGScalar, defaultValue: $0[4] as! SGColor, texcoord: $0[5] as! SGVector, dynamicMinLodClamp: $0[6] as! SGScalar, gradientDpdx: $0[7] as! SGVector, gradientDpdy: $0[8] as! SGVector, offset: $0[9] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_RealityKitTexture2DGradient_color4", inputs: [.asset, .int, .float, .float, .color4f, .vector2f, .float, .vector2f, .vector2f, .vector2i], output: .color4f) { ShaderGraphCoder.sampleGradient(file: $0[0] as! SGTexture, maxAnisotropy: $0[1] as! SGScalar, maxLodClamp: $0[2] as! SGScalar, minLodClamp: $0[3] as! SGScalar, defaultValue: $0[4] as! SGColor, texcoord: $0[5] as! SGVector, dynamicMinLodClamp: $0[6] as! SGScalar, gradientDpdx: $0[7] as! SGVector, gradientDpdy: $0[8] as! SGVector, offset: $0[9] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_RealityKitTexture2DGradient_vector4", inputs: [.asset, .int, .float, .float, .vector4f, .vector2f, .float, .vector2f, .vector2f, .vector2i], output: .vector4f) { ShaderGraphCoder.sampleGradient(file: $0[0] as! SGTexture, maxAnisotropy: $0[1] as! SGScalar, maxLodClamp: $0[2] as! SGScalar, minLodClamp: $0[3] as! SGScalar, defaultValue: $0[4] as! SGVector, texcoord: $0[5] as! SGVector, dynamicMinLodClamp: $0[6] as! SGScalar, gradientDpdx: $0[7] as! SGVector, gradientDpdy: $0[8] as! SGVector, offset: $0[9] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_RealityKitTexture2DLOD_color3", inputs: [.asset, .int, .float, .float, .color3f, .vector2f, .float, .vector2i], output: .color3f) { ShaderGraphCoder.sampleLOD(file: $0[0] as! SGTexture, maxAnisotropy: $0[1] as! SGScalar, maxLodClamp: $0[2] as! SGScalar, minLodClamp: $0[3] as! SGScalar, defaultValue: $0[4] as! SGColor, texcoord: $0[5] as! SGVector, lod: $0[6] as! SGScalar, offset: $0[7] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_RealityKitTexture2DLOD_color4", inputs: [.asset, .int, .float, .float, .color4f, .vector2f, .float, .vector2i], output: .color4f) { ShaderGraphCoder.sampleLOD(file: $0[0] as! SGTexture, maxAnisotropy: $0[1] as! SGScalar, maxLodClamp: $0[2] as! SGScalar, minLodClamp: $0[3] as! SGScalar, defaultValue: $0[4] as! SGColor, texcoord: $0[5] as! SGVector, lod: $0[6] as! SGScalar, offset: $0[7] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_RealityKitTexture2DLOD_vector4", inputs: [.asset, .int, .float, .float, .vector4f, .vector2f, .float, .vector2i], output: .vector4f) { ShaderGraphCoder.sampleLOD(file: $0[0] as! SGTexture, maxAnisotropy: $0[1] as! SGScalar, maxLodClamp: $0[2] as! SGScalar, minLodClamp: $0[3] as! SGScalar, defaultValue: $0[4] as! SGVector, texcoord: $0[5] as! SGVector, lod: $0[6] as! SGScalar, offset: $0[7] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_saturate_color3", inputs: [.color3f, .float, .color3f], output: .color3f) { ShaderGraphCoder.saturate($0[0] as! SGColor, amount: $0[1] as! SGScalar, lumacoeffs: $0[2] as! SGColor) })
+    ops.append(BenchmarkOperation(nodeType: "ND_saturate_color4", inputs: [.color4f, .float, .color3f], output: .color4f) { ShaderGraphCoder.saturate($0[0] as! SGColor, amount: $0[1] as! SGScalar, lumacoeffs: $0[2] as! SGColor) })
+    ops.append(BenchmarkOperation(nodeType: "ND_screen_color3", inputs: [.color3f, .color3f, .float], output: .color3f) { ShaderGraphCoder.screen(fg: $0[0] as! SGColor, bg: $0[1] as! SGColor, mix: $0[2] as! SGScalar) })
+    ops.append(BenchmarkOperation(nodeType: "ND_screen_color4", inputs: [.color4f, .color4f, .float], output: .color4f) { ShaderGraphCoder.screen(fg: $0[0] as! SGColor, bg: $0[1] as! SGColor, mix: $0[2] as! SGScalar) })
+    ops.append(BenchmarkOperation(nodeType: "ND_screen_float", inputs: [.float, .float, .float], output: .float) { ShaderGraphCoder.screen(fg: $0[0] as! SGScalar, bg: $0[1] as! SGScalar, mix: $0[2] as! SGScalar) })
+    ops.append(BenchmarkOperation(nodeType: "ND_screen_half", inputs: [.half, .half, .half], output: .half) { ShaderGraphCoder.screen(fg: $0[0] as! SGScalar, bg: $0[1] as! SGScalar, mix: $0[2] as! SGScalar) })
+    ops.append(BenchmarkOperation(nodeType: "ND_sign_color3", inputs: [.color3f], output: .color3f) { ShaderGraphCoder.sign($0[0] as! SGColor) })
+    ops.append(BenchmarkOperation(nodeType: "ND_sign_color4", inputs: [.color4f], output: .color4f) { ShaderGraphCoder.sign($0[0] as! SGColor) })
+    ops.append(BenchmarkOperation(nodeType: "ND_sign_float", inputs: [.float], output: .float) { ShaderGraphCoder.sign($0[0] as! SGScalar) })
+    ops.append(BenchmarkOperation(nodeType: "ND_sign_half", inputs: [.half], output: .half) { ShaderGraphCoder.sign($0[0] as! SGScalar) })
+    ops.append(BenchmarkOperation(nodeType: "ND_sign_half2", inputs: [.vector2h], output: .vector2h) { ShaderGraphCoder.sign($0[0] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_sign_half3", inputs: [.vector3h], output: .vector3h) { ShaderGraphCoder.sign($0[0] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_sign_half4", inputs: [.vector4h], output: .vector4h) { ShaderGraphCoder.sign($0[0] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_sign_vector2", inputs: [.vector2f], output: .vector2f) { ShaderGraphCoder.sign($0[0] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_sign_vector3", inputs: [.vector3f], output: .vector3f) { ShaderGraphCoder.sign($0[0] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_sign_vector4", inputs: [.vector4f], output: .vector4f) { ShaderGraphCoder.sign($0[0] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_sin_float", inputs: [.float], output: .float) { ShaderGraphCoder.sin($0[0] as! SGScalar) })
+    ops.append(BenchmarkOperation(nodeType: "ND_sin_half", inputs: [.half], output: .half) { ShaderGraphCoder.sin($0[0] as! SGScalar) })
+    ops.append(BenchmarkOperation(nodeType: "ND_sin_half2", inputs: [.vector2h], output: .vector2h) { ShaderGraphCoder.sin($0[0] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_sin_half3", inputs: [.vector3h], output: .vector3h) { ShaderGraphCoder.sin($0[0] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_sin_half4", inputs: [.vector4h], output: .vector4h) { ShaderGraphCoder.sin($0[0] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_sin_vector2", inputs: [.vector2f], output: .vector2f) { ShaderGraphCoder.sin($0[0] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_sin_vector3", inputs: [.vector3f], output: .vector3f) { ShaderGraphCoder.sin($0[0] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_sin_vector4", inputs: [.vector4f], output: .vector4f) { ShaderGraphCoder.sin($0[0] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_smoothstep_color3", inputs: [.color3f, .color3f, .color3f], output: .color3f) { ShaderGraphCoder.smoothStep($0[0] as! SGColor, low: $0[1] as! SGNumeric, high: $0[2] as! SGNumeric) })
+    ops.append(BenchmarkOperation(nodeType: "ND_smoothstep_color3FA", inputs: [.color3f, .float, .float], output: .color3f) { ShaderGraphCoder.smoothStep($0[0] as! SGColor, low: $0[1] as! SGNumeric, high: $0[2] as! SGNumeric) })
+    ops.append(BenchmarkOperation(nodeType: "ND_smoothstep_color4", inputs: [.color4f, .color4f, .color4f], output: .color4f) { ShaderGraphCoder.smoothStep($0[0] as! SGColor, low: $0[1] as! SGNumeric, high: $0[2] as! SGNumeric) })
+    ops.append(BenchmarkOperation(nodeType: "ND_smoothstep_color4FA", inputs: [.color4f, .float, .float], output: .color4f) { ShaderGraphCoder.smoothStep($0[0] as! SGColor, low: $0[1] as! SGNumeric, high: $0[2] as! SGNumeric) })
+    ops.append(BenchmarkOperation(nodeType: "ND_smoothstep_float", inputs: [.float, .float, .float], output: .float) { ShaderGraphCoder.smoothStep($0[0] as! SGScalar, low: $0[1] as! SGNumeric, high: $0[2] as! SGNumeric) })
+    ops.append(BenchmarkOperation(nodeType: "ND_smoothstep_half", inputs: [.half, .half, .half], output: .half) { ShaderGraphCoder.smoothStep($0[0] as! SGScalar, low: $0[1] as! SGNumeric, high: $0[2] as! SGNumeric) })
+    ops.append(BenchmarkOperation(nodeType: "ND_smoothstep_half2", inputs: [.vector2h, .vector2h, .vector2h], output: .vector2h) { ShaderGraphCoder.smoothStep($0[0] as! SGVector, low: $0[1] as! SGNumeric, high: $0[2] as! SGNumeric) })
+    ops.append(BenchmarkOperation(nodeType: "ND_smoothstep_half2FA", inputs: [.vector2h, .float, .float], output: .vector2h) { ShaderGraphCoder.smoothStep($0[0] as! SGVector, low: $0[1] as! SGNumeric, high: $0[2] as! SGNumeric) })
+    ops.append(BenchmarkOperation(nodeType: "ND_smoothstep_half3", inputs: [.vector3h, .vector3h, .vector3h], output: .vector3h) { ShaderGraphCoder.smoothStep($0[0] as! SGVector, low: $0[1] as! SGNumeric, high: $0[2] as! SGNumeric) })
+    ops.append(BenchmarkOperation(nodeType: "ND_smoothstep_half3FA", inputs: [.vector3h, .float, .float], output: .vector3h) { ShaderGraphCoder.smoothStep($0[0] as! SGVector, low: $0[1] as! SGNumeric, high: $0[2] as! SGNumeric) })
+    ops.append(BenchmarkOperation(nodeType: "ND_smoothstep_half4", inputs: [.vector4h, .vector4h, .vector4h], output: .vector4h) { ShaderGraphCoder.smoothStep($0[0] as! SGVector, low: $0[1] as! SGNumeric, high: $0[2] as! SGNumeric) })
+    ops.append(BenchmarkOperation(nodeType: "ND_smoothstep_half4FA", inputs: [.vector4h, .float, .float], output: .vector4h) { ShaderGraphCoder.smoothStep($0[0] as! SGVector, low: $0[1] as! SGNumeric, high: $0[2] as! SGNumeric) })
+    ops.append(BenchmarkOperation(nodeType: "ND_smoothstep_vector2", inputs: [.vector2f, .vector2f, .vector2f], output: .vector2f) { ShaderGraphCoder.smoothStep($0[0] as! SGVector, low: $0[1] as! SGNumeric, high: $0[2] as! SGNumeric) })
+    ops.append(BenchmarkOperation(nodeType: "ND_smoothstep_vector2FA", inputs: [.vector2f, .float, .float], output: .vector2f) { ShaderGraphCoder.smoothStep($0[0] as! SGVector, low: $0[1] as! SGNumeric, high: $0[2] as! SGNumeric) })
+    ops.append(BenchmarkOperation(nodeType: "ND_smoothstep_vector3", inputs: [.vector3f, .vector3f, .vector3f], output: .vector3f) { ShaderGraphCoder.smoothStep($0[0] as! SGVector, low: $0[1] as! SGNumeric, high: $0[2] as! SGNumeric) })
+    ops.append(BenchmarkOperation(nodeType: "ND_smoothstep_vector3FA", inputs: [.vector3f, .float, .float], output: .vector3f) { ShaderGraphCoder.smoothStep($0[0] as! SGVector, low: $0[1] as! SGNumeric, high: $0[2] as! SGNumeric) })
+    ops.append(BenchmarkOperation(nodeType: "ND_smoothstep_vector4", inputs: [.vector4f, .vector4f, .vector4f], output: .vector4f) { ShaderGraphCoder.smoothStep($0[0] as! SGVector, low: $0[1] as! SGNumeric, high: $0[2] as! SGNumeric) })
+    ops.append(BenchmarkOperation(nodeType: "ND_smoothstep_vector4FA", inputs: [.vector4f, .float, .float], output: .vector4f) { ShaderGraphCoder.smoothStep($0[0] as! SGVector, low: $0[1] as! SGNumeric, high: $0[2] as! SGNumeric) })
+    ops.append(BenchmarkOperation(nodeType: "ND_splitlr_color3", inputs: [.color3f, .color3f, .float, .vector2f], output: .color3f) { ShaderGraphCoder.splitlr(valuel: $0[0] as! SGColor, valuer: $0[1] as! SGColor, center: $0[2] as! SGScalar, texcoord: $0[3] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_splitlr_color4", inputs: [.color4f, .color4f, .float, .vector2f], output: .color4f) { ShaderGraphCoder.splitlr(valuel: $0[0] as! SGColor, valuer: $0[1] as! SGColor, center: $0[2] as! SGScalar, texcoord: $0[3] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_splitlr_float", inputs: [.float, .float, .float, .vector2f], output: .float) { ShaderGraphCoder.splitlr(valuel: $0[0] as! SGScalar, valuer: $0[1] as! SGScalar, center: $0[2] as! SGScalar, texcoord: $0[3] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_splitlr_half", inputs: [.half, .half, .float, .vector2f], output: .half) { ShaderGraphCoder.splitlr(valuel: $0[0] as! SGScalar, valuer: $0[1] as! SGScalar, center: $0[2] as! SGScalar, texcoord: $0[3] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_splitlr_vector2", inputs: [.vector2f, .vector2f, .float, .vector2f], output: .vector2f) { ShaderGraphCoder.splitlr(valuel: $0[0] as! SGVector, valuer: $0[1] as! SGVector, center: $0[2] as! SGScalar, texcoord: $0[3] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_splitlr_vector3", inputs: [.vector3f, .vector3f, .float, .vector2f], output: .vector3f) { ShaderGraphCoder.splitlr(valuel: $0[0] as! SGVector, valuer: $0[1] as! SGVector, center: $0[2] as! SGScalar, texcoord: $0[3] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_splitlr_vector4", inputs: [.vector4f, .vector4f, .float, .vector2f], output: .vector4f) { ShaderGraphCoder.splitlr(valuel: $0[0] as! SGVector, valuer: $0[1] as! SGVector, center: $0[2] as! SGScalar, texcoord: $0[3] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_splittb_color3", inputs: [.color3f, .color3f, .float, .vector2f], output: .color3f) { ShaderGraphCoder.splittb(valuet: $0[0] as! SGColor, valueb: $0[1] as! SGColor, center: $0[2] as! SGScalar, texcoord: $0[3] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_splittb_color4", inputs: [.color4f, .color4f, .float, .vector2f], output: .color4f) { ShaderGraphCoder.splittb(valuet: $0[0] as! SGColor, valueb: $0[1] as! SGColor, center: $0[2] as! SGScalar, texcoord: $0[3] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_splittb_float", inputs: [.float, .float, .float, .vector2f], output: .float) { ShaderGraphCoder.splittb(valuet: $0[0] as! SGScalar, valueb: $0[1] as! SGScalar, center: $0[2] as! SGScalar, texcoord: $0[3] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_splittb_half", inputs: [.half, .half, .float, .vector2f], output: .half) { ShaderGraphCoder.splittb(valuet: $0[0] as! SGScalar, valueb: $0[1] as! SGScalar, center: $0[2] as! SGScalar, texcoord: $0[3] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_splittb_half2", inputs: [.vector2h, .vector2h, .float, .vector2f], output: .vector2h) { ShaderGraphCoder.splittb(valuet: $0[0] as! SGVector, valueb: $0[1] as! SGVector, center: $0[2] as! SGScalar, texcoord: $0[3] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_splittb_half3", inputs: [.vector3h, .vector3h, .float, .vector2f], output: .vector3h) { ShaderGraphCoder.splittb(valuet: $0[0] as! SGVector, valueb: $0[1] as! SGVector, center: $0[2] as! SGScalar, texcoord: $0[3] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_splittb_half4", inputs: [.vector4h, .vector4h, .float, .vector2f], output: .vector4h) { ShaderGraphCoder.splittb(valuet: $0[0] as! SGVector, valueb: $0[1] as! SGVector, center: $0[2] as! SGScalar, texcoord: $0[3] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_splittb_vector2", inputs: [.vector2f, .vector2f, .float, .vector2f], output: .vector2f) { ShaderGraphCoder.splittb(valuet: $0[0] as! SGVector, valueb: $0[1] as! SGVector, center: $0[2] as! SGScalar, texcoord: $0[3] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_splittb_vector3", inputs: [.vector3f, .vector3f, .float, .vector2f], output: .vector3f) { ShaderGraphCoder.splittb(valuet: $0[0] as! SGVector, valueb: $0[1] as! SGVector, center: $0[2] as! SGScalar, texcoord: $0[3] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_splittb_vector4", inputs: [.vector4f, .vector4f, .float, .vector2f], output: .vector4f) { ShaderGraphCoder.splittb(valuet: $0[0] as! SGVector, valueb: $0[1] as! SGVector, center: $0[2] as! SGScalar, texcoord: $0[3] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_sqrt_float", inputs: [.float], output: .float) { ShaderGraphCoder.sqrt($0[0] as! SGScalar) })
+    ops.append(BenchmarkOperation(nodeType: "ND_sqrt_half", inputs: [.half], output: .half) { ShaderGraphCoder.sqrt($0[0] as! SGScalar) })
+    ops.append(BenchmarkOperation(nodeType: "ND_sqrt_half2", inputs: [.vector2h], output: .vector2h) { ShaderGraphCoder.sqrt($0[0] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_sqrt_half3", inputs: [.vector3h], output: .vector3h) { ShaderGraphCoder.sqrt($0[0] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_sqrt_half4", inputs: [.vector4h], output: .vector4h) { ShaderGraphCoder.sqrt($0[0] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_sqrt_vector2", inputs: [.vector2f], output: .vector2f) { ShaderGraphCoder.sqrt($0[0] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_sqrt_vector3", inputs: [.vector3f], output: .vector3f) { ShaderGraphCoder.sqrt($0[0] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_sqrt_vector4", inputs: [.vector4f], output: .vector4f) { ShaderGraphCoder.sqrt($0[0] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_realitykit_step_color3", inputs: [.color3f, .color3f], output: .color3f) { ShaderGraphCoder.step($0[0] as! SGColor, edge: $0[1] as! SGColor) })
+    ops.append(BenchmarkOperation(nodeType: "ND_realitykit_step_color4", inputs: [.color4f, .color4f], output: .color4f) { ShaderGraphCoder.step($0[0] as! SGColor, edge: $0[1] as! SGColor) })
+    ops.append(BenchmarkOperation(nodeType: "ND_realitykit_step_float", inputs: [.float, .float], output: .float) { ShaderGraphCoder.step($0[0] as! SGScalar, edge: $0[1] as! SGScalar) })
+    ops.append(BenchmarkOperation(nodeType: "ND_realitykit_step_vector2", inputs: [.vector2f, .vector2f], output: .vector2f) { ShaderGraphCoder.step($0[0] as! SGVector, edge: $0[1] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_realitykit_step_vector3", inputs: [.vector3f, .vector3f], output: .vector3f) { ShaderGraphCoder.step($0[0] as! SGVector, edge: $0[1] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_realitykit_step_vector4", inputs: [.vector4f, .vector4f], output: .vector4f) { ShaderGraphCoder.step($0[0] as! SGVector, edge: $0[1] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_subtract_color3", inputs: [.color3f, .color3f], output: .color3f) { ShaderGraphCoder.subtract($0[0] as! SGColor, $0[1] as! SGNumeric) })
+    ops.append(BenchmarkOperation(nodeType: "ND_subtract_color3FA", inputs: [.color3f, .float], output: .color3f) { ShaderGraphCoder.subtract($0[0] as! SGColor, $0[1] as! SGNumeric) })
+    ops.append(BenchmarkOperation(nodeType: "ND_subtract_color4", inputs: [.color4f, .color4f], output: .color4f) { ShaderGraphCoder.subtract($0[0] as! SGColor, $0[1] as! SGNumeric) })
+    ops.append(BenchmarkOperation(nodeType: "ND_subtract_color4FA", inputs: [.color4f, .float], output: .color4f) { ShaderGraphCoder.subtract($0[0] as! SGColor, $0[1] as! SGNumeric) })
+    ops.append(BenchmarkOperation(nodeType: "ND_subtract_float", inputs: [.float, .float], output: .float) { ShaderGraphCoder.subtract($0[0] as! SGScalar, $0[1] as! SGNumeric) })
+    ops.append(BenchmarkOperation(nodeType: "ND_subtract_half", inputs: [.half, .half], output: .half) { ShaderGraphCoder.subtract($0[0] as! SGScalar, $0[1] as! SGNumeric) })
+    ops.append(BenchmarkOperation(nodeType: "ND_subtract_matrix22", inputs: [.matrix2d, .matrix2d], output: .matrix2d) { ShaderGraphCoder.subtract($0[0] as! SGMatrix, $0[1] as! SGNumeric) })
+    ops.append(BenchmarkOperation(nodeType: "ND_subtract_matrix22FA", inputs: [.matrix2d, .float], output: .matrix2d) { ShaderGraphCoder.subtract($0[0] as! SGMatrix, $0[1] as! SGNumeric) })
+    ops.append(BenchmarkOperation(nodeType: "ND_subtract_matrix33", inputs: [.matrix3d, .matrix3d], output: .matrix3d) { ShaderGraphCoder.subtract($0[0] as! SGMatrix, $0[1] as! SGNumeric) })
+    ops.append(BenchmarkOperation(nodeType: "ND_subtract_matrix33FA", inputs: [.matrix3d, .float], output: .matrix3d) { ShaderGraphCoder.subtract($0[0] as! SGMatrix, $0[1] as! SGNumeric) })
+    ops.append(BenchmarkOperation(nodeType: "ND_subtract_matrix44", inputs: [.matrix4d, .matrix4d], output: .matrix4d) { ShaderGraphCoder.subtract($0[0] as! SGMatrix, $0[1] as! SGNumeric) })
+    ops.append(BenchmarkOperation(nodeType: "ND_subtract_matrix44FA", inputs: [.matrix4d, .float], output: .matrix4d) { ShaderGraphCoder.subtract($0[0] as! SGMatrix, $0[1] as! SGNumeric) })
+    ops.append(BenchmarkOperation(nodeType: "ND_subtract_vector2", inputs: [.vector2f, .vector2f], output: .vector2f) { ShaderGraphCoder.subtract($0[0] as! SGVector, $0[1] as! SGNumeric) })
+    ops.append(BenchmarkOperation(nodeType: "ND_subtract_vector2FA", inputs: [.vector2f, .float], output: .vector2f) { ShaderGraphCoder.subtract($0[0] as! SGVector, $0[1] as! SGNumeric) })
+    ops.append(BenchmarkOperation(nodeType: "ND_subtract_vector3", inputs: [.vector3f, .vector3f], output: .vector3f) { ShaderGraphCoder.subtract($0[0] as! SGVector, $0[1] as! SGNumeric) })
+    ops.append(BenchmarkOperation(nodeType: "ND_subtract_vector3FA", inputs: [.vector3f, .float], output: .vector3f) { ShaderGraphCoder.subtract($0[0] as! SGVector, $0[1] as! SGNumeric) })
+    ops.append(BenchmarkOperation(nodeType: "ND_subtract_vector4", inputs: [.vector4f, .vector4f], output: .vector4f) { ShaderGraphCoder.subtract($0[0] as! SGVector, $0[1] as! SGNumeric) })
+    ops.append(BenchmarkOperation(nodeType: "ND_subtract_vector4FA", inputs: [.vector4f, .float], output: .vector4f) { ShaderGraphCoder.subtract($0[0] as! SGVector, $0[1] as! SGNumeric) })
+    ops.append(BenchmarkOperation(nodeType: "ND_switch_color3", inputs: [.color3f, .color3f, .color3f, .color3f, .color3f, .color3f, .color3f, .color3f, .color3f, .color3f, .float], output: .color3f) { ShaderGraphCoder.switchValue($0[0] as! SGColor, $0[1] as! SGColor, $0[2] as! SGColor, $0[3] as! SGColor, $0[4] as! SGColor, $0[5] as! SGColor, $0[6] as! SGColor, $0[7] as! SGColor, $0[8] as! SGColor, $0[9] as! SGColor, which: $0[10] as! SGScalar) })
+    ops.append(BenchmarkOperation(nodeType: "ND_switch_color3I", inputs: [.color3f, .color3f, .color3f, .color3f, .color3f, .color3f, .color3f, .color3f, .color3f, .color3f, .int], output: .color3f) { ShaderGraphCoder.switchValue($0[0] as! SGColor, $0[1] as! SGColor, $0[2] as! SGColor, $0[3] as! SGColor, $0[4] as! SGColor, $0[5] as! SGColor, $0[6] as! SGColor, $0[7] as! SGColor, $0[8] as! SGColor, $0[9] as! SGColor, which: $0[10] as! SGScalar) })
+    ops.append(BenchmarkOperation(nodeType: "ND_switch_color4", inputs: [.color4f, .color4f, .color4f, .color4f, .color4f, .color4f, .color4f, .color4f, .color4f, .color4f, .float], output: .color4f) { ShaderGraphCoder.switchValue($0[0] as! SGColor, $0[1] as! SGColor, $0[2] as! SGColor, $0[3] as! SGColor, $0[4] as! SGColor, $0[5] as! SGColor, $0[6] as! SGColor, $0[7] as! SGColor, $0[8] as! SGColor, $0[9] as! SGColor, which: $0[10] as! SGScalar) })
+    ops.append(BenchmarkOperation(nodeType: "ND_switch_color4I", inputs: [.color4f, .color4f, .color4f, .color4f, .color4f, .color4f, .color4f, .color4f, .color4f, .color4f, .int], output: .color4f) { ShaderGraphCoder.switchValue($0[0] as! SGColor, $0[1] as! SGColor, $0[2] as! SGColor, $0[3] as! SGColor, $0[4] as! SGColor, $0[5] as! SGColor, $0[6] as! SGColor, $0[7] as! SGColor, $0[8] as! SGColor, $0[9] as! SGColor, which: $0[10] as! SGScalar) })
+    ops.append(BenchmarkOperation(nodeType: "ND_switch_float", inputs: [.float, .float, .float, .float, .float, .float, .float, .float, .float, .float, .float], output: .float) { ShaderGraphCoder.switchValue($0[0] as! SGScalar, $0[1] as! SGScalar, $0[2] as! SGScalar, $0[3] as! SGScalar, $0[4] as! SGScalar, $0[5] as! SGScalar, $0[6] as! SGScalar, $0[7] as! SGScalar, $0[8] as! SGScalar, $0[9] as! SGScalar, which: $0[10] as! SGScalar) })
+    ops.append(BenchmarkOperation(nodeType: "ND_switch_floatI", inputs: [.float, .float, .float, .float, .float, .float, .float, .float, .float, .float, .int], output: .float) { ShaderGraphCoder.switchValue($0[0] as! SGScalar, $0[1] as! SGScalar, $0[2] as! SGScalar, $0[3] as! SGScalar, $0[4] as! SGScalar, $0[5] as! SGScalar, $0[6] as! SGScalar, $0[7] as! SGScalar, $0[8] as! SGScalar, $0[9] as! SGScalar, which: $0[10] as! SGScalar) })
+    ops.append(BenchmarkOperation(nodeType: "ND_switch_half", inputs: [.half, .half, .half, .half, .half, .half, .half, .half, .half, .half, .float], output: .half) { ShaderGraphCoder.switchValue($0[0] as! SGScalar, $0[1] as! SGScalar, $0[2] as! SGScalar, $0[3] as! SGScalar, $0[4] as! SGScalar, $0[5] as! SGScalar, $0[6] as! SGScalar, $0[7] as! SGScalar, $0[8] as! SGScalar, $0[9] as! SGScalar, which: $0[10] as! SGScalar) })
+    ops.append(BenchmarkOperation(nodeType: "ND_switch_halfI", inputs: [.half, .half, .half, .half, .half, .half, .half, .half, .half, .half, .int], output: .half) { ShaderGraphCoder.switchValue($0[0] as! SGScalar, $0[1] as! SGScalar, $0[2] as! SGScalar, $0[3] as! SGScalar, $0[4] as! SGScalar, $0[5] as! SGScalar, $0[6] as! SGScalar, $0[7] as! SGScalar, $0[8] as! SGScalar, $0[9] as! SGScalar, which: $0[10] as! SGScalar) })
+    ops.append(BenchmarkOperation(nodeType: "ND_switch_vector2", inputs: [.vector2f, .vector2f, .vector2f, .vector2f, .vector2f, .vector2f, .vector2f, .vector2f, .vector2f, .vector2f, .float], output: .vector2f) { ShaderGraphCoder.switchValue($0[0] as! SGVector, $0[1] as! SGVector, $0[2] as! SGVector, $0[3] as! SGVector, $0[4] as! SGVector, $0[5] as! SGVector, $0[6] as! SGVector, $0[7] as! SGVector, $0[8] as! SGVector, $0[9] as! SGVector, which: $0[10] as! SGScalar) })
+    ops.append(BenchmarkOperation(nodeType: "ND_switch_vector2I", inputs: [.vector2f, .vector2f, .vector2f, .vector2f, .vector2f, .vector2f, .vector2f, .vector2f, .vector2f, .vector2f, .int], output: .vector2f) { ShaderGraphCoder.switchValue($0[0] as! SGVector, $0[1] as! SGVector, $0[2] as! SGVector, $0[3] as! SGVector, $0[4] as! SGVector, $0[5] as! SGVector, $0[6] as! SGVector, $0[7] as! SGVector, $0[8] as! SGVector, $0[9] as! SGVector, which: $0[10] as! SGScalar) })
+    ops.append(BenchmarkOperation(nodeType: "ND_switch_vector3", inputs: [.vector3f, .vector3f, .vector3f, .vector3f, .vector3f, .vector3f, .vector3f, .vector3f, .vector3f, .vector3f, .float], output: .vector3f) { ShaderGraphCoder.switchValue($0[0] as! SGVector, $0[1] as! SGVector, $0[2] as! SGVector, $0[3] as! SGVector, $0[4] as! SGVector, $0[5] as! SGVector, $0[6] as! SGVector, $0[7] as! SGVector, $0[8] as! SGVector, $0[9] as! SGVector, which: $0[10] as! SGScalar) })
+    ops.append(BenchmarkOperation(nodeType: "ND_switch_vector3I", inputs: [.vector3f, .vector3f, .vector3f, .vector3f, .vector3f, .vector3f, .vector3f, .vector3f, .vector3f, .vector3f, .int], output: .vector3f) { ShaderGraphCoder.switchValue($0[0] as! SGVector, $0[1] as! SGVector, $0[2] as! SGVector, $0[3] as! SGVector, $0[4] as! SGVector, $0[5] as! SGVector, $0[6] as! SGVector, $0[7] as! SGVector, $0[8] as! SGVector, $0[9] as! SGVector, which: $0[10] as! SGScalar) })
+    ops.append(BenchmarkOperation(nodeType: "ND_switch_vector4", inputs: [.vector4f, .vector4f, .vector4f, .vector4f, .vector4f, .vector4f, .vector4f, .vector4f, .vector4f, .vector4f, .float], output: .vector4f) { ShaderGraphCoder.switchValue($0[0] as! SGVector, $0[1] as! SGVector, $0[2] as! SGVector, $0[3] as! SGVector, $0[4] as! SGVector, $0[5] as! SGVector, $0[6] as! SGVector, $0[7] as! SGVector, $0[8] as! SGVector, $0[9] as! SGVector, which: $0[10] as! SGScalar) })
+    ops.append(BenchmarkOperation(nodeType: "ND_switch_vector4I", inputs: [.vector4f, .vector4f, .vector4f, .vector4f, .vector4f, .vector4f, .vector4f, .vector4f, .vector4f, .vector4f, .int], output: .vector4f) { ShaderGraphCoder.switchValue($0[0] as! SGVector, $0[1] as! SGVector, $0[2] as! SGVector, $0[3] as! SGVector, $0[4] as! SGVector, $0[5] as! SGVector, $0[6] as! SGVector, $0[7] as! SGVector, $0[8] as! SGVector, $0[9] as! SGVector, which: $0[10] as! SGScalar) })
+    ops.append(BenchmarkOperation(nodeType: "ND_tan_float", inputs: [.float], output: .float) { ShaderGraphCoder.tan($0[0] as! SGScalar) })
+    ops.append(BenchmarkOperation(nodeType: "ND_tan_half", inputs: [.half], output: .half) { ShaderGraphCoder.tan($0[0] as! SGScalar) })
+    ops.append(BenchmarkOperation(nodeType: "ND_tan_half2", inputs: [.vector2h], output: .vector2h) { ShaderGraphCoder.tan($0[0] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_tan_half3", inputs: [.vector3h], output: .vector3h) { ShaderGraphCoder.tan($0[0] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_tan_half4", inputs: [.vector4h], output: .vector4h) { ShaderGraphCoder.tan($0[0] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_tan_vector2", inputs: [.vector2f], output: .vector2f) { ShaderGraphCoder.tan($0[0] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_tan_vector3", inputs: [.vector3f], output: .vector3f) { ShaderGraphCoder.tan($0[0] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_tan_vector4", inputs: [.vector4f], output: .vector4f) { ShaderGraphCoder.tan($0[0] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_tiledimage_color3", inputs: [.asset, .color3f, .vector2f, .vector2f, .vector2f, .vector2f, .vector2f], output: .color3f) { ShaderGraphCoder.tiledImage(file: $0[0] as! SGTexture, defaultValue: $0[1] as! SGColor, texcoord: $0[2] as! SGVector, uvtiling: $0[3] as! SGVector, uvoffset: $0[4] as! SGVector, realworldimagesize: $0[5] as! SGVector, realworldtilesize: $0[6] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_tiledimage_color4", inputs: [.asset, .color4f, .vector2f, .vector2f, .vector2f, .vector2f, .vector2f], output: .color4f) { ShaderGraphCoder.tiledImage(file: $0[0] as! SGTexture, defaultValue: $0[1] as! SGColor, texcoord: $0[2] as! SGVector, uvtiling: $0[3] as! SGVector, uvoffset: $0[4] as! SGVector, realworldimagesize: $0[5] as! SGVector, realworldtilesize: $0[6] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_tiledimage_float", inputs: [.asset, .float, .vector2f, .vector2f, .vector2f, .vector2f, .vector2f], output: .float) { ShaderGraphCoder.tiledImage(file: $0[0] as! SGTexture, defaultValue: $0[1] as! SGScalar, texcoord: $0[2] as! SGVector, uvtiling: $0[3] as! SGVector, uvoffset: $0[4] as! SGVector, realworldimagesize: $0[5] as! SGVector, realworldtilesize: $0[6] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_tiledimage_half", inputs: [.asset, .half, .vector2f, .vector2f, .vector2f, .vector2f, .vector2f], output: .half) { ShaderGraphCoder.tiledImage(file: $0[0] as! SGTexture, defaultValue: $0[1] as! SGScalar, texcoord: $0[2] as! SGVector, uvtiling: $0[3] as! SGVector, uvoffset: $0[4] as! SGVector, realworldimagesize: $0[5] as! SGVector, realworldtilesize: $0[6] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_tiledimage_vector2", inputs: [.asset, .vector2f, .vector2f, .vector2f, .vector2f, .vector2f, .vector2f], output: .vector2f) { ShaderGraphCoder.tiledImage(file: $0[0] as! SGTexture, defaultValue: $0[1] as! SGVector, texcoord: $0[2] as! SGVector, uvtiling: $0[3] as! SGVector, uvoffset: $0[4] as! SGVector, realworldimagesize: $0[5] as! SGVector, realworldtilesize: $0[6] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_tiledimage_vector3", inputs: [.asset, .vector3f, .vector2f, .vector2f, .vector2f, .vector2f, .vector2f], output: .vector3f) { ShaderGraphCoder.tiledImage(file: $0[0] as! SGTexture, defaultValue: $0[1] as! SGVector, texcoord: $0[2] as! SGVector, uvtiling: $0[3] as! SGVector, uvoffset: $0[4] as! SGVector, realworldimagesize: $0[5] as! SGVector, realworldtilesize: $0[6] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_tiledimage_vector4", inputs: [.asset, .vector4f, .vector2f, .vector2f, .vector2f, .vector2f, .vector2f], output: .vector4f) { ShaderGraphCoder.tiledImage(file: $0[0] as! SGTexture, defaultValue: $0[1] as! SGVector, texcoord: $0[2] as! SGVector, uvtiling: $0[3] as! SGVector, uvoffset: $0[4] as! SGVector, realworldimagesize: $0[5] as! SGVector, realworldtilesize: $0[6] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_transformmatrix_vector2", inputs: [.vector2f, .matrix2d], output: .vector2f) { ShaderGraphCoder.transformMatrix($0[0] as! SGVector, mat: $0[1] as! SGMatrix) })
+    ops.append(BenchmarkOperation(nodeType: "ND_transformmatrix_vector2M3", inputs: [.vector2f, .matrix3d], output: .vector2f) { ShaderGraphCoder.transformMatrix($0[0] as! SGVector, mat: $0[1] as! SGMatrix) })
+    ops.append(BenchmarkOperation(nodeType: "ND_transformmatrix_vector3", inputs: [.vector3f, .matrix3d], output: .vector3f) { ShaderGraphCoder.transformMatrix($0[0] as! SGVector, mat: $0[1] as! SGMatrix) })
+    ops.append(BenchmarkOperation(nodeType: "ND_transformmatrix_vector3M4", inputs: [.vector3f, .matrix4d], output: .vector3f) { ShaderGraphCoder.transformMatrix($0[0] as! SGVector, mat: $0[1] as! SGMatrix) })
+    ops.append(BenchmarkOperation(nodeType: "ND_transformmatrix_vector4", inputs: [.vector4f, .matrix4d], output: .vector4f) { ShaderGraphCoder.transformMatrix($0[0] as! SGVector, mat: $0[1] as! SGMatrix) })
+    ops.append(BenchmarkOperation(nodeType: "ND_transformnormal_vector3", inputs: [.vector3f], output: .vector3f) { ShaderGraphCoder.transformNormal($0[0] as! SGVector, fromspace: SGTransformSpace.model, tospace: SGTransformSpace.model) })
+    ops.append(BenchmarkOperation(nodeType: "ND_transformpoint_vector3", inputs: [.vector3f], output: .vector3f) { ShaderGraphCoder.transformPoint($0[0] as! SGVector, fromspace: SGTransformSpace.model, tospace: SGTransformSpace.model) })
+    ops.append(BenchmarkOperation(nodeType: "ND_transformvector_vector3", inputs: [.vector3f], output: .vector3f) { ShaderGraphCoder.transformVector($0[0] as! SGVector, fromspace: SGTransformSpace.model, tospace: SGTransformSpace.model) })
+    ops.append(BenchmarkOperation(nodeType: "ND_transpose_matrix22", inputs: [.matrix2d], output: .matrix2d) { ShaderGraphCoder.transpose($0[0] as! SGMatrix) })
+    ops.append(BenchmarkOperation(nodeType: "ND_transpose_matrix33", inputs: [.matrix3d], output: .matrix3d) { ShaderGraphCoder.transpose($0[0] as! SGMatrix) })
+    ops.append(BenchmarkOperation(nodeType: "ND_transpose_matrix44", inputs: [.matrix4d], output: .matrix4d) { ShaderGraphCoder.transpose($0[0] as! SGMatrix) })
+    ops.append(BenchmarkOperation(nodeType: "ND_triplanarprojection_color3", inputs: [.asset, .asset, .asset, .color3f, .vector3f, .vector3f], output: .color3f) { ShaderGraphCoder.triplanarProjection(filex: $0[0] as! SGTexture, filey: $0[1] as! SGTexture, filez: $0[2] as! SGTexture, defaultValue: $0[3] as! SGColor, position: $0[4] as! SGVector, normal: $0[5] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_triplanarprojection_color4", inputs: [.asset, .asset, .asset, .color4f, .vector3f, .vector3f], output: .color4f) { ShaderGraphCoder.triplanarProjection(filex: $0[0] as! SGTexture, filey: $0[1] as! SGTexture, filez: $0[2] as! SGTexture, defaultValue: $0[3] as! SGColor, position: $0[4] as! SGVector, normal: $0[5] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_triplanarprojection_float", inputs: [.asset, .asset, .asset, .float, .vector3f, .vector3f], output: .float) { ShaderGraphCoder.triplanarProjection(filex: $0[0] as! SGTexture, filey: $0[1] as! SGTexture, filez: $0[2] as! SGTexture, defaultValue: $0[3] as! SGScalar, position: $0[4] as! SGVector, normal: $0[5] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_triplanarprojection_vector2", inputs: [.asset, .asset, .asset, .vector2f, .vector3f, .vector3f], output: .vector2f) { ShaderGraphCoder.triplanarProjection(filex: $0[0] as! SGTexture, filey: $0[1] as! SGTexture, filez: $0[2] as! SGTexture, defaultValue: $0[3] as! SGVector, position: $0[4] as! SGVector, normal: $0[5] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_triplanarprojection_vector3", inputs: [.asset, .asset, .asset, .vector3f, .vector3f, .vector3f], output: .vector3f) { ShaderGraphCoder.triplanarProjection(filex: $0[0] as! SGTexture, filey: $0[1] as! SGTexture, filez: $0[2] as! SGTexture, defaultValue: $0[3] as! SGVector, position: $0[4] as! SGVector, normal: $0[5] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_triplanarprojection_vector4", inputs: [.asset, .asset, .asset, .vector4f, .vector3f, .vector3f], output: .vector4f) { ShaderGraphCoder.triplanarProjection(filex: $0[0] as! SGTexture, filey: $0[1] as! SGTexture, filez: $0[2] as! SGTexture, defaultValue: $0[3] as! SGVector, position: $0[4] as! SGVector, normal: $0[5] as! SGVector) })
+    ops.append(BenchmarkOperation(nodeType: "ND_unpremult_color4", inputs: [.color4f], output: .color4f) { ShaderGraphCoder.unpremult($0[0] as! SGColor) })
+    ops.append(BenchmarkOperation(nodeType: "ND_worleynoise2d_float", inputs: [.vector2f, .float], output: .float) { ShaderGraphCoder.worleyNoise2DFloat(texcoord: $0[0] as! SGVector, jitter: $0[1] as! SGScalar) })
+    ops.append(BenchmarkOperation(nodeType: "ND_worleynoise2d_vector2", inputs: [.vector2f, .float], output: .vector2f) { ShaderGraphCoder.worleyNoise2DVector2(texcoord: $0[0] as! SGVector, jitter: $0[1] as! SGScalar) })
+    ops.append(BenchmarkOperation(nodeType: "ND_worleynoise2d_vector3", inputs: [.vector2f, .float], output: .vector3f) { ShaderGraphCoder.worleyNoise2DVector3(texcoord: $0[0] as! SGVector, jitter: $0[1] as! SGScalar) })
+    ops.append(BenchmarkOperation(nodeType: "ND_worleynoise3d_float", inputs: [.vector3f, .float], output: .float) { ShaderGraphCoder.worleyNoise3DFloat(position: $0[0] as! SGVector, jitter: $0[1] as! SGScalar) })
+    ops.append(BenchmarkOperation(nodeType: "ND_worleynoise3d_vector2", inputs: [.vector3f, .float], output: .vector2f) { ShaderGraphCoder.worleyNoise3DVector2(position: $0[0] as! SGVector, jitter: $0[1] as! SGScalar) })
+    ops.append(BenchmarkOperation(nodeType: "ND_worleynoise3d_vector3", inputs: [.vector3f, .float], output: .vector3f) { ShaderGraphCoder.worleyNoise3DVector3(position: $0[0] as! SGVector, jitter: $0[1] as! SGScalar) })
+    return ops
+}
@@ -0,0 +1,324 @@
+//
+//  main.swift
+//  ShaderGraphCoderBenchmark
+//
+//  Builds random, type-correct graphs from the generated operations
+//  and times construction, error and parameter collection, and USDA export.
+//
+//  swift run -c release ShaderGraphCoderBenchmark --sizes 10,100,1000,10000 --depth 16
+//
+
+import Foundation
+@_spi(Benchmarking) import ShaderGraphCoder
+
+/// A generated operation overload: the USD types of its value inputs and output,
+/// and a call through the public API that builds the node.
+struct BenchmarkOperation {
+    let nodeType: String
+    let inputs: [SGDataType]
+    let output: SGDataType
+    let make: ([SGValue]) -> SGValue
+}
+
+/// SplitMix64, so every run builds the same graphs for the same seed.
+struct BenchmarkRandom: RandomNumberGenerator {
+    var state: UInt64
+    mutating func next() -> UInt64 {
+        state &+= 0x9E3779B97F4A7C15
+        var z = state
+        z = (z ^ (z >> 30)) &* 0xBF58476D1CE4E5B9
+        z = (z ^ (z >> 27)) &* 0x94D049BB133111EB
+        return z ^ (z >> 31)
+    }
+}
+
+struct BenchmarkOptions {
+    var sizes: [Int] = [10, 30, 100, 300, 1_000, 3_000, 10_000, 30_000]
+    var depth: Int = 16
+    var seed: UInt64 = 1
+    var iterations: Int = 3
+    var maxExponent: Double? = nil
+
+    static let usage = "Usage: ShaderGraphCoderBenchmark [--sizes 10,100,1000] [--depth 16] [--seed 1] [--iterations 3] [--max-exponent 1.5]"
+
+    init(arguments: [String]) {
+        var args = arguments[...]
+        while let arg = args.popFirst() {
+            let value = args.popFirst() ?? ""
+            switch arg {
+            case "--sizes":
+                sizes = value.split(separator: ",").compactMap { Int($0) }
+            case "--depth":
+                depth = max(1, Int(value) ?? depth)
+            case "--seed":
+                seed = UInt64(value) ?? seed
+            case "--iterations":
+                iterations = max(1, Int(value) ?? iterations)
+            case "--max-exponent":
+                maxExponent = Double(value)
+            default:
+                print(BenchmarkOptions.usage)
+                exit(1)
+            }
+        }
+    }
+}
+
+/// The surface inputs that random values are routed into.
+let rootDataTypes: [SGDataType] = [.color3f, .vector3f, .float]
+
+struct RandomGraphBuilder {
+    let operations: [BenchmarkOperation]
+    let routes: [SGDataType: BenchmarkOperation]
+    var random: BenchmarkRandom
+    var numLeaves = 0
+
+    init(operations: [BenchmarkOperation], seed: UInt64) {
+        self.operations = operations
+        self.random = BenchmarkRandom(state: seed)
+        // For every data type, an operation that takes it and gets one step closer to a surface input.
+        var routes: [SGDataType: BenchmarkOperation] = [:]
+        var reached = Set(rootDataTypes)
+        var changed = true
+        while changed {
+            changed = false
+            for op in operations where reached.contains(op.output) {
+                for input in op.inputs where !reached.contains(input) {
+                    routes[input] = op
+                    reached.insert(input)
+                    changed = true
+                }
+            }
+        }
+        self.routes = routes
+    }
+
+    /// A constant, or every eighth time a material parameter, of the given type.
+    mutating func leaf(_ dataType: SGDataType) -> SGValue {
+        numLeaves += 1
+        let name = "p\(numLeaves)"
+        let isParameter = numLeaves % 8 == 0
+        func make<T: SGValue>(_ type: T.Type, _ value: SGConstantValue) -> SGValue {
+            T(source: isParameter ? .parameter(name: name, defaultValue: value) : .constant(value))
+        }
+        switch dataType {
+        case .bool: return make(SGValue.self, .bool(true))
+        case .color3f: return make(SGColor.self, .color3f([0.5, 0.5, 0.5]))
+        case .color4f: return make(SGColor.self, .color4f([0.5, 0.5, 0.5, 1]))
+        case .float: return make(SGScalar.self, .float(0.5))
+        case .half: return make(SGScalar.self, .half(0.5))
+        case .int: return make(SGScalar.self, .int(1))
+        case .matrix2d: return make(SGMatrix.self, .matrix2d(matrix_identity_float2x2))
+        case .matrix3d: return make(SGMatrix.self, .matrix3d(matrix_identity_float3x3))
+        case .matrix4d: return make(SGMatrix.self, .matrix4d(matrix_identity_float4x4))
+        case .vector2f: return make(SGVector.self, .vector2f([0.5, 0.5]))
+        case .vector3f: return make(SGVector.self, .vector3f([0.5, 0.5, 0.5]))
+        case .vector4f: return make(SGVector.self, .vector4f([0.5, 0.5, 0.5, 0.5]))
+        case .vector2h: return make(SGVector.self, .vector2h([0.5, 0.5]))
+        case .vector3h: return make(SGVector.self, .vector3h([0.5, 0.5, 0.5]))
+        case .vector4h: return make(SGVector.self, .vector4h([0.5, 0.5, 0.5, 0.5]))
+        case .vector2i: return make(SGVector.self, .vector2i([1, 1]))
+        case .vector3i: return make(SGVector.self, .vector3i([1, 1, 1]))
+        case .vector4i: return make(SGVector.self, .vector4i([1, 1, 1, 1]))
+        case .asset: return SGValue.textureParameter(name: name)
+        case .string, .token, .error: return make(SGValue.self, .string(""))
+        }
+    }
+
+    /// Prefers values nothing has consumed yet, then values of the previous layer, then new leaves.
+    mutating func input(_ dataType: SGDataType, unused: inout [SGDataType: [SGValue]], previous: [SGDataType: [SGValue]]) -> SGValue {
+        if random.next() % 4 != 0 {
+            if let value = unused[dataType]?.popLast() {
+                return value
+            }
+            if let values = previous[dataType], let value = values.randomElement(using: &random) {
+                return value
+            }
+        }
+        return leaf(dataType)
+    }
+
+    /// Builds `size` operation nodes in `depth` layers, each taking its inputs from the layers before it,
+    /// and connects every value that is still unused to a PBR surface.
+    mutating func build(size: Int, depth: Int) -> SGToken {
+        var unused: [SGDataType: [SGValue]] = [:]
+        var previous: [SGDataType: [SGValue]] = [:]
+        let nodesPerLayer = max(1, size / depth)
+        var remaining = size
+        while remaining > 0 {
+            var current: [SGDataType: [SGValue]] = [:]
+            for _ in 0..<min(nodesPerLayer, remaining) {
+                let op = operations.randomElement(using: &random)!
+                var args: [SGValue] = []
+                for input in op.inputs {
+                    args.append(self.input(input, unused: &unused, previous: previous))
+                }
+                current[op.output, default: []].append(op.make(args))
+            }
+            remaining -= min(nodesPerLayer, remaining)
+            // Dictionary order changes between runs, sort so the graph only depends on the seed.
+            for dataType in current.keys.sorted(by: { $0.rawValue < $1.rawValue }) {
+                unused[dataType, default: []].append(contentsOf: current[dataType]!)
+            }
+            previous = current
+        }
+        var rootValues: [SGDataType: [SGValue]] = [:]
+        for dataType in unused.keys.sorted(by: { $0.rawValue < $1.rawValue }) {
+            for value in unused[dataType]! {
+                if let routed = route(value, dataType) {
+                    rootValues[routed.dataType, default: []].append(routed)
+                }
+            }
+        }
+        return pbrSurface(
+            baseColor: sum(rootValues[.color3f] ?? []) as? SGColor,
+            normal: sum(rootValues[.vector3f] ?? []) as? SGVector,
+            roughness: sum(rootValues[.float] ?? []) as? SGScalar)
+    }
+
+    mutating func route(_ value: SGValue, _ dataType: SGDataType) -> SGValue? {
+        var value = value
+        var dataType = dataType
+        while !rootDataTypes.contains(dataType) {
+            guard let op = routes[dataType] else {
+                return nil
+            }
+            var args: [SGValue] = []
+            var placed = false
+            for input in op.inputs {
+                if !placed && input == dataType {
+                    args.append(value)
+                    placed = true
+                }
+                else {
+                    args.append(leaf(input))
+                }
+            }
+            value = op.make(args)
+            dataType = op.output
+        }
+        return value
+    }
+
+    /// Adds values pairwise so the sum does not lengthen the critical path by more than log2(n).
+    func sum(_ values: [SGValue]) -> SGValue? {
+        var level = values
+        while level.count > 1 {
+            var next: [SGValue] = []
+            for i in stride(from: 0, to: level.count - 1, by: 2) {
+                next.append(add(level[i], level[i + 1]))
+            }
+            if level.count % 2 == 1 {
+                next.append(level[level.count - 1])
+            }
+            level = next
+        }
+        return level.first
+    }
+
+    func add(_ a: SGValue, _ b: SGValue) -> SGValue {
+        switch (a, b) {
+        case let (a as SGColor, b as SGColor): return a + b
+        case let (a as SGVector, b as SGVector): return a + b
+        case let (a as SGScalar, b as SGScalar): return a + b
+        default: return a
+        }
+    }
+}
+
+struct BenchmarkResult {
+    let size: Int
+    var nodes = 0
+    var parameters = 0
+    var errors = 0
+    var build = Double.infinity
+    var collectErrors = Double.infinity
+    var collectParameters = Double.infinity
+    var usda = Double.infinity
+
+    var phases: [(String, Double)] {
+        [("build", build), ("collectErrors", collectErrors), ("collectParameters", collectParameters), ("getUSDA", usda)]
+    }
+}
+
+func milliseconds<T>(_ body: () -> T) -> (T, Double) {
+    let start = DispatchTime.now().uptimeNanoseconds
+    let result = body()
+    let end = DispatchTime.now().uptimeNanoseconds
+    return (result, Double(end - start) / 1_000_000)
+}
+
+func run(options: BenchmarkOptions) -> [BenchmarkResult] {
+    let operations = makeBenchmarkOperations()
+    print("\(operations.count) operations, depth \(options.depth), seed \(options.seed), best of \(options.iterations)")
+    print("")
+    print("   Nodes  Params  Errors    Build ms  Errors ms  Params ms    USDA ms  USDA µs/node")
+    var results: [BenchmarkResult] = []
+    for size in options.sizes {
+        var result = BenchmarkResult(size: size)
+        for _ in 0..<options.iterations {
+            var builder = RandomGraphBuilder(operations: operations, seed: options.seed &+ UInt64(size))
+            let (surface, build) = milliseconds { builder.build(size: size, depth: options.depth) }
+            let (errors, collectErrorsTime) = milliseconds { collectErrors(values: [surface]) }
+            let (parameters, collectParametersTime) = milliseconds { collectParameters(nodes: [surface.node].compactMap { $0 }) }
+            let (usda, usdaTime) = milliseconds { getUSDA(materialName: "Benchmark", surface: surface, geometryModifier: nil) }
+            result.nodes = usda.0.components(separatedBy: "def Shader ").count - 1
+            result.parameters = parameters.count
+            result.errors = errors.count
+            result.build = min(result.build, build)
+            result.collectErrors = min(result.collectErrors, collectErrorsTime)
+            result.collectParameters = min(result.collectParameters, collectParametersTime)
+            result.usda = min(result.usda, usdaTime)
+        }
+        let usdaPerNode = result.usda * 1000 / Double(max(1, result.nodes))
+        print(String(format: "%8ld %7ld %7ld %11.2f %10.2f %10.2f %10.2f %13.2f",
+                     result.nodes, result.parameters, result.errors, result.build, result.collectErrors, result.collectParameters, result.usda, usdaPerNode))
+        results.append(result)
+    }
+    return results
+}
+
+/// The exponent k in time ∝ nodes^k between two runs: about 1 for linear and 2 for quadratic work.
+func growthExponent(_ a: BenchmarkResult, _ b: BenchmarkResult, _ phase: Int) -> Double? {
+    let ta = a.phases[phase].1
+    let tb = b.phases[phase].1
+    // Times under a millisecond are too noisy to fit.
+    guard a.nodes > 0, b.nodes > a.nodes, ta >= 1, tb >= 1 else {
+        return nil
+    }
+    return log(tb / ta) / log(Double(b.nodes) / Double(a.nodes))
+}
+
+let options = BenchmarkOptions(arguments: Array(CommandLine.arguments.dropFirst()))
+let results = run(options: options)
+
+print("")
+print("Growth exponents (1 = linear, 2 = quadratic):")
+print("   Nodes       Build  Errors  Params    USDA")
+for i in 1..<max(1, results.count) {
+    var line = String(format: "%8ld   ", results[i].nodes)
+    for phase in 0..<4 {
+        if let k = growthExponent(results[i - 1], results[i], phase) {
+            line += String(format: "%7.2f ", k)
+        }
+        else {
+            line += "      - "
+        }
+    }
+    print(line)
+}
+
+if let maxExponent = options.maxExponent, results.count >= 2 {
+    let a = results[results.count - 2]
+    let b = results[results.count - 1]
+    var failed = false
+    for phase in 0..<4 {
+        if let k = growthExponent(a, b, phase), k > maxExponent {
+            print("Error: \(a.phases[phase].0) grows with exponent \(String(format: "%.2f", k)) from \(a.nodes) to \(b.nodes) nodes (max \(maxExponent))")
+            failed = true
+        }
+    }
+    if failed {
+        exit(1)
+    }
+}
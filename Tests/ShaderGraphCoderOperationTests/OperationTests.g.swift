@@ -0,0 +1,2396 @@
+// Autogenerated by opgen.py
+import Foundation
+import simd
+
+import XCTest
+@testable import ShaderGraphCoder
+
+extension OperationTests {
+    static let overloadSets: [(name: String, cases: () -> [OperationTestCase])] = [
+        ("abs", absCases),
+        ("acos", acosCases),
+        ("add", addCases),
+        ("ambientOcclusion", ambientOcclusionCases),
+        ("asin", asinCases),
+        ("atan2", atan2Cases),
+        ("blur", blurCases),
+        ("burn", burnCases),
+        ("ceil", ceilCases),
+        ("cellNoise2D", cellNoise2DCases),
+        ("cellNoise3D", cellNoise3DCases),
+        ("clamp", clampCases),
+        ("contrast", contrastCases),
+        ("cos", cosCases),
+        ("cross", crossCases),
+        ("determinant", determinantCases),
+        ("difference", differenceCases),
+        ("disjointover", disjointoverCases),
+        ("divide", divideCases),
+        ("dodge", dodgeCases),
+        ("dot", dotCases),
+        ("exp", expCases),
+        ("extract", extractCases),
+        ("floor", floorCases),
+        ("fract", fractCases),
+        ("fractal3D", fractal3DCases),
+        ("geometryModifier", geometryModifierCases),
+        ("geometrySwitchCameraIndex", geometrySwitchCameraIndexCases),
+        ("heightToNormal", heightToNormalCases),
+        ("hsvAdjust", hsvAdjustCases),
+        ("hsvToRGB", hsvToRGBCases),
+        ("ifEqual", ifEqualCases),
+        ("ifGreater", ifGreaterCases),
+        ("ifGreaterOrEqual", ifGreaterOrEqualCases),
+        ("image", imageCases),
+        ("inside", insideCases),
+        ("invertMatrix", invertMatrixCases),
+        ("length", lengthCases),
+        ("log", logCases),
+        ("logicalAnd", logicalAndCases),
+        ("logicalNot", logicalNotCases),
+        ("logicalOr", logicalOrCases),
+        ("logicalXor", logicalXorCases),
+        ("luminance", luminanceCases),
+        ("mask", maskCases),
+        ("matte", matteCases),
+        ("max", maxCases),
+        ("min", minCases),
+        ("minus", minusCases),
+        ("mix", mixCases),
+        ("mixColor", mixColorCases),
+        ("modulo", moduloCases),
+        ("multiply", multiplyCases),
+        ("noise2D", noise2DCases),
+        ("noise3D", noise3DCases),
+        ("normalMap", normalMapCases),
+        ("normalMapDecode", normalMapDecodeCases),
+        ("normalize", normalizeCases),
+        ("oneMinus", oneMinusCases),
+        ("out", outCases),
+        ("outside", outsideCases),
+        ("over", overCases),
+        ("overlay", overlayCases),
+        ("pbrSurface", pbrSurfaceCases),
+        ("pixel", pixelCases),
+        ("pixelGradient", pixelGradientCases),
+        ("pixelLOD", pixelLODCases),
+        ("place2D", place2DCases),
+        ("plus", plusCases),
+        ("pow", powCases),
+        ("premult", premultCases),
+        ("ramp4", ramp4Cases),
+        ("ramplr", ramplrCases),
+        ("ramptb", ramptbCases),
+        ("range", rangeCases),
+        ("read", readCases),
+        ("reflect", reflectCases),
+        ("refract", refractCases),
+        ("remap", remapCases),
+        ("rgbToHSV", rgbToHSVCases),
+        ("rotate2D", rotate2DCases),
+        ("rotate3D", rotate3DCases),
+        ("round", roundCases),
+        ("safePow", safePowCases),
+        ("sample", sampleCases),
+        ("sampleCube", sampleCubeCases),
+        ("sampleCubeGradient", sampleCubeGradientCases),
+        ("sampleCubeLOD", sampleCubeLODCases),
+        ("sampleGradient", sampleGradientCases),
+        ("sampleLOD", sampleLODCases),
+        ("saturate", saturateCases),
+        ("screen", screenCases),
+        ("sign", signCases),
+        ("sin", sinCases),
+        ("smoothStep", smoothStepCases),
+        ("splitlr", splitlrCases),
+        ("splittb", splittbCases),
+        ("sqrt", sqrtCases),
+        ("step", stepCases),
+        ("subtract", subtractCases),
+        ("switchValue", switchValueCases),
+        ("tan", tanCases),
+        ("tiledImage", tiledImageCases),
+        ("transformMatrix", transformMatrixCases),
+        ("transformNormal", transformNormalCases),
+        ("transformPoint", transformPointCases),
+        ("transformVector", transformVectorCases),
+        ("transpose", transposeCases),
+        ("triplanarProjection", triplanarProjectionCases),
+        ("unlitSurface", unlitSurfaceCases),
+        ("unpremult", unpremultCases),
+        ("worleyNoise2DFloat", worleyNoise2DFloatCases),
+        ("worleyNoise2DVector2", worleyNoise2DVector2Cases),
+        ("worleyNoise2DVector3", worleyNoise2DVector3Cases),
+        ("worleyNoise3DFloat", worleyNoise3DFloatCases),
+        ("worleyNoise3DVector2", worleyNoise3DVector2Cases),
+        ("worleyNoise3DVector3", worleyNoise3DVector3Cases),
+        ("SGValue.bitangent", sourceBitangentCases),
+        ("SGValue.cameraPosition", sourceCameraPositionCases),
+        ("SGValue.frame", sourceFrameCases),
+        ("SGValue.geomcolorColor3", sourceGeomcolorColor3Cases),
+        ("SGValue.geomcolorColor4", sourceGeomcolorColor4Cases),
+        ("SGValue.geomcolorFloat", sourceGeomcolorFloatCases),
+        ("SGValue.geometryModifierCustomAttribute", sourceGeometryModifierCustomAttributeCases),
+        ("SGValue.geometryModifierCustomAttributeHalf20", sourceGeometryModifierCustomAttributeHalf20Cases),
+        ("SGValue.geometryModifierCustomAttributeHalf21", sourceGeometryModifierCustomAttributeHalf21Cases),
+        ("SGValue.geometryModifierCustomAttributeHalf40", sourceGeometryModifierCustomAttributeHalf40Cases),
+        ("SGValue.geometryModifierCustomAttributeHalf41", sourceGeometryModifierCustomAttributeHalf41Cases),
+        ("SGValue.geometryModifierCustomAttributeHalf42", sourceGeometryModifierCustomAttributeHalf42Cases),
+        ("SGValue.geometryModifierCustomAttributeHalf43", sourceGeometryModifierCustomAttributeHalf43Cases),
+        ("SGValue.geometryModifierCustomParameter", sourceGeometryModifierCustomParameterCases),
+        ("SGValue.geometryModifierModelPositionOffset", sourceGeometryModifierModelPositionOffsetCases),
+        ("SGValue.geometryModifierModelToView", sourceGeometryModifierModelToViewCases),
+        ("SGValue.geometryModifierModelToWorld", sourceGeometryModifierModelToWorldCases),
+        ("SGValue.geometryModifierNormalToWorld", sourceGeometryModifierNormalToWorldCases),
+        ("SGValue.geometryModifierProjectionToView", sourceGeometryModifierProjectionToViewCases),
+        ("SGValue.geometryModifierUV0Offset", sourceGeometryModifierUV0OffsetCases),
+        ("SGValue.geometryModifierUV0Transform", sourceGeometryModifierUV0TransformCases),
+        ("SGValue.geometryModifierUV1Offset", sourceGeometryModifierUV1OffsetCases),
+        ("SGValue.geometryModifierUV1Transform", sourceGeometryModifierUV1TransformCases),
+        ("SGValue.geometryModifierVertexId", sourceGeometryModifierVertexIdCases),
+        ("SGValue.geometryModifierViewToProjection", sourceGeometryModifierViewToProjectionCases),
+        ("SGValue.geometryModifierWorldToModel", sourceGeometryModifierWorldToModelCases),
+        ("SGValue.materialParametersBaseColorTint", sourceMaterialParametersBaseColorTintCases),
+        ("SGValue.materialParametersClearcoatRoughnessScale", sourceMaterialParametersClearcoatRoughnessScaleCases),
+        ("SGValue.materialParametersClearcoatScale", sourceMaterialParametersClearcoatScaleCases),
+        ("SGValue.materialParametersEmissiveColor", sourceMaterialParametersEmissiveColorCases),
+        ("SGValue.materialParametersMetallicScale", sourceMaterialParametersMetallicScaleCases),
+        ("SGValue.materialParametersOpacityScale", sourceMaterialParametersOpacityScaleCases),
+        ("SGValue.materialParametersOpacityThreshold", sourceMaterialParametersOpacityThresholdCases),
+        ("SGValue.materialParametersRoughnessScale", sourceMaterialParametersRoughnessScaleCases),
+        ("SGValue.materialParametersSpecularScale", sourceMaterialParametersSpecularScaleCases),
+        ("SGValue.normal", sourceNormalCases),
+        ("SGValue.position", sourcePositionCases),
+        ("SGValue.surfaceBaseColor", sourceSurfaceBaseColorCases),
+        ("SGValue.surfaceClearcoat", sourceSurfaceClearcoatCases),
+        ("SGValue.surfaceClearcoatRoughness", sourceSurfaceClearcoatRoughnessCases),
+        ("SGValue.surfaceCustomAttribute", sourceSurfaceCustomAttributeCases),
+        ("SGValue.surfaceCustomAttributeHalf20", sourceSurfaceCustomAttributeHalf20Cases),
+        ("SGValue.surfaceCustomAttributeHalf21", sourceSurfaceCustomAttributeHalf21Cases),
+        ("SGValue.surfaceCustomAttributeHalf40", sourceSurfaceCustomAttributeHalf40Cases),
+        ("SGValue.surfaceCustomAttributeHalf41", sourceSurfaceCustomAttributeHalf41Cases),
+        ("SGValue.surfaceCustomAttributeHalf42", sourceSurfaceCustomAttributeHalf42Cases),
+        ("SGValue.surfaceCustomAttributeHalf43", sourceSurfaceCustomAttributeHalf43Cases),
+        ("SGValue.surfaceCustomParameter", sourceSurfaceCustomParameterCases),
+        ("SGValue.surfaceEmissiveColor", sourceSurfaceEmissiveColorCases),
+        ("SGValue.surfaceMetallic", sourceSurfaceMetallicCases),
+        ("SGValue.surfaceModelToView", sourceSurfaceModelToViewCases),
+        ("SGValue.surfaceModelToWorld", sourceSurfaceModelToWorldCases),
+        ("SGValue.surfaceOpacity", sourceSurfaceOpacityCases),
+        ("SGValue.surfaceProjectionToView", sourceSurfaceProjectionToViewCases),
+        ("SGValue.surfaceRoughness", sourceSurfaceRoughnessCases),
+        ("SGValue.surfaceScreenPosition", sourceSurfaceScreenPositionCases),
+        ("SGValue.surfaceSpecular", sourceSurfaceSpecularCases),
+        ("SGValue.surfaceViewDirection", sourceSurfaceViewDirectionCases),
+        ("SGValue.surfaceViewToProjection", sourceSurfaceViewToProjectionCases),
+        ("SGValue.surfaceWorldToView", sourceSurfaceWorldToViewCases),
+        ("SGValue.tangent", sourceTangentCases),
+        ("SGValue.texcoordVector2", sourceTexcoordVector2Cases),
+        ("SGValue.texcoordVector3", sourceTexcoordVector3Cases),
+        ("SGValue.time", sourceTimeCases),
+        ("SGValue.upDirection", sourceUpDirectionCases),
+        ("SGValue.viewDirection", sourceViewDirectionCases),
+    ]
+    
+    static func absCases() -> [OperationTestCase] {
+        var cases: [OperationTestCase] = []
+        cases.append(OperationTestCase(nodeType: "ND_absval_color3", inputs: [.color3f], output: .color3f) { ShaderGraphCoder.abs($0[0] as! SGColor) })
+        cases.append(OperationTestCase(nodeType: "ND_absval_color4", inputs: [.color4f], output: .color4f) { ShaderGraphCoder.abs($0[0] as! SGColor) })
+        cases.append(OperationTestCase(nodeType: "ND_absval_float", inputs: [.float], output: .float) { ShaderGraphCoder.abs($0[0] as! SGScalar) })
+        cases.append(OperationTestCase(nodeType: "ND_absval_half", inputs: [.half], output: .half) { ShaderGraphCoder.abs($0[0] as! SGScalar) })
+        cases.append(OperationTestCase(nodeType: "ND_absval_vector2", inputs: [.vector2f], output: .vector2f) { ShaderGraphCoder.abs($0[0] as! SGVector) })
+        cases.append(OperationTestCase(nodeType: "ND_absval_vector3", inputs: [.vector3f], output: .vector3f) { ShaderGraphCoder.abs($0[0] as! SGVector) })
+        cases.append(OperationTestCase(nodeType: "ND_absval_vector4", inputs: [.vector4f], output: .vector4f) { ShaderGraphCoder.abs($0[0] as! SGVector) })
+        return cases
+    }
+    func testAbs() throws {
+        try check(OperationTests.absCases())
+    }
+    
+    static func acosCases() -> [OperationTestCase] {
+        var cases: [OperationTestCase] = []
+        cases.append(OperationTestCase(nodeType: "ND_acos_float", inputs: [.float], output: .float) { ShaderGraphCoder.acos($0[0] as! SGScalar) })
+        cases.append(OperationTestCase(nodeType: "ND_acos_half", inputs: [.half], output: .half) { ShaderGraphCoder.acos($0[0] as! SGScalar) })
+        cases.append(OperationTestCase(nodeType: "ND_acos_half2", inputs: [.vector2h], output: .vector2h) { ShaderGraphCoder.acos($0[0] as! SGVector) })
+        cases.append(OperationTestCase(nodeType: "ND_acos_half3", inputs: [.vector3h], output: .vector3h) { ShaderGraphCoder.acos($0[0] as! SGVector) })
+        cases.append(OperationTestCase(nodeType: "ND_acos_half4", inputs: [.vector4h], output: .vector4h) { ShaderGraphCoder.acos($0[0] as! SGVector) })
+        cases.append(OperationTestCase(nodeType: "ND_acos_vector2", inputs: [.vector2f], output: .vector2f) { ShaderGraphCoder.acos($0[0] as! SGVector) })
+        cases.append(OperationTestCase(nodeType: "ND_acos_vector3", inputs: [.vector3f], output: .vector3f) { ShaderGraphCoder.acos($0[0] as! SGVector) })
+        cases.append(OperationTestCase(nodeType: "ND_acos_vector4", inputs: [.vector4f], output: .vector4f) { ShaderGraphCoder.acos($0[0] as! SGVector) })
+        return cases
+    }
+    func testAcos() throws {
+        try check(OperationTests.acosCases())
+    }
+    
+    static func addCases() -> [OperationTestCase] {
+        var cases: [OperationTestCase] = []
+        cases.append(OperationTestCase(nodeType: "ND_add_color3", inputs: [.color3f, .color3f], output: .color3f) { ShaderGraphCoder.add($0[0] as! SGColor, $0[1] as! SGNumeric) })
+        cases.append(OperationTestCase(nodeType: "ND_add_color3FA", inputs: [.color3f, .float], output: .color3f) { ShaderGraphCoder.add($0[0] as! SGColor, $0[1] as! SGNumeric) })
+        cases.append(OperationTestCase(nodeType: "ND_add_color4", inputs: [.color4f, .color4f], output: .color4f) { ShaderGraphCoder.add($0[0] as! SGColor, $0[1] as! SGNumeric) })
+        cases.append(OperationTestCase(nodeType: "ND_add_color4FA", inputs: [.color4f, .float], output: .color4f) { ShaderGraphCoder.add($0[0] as! SGColor, $0[1] as! SGNumeric) })
+        cases.append(OperationTestCase(nodeType: "ND_add_float", inputs: [.float, .float], output: .float) { ShaderGraphCoder.add($0[0] as! SGScalar, $0[1] as! SGNumeric) })
+        cases.append(OperationTestCase(nodeType: "ND_add_half", inputs: [.half, .half], output: .half) { ShaderGraphCoder.add($0[0] as! SGScalar, $0[1] as! SGNumeric) })
+        cases.append(OperationTestCase(nodeType: "ND_add_matrix22", inputs: [.matrix2d, .matrix2d], output: .matrix2d) { ShaderGraphCoder.add($0[0] as! SGMatrix, $0[1] as! SGNumeric) })
+        cases.append(OperationTestCase(nodeType: "ND_add_matrix22FA", inputs: [.matrix2d, .float], output: .matrix2d) { ShaderGraphCoder.add($0[0] as! SGMatrix, $0[1] as! SGNumeric) })
+        cases.append(OperationTestCase(nodeType: "ND_add_matrix33", inputs: [.matrix3d, .matrix3d], output: .matrix3d) { ShaderGraphCoder.add($0[0] as! SGMatrix, $0[1] as! SGNumeric) })
+        cases.append(OperationTestCase(nodeType: "ND_add_matrix33FA", inputs: [.matrix3d, .float], output: .matrix3d) { ShaderGraphCoder.add($0[0] as! SGMatrix, $0[1] as! SGNumeric) })
+        cases.append(OperationTestCase(nodeType: "ND_add_matrix44", inputs: [.matrix4d, .matrix4d], output: .matrix4d) { ShaderGraphCoder.add($0[0] as! SGMatrix, $0[1] as! SGNumeric) })
+        cases.append(OperationTestCase(nodeType: "ND_add_matrix44FA", inputs: [.matrix4d, .float], output: .matrix4d) { ShaderGraphCoder.add($0[0] as! SGMatrix, $0[1] as! SGNumeric) })
+        cases.append(OperationTestCase(nodeType: "ND_add_vector2", inputs: [.vector2f, .vector2f], output: .vector2f) { ShaderGraphCoder.add($0[0] as! SGVector, $0[1] as! SGNumeric) })
+        cases.append(OperationTestCase(nodeType: "ND_add_vector2FA", inputs: [.vector2f, .float], output: .vector2f) { ShaderGraphCoder.add($0[0] as! SGVector, $0[1] as! SGNumeric) })
+        cases.append(OperationTestCase(nodeType: "ND_add_vector3", inputs: [.vector3f, .vector3f], output: .vector3f) { ShaderGraphCoder.add($0[0] as! SGVector, $0[1] as! SGNumeric) })
+        cases.append(OperationTestCase(nodeType: "ND_add_vector3FA", inputs: [.vector3f, .float], output: .vector3f) { ShaderGraphCoder.add($0[0] as! SGVector, $0[1] as! SGNumeric) })
+        cases.append(OperationTestCase(nodeType: "ND_add_vector4", inputs: [.vector4f, .vector4f], output: .vector4f) { ShaderGraphCoder.add($0[0] as! SGVector, $0[1] as! SGNumeric) })
+        cases.append(OperationTestCase(nodeType: "ND_add_vector4FA", inputs: [.vector4f, .float], output: .vector4f) { ShaderGraphCoder.add($0[0] as! SGVector, $0[1] as! SGNumeric) })
+        return cases
+    }
+    func testAdd() throws {
+        try check(OperationTests.addCases())
+    }
+    
+    static func ambientOcclusionCases() -> [OperationTestCase] {
+        var cases: [OperationTestCase] = []
+        cases.append(OperationTestCase(nodeType: "ND_ambientocclusion_float", inputs: [.float, .float], output: .float) { ShaderGraphCoder.ambientOcclusion(coneangle: $0[0] as! SGScalar, maxdistance: $0[1] as! SGScalar) })
+        return cases
+    }
+    func testAmbientOcclusion() throws {
+        try check(OperationTests.ambientOcclusionCases())
+    }
+    
+    static func asinCases() -> [OperationTestCase] {
+        var cases: [OperationTestCase] = []
+        cases.append(OperationTestCase(nodeType: "ND_asin_float", inputs: [.float], output: .float) { ShaderGraphCoder.asin($0[0] as! SGScalar) })
+        cases.append(OperationTestCase(nodeType: "ND_asin_half", inputs: [.half], output: .half) { ShaderGraphCoder.asin($0[0] as! SGScalar) })
+        cases.append(OperationTestCase(nodeType: "ND_asin_half2", inputs: [.vector2h], output: .vector2h) { ShaderGraphCoder.asin($0[0] as! SGVector) })
+        cases.append(OperationTestCase(nodeType: "ND_asin_half3", inputs: [.vector3h], output: .vector3h) { ShaderGraphCoder.asin($0[0] as! SGVector) })
+        cases.append(OperationTestCase(nodeType: "ND_asin_half4", inputs: [.vector4h], output: .vector4h) { ShaderGraphCoder.asin($0[0] as! SGVector) })
+        cases.append(OperationTestCase(nodeType: "ND_asin_vector2", inputs: [.vector2f], output: .vector2f) { ShaderGraphCoder.asin($0[0] as! SGVector) })
+        cases.append(OperationTestCase(nodeType: "ND_asin_vector3", inputs: [.vector3f], output: .vector3f) { ShaderGraphCoder.asin($0[0] as! SGVector) })
+        cases.append(OperationTestCase(nodeType: "ND_asin_vector4", inputs: [.vector4f], output: .vector4f) { ShaderGraphCoder.asin($0[0] as! SGVector) })
+        return cases
+    }
+    func testAsin() throws {
+        try check(OperationTests.asinCases())
+    }
+    
+    static func atan2Cases() -> [OperationTestCase] {
+        var cases: [OperationTestCase] = []
+        cases.append(OperationTestCase(nodeType: "ND_atan2_float", inputs: [.float, .float], output: .float) { ShaderGraphCoder.atan2(iny: $0[0] as! SGScalar, inx: $0[1] as! SGScalar) })
+        cases.append(OperationTestCase(nodeType: "ND_atan2_half", inputs: [.half, .half], output: .half) { ShaderGraphCoder.atan2(iny: $0[0] as! SGScalar, inx: $0[1] as! SGScalar) })
+        cases.append(OperationTestCase(nodeType: "ND_atan2_half2", inputs: [.vector2h, .vector2h], output: .vector2h) { ShaderGraphCoder.atan2(iny: $0[0] as! SGVector, inx: $0[1] as! SGVector) })
+        cases.append(OperationTestCase(nodeType: "ND_atan2_half3", inputs: [.vector3h, .vector3h], output: .vector3h) { ShaderGraphCoder.atan2(iny: $0[0] as! SGVector, inx: $0[1] as! SGVector) })
+        cases.append(OperationTestCase(nodeType: "ND_atan2_half4", inputs: [.vector4h, .vector4h], output: .vector4h) { ShaderGraphCoder.atan2(iny: $0[0] as! SGVector, inx: $0[1] as! SGVector) })
+        cases.append(OperationTestCase(nodeType: "ND_atan2_vector2", inputs: [.vector2f, .vector2f], output: .vector2f) { ShaderGraphCoder.atan2(iny: $0[0] as! SGVector, inx: $0[1] as! SGVector) })
+        cases.append(OperationTestCase(nodeType: "ND_atan2_vector3", inputs: [.vector3f, .vector3f], output: .vector3f) { ShaderGraphCoder.atan2(iny: $0[0] as! SGVector, inx: $0[1] as! SGVector) })
+        cases.append(OperationTestCase(nodeType: "ND_atan2_vector4", inputs: [.vector4f, .vector4f], output: .vector4f) { ShaderGraphCoder.atan2(iny: $0[0] as! SGVector, inx: $0[1] as! SGVector) })
+        return cases
+    }
+    func testAtan2() throws {
+        try check(OperationTests.atan2Cases())
+    }
+    
+    static func blurCases() -> [OperationTestCase] {
+        var cases: [OperationTestCase] = []
+        cases.append(OperationTestCase(nodeType: "ND_blur_color3", inputs: [.color3f, .float], output: .color3f) { ShaderGraphCoder.blur($0[0] as! SGColor, size: $0[1] as! SGScalar) })
+        cases.append(OperationTestCase(nodeType: "ND_blur_color4", inputs: [.color4f, .float], output: .color4f) { ShaderGraphCoder.blur($0[0] as! SGColor, size: $0[1] as! SGScalar) })
+        cases.append(OperationTestCase(nodeType: "ND_blur_float", inputs: [.float, .float], output: .float) { ShaderGraphCoder.blur($0[0] as! SGScalar, size: $0[1] as! SGScalar) })
+        cases.append(OperationTestCase(nodeType: "ND_blur_half", inputs: [.half, .half], output: .half) { ShaderGraphCoder.blur($0[0] as! SGScalar, size: $0[1] as! SGScalar) })
+        cases.append(OperationTestCase(nodeType: "ND_blur_vector2", inputs: [.vector2f, .float], output: .vector2f) { ShaderGraphCoder.blur($0[0] as! SGVector, size: $0[1] as! SGScalar) })
+        cases.append(OperationTestCase(nodeType: "ND_blur_vector3", inputs: [.vector3f, .float], output: .vector3f) { ShaderGraphCoder.blur($0[0] as! SGVector, size: $0[1] as! SGScalar) })
+        cases.append(OperationTestCase(nodeType: "ND_blur_vector4", inputs: [.vector4f, .float], output: .vector4f) { ShaderGraphCoder.blur($0[0] as! SGVector, size: $0[1] as! SGScalar) })
+        return cases
+    }
+    func testBlur() throws {
+        try check(OperationTests.blurCases())
+    }
+    
+    static func burnCases() -> [OperationTestCase] {
+        var cases: [OperationTestCase] = []
+        cases.append(OperationTestCase(nodeType: "ND_burn_color3", inputs: [.color3f, .color3f, .float], output: .color3f) { ShaderGraphCoder.burn(fg: $0[0] as! SGColor, bg: $0[1] as! SGColor, mix: $0[2] as! SGScalar) })
+        cases.append(OperationTestCase(nodeType: "ND_burn_color4", inputs: [.color4f, .color4f, .float], output: .color4f) { ShaderGraphCoder.burn(fg: $0[0] as! SGColor, bg: $0[1] as! SGColor, mix: $0[2] as! SGScalar) })
+        cases.append(OperationTestCase(nodeType: "ND_burn_float", inputs: [.float, .float, .float], output: .float) { ShaderGraphCoder.burn(fg: $0[0] as! SGScalar, bg: $0[1] as! SGScalar, mix: $0[2] as! SGScalar) })
+        cases.append(OperationTestCase(nodeType: "ND_burn_half", inputs: [.half, .half, .half], output: .half) { ShaderGraphCoder.burn(fg: $0[0] as! SGScalar, bg: $0[1] as! SGScalar, mix: $0[2] as! SGScalar) })
+        return cases
+    }
+    func testBurn() throws {
+        try check(OperationTests.burnCases())
+    }
+    
+    static func ceilCases() -> [OperationTestCase] {
+        var cases: [OperationTestCase] = []
+        cases.append(OperationTestCase(nodeType: "ND_ceil_color3", inputs: [.color3f], output: .color3f) { ShaderGraphCoder.ceil($0[0] as! SGColor) })
+        cases.append(OperationTestCase(nodeType: "ND_ceil_color4", inputs: [.color4f], output: .color4f) { ShaderGraphCoder.ceil($0[0] as! SGColor) })
+        cases.append(OperationTestCase(nodeType: "ND_ceil_float", inputs: [.float], output: .float) { ShaderGraphCoder.ceil($0[0] as! SGScalar) })
+        cases.append(OperationTestCase(nodeType: "ND_ceil_half", inputs: [.half], output: .half) { ShaderGraphCoder.ceil($0[0] as! SGScalar) })
+        cases.append(OperationTestCase(nodeType: "ND_ceil_vector2", inputs: [.vector2f], output: .vector2f) { ShaderGraphCoder.ceil($0[0] as! SGVector) })
+        cases.append(OperationTestCase(nodeType: "ND_ceil_vector3", inputs: [.vector3f], output: .vector3f) { ShaderGraphCoder.ceil($0[0] as! SGVector) })
+        cases.append(OperationTestCase(nodeType: "ND_ceil_vector4", inputs: [.vector4f], output: .vector4f) { ShaderGraphCoder.ceil($0[0] as! SGVector) })
+        return cases
+    }
+    func testCeil() throws {
+        try check(OperationTests.ceilCases())
+    }
+    
+    static func cellNoise2DCases() -> [OperationTestCase] {
+        var cases: [OperationTestCase] = []
+        cases.append(OperationTestCase(nodeType: "ND_cellnoise2d_float", inputs: [.vector2f], output: .float) { ShaderGraphCoder.cellNoise2D(texcoord: $0[0] as! SGVector) })
+        return cases
+    }
+    func testCellNoise2D() throws {
+        try check(OperationTests.cellNoise2DCases())
+    }
+    
+    static func cellNoise3DCases() -> [OperationTestCase] {
+        var cases: [OperationTestCase] = []
+        cases.append(OperationTestCase(nodeType: "ND_cellnoise3d_float", inputs: [.vector3f], output: .float) { ShaderGraphCoder.cellNoise3D(position: $0[0] as! SGVector) })
+        return cases
+    }
+    func testCellNoise3D() throws {
+        try check(OperationTests.cellNoise3DCases())
+    }
+    
+    static func clampCases() -> [OperationTestCase] {
+        var cases: [OperationTestCase] = []
+        cases.append(OperationTestCase(nodeType: "ND_clamp_color3", inputs: [.color3f, .color3f, .color3f], output: .color3f) { ShaderGraphCoder.clamp($0[0] as! SGColor, min: $0[1] as! SGNumeric, max: $0[2] as! SGNumeric) })
+        cases.append(OperationTestCase(nodeType: "ND_clamp_color3FA", inputs: [.color3f, .float, .float], output: .color3f) { ShaderGraphCoder.clamp($0[0] as! SGColor, min: $0[1] as! SGNumeric, max: $0[2] as! SGNumeric) })
+        cases.append(OperationTestCase(nodeType: "ND_clamp_color4", inputs: [.color4f, .color4f, .color4f], output: .color4f) { ShaderGraphCoder.clamp($0[0] as! SGColor, min: $0[1] as! SGNumeric, max: $0[2] as! SGNumeric) })
+        cases.append(OperationTestCase(nodeType: "ND_clamp_color4FA", inputs: [.color4f, .float, .float], output: .color4f) { ShaderGraphCoder.clamp($0[0] as! SGColor, min: $0[1] as! SGNumeric, max: $0[2] as! SGNumeric) })
+        cases.append(OperationTestCase(nodeType: "ND_clamp_float", inputs: [.float, .float, .float], output: .float) { ShaderGraphCoder.clamp($0[0] as! SGScalar, min: $0[1] as! SGNumeric, max: $0[2] as! SGNumeric) })
+        cases.append(OperationTestCase(nodeType: "ND_clamp_half", inputs: [.half, .half, .half], output: .half) { ShaderGraphCoder.clamp($0[0] as! SGScalar, min: $0[1] as! SGNumeric, max: $0[2] as! SGNumeric) })
+        cases.append(OperationTestCase(nodeType: "ND_clamp_half2", inputs: [.vector2h, .vector2h, .vector2h], output: .vector2h) { ShaderGraphCoder.clamp($0[0] as! SGVector, min: $0[1] as! SGNumeric, max: $0[2] as! SGNumeric) })
+        cases.append(OperationTestCase(nodeType: "ND_clamp_half2FA", inputs: [.vector2h, .float, .float], output: .vector2h) { ShaderGraphCoder.clamp($0[0] as! SGVector, min: $0[1] as! SGNumeric, max: $0[2] as! SGNumeric) })
+        cases.append(OperationTestCase(nodeType: "ND_clamp_half3", inputs: [.vector3h, .vector3h, .vector3h], output: .vector3h) { ShaderGraphCoder.clamp($0[0] as! SGVector, min: $0[1] as! SGNumeric, max: $0[2] as! SGNumeric) })
+        cases.append(OperationTestCase(nodeType: "ND_clamp_half3FA", inputs: [.vector3h, .float, .float], output: .vector3h) { ShaderGraphCoder.clamp($0[0] as! SGVector, min: $0[1] as! SGNumeric, max: $0[2] as! SGNumeric) })
+        cases.append(OperationTestCase(nodeType: "ND_clamp_half4", inputs: [.vector4h, .vector4h, .vector4h], output: .vector4h) { ShaderGraphCoder.clamp($0[0] as! SGVector, min: $0[1] as! SGNumeric, max: $0[2] as! SGNumeric) })
+        cases.append(OperationTestCase(nodeType: "ND_clamp_half4FA", inputs: [.vector4h, .float, .float], output: .vector4h) { ShaderGraphCoder.clamp($0[0] as! SGVector, min: $0[1] as! SGNumeric, max: $0[2] as! SGNumeric) })
+        cases.append(OperationTestCase(nodeType: "ND_clamp_vector2", inputs: [.vector2f, .vector2f, .vector2f], output: .vector2f) { ShaderGraphCoder.clamp($0[0] as! SGVector, min: $0[1] as! SGNumeric, max: $0[2] as! SGNumeric) })
+        cases.append(OperationTestCase(nodeType: "ND_clamp_vector2FA", inputs: [.vector2f, .float, .float], output: .vector2f) { ShaderGraphCoder.clamp($0[0] as! SGVector, min: $0[1] as! SGNumeric, max: $0[2] as! SGNumeric) })
+        cases.append(OperationTestCase(nodeType: "ND_clamp_vector3", inputs: [.vector3f, .vector3f, .vector3f], output: .vector3f) { ShaderGraphCoder.clamp($0[0] as! SGVector, min: $0[1] as! SGNumeric, max: $0[2] as! SGNumeric) })
+        cases.append(OperationTestCase(nodeType: "ND_clamp_vector3FA", inputs: [.vector3f, .float, .float], output: .vector3f) { ShaderGraphCoder.clamp($0[0] as! SGVector, min: $0[1] as! SGNumeric, max: $0[2] as! SGNumeric) })
+        cases.append(OperationTestCase(nodeType: "ND_clamp_vector4", inputs: [.vector4f, .vector4f, .vector4f], output: .vector4f) { ShaderGraphCoder.clamp($0[0] as! SGVector, min: $0[1] as! SGNumeric, max: $0[2] as! SGNumeric) })
+        cases.append(OperationTestCase(nodeType: "ND_clamp_vector4FA", inputs: [.vector4f, .float, .float], output: .vector4f) { ShaderGraphCoder.clamp($0[0] as! SGVector, min: $0[1] as! SGNumeric, max: $0[2] as! SGNumeric) })
+        return cases
+    }
+    func testClamp() throws {
+        try check(OperationTests.clampCases())
+    }
+    
+    static func contrastCases() -> [OperationTestCase] {
+        var cases: [OperationTestCase] = []
+        cases.append(OperationTestCase(nodeType: "ND_contrast_color3", inputs: [.color3f, .color3f, .color3f], output: .color3f) { ShaderGraphCoder.contrast($0[0] as! SGColor, amount: $0[1] as! SGNumeric, pivot: $0[2] as! SGNumeric) })
+        cases.append(OperationTestCase(nodeType: "ND_contrast_color3FA", inputs: [.color3f, .float, .float], output: .color3f) { ShaderGraphCoder.contrast($0[0] as! SGColor, amount: $0[1] as! SGNumeric, pivot: $0[2] as! SGNumeric) })
+        cases.append(OperationTestCase(nodeType: "ND_contrast_color4", inputs: [.color4f, .color4f, .color4f], output: .color4f) { ShaderGraphCoder.contrast($0[0] as! SGColor, amount: $0[1] as! SGNumeric, pivot: $0[2] as! SGNumeric) })
+        cases.append(OperationTestCase(nodeType: "ND_contrast_color4FA", inputs: [.color4f, .float, .float], output: .color4f) { ShaderGraphCoder.contrast($0[0] as! SGColor, amount: $0[1] as! SGNumeric, pivot: $0[2] as! SGNumeric) })
+        cases.append(OperationTestCase(nodeType: "ND_contrast_float", inputs: [.float, .float, .float], output: .float) { ShaderGraphCoder.contrast($0[0] as! SGScalar, amount: $0[1] as! SGNumeric, pivot: $0[2] as! SGNumeric) })
+        cases.append(OperationTestCase(nodeType: "ND_contrast_vector2", inputs: [.vector2f, .vector2f, .vector2f], output: .vector2f) { ShaderGraphCoder.contrast($0[0] as! SGVector, amount: $0[1] as! SGNumeric, pivot: $0[2] as! SGNumeric) })
+        cases.append(OperationTestCase(nodeType: "ND_contrast_vector2FA", inputs: [.vector2f, .float, .float], output: .vector2f) { ShaderGraphCoder.contrast($0[0] as! SGVector, amount: $0[1] as! SGNumeric, pivot: $0[2] as! SGNumeric) })
+        cases.append(OperationTestCase(nodeType: "ND_contrast_vector3", inputs: [.vector3f, .vector3f, .vector3f], output: .vector3f) { ShaderGraphCoder.contrast($0[0] as! SGVector, amount: $0[1] as! SGNumeric, pivot: $0[2] as! SGNumeric) })
+        cases.append(OperationTestCase(nodeType: "ND_contrast_vector3FA", inputs: [.vector3f, .float, .float], output: .vector3f) { ShaderGraphCoder.contrast($0[0] as! SGVector, amount: $0[1] as! SGNumeric, pivot: $0[2] as! SGNumeric) })
+        cases.append(OperationTestCase(nodeType: "ND_contrast_vector4", inputs: [.vector4f, .vector4f, .vector4f], output: .vector4f) { ShaderGraphCoder.contrast($0[0] as! SGVector, amount: $0[1] as! SGNumeric, pivot: $0[2] as! SGNumeric) })
+        cases.append(OperationTestCase(nodeType: "ND_contrast_vector4FA", inputs: [.vector4f, .float, .float], output: .vector4f) { ShaderGraphCoder.contrast($0[0] as! SGVector, amount: $0[1] as! SGNumeric, pivot: $0[2] as! SGNumeric) })
+        return cases
+    }
+    func testContrast() throws {
+        try check(OperationTests.contrastCases())
+    }
+    
+    static func cosCases() -> [OperationTestCase] {
+        var cases: [OperationTestCase] = []
+        cases.append(OperationTestCase(nodeType: "ND_cos_float", inputs: [.float], output: .float) { ShaderGraphCoder.cos($0[0] as! SGScalar) })
+        cases.append(OperationTestCase(nodeType: "ND_cos_half", inputs: [.half], output: .half) { ShaderGraphCoder.cos($0[0] as! SGScalar) })
+        cases.append(OperationTestCase(nodeType: "ND_cos_half2", inputs: [.vector2h], output: .vector2h) { ShaderGraphCoder.cos($0[0] as! SGVector) })
+        cases.append(OperationTestCase(nodeType: "ND_cos_half3", inputs: [.vector3h], output: .vector3h) { ShaderGraphCoder.cos($0[0] as! SGVector) })
+        cases.append(OperationTestCase(nodeType: "ND_cos_half4", inputs: [.vector4h], output: .vector4h) { ShaderGraphCoder.cos($0[0] as! SGVector) })
+        cases.append(OperationTestCase(nodeType: "ND_cos_vector2", inputs: [.vector2f], output: .vector2f) { ShaderGraphCoder.cos($0[0] as! SGVector) })
+        cases.append(OperationTestCase(nodeType: "ND_cos_vector3", inputs: [.vector3f], output: .vector3f) { ShaderGraphCoder.cos($0[0] as! SGVector) })
+        cases.append(OperationTestCase(nodeType: "ND_cos_vector4", inputs: [.vector4f], output: .vector4f) { ShaderGraphCoder.cos($0[0] as! SGVector) })
+        return cases
+    }
+    func testCos() throws {
+        try check(OperationTests.cosCases())
+    }
+    
+    static func crossCases() -> [OperationTestCase] {
+        var cases: [OperationTestCase] = []
+        cases.append(OperationTestCase(nodeType: "ND_crossproduct_half3", inputs: [.vector3h, .vector3h], output: .vector3h) { ShaderGraphCoder.cross($0[0] as! SGVector, $0[1] as! SGVector) })
+        cases.append(OperationTestCase(nodeType: "ND_crossproduct_vector3", inputs: [.vector3f, .vector3f], output: .vector3f) { ShaderGraphCoder.cross($0[0] as! SGVector, $0[1] as! SGVector) })
+        return cases
+    }
+    func testCross() throws {
+        try check(OperationTests.crossCases())
+    }
+    
+    static func determinantCases() -> [OperationTestCase] {
+        var cases: [OperationTestCase] = []
+        cases.append(OperationTestCase(nodeType: "ND_determinant_matrix22", inputs: [.matrix2d], output: .float) { ShaderGraphCoder.determinant($0[0] as! SGMatrix) })
+        cases.append(OperationTestCase(nodeType: "ND_determinant_matrix33", inputs: [.matrix3d], output: .float) { ShaderGraphCoder.determinant($0[0] as! SGMatrix) })
+        cases.append(OperationTestCase(nodeType: "ND_determinant_matrix44", inputs: [.matrix4d], output: .float) { ShaderGraphCoder.determinant($0[0] as! SGMatrix) })
+        return cases
+    }
+    func testDeterminant() throws {
+        try check(OperationTests.determinantCases())
+    }
+    
+    static func differenceCases() -> [OperationTestCase] {
+        var cases: [OperationTestCase] = []
+        cases.append(OperationTestCase(nodeType: "ND_difference_color3", inputs: [.color3f, .color3f, .float], output: .color3f) { ShaderGraphCoder.difference(fg: $0[0] as! SGColor, bg: $0[1] as! SGColor, mix: $0[2] as! SGScalar) })
+        cases.append(OperationTestCase(nodeType: "ND_difference_color4", inputs: [.color4f, .color4f, .float], output: .color4f) { ShaderGraphCoder.difference(fg: $0[0] as! SGColor, bg: $0[1] as! SGColor, mix: $0[2] as! SGScalar) })
+        cases.append(OperationTestCase(nodeType: "ND_difference_float", inputs: [.float, .float, .float], output: .float) { ShaderGraphCoder.difference(fg: $0[0] as! SGScalar, bg: $0[1] as! SGScalar, mix: $0[2] as! SGScalar) })
+        cases.append(OperationTestCase(nodeType: "ND_difference_half", inputs: [.half, .half, .half], output: .half) { ShaderGraphCoder.difference(fg: $0[0] as! SGScalar, bg: $0[1] as! SGScalar, mix: $0[2] as! SGScalar) })
+        return cases
+    }
+    func testDifference() throws {
+        try check(OperationTests.differenceCases())
+    }
+    
+    static func disjointoverCases() -> [OperationTestCase] {
+        var cases: [OperationTestCase] = []
+        cases.append(OperationTestCase(nodeType: "ND_disjointover_color4", inputs: [.color4f, .color4f, .float], output: .color4f) { ShaderGraphCoder.disjointover(fg: $0[0] as! SGColor, bg: $0[1] as! SGColor, mix: $0[2] as! SGScalar) })
+        return cases
+    }
+    func testDisjointover() throws {
+        try check(OperationTests.disjointoverCases())
+    }
+    
+    static func divideCases() -> [OperationTestCase] {
+        var cases: [OperationTestCase] = []
+        cases.append(OperationTestCase(nodeType: "ND_divide_color3", inputs: [.color3f, .color3f], output: .color3f) { ShaderGraphCoder.divide($0[0] as! SGColor, $0[1] as! SGNumeric) })
+        cases.append(OperationTestCase(nodeType: "ND_divide_color3FA", inputs: [.color3f, .float], output: .color3f) { ShaderGraphCoder.divide($0[0] as! SGColor, $0[1] as! SGNumeric) })
+        cases.append(OperationTestCase(nodeType: "ND_divide_color4", inputs: [.color4f, .color4f], output: .color4f) { ShaderGraphCoder.divide($0[0] as! SGColor, $0[1] as! SGNumeric) })
+        cases.append(OperationTestCase(nodeType: "ND_divide_color4FA", inputs: [.color4f, .float], output: .color4f) { ShaderGraphCoder.divide($0[0] as! SGColor, $0[1] as! SGNumeric) })
+        cases.append(OperationTestCase(nodeType: "ND_divide_float", inputs: [.float, .float], output: .float) { ShaderGraphCoder.divide($0[0] as! SGScalar, $0[1] as! SGNumeric) })
+        cases.append(OperationTestCase(nodeType: "ND_divide_half", inputs: [.half, .half], output: .half) { ShaderGraphCoder.divide($0[0] as! SGScalar, $0[1] as! SGNumeric) })
+        cases.append(OperationTestCase(nodeType: "ND_divide_matrix22", inputs: [.matrix2d, .matrix2d], output: .matrix2d) { ShaderGraphCoder.divide($0[0] as! SGMatrix, $0[1] as! SGNumeric) })
+        cases.append(OperationTestCase(nodeType: "ND_divide_matrix33", inputs: [.matrix3d, .matrix3d], output: .matrix3d) { ShaderGraphCoder.divide($0[0] as! SGMatrix, $0[1] as! SGNumeric) })
+        cases.append(OperationTestCase(nodeType: "ND_divide_matrix44", inputs: [.matrix4d, .matrix4d], output: .matrix4d) { ShaderGraphCoder.divide($0[0] as! SGMatrix, $0[1] as! SGNumeric) })
+        cases.append(OperationTestCase(nodeType: "ND_divide_vector2", inputs: [.vector2f, .vector2f], output: .vector2f) { ShaderGraphCoder.divide($0[0] as! SGVector, $0[1] as! SGNumeric) })
+        cases.append(OperationTestCase(nodeType: "ND_divide_vector2FA", inputs: [.vector2f, .float], output: .vector2f) { ShaderGraphCoder.divide($0[0] as! SGVector, $0[1] as! SGNumeric) })
+        cases.append(OperationTestCase(nodeType: "ND_divide_vector3", inputs: [.vector3f, .vector3f], output: .vector3f) { ShaderGraphCoder.divide($0[0] as! SGVector, $0[1] as! SGNumeric) })
+        cases.append(OperationTestCase(nodeType: "ND_divide_vector3FA", inputs: [.vector3f, .float], output: .vector3f) { ShaderGraphCoder.divide($0[0] as! SGVector, $0[1] as! SGNumeric) })
+        cases.append(OperationTestCase(nodeType: "ND_divide_vector4", inputs: [.vector4f, .vector4f], output: .vector4f) { ShaderGraphCoder.divide($0[0] as! SGVector, $0[1] as! SGNumeric) })
+        cases.append(OperationTestCase(nodeType: "ND_divide_vector4FA", inputs: [.vector4f, .float], output: .vector4f) { ShaderGraphCoder.divide($0[0] as! SGVector, $0[1] as! SGNumeric) })
+        return cases
+    }
+    func testDivide() throws {
+        try check(OperationTests.divideCases())
+    }
+    
+    static func dodgeCases() -> [OperationTestCase] {
+        var cases: [OperationTestCase] = []
+        cases.append(OperationTestCase(nodeType: "ND_dodge_color3", inputs: [.color3f, .color3f, .float], output: .color3f) { ShaderGraphCoder.dodge(fg: $0[0] as! SGColor, bg: $0[1] as! SGColor, mix: $0[2] as! SGScalar) })
+        cases.append(OperationTestCase(nodeType: "ND_dodge_color4", inputs: [.color4f, .color4f, .float], output: .color4f) { ShaderGraphCoder.dodge(fg: $0[0] as! SGColor, bg: $0[1] as! SGColor, mix: $0[2] as! SGScalar) })
+        cases.append(OperationTestCase(nodeType: "ND_dodge_float", inputs: [.float, .float, .float], output: .float) { ShaderGraphCoder.dodge(fg: $0[0] as! SGScalar, bg: $0[1] as! SGScalar, mix: $0[2] as! SGScalar) })
+        cases.append(OperationTestCase(nodeType: "ND_dodge_half", inputs: [.half, .half, .half], output: .half) { ShaderGraphCoder.dodge(fg: $0[0] as! SGScalar, bg: $0[1] as! SGScalar, mix: $0[2] as! SGScalar) })
+        return cases
+    }
+    func testDodge() throws {
+        try check(OperationTests.dodgeCases())
+    }
+    
+    static func dotCases() -> [OperationTestCase] {
+        var cases: [OperationTestCase] = []
+        cases.append(OperationTestCase(nodeType: "ND_dotproduct_half2", inputs: [.vector2h, .vector2h], output: .float) { ShaderGraphCoder.dot($0[0] as! SGVector, $0[1] as! SGVector) })
+        cases.append(OperationTestCase(nodeType: "ND_dotproduct_half3", inputs: [.vector3h, .vector3h], output: .float) { ShaderGraphCoder.dot($0[0] as! SGVector, $0[1] as! SGVector) })
+        cases.append(OperationTestCase(nodeType: "ND_dotproduct_half4", inputs: [.vector4h, .vector4h], output: .float) { ShaderGraphCoder.dot($0[0] as! SGVector, $0[1] as! SGVector) })
+        cases.append(OperationTestCase(nodeType: "ND_dotproduct_vector2", inputs: [.vector2f, .vector2f], output: .float) { ShaderGraphCoder.dot($0[0] as! SGVector, $0[1] as! SGVector) })
+        cases.append(OperationTestCase(nodeType: "ND_dotproduct_vector3", inputs: [.vector3f, .vector3f], output: .float) { ShaderGraphCoder.dot($0[0] as! SGVector, $0[1] as! SGVector) })
+        cases.append(OperationTestCase(nodeType: "ND_dotproduct_vector4", inputs: [.vector4f, .vector4f], output: .float) { ShaderGraphCoder.dot($0[0] as! SGVector, $0[1] as! SGVector) })
+        return cases
+    }
+    func testDot() throws {
+        try check(OperationTests.dotCases())
+    }
+    
+    static func expCases() -> [OperationTestCase] {
+        var cases: [OperationTestCase] = []
+        cases.append(OperationTestCase(nodeType: "ND_exp_float", inputs: [.float], output: .float) { ShaderGraphCoder.exp($0[0] as! SGScalar) })
+        cases.append(OperationTestCase(nodeType: "ND_exp_half", inputs: [.half], output: .half) { ShaderGraphCoder.exp($0[0] as! SGScalar) })
+        cases.append(OperationTestCase(nodeType: "ND_exp_half2", inputs: [.vector2h], output: .vector2h) { ShaderGraphCoder.exp($0[0] as! SGVector) })
+        cases.append(OperationTestCase(nodeType: "ND_exp_half3", inputs: [.vector3h], output: .vector3h) { ShaderGraphCoder.exp($0[0] as! SGVector) })
+        cases.append(OperationTestCase(nodeType: "ND_exp_half4", inputs: [.vector4h], output: .vector4h) { ShaderGraphCoder.exp($0[0] as! SGVector) })
+        cases.append(OperationTestCase(nodeType: "ND_exp_vector2", inputs: [.vector2f], output: .vector2f) { ShaderGraphCoder.exp($0[0] as! SGVector) })
+        cases.append(OperationTestCase(nodeType: "ND_exp_vector3", inputs: [.vector3f], output: .vector3f) { ShaderGraphCoder.exp($0[0] as! SGVector) })
+        cases.append(OperationTestCase(nodeType: "ND_exp_vector4", inputs: [.vector4f], output: .vector4f) { ShaderGraphCoder.exp($0[0] as! SGVector) })
+        return cases
+    }
+    func testExp() throws {
+        try check(OperationTests.expCases())
+    }
+    
+    static func extractCases() -> [OperationTestCase] {
+        var cases: [OperationTestCase] = []
+        cases.append(OperationTestCase(nodeType: "ND_extract_color3", inputs: [.color3f], output: .float) { ShaderGraphCoder.extract($0[0] as! SGSIMD) })
+        cases.append(OperationTestCase(nodeType: "ND_extract_color4", inputs: [.color4f], output: .float) { ShaderGraphCoder.extract($0[0] as! SGSIMD) })
+        cases.append(OperationTestCase(nodeType: "ND_extract_vector2", inputs: [.vector2f], output: .float) { ShaderGraphCoder.extract($0[0] as! SGSIMD) })
+        cases.append(OperationTestCase(nodeType: "ND_extract_vector3", inputs: [.vector3f], output: .float) { ShaderGraphCoder.extract($0[0] as! SGSIMD) })
+        cases.append(OperationTestCase(nodeType: "ND_extract_vector4", inputs: [.vector4f], output: .float) { ShaderGraphCoder.extract($0[0] as! SGSIMD) })
+        return cases
+    }
+    func testExtract() throws {
+        try check(OperationTests.extractCases())
+    }
+    
+    static func floorCases() -> [OperationTestCase] {
+        var cases: [OperationTestCase] = []
+        cases.append(OperationTestCase(nodeType: "ND_floor_color3", inputs: [.color3f], output: .color3f) { ShaderGraphCoder.floor($0[0] as! SGColor) })
+        cases.append(OperationTestCase(nodeType: "ND_floor_color4", inputs: [.color4f], output: .color4f) { ShaderGraphCoder.floor($0[0] as! SGColor) })
+        cases.append(OperationTestCase(nodeType: "ND_floor_float", inputs: [.float], output: .float) { ShaderGraphCoder.floor($0[0] as! SGScalar) })
+        cases.append(OperationTestCase(nodeType: "ND_floor_half", inputs: [.half], output: .half) { ShaderGraphCoder.floor($0[0] as! SGScalar) })
+        cases.append(OperationTestCase(nodeType: "ND_floor_vector2", inputs: [.vector2f], output: .vector2f) { ShaderGraphCoder.floor($0[0] as! SGVector) })
+        cases.append(OperationTestCase(nodeType: "ND_floor_vector3", inputs: [.vector3f], output: .vector3f) { ShaderGraphCoder.floor($0[0] as! SGVector) })
+        cases.append(OperationTestCase(nodeType: "ND_floor_vector4", inputs: [.vector4f], output: .vector4f) { ShaderGraphCoder.floor($0[0] as! SGVector) })
+        return cases
+    }
+    func testFloor() throws {
+        try check(OperationTests.floorCases())
+    }
+    
+    static func fractCases() -> [OperationTestCase] {
+        var cases: [OperationTestCase] = []
+        cases.append(OperationTestCase(nodeType: "ND_realitykit_fractional_color3", inputs: [.color3f], output: .color3f) { ShaderGraphCoder.fract($0[0] as! SGColor) })
+        cases.append(OperationTestCase(nodeType: "ND_realitykit_fractional_color4", inputs: [.color4f], output: .color4f) { ShaderGraphCoder.fract($0[0] as! SGColor) })
+        cases.append(OperationTestCase(nodeType: "ND_realitykit_fractional_float", inputs: [.float], output: .float) { ShaderGraphCoder.fract($0[0] as! SGScalar) })
+        cases.append(OperationTestCase(nodeType: "ND_realitykit_fractional_vector2", inputs: [.vector2f], output: .vector2f) { ShaderGraphCoder.fract($0[0] as! SGVector) })
+        cases.append(OperationTestCase(nodeType: "ND_realitykit_fractional_vector3", inputs: [.vector3f], output: .vector3f) { ShaderGraphCoder.fract($0[0] as! SGVector) })
+        cases.append(OperationTestCase(nodeType: "ND_realitykit_fractional_vector4", inputs: [.vector4f], output: .vector4f) { ShaderGraphCoder.fract($0[0] as! SGVector) })
+        return cases
+    }
+    func testFract() throws {
+        try check(OperationTests.fractCases())
+    }
+    
+    static func fractal3DCases() -> [OperationTestCase] {
+        var cases: [OperationTestCase] = []
+        cases.append(OperationTestCase(nodeType: "ND_fractal3d_color3", inputs: [.vector3f, .int, .float, .float, .vector3f], output: .color3f) { ShaderGraphCoder.fractal3D(amplitude: $0[0] as! SGNumeric, octaves: $0[1] as! SGScalar, lacunarity: $0[2] as! SGScalar, diminish: $0[3] as! SGScalar, position: $0[4] as! SGVector) })
+        cases.append(OperationTestCase(nodeType: "ND_fractal3d_color3FA", inputs: [.float, .int, .float, .float, .vector3f], output: .color3f) { ShaderGraphCoder.fractal3D(amplitude: $0[0] as! SGNumeric, octaves: $0[1] as! SGScalar, lacunarity: $0[2] as! SGScalar, diminish: $0[3] as! SGScalar, position: $0[4] as! SGVector) })
+        cases.append(OperationTestCase(nodeType: "ND_fractal3d_color4", inputs: [.vector4f, .int, .float, .float, .vector3f], output: .color4f) { ShaderGraphCoder.fractal3D(amplitude: $0[0] as! SGNumeric, octaves: $0[1] as! SGScalar, lacunarity: $0[2] as! SGScalar, diminish: $0[3] as! SGScalar, position: $0[4] as! SGVector) })
+        cases.append(OperationTestCase(nodeType: "ND_fractal3d_vector2", inputs: [.vector2f, .int, .float, .float, .vector3f], output: .vector2f) { ShaderGraphCoder.fractal3D(amplitude: $0[0] as! SGNumeric, octaves: $0[1] as! SGScalar, lacunarity: $0[2] as! SGScalar, diminish: $0[3] as! SGScalar, position: $0[4] as! SGVector) })
+        return cases
+    }
+    func testFractal3D() throws {
+        try check(OperationTests.fractal3DCases())
+    }
+    
+    static func geometryModifierCases() -> [OperationTestCase] {
+        var cases: [OperationTestCase] = []
+        cases.append(OperationTestCase(nodeType: "ND_realitykit_geometrymodifier_vertexshader", inputs: [.vector3f, .color4f, .vector3f, .vector3f, .vector2f, .vector2f, .vector4f, .vector4h, .vector4h, .vector4h, .vector4h, .vector2h, .vector2h], output: .token) { ShaderGraphCoder.geometryModifier(modelPositionOffset: $0[0] as! SGVector, color: $0[1] as! SGColor, normal: $0[2] as! SGVector, bitangent: $0[3] as! SGVector, uv0: $0[4] as! SGVector, uv1: $0[5] as! SGVector, userAttribute: $0[6] as! SGVector, userAttributeHalf40: $0[7] as! SGVector, userAttributeHalf41: $0[8] as! SGVector, userAttributeHalf42: $0[9] as! SGVector, userAttributeHalf43: $0[10] as! SGVector, userAttributeHalf20: $0[11] as! SGVector, userAttributeHalf21: $0[12] as! SGVector) })
+        return cases
+    }
+    func testGeometryModifier() throws {
+        try check(OperationTests.geometryModifierCases())
+    }
+    
+    static func geometrySwitchCameraIndexCases() -> [OperationTestCase] {
+        var cases: [OperationTestCase] = []
+        cases.append(OperationTestCase(nodeType: "ND_realitykit_geometry_switch_cameraindex_color3", inputs: [.color3f, .color3f, .color3f], output: .color3f) { ShaderGraphCoder.geometrySwitchCameraIndex(mono: $0[0] as! SGColor, left: $0[1] as! SGColor, right: $0[2] as! SGColor) })
+        cases.append(OperationTestCase(nodeType: "ND_realitykit_geometry_switch_cameraindex_color4", inputs: [.color4f, .color4f, .color4f], output: .color4f) { ShaderGraphCoder.geometrySwitchCameraIndex(mono: $0[0] as! SGColor, left: $0[1] as! SGColor, right: $0[2] as! SGColor) })
+        cases.append(OperationTestCase(nodeType: "ND_realitykit_geometry_switch_cameraindex_float", inputs: [.float, .float, .float], output: .float) { ShaderGraphCoder.geometrySwitchCameraIndex(mono: $0[0] as! SGScalar, left: $0[1] as! SGScalar, right: $0[2] as! SGScalar) })
+        cases.append(OperationTestCase(nodeType: "ND_realitykit_geometry_switch_cameraindex_integer", inputs: [.int, .int, .int], output: .int) { ShaderGraphCoder.geometrySwitchCameraIndex(mono: $0[0] as! SGScalar, left: $0[1] as! SGScalar, right: $0[2] as! SGScalar) })
+        cases.append(OperationTestCase(nodeType: "ND_realitykit_geometry_switch_cameraindex_vector2", inputs: [.vector2f, .vector2f, .vector2f], output: .vector2f) { ShaderGraphCoder.geometrySwitchCameraIndex(mono: $0[0] as! SGVector, left: $0[1] as! SGVector, right: $0[2] as! SGVector) })
+        cases.append(OperationTestCase(nodeType: "ND_realitykit_geometry_switch_cameraindex_vector3", inputs: [.vector3f, .vector3f, .vector3f], output: .vector3f) { ShaderGraphCoder.geometrySwitchCameraIndex(mono: $0[0] as! SGVector, left: $0[1] as! SGVector, right: $0[2] as! SGVector) })
+        cases.append(OperationTestCase(nodeType: "ND_realitykit_geometry_switch_cameraindex_vector4", inputs: [.vector4f, .vector4f, .vector4f], output: .vector4f) { ShaderGraphCoder.geometrySwitchCameraIndex(mono: $0[0] as! SGVector, left: $0[1] as! SGVector, right: $0[2] as! SGVector) })
+        return cases
+    }
+    func testGeometrySwitchCameraIndex() throws {
+        try check(OperationTests.geometrySwitchCameraIndexCases())
+    }
+    
+    static func heightToNormalCases() -> [OperationTestCase] {
+        var cases: [OperationTestCase] = []
+        cases.append(OperationTestCase(nodeType: "ND_heighttonormal_vector3", inputs: [.float, .float], output: .vector3f) { ShaderGraphCoder.heightToNormal($0[0] as! SGScalar, scale: $0[1] as! SGScalar) })
+        return cases
+    }
+    func testHeightToNormal() throws {
+        try check(OperationTests.heightToNormalCases())
+    }
+    
+    static func hsvAdjustCases() -> [OperationTestCase] {
+        var cases: [OperationTestCase] = []
+        cases.append(OperationTestCase(nodeType: "ND_hsvadjust_color3", inputs: [.color3f, .vector3f], output: .color3f) { ShaderGraphCoder.hsvAdjust($0[0] as! SGColor, amount: $0[1] as! SGVector) })
+        cases.append(OperationTestCase(nodeType: "ND_hsvadjust_color4", inputs: [.color4f, .vector3f], output: .color4f) { ShaderGraphCoder.hsvAdjust($0[0] as! SGColor, amount: $0[1] as! SGVector) })
+        return cases
+    }
+    func testHsvAdjust() throws {
+        try check(OperationTests.hsvAdjustCases())
+    }
+    
+    static func hsvToRGBCases() -> [OperationTestCase] {
+        var cases: [OperationTestCase] = []
+        cases.append(OperationTestCase(nodeType: "ND_hsvtorgb_color3", inputs: [.color3f], output: .color3f) { ShaderGraphCoder.hsvToRGB($0[0] as! SGColor) })
+        cases.append(OperationTestCase(nodeType: "ND_hsvtorgb_color4", inputs: [.color4f], output: .color4f) { ShaderGraphCoder.hsvToRGB($0[0] as! SGColor) })
+        return cases
+    }
+    func testHsvToRGB() throws {
+        try check(OperationTests.hsvToRGBCases())
+    }
+    
+    static func ifEqualCases() -> [OperationTestCase] {
+        var cases: [OperationTestCase] = []
+        cases.append(OperationTestCase(nodeType: "ND_ifequal_color3", inputs: [.float, .float, .color3f, .color3f], output: .color3f) { ShaderGraphCoder.ifEqual($0[0] as! SGValue, $0[1] as! SGValue, trueResult: $0[2] as! SGColor, falseResult: $0[3] as! SGColor) })
+        cases.append(OperationTestCase(nodeType: "ND_ifequal_color3B", inputs: [.bool, .bool, .color3f, .color3f], output: .color3f) { ShaderGraphCoder.ifEqual($0[0] as! SGValue, $0[1] as! SGValue, trueResult: $0[2] as! SGColor, falseResult: $0[3] as! SGColor) })
+        cases.append(OperationTestCase(nodeType: "ND_ifequal_color3I", inputs: [.int, .int, .color3f, .color3f], output: .color3f) { ShaderGraphCoder.ifEqual($0[0] as! SGValue, $0[1] as! SGValue, trueResult: $0[2] as! SGColor, falseResult: $0[3] as! SGColor) })
+        cases.append(OperationTestCase(nodeType: "ND_ifequal_color4", inputs: [.float, .float, .color4f, .color4f], output: .color4f) { ShaderGraphCoder.ifEqual($0[0] as! SGValue, $0[1] as! SGValue, trueResult: $0[2] as! SGColor, falseResult: $0[3] as! SGColor) })
+        cases.append(OperationTestCase(nodeType: "ND_ifequal_color4B", inputs: [.bool, .bool, .color4f, .color4f], output: .color4f) { ShaderGraphCoder.ifEqual($0[0] as! SGValue, $0[1] as! SGValue, trueResult: $0[2] as! SGColor, falseResult: $0[3] as! SGColor) })
+        cases.append(OperationTestCase(nodeType: "ND_ifequal_color4I", inputs: [.int, .int, .color4f, .color4f], output: .color4f) { ShaderGraphCoder.ifEqual($0[0] as! SGValue, $0[1] as! SGValue, trueResult: $0[2] as! SGColor, falseResult: $0[3] as! SGColor) })
+        cases.append(OperationTestCase(nodeType: "ND_ifequal_float", inputs: [.float, .float, .float, .float], output: .float) { ShaderGraphCoder.ifEqual($0[0] as! SGValue, $0[1] as! SGValue, trueResult: $0[2] as! SGScalar, falseResult: $0[3] as! SGScalar) })
+        cases.append(OperationTestCase(nodeType: "ND_ifequal_floatB", inputs: [.bool, .bool, .float, .float], output: .float) { ShaderGraphCoder.ifEqual($0[0] as! SGValue, $0[1] as! SGValue, trueResult: $0[2] as! SGScalar, falseResult: $0[3] as! SGScalar) })
+        cases.append(OperationTestCase(nodeType: "ND_ifequal_floatI", inputs: [.int, .int, .float, .float], output: .float) { ShaderGraphCoder.ifEqual($0[0] as! SGValue, $0[1] as! SGValue, trueResult: $0[2] as! SGScalar, falseResult: $0[3] as! SGScalar) })
+        cases.append(OperationTestCase(nodeType: "ND_ifequal_half", inputs: [.half, .half, .half, .half], output: .half) { ShaderGraphCoder.ifEqual($0[0] as! SGValue, $0[1] as! SGValue, trueResult: $0[2] as! SGScalar, falseResult: $0[3] as! SGScalar) })
+        cases.append(OperationTestCase(nodeType: "ND_ifequal_half2", inputs: [.float, .float, .vector2h, .vector2h], output: .vector2h) { ShaderGraphCoder.ifEqual($0[0] as! SGValue, $0[1] as! SGValue, trueResult: $0[2] as! SGVector, falseResult: $0[3] as! SGVector) })
+        cases.append(OperationTestCase(nodeType: "ND_ifequal_half2B", inputs: [.bool, .bool, .vector2h, .vector2h], output: .vector2h) { ShaderGraphCoder.ifEqual($0[0] as! SGValue, $0[1] as! SGValue, trueResult: $0[2] as! SGVector, falseResult: $0[3] as! SGVector) })
+        cases.append(OperationTestCase(nodeType: "ND_ifequal_half2I", inputs: [.int, .int, .vector2h, .vector2h], output: .vector2h) { ShaderGraphCoder.ifEqual($0[0] as! SGValue, $0[1] as! SGValue, trueResult: $0[2] as! SGVector, falseResult: $0[3] as! SGVector) })
+        cases.append(OperationTestCase(nodeType: "ND_ifequal_half3", inputs: [.float, .float, .vector3h, .vector3h], output: .vector3h) { ShaderGraphCoder.ifEqual($0[0] as! SGValue, $0[1] as! SGValue, trueResult: $0[2] as! SGVector, falseResult: $0[3] as! SGVector) })
+        cases.append(OperationTestCase(nodeType: "ND_ifequal_half3B", inputs: [.bool, .bool, .vector3h, .vector3h], output: .vector3h) { ShaderGraphCoder.ifEqual($0[0] as! SGValue, $0[1] as! SGValue, trueResult: $0[2] as! SGVector, falseResult: $0[3] as! SGVector) })
+        cases.append(OperationTestCase(nodeType: "ND_ifequal_half3I", inputs: [.int, .int, .vector3h, .vector3h], output: .vector3h) { ShaderGraphCoder.ifEqual($0[0] as! SGValue, $0[1] as! SGValue, trueResult: $0[2] as! SGVector, falseResult: $0[3] as! SGVector) })
+        cases.append(OperationTestCase(nodeType: "ND_ifequal_half4", inputs: [.float, .float, .vector4h, .vector4h], output: .vector4h) { ShaderGraphCoder.ifEqual($0[0] as! SGValue, $0[1] as! SGValue, trueResult: $0[2] as! SGVector, falseResult: $0[3] as! SGVector) })
+        cases.append(OperationTestCase(nodeType: "ND_ifequal_half4B", inputs: [.bool, .bool, .vector4h, .vector4h], output: .vector4h) { ShaderGraphCoder.ifEqual($0[0] as! SGValue, $0[1] as! SGValue, trueResult: $0[2] as! SGVector, falseResult: $0[3] as! SGVector) })
+        cases.append(OperationTestCase(nodeType: "ND_ifequal_half4I", inputs: [.int, .int, .vector4h, .vector4h], output: .vector4h) { ShaderGraphCoder.ifEqual($0[0] as! SGValue, $0[1] as! SGValue, trueResult: $0[2] as! SGVector, falseResult: $0[3] as! SGVector) })
+        cases.append(OperationTestCase(nodeType: "ND_ifequal_halfB", inputs: [.bool, .bool, .half, .half], output: .half) { ShaderGraphCoder.ifEqual($0[0] as! SGValue, $0[1] as! SGValue, trueResult: $0[2] as! SGScalar, falseResult: $0[3] as! SGScalar) })
+        cases.append(OperationTestCase(nodeType: "ND_ifequal_halfI", inputs: [.int, .int, .half, .half], output: .half) { ShaderGraphCoder.ifEqual($0[0] as! SGValue, $0[1] as! SGValue, trueResult: $0[2] as! SGScalar, falseResult: $0[3] as! SGScalar) })
+        cases.append(OperationTestCase(nodeType: "ND_ifequal_vector2", inputs: [.float, .float, .vector2f, .vector2f], output: .vector2f) { ShaderGraphCoder.ifEqual($0[0] as! SGValue, $0[1] as! SGValue, trueResult: $0[2] as! SGVector, falseResult: $0[3] as! SGVector) })
+        cases.append(OperationTestCase(nodeType: "ND_ifequal_vector2B", inputs: [.bool, .bool, .vector2f, .vector2f], output: .vector2f) { ShaderGraphCoder.ifEqual($0[0] as! SGValue, $0[1] as! SGValue, trueResult: $0[2] as! SGVector, falseResult: $0[3] as! SGVector) })
+        cases.append(OperationTestCase(nodeType: "ND_ifequal_vector2I", inputs: [.int, .int, .vector2f, .vector2f], output: .vector2f) { ShaderGraphCoder.ifEqual($0[0] as! SGValue, $0[1] as! SGValue, trueResult: $0[2] as! SGVector, falseResult: $0[3] as! SGVector) })
+        cases.append(OperationTestCase(nodeType: "ND_ifequal_vector3", inputs: [.float, .float, .vector3f, .vector3f], output: .vector3f) { ShaderGraphCoder.ifEqual($0[0] as! SGValue, $0[1] as! SGValue, trueResult: $0[2] as! SGVector, falseResult: $0[3] as! SGVector) })
+        cases.append(OperationTestCase(nodeType: "ND_ifequal_vector3B", inputs: [.bool, .bool, .vector3f, .vector3f], output: .vector3f) { ShaderGraphCoder.ifEqual($0[0] as! SGValue, $0[1] as! SGValue, trueResult: $0[2] as! SGVector, falseResult: $0[3] as! SGVector) })
+        cases.append(OperationTestCase(nodeType: "ND_ifequal_vector3I", inputs: [.int, .int, .vector3f, .vector3f], output: .vector3f) { ShaderGraphCoder.ifEqual($0[0] as! SGValue, $0[1] as! SGValue, trueResult: $0[2] as! SGVector, falseResult: $0[3] as! SGVector) })
+        cases.append(OperationTestCase(nodeType: "ND_ifequal_vector4", inputs: [.float, .float, .vector4f, .vector4f], output: .vector4f) { ShaderGraphCoder.ifEqual($0[0] as! SGValue, $0[1] as! SGValue, trueResult: $0[2] as! SGVector, falseResult: $0[3] as! SGVector) })
+        cases.append(OperationTestCase(nodeType: "ND_ifequal_vector4B", inputs: [.bool, .bool, .vector4f, .vector4f], output: .vector4f) { ShaderGraphCoder.ifEqual($0[0] as! SGValue, $0[1] as! SGValue, trueResult: $0[2] as! SGVector, falseResult: $0[3] as! SGVector) })
+        cases.append(OperationTestCase(nodeType: "ND_ifequal_vector4I", inputs: [.int, .int, .vector4f, .vector4f], output: .vector4f) { ShaderGraphCoder.ifEqual($0[0] as! SGValue, $0[1] as! SGValue, trueResult: $0[2] as! SGVector, falseResult: $0[3] as! SGVector) })
+        return cases
+    }
+    func testIfEqual() throws {
+        try check(OperationTests.ifEqualCases())
+    }
+    
+    static func ifGreaterCases() -> [OperationTestCase] {
+        var cases: [OperationTestCase] = []
+        cases.append(OperationTestCase(nodeType: "ND_ifgreater_color3", inputs: [.float, .float, .color3f, .color3f], output: .color3f) { ShaderGraphCoder.ifGreater($0[0] as! SGScalar, $0[1] as! SGScalar, trueResult: $0[2] as! SGColor, falseResult: $0[3] as! SGColor) })
+        cases.append(OperationTestCase(nodeType: "ND_ifgreater_color3I", inputs: [.int, .int, .color3f, .color3f], output: .color3f) { ShaderGraphCoder.ifGreater($0[0] as! SGScalar, $0[1] as! SGScalar, trueResult: $0[2] as! SGColor, falseResult: $0[3] as! SGColor) })
+        cases.append(OperationTestCase(nodeType: "ND_ifgreater_color4", inputs: [.float, .float, .color4f, .color4f], output: .color4f) { ShaderGraphCoder.ifGreater($0[0] as! SGScalar, $0[1] as! SGScalar, trueResult: $0[2] as! SGColor, falseResult: $0[3] as! SGColor) })
+        cases.append(OperationTestCase(nodeType: "ND_ifgreater_color4I", inputs: [.int, .int, .color4f, .color4f], output: .color4f) { ShaderGraphCoder.ifGreater($0[0] as! SGScalar, $0[1] as! SGScalar, trueResult: $0[2] as! SGColor, falseResult: $0[3] as! SGColor) })
+        cases.append(OperationTestCase(nodeType: "ND_ifgreater_float", inputs: [.float, .float, .float, .float], output: .float) { ShaderGraphCoder.ifGreater($0[0] as! SGScalar, $0[1] as! SGScalar, trueResult: $0[2] as! SGScalar, falseResult: $0[3] as! SGScalar) })
+        cases.append(OperationTestCase(nodeType: "ND_ifgreater_floatI", inputs: [.int, .int, .float, .float], output: .float) { ShaderGraphCoder.ifGreater($0[0] as! SGScalar, $0[1] as! SGScalar, trueResult: $0[2] as! SGScalar, falseResult: $0[3] as! SGScalar) })
+        cases.append(OperationTestCase(nodeType: "ND_ifgreater_half", inputs: [.half, .half, .half, .half], output: .half) { ShaderGraphCoder.ifGreater($0[0] as! SGScalar, $0[1] as! SGScalar, trueResult: $0[2] as! SGScalar, falseResult: $0[3] as! SGScalar) })
+        cases.append(OperationTestCase(nodeType: "ND_ifgreater_half2", inputs: [.float, .float, .vector2h, .vector2h], output: .vector2h) { ShaderGraphCoder.ifGreater($0[0] as! SGScalar, $0[1] as! SGScalar, trueResult: $0[2] as! SGVector, falseResult: $0[3] as! SGVector) })
+        cases.append(OperationTestCase(nodeType: "ND_ifgreater_half2I", inputs: [.int, .int, .vector2h, .vector2h], output: .vector2h) { ShaderGraphCoder.ifGreater($0[0] as! SGScalar, $0[1] as! SGScalar, trueResult: $0[2] as! SGVector, falseResult: $0[3] as! SGVector) })
+        cases.append(OperationTestCase(nodeType: "ND_ifgreater_half3", inputs: [.float, .float, .vector3h, .vector3h], output: .vector3h) { ShaderGraphCoder.ifGreater($0[0] as! SGScalar, $0[1] as! SGScalar, trueResult: $0[2] as! SGVector, falseResult: $0[3] as! SGVector) })
+        cases.append(OperationTestCase(nodeType: "ND_ifgreater_half3I", inputs: [.int, .int, .vector3h, .vector3h], output: .vector3h) { ShaderGraphCoder.ifGreater($0[0] as! SGScalar, $0[1] as! SGScalar, trueResult: $0[2] as! SGVector, falseResult: $0[3] as! SGVector) })
+        cases.append(OperationTestCase(nodeType: "ND_ifgreater_half4", inputs: [.float, .float, .vector4h, .vector4h], output: .vector4h) { ShaderGraphCoder.ifGreater($0[0] as! SGScalar, $0[1] as! SGScalar, trueResult: $0[2] as! SGVector, falseResult: $0[3] as! SGVector) })
+        cases.append(OperationTestCase(nodeType: "ND_ifgreater_half4I", inputs: [.int, .int, .vector4h, .vector4h], output: .vector4h) { ShaderGraphCoder.ifGreater($0[0] as! SGScalar, $0[1] as! SGScalar, trueResult: $0[2] as! SGVector, falseResult: $0[3] as! SGVector) })
+        cases.append(OperationTestCase(nodeType: "ND_ifgreater_halfI", inputs: [.int, .int, .half, .half], output: .half) { ShaderGraphCoder.ifGreater($0[0] as! SGScalar, $0[1] as! SGScalar, trueResult: $0[2] as! SGScalar, falseResult: $0[3] as! SGScalar) })
+        cases.append(OperationTestCase(nodeType: "ND_ifgreater_vector2", inputs: [.float, .float, .vector2f, .vector2f], output: .vector2f) { ShaderGraphCoder.ifGreater($0[0] as! SGScalar, $0[1] as! SGScalar, trueResult: $0[2] as! SGVector, falseResult: $0[3] as! SGVector) })
+        cases.append(OperationTestCase(nodeType: "ND_ifgreater_vector2I", inputs: [.int, .int, .vector2f, .vector2f], output: .vector2f) { ShaderGraphCoder.ifGreater($0[0] as! SGScalar, $0[1] as! SGScalar, trueResult: $0[2] as! SGVector, falseResult: $0[3] as! SGVector) })
+        cases.append(OperationTestCase(nodeType: "ND_ifgreater_vector3", inputs: [.float, .float, .vector3f, .vector3f], output: .vector3f) { ShaderGraphCoder.ifGreater($0[0] as! SGScalar, $0[1] as! SGScalar, trueResult: $0[2] as! SGVector, falseResult: $0[3] as! SGVector) })
+        cases.append(OperationTestCase(nodeType: "ND_ifgreater_vector3I", inputs: [.int, .int, .vector3f, .vector3f], output: .vector3f) { ShaderGraphCoder.ifGreater($0[0] as! SGScalar, $0[1] as! SGScalar, trueResult: $0[2] as! SGVector, falseResult: $0[3] as! SGVector) })
+        cases.append(OperationTestCase(nodeType: "ND_ifgreater_vector4", inputs: [.float, .float, .vector4f, .vector4f], output: .vector4f) { ShaderGraphCoder.ifGreater($0[0] as! SGScalar, $0[1] as! SGScalar, trueResult: $0[2] as! SGVector, falseResult: $0[3] as! SGVector) })
+        cases.append(OperationTestCase(nodeType: "ND_ifgreater_vector4I", inputs: [.int, .int, .vector4f, .vector4f], output: .vector4f) { ShaderGraphCoder.ifGreater($0[0] as! SGScalar, $0[1] as! SGScalar, trueResult: $0[2] as! SGVector, falseResult: $0[3] as! SGVector) })
+        return cases
+    }
+    func testIfGreater() throws {
+        try check(OperationTests.ifGreaterCases())
+    }
+    
+    static func ifGreaterOrEqualCases() -> [OperationTestCase] {
+        var cases: [OperationTestCase] = []
+        cases.append(OperationTestCase(nodeType: "ND_ifgreatereq_color3", inputs: [.float, .float, .color3f, .color3f], output: .color3f) { ShaderGraphCoder.ifGreaterOrEqual($0[0] as! SGScalar, $0[1] as! SGScalar, trueResult: $0[2] as! SGColor, falseResult: $0[3] as! SGColor) })
+        cases.append(OperationTestCase(nodeType: "ND_ifgreatereq_color3I", inputs: [.int, .int, .color3f, .color3f], output: .color3f) { ShaderGraphCoder.ifGreaterOrEqual($0[0] as! SGScalar, $0[1] as! SGScalar, trueResult: $0[2] as! SGColor, falseResult: $0[3] as! SGColor) })
+        cases.append(OperationTestCase(nodeType: "ND_ifgreatereq_color4", inputs: [.float, .float, .color4f, .color4f], output: .color4f) { ShaderGraphCoder.ifGreaterOrEqual($0[0] as! SGScalar, $0[1] as! SGScalar, trueResult: $0[2] as! SGColor, falseResult: $0[3] as! SGColor) })
+        cases.append(OperationTestCase(nodeType: "ND_ifgreatereq_color4I", inputs: [.int, .int, .color4f, .color4f], output: .color4f) { ShaderGraphCoder.ifGreaterOrEqual($0[0] as! SGScalar, $0[1] as! SGScalar, trueResult: $0[2] as! SGColor, falseResult: $0[3] as! SGColor) })
+        cases.append(OperationTestCase(nodeType: "ND_ifgreatereq_float", inputs: [.float, .float, .float, .float], output: .float) { ShaderGraphCoder.ifGreaterOrEqual($0[0] as! SGScalar, $0[1] as! SGScalar, trueResult: $0[2] as! SGScalar, falseResult: $0[3] as! SGScalar) })
+        cases.append(OperationTestCase(nodeType: "ND_ifgreatereq_floatI", inputs: [.int, .int, .float, .float], output: .float) { ShaderGraphCoder.ifGreaterOrEqual($0[0] as! SGScalar, $0[1] as! SGScalar, trueResult: $0[2] as! SGScalar, falseResult: $0[3] as! SGScalar) })
+        cases.append(OperationTestCase(nodeType: "ND_ifgreatereq_half", inputs: [.half, .half, .half, .half], output: .half) { ShaderGraphCoder.ifGreaterOrEqual($0[0] as! SGScalar, $0[1] as! SGScalar, trueResult: $0[2] as! SGScalar, falseResult: $0[3] as! SGScalar) })
+        cases.append(OperationTestCase(nodeType: "ND_ifgreatereq_half2", inputs: [.float, .float, .vector2h, .vector2h], output: .vector2h) { ShaderGraphCoder.ifGreaterOrEqual($0[0] as! SGScalar, $0[1] as! SGScalar, trueResult: $0[2] as! SGVector, falseResult: $0[3] as! SGVector) })
+        cases.append(OperationTestCase(nodeType: "ND_ifgreatereq_half2I", inputs: [.int, .int, .vector2h, .vector2h], output: .vector2h) { ShaderGraphCoder.ifGreaterOrEqual($0[0] as! SGScalar, $0[1] as! SGScalar, trueResult: $0[2] as! SGVector, falseResult: $0[3] as! SGVector) })
+        cases.append(OperationTestCase(nodeType: "ND_ifgreatereq_half3", inputs: [.float, .float, .vector3h, .vector3h], output: .vector3h) { ShaderGraphCoder.ifGreaterOrEqual($0[0] as! SGScalar, $0[1] as! SGScalar, trueResult: $0[2] as! SGVector, falseResult: $0[3] as! SGVector) })
+        cases.append(OperationTestCase(nodeType: "ND_ifgreatereq_half3I", inputs: [.int, .int, .vector3h, .vector3h], output: .vector3h) { ShaderGraphCoder.ifGreaterOrEqual($0[0] as! SGScalar, $0[1] as! SGScalar, trueResult: $0[2] as! SGVector, falseResult: $0[3] as! SGVector) })
+        cases.append(OperationTestCase(nodeType: "ND_ifgreatereq_half4", inputs: [.float, .float, .vector4h, .vector4h], output: .vector4h) { ShaderGraphCoder.ifGreaterOrEqual($0[0] as! SGScalar, $0[1] as! SGScalar, trueResult: $0[2] as! SGVector, falseResult: $0[3] as! SGVector) })
+        cases.append(OperationTestCase(nodeType: "ND_ifgreatereq_half4I", inputs: [.int, .int, .vector4h, .vector4h], output: .vector4h) { ShaderGraphCoder.ifGreaterOrEqual($0[0] as! SGScalar, $0[1] as! SGScalar, trueResult: $0[2] as! SGVector, falseResult: $0[3] as! SGVector) })
+        cases.append(OperationTestCase(nodeType: "ND_ifgreatereq_halfI", inputs: [.int, .int, .half, .half], output: .half) { ShaderGraphCoder.ifGreaterOrEqual($0[0] as! SGScalar, $0[1] as! SGScalar, trueResult: $0[2] as! SGScalar, falseResult: $0[3] as! SGScalar) })
+        cases.append(OperationTestCase(nodeType: "ND_ifgreatereq_vector2", inputs: [.float, .float, .vector2f, .vector2f], output: .vector2f) { ShaderGraphCoder.ifGreaterOrEqual($0[0] as! SGScalar, $0[1] as! SGScalar, trueResult: $0[2] as! SGVector, falseResult: $0[3] as! SGVector) })
+        cases.append(OperationTestCase(nodeType: "ND_ifgreatereq_vector2I", inputs: [.int, .int, .vector2f, .vector2f], output: .vector2f) { ShaderGraphCoder.ifGreaterOrEqual($0[0] as! SGScalar, $0[1] as! SGScalar, trueResult: $0[2] as! SGVector, falseResult: $0[3] as! SGVector) })
+        cases.append(OperationTestCase(nodeType: "ND_ifgreatereq_vector3", inputs: [.float, .float, .vector3f, .vector3f], output: .vector3f) { ShaderGraphCoder.ifGreaterOrEqual($0[0] as! SGScalar, $0[1] as! SGScalar, trueResult: $0[2] as! SGVector, falseResult: $0[3] as! SGVector) })
+        cases.append(OperationTestCase(nodeType: "ND_ifgreatereq_vector3I", inputs: [.int, .int, .vector3f, .vector3f], output: .vector3f) { ShaderGraphCoder.ifGreaterOrEqual($0[0] as! SGScalar, $0[1] as! SGScalar, trueResult: $0[2] as! SGVector, falseResult: $0[3] as! SGVector) })
+        cases.append(OperationTestCase(nodeType: "ND_ifgreatereq_vector4", inputs: [.float, .float, .vector4f, .vector4f], output: .vector4f) { ShaderGraphCoder.ifGreaterOrEqual($0[0] as! SGScalar, $0[1] as! SGScalar, trueResult: $0[2] as! SGVector, falseResult: $0[3] as! SGVector) })
+        cases.append(OperationTestCase(nodeType: "ND_ifgreatereq_vector4I", inputs: [.int, .int, .vector4f, .vector4f], output: .vector4f) { ShaderGraphCoder.ifGreaterOrEqual($0[0] as! SGScalar, $0[1] as! SGScalar, trueResult: $0[2] as! SGVector, falseResult: $0[3] as! SGVector) })
+        return cases
+    }
+    func testIfGreaterOrEqual() throws {
+        try check(OperationTests.ifGreaterOrEqualCases())
+    }
+    
+    static func imageCases() -> [OperationTestCase] {
+        var cases: [OperationTestCase] = []
+        cases.append(OperationTestCase(nodeType: "ND_image_color3", inputs: [.asset, .color3f, .vector2f], output: .color3f) { ShaderGraphCoder.image(file: $0[0] as! SGTexture, defaultValue: $0[1] as! SGColor, texcoord: $0[2] as! SGVector) })
+        cases.append(OperationTestCase(nodeType: "ND_image_color4", inputs: [.asset, .color4f, .vector2f], output: .color4f) { ShaderGraphCoder.image(file: $0[0] as! SGTexture, defaultValue: $0[1] as! SGColor, texcoord: $0[2] as! SGVector) })
+        cases.append(OperationTestCase(nodeType: "ND_image_float", inputs: [.asset, .float, .vector2f], output: .float) { ShaderGraphCoder.image(file: $0[0] as! SGTexture, defaultValue: $0[1] as! SGScalar, texcoord: $0[2] as! SGVector) })
+        cases.append(OperationTestCase(nodeType: "ND_image_half", inputs: [.asset, .half, .vector2f], output: .half) { ShaderGraphCoder.image(file: $0[0] as! SGTexture, defaultValue: $0[1] as! SGScalar, texcoord: $0[2] as! SGVector) })
+        cases.append(OperationTestCase(nodeType: "ND_image_vector2", inputs: [.asset, .vector2f, .vector2f], output: .vector2f) { ShaderGraphCoder.image(file: $0[0] as! SGTexture, defaultValue: $0[1] as! SGVector, texcoord: $0[2] as! SGVector) })
+        cases.append(OperationTestCase(nodeType: "ND_image_vector3", inputs: [.asset, .vector3f, .vector2f], output: .vector3f) { ShaderGraphCoder.image(file: $0[0] as! SGTexture, defaultValue: $0[1] as! SGVector, texcoord: $0[2] as! SGVector) })
+        cases.append(OperationTestCase(nodeType: "ND_image_vector4", inputs: [.asset, .vector4f, .vector2f], output: .vector4f) { ShaderGraphCoder.image(file: $0[0] as! SGTexture, defaultValue: $0[1] as! SGVector, texcoord: $0[2] as! SGVector) })
+        return cases
+    }
+    func testImage() throws {
+        try check(OperationTests.imageCases())
+    }
+    
+    static func insideCases() -> [OperationTestCase] {
+        var cases: [OperationTestCase] = []
+        cases.append(OperationTestCase(nodeType: "ND_inside_color3", inputs: [.color3f, .float], output: .color3f) { ShaderGraphCoder.inside($0[0] as! SGColor, mask: $0[1] as! SGScalar) })
+        cases.append(OperationTestCase(nodeType: "ND_inside_color4", inputs: [.color4f, .float], output: .color4f) { ShaderGraphCoder.inside($0[0] as! SGColor, mask: $0[1] as! SGScalar) })
+        cases.append(OperationTestCase(nodeType: "ND_inside_float", inputs: [.float, .float], output: .float) { ShaderGraphCoder.inside($0[0] as! SGScalar, mask: $0[1] as! SGScalar) })
+        cases.append(OperationTestCase(nodeType: "ND_inside_half", inputs: [.half, .half], output: .half) { ShaderGraphCoder.inside($0[0] as! SGScalar, mask: $0[1] as! SGScalar) })
+        return cases
+    }
+    func testInside() throws {
+        try check(OperationTests.insideCases())
+    }
+    
+    static func invertMatrixCases() -> [OperationTestCase] {
+        var cases: [OperationTestCase] = []
+        cases.append(OperationTestCase(nodeType: "ND_invertmatrix_matrix22", inputs: [.matrix2d], output: .matrix2d) { ShaderGraphCoder.invertMatrix($0[0] as! SGMatrix) })
+        cases.append(OperationTestCase(nodeType: "ND_invertmatrix_matrix33", inputs: [.matrix3d], output: .matrix3d) { ShaderGraphCoder.invertMatrix($0[0] as! SGMatrix) })
+        cases.append(OperationTestCase(nodeType: "ND_invertmatrix_matrix44", inputs: [.matrix4d], output: .matrix4d) { ShaderGraphCoder.invertMatrix($0[0] as! SGMatrix) })
+        return cases
+    }
+    func testInvertMatrix() throws {
+        try check(OperationTests.invertMatrixCases())
+    }
+    
+    static func lengthCases() -> [OperationTestCase] {
+        var cases: [OperationTestCase] = []
+        cases.append(OperationTestCase(nodeType: "ND_magnitude_half2", inputs: [.vector2h], output: .float) { ShaderGraphCoder.length($0[0] as! SGVector) })
+        cases.append(OperationTestCase(nodeType: "ND_magnitude_half3", inputs: [.vector3h], output: .float) { ShaderGraphCoder.length($0[0] as! SGVector) })
+        cases.append(OperationTestCase(nodeType: "ND_magnitude_half4", inputs: [.vector4h], output: .float) { ShaderGraphCoder.length($0[0] as! SGVector) })
+        cases.append(OperationTestCase(nodeType: "ND_magnitude_vector2", inputs: [.vector2f], output: .float) { ShaderGraphCoder.length($0[0] as! SGVector) })
+        cases.append(OperationTestCase(nodeType: "ND_magnitude_vector3", inputs: [.vector3f], output: .float) { ShaderGraphCoder.length($0[0] as! SGVector) })
+        cases.append(OperationTestCase(nodeType: "ND_magnitude_vector4", inputs: [.vector4f], output: .float) { ShaderGraphCoder.length($0[0] as! SGVector) })
+        return cases
+    }
+    func testLength() throws {
+        try check(OperationTests.lengthCases())
+    }
+    
+    static func logCases() -> [OperationTestCase] {
+        var cases: [OperationTestCase] = []
+        cases.append(OperationTestCase(nodeType: "ND_ln_float", inputs: [.float], output: .float) { ShaderGraphCoder.log($0[0] as! SGScalar) })
+        cases.append(OperationTestCase(nodeType: "ND_ln_half", inputs: [.half], output: .half) { ShaderGraphCoder.log($0[0] as! SGScalar) })
+        cases.append(OperationTestCase(nodeType: "ND_ln_half2", inputs: [.vector2h], output: .vector2h) { ShaderGraphCoder.log($0[0] as! SGVector) })
+        cases.append(OperationTestCase(nodeType: "ND_ln_half3", inputs: [.vector3h], output: .vector3h) { ShaderGraphCoder.log($0[0] as! SGVector) })
+        cases.append(OperationTestCase(nodeType: "ND_ln_half4", inputs: [.vector4h], output: .vector4h) { ShaderGraphCoder.log($0[0] as! SGVector) })
+        cases.append(OperationTestCase(nodeType: "ND_ln_vector2", inputs: [.vector2f], output: .vector2f) { ShaderGraphCoder.log($0[0] as! SGVector) })
+        cases.append(OperationTestCase(nodeType: "ND_ln_vector3", inputs: [.vector3f], output: .vector3f) { ShaderGraphCoder.log($0[0] as! SGVector) })
+        cases.append(OperationTestCase(nodeType: "ND_ln_vector4", inputs: [.vector4f], output: .vector4f) { ShaderGraphCoder.log($0[0] as! SGVector) })
+        return cases
+    }
+    func testLog() throws {
+        try check(OperationTests.logCases())
+    }
+    
+    static func logicalAndCases() -> [OperationTestCase] {
+        var cases: [OperationTestCase] = []
+        cases.append(OperationTestCase(nodeType: "ND_realitykit_logical_and", inputs: [.bool, .bool], output: .bool) { ShaderGraphCoder.logicalAnd($0[0] as! SGValue, $0[1] as! SGValue) })
+        return cases
+    }
+    func testLogicalAnd() throws {
+        try check(OperationTests.logicalAndCases())
+    }
+    
+    static func logicalNotCases() -> [OperationTestCase] {
+        var cases: [OperationTestCase] = []
+        cases.append(OperationTestCase(nodeType: "ND_realitykit_logical_not", inputs: [.bool], output: .bool) { ShaderGraphCoder.logicalNot($0[0] as! SGValue) })
+        return cases
+    }
+    func testLogicalNot() throws {
+        try check(OperationTests.logicalNotCases())
+    }
+    
+    static func logicalOrCases() -> [OperationTestCase] {
+        var cases: [OperationTestCase] = []
+        cases.append(OperationTestCase(nodeType: "ND_realitykit_logical_or", inputs: [.bool, .bool], output: .bool) { ShaderGraphCoder.logicalOr($0[0] as! SGValue, $0[1] as! SGValue) })
+        return cases
+    }
+    func testLogicalOr() throws {
+        try check(OperationTests.logicalOrCases())
+    }
+    
+    static func logicalXorCases() -> [OperationTestCase] {
+        var cases: [OperationTestCase] = []
+        cases.append(OperationTestCase(nodeType: "ND_realitykit_logical_xor", inputs: [.bool, .bool], output: .bool) { ShaderGraphCoder.logicalXor($0[0] as! SGValue, $0[1] as! SGValue) })
+        return cases
+    }
+    func testLogicalXor() throws {
+        try check(OperationTests.logicalXorCases())
+    }
+    
+    static func luminanceCases() -> [OperationTestCase] {
+        var cases: [OperationTestCase] = []
+        cases.append(OperationTestCase(nodeType: "ND_luminance_color3", inputs: [.color3f, .color3f], output: .color3f) { ShaderGraphCoder.luminance($0[0] as! SGColor, lumacoeffs: $0[1] as! SGColor) })
+        cases.append(OperationTestCase(nodeType: "ND_luminance_color4", inputs: [.color4f, .color3f], output: .color4f) { ShaderGraphCoder.luminance($0[0] as! SGColor, lumacoeffs: $0[1] as! SGColor) })
+        return cases
+    }
+    func testLuminance() throws {
+        try check(OperationTests.luminanceCases())
+    }
+    
+    static func maskCases() -> [OperationTestCase] {
+        var cases: [OperationTestCase] = []
+        cases.append(OperationTestCase(nodeType: "ND_mask_color4", inputs: [.color4f, .color4f, .float], output: .color4f) { ShaderGraphCoder.mask(fg: $0[0] as! SGColor, bg: $0[1] as! SGColor, mix: $0[2] as! SGScalar) })
+        return cases
+    }
+    func testMask() throws {
+        try check(OperationTests.maskCases())
+    }
+    
+    static func matteCases() -> [OperationTestCase] {
+        var cases: [OperationTestCase] = []
+        cases.append(OperationTestCase(nodeType: "ND_matte_color4", inputs: [.color4f, .color4f, .float], output: .color4f) { ShaderGraphCoder.matte(fg: $0[0] as! SGColor, bg: $0[1] as! SGColor, mix: $0[2] as! SGScalar) })
+        return cases
+    }
+    func testMatte() throws {
+        try check(OperationTests.matteCases())
+    }
+    
+    static func maxCases() -> [OperationTestCase] {
+        var cases: [OperationTestCase] = []
+        cases.append(OperationTestCase(nodeType: "ND_max_color3", inputs: [.color3f, .color3f], output: .color3f) { ShaderGraphCoder.max($0[0] as! SGColor, $0[1] as! SGNumeric) })
+        cases.append(OperationTestCase(nodeType: "ND_max_color3FA", inputs: [.color3f, .float], output: .color3f) { ShaderGraphCoder.max($0[0] as! SGColor, $0[1] as! SGNumeric) })
+        cases.append(OperationTestCase(nodeType: "ND_max_color4", inputs: [.color4f, .color4f], output: .color4f) { ShaderGraphCoder.max($0[0] as! SGColor, $0[1] as! SGNumeric) })
+        cases.append(OperationTestCase(nodeType: "ND_max_color4FA", inputs: [.color4f, .float], output: .color4f) { ShaderGraphCoder.max($0[0] as! SGColor, $0[1] as! SGNumeric) })
+        cases.append(OperationTestCase(nodeType: "ND_max_float", inputs: [.float, .float], output: .float) { ShaderGraphCoder.max($0[0] as! SGScalar, $0[1] as! SGNumeric) })
+        cases.append(OperationTestCase(nodeType: "ND_max_half", inputs: [.half, .half], output: .half) { ShaderGraphCoder.max($0[0] as! SGScalar, $0[1] as! SGNumeric) })
+        cases.append(OperationTestCase(nodeType: "ND_max_half2", inputs: [.vector2h, .vector2h], output: .vector2h) { ShaderGraphCoder.max($0[0] as! SGVector, $0[1] as! SGNumeric) })
+        cases.append(OperationTestCase(nodeType: "ND_max_half2FA", inputs: [.vector2h, .float], output: .vector2h) { ShaderGraphCoder.max($0[0] as! SGVector, $0[1] as! SGNumeric) })
+        cases.append(OperationTestCase(nodeType: "ND_max_half3", inputs: [.vector3h, .vector3h], output: .vector3h) { ShaderGraphCoder.max($0[0] as! SGVector, $0[1] as! SGNumeric) })
+        cases.append(OperationTestCase(nodeType: "ND_max_half3FA", inputs: [.vector3h, .float], output: .vector3h) { ShaderGraphCoder.max($0[0] as! SGVector, $0[1] as! SGNumeric) })
+        cases.append(OperationTestCase(nodeType: "ND_max_half4", inputs: [.vector4h, .vector4h], output: .vector4h) { ShaderGraphCoder.max($0[0] as! SGVector, $0[1] as! SGNumeric) })
+        cases.append(OperationTestCase(nodeType: "ND_max_half4FA", inputs: [.vector4h, .float], output: .vector4h) { ShaderGraphCoder.max($0[0] as! SGVector, $0[1] as! SGNumeric) })
+        cases.append(OperationTestCase(nodeType: "ND_max_vector2", inputs: [.vector2f, .vector2f], output: .vector2f) { ShaderGraphCoder.max($0[0] as! SGVector, $0[1] as! SGNumeric) })
+        cases.append(OperationTestCase(nodeType: "ND_max_vector2FA", inputs: [.vector2f, .float], output: .vector2f) { ShaderGraphCoder.max($0[0] as! SGVector, $0[1] as! SGNumeric) })
+        cases.append(OperationTestCase(nodeType: "ND_max_vector3", inputs: [.vector3f, .vector3f], output: .vector3f) { ShaderGraphCoder.max($0[0] as! SGVector, $0[1] as! SGNumeric) })
+        cases.append(OperationTestCase(nodeType: "ND_max_vector3FA", inputs: [.vector3f, .float], output: .vector3f) { ShaderGraphCoder.max($0[0] as! SGVector, $0[1] as! SGNumeric) })
+        cases.append(OperationTestCase(nodeType: "ND_max_vector4", inputs: [.vector4f, .vector4f], output: .vector4f) { ShaderGraphCoder.max($0[0] as! SGVector, $0[1] as! SGNumeric) })
+        cases.append(OperationTestCase(nodeType: "ND_max_vector4FA", inputs: [.vector4f, .float], output: .vector4f) { ShaderGraphCoder.max($0[0] as! SGVector, $0[1] as! SGNumeric) })
+        return cases
+    }
+    func testMax() throws {
+        try check(OperationTests.maxCases())
+    }
+    
+    static func minCases() -> [OperationTestCase] {
+        var cases: [OperationTestCase] = []
+        cases.append(OperationTestCase(nodeType: "ND_min_color3", inputs: [.color3f, .color3f], output: .color3f) { ShaderGraphCoder.min($0[0] as! SGColor, $0[1] as! SGNumeric) })
+        cases.append(OperationTestCase(nodeType: "ND_min_color3FA", inputs: [.color3f, .float], output: .color3f) { ShaderGraphCoder.min($0[0] as! SGColor, $0[1] as! SGNumeric) })
+        cases.append(OperationTestCase(nodeType: "ND_min_color4", inputs: [.color4f, .color4f], output: .color4f) { ShaderGraphCoder.min($0[0] as! SGColor, $0[1] as! SGNumeric) })
+        cases.append(OperationTestCase(nodeType: "ND_min_color4FA", inputs: [.color4f, .float], output: .color4f) { ShaderGraphCoder.min($0[0] as! SGColor, $0[1] as! SGNumeric) })
+        cases.append(OperationTestCase(nodeType: "ND_min_float", inputs: [.float, .float], output: .float) { ShaderGraphCoder.min($0[0] as! SGScalar, $0[1] as! SGNumeric) })
+        cases.append(OperationTestCase(nodeType: "ND_min_half", inputs: [.half, .half], output: .half) { ShaderGraphCoder.min($0[0] as! SGScalar, $0[1] as! SGNumeric) })
+        cases.append(OperationTestCase(nodeType: "ND_min_half2", inputs: [.vector2h, .vector2h], output: .vector2h) { ShaderGraphCoder.min($0[0] as! SGVector, $0[1] as! SGNumeric) })
+        cases.append(OperationTestCase(nodeType: "ND_min_half2FA", inputs: [.vector2h, .float], output: .vector2h) { ShaderGraphCoder.min($0[0] as! SGVector, $0[1] as! SGNumeric) })
+        cases.append(OperationTestCase(nodeType: "ND_min_half3", inputs: [.vector3h, .vector3h], output: .vector3h) { ShaderGraphCoder.min($0[0] as! SGVector, $0[1] as! SGNumeric) })
+        cases.append(OperationTestCase(nodeType: "ND_min_half3FA", inputs: [.vector3h, .float], output: .vector3h) { ShaderGraphCoder.min($0[0] as! SGVector, $0[1] as! SGNumeric) })
+        cases.append(OperationTestCase(nodeType: "ND_min_half4", inputs: [.vector4h, .vector4h], output: .vector4h) { ShaderGraphCoder.min($0[0] as! SGVector, $0[1] as! SGNumeric) })
+        cases.append(OperationTestCase(nodeType: "ND_min_half4FA", inputs: [.vector4h, .float], output: .vector4h) { ShaderGraphCoder.min($0[0] as! SGVector, $0[1] as! SGNumeric) })
+        cases.append(OperationTestCase(nodeType: "ND_min_vector2", inputs: [.vector2f, .vector2f], output: .vector2f) { ShaderGraphCoder.min($0[0] as! SGVector, $0[1] as! SGNumeric) })
+        cases.append(OperationTestCase(nodeType: "ND_min_vector2FA", inputs: [.vector2f, .float], output: .vector2f) { ShaderGraphCoder.min($0[0] as! SGVector, $0[1] as! SGNumeric) })
+        cases.append(OperationTestCase(nodeType: "ND_min_vector3", inputs: [.vector3f, .vector3f], output: .vector3f) { ShaderGraphCoder.min($0[0] as! SGVector, $0[1] as! SGNumeric) })
+        cases.append(OperationTestCase(nodeType: "ND_min_vector3FA", inputs: [.vector3f, .float], output: .vector3f) { ShaderGraphCoder.min($0[0] as! SGVector, $0[1] as! SGNumeric) })
+        cases.append(OperationTestCase(nodeType: "ND_min_vector4", inputs: [.vector4f, .vector4f], output: .vector4f) { ShaderGraphCoder.min($0[0] as! SGVector, $0[1] as! SGNumeric) })
+        cases.append(OperationTestCase(nodeType: "ND_min_vector4FA", inputs: [.vector4f, .float], output: .vector4f) { ShaderGraphCoder.min($0[0] as! SGVector, $0[1] as! SGNumeric) })
+        return cases
+    }
+    func testMin() throws {
+        try check(OperationTests.minCases())
+    }
+    
+    static func minusCases() -> [OperationTestCase] {
+        var cases: [OperationTestCase] = []
+        cases.append(OperationTestCase(nodeType: "ND_minus_color3", inputs: [.color3f, .color3f, .float], output: .color3f) { ShaderGraphCoder.minus(fg: $0[0] as! SGColor, bg: $0[1] as! SGColor, mix: $0[2] as! SGScalar) })
+        cases.append(OperationTestCase(nodeType: "ND_minus_color4", inputs: [.color4f, .color4f, .float], output: .color4f) { ShaderGraphCoder.minus(fg: $0[0] as! SGColor, bg: $0[1] as! SGColor, mix: $0[2] as! SGScalar) })
+        cases.append(OperationTestCase(nodeType: "ND_minus_float", inputs: [.float, .float, .float], output: .float) { ShaderGraphCoder.minus(fg: $0[0] as! SGScalar, bg: $0[1] as! SGScalar, mix: $0[2] as! SGScalar) })
+        cases.append(OperationTestCase(nodeType: "ND_minus_half", inputs: [.half, .half, .half], output: .half) { ShaderGraphCoder.minus(fg: $0[0] as! SGScalar, bg: $0[1] as! SGScalar, mix: $0[2] as! SGScalar) })
+        return cases
+    }
+    func testMinus() throws {
+        try check(OperationTests.minusCases())
+    }
+    
+    static func mixCases() -> [OperationTestCase] {
+        var cases: [OperationTestCase] = []
+        cases.append(OperationTestCase(nodeType: "ND_mix_color3", inputs: [.color3f, .color3f, .float], output: .color3f) { ShaderGraphCoder.mix(fg: $0[0] as! SGColor, bg: $0[1] as! SGColor, mix: $0[2] as! SGScalar) })
+        cases.append(OperationTestCase(nodeType: "ND_mix_color4", inputs: [.color4f, .color4f, .float], output: .color4f) { ShaderGraphCoder.mix(fg: $0[0] as! SGColor, bg: $0[1] as! SGColor, mix: $0[2] as! SGScalar) })
+        cases.append(OperationTestCase(nodeType: "ND_mix_float", inputs: [.float, .float, .float], output: .float) { ShaderGraphCoder.mix(fg: $0[0] as! SGScalar, bg: $0[1] as! SGScalar, mix: $0[2] as! SGScalar) })
+        cases.append(OperationTestCase(nodeType: "ND_mix_half", inputs: [.half, .half, .half], output: .half) { ShaderGraphCoder.mix(fg: $0[0] as! SGScalar, bg: $0[1] as! SGScalar, mix: $0[2] as! SGScalar) })
+        cases.append(OperationTestCase(nodeType: "ND_mix_half2", inputs: [.vector2h, .vector2h, .float], output: .vector2h) { ShaderGraphCoder.mix(fg: $0[0] as! SGVector, bg: $0[1] as! SGVector, mix: $0[2] as! SGScalar) })
+        cases.append(OperationTestCase(nodeType: "ND_mix_half3", inputs: [.vector3h, .vector3h, .float], output: .vector3h) { ShaderGraphCoder.mix(fg: $0[0] as! SGVector, bg: $0[1] as! SGVector, mix: $0[2] as! SGScalar) })
+        cases.append(OperationTestCase(nodeType: "ND_mix_half4", inputs: [.vector4h, .vector4h, .float], output: .vector4h) { ShaderGraphCoder.mix(fg: $0[0] as! SGVector, bg: $0[1] as! SGVector, mix: $0[2] as! SGScalar) })
+        cases.append(OperationTestCase(nodeType: "ND_mix_vector2", inputs: [.vector2f, .vector2f, .float], output: .vector2f) { ShaderGraphCoder.mix(fg: $0[0] as! SGVector, bg: $0[1] as! SGVector, mix: $0[2] as! SGScalar) })
+        cases.append(OperationTestCase(nodeType: "ND_mix_vector3", inputs: [.vector3f, .vector3f, .float], output: .vector3f) { ShaderGraphCoder.mix(fg: $0[0] as! SGVector, bg: $0[1] as! SGVector, mix: $0[2] as! SGScalar) })
+        cases.append(OperationTestCase(nodeType: "ND_mix_vector4", inputs: [.vector4f, .vector4f, .float], output: .vector4f) { ShaderGraphCoder.mix(fg: $0[0] as! SGVector, bg: $0[1] as! SGVector, mix: $0[2] as! SGScalar) })
+        return cases
+    }
+    func testMix() throws {
+        try check(OperationTests.mixCases())
+    }
+    
+    static func mixColorCases() -> [OperationTestCase] {
+        var cases: [OperationTestCase] = []
+        cases.append(OperationTestCase(nodeType: "ND_in_color4", inputs: [.color4f, .color4f, .float], output: .color4f) { ShaderGraphCoder.mixColor(fg: $0[0] as! SGColor, bg: $0[1] as! SGColor, mix: $0[2] as! SGScalar) })
+        return cases
+    }
+    func testMixColor() throws {
+        try check(OperationTests.mixColorCases())
+    }
+    
+    static func moduloCases() -> [OperationTestCase] {
+        var cases: [OperationTestCase] = []
+        cases.append(OperationTestCase(nodeType: "ND_modulo_color3", inputs: [.color3f, .color3f], output: .color3f) { ShaderGraphCoder.modulo($0[0] as! SGColor, $0[1] as! SGNumeric) })
+        cases.append(OperationTestCase(nodeType: "ND_modulo_color3FA", inputs: [.color3f, .float], output: .color3f) { ShaderGraphCoder.modulo($0[0] as! SGColor, $0[1] as! SGNumeric) })
+        cases.append(OperationTestCase(nodeType: "ND_modulo_color4", inputs: [.color4f, .color4f], output: .color4f) { ShaderGraphCoder.modulo($0[0] as! SGColor, $0[1] as! SGNumeric) })
+        cases.append(OperationTestCase(nodeType: "ND_modulo_color4FA", inputs: [.color4f, .float], output: .color4f) { ShaderGraphCoder.modulo($0[0] as! SGColor, $0[1] as! SGNumeric) })
+        cases.append(OperationTestCase(nodeType: "ND_modulo_float", inputs: [.float, .float], output: .float) { ShaderGraphCoder.modulo($0[0] as! SGScalar, $0[1] as! SGNumeric) })
+        cases.append(OperationTestCase(nodeType: "ND_modulo_half", inputs: [.half, .half], output: .half) { ShaderGraphCoder.modulo($0[0] as! SGScalar, $0[1] as! SGNumeric) })
+        cases.append(OperationTestCase(nodeType: "ND_modulo_vector2", inputs: [.vector2f, .vector2f], output: .vector2f) { ShaderGraphCoder.modulo($0[0] as! SGVector, $0[1] as! SGNumeric) })
+        cases.append(OperationTestCase(nodeType: "ND_modulo_vector2FA", inputs: [.vector2f, .float], output: .vector2f) { ShaderGraphCoder.modulo($0[0] as! SGVector, $0[1] as! SGNumeric) })
+        cases.append(OperationTestCase(nodeType: "ND_modulo_vector3", inputs: [.vector3f, .vector3f], output: .vector3f) { ShaderGraphCoder.modulo($0[0] as! SGVector, $0[1] as! SGNumeric) })
+        cases.append(OperationTestCase(nodeType: "ND_modulo_vector3FA", inputs: [.vector3f, .float], output: .vector3f) { ShaderGraphCoder.modulo($0[0] as! SGVector, $0[1] as! SGNumeric) })
+        cases.append(OperationTestCase(nodeType: "ND_modulo_vector4", inputs: [.vector4f, .vector4f], output: .vector4f) { ShaderGraphCoder.modulo($0[0] as! SGVector, $0[1] as! SGNumeric) })
+        cases.append(OperationTestCase(nodeType: "ND_modulo_vector4FA", inputs: [.vector4f, .float], output: .vector4f) { ShaderGraphCoder.modulo($0[0] as! SGVector, $0[1] as! SGNumeric) })
+        return cases
+    }
+    func testModulo() throws {
+        try check(OperationTests.moduloCases())
+    }
+    
+    static func multiplyCases() -> [OperationTestCase] {
+        var cases: [OperationTestCase] = []
+        cases.append(OperationTestCase(nodeType: "ND_multiply_color3", inputs: [.color3f, .color3f], output: .color3f) { ShaderGraphCoder.multiply($0[0] as! SGColor, $0[1] as! SGNumeric) })
+        cases.append(OperationTestCase(nodeType: "ND_multiply_color3FA", inputs: [.color3f, .float], output: .color3f) { ShaderGraphCoder.multiply($0[0] as! SGColor, $0[1] as! SGNumeric) })
+        cases.append(OperationTestCase(nodeType: "ND_multiply_color4", inputs: [.color4f, .color4f], output: .color4f) { ShaderGraphCoder.multiply($0[0] as! SGColor, $0[1] as! SGNumeric) })
+        cases.append(OperationTestCase(nodeType: "ND_multiply_color4FA", inputs: [.color4f, .float], output: .color4f) { ShaderGraphCoder.multiply($0[0] as! SGColor, $0[1] as! SGNumeric) })
+        cases.append(OperationTestCase(nodeType: "ND_multiply_float", inputs: [.float, .float], output: .float) { ShaderGraphCoder.multiply($0[0] as! SGScalar, $0[1] as! SGNumeric) })
+        cases.append(OperationTestCase(nodeType: "ND_multiply_half", inputs: [.half, .half], output: .half) { ShaderGraphCoder.multiply($0[0] as! SGScalar, $0[1] as! SGNumeric) })
+        cases.append(OperationTestCase(nodeType: "ND_multiply_matrix22", inputs: [.matrix2d, .matrix2d], output: .matrix2d) { ShaderGraphCoder.multiply($0[0] as! SGMatrix, $0[1] as! SGNumeric) })
+        cases.append(OperationTestCase(nodeType: "ND_multiply_matrix33", inputs: [.matrix3d, .matrix3d], output: .matrix3d) { ShaderGraphCoder.multiply($0[0] as! SGMatrix, $0[1] as! SGNumeric) })
+        cases.append(OperationTestCase(nodeType: "ND_multiply_matrix44", inputs: [.matrix4d, .matrix4d], output: .matrix4d) { ShaderGraphCoder.multiply($0[0] as! SGMatrix, $0[1] as! SGNumeric) })
+        cases.append(OperationTestCase(nodeType: "ND_multiply_vector2", inputs: [.vector2f, .vector2f], output: .vector2f) { ShaderGraphCoder.multiply($0[0] as! SGVector, $0[1] as! SGNumeric) })
+        cases.append(OperationTestCase(nodeType: "ND_multiply_vector2FA", inputs: [.vector2f, .float], output: .vector2f) { ShaderGraphCoder.multiply($0[0] as! SGVector, $0[1] as! SGNumeric) })
+        cases.append(OperationTestCase(nodeType: "ND_multiply_vector3", inputs: [.vector3f, .vector3f], output: .vector3f) { ShaderGraphCoder.multiply($0[0] as! SGVector, $0[1] as! SGNumeric) })
+        cases.append(OperationTestCase(nodeType: "ND_multiply_vector3FA", inputs: [.vector3f, .float], output: .vector3f) { ShaderGraphCoder.multiply($0[0] as! SGVector, $0[1] as! SGNumeric) })
+        cases.append(OperationTestCase(nodeType: "ND_multiply_vector4", inputs: [.vector4f, .vector4f], output: .vector4f) { ShaderGraphCoder.multiply($0[0] as! SGVector, $0[1] as! SGNumeric) })
+        cases.append(OperationTestCase(nodeType: "ND_multiply_vector4FA", inputs: [.vector4f, .float], output: .vector4f) { ShaderGraphCoder.multiply($0[0] as! SGVector, $0[1] as! SGNumeric) })
+        return cases
+    }
+    func testMultiply() throws {
+        try check(OperationTests.multiplyCases())
+    }
+    
+    static func noise2DCases() -> [OperationTestCase] {
+        var cases: [OperationTestCase] = []
+        cases.append(OperationTestCase(nodeType: "ND_noise2d_color3", inputs: [.vector3f, .float, .vector2f], output: .color3f) { ShaderGraphCoder.noise2D(amplitude: $0[0] as! SGNumeric, pivot: $0[1] as! SGScalar, texcoord: $0[2] as! SGVector) })
+        cases.append(OperationTestCase(nodeType: "ND_noise2d_color3FA", inputs: [.float, .float, .vector2f], output: .color3f) { ShaderGraphCoder.noise2D(amplitude: $0[0] as! SGNumeric, pivot: $0[1] as! SGScalar, texcoord: $0[2] as! SGVector) })
+        cases.append(OperationTestCase(nodeType: "ND_noise2d_color4", inputs: [.vector4f, .float, .vector2f], output: .color4f) { ShaderGraphCoder.noise2D(amplitude: $0[0] as! SGNumeric, pivot: $0[1] as! SGScalar, texcoord: $0[2] as! SGVector) })
+        cases.append(OperationTestCase(nodeType: "ND_noise2d_vector2", inputs: [.vector2f, .float, .vector2f], output: .vector2f) { ShaderGraphCoder.noise2D(amplitude: $0[0] as! SGNumeric, pivot: $0[1] as! SGScalar, texcoord: $0[2] as! SGVector) })
+        return cases
+    }
+    func testNoise2D() throws {
+        try check(OperationTests.noise2DCases())
+    }
+    
+    static func noise3DCases() -> [OperationTestCase] {
+        var cases: [OperationTestCase] = []
+        cases.append(OperationTestCase(nodeType: "ND_noise3d_color3", inputs: [.vector3f, .float, .vector3f], output: .color3f) { ShaderGraphCoder.noise3D(amplitude: $0[0] as! SGNumeric, pivot: $0[1] as! SGScalar, position: $0[2] as! SGVector) })
+        cases.append(OperationTestCase(nodeType: "ND_noise3d_color3FA", inputs: [.float, .float, .vector3f], output: .color3f) { ShaderGraphCoder.noise3D(amplitude: $0[0] as! SGNumeric, pivot: $0[1] as! SGScalar, position: $0[2] as! SGVector) })
+        cases.append(OperationTestCase(nodeType: "ND_noise3d_color4", inputs: [.vector4f, .float, .vector3f], output: .color4f) { ShaderGraphCoder.noise3D(amplitude: $0[0] as! SGNumeric, pivot: $0[1] as! SGScalar, position: $0[2] as! SGVector) })
+        cases.append(OperationTestCase(nodeType: "ND_noise3d_vector2", inputs: [.vector2f, .float, .vector3f], output: .vector2f) { ShaderGraphCoder.noise3D(amplitude: $0[0] as! SGNumeric, pivot: $0[1] as! SGScalar, position: $0[2] as! SGVector) })
+        return cases
+    }
+    func testNoise3D() throws {
+        try check(OperationTests.noise3DCases())
+    }
+    
+    static func normalMapCases() -> [OperationTestCase] {
+        var cases: [OperationTestCase] = []
+        cases.append(OperationTestCase(nodeType: "ND_normalmap", inputs: [.vector3f, .float, .vector3f, .vector3f], output: .vector3f) { ShaderGraphCoder.normalMap($0[0] as! SGVector, scale: $0[1] as! SGNumeric, normal: $0[2] as! SGVector, tangent: $0[3] as! SGVector) })
+        cases.append(OperationTestCase(nodeType: "ND_normalmap_vector2", inputs: [.vector3f, .vector2f, .vector3f, .vector3f], output: .vector3f) { ShaderGraphCoder.normalMap($0[0] as! SGVector, scale: $0[1] as! SGNumeric, normal: $0[2] as! SGVector, tangent: $0[3] as! SGVector) })
+        return cases
+    }
+    func testNormalMap() throws {
+        try check(OperationTests.normalMapCases())
+    }
+    
+    static func normalMapDecodeCases() -> [OperationTestCase] {
+        var cases: [OperationTestCase] = []
+        cases.append(OperationTestCase(nodeType: "ND_normal_map_decode", inputs: [.vector3f], output: .vector3f) { ShaderGraphCoder.normalMapDecode($0[0] as! SGVector) })
+        return cases
+    }
+    func testNormalMapDecode() throws {
+        try check(OperationTests.normalMapDecodeCases())
+    }
+    
+    static func normalizeCases() -> [OperationTestCase] {
+        var cases: [OperationTestCase] = []
+        cases.append(OperationTestCase(nodeType: "ND_normalize_half2", inputs: [.vector2h], output: .vector2h) { ShaderGraphCoder.normalize($0[0] as! SGVector) })
+        cases.append(OperationTestCase(nodeType: "ND_normalize_half3", inputs: [.vector3h], output: .vector3h) { ShaderGraphCoder.normalize($0[0] as! SGVector) })
+        cases.append(OperationTestCase(nodeType: "ND_normalize_half4", inputs: [.vector4h], output: .vector4h) { ShaderGraphCoder.normalize($0[0] as! SGVector) })
+        cases.append(OperationTestCase(nodeType: "ND_normalize_vector2", inputs: [.vector2f], output: .vector2f) { ShaderGraphCoder.normalize($0[0] as! SGVector) })
+        cases.append(OperationTestCase(nodeType: "ND_normalize_vector3", inputs: [.vector3f], output: .vector3f) { ShaderGraphCoder.normalize($0[0] as! SGVector) })
+        cases.append(OperationTestCase(nodeType: "ND_normalize_vector4", inputs: [.vector4f], output: .vector4f) { ShaderGraphCoder.normalize($0[0] as! SGVector) })
+        return cases
+    }
+    func testNormalize() throws {
+        try check(OperationTests.normalizeCases())
+    }
+    
+    static func oneMinusCases() -> [OperationTestCase] {
+        var cases: [OperationTestCase] = []
+        cases.append(OperationTestCase(nodeType: "ND_realitykit_oneminus_color3", inputs: [.color3f], output: .color3f) { ShaderGraphCoder.oneMinus($0[0] as! SGColor) })
+        cases.append(OperationTestCase(nodeType: "ND_realitykit_oneminus_color4", inputs: [.color4f], output: .color4f) { ShaderGraphCoder.oneMinus($0[0] as! SGColor) })
+        cases.append(OperationTestCase(nodeType: "ND_realitykit_oneminus_float", inputs: [.float], output: .float) { ShaderGraphCoder.oneMinus($0[0] as! SGScalar) })
+        cases.append(OperationTestCase(nodeType: "ND_realitykit_oneminus_vector2", inputs: [.vector2f], output: .vector2f) { ShaderGraphCoder.oneMinus($0[0] as! SGVector) })
+        cases.append(OperationTestCase(nodeType: "ND_realitykit_oneminus_vector3", inputs: [.vector3f], output: .vector3f) { ShaderGraphCoder.oneMinus($0[0] as! SGVector) })
+        cases.append(OperationTestCase(nodeType: "ND_realitykit_oneminus_vector4", inputs: [.vector4f], output: .vector4f) { ShaderGraphCoder.oneMinus($0[0] as! SGVector) })
+        return cases
+    }
+    func testOneMinus() throws {
+        try check(OperationTests.oneMinusCases())
+    }
+    
+    static func outCases() -> [OperationTestCase] {
+        var cases: [OperationTestCase] = []
+        cases.append(OperationTestCase(nodeType: "ND_out_color4", inputs: [.color4f, .color4f, .float], output: .color4f) { ShaderGraphCoder.out(fg: $0[0] as! SGColor, bg: $0[1] as! SGColor, mix: $0[2] as! SGScalar) })
+        return cases
+    }
+    func testOut() throws {
+        try check(OperationTests.outCases())
+    }
+    
+    static func outsideCases() -> [OperationTestCase] {
+        var cases: [OperationTestCase] = []
+        cases.append(OperationTestCase(nodeType: "ND_outside_color3", inputs: [.color3f, .float], output: .color3f) { ShaderGraphCoder.outside($0[0] as! SGColor, mask: $0[1] as! SGScalar) })
+        cases.append(OperationTestCase(nodeType: "ND_outside_color4", inputs: [.color4f, .float], output: .color4f) { ShaderGraphCoder.outside($0[0] as! SGColor, mask: $0[1] as! SGScalar) })
+        cases.append(OperationTestCase(nodeType: "ND_outside_float", inputs: [.float, .float], output: .float) { ShaderGraphCoder.outside($0[0] as! SGScalar, mask: $0[1] as! SGScalar) })
+        cases.append(OperationTestCase(nodeType: "ND_outside_half", inputs: [.half, .half], output: .half) { ShaderGraphCoder.outside($0[0] as! SGScalar, mask: $0[1] as! SGScalar) })
+        return cases
+    }
+    func testOutside() throws {
+        try check(OperationTests.outsideCases())
+    }
+    
+    static func overCases() -> [OperationTestCase] {
+        var cases: [OperationTestCase] = []
+        cases.append(OperationTestCase(nodeType: "ND_over_color4", inputs: [.color4f, .color4f, .float], output: .color4f) { ShaderGraphCoder.over(fg: $0[0] as! SGColor, bg: $0[1] as! SGColor, mix: $0[2] as! SGScalar) })
+        return cases
+    }
+    func testOver() throws {
+        try check(OperationTests.overCases())
+    }
+    
+    static func overlayCases() -> [OperationTestCase] {
+        var cases: [OperationTestCase] = []
+        cases.append(OperationTestCase(nodeType: "ND_overlay_color3", inputs: [.color3f, .color3f, .float], output: .color3f) { ShaderGraphCoder.overlay(fg: $0[0] as! SGColor, bg: $0[1] as! SGColor, mix: $0[2] as! SGScalar) })
+        cases.append(OperationTestCase(nodeType: "ND_overlay_color4", inputs: [.color4f, .color4f, .float], output: .color4f) { ShaderGraphCoder.overlay(fg: $0[0] as! SGColor, bg: $0[1] as! SGColor, mix: $0[2] as! SGScalar) })
+        cases.append(OperationTestCase(nodeType: "ND_overlay_float", inputs: [.float, .float, .float], output: .float) { ShaderGraphCoder.overlay(fg: $0[0] as! SGScalar, bg: $0[1] as! SGScalar, mix: $0[2] as! SGScalar) })
+        cases.append(OperationTestCase(nodeType: "ND_overlay_half", inputs: [.half, .half, .half], output: .half) { ShaderGraphCoder.overlay(fg: $0[0] as! SGScalar, bg: $0[1] as! SGScalar, mix: $0[2] as! SGScalar) })
+        return cases
+    }
+    func testOverlay() throws {
+        try check(OperationTests.overlayCases())
+    }
+    
+    static func pbrSurfaceCases() -> [OperationTestCase] {
+        var cases: [OperationTestCase] = []
+        cases.append(OperationTestCase(nodeType: "ND_realitykit_pbr_surfaceshader", inputs: [.color3f, .color3f, .vector3f, .float, .float, .float, .float, .float, .float, .float, .float], output: .token) { ShaderGraphCoder.pbrSurface(baseColor: $0[0] as! SGColor, emissiveColor: $0[1] as! SGColor, normal: $0[2] as! SGVector, roughness: $0[3] as! SGScalar, metallic: $0[4] as! SGScalar, ambientOcclusion: $0[5] as! SGScalar, specular: $0[6] as! SGScalar, opacity: $0[7] as! SGScalar, opacityThreshold: $0[8] as! SGScalar, clearcoat: $0[9] as! SGScalar, clearcoatRoughness: $0[10] as! SGScalar) })
+        return cases
+    }
+    func testPbrSurface() throws {
+        try check(OperationTests.pbrSurfaceCases())
+    }
+    
+    static func pixelCases() -> [OperationTestCase] {
+        var cases: [OperationTestCase] = []
+        cases.append(OperationTestCase(nodeType: "ND_RealityKitTexture2DPixel_color3", inputs: [.asset, .int, .float, .float, .color3f, .vector2f, .float, .float, .vector2i], output: .color3f) { ShaderGraphCoder.pixel(file: $0[0] as! SGTexture, maxAnisotropy: $0[1] as! SGScalar, maxLodClamp: $0[2] as! SGScalar, minLodClamp: $0[3] as! SGScalar, defaultValue: $0[4] as! SGColor, texcoord: $0[5] as! SGVector, bias: $0[6] as! SGScalar, dynamicMinLodClamp: $0[7] as! SGScalar, offset: $0[8] as! SGVector) })
+        cases.append(OperationTestCase(nodeType: "ND_RealityKitTexture2DPixel_color4", inputs: [.asset, .int, .float, .float, .color4f, .vector2f, .float, .float, .vector2i], output: .color4f) { ShaderGraphCoder.pixel(file: $0[0] as! SGTexture, maxAnisotropy: $0[1] as! SGScalar, maxLodClamp: $0[2] as! SGScalar, minLodClamp: $0[3] as! SGScalar, defaultValue: $0[4] as! SGColor, texcoord: $0[5] as! SGVector, bias: $0[6] as! SGScalar, dynamicMinLodClamp: $0[7] as! SGScalar, offset: $0[8] as! SGVector) })
+        cases.append(OperationTestCase(nodeType: "ND_RealityKitTexture2DPixel_vector4", inputs: [.asset, .int, .float, .float, .vector4f, .vector2f, .float, .float, .vector2i], output: .vector4f) { ShaderGraphCoder.pixel(file: $0[0] as! SGTexture, maxAnisotropy: $0[1] as! SGScalar, maxLodClamp: $0[2] as! SGScalar, minLodClamp: $0[3] as! SGScalar, defaultValue: $0[4] as! SGVector, texcoord: $0[5] as! SGVector, bias: $0[6] as! SGScalar, dynamicMinLodClamp: $0[7] as! SGScalar, offset: $0[8] as! SGVector) })
+        return cases
+    }
+    func testPixel() throws {
+        try check(OperationTests.pixelCases())
+    }
+    
+    static func pixelGradientCases() -> [OperationTestCase] {
+        var cases: [OperationTestCase] = []
+        cases.append(OperationTestCase(nodeType: "ND_RealityKitTexture2DPixelGradient_color3", inputs: [.asset, .int, .float, .float, .color3f, .vector2f, .float, .vector2f, .vector2f, .vector2i], output: .color3f) { ShaderGraphCoder.pixelGradient(file: $0[0] as! SGTexture, maxAnisotropy: $0[1] as! SGScalar, maxLodClamp: $0[2] as! SGScalar, minLodClamp: $0[3] as! SGScalar, defaultValue: $0[4] as! SGColor, texcoord: $0[5] as! SGVector, dynamicMinLodClamp: $0[6] as! SGScalar, gradientDpdx: $0[7] as! SGVector, gradientDpdy: $0[8] as! SGVector, offset: $0[9] as! SGVector) })
+        cases.append(OperationTestCase(nodeType: "ND_RealityKitTexture2DPixelGradient_color4", inputs: [.asset, .int, .float, .float, .color4f, .vector2f, .float, .vector2f, .vector2f, .vector2i], output: .color4f) { ShaderGraphCoder.pixelGradient(file: $0[0] as! SGTexture, maxAnisotropy: $0[1] as! SGScalar, maxLodClamp: $0[2] as! SGScalar, minLodClamp: $0[3] as! SGScalar, defaultValue: $0[4] as! SGColor, texcoord: $0[5] as! SGVector, dynamicMinLodClamp: $0[6] as! SGScalar, gradientDpdx: $0[7] as! SGVector, gradientDpdy: $0[8] as! SGVector, offset: $0[9] as! SGVector) })
+        cases.append(OperationTestCase(nodeType: "ND_RealityKitTexture2DPixelGradient_vector4", inputs: [.asset, .int, .float, .float, .vector4f, .vector2f, .float, .vector2f, .vector2f, .vector2i], output: .vector4f) { ShaderGraphCoder.pixelGradient(file: $0[0] as! SGTexture, maxAnisotropy: $0[1] as! SGScalar, maxLodClamp: $0[2] as! SGScalar, minLodClamp: $0[3] as! SGScalar, defaultValue: $0[4] as! SGVector, texcoord: $0[5] as! SGVector, dynamicMinLodClamp: $0[6] as! SGScalar, gradientDpdx: $0[7] as! SGVector, gradientDpdy: $0[8] as! SGVector, offset: $0[9] as! SGVector) })
+        return cases
+    }
+    func testPixelGradient() throws {
+        try check(OperationTests.pixelGradientCases())
+    }
+    
+    static func pixelLODCases() -> [OperationTestCase] {
+        var cases: [OperationTestCase] = []
+        cases.append(OperationTestCase(nodeType: "ND_RealityKitTexture2DPixelLOD_color3", inputs: [.asset, .int, .float, .float, .color3f, .vector2f, .float, .vector2i], output: .color3f) { ShaderGraphCoder.pixelLOD(file: $0[0] as! SGTexture, maxAnisotropy: $0[1] as! SGScalar, maxLodClamp: $0[2] as! SGScalar, minLodClamp: $0[3] as! SGScalar, defaultValue: $0[4] as! SGColor, texcoord: $0[5] as! SGVector, lod: $0[6] as! SGScalar, offset: $0[7] as! SGVector) })
+        cases.append(OperationTestCase(nodeType: "ND_RealityKitTexture2DPixelLOD_color4", inputs: [.asset, .int, .float, .float, .color4f, .vector2f, .float, .vector2i], output: .color4f) { ShaderGraphCoder.pixelLOD(file: $0[0] as! SGTexture, maxAnisotropy: $0[1] as! SGScalar, maxLodClamp: $0[2] as! SGScalar, minLodClamp: $0[3] as! SGScalar, defaultValue: $0[4] as! SGColor, texcoord: $0[5] as! SGVector, lod: $0[6] as! SGScalar, offset: $0[7] as! SGVector) })
+        cases.append(OperationTestCase(nodeType: "ND_RealityKitTexture2DPixelLOD_vector4", inputs: [.asset, .int, .float, .float, .vector4f, .vector2f, .float, .vector2i], output: .vector4f) { ShaderGraphCoder.pixelLOD(file: $0[0] as! SGTexture, maxAnisotropy: $0[1] as! SGScalar, maxLodClamp: $0[2] as! SGScalar, minLodClamp: $0[3] as! SGScalar, defaultValue: $0[4] as! SGVector, texcoord: $0[5] as! SGVector, lod: $0[6] as! SGScalar, offset: $0[7] as! SGVector) })
+        return cases
+    }
+    func testPixelLOD() throws {
+        try check(OperationTests.pixelLODCases())
+    }
+    
+    static func place2DCases() -> [OperationTestCase] {
+        var cases: [OperationTestCase] = []
+        cases.append(OperationTestCase(nodeType: "ND_place2d_vector2", inputs: [.vector2f, .vector2f, .vector2f, .float, .vector2f], output: .vector2f) { ShaderGraphCoder.place2D(texcoord: $0[0] as! SGVector, pivot: $0[1] as! SGVector, scale: $0[2] as! SGVector, rotate: $0[3] as! SGScalar, offset: $0[4] as! SGVector) })
+        return cases
+    }
+    func testPlace2D() throws {
+        try check(OperationTests.place2DCases())
+    }
+    
+    static func plusCases() -> [OperationTestCase] {
+        var cases: [OperationTestCase] = []
+        cases.append(OperationTestCase(nodeType: "ND_plus_color3", inputs: [.color3f, .color3f, .float], output: .color3f) { ShaderGraphCoder.plus(fg: $0[0] as! SGColor, bg: $0[1] as! SGColor, mix: $0[2] as! SGScalar) })
+        cases.append(OperationTestCase(nodeType: "ND_plus_color4", inputs: [.color4f, .color4f, .float], output: .color4f) { ShaderGraphCoder.plus(fg: $0[0] as! SGColor, bg: $0[1] as! SGColor, mix: $0[2] as! SGScalar) })
+        cases.append(OperationTestCase(nodeType: "ND_plus_float", inputs: [.float, .float, .float], output: .float) { ShaderGraphCoder.plus(fg: $0[0] as! SGScalar, bg: $0[1] as! SGScalar, mix: $0[2] as! SGScalar) })
+        cases.append(OperationTestCase(nodeType: "ND_plus_half", inputs: [.half, .half, .half], output: .half) { ShaderGraphCoder.plus(fg: $0[0] as! SGScalar, bg: $0[1] as! SGScalar, mix: $0[2] as! SGScalar) })
+        return cases
+    }
+    func testPlus() throws {
+        try check(OperationTests.plusCases())
+    }
+    
+    static func powCases() -> [OperationTestCase] {
+        var cases: [OperationTestCase] = []
+        cases.append(OperationTestCase(nodeType: "ND_power_color3", inputs: [.color3f, .color3f], output: .color3f) { ShaderGraphCoder.pow($0[0] as! SGColor, $0[1] as! SGNumeric) })
+        cases.append(OperationTestCase(nodeType: "ND_power_color3FA", inputs: [.color3f, .float], output: .color3f) { ShaderGraphCoder.pow($0[0] as! SGColor, $0[1] as! SGNumeric) })
+        cases.append(OperationTestCase(nodeType: "ND_power_color4", inputs: [.color4f, .color4f], output: .color4f) { ShaderGraphCoder.pow($0[0] as! SGColor, $0[1] as! SGNumeric) })
+        cases.append(OperationTestCase(nodeType: "ND_power_color4FA", inputs: [.color4f, .float], output: .color4f) { ShaderGraphCoder.pow($0[0] as! SGColor, $0[1] as! SGNumeric) })
+        cases.append(OperationTestCase(nodeType: "ND_power_float", inputs: [.float, .float], output: .float) { ShaderGraphCoder.pow($0[0] as! SGScalar, $0[1] as! SGNumeric) })
+        cases.append(OperationTestCase(nodeType: "ND_power_half", inputs: [.half, .half], output: .half) { ShaderGraphCoder.pow($0[0] as! SGScalar, $0[1] as! SGNumeric) })
+        cases.append(OperationTestCase(nodeType: "ND_power_vector2", inputs: [.vector2f, .vector2f], output: .vector2f) { ShaderGraphCoder.pow($0[0] as! SGVector, $0[1] as! SGNumeric) })
+        cases.append(OperationTestCase(nodeType: "ND_power_vector2FA", inputs: [.vector2f, .float], output: .vector2f) { ShaderGraphCoder.pow($0[0] as! SGVector, $0[1] as! SGNumeric) })
+        cases.append(OperationTestCase(nodeType: "ND_power_vector3", inputs: [.vector3f, .vector3f], output: .vector3f) { ShaderGraphCoder.pow($0[0] as! SGVector, $0[1] as! SGNumeric) })
+        cases.append(OperationTestCase(nodeType: "ND_power_vector3FA", inputs: [.vector3f, .float], output: .vector3f) { ShaderGraphCoder.pow($0[0] as! SGVector, $0[1] as! SGNumeric) })
+        cases.append(OperationTestCase(nodeType: "ND_power_vector4", inputs: [.vector4f, .vector4f], output: .vector4f) { ShaderGraphCoder.pow($0[0] as! SGVector, $0[1] as! SGNumeric) })
+        cases.append(OperationTestCase(nodeType: "ND_power_vector4FA", inputs: [.vector4f, .float], output: .vector4f) { ShaderGraphCoder.pow($0[0] as! SGVector, $0[1] as! SGNumeric) })
+        return cases
+    }
+    func testPow() throws {
+        try check(OperationTests.powCases())
+    }
+    
+    static func premultCases() -> [OperationTestCase] {
+        var cases: [OperationTestCase] = []
+        cases.append(OperationTestCase(nodeType: "ND_premult_color4", inputs: [.color4f], output: .color4f) { ShaderGraphCoder.premult($0[0] as! SGColor) })
+        return cases
+    }
+    func testPremult() throws {
+        try check(OperationTests.premultCases())
+    }
+    
+    static func ramp4Cases() -> [OperationTestCase] {
+        var cases: [OperationTestCase] = []
+        cases.append(OperationTestCase(nodeType: "ND_ramp4_color3", inputs: [.color3f, .color3f, .color3f, .color3f, .vector2f], output: .color3f) { ShaderGraphCoder.ramp4(valuetl: $0[0] as! SGColor, valuetr: $0[1] as! SGColor, valuebl: $0[2] as! SGColor, valuebr: $0[3] as! SGColor, texcoord: $0[4] as! SGVector) })
+        cases.append(OperationTestCase(nodeType: "ND_ramp4_color4", inputs: [.color4f, .color4f, .color4f, .color4f, .vector2f], output: .color4f) { ShaderGraphCoder.ramp4(valuetl: $0[0] as! SGColor, valuetr: $0[1] as! SGColor, valuebl: $0[2] as! SGColor, valuebr: $0[3] as! SGColor, texcoord: $0[4] as! SGVector) })
+        cases.append(OperationTestCase(nodeType: "ND_ramp4_float", inputs: [.float, .float, .float, .float, .vector2f], output: .float) { ShaderGraphCoder.ramp4(valuetl: $0[0] as! SGScalar, valuetr: $0[1] as! SGScalar, valuebl: $0[2] as! SGScalar, valuebr: $0[3] as! SGScalar, texcoord: $0[4] as! SGVector) })
+        cases.append(OperationTestCase(nodeType: "ND_ramp4_vector2", inputs: [.vector2f, .vector2f, .vector2f, .vector2f, .vector2f], output: .vector2f) { ShaderGraphCoder.ramp4(valuetl: $0[0] as! SGVector, valuetr: $0[1] as! SGVector, valuebl: $0[2] as! SGVector, valuebr: $0[3] as! SGVector, texcoord: $0[4] as! SGVector) })
+        cases.append(OperationTestCase(nodeType: "ND_ramp4_vector3", inputs: [.vector3f, .vector3f, .vector3f, .vector3f, .vector2f], output: .vector3f) { ShaderGraphCoder.ramp4(valuetl: $0[0] as! SGVector, valuetr: $0[1] as! SGVector, valuebl: $0[2] as! SGVector, valuebr: $0[3] as! SGVector, texcoord: $0[4] as! SGVector) })
+        cases.append(OperationTestCase(nodeType: "ND_ramp4_vector4", inputs: [.vector4f, .vector4f, .vector4f, .vector4f, .vector2f], output: .vector4f) { ShaderGraphCoder.ramp4(valuetl: $0[0] as! SGVector, valuetr: $0[1] as! SGVector, valuebl: $0[2] as! SGVector, valuebr: $0[3] as! SGVector, texcoord: $0[4] as! SGVector) })
+        return cases
+    }
+    func testRamp4() throws {
+        try check(OperationTests.ramp4Cases())
+    }
+    
+    static func ramplrCases() -> [OperationTestCase] {
+        var cases: [OperationTestCase] = []
+        cases.append(OperationTestCase(nodeType: "ND_ramplr_color3", inputs: [.color3f, .color3f, .vector2f], output: .color3f) { ShaderGraphCoder.ramplr(valuel: $0[0] as! SGColor, valuer: $0[1] as! SGColor, texcoord: $0[2] as! SGVector) })
+        cases.append(OperationTestCase(nodeType: "ND_ramplr_color4", inputs: [.color4f, .color4f, .vector2f], output: .color4f) { ShaderGraphCoder.ramplr(valuel: $0[0] as! SGColor, valuer: $0[1] as! SGColor, texcoord: $0[2] as! SGVector) })
+        cases.append(OperationTestCase(nodeType: "ND_ramplr_float", inputs: [.float, .float, .vector2f], output: .float) { ShaderGraphCoder.ramplr(valuel: $0[0] as! SGScalar, valuer: $0[1] as! SGScalar, texcoord: $0[2] as! SGVector) })
+        cases.append(OperationTestCase(nodeType: "ND_ramplr_half", inputs: [.half, .half, .vector2f], output: .half) { ShaderGraphCoder.ramplr(valuel: $0[0] as! SGScalar, valuer: $0[1] as! SGScalar, texcoord: $0[2] as! SGVector) })
+        cases.append(OperationTestCase(nodeType: "ND_ramplr_half2", inputs: [.vector2h, .vector2h, .vector2f], output: .vector2h) { ShaderGraphCoder.ramplr(valuel: $0[0] as! SGVector, valuer: $0[1] as! SGVector, texcoord: $0[2] as! SGVector) })
+        cases.append(OperationTestCase(nodeType: "ND_ramplr_half3", inputs: [.vector3h, .vector3h, .vector2f], output: .vector3h) { ShaderGraphCoder.ramplr(valuel: $0[0] as! SGVector, valuer: $0[1] as! SGVector, texcoord: $0[2] as! SGVector) })
+        cases.append(OperationTestCase(nodeType: "ND_ramplr_half4", inputs: [.vector4h, .vector4h, .vector2f], output: .vector4h) { ShaderGraphCoder.ramplr(valuel: $0[0] as! SGVector, valuer: $0[1] as! SGVector, texcoord: $0[2] as! SGVector) })
+        cases.append(OperationTestCase(nodeType: "ND_ramplr_vector2", inputs: [.vector2f, .vector2f, .vector2f], output: .vector2f) { ShaderGraphCoder.ramplr(valuel: $0[0] as! SGVector, valuer: $0[1] as! SGVector, texcoord: $0[2] as! SGVector) })
+        cases.append(OperationTestCase(nodeType: "ND_ramplr_vector3", inputs: [.vector3f, .vector3f, .vector2f], output: .vector3f) { ShaderGraphCoder.ramplr(valuel: $0[0] as! SGVector, valuer: $0[1] as! SGVector, texcoord: $0[2] as! SGVector) })
+        cases.append(OperationTestCase(nodeType: "ND_ramplr_vector4", inputs: [.vector4f, .vector4f, .vector2f], output: .vector4f) { ShaderGraphCoder.ramplr(valuel: $0[0] as! SGVector, valuer: $0[1] as! SGVector, texcoord: $0[2] as! SGVector) })
+        return cases
+    }
+    func testRamplr() throws {
+        try check(OperationTests.ramplrCases())
+    }
+    
+    static func ramptbCases() -> [OperationTestCase] {
+        var cases: [OperationTestCase] = []
+        cases.append(OperationTestCase(nodeType: "ND_ramptb_color3", inputs: [.color3f, .color3f, .vector2f], output: .color3f) { ShaderGraphCoder.ramptb(valuet: $0[0] as! SGColor, valueb: $0[1] as! SGColor, texcoord: $0[2] as! SGVector) })
+        cases.append(OperationTestCase(nodeType: "ND_ramptb_color4", inputs: [.color4f, .color4f, .vector2f], output: .color4f) { ShaderGraphCoder.ramptb(valuet: $0[0] as! SGColor, valueb: $0[1] as! SGColor, texcoord: $0[2] as! SGVector) })
+        cases.append(OperationTestCase(nodeType: "ND_ramptb_float", inputs: [.float, .float, .vector2f], output: .float) { ShaderGraphCoder.ramptb(valuet: $0[0] as! SGScalar, valueb: $0[1] as! SGScalar, texcoord: $0[2] as! SGVector) })
+        cases.append(OperationTestCase(nodeType: "ND_ramptb_half", inputs: [.half, .half, .vector2f], output: .half) { ShaderGraphCoder.ramptb(valuet: $0[0] as! SGScalar, valueb: $0[1] as! SGScalar, texcoord: $0[2] as! SGVector) })
+        cases.append(OperationTestCase(nodeType: "ND_ramptb_half2", inputs: [.vector2h, .vector2h, .vector2f], output: .vector2h) { ShaderGraphCoder.ramptb(valuet: $0[0] as! SGVector, valueb: $0[1] as! SGVector, texcoord: $0[2] as! SGVector) })
+        cases.append(OperationTestCase(nodeType: "ND_ramptb_half3", inputs: [.vector3h, .vector3h, .vector2f], output: .vector3h) { ShaderGraphCoder.ramptb(valuet: $0[0] as! SGVector, valueb: $0[1] as! SGVector, texcoord: $0[2] as! SGVector) })
+        cases.append(OperationTestCase(nodeType: "ND_ramptb_half4", inputs: [.vector4h, .vector4h, .vector2f], output: .vector4h) { ShaderGraphCoder.ramptb(valuet: $0[0] as! SGVector, valueb: $0[1] as! SGVector, texcoord: $0[2] as! SGVector) })
+        cases.append(OperationTestCase(nodeType: "ND_ramptb_vector2", inputs: [.vector2f, .vector2f, .vector2f], output: .vector2f) { ShaderGraphCoder.ramptb(valuet: $0[0] as! SGVector, valueb: $0[1] as! SGVector, texcoord: $0[2] as! SGVector) })
+        cases.append(OperationTestCase(nodeType: "ND_ramptb_vector3", inputs: [.vector3f, .vector3f, .vector2f], output: .vector3f) { ShaderGraphCoder.ramptb(valuet: $0[0] as! SGVector, valueb: $0[1] as! SGVector, texcoord: $0[2] as! SGVector) })
+        cases.append(OperationTestCase(nodeType: "ND_ramptb_vector4", inputs: [.vector4f, .vector4f, .vector2f], output: .vector4f) { ShaderGraphCoder.ramptb(valuet: $0[0] as! SGVector, valueb: $0[1] as! SGVector, texcoord: $0[2] as! SGVector) })
+        return cases
+    }
+    func testRamptb() throws {
+        try check(OperationTests.ramptbCases())
+    }
+    
+    static func rangeCases() -> [OperationTestCase] {
+        var cases: [OperationTestCase] = []
+        cases.append(OperationTestCase(nodeType: "ND_range_color3", inputs: [.color3f, .color3f, .color3f, .color3f, .color3f, .color3f, .bool], output: .color3f) { ShaderGraphCoder.range($0[0] as! SGColor, inlow: $0[1] as! SGNumeric, inhigh: $0[2] as! SGNumeric, gamma: $0[3] as! SGNumeric, outlow: $0[4] as! SGNumeric, outhigh: $0[5] as! SGNumeric, doclamp: $0[6] as! SGValue) })
+        cases.append(OperationTestCase(nodeType: "ND_range_color3FA", inputs: [.color3f, .float, .float, .float, .float, .float, .bool], output: .color3f) { ShaderGraphCoder.range($0[0] as! SGColor, inlow: $0[1] as! SGNumeric, inhigh: $0[2] as! SGNumeric, gamma: $0[3] as! SGNumeric, outlow: $0[4] as! SGNumeric, outhigh: $0[5] as! SGNumeric, doclamp: $0[6] as! SGValue) })
+        cases.append(OperationTestCase(nodeType: "ND_range_color4", inputs: [.color4f, .color4f, .color4f, .color4f, .color4f, .color4f, .bool], output: .color4f) { ShaderGraphCoder.range($0[0] as! SGColor, inlow: $0[1] as! SGNumeric, inhigh: $0[2] as! SGNumeric, gamma: $0[3] as! SGNumeric, outlow: $0[4] as! SGNumeric, outhigh: $0[5] as! SGNumeric, doclamp: $0[6] as! SGValue) })
+        cases.append(OperationTestCase(nodeType: "ND_range_color4FA", inputs: [.color4f, .float, .float, .float, .float, .float, .bool], output: .color4f) { ShaderGraphCoder.range($0[0] as! SGColor, inlow: $0[1] as! SGNumeric, inhigh: $0[2] as! SGNumeric, gamma: $0[3] as! SGNumeric, outlow: $0[4] as! SGNumeric, outhigh: $0[5] as! SGNumeric, doclamp: $0[6] as! SGValue) })
+        cases.append(OperationTestCase(nodeType: "ND_range_float", inputs: [.float, .float, .float, .float, .float, .float, .bool], output: .float) { ShaderGraphCoder.range($0[0] as! SGScalar, inlow: $0[1] as! SGNumeric, inhigh: $0[2] as! SGNumeric, gamma: $0[3] as! SGNumeric, outlow: $0[4] as! SGNumeric, outhigh: $0[5] as! SGNumeric, doclamp: $0[6] as! SGValue) })
+        cases.append(OperationTestCase(nodeType: "ND_range_vector2", inputs: [.vector2f, .vector2f, .vector2f, .vector2f, .vector2f, .vector2f, .bool], output: .vector2f) { ShaderGraphCoder.range($0[0] as! SGVector, inlow: $0[1] as! SGNumeric, inhigh: $0[2] as! SGNumeric, gamma: $0[3] as! SGNumeric, outlow: $0[4] as! SGNumeric, outhigh: $0[5] as! SGNumeric, doclamp: $0[6] as! SGValue) })
+        cases.append(OperationTestCase(nodeType: "ND_range_vector2FA", inputs: [.vector2f, .float, .float, .float, .float, .float, .bool], output: .vector2f) { ShaderGraphCoder.range($0[0] as! SGVector, inlow: $0[1] as! SGNumeric, inhigh: $0[2] as! SGNumeric, gamma: $0[3] as! SGNumeric, outlow: $0[4] as! SGNumeric, outhigh: $0[5] as! SGNumeric, doclamp: $0[6] as! SGValue) })
+        cases.append(OperationTestCase(nodeType: "ND_range_vector3", inputs: [.vector3f, .vector3f, .vector3f, .vector3f, .vector3f, .vector3f, .bool], output: .vector3f) { ShaderGraphCoder.range($0[0] as! SGVector, inlow: $0[1] as! SGNumeric, inhigh: $0[2] as! SGNumeric, gamma: $0[3] as! SGNumeric, outlow: $0[4] as! SGNumeric, outhigh: $0[5] as! SGNumeric, doclamp: $0[6] as! SGValue) })
+        cases.append(OperationTestCase(nodeType: "ND_range_vector3FA", inputs: [.vector3f, .float, .float, .float, .float, .float, .bool], output: .vector3f) { ShaderGraphCoder.range($0[0] as! SGVector, inlow: $0[1] as! SGNumeric, inhigh: $0[2] as! SGNumeric, gamma: $0[3] as! SGNumeric, outlow: $0[4] as! SGNumeric, outhigh: $0[5] as! SGNumeric, doclamp: $0[6] as! SGValue) })
+        cases.append(OperationTestCase(nodeType: "ND_range_vector4", inputs: [.vector4f, .vector4f, .vector4f, .vector4f, .vector4f, .vector4f, .bool], output: .vector4f) { ShaderGraphCoder.range($0[0] as! SGVector, inlow: $0[1] as! SGNumeric, inhigh: $0[2] as! SGNumeric, gamma: $0[3] as! SGNumeric, outlow: $0[4] as! SGNumeric, outhigh: $0[5] as! SGNumeric, doclamp: $0[6] as! SGValue) })
+        cases.append(OperationTestCase(nodeType: "ND_range_vector4FA", inputs: [.vector4f, .float, .float, .float, .float, .float, .bool], output: .vector4f) { ShaderGraphCoder.range($0[0] as! SGVector, inlow: $0[1] as! SGNumeric, inhigh: $0[2] as! SGNumeric, gamma: $0[3] as! SGNumeric, outlow: $0[4] as! SGNumeric, outhigh: $0[5] as! SGNumeric, doclamp: $0[6] as! SGValue) })
+        return cases
+    }
+    func testRange() throws {
+        try check(OperationTests.rangeCases())
+    }
+    
+    static func readCases() -> [OperationTestCase] {
+        var cases: [OperationTestCase] = []
+        cases.append(OperationTestCase(nodeType: "ND_RealityKitTextureRead_color4", inputs: [.asset, .color4f, .int, .int, .int], output: .color4f) { ShaderGraphCoder.read(file: $0[0] as! SGTexture, defaultValue: $0[1] as! SGColor, x: $0[2] as! SGScalar, y: $0[3] as! SGScalar, lod: $0[4] as! SGScalar) })
+        cases.append(OperationTestCase(nodeType: "ND_RealityKitTextureRead_vector4", inputs: [.asset, .vector4f, .int, .int, .int], output: .vector4f) { ShaderGraphCoder.read(file: $0[0] as! SGTexture, defaultValue: $0[1] as! SGVector, x: $0[2] as! SGScalar, y: $0[3] as! SGScalar, lod: $0[4] as! SGScalar) })
+        return cases
+    }
+    func testRead() throws {
+        try check(OperationTests.readCases())
+    }
+    
+    static func reflectCases() -> [OperationTestCase] {
+        var cases: [OperationTestCase] = []
+        cases.append(OperationTestCase(nodeType: "ND_realitykit_reflect_vector3", inputs: [.vector3f, .vector3f], output: .vector3f) { ShaderGraphCoder.reflect($0[0] as! SGVector, normal: $0[1] as! SGVector) })
+        return cases
+    }
+    func testReflect() throws {
+        try check(OperationTests.reflectCases())
+    }
+    
+    static func refractCases() -> [OperationTestCase] {
+        var cases: [OperationTestCase] = []
+        cases.append(OperationTestCase(nodeType: "ND_realitykit_refract_vector3", inputs: [.vector3f, .vector3f, .float], output: .vector3f) { ShaderGraphCoder.refract($0[0] as! SGVector, normal: $0[1] as! SGVector, eta: $0[2] as! SGScalar) })
+        return cases
+    }
+    func testRefract() throws {
+        try check(OperationTests.refractCases())
+    }
+    
+    static func remapCases() -> [OperationTestCase] {
+        var cases: [OperationTestCase] = []
+        cases.append(OperationTestCase(nodeType: "ND_remap_color3", inputs: [.color3f, .color3f, .color3f, .color3f, .color3f], output: .color3f) { ShaderGraphCoder.remap($0[0] as! SGColor, inlow: $0[1] as! SGNumeric, inhigh: $0[2] as! SGNumeric, outlow: $0[3] as! SGNumeric, outhigh: $0[4] as! SGNumeric) })
+        cases.append(OperationTestCase(nodeType: "ND_remap_color3FA", inputs: [.color3f, .float, .float, .float, .float], output: .color3f) { ShaderGraphCoder.remap($0[0] as! SGColor, inlow: $0[1] as! SGNumeric, inhigh: $0[2] as! SGNumeric, outlow: $0[3] as! SGNumeric, outhigh: $0[4] as! SGNumeric) })
+        cases.append(OperationTestCase(nodeType: "ND_remap_color4", inputs: [.color4f, .color4f, .color4f, .color4f, .color4f], output: .color4f) { ShaderGraphCoder.remap($0[0] as! SGColor, inlow: $0[1] as! SGNumeric, inhigh: $0[2] as! SGNumeric, outlow: $0[3] as! SGNumeric, outhigh: $0[4] as! SGNumeric) })
+        cases.append(OperationTestCase(nodeType: "ND_remap_color4FA", inputs: [.color4f, .float, .float, .float, .float], output: .color4f) { ShaderGraphCoder.remap($0[0] as! SGColor, inlow: $0[1] as! SGNumeric, inhigh: $0[2] as! SGNumeric, outlow: $0[3] as! SGNumeric, outhigh: $0[4] as! SGNumeric) })
+        cases.append(OperationTestCase(nodeType: "ND_remap_float", inputs: [.float, .float, .float, .float, .float], output: .float) { ShaderGraphCoder.remap($0[0] as! SGScalar, inlow: $0[1] as! SGNumeric, inhigh: $0[2] as! SGNumeric, outlow: $0[3] as! SGNumeric, outhigh: $0[4] as! SGNumeric) })
+        cases.append(OperationTestCase(nodeType: "ND_remap_half", inputs: [.half, .half, .half, .half, .half], output: .half) { ShaderGraphCoder.remap($0[0] as! SGScalar, inlow: $0[1] as! SGNumeric, inhigh: $0[2] as! SGNumeric, outlow: $0[3] as! SGNumeric, outhigh: $0[4] as! SGNumeric) })
+        cases.append(OperationTestCase(nodeType: "ND_remap_half2", inputs: [.vector2h, .vector2h, .vector2h, .vector2h, .vector2h], output: .vector2h) { ShaderGraphCoder.remap($0[0] as! SGVector, inlow: $0[1] as! SGNumeric, inhigh: $0[2] as! SGNumeric, outlow: $0[3] as! SGNumeric, outhigh: $0[4] as! SGNumeric) })
+        cases.append(OperationTestCase(nodeType: "ND_remap_half2FA", inputs: [.vector2h, .float, .float, .float, .float], output: .vector2h) { ShaderGraphCoder.remap($0[0] as! SGVector, inlow: $0[1] as! SGNumeric, inhigh: $0[2] as! SGNumeric, outlow: $0[3] as! SGNumeric, outhigh: $0[4] as! SGNumeric) })
+        cases.append(OperationTestCase(nodeType: "ND_remap_half3", inputs: [.vector3h, .vector3h, .vector3h, .vector3h, .vector3h], output: .vector3h) { ShaderGraphCoder.remap($0[0] as! SGVector, inlow: $0[1] as! SGNumeric, inhigh: $0[2] as! SGNumeric, outlow: $0[3] as! SGNumeric, outhigh: $0[4] as! SGNumeric) })
+        cases.append(OperationTestCase(nodeType: "ND_remap_half3FA", inputs: [.vector3h, .float, .float, .float, .float], output: .vector3h) { ShaderGraphCoder.remap($0[0] as! SGVector, inlow: $0[1] as! SGNumeric, inhigh: $0[2] as! SGNumeric, outlow: $0[3] as! SGNumeric, outhigh: $0[4] as! SGNumeric) })
+        cases.append(OperationTestCase(nodeType: "ND_remap_half4", inputs: [.vector4h, .vector4h, .vector4h, .vector4h, .vector4h], output: .vector4h) { ShaderGraphCoder.remap($0[0] as! SGVector, inlow: $0[1] as! SGNumeric, inhigh: $0[2] as! SGNumeric, outlow: $0[3] as! SGNumeric, outhigh: $0[4] as! SGNumeric) })
+        cases.append(OperationTestCase(nodeType: "ND_remap_half4FA", inputs: [.vector4h, .float, .float, .float, .float], output: .vector4h) { ShaderGraphCoder.remap($0[0] as! SGVector, inlow: $0[1] as! SGNumeric, inhigh: $0[2] as! SGNumeric, outlow: $0[3] as! SGNumeric, outhigh: $0[4] as! SGNumeric) })
+        cases.append(OperationTestCase(nodeType: "ND_remap_vector2", inputs: [.vector2f, .vector2f, .vector2f, .vector2f, .vector2f], output: .vector2f) { ShaderGraphCoder.remap($0[0] as! SGVector, inlow: $0[1] as! SGNumeric, inhigh: $0[2] as! SGNumeric, outlow: $0[3] as! SGNumeric, outhigh: $0[4] as! SGNumeric) })
+        cases.append(OperationTestCase(nodeType: "ND_remap_vector2FA", inputs: [.vector2f, .float, .float, .float, .float], output: .vector2f) { ShaderGraphCoder.remap($0[0] as! SGVector, inlow: $0[1] as! SGNumeric, inhigh: $0[2] as! SGNumeric, outlow: $0[3] as! SGNumeric, outhigh: $0[4] as! SGNumeric) })
+        cases.append(OperationTestCase(nodeType: "ND_remap_vector3", inputs: [.vector3f, .vector3f, .vector3f, .vector3f, .vector3f], output: .vector3f) { ShaderGraphCoder.remap($0[0] as! SGVector, inlow: $0[1] as! SGNumeric, inhigh: $0[2] as! SGNumeric, outlow: $0[3] as! SGNumeric, outhigh: $0[4] as! SGNumeric) })
+        cases.append(OperationTestCase(nodeType: "ND_remap_vector3FA", inputs: [.vector3f, .float, .float, .float, .float], output: .vector3f) { ShaderGraphCoder.remap($0[0] as! SGVector, inlow: $0[1] as! SGNumeric, inhigh: $0[2] as! SGNumeric, outlow: $0[3] as! SGNumeric, outhigh: $0[4] as! SGNumeric) })
+        cases.append(OperationTestCase(nodeType: "ND_remap_vector4", inputs: [.vector4f, .vector4f, .vector4f, .vector4f, .vector4f], output: .vector4f) { ShaderGraphCoder.remap($0[0] as! SGVector, inlow: $0[1] as! SGNumeric, inhigh: $0[2] as! SGNumeric, outlow: $0[3] as! SGNumeric, outhigh: $0[4] as! SGNumeric) })
+        cases.append(OperationTestCase(nodeType: "ND_remap_vector4FA", inputs: [.vector4f, .float, .float, .float, .float], output: .vector4f) { ShaderGraphCoder.remap($0[0] as! SGVector, inlow: $0[1] as! SGNumeric, inhigh: $0[2] as! SGNumeric, outlow: $0[3] as! SGNumeric, outhigh: $0[4] as! SGNumeric) })
+        return cases
+    }
+    func testRemap() throws {
+        try check(OperationTests.remapCases())
+    }
+    
+    static func rgbToHSVCases() -> [OperationTestCase] {
+        var cases: [OperationTestCase] = []
+        cases.append(OperationTestCase(nodeType: "ND_rgbtohsv_color3", inputs: [.color3f], output: .color3f) { ShaderGraphCoder.rgbToHSV($0[0] as! SGColor) })
+        cases.append(OperationTestCase(nodeType: "ND_rgbtohsv_color4", inputs: [.color4f], output: .color4f) { ShaderGraphCoder.rgbToHSV($0[0] as! SGColor) })
+        return cases
+    }
+    func testRgbToHSV() throws {
+        try check(OperationTests.rgbToHSVCases())
+    }
+    
+    static func rotate2DCases() -> [OperationTestCase] {
+        var cases: [OperationTestCase] = []
+        cases.append(OperationTestCase(nodeType: "ND_rotate2d_vector2", inputs: [.vector2f, .float], output: .vector2f) { ShaderGraphCoder.rotate2D($0[0] as! SGVector, amount: $0[1] as! SGScalar) })
+        return cases
+    }
+    func testRotate2D() throws {
+        try check(OperationTests.rotate2DCases())
+    }
+    
+    static func rotate3DCases() -> [OperationTestCase] {
+        var cases: [OperationTestCase] = []
+        cases.append(OperationTestCase(nodeType: "ND_rotate3d_vector3", inputs: [.vector3f, .float, .vector3f], output: .vector3f) { ShaderGraphCoder.rotate3D($0[0] as! SGVector, amount: $0[1] as! SGScalar, axis: $0[2] as! SGVector) })
+        return cases
+    }
+    func testRotate3D() throws {
+        try check(OperationTests.rotate3DCases())
+    }
+    
+    static func roundCases() -> [OperationTestCase] {
+        var cases: [OperationTestCase] = []
+        cases.append(OperationTestCase(nodeType: "ND_round_color3", inputs: [.color3f], output: .color3f) { ShaderGraphCoder.round($0[0] as! SGColor) })
+        cases.append(OperationTestCase(nodeType: "ND_round_color4", inputs: [.color4f], output: .color4f) { ShaderGraphCoder.round($0[0] as! SGColor) })
+        cases.append(OperationTestCase(nodeType: "ND_round_float", inputs: [.float], output: .float) { ShaderGraphCoder.round($0[0] as! SGScalar) })
+        cases.append(OperationTestCase(nodeType: "ND_round_half", inputs: [.half], output: .half) { ShaderGraphCoder.round($0[0] as! SGScalar) })
+        cases.append(OperationTestCase(nodeType: "ND_round_vector2", inputs: [.vector2f], output: .vector2f) { ShaderGraphCoder.round($0[0] as! SGVector) })
+        cases.append(OperationTestCase(nodeType: "ND_round_vector3", inputs: [.vector3f], output: .vector3f) { ShaderGraphCoder.round($0[0] as! SGVector) })
+        cases.append(OperationTestCase(nodeType: "ND_round_vector4", inputs: [.vector4f], output: .vector4f) { ShaderGraphCoder.round($0[0] as! SGVector) })
+        return cases
+    }
+    func testRound() throws {
+        try check(OperationTests.roundCases())
+    }
+    
+    static func safePowCases() -> [OperationTestCase] {
+        var cases: [OperationTestCase] = []
+        cases.append(OperationTestCase(nodeType: "ND_safepower_color3", inputs: [.color3f, .color3f], output: .color3f) { ShaderGraphCoder.safePow($0[0] as! SGColor, $0[1] as! SGNumeric) })
+        cases.append(OperationTestCase(nodeType: "ND_safepower_color3FA", inputs: [.color3f, .float], output: .color3f) { ShaderGraphCoder.safePow($0[0] as! SGColor, $0[1] as! SGNumeric) })
+        cases.append(OperationTestCase(nodeType: "ND_safepower_color4", inputs: [.color4f, .color4f], output: .color4f) { ShaderGraphCoder.safePow($0[0] as! SGColor, $0[1] as! SGNumeric) })
+        cases.append(OperationTestCase(nodeType: "ND_safepower_color4FA", inputs: [.color4f, .float], output: .color4f) { ShaderGraphCoder.safePow($0[0] as! SGColor, $0[1] as! SGNumeric) })
+        cases.append(OperationTestCase(nodeType: "ND_safepower_float", inputs: [.float, .float], output: .float) { ShaderGraphCoder.safePow($0[0] as! SGScalar, $0[1] as! SGNumeric) })
+        cases.append(OperationTestCase(nodeType: "ND_safepower_half", inputs: [.half, .half], output: .half) { ShaderGraphCoder.safePow($0[0] as! SGScalar, $0[1] as! SGNumeric) })
+        cases.append(OperationTestCase(nodeType: "ND_safepower_vector2", inputs: [.vector2f, .vector2f], output: .vector2f) { ShaderGraphCoder.safePow($0[0] as! SGVector, $0[1] as! SGNumeric) })
+        cases.append(OperationTestCase(nodeType: "ND_safepower_vector2FA", inputs: [.vector2f, .float], output: .vector2f) { ShaderGraphCoder.safePow($0[0] as! SGVector, $0[1] as! SGNumeric) })
+        cases.append(OperationTestCase(nodeType: "ND_safepower_vector3", inputs: [.vector3f, .vector3f], output: .vector3f) { ShaderGraphCoder.safePow($0[0] as! SGVector, $0[1] as! SGNumeric) })
+        cases.append(OperationTestCase(nodeType: "ND_safepower_vector3FA", inputs: [.vector3f, .float], output: .vector3f) { ShaderGraphCoder.safePow($0[0] as! SGVector, $0[1] as! SGNumeric) })
+        cases.append(OperationTestCase(nodeType: "ND_safepower_vector4", inputs: [.vector4f, .vector4f], output: .vector4f) { ShaderGraphCoder.safePow($0[0] as! SGVector, $0[1] as! SGNumeric) })
+        cases.append(OperationTestCase(nodeType: "ND_safepower_vector4FA", inputs: [.vector4f, .float], output: .vector4f) { ShaderGraphCoder.safePow($0[0] as! SGVector, $0[1] as! SGNumeric) })
+        return cases
+    }
+    func testSafePow() throws {
+        try check(OperationTests.safePowCases())
+    }
+    
+    static func sampleCases() -> [OperationTestCase] {
+        var cases: [OperationTestCase] = []
+        cases.append(OperationTestCase(nodeType: "ND_RealityKitTexture2D_color3", inputs: [.asset, .int, .float, .float, .color3f, .vector2f, .float, .float, .vector2i], output: .color3f) { ShaderGraphCoder.sample(file: $0[0] as! SGTexture, maxAnisotropy: $0[1] as! SGScalar, maxLodClamp: $0[2] as! SGScalar, minLodClamp: $0[3] as! SGScalar, defaultValue: $0[4] as! SGColor, texcoord: $0[5] as! SGVector, bias: $0[6] as! SGScalar, dynamicMinLodClamp: $0[7] as! SGScalar, offset: $0[8] as! SGVector) })
+        cases.append(OperationTestCase(nodeType: "ND_RealityKitTexture2D_color4", inputs: [.asset, .int, .float, .float, .color4f, .vector2f, .float, .float, .vector2i], output: .color4f) { ShaderGraphCoder.sample(file: $0[0] as! SGTexture, maxAnisotropy: $0[1] as! SGScalar, maxLodClamp: $0[2] as! SGScalar, minLodClamp: $0[3] as! SGScalar, defaultValue: $0[4] as! SGColor, texcoord: $0[5] as! SGVector, bias: $0[6] as! SGScalar, dynamicMinLodClamp: $0[7] as! SGScalar, offset: $0[8] as! SGVector) })
+        cases.append(OperationTestCase(nodeType: "ND_RealityKitTexture2D_vector4", inputs: [.asset, .int, .float, .float, .vector4f, .vector2f, .float, .float, .vector2i], output: .vector4f) { ShaderGraphCoder.sample(file: $0[0] as! SGTexture, maxAnisotropy: $0[1] as! SGScalar, maxLodClamp: $0[2] as! SGScalar, minLodClamp: $0[3] as! SGScalar, defaultValue: $0[4] as! SGVector, texcoord: $0[5] as! SGVector, bias: $0[6] as! SGScalar, dynamicMinLodClamp: $0[7] as! SGScalar, offset: $0[8] as! SGVector) })
+        return cases
+    }
+    func testSample() throws {
+        try check(OperationTests.sampleCases())
+    }
+    
+    static func sampleCubeCases() -> [OperationTestCase] {
+        var cases: [OperationTestCase] = []
+        cases.append(OperationTestCase(nodeType: "ND_RealityKitTextureCube_color4", inputs: [.asset, .int, .float, .float, .color4f, .vector3f, .float, .float], output: .color4f) { ShaderGraphCoder.sampleCube(file: $0[0] as! SGTexture, maxAnisotropy: $0[1] as! SGScalar, maxLodClamp: $0[2] as! SGScalar, minLodClamp: $0[3] as! SGScalar, defaultValue: $0[4] as! SGColor, texcoord: $0[5] as! SGVector, bias: $0[6] as! SGScalar, dynamicMinLodClamp: $0[7] as! SGScalar) })
+        cases.append(OperationTestCase(nodeType: "ND_RealityKitTextureCube_vector4", inputs: [.asset, .int, .float, .float, .vector4f, .vector3f, .float, .float], output: .vector4f) { ShaderGraphCoder.sampleCube(file: $0[0] as! SGTexture, maxAnisotropy: $0[1] as! SGScalar, maxLodClamp: $0[2] as! SGScalar, minLodClamp: $0[3] as! SGScalar, defaultValue: $0[4] as! SGVector, texcoord: $0[5] as! SGVector, bias: $0[6] as! SGScalar, dynamicMinLodClamp: $0[7] as! SGScalar) })
+        return cases
+    }
+    func testSampleCube() throws {
+        try check(OperationTests.sampleCubeCases())
+    }
+    
+    static func sampleCubeGradientCases() -> [OperationTestCase] {
+        var cases: [OperationTestCase] = []
+        cases.append(OperationTestCase(nodeType: "ND_RealityKitTextureCubeGradient_color4", inputs: [.asset, .int, .float, .float, .color4f, .vector3f, .float, .vector3f, .vector3f], output: .color4f) { ShaderGraphCoder.sampleCubeGradient(file: $0[0] as! SGTexture, maxAnisotropy: $0[1] as! SGScalar, maxLodClamp: $0[2] as! SGScalar, minLodClamp: $0[3] as! SGScalar, defaultValue: $0[4] as! SGColor, texcoord: $0[5] as! SGVector, dynamicMinLodClamp: $0[6] as! SGScalar, gradientcubeDpdx: $0[7] as! SGVector, gradientcubeDpdy: $0[8] as! SGVector) })
+        cases.append(OperationTestCase(nodeType: "ND_RealityKitTextureCubeGradient_vector4", inputs: [.asset, .int, .float, .float, .vector4f, .vector3f, .float, .vector3f, .vector3f], output: .vector4f) { ShaderGraphCoder.sampleCubeGradient(file: $0[0] as! SGTexture, maxAnisotropy: $0[1] as! SGScalar, maxLodClamp: $0[2] as! SGScalar, minLodClamp: $0[3] as! SGScalar, defaultValue: $0[4] as! SGVector, texcoord: $0[5] as! SGVector, dynamicMinLodClamp: $0[6] as! SGScalar, gradientcubeDpdx: $0[7] as! SGVector, gradientcubeDpdy: $0[8] as! SGVector) })
+        return cases
+    }
+    func testSampleCubeGradient() throws {
+        try check(OperationTests.sampleCubeGradientCases())
+    }
+    
+    static func sampleCubeLODCases() -> [OperationTestCase] {
+        var cases: [OperationTestCase] = []
+        cases.append(OperationTestCase(nodeType: "ND_RealityKitTextureCubeLOD_color4", inputs: [.asset, .int, .float, .float, .color4f, .vector3f, .float], output: .color4f) { ShaderGraphCoder.sampleCubeLOD(file: $0[0] as! SGTexture, maxAnisotropy: $0[1] as! SGScalar, maxLodClamp: $0[2] as! SGScalar, minLodClamp: $0[3] as! SGScalar, defaultValue: $0[4] as! SGColor, texcoord: $0[5] as! SGVector, lod: $0[6] as! SGScalar) })
+        cases.append(OperationTestCase(nodeType: "ND_RealityKitTextureCubeLOD_vector4", inputs: [.asset, .int, .float, .float, .vector4f, .vector3f, .float], output: .vector4f) { ShaderGraphCoder.sampleCubeLOD(file: $0[0] as! SGTexture, maxAnisotropy: $0[1] as! SGScalar, maxLodClamp: $0[2] as! SGScalar, minLodClamp: $0[3] as! SGScalar, defaultValue: $0[4] as! SGVector, texcoord: $0[5] as! SGVector, lod: $0[6] as! SGScalar) })
+        return cases
+    }
+    func testSampleCubeLOD() throws {
+        try check(OperationTests.sampleCubeLODCases())
+    }
+    
+    static func sampleGradientCases() -> [OperationTestCase] {
+        var cases: [OperationTestCase] = []
+        cases.append(OperationTestCase(nodeType: "ND_RealityKitTexture2DGradient_color3", inputs: [.asset, .int, .float, .float, .color3f, .vector2f, .float, .vector2f, .vector2f, .vector2i], output: .color3f) { ShaderGraphCoder.sampleGradient(file: $0[0] as! SGTexture, maxAnisotropy: $0[1] as! SGScalar, maxLodClamp: $0[2] as! SGScalar, minLodClamp: $0[3] as! SGScalar, defaultValue: $0[4] as! SGColor, texcoord: $0[5] as! SGVector, dynamicMinLodClamp: $0[6] as! SGScalar, gradientDpdx: $0[7] as! SGVector, gradientDpdy: $0[8] as! SGVector, offset: $0[9] as! SGVector) })
+        cases.append(OperationTestCase(nodeType: "ND_RealityKitTexture2DGradient_color4", inputs: [.asset, .int, .float, .float, .color4f, .vector2f, .float, .vector2f, .vector2f, .vector2i], output: .color4f) { ShaderGraphCoder.sampleGradient(file: $0[0] as! SGTexture, maxAnisotropy: $0[1] as! SGScalar, maxLodClamp: $0[2] as! SGScalar, minLodClamp: $0[3] as! SGScalar, defaultValue: $0[4] as! SGColor, texcoord: $0[5] as! SGVector, dynamicMinLodClamp: $0[6] as! SGScalar, gradientDpdx: $0[7] as! SGVector, gradientDpdy: $0[8] as! SGVector, offset: $0[9] as! SGVector) })
+        cases.append(OperationTestCase(nodeType: "ND_RealityKitTexture2DGradient_vector4", inputs: [.asset, .int, .float, .float, .vector4f, .vector2f, .float, .vector2f, .vector2f, .vector2i], output: .vector4f) { ShaderGraphCoder.sampleGradient(file: $0[0] as! SGTexture, maxAnisotropy: $0[1] as! SGScalar, maxLodClamp: $0[2] as! SGScalar, minLodClamp: $0[3] as! SGScalar, defaultValue: $0[4] as! SGVector, texcoord: $0[5] as! SGVector, dynamicMinLodClamp: $0[6] as! SGScalar, gradientDpdx: $0[7] as! SGVector, gradientDpdy: $0[8] as! SGVector, offset: $0[9] as! SGVector) })
+        return cases
+    }
+    func testSampleGradient() throws {
+        try check(OperationTests.sampleGradientCases())
+    }
+    
+    static func sampleLODCases() -> [OperationTestCase] {
+        var cases: [OperationTestCase] = []
+        cases.append(OperationTestCase(nodeType: "ND_RealityKitTexture2DLOD_color3", inputs: [.asset, .int, .float, .float, .color3f, .vector2f, .float, .vector2i], output: .color3f) { ShaderGraphCoder.sampleLOD(file: $0[0] as! SGTexture, maxAnisotropy: $0[1] as! SGScalar, maxLodClamp: $0[2] as! SGScalar, minLodClamp: $0[3] as! SGScalar, defaultValue: $0[4] as! SGColor, texcoord: $0[5] as! SGVector, lod: $0[6] as! SGScalar, offset: $0[7] as! SGVector) })
+        cases.append(OperationTestCase(nodeType: "ND_RealityKitTexture2DLOD_color4", inputs: [.asset, .int, .float, .float, .color4f, .vector2f, .float, .vector2i], output: .color4f) { ShaderGraphCoder.sampleLOD(file: $0[0] as! SGTexture, maxAnisotropy: $0[1] as! SGScalar, maxLodClamp: $0[2] as! SGScalar, minLodClamp: $0[3] as! SGScalar, defaultValue: $0[4] as! SGColor, texcoord: $0[5] as! SGVector, lod: $0[6] as! SGScalar, offset: $0[7] as! SGVector) })
+        cases.append(OperationTestCase(nodeType: "ND_RealityKitTexture2DLOD_vector4", inputs: [.asset, .int, .float, .float, .vector4f, .vector2f, .float, .vector2i], output: .vector4f) { ShaderGraphCoder.sampleLOD(file: $0[0] as! SGTexture, maxAnisotropy: $0[1] as! SGScalar, maxLodClamp: $0[2] as! SGScalar, minLodClamp: $0[3] as! SGScalar, defaultValue: $0[4] as! SGVector, texcoord: $0[5] as! SGVector, lod: $0[6] as! SGScalar, offset: $0[7] as! SGVector) })
+        return cases
+    }
+    func testSampleLOD() throws {
+        try check(OperationTests.sampleLODCases())
+    }
+    
+    static func saturateCases() -> [OperationTestCase] {
+        var cases: [OperationTestCase] = []
+        cases.append(OperationTestCase(nodeType: "ND_saturate_color3", inputs: [.color3f, .float, .color3f], output: .color3f) { ShaderGraphCoder.saturate($0[0] as! SGColor, amount: $0[1] as! SGScalar, lumacoeffs: $0[2] as! SGColor) })
+        cases.append(OperationTestCase(nodeType: "ND_saturate_color4", inputs: [.color4f, .float, .color3f], output: .color4f) { ShaderGraphCoder.saturate($0[0] as! SGColor, amount: $0[1] as! SGScalar, lumacoeffs: $0[2] as! SGColor) })
+        return cases
+    }
+    func testSaturate() throws {
+        try check(OperationTests.saturateCases())
+    }
+    
+    static func screenCases() -> [OperationTestCase] {
+        var cases: [OperationTestCase] = []
+        cases.append(OperationTestCase(nodeType: "ND_screen_color3", inputs: [.color3f, .color3f, .float], output: .color3f) { ShaderGraphCoder.screen(fg: $0[0] as! SGColor, bg: $0[1] as! SGColor, mix: $0[2] as! SGScalar) })
+        cases.append(OperationTestCase(nodeType: "ND_screen_color4", inputs: [.color4f, .color4f, .float], output: .color4f) { ShaderGraphCoder.screen(fg: $0[0] as! SGColor, bg: $0[1] as! SGColor, mix: $0[2] as! SGScalar) })
+        cases.append(OperationTestCase(nodeType: "ND_screen_float", inputs: [.float, .float, .float], output: .float) { ShaderGraphCoder.screen(fg: $0[0] as! SGScalar, bg: $0[1] as! SGScalar, mix: $0[2] as! SGScalar) })
+        cases.append(OperationTestCase(nodeType: "ND_screen_half", inputs: [.half, .half, .half], output: .half) { ShaderGraphCoder.screen(fg: $0[0] as! SGScalar, bg: $0[1] as! SGScalar, mix: $0[2] as! SGScalar) })
+        return cases
+    }
+    func testScreen() throws {
+        try check(OperationTests.screenCases())
+    }
+    
+    static func signCases() -> [OperationTestCase] {
+        var cases: [OperationTestCase] = []
+        cases.append(OperationTestCase(nodeType: "ND_sign_color3", inputs: [.color3f], output: .color3f) { ShaderGraphCoder.sign($0[0] as! SGColor) })
+        cases.append(OperationTestCase(nodeType: "ND_sign_color4", inputs: [.color4f], output: .color4f) { ShaderGraphCoder.sign($0[0] as! SGColor) })
+        cases.append(OperationTestCase(nodeType: "ND_sign_float", inputs: [.float], output: .float) { ShaderGraphCoder.sign($0[0] as! SGScalar) })
+        cases.append(OperationTestCase(nodeType: "ND_sign_half", inputs: [.half], output: .half) { ShaderGraphCoder.sign($0[0] as! SGScalar) })
+        cases.append(OperationTestCase(nodeType: "ND_sign_half2", inputs: [.vector2h], output: .vector2h) { ShaderGraphCoder.sign($0[0] as! SGVector) })
+        cases.append(OperationTestCase(nodeType: "ND_sign_half3", inputs: [.vector3h], output: .vector3h) { ShaderGraphCoder.sign($0[0] as! SGVector) })
+        cases.append(OperationTestCase(nodeType: "ND_sign_half4", inputs: [.vector4h], output: .vector4h) { ShaderGraphCoder.sign($0[0] as! SGVector) })
+        cases.append(OperationTestCase(nodeType: "ND_sign_vector2", inputs: [.vector2f], output: .vector2f) { ShaderGraphCoder.sign($0[0] as! SGVector) })
+        cases.append(OperationTestCase(nodeType: "ND_sign_vector3", inputs: [.vector3f], output: .vector3f) { ShaderGraphCoder.sign($0[0] as! SGVector) })
+        cases.append(OperationTestCase(nodeType: "ND_sign_vector4", inputs: [.vector4f], output: .vector4f) { ShaderGraphCoder.sign($0[0] as! SGVector) })
+        return cases
+    }
+    func testSign() throws {
+        try check(OperationTests.signCases())
+    }
+    
+    static func sinCases() -> [OperationTestCase] {
+        var cases: [OperationTestCase] = []
+        cases.append(OperationTestCase(nodeType: "ND_sin_float", inputs: [.float], output: .float) { ShaderGraphCoder.sin($0[0] as! SGScalar) })
+        cases.append(OperationTestCase(nodeType: "ND_sin_half", inputs: [.half], output: .half) { ShaderGraphCoder.sin($0[0] as! SGScalar) })
+        cases.append(OperationTestCase(nodeType: "ND_sin_half2", inputs: [.vector2h], output: .vector2h) { ShaderGraphCoder.sin($0[0] as! SGVector) })
+        cases.append(OperationTestCase(nodeType: "ND_sin_half3", inputs: [.vector3h], output: .vector3h) { ShaderGraphCoder.sin($0[0] as! SGVector) })
+        cases.append(OperationTestCase(nodeType: "ND_sin_half4", inputs: [.vector4h], output: .vector4h) { ShaderGraphCoder.sin($0[0] as! SGVector) })
+        cases.append(OperationTestCase(nodeType: "ND_sin_vector2", inputs: [.vector2f], output: .vector2f) { ShaderGraphCoder.sin($0[0] as! SGVector) })
+        cases.append(OperationTestCase(nodeType: "ND_sin_vector3", inputs: [.vector3f], output: .vector3f) { ShaderGraphCoder.sin($0[0] as! SGVector) })
+        cases.append(OperationTestCase(nodeType: "ND_sin_vector4", inputs: [.vector4f], output: .vector4f) { ShaderGraphCoder.sin($0[0] as! SGVector) })
+        return cases
+    }
+    func testSin() throws {
+        try check(OperationTests.sinCases())
+    }
+    
+    static func smoothStepCases() -> [OperationTestCase] {
+        var cases: [OperationTestCase] = []
+        cases.append(OperationTestCase(nodeType: "ND_smoothstep_color3", inputs: [.color3f, .color3f, .color3f], output: .color3f) { ShaderGraphCoder.smoothStep($0[0] as! SGColor, low: $0[1] as! SGNumeric, high: $0[2] as! SGNumeric) })
+        cases.append(OperationTestCase(nodeType: "ND_smoothstep_color3FA", inputs: [.color3f, .float, .float], output: .color3f) { ShaderGraphCoder.smoothStep($0[0] as! SGColor, low: $0[1] as! SGNumeric, high: $0[2] as! SGNumeric) })
+        cases.append(OperationTestCase(nodeType: "ND_smoothstep_color4", inputs: [.color4f, .color4f, .color4f], output: .color4f) { ShaderGraphCoder.smoothStep($0[0] as! SGColor, low: $0[1] as! SGNumeric, high: $0[2] as! SGNumeric) })
+        cases.append(OperationTestCase(nodeType: "ND_smoothstep_color4FA", inputs: [.color4f, .float, .float], output: .color4f) { ShaderGraphCoder.smoothStep($0[0] as! SGColor, low: $0[1] as! SGNumeric, high: $0[2] as! SGNumeric) })
+        cases.append(OperationTestCase(nodeType: "ND_smoothstep_float", inputs: [.float, .float, .float], output: .float) { ShaderGraphCoder.smoothStep($0[0] as! SGScalar, low: $0[1] as! SGNumeric, high: $0[2] as! SGNumeric) })
+        cases.append(OperationTestCase(nodeType: "ND_smoothstep_half", inputs: [.half, .half, .half], output: .half) { ShaderGraphCoder.smoothStep($0[0] as! SGScalar, low: $0[1] as! SGNumeric, high: $0[2] as! SGNumeric) })
+        cases.append(OperationTestCase(nodeType: "ND_smoothstep_half2", inputs: [.vector2h, .vector2h, .vector2h], output: .vector2h) { ShaderGraphCoder.smoothStep($0[0] as! SGVector, low: $0[1] as! SGNumeric, high: $0[2] as! SGNumeric) })
+        cases.append(OperationTestCase(nodeType: "ND_smoothstep_half2FA", inputs: [.vector2h, .float, .float], output: .vector2h) { ShaderGraphCoder.smoothStep($0[0] as! SGVector, low: $0[1] as! SGNumeric, high: $0[2] as! SGNumeric) })
+        cases.append(OperationTestCase(nodeType: "ND_smoothstep_half3", inputs: [.vector3h, .vector3h, .vector3h], output: .vector3h) { ShaderGraphCoder.smoothStep($0[0] as! SGVector, low: $0[1] as! SGNumeric, high: $0[2] as! SGNumeric) })
+        cases.append(OperationTestCase(nodeType: "ND_smoothstep_half3FA", inputs: [.vector3h, .float, .float], output: .vector3h) { ShaderGraphCoder.smoothStep($0[0] as! SGVector, low: $0[1] as! SGNumeric, high: $0[2] as! SGNumeric) })
+        cases.append(OperationTestCase(nodeType: "ND_smoothstep_half4", inputs: [.vector4h, .vector4h, .vector4h], output: .vector4h) { ShaderGraphCoder.smoothStep($0[0] as! SGVector, low: $0[1] as! SGNumeric, high: $0[2] as! SGNumeric) })
+        cases.append(OperationTestCase(nodeType: "ND_smoothstep_half4FA", inputs: [.vector4h, .float, .float], output: .vector4h) { ShaderGraphCoder.smoothStep($0[0] as! SGVector, low: $0[1] as! SGNumeric, high: $0[2] as! SGNumeric) })
+        cases.append(OperationTestCase(nodeType: "ND_smoothstep_vector2", inputs: [.vector2f, .vector2f, .vector2f], output: .vector2f) { ShaderGraphCoder.smoothStep($0[0] as! SGVector, low: $0[1] as! SGNumeric, high: $0[2] as! SGNumeric) })
+        cases.append(OperationTestCase(nodeType: "ND_smoothstep_vector2FA", inputs: [.vector2f, .float, .float], output: .vector2f) { ShaderGraphCoder.smoothStep($0[0] as! SGVector, low: $0[1] as! SGNumeric, high: $0[2] as! SGNumeric) })
+        cases.append(OperationTestCase(nodeType: "ND_smoothstep_vector3", inputs: [.vector3f, .vector3f, .vector3f], output: .vector3f) { ShaderGraphCoder.smoothStep($0[0] as! SGVector, low: $0[1] as! SGNumeric, high: $0[2] as! SGNumeric) })
+        cases.append(OperationTestCase(nodeType: "ND_smoothstep_vector3FA", inputs: [.vector3f, .float, .float], output: .vector3f) { ShaderGraphCoder.smoothStep($0[0] as! SGVector, low: $0[1] as! SGNumeric, high: $0[2] as! SGNumeric) })
+        cases.append(OperationTestCase(nodeType: "ND_smoothstep_vector4", inputs: [.vector4f, .vector4f, .vector4f], output: .vector4f) { ShaderGraphCoder.smoothStep($0[0] as! SGVector, low: $0[1] as! SGNumeric, high: $0[2] as! SGNumeric) })
+        cases.append(OperationTestCase(nodeType: "ND_smoothstep_vector4FA", inputs: [.vector4f, .float, .float], output: .vector4f) { ShaderGraphCoder.smoothStep($0[0] as! SGVector, low: $0[1] as! SGNumeric, high: $0[2] as! SGNumeric) })
+        return cases
+    }
+    func testSmoothStep() throws {
+        try check(OperationTests.smoothStepCases())
+    }
+    
+    static func splitlrCases() -> [OperationTestCase] {
+        var cases: [OperationTestCase] = []
+        cases.append(OperationTestCase(nodeType: "ND_splitlr_color3", inputs: [.color3f, .color3f, .float, .vector2f], output: .color3f) { ShaderGraphCoder.splitlr(valuel: $0[0] as! SGColor, valuer: $0[1] as! SGColor, center: $0[2] as! SGScalar, texcoord: $0[3] as! SGVector) })
+        cases.append(OperationTestCase(nodeType: "ND_splitlr_color4", inputs: [.color4f, .color4f, .float, .vector2f], output: .color4f) { ShaderGraphCoder.splitlr(valuel: $0[0] as! SGColor, valuer: $0[1] as! SGColor, center: $0[2] as! SGScalar, texcoord: $0[3] as! SGVector) })
+        cases.append(OperationTestCase(nodeType: "ND_splitlr_float", inputs: [.float, .float, .float, .vector2f], output: .float) { ShaderGraphCoder.splitlr(valuel: $0[0] as! SGScalar, valuer: $0[1] as! SGScalar, center: $0[2] as! SGScalar, texcoord: $0[3] as! SGVector) })
+        cases.append(OperationTestCase(nodeType: "ND_splitlr_half", inputs: [.half, .half, .float, .vector2f], output: .half) { ShaderGraphCoder.splitlr(valuel: $0[0] as! SGScalar, valuer: $0[1] as! SGScalar, center: $0[2] as! SGScalar, texcoord: $0[3] as! SGVector) })
+        cases.append(OperationTestCase(nodeType: "ND_splitlr_vector2", inputs: [.vector2f, .vector2f, .float, .vector2f], output: .vector2f) { ShaderGraphCoder.splitlr(valuel: $0[0] as! SGVector, valuer: $0[1] as! SGVector, center: $0[2] as! SGScalar, texcoord: $0[3] as! SGVector) })
+        cases.append(OperationTestCase(nodeType: "ND_splitlr_vector3", inputs: [.vector3f, .vector3f, .float, .vector2f], output: .vector3f) { ShaderGraphCoder.splitlr(valuel: $0[0] as! SGVector, valuer: $0[1] as! SGVector, center: $0[2] as! SGScalar, texcoord: $0[3] as! SGVector) })
+        cases.append(OperationTestCase(nodeType: "ND_splitlr_vector4", inputs: [.vector4f, .vector4f, .float, .vector2f], output: .vector4f) { ShaderGraphCoder.splitlr(valuel: $0[0] as! SGVector, valuer: $0[1] as! SGVector, center: $0[2] as! SGScalar, texcoord: $0[3] as! SGVector) })
+        return cases
+    }
+    func testSplitlr() throws {
+        try check(OperationTests.splitlrCases())
+    }
+    
+    static func splittbCases() -> [OperationTestCase] {
+        var cases: [OperationTestCase] = []
+        cases.append(OperationTestCase(nodeType: "ND_splittb_color3", inputs: [.color3f, .color3f, .float, .vector2f], output: .color3f) { ShaderGraphCoder.splittb(valuet: $0[0] as! SGColor, valueb: $0[1] as! SGColor, center: $0[2] as! SGScalar, texcoord: $0[3] as! SGVector) })
+        cases.append(OperationTestCase(nodeType: "ND_splittb_color4", inputs: [.color4f, .color4f, .float, .vector2f], output: .color4f) { ShaderGraphCoder.splittb(valuet: $0[0] as! SGColor, valueb: $0[1] as! SGColor, center: $0[2] as! SGScalar, texcoord: $0[3] as! SGVector) })
+        cases.append(OperationTestCase(nodeType: "ND_splittb_float", inputs: [.float, .float, .float, .vector2f], output: .float) { ShaderGraphCoder.splittb(valuet: $0[0] as! SGScalar, valueb: $0[1] as! SGScalar, center: $0[2] as! SGScalar, texcoord: $0[3] as! SGVector) })
+        cases.append(OperationTestCase(nodeType: "ND_splittb_half", inputs: [.half, .half, .float, .vector2f], output: .half) { ShaderGraphCoder.splittb(valuet: $0[0] as! SGScalar, valueb: $0[1] as! SGScalar, center: $0[2] as! SGScalar, texcoord: $0[3] as! SGVector) })
+        cases.append(OperationTestCase(nodeType: "ND_splittb_half2", inputs: [.vector2h, .vector2h, .float, .vector2f], output: .vector2h) { ShaderGraphCoder.splittb(valuet: $0[0] as! SGVector, valueb: $0[1] as! SGVector, center: $0[2] as! SGScalar, texcoord: $0[3] as! SGVector) })
+        cases.append(OperationTestCase(nodeType: "ND_splittb_half3", inputs: [.vector3h, .vector3h, .float, .vector2f], output: .vector3h) { ShaderGraphCoder.splittb(valuet: $0[0] as! SGVector, valueb: $0[1] as! SGVector, center: $0[2] as! SGScalar, texcoord: $0[3] as! SGVector) })
+        cases.append(OperationTestCase(nodeType: "ND_splittb_half4", inputs: [.vector4h, .vector4h, .float, .vector2f], output: .vector4h) { ShaderGraphCoder.splittb(valuet: $0[0] as! SGVector, valueb: $0[1] as! SGVector, center: $0[2] as! SGScalar, texcoord: $0[3] as! SGVector) })
+        cases.append(OperationTestCase(nodeType: "ND_splittb_vector2", inputs: [.vector2f, .vector2f, .float, .vector2f], output: .vector2f) { ShaderGraphCoder.splittb(valuet: $0[0] as! SGVector, valueb: $0[1] as! SGVector, center: $0[2] as! SGScalar, texcoord: $0[3] as! SGVector) })
+        cases.append(OperationTestCase(nodeType: "ND_splittb_vector3", inputs: [.vector3f, .vector3f, .float, .vector2f], output: .vector3f) { ShaderGraphCoder.splittb(valuet: $0[0] as! SGVector, valueb: $0[1] as! SGVector, center: $0[2] as! SGScalar, texcoord: $0[3] as! SGVector) })
+        cases.append(OperationTestCase(nodeType: "ND_splittb_vector4", inputs: [.vector4f, .vector4f, .float, .vector2f], output: .vector4f) { ShaderGraphCoder.splittb(valuet: $0[0] as! SGVector, valueb: $0[1] as! SGVector, center: $0[2] as! SGScalar, texcoord: $0[3] as! SGVector) })
+        return cases
+    }
+    func testSplittb() throws {
+        try check(OperationTests.splittbCases())
+    }
+    
+    static func sqrtCases() -> [OperationTestCase] {
+        var cases: [OperationTestCase] = []
+        cases.append(OperationTestCase(nodeType: "ND_sqrt_float", inputs: [.float], output: .float) { ShaderGraphCoder.sqrt($0[0] as! SGScalar) })
+        cases.append(OperationTestCase(nodeType: "ND_sqrt_half", inputs: [.half], output: .half) { ShaderGraphCoder.sqrt($0[0] as! SGScalar) })
+        cases.append(OperationTestCase(nodeType: "ND_sqrt_half2", inputs: [.vector2h], output: .vector2h) { ShaderGraphCoder.sqrt($0[0] as! SGVector) })
+        cases.append(OperationTestCase(nodeType: "ND_sqrt_half3", inputs: [.vector3h], output: .vector3h) { ShaderGraphCoder.sqrt($0[0] as! SGVector) })
+        cases.append(OperationTestCase(nodeType: "ND_sqrt_half4", inputs: [.vector4h], output: .vector4h) { ShaderGraphCoder.sqrt($0[0] as! SGVector) })
+        cases.append(OperationTestCase(nodeType: "ND_sqrt_vector2", inputs: [.vector2f], output: .vector2f) { ShaderGraphCoder.sqrt($0[0] as! SGVector) })
+        cases.append(OperationTestCase(nodeType: "ND_sqrt_vector3", inputs: [.vector3f], output: .vector3f) { ShaderGraphCoder.sqrt($0[0] as! SGVector) })
+        cases.append(OperationTestCase(nodeType: "ND_sqrt_vector4", inputs: [.vector4f], output: .vector4f) { ShaderGraphCoder.sqrt($0[0] as! SGVector) })
+        return cases
+    }
+    func testSqrt() throws {
+        try check(OperationTests.sqrtCases())
+    }
+    
+    static func stepCases() -> [OperationTestCase] {
+        var cases: [OperationTestCase] = []
+        cases.append(OperationTestCase(nodeType: "ND_realitykit_step_color3", inputs: [.color3f, .color3f], output: .color3f) { ShaderGraphCoder.step($0[0] as! SGColor, edge: $0[1] as! SGColor) })
+        cases.append(OperationTestCase(nodeType: "ND_realitykit_step_color4", inputs: [.color4f, .color4f], output: .color4f) { ShaderGraphCoder.step($0[0] as! SGColor, edge: $0[1] as! SGColor) })
+        cases.append(OperationTestCase(nodeType: "ND_realitykit_step_float", inputs: [.float, .float], output: .float) { ShaderGraphCoder.step($0[0] as! SGScalar, edge: $0[1] as! SGScalar) })
+        cases.append(OperationTestCase(nodeType: "ND_realitykit_step_vector2", inputs: [.vector2f, .vector2f], output: .vector2f) { ShaderGraphCoder.step($0[0] as! SGVector, edge: $0[1] as! SGVector) })
+        cases.append(OperationTestCase(nodeType: "ND_realitykit_step_vector3", inputs: [.vector3f, .vector3f], output: .vector3f) { ShaderGraphCoder.step($0[0] as! SGVector, edge: $0[1] as! SGVector) })
+        cases.append(OperationTestCase(nodeType: "ND_realitykit_step_vector4", inputs: [.vector4f, .vector4f], output: .vector4f) { ShaderGraphCoder.step($0[0] as! SGVector, edge: $0[1] as! SGVector) })
+        return cases
+    }
+    func testStep() throws {
+        try check(OperationTests.stepCases())
+    }
+    
+    static func subtractCases() -> [OperationTestCase] {
+        var cases: [OperationTestCase] = []
+        cases.append(OperationTestCase(nodeType: "ND_subtract_color3", inputs: [.color3f, .color3f], output: .color3f) { ShaderGraphCoder.subtract($0[0] as! SGColor, $0[1] as! SGNumeric) })
+        cases.append(OperationTestCase(nodeType: "ND_subtract_color3FA", inputs: [.color3f, .float], output: .color3f) { ShaderGraphCoder.subtract($0[0] as! SGColor, $0[1] as! SGNumeric) })
+        cases.append(OperationTestCase(nodeType: "ND_subtract_color4", inputs: [.color4f, .color4f], output: .color4f) { ShaderGraphCoder.subtract($0[0] as! SGColor, $0[1] as! SGNumeric) })
+        cases.append(OperationTestCase(nodeType: "ND_subtract_color4FA", inputs: [.color4f, .float], output: .color4f) { ShaderGraphCoder.subtract($0[0] as! SGColor, $0[1] as! SGNumeric) })
+        cases.append(OperationTestCase(nodeType: "ND_subtract_float", inputs: [.float, .float], output: .float) { ShaderGraphCoder.subtract($0[0] as! SGScalar, $0[1] as! SGNumeric) })
+        cases.append(OperationTestCase(nodeType: "ND_subtract_half", inputs: [.half, .half], output: .half) { ShaderGraphCoder.subtract($0[0] as! SGScalar, $0[1] as! SGNumeric) })
+        cases.append(OperationTestCase(nodeType: "ND_subtract_matrix22", inputs: [.matrix2d, .matrix2d], output: .matrix2d) { ShaderGraphCoder.subtract($0[0] as! SGMatrix, $0[1] as! SGNumeric) })
+        cases.append(OperationTestCase(nodeType: "ND_subtract_matrix22FA", inputs: [.matrix2d, .float], output: .matrix2d) { ShaderGraphCoder.subtract($0[0] as! SGMatrix, $0[1] as! SGNumeric) })
+        cases.append(OperationTestCase(nodeType: "ND_subtract_matrix33", inputs: [.matrix3d, .matrix3d], output: .matrix3d) { ShaderGraphCoder.subtract($0[0] as! SGMatrix, $0[1] as! SGNumeric) })
+        cases.append(OperationTestCase(nodeType: "ND_subtract_matrix33FA", inputs: [.matrix3d, .float], output: .matrix3d) { ShaderGraphCoder.subtract($0[0] as! SGMatrix, $0[1] as! SGNumeric) })
+        cases.append(OperationTestCase(nodeType: "ND_subtract_matrix44", inputs: [.matrix4d, .matrix4d], output: .matrix4d) { ShaderGraphCoder.subtract($0[0] as! SGMatrix, $0[1] as! SGNumeric) })
+        cases.append(OperationTestCase(nodeType: "ND_subtract_matrix44FA", inputs: [.matrix4d, .float], output: .matrix4d) { ShaderGraphCoder.subtract($0[0] as! SGMatrix, $0[1] as! SGNumeric) })
+        cases.append(OperationTestCase(nodeType: "ND_subtract_vector2", inputs: [.vector2f, .vector2f], output: .vector2f) { ShaderGraphCoder.subtract($0[0] as! SGVector, $0[1] as! SGNumeric) })
+        cases.append(OperationTestCase(nodeType: "ND_subtract_vector2FA", inputs: [.vector2f, .float], output: .vector2f) { ShaderGraphCoder.subtract($0[0] as! SGVector, $0[1] as! SGNumeric) })
+        cases.append(OperationTestCase(nodeType: "ND_subtract_vector3", inputs: [.vector3f, .vector3f], output: .vector3f) { ShaderGraphCoder.subtract($0[0] as! SGVector, $0[1] as! SGNumeric) })
+        cases.append(OperationTestCase(nodeType: "ND_subtract_vector3FA", inputs: [.vector3f, .float], output: .vector3f) { ShaderGraphCoder.subtract($0[0] as! SGVector, $0[1] as! SGNumeric) })
+        cases.append(OperationTestCase(nodeType: "ND_subtract_vector4", inputs: [.vector4f, .vector4f], output: .vector4f) { ShaderGraphCoder.subtract($0[0] as! SGVector, $0[1] as! SGNumeric) })
+        cases.append(OperationTestCase(nodeType: "ND_subtract_vector4FA", inputs: [.vector4f, .float], output: .vector4f) { ShaderGraphCoder.subtract($0[0] as! SGVector, $0[1] as! SGNumeric) })
+        return cases
+    }
+    func testSubtract() throws {
+        try check(OperationTests.subtractCases())
+    }
+    
+    static func switchValueCases() -> [OperationTestCase] {
+        var cases: [OperationTestCase] = []
+        cases.append(OperationTestCase(nodeType: "ND_switch_color3", inputs: [.color3f, .color3f, .color3f, .color3f, .color3f, .color3f, .color3f, .color3f, .color3f, .color3f, .float], output: .color3f) { ShaderGraphCoder.switchValue($0[0] as! SGColor, $0[1] as! SGColor, $0[2] as! SGColor, $0[3] as! SGColor, $0[4] as! SGColor, $0[5] as! SGColor, $0[6] as! SGColor, $0[7] as! SGColor, $0[8] as! SGColor, $0[9] as! SGColor, which: $0[10] as! SGScalar) })
+        cases.append(OperationTestCase(nodeType: "ND_switch_color3I", inputs: [.color3f, .color3f, .color3f, .color3f, .color3f, .color3f, .color3f, .color3f, .color3f, .color3f, .int], output: .color3f) { ShaderGraphCoder.switchValue($0[0] as! SGColor, $0[1] as! SGColor, $0[2] as! SGColor, $0[3] as! SGColor, $0[4] as! SGColor, $0[5] as! SGColor, $0[6] as! SGColor, $0[7] as! SGColor, $0[8] as! SGColor, $0[9] as! SGColor, which: $0[10] as! SGScalar) })
+        cases.append(OperationTestCase(nodeType: "ND_switch_color4", inputs: [.color4f, .color4f, .color4f, .color4f, .color4f, .color4f, .color4f, .color4f, .color4f, .color4f, .float], output: .color4f) { ShaderGraphCoder.switchValue($0[0] as! SGColor, $0[1] as! SGColor, $0[2] as! SGColor, $0[3] as! SGColor, $0[4] as! SGColor, $0[5] as! SGColor, $0[6] as! SGColor, $0[7] as! SGColor, $0[8] as! SGColor, $0[9] as! SGColor, which: $0[10] as! SGScalar) })
+        cases.append(OperationTestCase(nodeType: "ND_switch_color4I", inputs: [.color4f, .color4f, .color4f, .color4f, .color4f, .color4f, .color4f, .color4f, .color4f, .color4f, .int], output: .color4f) { ShaderGraphCoder.switchValue($0[0] as! SGColor, $0[1] as! SGColor, $0[2] as! SGColor, $0[3] as! SGColor, $0[4] as! SGColor, $0[5] as! SGColor, $0[6] as! SGColor, $0[7] as! SGColor, $0[8] as! SGColor, $0[9] as! SGColor, which: $0[10] as! SGScalar) })
+        cases.append(OperationTestCase(nodeType: "ND_switch_float", inputs: [.float, .float, .float, .float, .float, .float, .float, .float, .float, .float, .float], output: .float) { ShaderGraphCoder.switchValue($0[0] as! SGScalar, $0[1] as! SGScalar, $0[2] as! SGScalar, $0[3] as! SGScalar, $0[4] as! SGScalar, $0[5] as! SGScalar, $0[6] as! SGScalar, $0[7] as! SGScalar, $0[8] as! SGScalar, $0[9] as! SGScalar, which: $0[10] as! SGScalar) })
+        cases.append(OperationTestCase(nodeType: "ND_switch_floatI", inputs: [.float, .float, .float, .float, .float, .float, .float, .float, .float, .float, .int], output: .float) { ShaderGraphCoder.switchValue($0[0] as! SGScalar, $0[1] as! SGScalar, $0[2] as! SGScalar, $0[3] as! SGScalar, $0[4] as! SGScalar, $0[5] as! SGScalar, $0[6] as! SGScalar, $0[7] as! SGScalar, $0[8] as! SGScalar, $0[9] as! SGScalar, which: $0[10] as! SGScalar) })
+        cases.append(OperationTestCase(nodeType: "ND_switch_half", inputs: [.half, .half, .half, .half, .half, .half, .half, .half, .half, .half, .float], output: .half) { ShaderGraphCoder.switchValue($0[0] as! SGScalar, $0[1] as! SGScalar, $0[2] as! SGScalar, $0[3] as! SGScalar, $0[4] as! SGScalar, $0[5] as! SGScalar, $0[6] as! SGScalar, $0[7] as! SGScalar, $0[8] as! SGScalar, $0[9] as! SGScalar, which: $0[10] as! SGScalar) })
+        cases.append(OperationTestCase(nodeType: "ND_switch_halfI", inputs: [.half, .half, .half, .half, .half, .half, .half, .half, .half, .half, .int], output: .half) { ShaderGraphCoder.switchValue($0[0] as! SGScalar, $0[1] as! SGScalar, $0[2] as! SGScalar, $0[3] as! SGScalar, $0[4] as! SGScalar, $0[5] as! SGScalar, $0[6] as! SGScalar, $0[7] as! SGScalar, $0[8] as! SGScalar, $0[9] as! SGScalar, which: $0[10] as! SGScalar) })
+        cases.append(OperationTestCase(nodeType: "ND_switch_vector2", inputs: [.vector2f, .vector2f, .vector2f, .vector2f, .vector2f, .vector2f, .vector2f, .vector2f, .vector2f, .vector2f, .float], output: .vector2f) { ShaderGraphCoder.switchValue($0[0] as! SGVector, $0[1] as! SGVector, $0[2] as! SGVector, $0[3] as! SGVector, $0[4] as! SGVector, $0[5] as! SGVector, $0[6] as! SGVector, $0[7] as! SGVector, $0[8] as! SGVector, $0[9] as! SGVector, which: $0[10] as! SGScalar) })
+        cases.append(OperationTestCase(nodeType: "ND_switch_vector2I", inputs: [.vector2f, .vector2f, .vector2f, .vector2f, .vector2f, .vector2f, .vector2f, .vector2f, .vector2f, .vector2f, .int], output: .vector2f) { ShaderGraphCoder.switchValue($0[0] as! SGVector, $0[1] as! SGVector, $0[2] as! SGVector, $0[3] as! SGVector, $0[4] as! SGVector, $0[5] as! SGVector, $0[6] as! SGVector, $0[7] as! SGVector, $0[8] as! SGVector, $0[9] as! SGVector, which: $0[10] as! SGScalar) })
+        cases.append(OperationTestCase(nodeType: "ND_switch_vector3", inputs: [.vector3f, .vector3f, .vector3f, .vector3f, .vector3f, .vector3f, .vector3f, .vector3f, .vector3f, .vector3f, .float], output: .vector3f) { ShaderGraphCoder.switchValue($0[0] as! SGVector, $0[1] as! SGVector, $0[2] as! SGVector, $0[3] as! SGVector, $0[4] as! SGVector, $0[5] as! SGVector, $0[6] as! SGVector, $0[7] as! SGVector, $0[8] as! SGVector, $0[9] as! SGVector, which: $0[10] as! SGScalar) })
+        cases.append(OperationTestCase(nodeType: "ND_switch_vector3I", inputs: [.vector3f, .vector3f, .vector3f, .vector3f, .vector3f, .vector3f, .vector3f, .vector3f, .vector3f, .vector3f, .int], output: .vector3f) { ShaderGraphCoder.switchValue($0[0] as! SGVector, $0[1] as! SGVector, $0[2] as! SGVector, $0[3] as! SGVector, $0[4] as! SGVector, $0[5] as! SGVector, $0[6] as! SGVector, $0[7] as! SGVector, $0[8] as! SGVector, $0[9] as! SGVector, which: $0[10] as! SGScalar) })
+        cases.append(OperationTestCase(nodeType: "ND_switch_vector4", inputs: [.vector4f, .vector4f, .vector4f, .vector4f, .vector4f, .vector4f, .vector4f, .vector4f, .vector4f, .vector4f, .float], output: .vector4f) { ShaderGraphCoder.switchValue($0[0] as! SGVector, $0[1] as! SGVector, $0[2] as! SGVector, $0[3] as! SGVector, $0[4] as! SGVector, $0[5] as! SGVector, $0[6] as! SGVector, $0[7] as! SGVector, $0[8] as! SGVector, $0[9] as! SGVector, which: $0[10] as! SGScalar) })
+        cases.append(OperationTestCase(nodeType: "ND_switch_vector4I", inputs: [.vector4f, .vector4f, .vector4f, .vector4f, .vector4f, .vector4f, .vector4f, .vector4f, .vector4f, .vector4f, .int], output: .vector4f) { ShaderGraphCoder.switchValue($0[0] as! SGVector, $0[1] as! SGVector, $0[2] as! SGVector, $0[3] as! SGVector, $0[4] as! SGVector, $0[5] as! SGVector, $0[6] as! SGVector, $0[7] as! SGVector, $0[8] as! SGVector, $0[9] as! SGVector, which: $0[10] as! SGScalar) })
+        return cases
+    }
+    func testSwitchValue() throws {
+        try check(OperationTests.switchValueCases())
+    }
+    
+    static func tanCases() -> [OperationTestCase] {
+        var cases: [OperationTestCase] = []
+        cases.append(OperationTestCase(nodeType: "ND_tan_float", inputs: [.float], output: .float) { ShaderGraphCoder.tan($0[0] as! SGScalar) })
+        cases.append(OperationTestCase(nodeType: "ND_tan_half", inputs: [.half], output: .half) { ShaderGraphCoder.tan($0[0] as! SGScalar) })
+        cases.append(OperationTestCase(nodeType: "ND_tan_half2", inputs: [.vector2h], output: .vector2h) { ShaderGraphCoder.tan($0[0] as! SGVector) })
+        cases.append(OperationTestCase(nodeType: "ND_tan_half3", inputs: [.vector3h], output: .vector3h) { ShaderGraphCoder.tan($0[0] as! SGVector) })
+        cases.append(OperationTestCase(nodeType: "ND_tan_half4", inputs: [.vector4h], output: .vector4h) { ShaderGraphCoder.tan($0[0] as! SGVector) })
+        cases.append(OperationTestCase(nodeType: "ND_tan_vector2", inputs: [.vector2f], output: .vector2f) { ShaderGraphCoder.tan($0[0] as! SGVector) })
+        cases.append(OperationTestCase(nodeType: "ND_tan_vector3", inputs: [.vector3f], output: .vector3f) { ShaderGraphCoder.tan($0[0] as! SGVector) })
+        cases.append(OperationTestCase(nodeType: "ND_tan_vector4", inputs: [.vector4f], output: .vector4f) { ShaderGraphCoder.tan($0[0] as! SGVector) })
+        return cases
+    }
+    func testTan() throws {
+        try check(OperationTests.tanCases())
+    }
+    
+    static func tiledImageCases() -> [OperationTestCase] {
+        var cases: [OperationTestCase] = []
+        cases.append(OperationTestCase(nodeType: "ND_tiledimage_color3", inputs: [.asset, .color3f, .vector2f, .vector2f, .vector2f, .vector2f, .vector2f], output: .color3f) { ShaderGraphCoder.tiledImage(file: $0[0] as! SGTexture, defaultValue: $0[1] as! SGColor, texcoord: $0[2] as! SGVector, uvtiling: $0[3] as! SGVector, uvoffset: $0[4] as! SGVector, realworldimagesize: $0[5] as! SGVector, realworldtilesize: $0[6] as! SGVector) })
+        cases.append(OperationTestCase(nodeType: "ND_tiledimage_color4", inputs: [.asset, .color4f, .vector2f, .vector2f, .vector2f, .vector2f, .vector2f], output: .color4f) { ShaderGraphCoder.tiledImage(file: $0[0] as! SGTexture, defaultValue: $0[1] as! SGColor, texcoord: $0[2] as! SGVector, uvtiling: $0[3] as! SGVector, uvoffset: $0[4] as! SGVector, realworldimagesize: $0[5] as! SGVector, realworldtilesize: $0[6] as! SGVector) })
+        cases.append(OperationTestCase(nodeType: "ND_tiledimage_float", inputs: [.asset, .float, .vector2f, .vector2f, .vector2f, .vector2f, .vector2f], output: .float) { ShaderGraphCoder.tiledImage(file: $0[0] as! SGTexture, defaultValue: $0[1] as! SGScalar, texcoord: $0[2] as! SGVector, uvtiling: $0[3] as! SGVector, uvoffset: $0[4] as! SGVector, realworldimagesize: $0[5] as! SGVector, realworldtilesize: $0[6] as! SGVector) })
+        cases.append(OperationTestCase(nodeType: "ND_tiledimage_half", inputs: [.asset, .half, .vector2f, .vector2f, .vector2f, .vector2f, .vector2f], output: .half) { ShaderGraphCoder.tiledImage(file: $0[0] as! SGTexture, defaultValue: $0[1] as! SGScalar, texcoord: $0[2] as! SGVector, uvtiling: $0[3] as! SGVector, uvoffset: $0[4] as! SGVector, realworldimagesize: $0[5] as! SGVector, realworldtilesize: $0[6] as! SGVector) })
+        cases.append(OperationTestCase(nodeType: "ND_tiledimage_vector2", inputs: [.asset, .vector2f, .vector2f, .vector2f, .vector2f, .vector2f, .vector2f], output: .vector2f) { ShaderGraphCoder.tiledImage(file: $0[0] as! SGTexture, defaultValue: $0[1] as! SGVector, texcoord: $0[2] as! SGVector, uvtiling: $0[3] as! SGVector, uvoffset: $0[4] as! SGVector, realworldimagesize: $0[5] as! SGVector, realworldtilesize: $0[6] as! SGVector) })
+        cases.append(OperationTestCase(nodeType: "ND_tiledimage_vector3", inputs: [.asset, .vector3f, .vector2f, .vector2f, .vector2f, .vector2f, .vector2f], output: .vector3f) { ShaderGraphCoder.tiledImage(file: $0[0] as! SGTexture, defaultValue: $0[1] as! SGVector, texcoord: $0[2] as! SGVector, uvtiling: $0[3] as! SGVector, uvoffset: $0[4] as! SGVector, realworldimagesize: $0[5] as! SGVector, realworldtilesize: $0[6] as! SGVector) })
+        cases.append(OperationTestCase(nodeType: "ND_tiledimage_vector4", inputs: [.asset, .vector4f, .vector2f, .vector2f, .vector2f, .vector2f, .vector2f], output: .vector4f) { ShaderGraphCoder.tiledImage(file: $0[0] as! SGTexture, defaultValue: $0[1] as! SGVector, texcoord: $0[2] as! SGVector, uvtiling: $0[3] as! SGVector, uvoffset: $0[4] as! SGVector, realworldimagesize: $0[5] as! SGVector, realworldtilesize: $0[6] as! SGVector) })
+        return cases
+    }
+    func testTiledImage() throws {
+        try check(OperationTests.tiledImageCases())
+    }
+    
+    static func transformMatrixCases() -> [OperationTestCase] {
+        var cases: [OperationTestCase] = []
+        cases.append(OperationTestCase(nodeType: "ND_transformmatrix_vector2", inputs: [.vector2f, .matrix2d], output: .vector2f) { ShaderGraphCoder.transformMatrix($0[0] as! SGVector, mat: $0[1] as! SGMatrix) })
+        cases.append(OperationTestCase(nodeType: "ND_transformmatrix_vector2M3", inputs: [.vector2f, .matrix3d], output: .vector2f) { ShaderGraphCoder.transformMatrix($0[0] as! SGVector, mat: $0[1] as! SGMatrix) })
+        cases.append(OperationTestCase(nodeType: "ND_transformmatrix_vector3", inputs: [.vector3f, .matrix3d], output: .vector3f) { ShaderGraphCoder.transformMatrix($0[0] as! SGVector, mat: $0[1] as! SGMatrix) })
+        cases.append(OperationTestCase(nodeType: "ND_transformmatrix_vector3M4", inputs: [.vector3f, .matrix4d], output: .vector3f) { ShaderGraphCoder.transformMatrix($0[0] as! SGVector, mat: $0[1] as! SGMatrix) })
+        cases.append(OperationTestCase(nodeType: "ND_transformmatrix_vector4", inputs: [.vector4f, .matrix4d], output: .vector4f) { ShaderGraphCoder.transformMatrix($0[0] as! SGVector, mat: $0[1] as! SGMatrix) })
+        return cases
+    }
+    func testTransformMatrix() throws {
+        try check(OperationTests.transformMatrixCases())
+    }
+    
+    static func transformNormalCases() -> [OperationTestCase] {
+        var cases: [OperationTestCase] = []
+        cases.append(OperationTestCase(nodeType: "ND_transformnormal_vector3", inputs: [.vector3f], output: .vector3f) { ShaderGraphCoder.transformNormal($0[0] as! SGVector, fromspace: SGTransformSpace.model, tospace: SGTransformSpace.model) })
+        return cases
+    }
+    func testTransformNormal() throws {
+        try check(OperationTests.transformNormalCases())
+    }
+    
+    static func transformPointCases() -> [OperationTestCase] {
+        var cases: [OperationTestCase] = []
+        cases.append(OperationTestCase(nodeType: "ND_transformpoint_vector3", inputs: [.vector3f], output: .vector3f) { ShaderGraphCoder.transformPoint($0[0] as! SGVector, fromspace: SGTransformSpace.model, tospace: SGTransformSpace.model) })
+        return cases
+    }
+    func testTransformPoint() throws {
+        try check(OperationTests.transformPointCases())
+    }
+    
+    static func transformVectorCases() -> [OperationTestCase] {
+        var cases: [OperationTestCase] = []
+        cases.append(OperationTestCase(nodeType: "ND_transformvector_vector3", inputs: [.vector3f], output: .vector3f) { ShaderGraphCoder.transformVector($0[0] as! SGVector, fromspace: SGTransformSpace.model, tospace: SGTransformSpace.model) })
+        return cases
+    }
+    func testTransformVector() throws {
+        try check(OperationTests.transformVectorCases())
+    }
+    
+    static func transposeCases() -> [OperationTestCase] {
+        var cases: [OperationTestCase] = []
+        cases.append(OperationTestCase(nodeType: "ND_transpose_matrix22", inputs: [.matrix2d], output: .matrix2d) { ShaderGraphCoder.transpose($0[0] as! SGMatrix) })
+        cases.append(OperationTestCase(nodeType: "ND_transpose_matrix33", inputs: [.matrix3d], output: .matrix3d) { ShaderGraphCoder.transpose($0[0] as! SGMatrix) })
+        cases.append(OperationTestCase(nodeType: "ND_transpose_matrix44", inputs: [.matrix4d], output: .matrix4d) { ShaderGraphCoder.transpose($0[0] as! SGMatrix) })
+        return cases
+    }
+    func testTranspose() throws {
+        try check(OperationTests.transposeCases())
+    }
+    
+    static func triplanarProjectionCases() -> [OperationTestCase] {
+        var cases: [OperationTestCase] = []
+        cases.append(OperationTestCase(nodeType: "ND_triplanarprojection_color3", inputs: [.asset, .asset, .asset, .color3f, .vector3f, .vector3f], output: .color3f) { ShaderGraphCoder.triplanarProjection(filex: $0[0] as! SGTexture, filey: $0[1] as! SGTexture, filez: $0[2] as! SGTexture, defaultValue: $0[3] as! SGColor, position: $0[4] as! SGVector, normal: $0[5] as! SGVector) })
+        cases.append(OperationTestCase(nodeType: "ND_triplanarprojection_color4", inputs: [.asset, .asset, .asset, .color4f, .vector3f, .vector3f], output: .color4f) { ShaderGraphCoder.triplanarProjection(filex: $0[0] as! SGTexture, filey: $0[1] as! SGTexture, filez: $0[2] as! SGTexture, defaultValue: $0[3] as! SGColor, position: $0[4] as! SGVector, normal: $0[5] as! SGVector) })
+        cases.append(OperationTestCase(nodeType: "ND_triplanarprojection_float", inputs: [.asset, .asset, .asset, .float, .vector3f, .vector3f], output: .float) { ShaderGraphCoder.triplanarProjection(filex: $0[0] as! SGTexture, filey: $0[1] as! SGTexture, filez: $0[2] as! SGTexture, defaultValue: $0[3] as! SGScalar, position: $0[4] as! SGVector, normal: $0[5] as! SGVector) })
+        cases.append(OperationTestCase(nodeType: "ND_triplanarprojection_vector2", inputs: [.asset, .asset, .asset, .vector2f, .vector3f, .vector3f], output: .vector2f) { ShaderGraphCoder.triplanarProjection(filex: $0[0] as! SGTexture, filey: $0[1] as! SGTexture, filez: $0[2] as! SGTexture, defaultValue: $0[3] as! SGVector, position: $0[4] as! SGVector, normal: $0[5] as! SGVector) })
+        cases.append(OperationTestCase(nodeType: "ND_triplanarprojection_vector3", inputs: [.asset, .asset, .asset, .vector3f, .vector3f, .vector3f], output: .vector3f) { ShaderGraphCoder.triplanarProjection(filex: $0[0] as! SGTexture, filey: $0[1] as! SGTexture, filez: $0[2] as! SGTexture, defaultValue: $0[3] as! SGVector, position: $0[4] as! SGVector, normal: $0[5] as! SGVector) })
+        cases.append(OperationTestCase(nodeType: "ND_triplanarprojection_vector4", inputs: [.asset, .asset, .asset, .vector4f, .vector3f, .vector3f], output: .vector4f) { ShaderGraphCoder.triplanarProjection(filex: $0[0] as! SGTexture, filey: $0[1] as! SGTexture, filez: $0[2] as! SGTexture, defaultValue: $0[3] as! SGVector, position: $0[4] as! SGVector, normal: $0[5] as! SGVector) })
+        return cases
+    }
+    func testTriplanarProjection() throws {
+        try check(OperationTests.triplanarProjectionCases())
+    }
+    
+    static func unlitSurfaceCases() -> [OperationTestCase] {
+        var cases: [OperationTestCase] = []
+        cases.append(OperationTestCase(nodeType: "ND_realitykit_unlit_surfaceshader", inputs: [.color3f, .float, .float], output: .token) { ShaderGraphCoder.unlitSurface(color: $0[0] as! SGColor, opacity: $0[1] as! SGScalar, opacityThreshold: $0[2] as! SGScalar) })
+        return cases
+    }
+    func testUnlitSurface() throws {
+        try check(OperationTests.unlitSurfaceCases())
+    }
+    
+    static func unpremultCases() -> [OperationTestCase] {
+        var cases: [OperationTestCase] = []
+        cases.append(OperationTestCase(nodeType: "ND_unpremult_color4", inputs: [.color4f], output: .color4f) { ShaderGraphCoder.unpremult($0[0] as! SGColor) })
+        return cases
+    }
+    func testUnpremult() throws {
+        try check(OperationTests.unpremultCases())
+    }
+    
+    static func worleyNoise2DFloatCases() -> [OperationTestCase] {
+        var cases: [OperationTestCase] = []
+        cases.append(OperationTestCase(nodeType: "ND_worleynoise2d_float", inputs: [.vector2f, .float], output: .float) { ShaderGraphCoder.worleyNoise2DFloat(texcoord: $0[0] as! SGVector, jitter: $0[1] as! SGScalar) })
+        return cases
+    }
+    func testWorleyNoise2DFloat() throws {
+        try check(OperationTests.worleyNoise2DFloatCases())
+    }
+    
+    static func worleyNoise2DVector2Cases() -> [OperationTestCase] {
+        var cases: [OperationTestCase] = []
+        cases.append(OperationTestCase(nodeType: "ND_worleynoise2d_vector2", inputs: [.vector2f, .float], output: .vector2f) { ShaderGraphCoder.worleyNoise2DVector2(texcoord: $0[0] as! SGVector, jitter: $0[1] as! SGScalar) })
+        return cases
+    }
+    func testWorleyNoise2DVector2() throws {
+        try check(OperationTests.worleyNoise2DVector2Cases())
+    }
+    
+    static func worleyNoise2DVector3Cases() -> [OperationTestCase] {
+        var cases: [OperationTestCase] = []
+        cases.append(OperationTestCase(nodeType: "ND_worleynoise2d_vector3", inputs: [.vector2f, .float], output: .vector3f) { ShaderGraphCoder.worleyNoise2DVector3(texcoord: $0[0] as! SGVector, jitter: $0[1] as! SGScalar) })
+        return cases
+    }
+    func testWorleyNoise2DVector3() throws {
+        try check(OperationTests.worleyNoise2DVector3Cases())
+    }
+    
+    static func worleyNoise3DFloatCases() -> [OperationTestCase] {
+        var cases: [OperationTestCase] = []
+        cases.append(OperationTestCase(nodeType: "ND_worleynoise3d_float", inputs: [.vector3f, .float], output: .float) { ShaderGraphCoder.worleyNoise3DFloat(position: $0[0] as! SGVector, jitter: $0[1] as! SGScalar) })
+        return cases
+    }
+    func testWorleyNoise3DFloat() throws {
+        try check(OperationTests.worleyNoise3DFloatCases())
+    }
+    
+    static func worleyNoise3DVector2Cases() -> [OperationTestCase] {
+        var cases: [OperationTestCase] = []
+        cases.append(OperationTestCase(nodeType: "ND_worleynoise3d_vector2", inputs: [.vector3f, .float], output: .vector2f) { ShaderGraphCoder.worleyNoise3DVector2(position: $0[0] as! SGVector, jitter: $0[1] as! SGScalar) })
+        return cases
+    }
+    func testWorleyNoise3DVector2() throws {
+        try check(OperationTests.worleyNoise3DVector2Cases())
+    }
+    
+    static func worleyNoise3DVector3Cases() -> [OperationTestCase] {
+        var cases: [OperationTestCase] = []
+        cases.append(OperationTestCase(nodeType: "ND_worleynoise3d_vector3", inputs: [.vector3f, .float], output: .vector3f) { ShaderGraphCoder.worleyNoise3DVector3(position: $0[0] as! SGVector, jitter: $0[1] as! SGScalar) })
+        return cases
+    }
+    func testWorleyNoise3DVector3() throws {
+        try check(OperationTests.worleyNoise3DVector3Cases())
+    }
+    
+    static func sourceBitangentCases() -> [OperationTestCase] {
+        var cases: [OperationTestCase] = []
+        cases.append(OperationTestCase(nodeType: "ND_bitangent_vector3", inputs: [], output: .vector3f) { _ in SGValue.bitangent() })
+        return cases
+    }
+    func testSourceBitangent() throws {
+        try check(OperationTests.sourceBitangentCases())
+    }
+    
+    static func sourceCameraPositionCases() -> [OperationTestCase] {
+        var cases: [OperationTestCase] = []
+        cases.append(OperationTestCase(nodeType: "ND_realitykit_cameraposition_vector3", inputs: [], output: .vector3f) { _ in SGValue.cameraPosition() })
+        return cases
+    }
+    func testSourceCameraPosition() throws {
+        try check(OperationTests.sourceCameraPositionCases())
+    }
+    
+    static func sourceFrameCases() -> [OperationTestCase] {
+        var cases: [OperationTestCase] = []
+        cases.append(OperationTestCase(nodeType: "ND_frame_float", inputs: [], output: .float) { _ in SGValue.frame })
+        return cases
+    }
+    func testSourceFrame() throws {
+        try check(OperationTests.sourceFrameCases())
+    }
+    
+    static func sourceGeomcolorColor3Cases() -> [OperationTestCase] {
+        var cases: [OperationTestCase] = []
+        cases.append(OperationTestCase(nodeType: "ND_geomcolor_color3", inputs: [], output: .color3f) { _ in SGValue.geomcolorColor3() })
+        return cases
+    }
+    func testSourceGeomcolorColor3() throws {
+        try check(OperationTests.sourceGeomcolorColor3Cases())
+    }
+    
+    static func sourceGeomcolorColor4Cases() -> [OperationTestCase] {
+        var cases: [OperationTestCase] = []
+        cases.append(OperationTestCase(nodeType: "ND_geomcolor_color4", inputs: [], output: .color4f) { _ in SGValue.geomcolorColor4() })
+        return cases
+    }
+    func testSourceGeomcolorColor4() throws {
+        try check(OperationTests.sourceGeomcolorColor4Cases())
+    }
+    
+    static func sourceGeomcolorFloatCases() -> [OperationTestCase] {
+        var cases: [OperationTestCase] = []
+        cases.append(OperationTestCase(nodeType: "ND_geomcolor_float", inputs: [], output: .float) { _ in SGValue.geomcolorFloat() })
+        return cases
+    }
+    func testSourceGeomcolorFloat() throws {
+        try check(OperationTests.sourceGeomcolorFloatCases())
+    }
+    
+    static func sourceGeometryModifierCustomAttributeCases() -> [OperationTestCase] {
+        var cases: [OperationTestCase] = []
+        cases.append(OperationTestCase(nodeType: "ND_realitykit_geometry_modifier_custom_attribute", inputs: [], output: .vector4f) { _ in SGValue.geometryModifierCustomAttribute })
+        return cases
+    }
+    func testSourceGeometryModifierCustomAttribute() throws {
+        try check(OperationTests.sourceGeometryModifierCustomAttributeCases())
+    }
+    
+    static func sourceGeometryModifierCustomAttributeHalf20Cases() -> [OperationTestCase] {
+        var cases: [OperationTestCase] = []
+        cases.append(OperationTestCase(nodeType: "ND_realitykit_geometry_modifier_custom_attribute_half2_0", inputs: [], output: .vector2h) { _ in SGValue.geometryModifierCustomAttributeHalf20 })
+        return cases
+    }
+    func testSourceGeometryModifierCustomAttributeHalf20() throws {
+        try check(OperationTests.sourceGeometryModifierCustomAttributeHalf20Cases())
+    }
+    
+    static func sourceGeometryModifierCustomAttributeHalf21Cases() -> [OperationTestCase] {
+        var cases: [OperationTestCase] = []
+        cases.append(OperationTestCase(nodeType: "ND_realitykit_geometry_modifier_custom_attribute_half2_1", inputs: [], output: .vector2h) { _ in SGValue.geometryModifierCustomAttributeHalf21 })
+        return cases
+    }
+    func testSourceGeometryModifierCustomAttributeHalf21() throws {
+        try check(OperationTests.sourceGeometryModifierCustomAttributeHalf21Cases())
+    }
+    
+    static func sourceGeometryModifierCustomAttributeHalf40Cases() -> [OperationTestCase] {
+        var cases: [OperationTestCase] = []
+        cases.append(OperationTestCase(nodeType: "ND_realitykit_geometry_modifier_custom_attribute_half4_0", inputs: [], output: .vector4h) { _ in SGValue.geometryModifierCustomAttributeHalf40 })
+        return cases
+    }
+    func testSourceGeometryModifierCustomAttributeHalf40() throws {
+        try check(OperationTests.sourceGeometryModifierCustomAttributeHalf40Cases())
+    }
+    
+    static func sourceGeometryModifierCustomAttributeHalf41Cases() -> [OperationTestCase] {
+        var cases: [OperationTestCase] = []
+        cases.append(OperationTestCase(nodeType: "ND_realitykit_geometry_modifier_custom_attribute_half4_1", inputs: [], output: .vector4h) { _ in SGValue.geometryModifierCustomAttributeHalf41 })
+        return cases
+    }
+    func testSourceGeometryModifierCustomAttributeHalf41() throws {
+        try check(OperationTests.sourceGeometryModifierCustomAttributeHalf41Cases())
+    }
+    
+    static func sourceGeometryModifierCustomAttributeHalf42Cases() -> [OperationTestCase] {
+        var cases: [OperationTestCase] = []
+        cases.append(OperationTestCase(nodeType: "ND_realitykit_geometry_modifier_custom_attribute_half4_2", inputs: [], output: .vector4h) { _ in SGValue.geometryModifierCustomAttributeHalf42 })
+        return cases
+    }
+    func testSourceGeometryModifierCustomAttributeHalf42() throws {
+        try check(OperationTests.sourceGeometryModifierCustomAttributeHalf42Cases())
+    }
+    
+    static func sourceGeometryModifierCustomAttributeHalf43Cases() -> [OperationTestCase] {
+        var cases: [OperationTestCase] = []
+        cases.append(OperationTestCase(nodeType: "ND_realitykit_geometry_modifier_custom_attribute_half4_3", inputs: [], output: .vector4h) { _ in SGValue.geometryModifierCustomAttributeHalf43 })
+        return cases
+    }
+    func testSourceGeometryModifierCustomAttributeHalf43() throws {
+        try check(OperationTests.sourceGeometryModifierCustomAttributeHalf43Cases())
+    }
+    
+    static func sourceGeometryModifierCustomParameterCases() -> [OperationTestCase] {
+        var cases: [OperationTestCase] = []
+        cases.append(OperationTestCase(nodeType: "ND_realitykit_geometry_modifier_custom_parameter", inputs: [], output: .vector4f) { _ in SGValue.geometryModifierCustomParameter })
+        return cases
+    }
+    func testSourceGeometryModifierCustomParameter() throws {
+        try check(OperationTests.sourceGeometryModifierCustomParameterCases())
+    }
+    
+    static func sourceGeometryModifierModelPositionOffsetCases() -> [OperationTestCase] {
+        var cases: [OperationTestCase] = []
+        cases.append(OperationTestCase(nodeType: "ND_realitykit_geometry_modifier_model_position_offset", inputs: [], output: .vector3f) { _ in SGValue.geometryModifierModelPositionOffset })
+        return cases
+    }
+    func testSourceGeometryModifierModelPositionOffset() throws {
+        try check(OperationTests.sourceGeometryModifierModelPositionOffsetCases())
+    }
+    
+    static func sourceGeometryModifierModelToViewCases() -> [OperationTestCase] {
+        var cases: [OperationTestCase] = []
+        cases.append(OperationTestCase(nodeType: "ND_realitykit_geometry_modifier_model_to_view", inputs: [], output: .matrix4d) { _ in SGValue.geometryModifierModelToView })
+        return cases
+    }
+    func testSourceGeometryModifierModelToView() throws {
+        try check(OperationTests.sourceGeometryModifierModelToViewCases())
+    }
+    
+    static func sourceGeometryModifierModelToWorldCases() -> [OperationTestCase] {
+        var cases: [OperationTestCase] = []
+        cases.append(OperationTestCase(nodeType: "ND_realitykit_geometry_modifier_model_to_world", inputs: [], output: .matrix4d) { _ in SGValue.geometryModifierModelToWorld })
+        return cases
+    }
+    func testSourceGeometryModifierModelToWorld() throws {
+        try check(OperationTests.sourceGeometryModifierModelToWorldCases())
+    }
+    
+    static func sourceGeometryModifierNormalToWorldCases() -> [OperationTestCase] {
+        var cases: [OperationTestCase] = []
+        cases.append(OperationTestCase(nodeType: "ND_realitykit_geometry_modifier_normal_to_world", inputs: [], output: .matrix3d) { _ in SGValue.geometryModifierNormalToWorld })
+        return cases
+    }
+    func testSourceGeometryModifierNormalToWorld() throws {
+        try check(OperationTests.sourceGeometryModifierNormalToWorldCases())
+    }
+    
+    static func sourceGeometryModifierProjectionToViewCases() -> [OperationTestCase] {
+        var cases: [OperationTestCase] = []
+        cases.append(OperationTestCase(nodeType: "ND_realitykit_geometry_modifier_projection_to_view", inputs: [], output: .matrix4d) { _ in SGValue.geometryModifierProjectionToView })
+        return cases
+    }
+    func testSourceGeometryModifierProjectionToView() throws {
+        try check(OperationTests.sourceGeometryModifierProjectionToViewCases())
+    }
+    
+    static func sourceGeometryModifierUV0OffsetCases() -> [OperationTestCase] {
+        var cases: [OperationTestCase] = []
+        cases.append(OperationTestCase(nodeType: "ND_realitykit_geometry_modifier_uv0_offset", inputs: [], output: .vector2f) { _ in SGValue.geometryModifierUV0Offset })
+        return cases
+    }
+    func testSourceGeometryModifierUV0Offset() throws {
+        try check(OperationTests.sourceGeometryModifierUV0OffsetCases())
+    }
+    
+    static func sourceGeometryModifierUV0TransformCases() -> [OperationTestCase] {
+        var cases: [OperationTestCase] = []
+        cases.append(OperationTestCase(nodeType: "ND_realitykit_geometry_modifier_uv0_transform", inputs: [], output: .matrix2d) { _ in SGValue.geometryModifierUV0Transform })
+        return cases
+    }
+    func testSourceGeometryModifierUV0Transform() throws {
+        try check(OperationTests.sourceGeometryModifierUV0TransformCases())
+    }
+    
+    static func sourceGeometryModifierUV1OffsetCases() -> [OperationTestCase] {
+        var cases: [OperationTestCase] = []
+        cases.append(OperationTestCase(nodeType: "ND_realitykit_geometry_modifier_uv1_offset", inputs: [], output: .vector2f) { _ in SGValue.geometryModifierUV1Offset })
+        return cases
+    }
+    func testSourceGeometryModifierUV1Offset() throws {
+        try check(OperationTests.sourceGeometryModifierUV1OffsetCases())
+    }
+    
+    static func sourceGeometryModifierUV1TransformCases() -> [OperationTestCase] {
+        var cases: [OperationTestCase] = []
+        cases.append(OperationTestCase(nodeType: "ND_realitykit_geometry_modifier_uv1_transform", inputs: [], output: .matrix2d) { _ in SGValue.geometryModifierUV1Transform })
+        return cases
+    }
+    func testSourceGeometryModifierUV1Transform() throws {
+        try check(OperationTests.sourceGeometryModifierUV1TransformCases())
+    }
+    
+    static func sourceGeometryModifierVertexIdCases() -> [OperationTestCase] {
+        var cases: [OperationTestCase] = []
+        cases.append(OperationTestCase(nodeType: "ND_realitykit_geometry_modifier_vertex_id", inputs: [], output: .int) { _ in SGValue.geometryModifierVertexId })
+        return cases
+    }
+    func testSourceGeometryModifierVertexId() throws {
+        try check(OperationTests.sourceGeometryModifierVertexIdCases())
+    }
+    
+    static func sourceGeometryModifierViewToProjectionCases() -> [OperationTestCase] {
+        var cases: [OperationTestCase] = []
+        cases.append(OperationTestCase(nodeType: "ND_realitykit_geometry_modifier_view_to_projection", inputs: [], output: .matrix4d) { _ in SGValue.geometryModifierViewToProjection })
+        return cases
+    }
+    func testSourceGeometryModifierViewToProjection() throws {
+        try check(OperationTests.sourceGeometryModifierViewToProjectionCases())
+    }
+    
+    static func sourceGeometryModifierWorldToModelCases() -> [OperationTestCase] {
+        var cases: [OperationTestCase] = []
+        cases.append(OperationTestCase(nodeType: "ND_realitykit_geometry_modifier_world_to_model", inputs: [], output: .matrix4d) { _ in SGValue.geometryModifierWorldToModel })
+        return cases
+    }
+    func testSourceGeometryModifierWorldToModel() throws {
+        try check(OperationTests.sourceGeometryModifierWorldToModelCases())
+    }
+    
+    static func sourceMaterialParametersBaseColorTintCases() -> [OperationTestCase] {
+        var cases: [OperationTestCase] = []
+        cases.append(OperationTestCase(nodeType: "ND_realitykit_material_parameters_base_color_tint", inputs: [], output: .color3f) { _ in SGValue.materialParametersBaseColorTint })
+        return cases
+    }
+    func testSourceMaterialParametersBaseColorTint() throws {
+        try check(OperationTests.sourceMaterialParametersBaseColorTintCases())
+    }
+    
+    static func sourceMaterialParametersClearcoatRoughnessScaleCases() -> [OperationTestCase] {
+        var cases: [OperationTestCase] = []
+        cases.append(OperationTestCase(nodeType: "ND_realitykit_material_parameters_clearcoat_roughness_scale", inputs: [], output: .float) { _ in SGValue.materialParametersClearcoatRoughnessScale })
+        return cases
+    }
+    func testSourceMaterialParametersClearcoatRoughnessScale() throws {
+        try check(OperationTests.sourceMaterialParametersClearcoatRoughnessScaleCases())
+    }
+    
+    static func sourceMaterialParametersClearcoatScaleCases() -> [OperationTestCase] {
+        var cases: [OperationTestCase] = []
+        cases.append(OperationTestCase(nodeType: "ND_realitykit_material_parameters_clearcoat_scale", inputs: [], output: .float) { _ in SGValue.materialParametersClearcoatScale })
+        return cases
+    }
+    func testSourceMaterialParametersClearcoatScale() throws {
+        try check(OperationTests.sourceMaterialParametersClearcoatScaleCases())
+    }
+    
+    static func sourceMaterialParametersEmissiveColorCases() -> [OperationTestCase] {
+        var cases: [OperationTestCase] = []
+        cases.append(OperationTestCase(nodeType: "ND_realitykit_material_parameters_emissive_color", inputs: [], output: .color3f) { _ in SGValue.materialParametersEmissiveColor })
+        return cases
+    }
+    func testSourceMaterialParametersEmissiveColor() throws {
+        try check(OperationTests.sourceMaterialParametersEmissiveColorCases())
+    }
+    
+    static func sourceMaterialParametersMetallicScaleCases() -> [OperationTestCase] {
+        var cases: [OperationTestCase] = []
+        cases.append(OperationTestCase(nodeType: "ND_realitykit_material_parameters_metallic_scale", inputs: [], output: .float) { _ in SGValue.materialParametersMetallicScale })
+        return cases
+    }
+    func testSourceMaterialParametersMetallicScale() throws {
+        try check(OperationTests.sourceMaterialParametersMetallicScaleCases())
+    }
+    
+    static func sourceMaterialParametersOpacityScaleCases() -> [OperationTestCase] {
+        var cases: [OperationTestCase] = []
+        cases.append(OperationTestCase(nodeType: "ND_realitykit_material_parameters_opacity_scale", inputs: [], output: .float) { _ in SGValue.materialParametersOpacityScale })
+        return cases
+    }
+    func testSourceMaterialParametersOpacityScale() throws {
+        try check(OperationTests.sourceMaterialParametersOpacityScaleCases())
+    }
+    
+    static func sourceMaterialParametersOpacityThresholdCases() -> [OperationTestCase] {
+        var cases: [OperationTestCase] = []
+        cases.append(OperationTestCase(nodeType: "ND_realitykit_material_parameters_opacity_threshold", inputs: [], output: .float) { _ in SGValue.materialParametersOpacityThreshold })
+        return cases
+    }
+    func testSourceMaterialParametersOpacityThreshold() throws {
+        try check(OperationTests.sourceMaterialParametersOpacityThresholdCases())
+    }
+    
+    static func sourceMaterialParametersRoughnessScaleCases() -> [OperationTestCase] {
+        var cases: [OperationTestCase] = []
+        cases.append(OperationTestCase(nodeType: "ND_realitykit_material_parameters_roughness_scale", inputs: [], output: .float) { _ in SGValue.materialParametersRoughnessScale })
+        return cases
+    }
+    func testSourceMaterialParametersRoughnessScale() throws {
+        try check(OperationTests.sourceMaterialParametersRoughnessScaleCases())
+    }
+    
+    static func sourceMaterialParametersSpecularScaleCases() -> [OperationTestCase] {
+        var cases: [OperationTestCase] = []
+        cases.append(OperationTestCase(nodeType: "ND_realitykit_material_parameters_specular_scale", inputs: [], output: .float) { _ in SGValue.materialParametersSpecularScale })
+        return cases
+    }
+    func testSourceMaterialParametersSpecularScale() throws {
+        try check(OperationTests.sourceMaterialParametersSpecularScaleCases())
+    }
+    
+    static func sourceNormalCases() -> [OperationTestCase] {
+        var cases: [OperationTestCase] = []
+        cases.append(OperationTestCase(nodeType: "ND_normal_vector3", inputs: [], output: .vector3f) { _ in SGValue.normal() })
+        return cases
+    }
+    func testSourceNormal() throws {
+        try check(OperationTests.sourceNormalCases())
+    }
+    
+    static func sourcePositionCases() -> [OperationTestCase] {
+        var cases: [OperationTestCase] = []
+        cases.append(OperationTestCase(nodeType: "ND_position_vector3", inputs: [], output: .vector3f) { _ in SGValue.position() })
+        return cases
+    }
+    func testSourcePosition() throws {
+        try check(OperationTests.sourcePositionCases())
+    }
+    
+    static func sourceSurfaceBaseColorCases() -> [OperationTestCase] {
+        var cases: [OperationTestCase] = []
+        cases.append(OperationTestCase(nodeType: "ND_realitykit_surface_base_color", inputs: [], output: .color3f) { _ in SGValue.surfaceBaseColor })
+        return cases
+    }
+    func testSourceSurfaceBaseColor() throws {
+        try check(OperationTests.sourceSurfaceBaseColorCases())
+    }
+    
+    static func sourceSurfaceClearcoatCases() -> [OperationTestCase] {
+        var cases: [OperationTestCase] = []
+        cases.append(OperationTestCase(nodeType: "ND_realitykit_surface_clearcoat", inputs: [], output: .float) { _ in SGValue.surfaceClearcoat })
+        return cases
+    }
+    func testSourceSurfaceClearcoat() throws {
+        try check(OperationTests.sourceSurfaceClearcoatCases())
+    }
+    
+    static func sourceSurfaceClearcoatRoughnessCases() -> [OperationTestCase] {
+        var cases: [OperationTestCase] = []
+        cases.append(OperationTestCase(nodeType: "ND_realitykit_surface_clearcoat_roughness", inputs: [], output: .float) { _ in SGValue.surfaceClearcoatRoughness })
+        return cases
+    }
+    func testSourceSurfaceClearcoatRoughness() throws {
+        try check(OperationTests.sourceSurfaceClearcoatRoughnessCases())
+    }
+    
+    static func sourceSurfaceCustomAttributeCases() -> [OperationTestCase] {
+        var cases: [OperationTestCase] = []
+        cases.append(OperationTestCase(nodeType: "ND_realitykit_surface_custom_attribute", inputs: [], output: .vector4f) { _ in SGValue.surfaceCustomAttribute })
+        return cases
+    }
+    func testSourceSurfaceCustomAttribute() throws {
+        try check(OperationTests.sourceSurfaceCustomAttributeCases())
+    }
+    
+    static func sourceSurfaceCustomAttributeHalf20Cases() -> [OperationTestCase] {
+        var cases: [OperationTestCase] = []
+        cases.append(OperationTestCase(nodeType: "ND_realitykit_surface_custom_attribute_half2_0", inputs: [], output: .vector2h) { _ in SGValue.surfaceCustomAttributeHalf20 })
+        return cases
+    }
+    func testSourceSurfaceCustomAttributeHalf20() throws {
+        try check(OperationTests.sourceSurfaceCustomAttributeHalf20Cases())
+    }
+    
+    static func sourceSurfaceCustomAttributeHalf21Cases() -> [OperationTestCase] {
+        var cases: [OperationTestCase] = []
+        cases.append(OperationTestCase(nodeType: "ND_realitykit_surface_custom_attribute_half2_1", inputs: [], output: .vector2h) { _ in SGValue.surfaceCustomAttributeHalf21 })
+        return cases
+    }
+    func testSourceSurfaceCustomAttributeHalf21() throws {
+        try check(OperationTests.sourceSurfaceCustomAttributeHalf21Cases())
+    }
+    
+    static func sourceSurfaceCustomAttributeHalf40Cases() -> [OperationTestCase] {
+        var cases: [OperationTestCase] = []
+        cases.append(OperationTestCase(nodeType: "ND_realitykit_surface_custom_attribute_half4_0", inputs: [], output: .vector4h) { _ in SGValue.surfaceCustomAttributeHalf40 })
+        return cases
+    }
+    func testSourceSurfaceCustomAttributeHalf40() throws {
+        try check(OperationTests.sourceSurfaceCustomAttributeHalf40Cases())
+    }
+    
+    static func sourceSurfaceCustomAttributeHalf41Cases() -> [OperationTestCase] {
+        var cases: [OperationTestCase] = []
+        cases.append(OperationTestCase(nodeType: "ND_realitykit_surface_custom_attribute_half4_1", inputs: [], output: .vector4h) { _ in SGValue.surfaceCustomAttributeHalf41 })
+        return cases
+    }
+    func testSourceSurfaceCustomAttributeHalf41() throws {
+        try check(OperationTests.sourceSurfaceCustomAttributeHalf41Cases())
+    }
+    
+    static func sourceSurfaceCustomAttributeHalf42Cases() -> [OperationTestCase] {
+        var cases: [OperationTestCase] = []
+        cases.append(OperationTestCase(nodeType: "ND_realitykit_surface_custom_attribute_half4_2", inputs: [], output: .vector4h) { _ in SGValue.surfaceCustomAttributeHalf42 })
+        return cases
+    }
+    func testSourceSurfaceCustomAttributeHalf42() throws {
+        try check(OperationTests.sourceSurfaceCustomAttributeHalf42Cases())
+    }
+    
+    static func sourceSurfaceCustomAttributeHalf43Cases() -> [OperationTestCase] {
+        var cases: [OperationTestCase] = []
+        cases.append(OperationTestCase(nodeType: "ND_realitykit_surface_custom_attribute_half4_3", inputs: [], output: .vector4h) { _ in SGValue.surfaceCustomAttributeHalf43 })
+        return cases
+    }
+    func testSourceSurfaceCustomAttributeHalf43() throws {
+        try check(OperationTests.sourceSurfaceCustomAttributeHalf43Cases())
+    }
+    
+    static func sourceSurfaceCustomParameterCases() -> [OperationTestCase] {
+        var cases: [OperationTestCase] = []
+        cases.append(OperationTestCase(nodeType: "ND_realitykit_surface_custom_parameter", inputs: [], output: .vector4f) { _ in SGValue.surfaceCustomParameter })
+        return cases
+    }
+    func testSourceSurfaceCustomParameter() throws {
+        try check(OperationTests.sourceSurfaceCustomParameterCases())
+    }
+    
+    static func sourceSurfaceEmissiveColorCases() -> [OperationTestCase] {
+        var cases: [OperationTestCase] = []
+        cases.append(OperationTestCase(nodeType: "ND_realitykit_surface_emissive_color", inputs: [], output: .color3f) { _ in SGValue.surfaceEmissiveColor })
+        return cases
+    }
+    func testSourceSurfaceEmissiveColor() throws {
+        try check(OperationTests.sourceSurfaceEmissiveColorCases())
+    }
+    
+    static func sourceSurfaceMetallicCases() -> [OperationTestCase] {
+        var cases: [OperationTestCase] = []
+        cases.append(OperationTestCase(nodeType: "ND_realitykit_surface_metallic", inputs: [], output: .float) { _ in SGValue.surfaceMetallic })
+        return cases
+    }
+    func testSourceSurfaceMetallic() throws {
+        try check(OperationTests.sourceSurfaceMetallicCases())
+    }
+    
+    static func sourceSurfaceModelToViewCases() -> [OperationTestCase] {
+        var cases: [OperationTestCase] = []
+        cases.append(OperationTestCase(nodeType: "ND_realitykit_surface_model_to_view", inputs: [], output: .matrix4d) { _ in SGValue.surfaceModelToView })
+        return cases
+    }
+    func testSourceSurfaceModelToView() throws {
+        try check(OperationTests.sourceSurfaceModelToViewCases())
+    }
+    
+    static func sourceSurfaceModelToWorldCases() -> [OperationTestCase] {
+        var cases: [OperationTestCase] = []
+        cases.append(OperationTestCase(nodeType: "ND_realitykit_surface_model_to_world", inputs: [], output: .matrix4d) { _ in SGValue.surfaceModelToWorld })
+        return cases
+    }
+    func testSourceSurfaceModelToWorld() throws {
+        try check(OperationTests.sourceSurfaceModelToWorldCases())
+    }
+    
+    static func sourceSurfaceOpacityCases() -> [OperationTestCase] {
+        var cases: [OperationTestCase] = []
+        cases.append(OperationTestCase(nodeType: "ND_realitykit_surface_opacity", inputs: [], output: .float) { _ in SGValue.surfaceOpacity })
+        return cases
+    }
+    func testSourceSurfaceOpacity() throws {
+        try check(OperationTests.sourceSurfaceOpacityCases())
+    }
+    
+    static func sourceSurfaceProjectionToViewCases() -> [OperationTestCase] {
+        var cases: [OperationTestCase] = []
+        cases.append(OperationTestCase(nodeType: "ND_realitykit_surface_projection_to_view", inputs: [], output: .matrix4d) { _ in SGValue.surfaceProjectionToView })
+        return cases
+    }
+    func testSourceSurfaceProjectionToView() throws {
+        try check(OperationTests.sourceSurfaceProjectionToViewCases())
+    }
+    
+    static func sourceSurfaceRoughnessCases() -> [OperationTestCase] {
+        var cases: [OperationTestCase] = []
+        cases.append(OperationTestCase(nodeType: "ND_realitykit_surface_roughness", inputs: [], output: .float) { _ in SGValue.surfaceRoughness })
+        return cases
+    }
+    func testSourceSurfaceRoughness() throws {
+        try check(OperationTests.sourceSurfaceRoughnessCases())
+    }
+    
+    static func sourceSurfaceScreenPositionCases() -> [OperationTestCase] {
+        var cases: [OperationTestCase] = []
+        cases.append(OperationTestCase(nodeType: "ND_realitykit_surface_screen_position", inputs: [], output: .vector4f) { _ in SGValue.surfaceScreenPosition })
+        return cases
+    }
+    func testSourceSurfaceScreenPosition() throws {
+        try check(OperationTests.sourceSurfaceScreenPositionCases())
+    }
+    
+    static func sourceSurfaceSpecularCases() -> [OperationTestCase] {
+        var cases: [OperationTestCase] = []
+        cases.append(OperationTestCase(nodeType: "ND_realitykit_surface_specular", inputs: [], output: .float) { _ in SGValue.surfaceSpecular })
+        return cases
+    }
+    func testSourceSurfaceSpecular() throws {
+        try check(OperationTests.sourceSurfaceSpecularCases())
+    }
+    
+    static func sourceSurfaceViewDirectionCases() -> [OperationTestCase] {
+        var cases: [OperationTestCase] = []
+        cases.append(OperationTestCase(nodeType: "ND_realitykit_surface_view_direction", inputs: [], output: .vector3f) { _ in SGValue.surfaceViewDirection })
+        return cases
+    }
+    func testSourceSurfaceViewDirection() throws {
+        try check(OperationTests.sourceSurfaceViewDirectionCases())
+    }
+    
+    static func sourceSurfaceViewToProjectionCases() -> [OperationTestCase] {
+        var cases: [OperationTestCase] = []
+        cases.append(OperationTestCase(nodeType: "ND_realitykit_surface_view_to_projection", inputs: [], output: .matrix4d) { _ in SGValue.surfaceViewToProjection })
+        return cases
+    }
+    func testSourceSurfaceViewToProjection() throws {
+        try check(OperationTests.sourceSurfaceViewToProjectionCases())
+    }
+    
+    static func sourceSurfaceWorldToViewCases() -> [OperationTestCase] {
+        var cases: [OperationTestCase] = []
+        cases.append(OperationTestCase(nodeType: "ND_realitykit_surface_world_to_view", inputs: [], output: .matrix4d) { _ in SGValue.surfaceWorldToView })
+        return cases
+    }
+    func testSourceSurfaceWorldToView() throws {
+        try check(OperationTests.sourceSurfaceWorldToViewCases())
+    }
+    
+    static func sourceTangentCases() -> [OperationTestCase] {
+        var cases: [OperationTestCase] = []
+        cases.append(OperationTestCase(nodeType: "ND_tangent_vector3", inputs: [], output: .vector3f) { _ in SGValue.tangent() })
+        return cases
+    }
+    func testSourceTangent() throws {
+        try check(OperationTests.sourceTangentCases())
+    }
+    
+    static func sourceTexcoordVector2Cases() -> [OperationTestCase] {
+        var cases: [OperationTestCase] = []
+        cases.append(OperationTestCase(nodeType: "ND_texcoord_vector2", inputs: [], output: .vector2f) { _ in SGValue.texcoordVector2() })
+        return cases
+    }
+    func testSourceTexcoordVector2() throws {
+        try check(OperationTests.sourceTexcoordVector2Cases())
+    }
+    
+    static func sourceTexcoordVector3Cases() -> [OperationTestCase] {
+        var cases: [OperationTestCase] = []
+        cases.append(OperationTestCase(nodeType: "ND_texcoord_vector3", inputs: [], output: .vector3f) { _ in SGValue.texcoordVector3() })
+        return cases
+    }
+    func testSourceTexcoordVector3() throws {
+        try check(OperationTests.sourceTexcoordVector3Cases())
+    }
+    
+    static func sourceTimeCases() -> [OperationTestCase] {
+        var cases: [OperationTestCase] = []
+        cases.append(OperationTestCase(nodeType: "ND_time_float", inputs: [], output: .float) { _ in SGValue.time })
+        return cases
+    }
+    func testSourceTime() throws {
+        try check(OperationTests.sourceTimeCases())
+    }
+    
+    static func sourceUpDirectionCases() -> [OperationTestCase] {
+        var cases: [OperationTestCase] = []
+        cases.append(OperationTestCase(nodeType: "ND_updirection_vector3", inputs: [], output: .vector3f) { _ in SGValue.upDirection() })
+        return cases
+    }
+    func testSourceUpDirection() throws {
+        try check(OperationTests.sourceUpDirectionCases())
+    }
+    
+    static func sourceViewDirectionCases() -> [OperationTestCase] {
+        var cases: [OperationTestCase] = []
+        cases.append(OperationTestCase(nodeType: "ND_realitykit_viewdirection_vector3", inputs: [], output: .vector3f) { _ in SGValue.viewDirection() })
+        return cases
+    }
+    func testSourceViewDirection() throws {
+        try check(OperationTests.sourceViewDirectionCases())
+    }
+}
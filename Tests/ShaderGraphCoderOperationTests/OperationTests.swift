@@ -0,0 +1,83 @@
+import XCTest
+import simd
+@_spi(Benchmarking) @testable import ShaderGraphCoder
+
+/// A USD overload of a generated operation or source: the data types of its value inputs and output,
+/// and a call through the public API that should build it.
+struct OperationTestCase {
+    let nodeType: String
+    let inputs: [SGDataType]
+    let output: SGDataType
+    let make: ([SGValue]) -> SGValue
+}
+
+/// The tests for every overload set are generated by Tools/opgen.py into OperationTests.g.swift.
+final class OperationTests: XCTestCase {
+
+    static func makeInput(_ dataType: SGDataType) -> SGValue {
+        switch dataType {
+        case .asset: return SGValue.textureParameter(name: "texture")
+        case .bool: return SGValue(source: .constant(.bool(true)))
+        case .color3f: return SGValue.color3f(0.5, 0.5, 0.5)
+        case .color4f: return SGValue.color4f(0.5, 0.5, 0.5, 1)
+        case .float: return SGValue.float(0.5)
+        case .half: return SGValue.half(0.5)
+        case .int: return SGValue.int(1)
+        case .matrix2d: return SGValue.identity2d
+        case .matrix3d: return SGValue.identity3d
+        case .matrix4d: return SGValue.identity4d
+        case .vector2f: return SGValue.vector2f(0.5, 0.5)
+        case .vector3f: return SGValue.vector3f(0.5, 0.5, 0.5)
+        case .vector4f: return SGValue.vector4f(0.5, 0.5, 0.5, 0.5)
+        case .vector2h: return SGValue.vector2h(0.5, 0.5)
+        case .vector3h: return SGValue.vector3h(0.5, 0.5, 0.5)
+        case .vector4h: return SGValue.vector4h(0.5, 0.5, 0.5, 0.5)
+        case .vector2i: return SGValue.vector2i([1, 1])
+        case .vector3i: return SGValue.vector3i([1, 1, 1])
+        case .vector4i: return SGValue.vector4i([1, 1, 1, 1])
+        case .string, .token, .error: return SGValue.string("")
+        }
+    }
+
+    /// Checks that every case dispatches to its node type and produces its output data type without errors.
+    func check(_ cases: [OperationTestCase], file: StaticString = #filePath, line: UInt = #line) throws {
+        for c in cases {
+            let value = c.make(c.inputs.map { OperationTests.makeInput($0) })
+            XCTAssertEqual(collectErrors(values: [value]), [], c.nodeType, file: file, line: line)
+            XCTAssertEqual(value.node?.nodeType, c.nodeType, file: file, line: line)
+            XCTAssertEqual(value.dataType, c.output, c.nodeType, file: file, line: line)
+        }
+    }
+
+    /// Reports how long building each overload and exporting it as USDA takes.
+    /// It builds and exports every overload many times, so it only runs when SHADERGRAPHCODER_OPERATION_TIMINGS is set.
+    func testOperationTimings() throws {
+        try XCTSkipIf(ProcessInfo.processInfo.environment["SHADERGRAPHCODER_OPERATION_TIMINGS"] == nil, "Set SHADERGRAPHCODER_OPERATION_TIMINGS to measure the operations")
+        let iterations = 100
+        var rows: [(String, Double, Double)] = []
+        for (_, makeCases) in OperationTests.overloadSets {
+            for c in makeCases() {
+                let inputs = c.inputs.map { OperationTests.makeInput($0) }
+                var value: SGValue = c.make(inputs)
+                let constructStart = DispatchTime.now().uptimeNanoseconds
+                for _ in 0..<iterations {
+                    value = c.make(inputs)
+                }
+                let constructTime = Double(DispatchTime.now().uptimeNanoseconds - constructStart) / Double(iterations) / 1000
+                // Export the node as the surface; the USDA is not loaded, so its type does not matter
+                let surface = SGToken(source: value.source)
+                let exportStart = DispatchTime.now().uptimeNanoseconds
+                for _ in 0..<iterations {
+                    _ = getUSDA(materialName: "TestMat", surface: surface, geometryModifier: nil)
+                }
+                let exportTime = Double(DispatchTime.now().uptimeNanoseconds - exportStart) / Double(iterations) / 1000
+                rows.append((c.nodeType, constructTime, exportTime))
+            }
+        }
+        print("Node type                                          Construct µs   Export µs")
+        for (nodeType, constructTime, exportTime) in rows.sorted(by: { $0.1 + $0.2 > $1.1 + $1.2 }) {
+            print(nodeType.padding(toLength: 50, withPad: " ", startingAt: 0) + String(format: " %12.2f %11.2f", constructTime, exportTime))
+        }
+        XCTAssertGreaterThan(rows.count, 0)
+    }
+}
@@ -162,4 +162,107 @@ final class ShaderGraphCoderTests: XCTestCase {
         let r = SGValue.vector3f(1, 2, 3).add(.vector3f(4, 5, 6)).divide(.float(2))
         try vectorTest(r)
     }
+
+    func testCostEstimate() throws {
+        let p = SGValue.position()
+        let r = normalize(p) + p
+        let cost = estimateCost(surface: pbrSurface(normal: r), geometryModifier: nil)
+        XCTAssertEqual(cost.nodeCount, 4)
+        XCTAssertEqual(cost.nodeCountsByType["ND_position_vector3"], 1)
+        XCTAssertEqual(cost.criticalPathDepth, 4)
+        XCTAssertEqual(cost.textureSamples, 0)
+        XCTAssertEqual(cost.totalCost, 3 + 18 + 3 + 64)
+        XCTAssertEqual(cost.violations(of: SGMaterialCostBudget(maxNodes: 3, maxCriticalPathDepth: 4)).count, 1)
+    }
+
+    func testPromoteConstants() throws {
+        func makeSurface(_ color: SIMD3<Float>, roughness: Float) -> SGToken {
+            pbrSurface(baseColor: .color3f(color) * .color3f(0.5, 0.5, 0.5), roughness: .float(roughness))
+        }
+        let (surface, _, promoted) = promoteConstants(surface: makeSurface([1, 0, 0], roughness: 0.25), geometryModifier: nil)
+        XCTAssertEqual(promoted.parameters.count, 3)
+        let (usda, _, errors) = getUSDA(materialName: "TestMat", surface: surface, geometryModifier: nil)
+        XCTAssertEqual(errors.count, 0)
+        for p in promoted.parameters {
+            XCTAssertTrue(usda.contains("inputs:\(p.name) = "))
+        }
+        let values = promoted.values(surface: makeSurface([0, 1, 0], roughness: 0.75), geometryModifier: nil)
+        XCTAssertEqual(Set(values.keys), Set(promoted.parameters.map { $0.name }))
+        try surfaceTest(surface!)
+        let noise = pbrSurface(roughness: fractal3D(amplitude: SGValue.float(1), octaves: .int(3)))
+        let (_, _, promotedNoise) = promoteConstants(surface: noise, geometryModifier: nil, where: { _, _ in true })
+        XCTAssertEqual(promotedNoise.parameters.map { $0.defaultValue.dataType }, [.float])
+    }
+
+    func testSubgraphInstances() throws {
+        let scaled = SGSubgraph(name: "Scaled", inputs: [.init(name: "position", defaultValue: .vector3f(.zero)), .init(name: "scale", defaultValue: .float(1))]) { inputs in
+            normalize((inputs[0] as! SGVector) * (inputs[1] as! SGScalar))
+        }
+        let p = SGValue.position()
+        let surface = pbrSurface(normal: scaled(p, .float(2)) + scaled(p, .float(3)))
+        let (usda, _, errors) = getUSDA(materialName: "TestMat", surface: surface, geometryModifier: nil)
+        XCTAssertEqual(errors.count, 0)
+        XCTAssertEqual(usda.components(separatedBy: "class NodeGraph").count - 1, 1)
+        XCTAssertEqual(usda.components(separatedBy: "prepend references").count - 1, 2)
+        XCTAssertEqual(usda.components(separatedBy: "ND_normalize_vector3").count - 1, 1)
+        try surfaceTest(surface)
+
+        let tinted = SGSubgraph(name: "Tinted", inputs: [.init(name: "color", defaultValue: .color3f([1, 1, 1]))]) { inputs in
+            (inputs[0] as! SGColor) * SGValue.color3fParameter(name: "Tint", defaultValue: [1, 0, 0])
+        }
+        let (tintedUSDA, _, tintedErrors) = getUSDA(materialName: "TestMat", surface: pbrSurface(baseColor: tinted(.color3f(0.5, 0.5, 0.5))), geometryModifier: nil)
+        XCTAssertEqual(tintedErrors.count, 0)
+        XCTAssertEqual(tintedUSDA.components(separatedBy: "color3f inputs:Tint = ").count - 1, 2)
+        XCTAssertTrue(tintedUSDA.contains("color3f inputs:Tint.connect = </Root/TestMat.inputs:Tint>"))
+    }
+
+    func testGraphKeys() throws {
+        func makeSurface(_ roughness: Float) -> SGToken {
+            pbrSurface(baseColor: .color3f(1, 0, 0), roughness: .float(roughness))
+        }
+        let a = SGGraphRoots(surface: makeSurface(0.5), geometryModifier: nil)
+        let b = SGGraphRoots(surface: makeSurface(0.5), geometryModifier: nil)
+        let c = SGGraphRoots(surface: makeSurface(0.25), geometryModifier: nil)
+        XCTAssertNotNil(a.key)
+        XCTAssertEqual(a.key, b.key)
+        XCTAssertNotEqual(a.key, c.key)
+        XCTAssertNil(SGGraphRoots(surface: SGToken(source: .error("Test", values: [])), geometryModifier: nil).key)
+    }
+
+    func testDemotePrecision() throws {
+        // The lone clamp stays in float, the max and clamp of the tint are demoted together
+        // and the glow stays in float because its parameter can be out of range
+        let normal = clamp(normalize(SGValue.normal()), min: SGValue.float(0), max: SGValue.float(1))
+        let tint = clamp(max(SGValue.color3f(0.8, 0.2, 0.1), SGValue.color3f(0.1, 0.1, 0.1)), min: SGValue.float(0), max: SGValue.float(1))
+        let glow = clamp(max(SGValue.color3fParameter(name: "Glow", defaultValue: [1, 0, 0]), SGValue.color3f(0.1, 0.1, 0.1)), min: SGValue.float(0), max: SGValue.float(1))
+        let (surface, _, demotedNodes) = demotePrecision(surface: pbrSurface(baseColor: tint, emissiveColor: glow, normal: normal), geometryModifier: nil)
+        XCTAssertEqual(demotedNodes, 2)
+        let (usda, _, errors) = getUSDA(materialName: "TestMat", surface: surface, geometryModifier: nil)
+        XCTAssertEqual(errors.count, 0)
+        XCTAssertTrue(usda.contains("ND_max_half3"))
+        XCTAssertTrue(usda.contains("ND_clamp_half3FA"))
+        XCTAssertTrue(usda.contains("ND_convert_half3_color3"))
+        XCTAssertTrue(usda.contains("ND_convert_color3_vector3"))
+        XCTAssertTrue(usda.contains("ND_max_color3"))
+        XCTAssertTrue(usda.contains("ND_clamp_vector3FA"))
+        XCTAssertTrue(usda.contains("ND_normalize_vector3"))
+        try surfaceTest(surface!)
+    }
+
+    func testNameIDs() throws {
+        let node = sin(SGValue.float(1)).node!
+        XCTAssertEqual(node.nodeType, "ND_sin_float")
+        XCTAssertLessThan(Int(node.nodeTypeID), SGNode.schemaNodeTypes.count)
+        XCTAssertEqual(node.inputs[0].name, "in")
+        let custom = SGNode(nodeType: "MyCustomNode", inputs: [.init(name: "myInput", dataType: .float)], outputs: [.init(dataType: .float)])
+        XCTAssertEqual(custom.nodeType, "MyCustomNode")
+        XCTAssertEqual(custom.inputs[0].name, "myInput")
+        XCTAssertEqual(SGNode(nodeType: "MyCustomNode", inputs: [], outputs: []).nodeTypeID, custom.nodeTypeID)
+        let identity = SGSubgraph(name: "Identity", inputs: [.init(name: "x", defaultValue: .float(0))]) { inputs in
+            inputs[0] as! SGScalar
+        }
+        let instance = identity(SGValue.float(1)).node!
+        XCTAssertEqual(instance.nodeType, identity.definition.usdaName)
+        XCTAssertEqual(instance.nodeTypeID, -1)
+    }
 }
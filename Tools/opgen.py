@@ -1,8 +1,13 @@
+import argparse
+import ast
+import json
 import os
 import re
 from typing import Dict, List, Optional, Set, Tuple, Union
-from pxr import Usd
 import plistlib
+import sys
+import time
+import usdc
 
 manual_node_prefixes = [
     'ND_combine',
@@ -114,8 +119,126 @@ enum_sgc_types: Dict[str, str] = {
     "opaque_black|opaque_white|transparent_black": "SGSamplerBorderColor",
 }
 
-def prop_is_supported(prop):
-    cd = prop.GetCustomData()
+# Rough ALU cost of one output component, by node base name without the ND_ and realitykit_ prefixes.
+# Unlisted nodes cost 1 per component.
+node_alu_weights: Dict[str, int] = {
+    "acos": 8,
+    "ambientocclusion": 32,
+    "asin": 8,
+    "atan2": 12,
+    "blur": 32,
+    "burn": 4,
+    "cellnoise2d": 12,
+    "cellnoise3d": 16,
+    "contrast": 4,
+    "cos": 6,
+    "crossproduct": 3,
+    "curveadjust": 16,
+    "curvelookup": 16,
+    "determinant": 8,
+    "divide": 4,
+    "dodge": 4,
+    "environment_radiance": 32,
+    "exp": 6,
+    "fractal3d": 128,
+    "heighttonormal": 24,
+    "hsvadjust": 24,
+    "hsvtorgb": 12,
+    "image": 4,
+    "invertmatrix": 32,
+    "ln": 6,
+    "luminance": 3,
+    "magnitude": 4,
+    "mix": 3,
+    "modulo": 4,
+    "noise2d": 24,
+    "noise3d": 32,
+    "normalize": 6,
+    "normalmap": 12,
+    "overlay": 6,
+    "pbr_surfaceshader": 64,
+    "place2d": 12,
+    "power": 8,
+    "range": 8,
+    "reflect": 4,
+    "refract": 8,
+    "remap": 4,
+    "rgbtohsv": 12,
+    "rotate2d": 8,
+    "rotate3d": 16,
+    "safepower": 10,
+    "sin": 6,
+    "smoothstep": 6,
+    "sqrt": 4,
+    "tan": 8,
+    "tiledimage": 8,
+    "transformmatrix": 16,
+    "transformnormal": 12,
+    "transformpoint": 16,
+    "transformvector": 12,
+    "triplanarprojection": 16,
+    "unlit_surfaceshader": 8,
+    "worleynoise2d": 48,
+    "worleynoise3d": 96,
+}
+
+noise_node_base_names = [
+    'cellnoise2d',
+    'cellnoise3d',
+    'fractal3d',
+    'noise2d',
+    'noise3d',
+    'worleynoise2d',
+    'worleynoise3d',
+]
+
+branch_node_base_names = [
+    'geometry_switch_cameraindex',
+    'ifequal',
+    'ifgreater',
+    'ifgreatereq',
+    'switch',
+]
+
+# How the output of a node relates to the range of its inputs, used to decide where half precision is safe.
+# "bounded" nodes output values within [-1, 1] whatever their inputs,
+# "preserving" nodes output values within [-1, 1] when all their inputs are.
+# mix is not listed: with a weight outside [0, 1] it extrapolates, e.g. fg = 1, bg = -1, mix = -1 gives 3.
+half_precision_ranges: Dict[str, str] = {
+    "absval": "preserving",
+    "ceil": "preserving",
+    "clamp": "preserving",
+    "cos": "bounded",
+    "floor": "preserving",
+    "ifequal": "preserving",
+    "ifgreater": "preserving",
+    "ifgreatereq": "preserving",
+    "max": "preserving",
+    "min": "preserving",
+    "multiply": "preserving",
+    "normalize": "bounded",
+    "ramplr": "preserving",
+    "ramptb": "preserving",
+    "round": "preserving",
+    "sign": "bounded",
+    "sin": "bounded",
+    "smoothstep": "bounded",
+    "splitlr": "preserving",
+    "splittb": "preserving",
+    "switch": "preserving",
+}
+
+# The half-precision type that replaces each float type when a node is demoted
+half_precision_usd_types: Dict[str, str] = {
+    "color3f": "half3",
+    "color4f": "half4",
+    "float": "half",
+    "float2": "half2",
+    "float3": "half3",
+    "float4": "half4",
+}
+
+def prop_is_supported(cd: Optional[Dict[str, object]]):
     if cd is not None and "realitykit" in cd:
         rk = cd["realitykit"]
         if "unsupported" in rk:
@@ -124,8 +247,7 @@ def prop_is_supported(prop):
                 return not u
     return True
 
-def prim_is_supported(prim):
-    cd = prim.GetCustomData()
+def prim_is_supported(cd: Optional[Dict[str, object]]):
     if cd is not None and "realitykit" in cd:
         rk = cd["realitykit"]
         if "availability" in rk:
@@ -134,23 +256,117 @@ def prim_is_supported(prim):
                 return False
     return True
 
+schema_metadata_keys = ['allowedTokens', 'connectability', 'displayName']
+
+class SchemaAttribute():
+    """An input or output of a schema prim, as read by one of the ingestion backends."""
+    __slots__ = ('name', 'usd_type', 'type_is_array', 'default_value', 'custom_data', 'metadata')
+    def __init__(self, name: str, usd_type: str, type_is_array: bool, default_value, custom_data: Optional[Dict[str, object]], metadata: Dict[str, object]):
+        self.name = name
+        self.usd_type = usd_type
+        self.type_is_array = type_is_array
+        self.default_value = default_value
+        self.custom_data = custom_data
+        self.metadata = metadata
+
+class SchemaPrim():
+    """A root prim of a schema with the attributes that are inputs or outputs."""
+    __slots__ = ('name', 'custom_data', 'attributes')
+    def __init__(self, name: str, custom_data: Optional[Dict[str, object]], attributes: List[SchemaAttribute]):
+        self.name = name
+        self.custom_data = custom_data
+        self.attributes = attributes
+
+def is_node_property_name(name: str) -> bool:
+    return name.startswith('inputs:') or name.startswith('outputs:')
+
+def read_schema_prims_pxr(usd_path: str) -> List[SchemaPrim]:
+    from pxr import Usd
+    stage = Usd.Stage.Open(usd_path)
+    prims: List[SchemaPrim] = []
+    for prim in stage.Traverse():
+        if not is_node_path(str(prim.GetPath())):
+            continue
+        attributes: List[SchemaAttribute] = []
+        for pn in prim.GetPropertyNames():
+            if not is_node_property_name(pn):
+                continue
+            p = prim.GetAttribute(pn)
+            t = p.GetTypeName()
+            usd_type_aliases = t.aliasesAsStrings
+            usd_type = usd_type_aliases[0] if len(usd_type_aliases) > 0 else t.type.typeName
+            metadata = p.GetAllMetadata()
+            metadata = {k: metadata[k] for k in schema_metadata_keys if k in metadata}
+            attributes.append(SchemaAttribute(pn, usd_type, t.isArray, p.Get() if p.HasValue() else None, p.GetCustomData(), metadata))
+        prims.append(SchemaPrim(str(prim.GetName()), prim.GetCustomData(), attributes))
+    return prims
+
+def read_schema_prims_usdc(usd_path: str) -> List[SchemaPrim]:
+    prims: List[SchemaPrim] = []
+    with usdc.CrateFile(usd_path) as crate:
+        for spec in crate.root_prims():
+            if spec.get('specifier') != usdc.SPECIFIER_DEF or not spec.get('active', True) or not is_node_path(spec.path):
+                continue
+            attributes: List[SchemaAttribute] = []
+            for p in spec.properties():
+                if p.spec_type != usdc.SPEC_TYPE_ATTRIBUTE or not is_node_property_name(p.name):
+                    continue
+                usd_type = p.get('typeName')
+                metadata = {k: p.get(k) for k in schema_metadata_keys if p.has(k)}
+                attributes.append(SchemaAttribute(p.name, usd_type, usd_type.endswith('[]'), p.get('default'), p.get('customData'), metadata))
+            prims.append(SchemaPrim(spec.name, spec.get('customData'), attributes))
+    return prims
+
+schema_readers = {
+    'usdc': read_schema_prims_usdc,
+    'pxr': read_schema_prims_pxr,
+}
+
+def compare_schema_prims(expected: List[SchemaPrim], actual: List[SchemaPrim]) -> List[str]:
+    """Lists the differences between two backends in everything the generator reads."""
+    def describe_attribute(a: SchemaAttribute):
+        metadata = {k: (str(v) if k != 'allowedTokens' else [str(x) for x in v]) for k, v in a.metadata.items()}
+        return (a.usd_type, a.type_is_array, a.default_value is None, str(a.default_value), prop_is_supported(a.custom_data), metadata)
+    differences: List[str] = []
+    if [x.name for x in expected] != [x.name for x in actual]:
+        differences.append('Prim names or order differ')
+        return differences
+    for e, a in zip(expected, actual):
+        if prim_is_supported(e.custom_data) != prim_is_supported(a.custom_data):
+            differences.append(f'{e.name}: support differs')
+        if [x.name for x in e.attributes] != [x.name for x in a.attributes]:
+            differences.append(f'{e.name}: properties differ')
+            continue
+        for ea, aa in zip(e.attributes, a.attributes):
+            if describe_attribute(ea) != describe_attribute(aa):
+                differences.append(f'{e.name}.{ea.name}: {describe_attribute(ea)} != {describe_attribute(aa)}')
+    return differences
+
 class Node():
+    __slots__ = ('name', 'base_name', 'suffix_type_name', 'inputs', 'outputs', 'description', 'introduced_index', 'removed', 'removed_index')
     name: str
+    base_name: str
+    suffix_type_name: Optional[str]
     inputs: List['NodeProperty']
     outputs: List['NodeProperty']
-    def __init__(self, prim):
-        self.name = str(prim.GetName())
-        property_names = prim.GetPropertyNames()
+    introduced_index: int
+    removed: bool
+    removed_index: Optional[int]
+    def __init__(self, prim: SchemaPrim):
+        self.name = sys.intern(prim.name)
+        self.base_name, self.suffix_type_name = get_node_suffix_type_name(self.name)
+        self.introduced_index = 0
+        self.removed = False
+        self.removed_index = None
         self.inputs = []
         self.outputs = []
-        for pn in property_names:
-            p = prim.GetAttribute(pn)
-            if not prop_is_supported(p):
+        for p in prim.attributes:
+            if not prop_is_supported(p.custom_data):
                 continue
-            if pn.startswith('inputs:'):
-                self.inputs.append(NodeProperty(self, pn, p))
-            if pn.startswith('outputs:'):
-                self.outputs.append(NodeProperty(self, pn, p))
+            if p.name.startswith('inputs:'):
+                self.inputs.append(NodeProperty(self, p))
+            if p.name.startswith('outputs:'):
+                self.outputs.append(NodeProperty(self, p))
         if self.name in node_descriptions:
             self.description = node_descriptions[self.name].strip()
             if self.description.endswith(')'):
@@ -162,28 +378,31 @@ class Node():
 
     def __str__(self):
         return f'{self.name} ({len(self.inputs)} inputs, {len(self.outputs)} outputs)'
-    
+
+    def signature(self) -> List[Tuple[str, str]]:
+        return [(p.property_name, p.usd_type) for p in self.inputs + self.outputs]
+
     def resolve_enums(self):
         for i in self.inputs:
             i.resolve_enums()
         for o in self.outputs:
             o.resolve_enums()
-    
+
 class NodeProperty():
-    def __init__(self, node: Node, property_name: str, p):
+    __slots__ = ('node', 'property_name', 'name', 'usd_type', 'type_is_array', 'default_value', 'is_enum', 'enum_members', 'enum', 'interface_only', 'display_name')
+    def __init__(self, node: Node, p: SchemaAttribute):
         self.node = node
-        self.property_name = property_name
-        self.name = property_name.split(':')[-1]
-        t = p.GetTypeName()
-        self.usd_type_aliases = t.aliasesAsStrings
-        self.usd_type = self.usd_type_aliases[0] if len(self.usd_type_aliases) > 0 else t.type.typeName
-        self.type_is_array = t.isArray
-        self.default_value = p.Get() if p.HasValue() else None
-        metadata = p.GetAllMetadata()
+        self.property_name = sys.intern(p.name)
+        self.name = sys.intern(p.name.split(':')[-1])
+        self.usd_type = sys.intern(p.usd_type)
+        self.type_is_array = p.type_is_array
+        self.default_value = p.default_value
+        metadata = p.metadata
         self.is_enum = False
         self.enum_members = []
+        self.enum = None
         if self.usd_type == "string" and "allowedTokens" in metadata:
-            self.enum_members = list(metadata["allowedTokens"])
+            self.enum_members = [sys.intern(str(x)) for x in metadata["allowedTokens"]]
             if len(self.enum_members) > 0:
                 self.is_enum = True
         if "connectability" in metadata and metadata["connectability"] == "interfaceOnly":
@@ -197,18 +416,19 @@ class NodeProperty():
 
     def __str__(self):
         return f'{self.name}: {self.usd_type} = {self.default_value}'
-    
+
     def resolve_enums(self):
         if self.is_enum:
             self.enum = get_enum(self.enum_members, self.node)
             self.usd_type = self.enum.gen_usd_type
 
 class EnumType():
+    __slots__ = ('id', 'structural_type_id', 'members', 'gen_usd_type', 'gen_sgc_type', 'first_node_name')
     def __init__(self, id: int, structural_type_id: str, members: List[str], node: Node):
         self.id = id
         self.structural_type_id = structural_type_id
         self.members = sorted(members)
-        self.gen_usd_type = f'enum{id}'
+        self.gen_usd_type = sys.intern(f'enum{id}')
         self.gen_sgc_type = f'SGEnum{id}_' + '_'.join(self.members)
         if structural_type_id in enum_sgc_types:
             self.gen_sgc_type = enum_sgc_types[structural_type_id]
@@ -218,7 +438,7 @@ class EnumType():
         # print(f'{self.first_node_name} created enum {self.gen_usd_type} with members {members}')
 
     def __str__(self):
-        return self.type_id
+        return self.structural_type_id
 
 def get_enum_structural_type_id(members: List[str]) -> str:
     sorted_members = sorted(members)
@@ -237,10 +457,112 @@ def get_enum(members: List[str], node: Node) -> EnumType:
     enums_by_gen_usd_type[enum.gen_usd_type] = enum
     return enum
 
-def is_node(prim):
-    path = str(prim.GetPath()).split('/')
+def is_node_path(prim_path: str):
+    path = prim_path.split('/')
     return len(path) == 2 and len(path[0]) == 0 and path[1].startswith('ND_')
 
+class Schema():
+    """A node catalog (USD + description plist) shipped with one OS release.
+    Schemas are given oldest first. The first one is the baseline and
+    needs no availability; later ones need a Swift availability spec
+    such as "visionOS 2.0, iOS 18.0, macOS 15.0"."""
+    def __init__(self, index: int, usd_path: str, plist_path: str, availability: Optional[str]):
+        self.index = index
+        self.usd_path = usd_path
+        self.plist_path = plist_path
+        self.availability = availability
+        self.node_names: Set[str] = set()
+
+    def __str__(self):
+        return self.availability if self.availability is not None else os.path.basename(self.usd_path)
+
+schemas: List[Schema] = []
+
+def parse_schema_arg(index: int, arg: str) -> Schema:
+    parts = [x.strip() for x in arg.split(',', 2)]
+    if len(parts) < 2:
+        raise ValueError(f'Expected USD,PLIST[,AVAILABILITY] but got "{arg}"')
+    availability = parts[2] if len(parts) > 2 and len(parts[2]) > 0 else None
+    if index > 0 and availability is None:
+        raise ValueError(f'Schema "{parts[0]}" needs an availability because it is not the first schema')
+    return Schema(index, parts[0], parts[1], availability)
+
+schema_prims_cache: Dict[str, Tuple[float, List[SchemaPrim]]] = {}
+
+def read_schema_prims(schema: Schema) -> List[SchemaPrim]:
+    """Reads the prims of a schema, reusing the last read while the file is unchanged."""
+    mtime = os.path.getmtime(schema.usd_path)
+    cached = schema_prims_cache.get(schema.usd_path)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+    start_time = time.perf_counter()
+    prims = schema_readers[args.backend](schema.usd_path)
+    print(f'Read {len(prims)} prims from {schema} ({args.backend}, {time.perf_counter() - start_time:.2f}s)')
+    if args.validate_backend:
+        other_backend = 'pxr' if args.backend == 'usdc' else 'usdc'
+        differences = compare_schema_prims(schema_readers[other_backend](schema.usd_path), prims)
+        for d in differences:
+            print(f'Error: {d}')
+        if len(differences) > 0:
+            raise ValueError(f'The {args.backend} and {other_backend} backends read {schema} differently')
+        print(f'The {args.backend} and {other_backend} backends agree on {len(prims)} prims in {schema}')
+    schema_prims_cache[schema.usd_path] = (mtime, prims)
+    return prims
+
+def load_schema_nodes(schema: Schema) -> List[Node]:
+    nodes = [Node(x) for x in read_schema_prims(schema) if prim_is_supported(x.custom_data)]
+    schema.node_names = set(x.name for x in nodes)
+    print(f'Found {len(nodes)} nodes in {schema}')
+    return nodes
+
+def merge_schema_nodes(nodes_per_schema: List[List[Node]]) -> List[Node]:
+    """Merges the catalogs of all schemas into one list of nodes.
+    Each node is tagged with the first schema that introduced it and, if the latest schema does not have it,
+    the schema after the last one that did. The newest definition of a node wins."""
+    nodes_by_name: Dict[str, Node] = {}
+    introduced_index: Dict[str, int] = {}
+    last_index: Dict[str, int] = {}
+    seen_names: Set[str] = set()
+    for schema, nodes in zip(schemas, nodes_per_schema):
+        for name in schema.node_names - seen_names:
+            introduced_index[name] = schema.index
+        for name in schema.node_names:
+            last_index[name] = schema.index
+        for node in nodes:
+            if node.name in nodes_by_name and nodes_by_name[node.name].signature() != node.signature():
+                print(f'Warning: {node.name} changed its inputs or outputs in {schema}')
+            nodes_by_name[node.name] = node
+        seen_names |= schema.node_names
+    removed_names = seen_names - schemas[-1].node_names
+    for name, node in nodes_by_name.items():
+        node.introduced_index = introduced_index[name]
+        node.removed = name in removed_names
+        node.removed_index = last_index[name] + 1 if node.removed else None
+    if len(schemas) > 1:
+        for schema in schemas[1:]:
+            print(f'{schema} introduced {len([x for x in introduced_index.values() if x == schema.index])} nodes')
+            print(f'{schema} removed {len([x for x in removed_names if last_index[x] + 1 == schema.index])} nodes')
+    return list(nodes_by_name.values())
+
+class SchemaCatalog():
+    """Lookup indexes over the merged nodes of all schemas, shared by the passes that emit tables."""
+    __slots__ = ('nodes', 'nodes_by_base_name', 'converts_by_input_type')
+    def __init__(self, nodes: List[Node]):
+        self.nodes = sorted(nodes, key=lambda x: x.name)
+        self.nodes_by_base_name: Dict[str, List[Node]] = {}
+        self.converts_by_input_type: Dict[str, List[Tuple[str, str]]] = {}
+        for node in self.nodes:
+            self.nodes_by_base_name.setdefault(node.base_name, []).append(node)
+            if node.base_name.startswith('ND_convert_') and len(node.inputs) == 1 and len(node.outputs) == 1:
+                self.converts_by_input_type.setdefault(node.inputs[0].usd_type, []).append((node.name, node.outputs[0].usd_type))
+
+    def nodes_with_base_name(self, base_name: str) -> List[Node]:
+        return self.nodes_by_base_name.get(base_name, [])
+
+    def converts_from(self, usd_type: str) -> List[Tuple[str, str]]:
+        """The convert nodes that read the type, as (node type, output USD type) pairs sorted by node type."""
+        return self.converts_by_input_type.get(usd_type, [])
+
 def should_output_node(node: Node):
     if node.name.startswith('ND_Internal'):
         # print(f'Skipping {node.name} because it is internal')
@@ -273,6 +595,14 @@ def is_unnamed_input_name(i: int, input: NodeProperty, node: Node) -> bool:
         return True
     return False
 
+def dispatch_overloads(overloads: List[Tuple[Optional[str], Node]]) -> Dict[Tuple[str, ...], str]:
+    """Maps each combination of input types a set accepts to the node its function builds.
+    The function tries the overloads in order and the first whose inputs match wins."""
+    dispatch: Dict[Tuple[str, ...], str] = {}
+    for _, node in overloads:
+        dispatch.setdefault(tuple(x.usd_type for x in node.inputs if not x.is_enum), node.name)
+    return dispatch
+
 class NodeOverloads():
     overloads: List[Tuple[Optional[str], Node]]
     def __init__(self, base_name: str, first_suffix_type_name: Optional[str], first_node: Node):
@@ -281,10 +611,20 @@ class NodeOverloads():
         self.overloads = [(first_suffix_type_name, first_node)]
         self.num_inputs = len(first_node.inputs)
         self.write_func = self.num_inputs > 0
+        self.emitted_bytes = 0
+        self.emitted_lines = 0
+        self.extension_types: List[str] = []
     def add_overload(self, suffix_type_name: Optional[str], node: Node):
         self.overloads.append((suffix_type_name, node))
     def first_node(self) -> Node:
         return self.overloads[0][1]
+    def introduced_index(self) -> int:
+        return min(node.introduced_index for _, node in self.overloads)
+    def is_removed(self) -> bool:
+        return all(node.removed for _, node in self.overloads)
+    def removed_index(self) -> int:
+        """The schema from which none of the overloads are available, if is_removed()."""
+        return max(node.removed_index or 0 for _, node in self.overloads)
     def all_inputs_shared(self) -> bool:
         first_inputs = self.first_node().inputs
         for _, node in self.overloads[1:]:
@@ -344,6 +684,27 @@ class NodeOverloads():
         elif self.generic_params is not None and i in self.generic_params[0]:
             sgc_type = 'T'
         return sgc_type
+    def dispatch(self) -> Dict[Tuple[str, ...], str]:
+        return dispatch_overloads(self.overloads)
+    def collapse_to_generic(self) -> bool:
+        """Narrows a set whose output type varies but that has no generic parameter to the overloads
+        where one input has the output's type, if the function still builds the same node for every
+        combination of input types. The set then becomes one generic over that input and only overloads
+        that an earlier overload always shadowed are dropped."""
+        if len(self.overloads) < 2 or self.find_generic_params() is not None:
+            return False
+        if len(set(usd_type_to_sgc_type(x.outputs[0].usd_type) for _, x in self.overloads)) < 2:
+            return False
+        baseline = dispatch_overloads(self.overloads)
+        for i, input in enumerate(self.first_node().inputs):
+            if input.is_enum or input.usd_type == "asset":
+                continue
+            tracking = [(s, x) for s, x in self.overloads if x.inputs[i].usd_type == x.outputs[0].usd_type]
+            if len(tracking) < 2 or dispatch_overloads(tracking) != baseline:
+                continue
+            self.overloads = tracking
+            return True
+        return False
     def find_generic_params(self) -> Optional[Tuple[List[int], str]]:
         param_type_matches_output_type = [True for _ in self.first_node().inputs]
         sgc_output_types: Set[str] = set()
@@ -397,7 +758,7 @@ class NodeOverloads():
 node_overloads: Dict[str, NodeOverloads] = {}
 
 def add_node_to_overloads(node: Node):
-    base_name, suffix_type_name = get_node_suffix_type_name(node)
+    base_name, suffix_type_name = node.base_name, node.suffix_type_name
     if base_name not in node_overloads:
         node_overloads[base_name] = NodeOverloads(base_name, suffix_type_name, node)
     else:
@@ -469,104 +830,74 @@ suffix_type_names: List[str] = [
     "_vector4I",
 ]
 
-def get_node_suffix_type_name(node: Node) -> Tuple[str, Optional[str]]:
-    for suffix in suffix_type_names:
-        if node.name.endswith(suffix):
-            base_name = node.name[:-len(suffix)]
-            return base_name, suffix
-    return node.name, None
+suffix_type_names_set: Set[str] = set(suffix_type_names)
+
+def get_node_suffix_type_name(name: str) -> Tuple[str, Optional[str]]:
+    # Suffixes never contain an underscore so only the last segment needs to be looked up
+    i = name.rfind('_')
+    if i > 0 and name[i:] in suffix_type_names_set:
+        return sys.intern(name[:i]), sys.intern(name[i:])
+    return name, None
+
+sgc_types_by_usd_type: Dict[str, str] = {
+    'bool': 'SGValue',
+    'color3f': 'SGColor',
+    'color4f': 'SGColor',
+    'float': 'SGScalar',
+    'matrix2d': 'SGMatrix',
+    'matrix3d': 'SGMatrix',
+    'matrix4d': 'SGMatrix',
+    'float2': 'SGVector',
+    'half2': 'SGVector',
+    'int2': 'SGVector',
+    'float3': 'SGVector',
+    'half3': 'SGVector',
+    'int3': 'SGVector',
+    'float4': 'SGVector',
+    'half4': 'SGVector',
+    'int4': 'SGVector',
+    'int': 'SGScalar',
+    'half': 'SGScalar',
+    'asset': 'SGTexture',
+    'string': 'SGString',
+    'token': 'SGToken',
+}
 
 def usd_type_to_sgc_type(usd_type: str) -> str:
-    if usd_type == 'bool':
-        return 'SGValue'
-    if usd_type == 'color3f':
-        return 'SGColor'
-    if usd_type == 'color4f':
-        return 'SGColor'
-    if usd_type == 'float':
-        return 'SGScalar'
-    if usd_type == 'matrix2d':
-        return 'SGMatrix'
-    if usd_type == 'matrix3d':
-        return 'SGMatrix'
-    if usd_type == 'matrix4d':
-        return 'SGMatrix'
-    if usd_type == 'float2':
-        return 'SGVector'
-    if usd_type == 'half2':
-        return 'SGVector'
-    if usd_type == 'int2':
-        return 'SGVector'
-    if usd_type == 'float3':
-        return 'SGVector'
-    if usd_type == 'half3':
-        return 'SGVector'
-    if usd_type == 'int3':
-        return 'SGVector'
-    if usd_type == 'float4':
-        return 'SGVector'
-    if usd_type == 'half4':
-        return 'SGVector'
-    if usd_type == 'int4':
-        return 'SGVector'
-    if usd_type == 'int':
-        return 'SGScalar'
-    if usd_type == 'half':
-        return 'SGScalar'
-    if usd_type == 'asset':
-        return 'SGTexture'
-    if usd_type == 'string':
-        return 'SGString'
-    if usd_type == 'token':
-        return 'SGToken'
+    if usd_type in sgc_types_by_usd_type:
+        return sgc_types_by_usd_type[usd_type]
     if usd_type in enums_by_gen_usd_type:
         return enums_by_gen_usd_type[usd_type].gen_sgc_type
     print("Unknown USD type:", usd_type)
     return usd_type
 
+sgc_datatypes_by_usd_type: Dict[str, str] = {
+    'bool': 'SGDataType.bool',
+    'color3f': 'SGDataType.color3f',
+    'color4f': 'SGDataType.color4f',
+    'float': 'SGDataType.float',
+    'matrix2d': 'SGDataType.matrix2d',
+    'matrix3d': 'SGDataType.matrix3d',
+    'matrix4d': 'SGDataType.matrix4d',
+    'float2': 'SGDataType.vector2f',
+    'half2': 'SGDataType.vector2h',
+    'int2': 'SGDataType.vector2i',
+    'float3': 'SGDataType.vector3f',
+    'half3': 'SGDataType.vector3h',
+    'int3': 'SGDataType.vector3i',
+    'float4': 'SGDataType.vector4f',
+    'half4': 'SGDataType.vector4h',
+    'int4': 'SGDataType.vector4i',
+    'int': 'SGDataType.int',
+    'half': 'SGDataType.half',
+    'asset': 'SGDataType.asset',
+    'string': 'SGDataType.string',
+    'token': 'SGDataType.token',
+}
+
 def usd_type_to_sgc_datatype(usd_type: str) -> str:
-    if usd_type == 'bool':
-        return 'SGDataType.bool'
-    if usd_type == 'color3f':
-        return 'SGDataType.color3f'
-    if usd_type == 'color4f':
-        return 'SGDataType.color4f'
-    if usd_type == 'float':
-        return 'SGDataType.float'
-    if usd_type == 'matrix2d':
-        return 'SGDataType.matrix2d'
-    if usd_type == 'matrix3d':
-        return 'SGDataType.matrix3d'
-    if usd_type == 'matrix4d':
-        return 'SGDataType.matrix4d'
-    if usd_type == 'float2':
-        return 'SGDataType.vector2f'
-    if usd_type == 'half2':
-        return 'SGDataType.vector2h'
-    if usd_type == 'int2':
-        return 'SGDataType.vector2i'
-    if usd_type == 'float3':
-        return 'SGDataType.vector3f'
-    if usd_type == 'half3':
-        return 'SGDataType.vector3h'
-    if usd_type == 'int3':
-        return 'SGDataType.vector3i'
-    if usd_type == 'float4':
-        return 'SGDataType.vector4f'
-    if usd_type == 'half4':
-        return 'SGDataType.vector4h'
-    if usd_type == 'int4':
-        return 'SGDataType.vector4i'
-    if usd_type == 'int':
-        return 'SGDataType.int'
-    if usd_type == 'half':
-        return 'SGDataType.half'
-    if usd_type == 'asset':
-        return 'SGDataType.asset'
-    if usd_type == 'string':
-        return 'SGDataType.string'
-    if usd_type == 'token':
-        return 'SGDataType.token'
+    if usd_type in sgc_datatypes_by_usd_type:
+        return sgc_datatypes_by_usd_type[usd_type]
     if usd_type in enums_by_gen_usd_type:
         return f"SGDataType.string"
     print("Unknown USD datatype:", usd_type)
@@ -575,86 +906,89 @@ def usd_type_to_sgc_datatype(usd_type: str) -> str:
 def usd_type_to_const_ctor(usd_type):
     return usd_type_to_sgc_datatype(usd_type).replace('SGDataType.', '.')
 
+primitive_types_by_usd_type: Dict[str, str] = {
+    'bool': 'Bool',
+    'color3f': 'SIMD3<Float>',
+    'color4f': 'SIMD4<Float>',
+    'float': 'Float',
+    'matrix2d': 'SIMD2x2<Float>',
+    'matrix3d': 'SIMD3x3<Float>',
+    'matrix4d': 'SIMD4x4<Float>',
+    'float2': 'SIMD2<Float>',
+    'half2': 'SIMD2<Float16>',
+    'int2': 'SIMD2<Int32>',
+    'float3': 'SIMD3<Float>',
+    'half3': 'SIMD3<Float16>',
+    'int3': 'SIMD3<Int32>',
+    'float4': 'SIMD4<Float>',
+    'half4': 'SIMD4<Float16>',
+    'int4': 'SIMD4<Int32>',
+    'int': 'Int',
+    'half': 'Float16',
+    'asset': 'SGTexture',
+    'string': 'String',
+    'token': 'String',
+}
+
 def usd_type_to_primitive_type(usd_type: str) -> str:
-    if usd_type == 'bool':
-        return 'Bool'
-    if usd_type == 'color3f':
-        return 'SIMD3<Float>'
-    if usd_type == 'color4f':
-        return 'SIMD4<Float>'
-    if usd_type == 'float':
-        return 'Float'
-    if usd_type == 'matrix2d':
-        return 'SIMD2x2<Float>'
-    if usd_type == 'matrix3d':
-        return 'SIMD3x3<Float>'
-    if usd_type == 'matrix4d':
-        return 'SIMD4x4<Float>'
-    if usd_type == 'float2':
-        return 'SIMD2<Float>'
-    if usd_type == 'half2':
-        return 'SIMD2<Float16>'
-    if usd_type == 'int2':
-        return 'SIMD2<Int32>'
-    if usd_type == 'float3':
-        return 'SIMD3<Float>'
-    if usd_type == 'half3':
-        return 'SIMD3<Float16>'
-    if usd_type == 'int3':
-        return 'SIMD3<Int32>'
-    if usd_type == 'float4':
-        return 'SIMD4<Float>'
-    if usd_type == 'half4':
-        return 'SIMD4<Float16>'
-    if usd_type == 'int4':
-        return 'SIMD4<Int32>'
-    if usd_type == 'int':
-        return 'Int'
-    if usd_type == 'half':
-        return 'Float16'
-    if usd_type == 'asset':
-        return 'SGTexture'
-    if usd_type == 'string':
-        return 'String'
-    if usd_type == 'token':
-        return 'String'
+    if usd_type in primitive_types_by_usd_type:
+        return primitive_types_by_usd_type[usd_type]
     if usd_type in enums_by_gen_usd_type:
         return enums_by_gen_usd_type[usd_type].gen_sgc_type
     print("Unknown USD primitive type:", usd_type)
     return f"Any"
 
+plist_strings_cache: Dict[str, Tuple[float, Dict[str, str]]] = {}
+
 def load_plist_strings(plist_path) -> Dict[str, str]:
+    mtime = os.path.getmtime(plist_path)
+    cached = plist_strings_cache.get(plist_path)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
     with open(plist_path, 'rb') as f:
         plist = plistlib.load(f)
+    plist_strings_cache[plist_path] = (mtime, plist)
     return plist
 
+def write_file_if_changed(file_path: str, contents: str) -> bool:
+    """Writes the file unless it already has these contents, so unchanged outputs keep their timestamps."""
+    if os.path.exists(file_path):
+        with open(file_path, 'r') as f:
+            if f.read() == contents:
+                return False
+    with open(file_path, 'w') as f:
+        f.write(contents)
+    print(f'Wrote {os.path.relpath(file_path, repo_path)}')
+    return True
+
 class CodeWriter():
     def __init__(self):
         self.lines = []
         self.current_line = ""
         self.needs_indent = True
         self.indent_level = 0
+        self.num_bytes = 0
 
     def commit_current_line(self):
+        self.num_bytes += len(self.current_line.encode('utf-8')) + 1
         self.lines.append(self.current_line)
         self.current_line = ""
         self.needs_indent = True
 
-    def output_to_file(self, file_path: str):
-        with open(file_path, 'w') as f:
-            for line in self.lines:
-                f.write(line)
-                f.write('\n')
-            f.write(self.current_line)
+    def output_to_file(self, file_path: str) -> bool:
+        return write_file_if_changed(file_path, self.__str__())
 
-    def replace_in_file(self, file_path: str, re_to_replace: str):
+    def replace_in_file(self, file_path: str, re_to_replace: str) -> bool:
         replacement = self.__str__()
         with open(file_path, 'r') as f:
             original_file_contents = f.read()
         r = re.compile(re_to_replace, re.MULTILINE|re.DOTALL)
         new_file_contents = r.sub(replacement, original_file_contents)
-        with open(file_path, 'w') as f:
-            f.write(new_file_contents)
+        return write_file_if_changed(file_path, new_file_contents)
+
+    def size(self) -> Tuple[int, int]:
+        """Returns the number of bytes and lines written so far."""
+        return self.num_bytes + len(self.current_line.encode('utf-8')), len(self.lines)
 
     def __str__(self) -> str:
         if len(self.lines) == 0:
@@ -779,8 +1113,10 @@ def get_base_sg_type(sg_types: List[str]) -> str:
     print("Warning: Could not determine base SG type for", composite_type)
     return "SGValue"
 
-def write_enums(w: SwiftWriter):
+def write_enums(w: SwiftWriter, used_sgc_types: Optional[Set[str]] = None):
     for enum in enums_by_gen_usd_type.values():
+        if used_sgc_types is not None and enum.gen_sgc_type not in used_sgc_types:
+            continue
         w.write_line(f'public enum {enum.gen_sgc_type}: String, CaseIterable {{')
         for member in enum.members:
             case_swift_name = snake_to_camel(member)
@@ -813,12 +1149,123 @@ def write_sgc_value(w: SwiftWriter, value, usd_type: str, sgc_type: str):
     write_primitive_value(w, value, usd_type, sgc_type)
     w.write(f')))')
 
+def write_availability(overloads: NodeOverloads, w: CodeWriter):
+    introduced_index = overloads.introduced_index()
+    if introduced_index > 0:
+        w.write_line(f'@available({schemas[introduced_index].availability}, *)')
+    if overloads.is_removed():
+        w.write_line(f'@available(*, deprecated, message: "Not available in {schemas[overloads.removed_index()]}")')
+
+def record_emitted_size(overloads: NodeOverloads, w: CodeWriter, start: Tuple[int, int]):
+    end = w.size()
+    overloads.emitted_bytes += end[0] - start[0]
+    overloads.emitted_lines += end[1] - start[1]
+
+public_surface: List[str] = []
+
+def record_public_surface(scope: str, w: CodeWriter):
+    """Records the prototype that was just written so changes to the public call surface can be detected."""
+    public_surface.append(f'{scope}: {w.current_line.strip()}')
+
+sgc_superclasses = {
+    "SGNumeric": "SGValue",
+    "SGScalar": "SGNumeric",
+    "SGMatrix": "SGNumeric",
+    "SGSIMD": "SGNumeric",
+    "SGVector": "SGSIMD",
+    "SGColor": "SGSIMD",
+    "SGString": "SGValue",
+    "SGToken": "SGValue",
+    "SGAsset": "SGValue",
+    "SGTexture": "SGAsset",
+}
+
+def is_sgc_subclass(sgc_type: str, base_sgc_type: str) -> bool:
+    t: Optional[str] = sgc_type
+    while t is not None:
+        if t == base_sgc_type:
+            return True
+        t = sgc_superclasses.get(t)
+    return False
+
+surface_decl_re = re.compile(r'^(\w+): (?:public )?(?:static )?func (\w+)(?:<(\w+)>)?\((.*)\) -> (\w+)(?: where \w+: (\w+))?$')
+
+def parse_surface_decl(decl: str):
+    """Returns the scope, name, parameters as (label, type, has default) and return type of a recorded prototype,
+    with a generic parameter replaced by its constraint and marked generic."""
+    m = surface_decl_re.match(decl)
+    if m is None:
+        return None
+    scope, name, generic, params_str, return_type, constraint = m.groups()
+    def resolve(t: str) -> Tuple[str, bool]:
+        if generic is not None and t == generic:
+            return constraint or "SGValue", True
+        if t == "Self":
+            return scope, False
+        return t, False
+    params = []
+    for p in [x for x in params_str.split(', ') if len(x) > 0]:
+        label_and_name, type_and_default = p.split(': ', 1)
+        label = label_and_name.split(' ')[0]
+        t = type_and_default.split(' = ')[0].rstrip('?')
+        params.append((label, resolve(t), ' = ' in type_and_default))
+    return scope, name, params, resolve(return_type)
+
+def is_call_compatible(old, new) -> bool:
+    """True if every call that type-checks against old also does against new with a result usable where old's was:
+    the same argument labels, defaults kept, parameters as wide or wider and a result as narrow or narrower."""
+    if old[:2] != new[:2] or len(old[2]) != len(new[2]):
+        return False
+    for (old_label, (old_type, _), old_default), (new_label, (new_type, _), new_default) in zip(old[2], new[2]):
+        if old_label != new_label or (old_default and not new_default):
+            return False
+        if old_type != new_type and not is_sgc_subclass(old_type, new_type):
+            return False
+    (old_return, old_return_is_generic), (new_return, new_return_is_generic) = old[3], new[3]
+    if old_return_is_generic and not new_return_is_generic:
+        return False
+    return old_return == new_return or is_sgc_subclass(new_return, old_return)
+
+def check_public_surface(snapshot_path: str) -> List[str]:
+    with open(snapshot_path, 'r') as f:
+        snapshot = [x for x in f.read().splitlines() if len(x) > 0]
+    surface = set(public_surface)
+    decls_by_name: Dict[Tuple[str, str], List] = {}
+    for x in public_surface:
+        d = parse_surface_decl(x)
+        if d is not None:
+            decls_by_name.setdefault(d[:2], []).append(d)
+    violations: List[str] = []
+    for x in snapshot:
+        if x in surface:
+            continue
+        old = parse_surface_decl(x)
+        if old is None or not any(is_call_compatible(old, new) for new in decls_by_name.get(old[:2], [])):
+            violations.append(f'Public declaration changed or removed: {x}')
+    return violations
+
+def write_instrumentation(w: CodeWriter, lines: List[str]):
+    """Writes lines that are only compiled when SHADERGRAPHCODER_INSTRUMENTATION is defined, if --instrument was passed."""
+    if not args.instrument:
+        return
+    w.write_line('#if SHADERGRAPHCODER_INSTRUMENTATION')
+    for line in lines:
+        w.write_line(line)
+    w.write_line('#endif')
+
 def write_node_overloads(overloads: NodeOverloads, decl_public: bool, decl_static: bool, w: SwiftWriter):
+    start = w.size()
     generic_params, sgc_output_type, interface_only_params, primitive_params, param_names, default_value_params, num_unnamed_inputs, usd_param_type_is_shared, sgc_param_type_is_shared, sgc_shared_param_type, num_unshared_usd_params = overloads.analyze()
     write_node_overloads_prototype(overloads, w, decl_public, decl_static, generic_params, primitive_params, default_value_params, sgc_param_type_is_shared, sgc_shared_param_type, num_unnamed_inputs, param_names, sgc_output_type, skip_params=0, generic_is_self=False)
+    record_public_surface('SGValue' if decl_static else 'ShaderGraphCoder', w)
     first_node_inputs = overloads.first_node().inputs
     w.write_line(f' {{')
     w.indent()
+    instrumented_name = f'SGValue.{overloads.swift_name}' if decl_static else overloads.swift_name
+    write_instrumentation(w, [
+        f'let instrumentationID = SGInstrumentation.beginCall("{instrumented_name}")',
+        f'defer {{ SGInstrumentation.endCall("{instrumented_name}", instrumentationID) }}',
+    ])
     for i, input in enumerate(first_node_inputs):
         if not usd_param_type_is_shared[i]:
             continue
@@ -828,8 +1275,11 @@ def write_node_overloads(overloads: NodeOverloads, decl_public: bool, decl_stati
             continue
         sgc_datatype = usd_type_to_sgc_datatype(input.usd_type)
         w.write_line(f'guard {sgc_datatype}.matches({param_names[i]}) else {{')
+        w.indent()
+        write_instrumentation(w, [f'SGInstrumentation.recordError("{instrumented_name}")'])
         datatype_code = f'{param_names[i]}.dataType' if default_value_params[i] is None else f'{param_names[i]}?.dataType.rawValue ?? "nil"'
-        w.write_line(f'    return {sgc_output_type}(source: .error("Invalid {overloads.swift_name} input. Expected {param_names[i]} data type to be {sgc_datatype}, but got \({datatype_code}).", values: [{param_names[i]}]))')
+        w.write_line(f'return {sgc_output_type}(source: .error("Invalid {overloads.swift_name} input. Expected {param_names[i]} data type to be {sgc_datatype}, but got \({datatype_code}).", values: [{param_names[i]}]))')
+        w.unindent()
         w.write_line(f'}}')
     for _, node in overloads.overloads:
         conds: List[str] = []
@@ -844,26 +1294,38 @@ def write_node_overloads(overloads: NodeOverloads, decl_public: bool, decl_stati
                 print(f'Warning: {overloads.swift_name} has multiple overloads but none of the inputs have unique types')
         else:
             cond = " && ".join(conds)
+            if node.introduced_index > overloads.introduced_index():
+                cond += f', #available({schemas[node.introduced_index].availability}, *)'
             w.write_line(f'if {cond} {{')
             w.indent()
         sgc_node_output_type = usd_type_to_sgc_type(node.outputs[0].usd_type)
         if generic_params is not None:
             sgc_node_output_type = 'T'
+        if node.removed_index is not None:
+            # The rest of the set is still available, so gate this overload at runtime instead of deprecating the function
+            removed_schema = schemas[node.removed_index]
+            vals = [param_names[i] for i, input in enumerate(node.inputs) if not input.is_enum and not interface_only_params[i] and not primitive_params[i]]
+            w.write_line(f'if #available({removed_schema.availability}, *) {{')
+            w.indent()
+            write_instrumentation(w, [f'SGInstrumentation.recordError("{instrumented_name}")'])
+            w.write_line(f'return {sgc_node_output_type}(source: .error("{node.name} is not available in {removed_schema}", values: [{", ".join(vals)}]))')
+            w.unindent()
+            w.write_line(f'}}')
         w.write_line(f'return {sgc_node_output_type}(source: .nodeOutput(SGNode(')
         w.indent()
-        w.write_line(f'nodeType: "{node.name}",')
+        w.write_line(f'nodeTypeID: {node_type_ids[node.name]}, // {node.name}')
         w.write_line(f'inputs: [')
         w.indent()
         for i, input in enumerate(node.inputs):
             sgc_datatype = usd_type_to_sgc_datatype(input.usd_type)
             if input.is_enum:
-                w.write_line(f'.init(name: "{input.name}", dataType: {sgc_datatype}, connection: SGString(source: .constant(.string({param_names[i]}.rawValue)))),')
+                w.write_line(f'.init(nameID: {input_name_ids[input.name]}, dataType: {sgc_datatype}, connection: SGString(source: .constant(.string({param_names[i]}.rawValue)))),')
             elif interface_only_params[i]:
                 sgct = usd_type_to_sgc_type(input.usd_type)
                 ctor = usd_type_to_const_ctor(input.usd_type)
-                w.write_line(f'.init(name: "{input.name}", dataType: {sgc_datatype}, connection: {sgct}(source: .constant({ctor}({param_names[i]})))),')
+                w.write_line(f'.init(nameID: {input_name_ids[input.name]}, dataType: {sgc_datatype}, connection: {sgct}(source: .constant({ctor}({param_names[i]})))),')
             else:
-                w.write_line(f'.init(name: "{input.name}", dataType: {sgc_datatype}, connection: {param_names[i]}),')
+                w.write_line(f'.init(nameID: {input_name_ids[input.name]}, dataType: {sgc_datatype}, connection: {param_names[i]}),')
         w.unindent()
         w.write_line(f'],')
         w.write_line(f'outputs: [.init(dataType: {usd_type_to_sgc_datatype(node.outputs[0].usd_type)})])))')
@@ -884,15 +1346,18 @@ def write_node_overloads(overloads: NodeOverloads, decl_public: bool, decl_stati
                 args.append(f'{param_names[i]}: \({param_names[i]}.dataType)')
         args_str = "(" + ", ".join(args) + ")"
         vals_str = "[" + ", ".join(vals) + "]"
+        write_instrumentation(w, [f'SGInstrumentation.recordError("{instrumented_name}")'])
         w.write_line(f'return {sgc_output_type}(source: .error("Unsupported input data types in {overloads.swift_name}{args_str}", values: {vals_str}))')
     w.unindent()
     w.write_line('}')
+    record_emitted_size(overloads, w, start)
 
 def write_node_overloads_prototype(overloads: NodeOverloads, w: CodeWriter, decl_public: bool, decl_static: bool, generic_params, primitive_params: List[bool], default_value_params, sgc_param_type_is_shared: List[bool], sgc_shared_param_type: List[str], num_unnamed_inputs: int, param_names: List[str], sgc_output_type: str, skip_params: int, generic_is_self: bool):
     first_node = overloads.first_node()
     swift_name = overloads.swift_name
     if len(first_node.description) > 0:
         w.write_line(f'/// {first_node.description}')
+    write_availability(overloads, w)
     if decl_public:
         w.write('public ')
     if decl_static:
@@ -937,9 +1402,12 @@ def write_extension_node_overloads(w: SwiftWriter, ext_sgc_type: str, overloadss
     w.write_line(f'public extension {ext_sgc_type} {{')
     w.indent()
     for overloads in overloadss:
+        start = w.size()
+        overloads.extension_types.append(ext_sgc_type)
         generic_params, sgc_output_type, interface_only_params, primitive_params, param_names, default_value_params, num_unnamed_inputs, usd_param_type_is_shared, sgc_param_type_is_shared, sgc_shared_param_type, num_unshared_usd_params = overloads.analyze()
         generic_is_self = overloads.generic_params is not None and 0 in overloads.generic_params[0]
         write_node_overloads_prototype(overloads, w, False, False, generic_params, primitive_params, default_value_params, sgc_param_type_is_shared, sgc_shared_param_type, num_unnamed_inputs, param_names, sgc_output_type, skip_params=1, generic_is_self=generic_is_self)
+        record_public_surface(ext_sgc_type, w)
         w.write_line(' {')
         w.indent()
         w.write(f'ShaderGraphCoder.{overloads.swift_name}(')
@@ -958,6 +1426,7 @@ def write_extension_node_overloads(w: SwiftWriter, ext_sgc_type: str, overloadss
         w.write_line("")
         w.unindent()
         w.write_line('}')
+        record_emitted_size(overloads, w, start)
     w.unindent()
     w.write_line('}')
 
@@ -976,79 +1445,698 @@ def write_node_overload_table_entry(overloads: NodeOverloads, w: SwiftWriter, pr
         w.write(f")")
     w.write_line(f"` | {node.description} |")
 
+benchmark_value_usd_types: Set[str] = {
+    'bool', 'color3f', 'color4f', 'float', 'half', 'int',
+    'float2', 'float3', 'float4', 'half2', 'half3', 'half4', 'int2', 'int3', 'int4',
+    'matrix2d', 'matrix3d', 'matrix4d', 'asset',
+}
+
+def get_benchmark_primitive_literal(input: NodeProperty, sgc_type: str) -> str:
+    if input.is_enum:
+        return f'{sgc_type}.{snake_to_camel(input.enum.members[0])}'
+    primitive_type = usd_type_to_primitive_type(input.usd_type)
+    if primitive_type == 'Bool':
+        return 'false'
+    if primitive_type == 'String':
+        return '""'
+    if primitive_type.startswith('SIMD') and 'x' not in primitive_type:
+        return '.zero'
+    if primitive_type.startswith('SIMD'):
+        return '.init()'
+    return '0'
+
+def get_operation_calls(overloads: NodeOverloads, call_prefix: str, output_usd_types: Set[str]) -> List[Tuple[Node, List[str], str, str]]:
+    """Returns a call through the public API for every USD overload of an overload set that can be built
+    from value inputs alone, with the SGDataTypes of those inputs and of the output.
+    The call reads its value inputs from $0 in order. Overloads introduced by later schemas or removed ones are skipped."""
+    calls: List[Tuple[Node, List[str], str, str]] = []
+    if overloads.introduced_index() > 0 or overloads.is_removed():
+        return calls
+    generic_params, sgc_output_type, interface_only_params, primitive_params, param_names, default_value_params, num_unnamed_inputs, *_ = overloads.analyze()
+    for _, node in overloads.overloads:
+        if node.introduced_index > 0 or node.removed:
+            continue
+        if node.outputs[0].usd_type not in output_usd_types:
+            continue
+        args: List[str] = []
+        input_types: List[str] = []
+        supported = True
+        for i, input in enumerate(node.inputs):
+            sgc_type = overloads.get_param_sgc_type(i)
+            label = '' if i < num_unnamed_inputs else f'{param_names[i]}: '
+            if primitive_params[i]:
+                if default_value_params[i] is None:
+                    args.append(label + get_benchmark_primitive_literal(input, sgc_type))
+                continue
+            if input.is_enum or input.usd_type not in benchmark_value_usd_types:
+                supported = False
+                break
+            if sgc_type == 'T':
+                sgc_type = usd_type_to_sgc_type(input.usd_type)
+            args.append(f'{label}$0[{len(input_types)}] as! {sgc_type}')
+            input_types.append(usd_type_to_const_ctor(input.usd_type))
+        if not supported:
+            continue
+        output_type = usd_type_to_const_ctor(node.outputs[0].usd_type)
+        if overloads.write_func:
+            call = f'{call_prefix}{overloads.swift_name}({", ".join(args)})'
+        else:
+            call = f'{call_prefix}{overloads.swift_name}'
+        calls.append((node, input_types, output_type, call))
+    return calls
+
+def write_benchmark_operations(w: SwiftWriter, overloadss: List[NodeOverloads]) -> int:
+    """Writes a table of every operation overload that random graphs can be built from.
+    Each entry lists the USD types of the node's value inputs and output, and calls the public API."""
+    w.write_line('import ShaderGraphCoder')
+    w.write_line('')
+    w.write_line('func makeBenchmarkOperations() -> [BenchmarkOperation] {')
+    w.indent()
+    w.write_line('var ops: [BenchmarkOperation] = []')
+    num_operations = 0
+    output_usd_types = benchmark_value_usd_types - {'asset'}
+    for overloads in overloadss:
+        if not overloads.write_func:
+            continue
+        for node, input_types, output_type, call in get_operation_calls(overloads, 'ShaderGraphCoder.', output_usd_types):
+            w.write_line(f'ops.append(BenchmarkOperation(nodeType: "{node.name}", inputs: [{", ".join(input_types)}], output: {output_type}) {{ {call} }})')
+            num_operations += 1
+    w.write_line('return ops')
+    w.unindent()
+    w.write_line('}')
+    return num_operations
+
+def write_operation_tests(w: SwiftWriter, op_overloadss: List[NodeOverloads], src_overloadss: List[NodeOverloads]) -> int:
+    """Writes a test for every overload set that builds each of its USD overloads and checks which node was built.
+    An overload whose value inputs have the same types as an earlier one can never be dispatched to and is left out."""
+    w.write_line('import XCTest')
+    w.write_line('@testable import ShaderGraphCoder')
+    w.write_line('')
+    w.write_line('extension OperationTests {')
+    w.indent()
+    output_usd_types = benchmark_value_usd_types | {'string', 'token'}
+    overload_sets: List[Tuple[str, str, List[Tuple[Node, List[str], str, str]]]] = []
+    for overloads, call_prefix, name_prefix in [(x, 'ShaderGraphCoder.', '') for x in op_overloadss] + [(x, 'SGValue.', 'SGValue.') for x in src_overloadss]:
+        calls = []
+        seen_input_types: Set[str] = set()
+        for call in get_operation_calls(overloads, call_prefix, output_usd_types):
+            input_types_key = ','.join(call[1])
+            if input_types_key in seen_input_types:
+                continue
+            seen_input_types.add(input_types_key)
+            calls.append(call)
+        if len(calls) > 0:
+            test_name = ('Source' if len(name_prefix) > 0 else '') + overloads.swift_name[0].upper() + overloads.swift_name[1:]
+            overload_sets.append((name_prefix + overloads.swift_name, test_name, calls))
+    w.write_line('static let overloadSets: [(name: String, cases: () -> [OperationTestCase])] = [')
+    w.indent()
+    for name, test_name, _ in overload_sets:
+        w.write_line(f'("{name}", {test_name[0].lower() + test_name[1:]}Cases),')
+    w.unindent()
+    w.write_line(']')
+    num_cases = 0
+    for name, test_name, calls in overload_sets:
+        func_name = test_name[0].lower() + test_name[1:]
+        w.write_line('')
+        w.write_line(f'static func {func_name}Cases() -> [OperationTestCase] {{')
+        w.indent()
+        w.write_line('var cases: [OperationTestCase] = []')
+        for node, input_types, output_type, call in calls:
+            w.write_line(f'cases.append(OperationTestCase(nodeType: "{node.name}", inputs: [{", ".join(input_types)}], output: {output_type}) {{ {"_ in " if len(input_types) == 0 else ""}{call} }})')
+            num_cases += 1
+        w.write_line('return cases')
+        w.unindent()
+        w.write_line('}')
+        w.write_line(f'func test{test_name}() throws {{')
+        w.indent()
+        w.write_line(f'try check(OperationTests.{func_name}Cases())')
+        w.unindent()
+        w.write_line('}')
+    w.unindent()
+    w.write_line('}')
+    return num_cases
+
+def write_interface_only_inputs(w: SwiftWriter, catalog: SchemaCatalog) -> int:
+    """Writes the inputs of every node type that only accept constants.
+    Passes that turn constants into connections, like parameter promotion, must leave these alone."""
+    w.write_line('extension SGNode {')
+    w.indent()
+    w.write_line('static let interfaceOnlyInputs: [String: Set<String>] = [')
+    w.indent()
+    num_nodes = 0
+    for node in catalog.nodes:
+        names = [x.name for x in node.inputs if x.interface_only]
+        if len(node.outputs) == 0 or len(names) == 0:
+            continue
+        w.write_line(f'"{node.name}": [{", ".join(json.dumps(x) for x in names)}],')
+        num_nodes += 1
+    w.unindent()
+    w.write_line(']')
+    w.unindent()
+    w.write_line('}')
+    return num_nodes
+
+usd_type_components_re = re.compile(r'(\d)([a-z]?)$')
+def get_usd_type_components(usd_type: str) -> int:
+    m = usd_type_components_re.search(usd_type)
+    if m is None:
+        return 1
+    n = int(m.group(1))
+    return n * n if usd_type.startswith('matrix') else n
+
+def get_node_cost_base_name(node: Node) -> str:
+    base_name = node.base_name[3:] if node.base_name.startswith('ND_') else node.base_name
+    if base_name.startswith('realitykit_'):
+        base_name = base_name[len('realitykit_'):]
+    return base_name
+
+def write_node_costs(w: SwiftWriter, catalog: SchemaCatalog) -> int:
+    """Writes the estimated cost of every node type in the schemas that has an output, including the manual ones.
+    Texture samples count the asset inputs of nodes that read a texture, ALU weights scale with the output components."""
+    w.write_line('extension SGNodeCost {')
+    w.indent()
+    w.write_line('static let schemaCosts: [String: SGNodeCost] = [')
+    w.indent()
+    num_costs = 0
+    for node in catalog.nodes:
+        if len(node.outputs) == 0:
+            continue
+        base_name = get_node_cost_base_name(node)
+        components = max(1, sum(get_usd_type_components(o.usd_type) for o in node.outputs))
+        args = [f'aluWeight: {node_alu_weights.get(base_name, 1) * components}']
+        if not any(o.usd_type == 'asset' for o in node.outputs):
+            texture_samples = len([i for i in node.inputs if i.usd_type == 'asset'])
+            if texture_samples > 0:
+                args.append(f'textureSamples: {texture_samples}')
+        if base_name in noise_node_base_names:
+            args.append('isNoise: true')
+        if base_name in branch_node_base_names:
+            args.append('isBranch: true')
+        w.write_line(f'"{node.name}": SGNodeCost({", ".join(args)}),')
+        num_costs += 1
+    w.unindent()
+    w.write_line(']')
+    w.unindent()
+    w.write_line('}')
+    return num_costs
+
+node_type_ids: Dict[str, int] = {}
+input_name_ids: Dict[str, int] = {}
+
+def assign_name_ids(nodes: List[Node]):
+    """Gives every node type and input name in the schemas an ID that does not change between runs.
+    The IDs are the line numbers in the checked-in name table: names are never removed from it and new ones
+    are appended in sorted order, so adding or dropping a node does not renumber the others.
+    The generated operations store these IDs, and Names.g.swift maps them back to the strings."""
+    node_type_ids.clear()
+    input_name_ids.clear()
+    if os.path.exists(names_path):
+        with open(names_path, 'r') as f:
+            for line in f.read().splitlines():
+                kind, _, name = line.partition(' ')
+                ids = node_type_ids if kind == 'node' else input_name_ids
+                ids[name] = len(ids)
+    for name in sorted({x.name for x in nodes} - node_type_ids.keys()):
+        node_type_ids[name] = len(node_type_ids)
+    for name in sorted({p.name for x in nodes for p in x.inputs} - input_name_ids.keys()):
+        input_name_ids[name] = len(input_name_ids)
+
+def write_name_table():
+    lines = [f'node {x}\n' for x in sorted(node_type_ids, key=lambda x: node_type_ids[x])]
+    lines += [f'input {x}\n' for x in sorted(input_name_ids, key=lambda x: input_name_ids[x])]
+    write_file_if_changed(names_path, ''.join(lines))
+
+def write_names(w: SwiftWriter):
+    w.write_line('extension SGNode {')
+    w.indent()
+    w.write_line('static let schemaNodeTypes: [String] = [')
+    w.indent()
+    for name in sorted(node_type_ids, key=lambda x: node_type_ids[x]):
+        w.write_line(f'"{name}",')
+    w.unindent()
+    w.write_line(']')
+    w.unindent()
+    w.write_line('}')
+    w.write_line('')
+    w.write_line('extension SGNode.Input {')
+    w.indent()
+    w.write_line('static let schemaNames: [String] = [')
+    w.indent()
+    for name in sorted(input_name_ids, key=lambda x: input_name_ids[x]):
+        w.write_line(f'"{name}",')
+    w.unindent()
+    w.write_line(']')
+    w.unindent()
+    w.write_line('}')
+
+def get_half_precision_variant(node: Node, catalog: SchemaCatalog) -> Optional[Node]:
+    """Returns the node with the same base name and inputs that computes in half precision.
+    Every input and output must keep its type or change it to its half-precision type.
+    When several variants match, the one that changes the fewest inputs wins."""
+    best: Optional[Node] = None
+    best_changes = 0
+    for h in catalog.nodes_with_base_name(node.base_name):
+        if h is node or h.suffix_type_name is None or not h.suffix_type_name.startswith('_half'):
+            continue
+        if [x.name for x in h.inputs] != [x.name for x in node.inputs] or [x.name for x in h.outputs] != [x.name for x in node.outputs]:
+            continue
+        changes = 0
+        compatible = True
+        for p, hp in zip(node.inputs + node.outputs, h.inputs + h.outputs):
+            if p.usd_type == hp.usd_type:
+                continue
+            if half_precision_usd_types.get(p.usd_type) != hp.usd_type:
+                compatible = False
+                break
+            changes += 1
+        if not compatible or changes == 0 or h.outputs[0].usd_type == node.outputs[0].usd_type:
+            continue
+        if best is None or changes < best_changes or (changes == best_changes and h.name < best.name):
+            best = h
+            best_changes = changes
+    return best
+
+def get_half_precision_conversions(catalog: SchemaCatalog, from_usd_type: str, to_usd_type: str) -> Optional[List[Tuple[str, str]]]:
+    """Returns the shortest chain of at most two convert nodes between the types as (node type, output USD type) pairs."""
+    for name, out_type in catalog.converts_from(from_usd_type):
+        if out_type == to_usd_type:
+            return [(name, out_type)]
+    for name, out_type in catalog.converts_from(from_usd_type):
+        for name2, out_type2 in catalog.converts_from(out_type):
+            if out_type2 == to_usd_type:
+                return [(name, out_type), (name2, out_type2)]
+    return None
+
+def write_half_precision(w: SwiftWriter, catalog: SchemaCatalog) -> int:
+    """Writes the precision-safety table: the output range of every float node in half_precision_ranges,
+    its half-precision variant if the schemas have one, and the conversions needed at the boundaries of demoted nodes."""
+    w.write_line('extension SGHalfPrecision {')
+    w.indent()
+    w.write_line('static let schemaNodes: [String: SGHalfPrecision] = [')
+    w.indent()
+    num_nodes = 0
+    for node in catalog.nodes:
+        if len(node.outputs) != 1 or node.outputs[0].usd_type not in half_precision_usd_types:
+            continue
+        range_name = half_precision_ranges.get(get_node_cost_base_name(node))
+        if range_name is None:
+            continue
+        args = [f'range: .{range_name}']
+        h = get_half_precision_variant(node, catalog)
+        if h is not None:
+            input_types = ', '.join(f'"{x.name}": {usd_type_to_const_ctor(x.usd_type)}' for x in h.inputs)
+            args.append(f'halfNodeType: "{h.name}"')
+            args.append(f'halfInputTypes: [{input_types if len(input_types) > 0 else ":"}]')
+            args.append(f'halfOutputType: {usd_type_to_const_ctor(h.outputs[0].usd_type)}')
+        w.write_line(f'"{node.name}": SGHalfPrecision({", ".join(args)}),')
+        num_nodes += 1
+    w.unindent()
+    w.write_line(']')
+    for var_name, to_half in [('toHalfConversions', True), ('fromHalfConversions', False)]:
+        w.write_line(f'static let {var_name}: [SGDataType: [(nodeType: String, dataType: SGDataType)]] = [')
+        w.indent()
+        for float_type, half_type in sorted(half_precision_usd_types.items()):
+            chain = get_half_precision_conversions(catalog, float_type, half_type) if to_half else get_half_precision_conversions(catalog, half_type, float_type)
+            if chain is None:
+                continue
+            steps = ', '.join(f'(nodeType: "{n}", dataType: {usd_type_to_const_ctor(t)})' for n, t in chain)
+            w.write_line(f'{usd_type_to_const_ctor(float_type)}: [{steps}],')
+        w.unindent()
+        w.write_line(']')
+    w.unindent()
+    w.write_line('}')
+    return num_nodes
+
+def get_overloads_report(overloads: NodeOverloads, kind: str) -> Dict[str, object]:
+    num_params = len(overloads.first_node().inputs)
+    num_generic_params = len([i for i in range(num_params) if overloads.get_param_sgc_type(i) == 'T'])
+    num_primitive_params = len([x for x in overloads.primitive_params if x])
+    return {
+        "swift_name": overloads.swift_name,
+        "base_name": overloads.base_name,
+        "kind": kind,
+        "bytes": overloads.emitted_bytes,
+        "lines": overloads.emitted_lines,
+        "usd_overloads": len(overloads.overloads),
+        "generic_params": num_generic_params,
+        "concrete_params": num_params - num_generic_params - num_primitive_params,
+        "primitive_params": num_primitive_params,
+        "extension_types": overloads.extension_types,
+    }
+
+def print_overloads_report(reports: List[Dict[str, object]], files: Dict[str, Tuple[int, int]], top: int):
+    reports = sorted(reports, key=lambda x: x["bytes"], reverse=True)
+    print(f'{"Overload set":<32} {"Kind":<9} {"USD":>4} {"Gen":>4} {"Conc":>4} {"Prim":>4} {"Lines":>6} {"Bytes":>8}  Extensions')
+    for r in reports[:top]:
+        print(f'{r["swift_name"]:<32} {r["kind"]:<9} {r["usd_overloads"]:>4} {r["generic_params"]:>4} {r["concrete_params"]:>4} {r["primitive_params"]:>4} {r["lines"]:>6} {r["bytes"]:>8}  {", ".join(r["extension_types"])}')
+    if len(reports) > top:
+        print(f'... and {len(reports) - top} more overload sets')
+    for path, (num_bytes, num_lines) in files.items():
+        print(f'{os.path.basename(path)}: {num_lines} lines, {num_bytes} bytes')
+
+def check_budgets(reports: List[Dict[str, object]], files: Dict[str, Tuple[int, int]]) -> List[str]:
+    violations: List[str] = []
+    for r in reports:
+        if args.budget_node_bytes is not None and r["bytes"] > args.budget_node_bytes:
+            violations.append(f'{r["swift_name"]} emits {r["bytes"]} bytes (budget {args.budget_node_bytes})')
+        if args.budget_node_overloads is not None and r["usd_overloads"] > args.budget_node_overloads:
+            violations.append(f'{r["swift_name"]} has {r["usd_overloads"]} USD overloads (budget {args.budget_node_overloads})')
+    for path, (num_bytes, num_lines) in files.items():
+        if args.budget_file_bytes is not None and num_bytes > args.budget_file_bytes:
+            violations.append(f'{os.path.basename(path)} is {num_bytes} bytes (budget {args.budget_file_bytes})')
+        if args.budget_file_lines is not None and num_lines > args.budget_file_lines:
+            violations.append(f'{os.path.basename(path)} is {num_lines} lines (budget {args.budget_file_lines})')
+    return violations
+
+swift_identifier_re = re.compile(r'\b[A-Za-z_][A-Za-z0-9_]*\b')
+def find_used_swift_names(dir_paths: List[str]) -> Set[str]:
+    """Returns every identifier in the hand-written Swift sources under the directories.
+    Generated *.g.swift files are skipped, they would keep everything they declare.
+    Comments and strings are not skipped, so a name that only appears in them still counts as used."""
+    names: Set[str] = set()
+    for dir_path in dir_paths:
+        for root, _, file_names in os.walk(dir_path):
+            for file_name in file_names:
+                if not file_name.endswith('.swift') or file_name.endswith('.g.swift'):
+                    continue
+                with open(os.path.join(root, file_name), 'r', encoding='utf-8', errors='replace') as f:
+                    names.update(swift_identifier_re.findall(f.read()))
+    return names
+
+def trim_overloads(op_nodes: List[NodeOverloads], src_nodes: List[NodeOverloads]) -> Tuple[List[NodeOverloads], List[NodeOverloads], Set[str]]:
+    """Keeps the operations and sources the app or the hand-written library sources refer to by name,
+    and returns the enum types they or those sources need."""
+    used_names = find_used_swift_names(args.app_sources + [src_path])
+    op_nodes = [x for x in op_nodes if x.swift_name in used_names]
+    src_nodes = [x for x in src_nodes if x.swift_name in used_names]
+    enum_sgc_types_used = {x.gen_sgc_type for x in enums_by_gen_usd_type.values() if x.gen_sgc_type in used_names}
+    for overloads in op_nodes + src_nodes:
+        for _, node in overloads.overloads:
+            enum_sgc_types_used.update(x.enum.gen_sgc_type for x in node.inputs if x.enum is not None)
+    return op_nodes, src_nodes, enum_sgc_types_used
+
+generator_table_names = [
+    'manual_node_prefixes',
+    'param_renames',
+    'node_renames',
+    'enum_sgc_types',
+    'suffix_type_names',
+    'sgc_types_by_usd_type',
+    'sgc_datatypes_by_usd_type',
+    'primitive_types_by_usd_type',
+    'node_alu_weights',
+    'noise_node_base_names',
+    'branch_node_base_names',
+    'half_precision_ranges',
+    'half_precision_usd_types',
+]
+
+def read_generator_tables(source: str) -> Tuple[Dict[str, object], str]:
+    """Splits the source of this script into its literal tables and a dump of everything else.
+    Comparing the dumps tells a table edit, which can be applied in place, from a code edit."""
+    tables: Dict[str, object] = {}
+    code: List[str] = []
+    for stmt in ast.parse(source).body:
+        target = None
+        if isinstance(stmt, ast.Assign) and len(stmt.targets) == 1:
+            target = stmt.targets[0]
+        elif isinstance(stmt, ast.AnnAssign):
+            target = stmt.target
+        if isinstance(target, ast.Name) and target.id in generator_table_names:
+            try:
+                tables[target.id] = ast.literal_eval(stmt.value)
+                continue
+            except ValueError:
+                pass
+        code.append(ast.dump(stmt))
+    return tables, '\n'.join(code)
+
+def apply_generator_tables(tables: Dict[str, object]):
+    global suffix_type_names_set
+    globals().update(tables)
+    suffix_type_names_set = set(suffix_type_names)
+
+def generate() -> bool:
+    """Generates the outputs from the schemas and writes the ones that changed.
+    Schema reads are cached, everything derived from them is rebuilt.
+    Returns False without writing anything if a budget or the public surface check fails."""
+    enums_by_structural_type_id.clear()
+    enums_by_gen_usd_type.clear()
+    node_overloads.clear()
+    node_overloads_by_first_input_sgc_type.clear()
+    public_surface.clear()
+    node_descriptions.clear()
+    for schema in schemas:
+        node_descriptions.update(load_plist_strings(schema.plist_path))
+
+    nodes = merge_schema_nodes([load_schema_nodes(x) for x in schemas])
+    print(f'Found {len(nodes)} nodes')
+    catalog = SchemaCatalog(nodes)
+    assign_name_ids(nodes)
+    output_nodes = [x for x in nodes if should_output_node(x)]
+    output_nodes = sorted(output_nodes, key=lambda x: x.name)
+    print(f'Outputting {len(output_nodes)} nodes')
+    for node in output_nodes:
+        node.resolve_enums()
+        add_node_to_overloads(node)
+    for key, no in list(node_overloads.items()):
+        if len(no.overloads) > 1 and no.all_inputs_shared():
+            del node_overloads[key]
+            for suffix_type_name, node in no.overloads:
+                new_base_name = key + suffix_type_name
+                new_no = NodeOverloads(new_base_name, suffix_type_name, node)
+                node_overloads[new_base_name] = new_no
+    baseline_dispatch = {key: no.dispatch() for key, no in node_overloads.items()}
+    collapsed = [key for key, no in node_overloads.items() if no.collapse_to_generic()]
+    if len(collapsed) > 0:
+        print(f'Collapsed {", ".join(sorted(node_overloads[x].swift_name for x in collapsed))} to generics')
+    for key in collapsed:
+        dispatch = node_overloads[key].dispatch()
+        for types, name in baseline_dispatch[key].items():
+            if dispatch.get(types) != name:
+                print(f'Error: collapsing {node_overloads[key].swift_name} changed the node built for ({", ".join(types)}) from {name} to {dispatch.get(types)}')
+                return False
+    print(f'Outputting {len(node_overloads)} overloads')
+    src_nodes: List[NodeOverloads] = []
+    op_nodes: List[NodeOverloads] = []
+    for no in (x[1] for x in node_overloads.items()):
+        if no.is_src():
+            src_nodes.append(no)
+        else:
+            op_nodes.append(no)
+    src_nodes = sorted(src_nodes, key=lambda x: x.swift_name)
+    op_nodes = sorted(op_nodes, key=lambda x: x.swift_name)
+    used_enum_sgc_types: Optional[Set[str]] = None
+    is_trimmed = len(args.app_sources) > 0
+    if is_trimmed:
+        op_nodes, src_nodes, used_enum_sgc_types = trim_overloads(op_nodes, src_nodes)
+        print(f'Trimmed to the overloads used in {", ".join(args.app_sources)}')
+    print(f'Outputting {len(op_nodes)} operations')
+    print(f'Outputting {len(src_nodes)} sources')
+
+    ops_writer = SwiftWriter()
+    ops_readme_writer = CodeWriter()
+    write_enums(ops_writer, used_enum_sgc_types)
+    for node in op_nodes:
+        write_node_overloads(node, True, False, ops_writer)
+        write_node_overload_table_entry(node, ops_readme_writer)
+    group_by_first_input_sgc_type(op_nodes)
+    for sgc_type in ["SGValue", "SGNumeric", "SGScalar", "SGSIMD", "SGColor", "SGVector", "SGMatrix", "SGTexture", "SGToken"]:
+        if sgc_type in node_overloads_by_first_input_sgc_type:
+            write_extension_node_overloads(ops_writer, sgc_type, node_overloads_by_first_input_sgc_type[sgc_type])
+    ops_readme_writer.write_line('')
+
+    srcs_writer = SwiftWriter()
+    srcs_readme_writer = CodeWriter()
+    srcs_writer.write_line('public extension SGValue {')
+    srcs_writer.indent()
+    for node in src_nodes:
+        write_node_overloads(node, False, True, srcs_writer)
+        write_node_overload_table_entry(node, srcs_readme_writer, prefix_name="SGValue.")
+    srcs_writer.unindent()
+    srcs_writer.write_line('}')
+    srcs_readme_writer.write_line('')
+
+    # The operations store name IDs, so the names are written next to them on every run
+    names_writer = SwiftWriter()
+    write_names(names_writer)
+    print(f'Outputting {len(node_type_ids)} node type and {len(input_name_ids)} input name IDs')
+
+    # A trimmed build only replaces the operations, sources and names, the other outputs describe the whole schema
+    # and the tests and benchmark use every operation
+    other_outputs: List[Tuple[SwiftWriter, str]] = []
+    if not is_trimmed:
+        benchmark_writer = SwiftWriter()
+        num_benchmark_operations = write_benchmark_operations(benchmark_writer, op_nodes)
+        print(f'Outputting {num_benchmark_operations} benchmark operations')
+
+        tests_writer = SwiftWriter()
+        num_test_cases = write_operation_tests(tests_writer, op_nodes, src_nodes)
+        print(f'Outputting {num_test_cases} operation test cases')
+
+        costs_writer = SwiftWriter()
+        num_costs = write_node_costs(costs_writer, catalog)
+        print(f'Outputting {num_costs} node costs')
+
+        inputs_writer = SwiftWriter()
+        num_interface_only_nodes = write_interface_only_inputs(inputs_writer, catalog)
+        print(f'Outputting {num_interface_only_nodes} nodes with interface-only inputs')
+
+        precision_writer = SwiftWriter()
+        num_precision_nodes = write_half_precision(precision_writer, catalog)
+        print(f'Outputting {num_precision_nodes} nodes in the precision-safety table')
+
+        other_outputs = [
+            (benchmark_writer, benchmark_out_path),
+            (tests_writer, tests_out_path),
+            (costs_writer, costs_out_path),
+            (inputs_writer, inputs_out_path),
+            (precision_writer, precision_out_path),
+        ]
+
+    reports = [get_overloads_report(x, "operation") for x in op_nodes] + [get_overloads_report(x, "source") for x in src_nodes]
+    file_sizes = {ops_out_path: ops_writer.size(), srcs_out_path: srcs_writer.size()}
+    if args.report_top > 0:
+        print_overloads_report(reports, file_sizes, args.report_top)
+    if args.report is not None:
+        with open(args.report, 'w') as f:
+            json.dump({
+                "files": [{"path": os.path.relpath(k, repo_path), "bytes": v[0], "lines": v[1]} for k, v in file_sizes.items()],
+                "overload_sets": reports,
+            }, f, indent=2)
+        print(f'Wrote report to {args.report}')
+    budget_violations = check_budgets(reports, file_sizes)
+    # A trimmed build drops public declarations on purpose
+    if not is_trimmed and not args.update_surface and os.path.exists(surface_path):
+        budget_violations += check_public_surface(surface_path)
+    if len(budget_violations) > 0:
+        for v in budget_violations:
+            print(f'Error: {v}')
+        print(f'{len(budget_violations)} budget or public surface violations, not writing outputs')
+        return False
+
+    ops_writer.output_to_file(ops_out_path)
+    srcs_writer.output_to_file(srcs_out_path)
+    names_writer.output_to_file(names_out_path)
+    write_name_table()
+    for w, path in other_outputs:
+        w.output_to_file(path)
+    if is_trimmed:
+        return True
+    ops_readme_writer.replace_in_file(readme_path, r"\| \`abs.*?\n\n")
+    srcs_readme_writer.replace_in_file(readme_path, r"\| \`SGValue\.bitangent.*?\n\n")
+    if args.update_surface or not os.path.exists(surface_path):
+        if write_file_if_changed(surface_path, ''.join(x + '\n' for x in sorted(public_surface))):
+            print(f'Wrote {len(public_surface)} public declarations to {surface_path}')
+    return True
+
+def watch(poll_interval: float):
+    """Regenerates whenever a schema, a description plist or this script changes.
+    Edits to the tables above are applied in place; other edits to this script or to the crate reader restart it."""
+    script_path = os.path.abspath(__file__)
+    usdc_path = os.path.abspath(usdc.__file__)
+    with open(script_path, 'r') as f:
+        _, code = read_generator_tables(f.read())
+    watched_paths = [script_path, usdc_path] + [x.usd_path for x in schemas] + [x.plist_path for x in schemas]
+    mtimes = {x: os.path.getmtime(x) for x in watched_paths}
+    print(f'Watching {len(watched_paths)} files for changes, press Ctrl+C to stop')
+    while True:
+        time.sleep(poll_interval)
+        changed_paths = [x for x in watched_paths if os.path.exists(x) and os.path.getmtime(x) != mtimes[x]]
+        if len(changed_paths) == 0:
+            continue
+        for x in changed_paths:
+            mtimes[x] = os.path.getmtime(x)
+        start_time = time.perf_counter()
+        if usdc_path in changed_paths:
+            print(f'{os.path.basename(usdc_path)} changed, restarting')
+            os.execv(sys.executable, [sys.executable] + sys.argv)
+        if script_path in changed_paths:
+            with open(script_path, 'r') as f:
+                source = f.read()
+            try:
+                tables, new_code = read_generator_tables(source)
+            except SyntaxError as e:
+                print(f'Error: {e}')
+                continue
+            if new_code != code:
+                print(f'{os.path.basename(script_path)} changed, restarting')
+                os.execv(sys.executable, [sys.executable] + sys.argv)
+            apply_generator_tables(tables)
+        try:
+            succeeded = generate()
+        except Exception as e:
+            print(f'Error: {e}')
+            continue
+        if not succeeded:
+            print(f'Failed to regenerate after changes to {", ".join(os.path.basename(x) for x in changed_paths)}, waiting for more changes')
+            continue
+        print(f'Regenerated in {time.perf_counter() - start_time:.2f}s after changes to {", ".join(os.path.basename(x) for x in changed_paths)}')
+
 tools_path = os.path.dirname(os.path.abspath(__file__))
 repo_path = os.path.dirname(tools_path)
-schemas_path = os.path.join(tools_path, 'schemas.usda')
-plist_path = os.path.join(tools_path, 'schemas.plist') 
+schemas_path = os.path.join(tools_path, 'schemas.usd')
+plist_path = os.path.join(tools_path, 'schemas.plist')
+surface_path = os.path.join(tools_path, 'surface.txt')
+names_path = os.path.join(tools_path, 'names.txt')
 src_path = os.path.abspath(os.path.join(tools_path, '..', 'Sources', 'ShaderGraphCoder'))
-node_descriptions = load_plist_strings(plist_path)
 
-ops_out_path = os.path.join(src_path, 'Operations.g.swift')
-srcs_out_path = os.path.join(src_path, 'Sources.g.swift')
+arg_parser = argparse.ArgumentParser(description='Generates the ShaderGraphCoder operations and sources from the RealityKit node schemas.')
+arg_parser.add_argument('--schema', action='append', default=[], metavar='USD,PLIST[,AVAILABILITY]',
+                        help='A schema and its descriptions, oldest release first. '
+                             'Every schema after the first needs a Swift availability spec, '
+                             'e.g. "schemas2.usd,schemas2.plist,visionOS 2.0, iOS 18.0, macOS 15.0". '
+                             'Defaults to the schema in Tools.')
+arg_parser.add_argument('--report', metavar='JSON', help='Write a size and overload report for every overload set to this file.')
+arg_parser.add_argument('--report-top', type=int, default=0, metavar='N', help='Print the N largest overload sets as a summary table.')
+arg_parser.add_argument('--budget-node-bytes', type=int, metavar='BYTES', help='Fail if an overload set emits more than this many bytes.')
+arg_parser.add_argument('--budget-node-overloads', type=int, metavar='COUNT', help='Fail if an overload set has more than this many USD overloads.')
+arg_parser.add_argument('--budget-file-bytes', type=int, metavar='BYTES', help='Fail if a generated file is larger than this many bytes.')
+arg_parser.add_argument('--budget-file-lines', type=int, metavar='LINES', help='Fail if a generated file has more than this many lines.')
+arg_parser.add_argument('--update-surface', action='store_true', help=f'Accept changes to the public call surface and rewrite {os.path.basename(surface_path)}.')
+arg_parser.add_argument('--backend', choices=sorted(schema_readers.keys()), default='usdc',
+                        help='How to read the schemas. "usdc" decodes the crate files directly, "pxr" uses OpenUSD. Defaults to usdc.')
+arg_parser.add_argument('--validate-backend', action='store_true', help='Also read every schema with the other backend and fail if they differ.')
+arg_parser.add_argument('--instrument', action='store_true',
+                        help='Record calls, errors and signposts in every generated operation and source. '
+                             'The instrumentation is only compiled when SHADERGRAPHCODER_INSTRUMENTATION is defined.')
+arg_parser.add_argument('--app-sources', action='append', default=[], metavar='DIR',
+                        help='Only generate the operations and sources that the Swift files in this directory refer to by name. '
+                             'Can be given more than once. Only Operations.g.swift and Sources.g.swift are written, '
+                             'so the tests and benchmark of a trimmed package do not build.')
+arg_parser.add_argument('--out-dir', metavar='DIR', help='Where to write Operations.g.swift and Sources.g.swift, created if needed. Defaults to Sources/ShaderGraphCoder.')
+arg_parser.add_argument('--watch', action='store_true', help='Keep running and regenerate when a schema, a description plist or the tables in this script change.')
+arg_parser.add_argument('--watch-interval', type=float, default=0.25, metavar='SECONDS', help='How often to check for changes in watch mode.')
+args = arg_parser.parse_args()
+if len(args.schema) == 0:
+    args.schema = [f'{schemas_path},{plist_path}']
+schemas = [parse_schema_arg(i, x) for i, x in enumerate(args.schema)]
+
+node_descriptions: Dict[str, str] = {}
+
+out_path = args.out_dir if args.out_dir is not None else src_path
+os.makedirs(out_path, exist_ok=True)
+ops_out_path = os.path.join(out_path, 'Operations.g.swift')
+srcs_out_path = os.path.join(out_path, 'Sources.g.swift')
+costs_out_path = os.path.join(src_path, 'Costs.g.swift')
+inputs_out_path = os.path.join(src_path, 'Inputs.g.swift')
+precision_out_path = os.path.join(src_path, 'Precision.g.swift')
+names_out_path = os.path.join(out_path, 'Names.g.swift')
 readme_path = os.path.join(repo_path, 'README.md')
-
-stage = Usd.Stage.Open(schemas_path)
-all_prims = [x for x in stage.Traverse()]  
-
-test_prim = [x for x in all_prims if x.GetName() == 'ND_realitykit_image_half'][0]
-dir(test_prim.GetAttribute('inputs:border_color').GetAllMetadata()["allowedTokens"])
-list(test_prim.GetAttribute('inputs:border_color').GetAllMetadata()["allowedTokens"])
-
-prop_is_supported(test_prim.GetAttribute('inputs:fps'))
-
-nodes = [Node(x) for x in all_prims if is_node(x) and prim_is_supported(x)]
-print(f'Found {len(nodes)} nodes')
-output_nodes = [x for x in nodes if should_output_node(x)]
-output_nodes = sorted(output_nodes, key=lambda x: x.name)
-print(f'Outputting {len(output_nodes)} nodes')
-for node in output_nodes:
-    node.resolve_enums()
-    add_node_to_overloads(node)
-for key, no in list(node_overloads.items()):
-    if len(no.overloads) > 1 and no.all_inputs_shared():
-        del node_overloads[key]
-        for suffix_type_name, node in no.overloads:
-            new_base_name = key + suffix_type_name
-            new_no = NodeOverloads(new_base_name, suffix_type_name, node)
-            node_overloads[new_base_name] = new_no
-print(f'Outputting {len(node_overloads)} overloads')
-src_nodes: List[NodeOverloads] = []
-op_nodes: List[NodeOverloads] = []
-for no in (x[1] for x in node_overloads.items()):
-    if no.is_src():
-        src_nodes.append(no)
-    else:
-        op_nodes.append(no)
-src_nodes = sorted(src_nodes, key=lambda x: x.swift_name)
-op_nodes = sorted(op_nodes, key=lambda x: x.swift_name)
-print(f'Outputting {len(op_nodes)} operations')
-print(f'Outputting {len(src_nodes)} sources')
-
-ops_writer = SwiftWriter()
-ops_readme_writer = CodeWriter()
-write_enums(ops_writer)
-for node in op_nodes:
-    write_node_overloads(node, True, False, ops_writer)
-    write_node_overload_table_entry(node, ops_readme_writer)
-group_by_first_input_sgc_type(op_nodes)
-for sgc_type in ["SGValue", "SGNumeric", "SGScalar", "SGSIMD", "SGColor", "SGVector", "SGMatrix", "SGTexture", "SGToken"]:
-    if sgc_type in node_overloads_by_first_input_sgc_type:
-        write_extension_node_overloads(ops_writer, sgc_type, node_overloads_by_first_input_sgc_type[sgc_type])
-ops_writer.output_to_file(ops_out_path)
-ops_readme_writer.write_line('')
-ops_readme_writer.replace_in_file(readme_path, r"\| \`abs.*?\n\n")
-
-srcs_writer = SwiftWriter()
-srcs_readme_writer = CodeWriter()
-srcs_writer.write_line('public extension SGValue {')
-srcs_writer.indent()
-for node in src_nodes:
-    write_node_overloads(node, False, True, srcs_writer)
-    write_node_overload_table_entry(node, srcs_readme_writer, prefix_name="SGValue.")
-srcs_writer.unindent()
-srcs_writer.write_line('}')
-srcs_writer.output_to_file(srcs_out_path)
-srcs_readme_writer.write_line('')
-srcs_readme_writer.replace_in_file(readme_path, r"\| \`SGValue\.bitangent.*?\n\n")
-
-print('Done')
+benchmark_out_path = os.path.join(repo_path, 'Sources', 'ShaderGraphCoderBenchmark', 'Operations.g.swift')
+tests_out_path = os.path.join(repo_path, 'Tests', 'ShaderGraphCoderOperationTests', 'OperationTests.g.swift')
+
+try:
+    succeeded = generate()
+except ValueError as e:
+    print(f'Error: {e}')
+    succeeded = False
+if succeeded:
+    print('Done')
+elif not args.watch:
+    sys.exit(1)
+if args.watch:
+    try:
+        watch(args.watch_interval)
+    except KeyboardInterrupt:
+        pass
@@ -0,0 +1,510 @@
+"""A minimal reader for binary USD crate (.usdc) files.
+
+opgen.py only needs the root prims of the node schema, their attributes and
+a handful of metadata fields. This module memory maps the crate and decodes
+exactly that without the OpenUSD (pxr) stack. Field values are decoded lazily
+on first access, so unsupported value types only fail when they are asked for.
+
+Values are returned as plain Python objects. Vectors and matrices are tuples
+that print the way Gf types do, e.g. "(0.5, 0.5, 1)", so generated code does
+not depend on which reader produced them.
+"""
+
+import mmap
+import struct
+from decimal import Decimal
+from typing import Dict, Iterator, List, Optional, Tuple
+
+SPEC_TYPE_ATTRIBUTE = 1
+SPEC_TYPE_PRIM = 6
+SPEC_TYPE_PSEUDO_ROOT = 7
+
+SPECIFIER_DEF = 0
+
+TYPE_BOOL = 1
+TYPE_UCHAR = 2
+TYPE_INT = 3
+TYPE_UINT = 4
+TYPE_INT64 = 5
+TYPE_UINT64 = 6
+TYPE_HALF = 7
+TYPE_FLOAT = 8
+TYPE_DOUBLE = 9
+TYPE_STRING = 10
+TYPE_TOKEN = 11
+TYPE_ASSET_PATH = 12
+TYPE_MATRIX2D = 13
+TYPE_MATRIX3D = 14
+TYPE_MATRIX4D = 15
+TYPE_DICTIONARY = 31
+TYPE_TOKEN_VECTOR = 41
+TYPE_SPECIFIER = 42
+TYPE_PERMISSION = 43
+TYPE_VARIABILITY = 44
+TYPE_STRING_VECTOR = 50
+TYPE_VALUE_BLOCK = 51
+
+# Scalar types: (struct format, inline struct format).
+scalar_formats: Dict[int, Tuple[str, str]] = {
+    TYPE_BOOL: ('?', '?'),
+    TYPE_UCHAR: ('B', 'B'),
+    TYPE_INT: ('i', 'i'),
+    TYPE_UINT: ('I', 'I'),
+    TYPE_INT64: ('q', 'q'),
+    TYPE_UINT64: ('Q', 'Q'),
+    TYPE_HALF: ('e', 'e'),
+    TYPE_FLOAT: ('f', 'f'),
+    TYPE_DOUBLE: ('d', 'f'),
+    TYPE_SPECIFIER: ('i', 'i'),
+    TYPE_PERMISSION: ('i', 'i'),
+    TYPE_VARIABILITY: ('i', 'i'),
+}
+
+# Vector types: (component struct format, dimension).
+vector_formats: Dict[int, Tuple[str, int]] = {
+    19: ('d', 2), 20: ('f', 2), 21: ('e', 2), 22: ('i', 2),
+    23: ('d', 3), 24: ('f', 3), 25: ('e', 3), 26: ('i', 3),
+    27: ('d', 4), 28: ('f', 4), 29: ('e', 4), 30: ('i', 4),
+}
+
+matrix_dimensions: Dict[int, int] = {
+    TYPE_MATRIX2D: 2,
+    TYPE_MATRIX3D: 3,
+    TYPE_MATRIX4D: 4,
+}
+
+class CrateError(Exception):
+    pass
+
+def format_shortest(value: float, single: bool) -> str:
+    """Formats a float with the fewest digits that round trip, like Tf does for Gf values."""
+    if value == 0:
+        return '-0' if str(value).startswith('-') else '0'
+    if single:
+        digits = None
+        for precision in range(1, 10):
+            s = f'{value:.{precision - 1}e}'
+            if struct.unpack('<f', struct.pack('<f', float(s)))[0] == value:
+                digits = s
+                break
+        assert digits is not None
+    else:
+        digits = repr(value)
+    d = Decimal(digits).normalize()
+    exponent = d.adjusted()
+    if exponent < -6 or exponent >= 21:
+        return f'{d:e}'.replace('E', 'e')
+    return f'{d:f}'
+
+class GfVec(tuple):
+    """A vector value that prints like the corresponding Gf type."""
+    single = True
+    def __str__(self):
+        return '(' + ', '.join(format_gf_component(x, self.single) for x in self) + ')'
+    __repr__ = __str__
+
+class GfVecd(GfVec):
+    single = False
+
+class GfMatrix(tuple):
+    """A matrix value (a tuple of GfVecd rows) that prints like GfMatrixNd."""
+    def __str__(self):
+        return '( ' + ', '.join(str(x) for x in self) + ' )'
+    __repr__ = __str__
+
+class AssetPath(str):
+    def __str__(self):
+        return f'@{str.__str__(self)}@'
+    __repr__ = __str__
+
+def format_gf_component(value, single: bool) -> str:
+    if isinstance(value, int):
+        return str(value)
+    return format_shortest(value, single)
+
+def lz4_decompress_block(src: bytes) -> bytes:
+    dst = bytearray()
+    i = 0
+    n = len(src)
+    while i < n:
+        token = src[i]
+        i += 1
+        literal_length = token >> 4
+        if literal_length == 15:
+            while True:
+                b = src[i]
+                i += 1
+                literal_length += b
+                if b != 255:
+                    break
+        dst += src[i:i + literal_length]
+        i += literal_length
+        if i >= n:
+            break
+        offset = src[i] | (src[i + 1] << 8)
+        i += 2
+        match_length = token & 15
+        if match_length == 15:
+            while True:
+                b = src[i]
+                i += 1
+                match_length += b
+                if b != 255:
+                    break
+        match_length += 4
+        start = len(dst) - offset
+        if offset >= match_length:
+            dst += dst[start:start + match_length]
+        else:
+            pattern = dst[start:]
+            dst += (pattern * (match_length // offset + 1))[:match_length]
+    return bytes(dst)
+
+def fast_decompress(src: bytes, max_size: int) -> bytes:
+    """Decodes a TfFastCompression buffer: a chunk count followed by LZ4 blocks.
+    A count of zero means the rest of the buffer is a single block."""
+    num_chunks = src[0]
+    if num_chunks == 0:
+        out = lz4_decompress_block(src[1:])
+    else:
+        chunks = []
+        i = 1
+        for _ in range(num_chunks):
+            chunk_size = struct.unpack_from('<i', src, i)[0]
+            i += 4
+            chunks.append(lz4_decompress_block(src[i:i + chunk_size]))
+            i += chunk_size
+        out = b''.join(chunks)
+    if len(out) > max_size:
+        raise CrateError(f'Decompressed {len(out)} bytes, expected at most {max_size}')
+    return out
+
+def decode_integers(src: bytes, num_ints: int, wide: bool) -> List[int]:
+    """Decodes Sdf integer compression: a common delta, 2-bit codes, then the other deltas."""
+    common_format, small, medium, large = ('<q', 'h', 'i', 'q') if wide else ('<i', 'b', 'h', 'i')
+    common_value = struct.unpack_from(common_format, src, 0)[0]
+    codes_offset = struct.calcsize(common_format)
+    num_code_bytes = (num_ints * 2 + 7) // 8
+    offset = codes_offset + num_code_bytes
+    sizes = {1: (small, struct.calcsize(small)), 2: (medium, struct.calcsize(medium)), 3: (large, struct.calcsize(large))}
+    result: List[int] = []
+    prev = 0
+    for i in range(num_ints):
+        code = (src[codes_offset + i // 4] >> (2 * (i % 4))) & 3
+        if code == 0:
+            prev += common_value
+        else:
+            fmt, size = sizes[code]
+            prev += struct.unpack_from('<' + fmt, src, offset)[0]
+            offset += size
+        result.append(prev)
+    return result
+
+class Spec():
+    """One spec of the crate: a path, its spec type and its fields."""
+    __slots__ = ('crate', 'path', 'spec_type', 'reps')
+    def __init__(self, crate: 'CrateFile', path: str, spec_type: int, reps: Dict[str, int]):
+        self.crate = crate
+        self.path = path
+        self.spec_type = spec_type
+        self.reps = reps
+
+    def __str__(self):
+        return self.path
+
+    @property
+    def name(self) -> str:
+        return self.path.rsplit('.', 1)[-1] if self.spec_type == SPEC_TYPE_ATTRIBUTE else self.path.rsplit('/', 1)[-1]
+
+    def field_names(self) -> List[str]:
+        return list(self.reps.keys())
+
+    def has(self, field_name: str) -> bool:
+        return field_name in self.reps
+
+    def get(self, field_name: str, default=None):
+        if field_name not in self.reps:
+            return default
+        return self.crate.unpack(self.reps[field_name])
+
+    def children(self) -> List['Spec']:
+        return [self.crate.specs_by_path[self.child_path(x)] for x in self.get('primChildren', [])]
+
+    def properties(self) -> List['Spec']:
+        return [self.crate.specs_by_path[f'{self.path}.{x}'] for x in self.get('properties', [])]
+
+    def child_path(self, name: str) -> str:
+        return f'/{name}' if self.path == '/' else f'{self.path}/{name}'
+
+class CrateFile():
+    """A memory mapped USD crate file.
+    Tokens, strings, paths, field sets and specs are read up front since
+    every lookup needs them. Values are unpacked when a field is read."""
+    def __init__(self, path: str):
+        self.file_path = path
+        self.file = open(path, 'rb')
+        self.data = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+        if self.data[:8] != b'PXR-USDC':
+            raise CrateError(f'{path} is not a USD crate file')
+        self.version = tuple(self.data[8:11])
+        if self.version < (0, 4, 0):
+            raise CrateError(f'{path} has crate version {".".join(str(x) for x in self.version)}, 0.4.0 or later is needed')
+        toc_offset = struct.unpack_from('<q', self.data, 16)[0]
+        num_sections = struct.unpack_from('<Q', self.data, toc_offset)[0]
+        self.sections: Dict[str, Tuple[int, int]] = {}
+        for i in range(num_sections):
+            name, start, size = struct.unpack_from('<16sqq', self.data, toc_offset + 8 + i * 32)
+            self.sections[name.rstrip(b'\0').decode('ascii')] = (start, size)
+        self.tokens = self.read_tokens()
+        self.strings = self.read_strings()
+        self.fields = self.read_fields()
+        self.field_sets = self.read_field_sets()
+        self.paths = self.read_paths()
+        self.specs_by_path: Dict[str, Spec] = {}
+        for spec in self.read_specs():
+            self.specs_by_path[spec.path] = spec
+
+    def close(self):
+        self.data.close()
+        self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def section_offset(self, name: str) -> int:
+        if name not in self.sections:
+            raise CrateError(f'{self.file_path} has no {name} section')
+        return self.sections[name][0]
+
+    def read_u64(self, offset: int) -> int:
+        return struct.unpack_from('<Q', self.data, offset)[0]
+
+    def read_compressed_ints(self, offset: int, num_ints: int, wide: bool = False) -> Tuple[List[int], int]:
+        compressed_size = self.read_u64(offset)
+        offset += 8
+        if num_ints == 0:
+            return [], offset + compressed_size
+        int_size = 8 if wide else 4
+        working_size = int_size + (num_ints * 2 + 7) // 8 + num_ints * int_size
+        # The exact encoded size is not stored, only an upper bound is known.
+        buffer = fast_decompress(self.data[offset:offset + compressed_size], working_size)
+        return decode_integers(buffer, num_ints, wide), offset + compressed_size
+
+    def read_tokens(self) -> List[str]:
+        offset = self.section_offset('TOKENS')
+        num_tokens, uncompressed_size, compressed_size = struct.unpack_from('<QQQ', self.data, offset)
+        offset += 24
+        buffer = fast_decompress(self.data[offset:offset + compressed_size], uncompressed_size)
+        if len(buffer) != uncompressed_size:
+            raise CrateError(f'Expected {uncompressed_size} bytes of tokens but got {len(buffer)}')
+        tokens = [x.decode('utf-8') for x in buffer.split(b'\0')[:num_tokens]]
+        if len(tokens) != num_tokens:
+            raise CrateError(f'Expected {num_tokens} tokens but found {len(tokens)}')
+        return tokens
+
+    def read_strings(self) -> List[str]:
+        offset = self.section_offset('STRINGS')
+        count = self.read_u64(offset)
+        indexes = struct.unpack_from(f'<{count}I', self.data, offset + 8)
+        return [self.tokens[x] for x in indexes]
+
+    def read_fields(self) -> List[Tuple[str, int]]:
+        offset = self.section_offset('FIELDS')
+        num_fields = self.read_u64(offset)
+        token_indexes, offset = self.read_compressed_ints(offset + 8, num_fields)
+        reps_size = self.read_u64(offset)
+        offset += 8
+        reps_buffer = fast_decompress(self.data[offset:offset + reps_size], num_fields * 8)
+        reps = struct.unpack(f'<{num_fields}Q', reps_buffer)
+        return [(self.tokens[t], r) for t, r in zip(token_indexes, reps)]
+
+    def read_field_sets(self) -> List[int]:
+        offset = self.section_offset('FIELDSETS')
+        num_field_sets = self.read_u64(offset)
+        return self.read_compressed_ints(offset + 8, num_field_sets)[0]
+
+    def read_paths(self) -> List[str]:
+        offset = self.section_offset('PATHS')
+        num_paths = self.read_u64(offset)
+        num_encoded_paths = self.read_u64(offset + 8)
+        offset += 16
+        path_indexes, offset = self.read_compressed_ints(offset, num_encoded_paths)
+        element_token_indexes, offset = self.read_compressed_ints(offset, num_encoded_paths)
+        jumps, offset = self.read_compressed_ints(offset, num_encoded_paths)
+        paths: List[str] = [''] * num_paths
+        # Each entry is (index, parent path); a jump > 0 means a sibling follows at index + jump.
+        stack: List[Tuple[int, Optional[str]]] = [(0, None)]
+        while len(stack) > 0:
+            index, parent = stack.pop()
+            while True:
+                if parent is None:
+                    path = '/'
+                else:
+                    token_index = element_token_indexes[index]
+                    name = self.tokens[abs(token_index)]
+                    if token_index < 0:
+                        path = f'{parent}.{name}'
+                    else:
+                        path = f'/{name}' if parent == '/' else f'{parent}/{name}'
+                paths[path_indexes[index]] = path
+                jump = jumps[index]
+                has_child = jump > 0 or jump == -1
+                has_sibling = jump >= 0
+                if has_child:
+                    if has_sibling:
+                        stack.append((index + jump, parent))
+                    parent = path
+                elif not has_sibling:
+                    break
+                index += 1
+        return paths
+
+    def read_specs(self) -> Iterator[Spec]:
+        offset = self.section_offset('SPECS')
+        num_specs = self.read_u64(offset)
+        path_indexes, offset = self.read_compressed_ints(offset + 8, num_specs)
+        field_set_indexes, offset = self.read_compressed_ints(offset, num_specs)
+        spec_types, offset = self.read_compressed_ints(offset, num_specs)
+        for path_index, field_set_index, spec_type in zip(path_indexes, field_set_indexes, spec_types):
+            reps: Dict[str, int] = {}
+            i = field_set_index
+            # Field sets are runs of field indexes terminated by ~0, which decodes as -1.
+            while self.field_sets[i] != -1:
+                name, rep = self.fields[self.field_sets[i]]
+                reps[name] = rep
+                i += 1
+            yield Spec(self, self.paths[path_index], spec_type, reps)
+
+    def pseudo_root(self) -> Spec:
+        return self.specs_by_path['/']
+
+    def root_prims(self) -> List[Spec]:
+        """The root prims in authored order, like the children of the stage's pseudo-root."""
+        return self.pseudo_root().children()
+
+    def unpack(self, rep: int):
+        is_array = (rep >> 63) & 1 == 1
+        is_inlined = (rep >> 62) & 1 == 1
+        is_compressed = (rep >> 61) & 1 == 1
+        type_id = (rep >> 48) & 0xFF
+        payload = rep & ((1 << 48) - 1)
+        if type_id == TYPE_VALUE_BLOCK:
+            return None
+        if is_array:
+            return self.unpack_array(type_id, payload, is_compressed)
+        if is_inlined:
+            return self.unpack_inlined(type_id, payload)
+        return self.unpack_at(type_id, payload)
+
+    def unpack_inlined(self, type_id: int, payload: int):
+        raw = struct.pack('<I', payload & 0xFFFFFFFF)
+        if type_id == TYPE_TOKEN:
+            return self.tokens[payload]
+        if type_id == TYPE_STRING:
+            return self.strings[payload]
+        if type_id == TYPE_ASSET_PATH:
+            return AssetPath(self.tokens[payload])
+        if type_id in scalar_formats:
+            fmt = scalar_formats[type_id][1]
+            return struct.unpack_from('<' + fmt, raw)[0]
+        if type_id in vector_formats:
+            fmt, dim = vector_formats[type_id]
+            if struct.calcsize(f'<{dim}{fmt}') <= 4:
+                # Types that fit in 32 bits (GfVec2h) are stored as is.
+                return GfVec(struct.unpack_from(f'<{dim}{fmt}', raw))
+            # Larger vectors are only inlined when every component fits in an int8.
+            values = struct.unpack_from(f'<{dim}b', raw)
+            if fmt == 'i':
+                return GfVec(values)
+            vec_type = GfVecd if fmt == 'd' else GfVec
+            return vec_type(float(x) for x in values)
+        if type_id in matrix_dimensions:
+            dim = matrix_dimensions[type_id]
+            diagonal = struct.unpack_from(f'<{dim}b', raw)
+            return GfMatrix(GfVecd(float(diagonal[r]) if r == c else 0.0 for c in range(dim)) for r in range(dim))
+        if type_id == TYPE_DICTIONARY:
+            return {}
+        raise CrateError(f'Unsupported inlined value type {type_id}')
+
+    def unpack_at(self, type_id: int, offset: int):
+        if type_id in scalar_formats:
+            return struct.unpack_from('<' + scalar_formats[type_id][0], self.data, offset)[0]
+        if type_id in vector_formats:
+            fmt, dim = vector_formats[type_id]
+            values = struct.unpack_from(f'<{dim}{fmt}', self.data, offset)
+            return GfVecd(values) if fmt == 'd' else GfVec(values)
+        if type_id in matrix_dimensions:
+            dim = matrix_dimensions[type_id]
+            values = struct.unpack_from(f'<{dim * dim}d', self.data, offset)
+            return GfMatrix(GfVecd(values[r * dim:(r + 1) * dim]) for r in range(dim))
+        if type_id == TYPE_TOKEN_VECTOR:
+            count = self.read_u64(offset)
+            return [self.tokens[x] for x in struct.unpack_from(f'<{count}I', self.data, offset + 8)]
+        if type_id == TYPE_STRING_VECTOR:
+            count = self.read_u64(offset)
+            return [self.strings[x] for x in struct.unpack_from(f'<{count}I', self.data, offset + 8)]
+        if type_id == TYPE_DICTIONARY:
+            return self.read_dictionary(offset)
+        raise CrateError(f'Unsupported value type {type_id}')
+
+    def read_dictionary(self, offset: int) -> Dict[str, object]:
+        count = self.read_u64(offset)
+        offset += 8
+        result: Dict[str, object] = {}
+        for _ in range(count):
+            key = self.strings[struct.unpack_from('<I', self.data, offset)[0]]
+            offset += 4
+            # Each value is a relative offset to its ValueRep. Out of line data such as
+            # nested dictionaries is written before the rep, the next key follows it.
+            rep_offset = offset + struct.unpack_from('<q', self.data, offset)[0]
+            result[key] = self.unpack(self.read_u64(rep_offset))
+            offset = rep_offset + 8
+        return result
+
+    def unpack_array(self, type_id: int, offset: int, is_compressed: bool) -> list:
+        if offset == 0:
+            return []
+        if self.version < (0, 7, 0):
+            count = struct.unpack_from('<I', self.data, offset)[0]
+            offset += 4
+        else:
+            count = self.read_u64(offset)
+            offset += 8
+        if type_id in (TYPE_TOKEN, TYPE_STRING, TYPE_ASSET_PATH):
+            indexes = struct.unpack_from(f'<{count}I', self.data, offset)
+            if type_id == TYPE_STRING:
+                return [self.strings[x] for x in indexes]
+            if type_id == TYPE_ASSET_PATH:
+                return [AssetPath(self.tokens[x]) for x in indexes]
+            return [self.tokens[x] for x in indexes]
+        if is_compressed:
+            return self.unpack_compressed_array(type_id, offset, count)
+        if type_id in scalar_formats:
+            fmt = scalar_formats[type_id][0]
+            return list(struct.unpack_from(f'<{count}{fmt}', self.data, offset))
+        if type_id in vector_formats:
+            fmt, dim = vector_formats[type_id]
+            values = struct.unpack_from(f'<{count * dim}{fmt}', self.data, offset)
+            vec_type = GfVecd if fmt == 'd' else GfVec
+            return [vec_type(values[i * dim:(i + 1) * dim]) for i in range(count)]
+        raise CrateError(f'Unsupported array value type {type_id}')
+
+    def unpack_compressed_array(self, type_id: int, offset: int, count: int) -> list:
+        if type_id in (TYPE_INT, TYPE_UINT, TYPE_INT64, TYPE_UINT64):
+            return self.read_compressed_ints(offset, count, wide=type_id in (TYPE_INT64, TYPE_UINT64))[0]
+        if type_id in (TYPE_HALF, TYPE_FLOAT, TYPE_DOUBLE):
+            fmt = scalar_formats[type_id][0]
+            code = chr(self.data[offset])
+            offset += 1
+            if code == 'i':
+                return [float(x) for x in self.read_compressed_ints(offset, count)[0]]
+            if code == 't':
+                lut_size = struct.unpack_from('<I', self.data, offset)[0]
+                offset += 4
+                lut = struct.unpack_from(f'<{lut_size}{fmt}', self.data, offset)
+                offset += lut_size * struct.calcsize(fmt)
+                return [lut[x] for x in self.read_compressed_ints(offset, count)[0]]
+        raise CrateError(f'Unsupported compressed array value type {type_id}')